@@ -0,0 +1,705 @@
+#include "bench.h"
+
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <assert.h>
+#include <time.h>
+#include <unistd.h>
+#include <math.h>
+
+// Command line driver of the portable backend
+//
+// Runs the generated benchmark tables (built with --backend portable, see tools/portable.py)
+// like src/runTests.swift does on the device and writes the same JSON reports, so the analysis
+// tools can be run on the results of any machine:
+//
+//   smetest [-o directory] [-t ops,memory,mixed,gemm] [-j H,L]... [-n repetitions] [-c cpus] [-p]
+//
+// Reports: cpu_info.json, op_benchmarks.json, mem_benchmarks.json, mixed_benchmarks.json and
+// gemm_benchmarks.json in the output directory. The thread configurations default to the
+// device defaults (all cores for the instruction benchmarks, one thread otherwise), every -j
+// option adds one configuration of high- and low-priority threads. With -c (comma-separated
+// CPU list) thread i is pinned to the i-th CPU of the list (Linux).
+//
+// The benchmarks run on the barrier-started harness (run_benchmark_threads), the reports have
+// three more columns from its per-thread timing: the median start skew of the threads
+// (seconds) and the median throughput of the slowest and the fastest thread.
+//
+// With -p the harness collects hardware counters (perf_event_open, see counters.c) around the
+// benchmark function of every thread. The reports then also have the median counts of a run
+// (cycles, instructions, l1d_misses, l2_misses, summed over the threads), the cycles per
+// instruction (cpi) and the effective frequency (ghz, cycles per second of thread run time).
+// Counters the system does not provide are null.
+
+#define MAX_THREAD_CONFIGS 64
+#define MAX_CPUS 1024
+
+typedef struct {
+  size_t high;
+  size_t low;
+} thread_config_t;
+
+typedef struct {
+  const char* output;
+  const char* tests;
+  thread_config_t threads[MAX_THREAD_CONFIGS];
+  size_t n_threads;
+  // repetitions per benchmark and configuration (0: the device defaults)
+  size_t times;
+  // CPUs to pin the threads to (none: no pinning)
+  int32_t cpus[MAX_CPUS];
+  size_t n_cpus;
+  // collect hardware counters
+  bool counters;
+} options_t;
+
+
+// Samples of a benchmark configuration (accumulated over the rounds of the schedule)
+typedef struct {
+  double* elapsed;
+  double* total_ops;
+  // spread of the thread start times and the throughput of the slowest and the fastest thread
+  double* start_skew;
+  double* thread_min;
+  double* thread_max;
+  // hardware counters and the summed run time of the threads
+  double* cycles;
+  double* instructions;
+  double* l1d_misses;
+  double* l2_misses;
+  double* thread_time;
+  size_t count;
+} samples_t;
+
+static void samples_add(samples_t* samples, benchmark_result_t result, const thread_result_t* threads, size_t n_threads) {
+  size_t size = (samples->count + 1)*sizeof(double);
+  double** columns[] = {
+    &samples->elapsed, &samples->total_ops, &samples->start_skew, &samples->thread_min, &samples->thread_max,
+    &samples->cycles, &samples->instructions, &samples->l1d_misses, &samples->l2_misses, &samples->thread_time
+  };
+  for (size_t i = 0; i < sizeof(columns)/sizeof(columns[0]); i++) {
+    *columns[i] = realloc(*columns[i], size);
+    assert(*columns[i] != nullptr);
+  }
+
+  double first = threads[0].start, last = threads[0].start;
+  double slowest = threads[0].total_ops/(threads[0].stop - threads[0].start), fastest = slowest;
+  double thread_time = threads[0].stop - threads[0].start;
+  for (size_t i = 1; i < n_threads; i++) {
+    double rate = threads[i].total_ops/(threads[i].stop - threads[i].start);
+    first = threads[i].start < first ? threads[i].start : first;
+    last = threads[i].start > last ? threads[i].start : last;
+    slowest = rate < slowest ? rate : slowest;
+    fastest = rate > fastest ? rate : fastest;
+    thread_time += threads[i].stop - threads[i].start;
+  }
+
+  samples->elapsed[samples->count] = result.elapsed;
+  samples->total_ops[samples->count] = result.total_ops;
+  samples->start_skew[samples->count] = last - first;
+  samples->thread_min[samples->count] = slowest/1e9;
+  samples->thread_max[samples->count] = fastest/1e9;
+  samples->cycles[samples->count] = result.counters.cycles;
+  samples->instructions[samples->count] = result.counters.instructions;
+  samples->l1d_misses[samples->count] = result.counters.l1d_misses;
+  samples->l2_misses[samples->count] = result.counters.l2_misses;
+  samples->thread_time[samples->count] = thread_time;
+  samples->count++;
+}
+
+static void samples_free(samples_t* samples, size_t count) {
+  for (size_t i = 0; i < count; i++) {
+    free(samples[i].elapsed);
+    free(samples[i].total_ops);
+    free(samples[i].start_skew);
+    free(samples[i].thread_min);
+    free(samples[i].thread_max);
+    free(samples[i].cycles);
+    free(samples[i].instructions);
+    free(samples[i].l1d_misses);
+    free(samples[i].l2_misses);
+    free(samples[i].thread_time);
+  }
+  free(samples);
+}
+
+static int compare_doubles(const void* a, const void* b) {
+  double x = *(const double*)a, y = *(const double*)b;
+  return (x > y) - (x < y);
+}
+
+static double median(const double* values, size_t count) {
+  if (count == 0) return 0.0;
+
+  double sorted[count];
+  memcpy(sorted, values, count*sizeof(double));
+  qsort(sorted, count, sizeof(double), compare_doubles);
+
+  return count % 2 == 0 ? (sorted[count/2 - 1] + sorted[count/2])/2.0 : sorted[count/2];
+}
+
+// billions of operations per second of samples first..count-1
+static double median_rate(const samples_t* samples, size_t first) {
+  size_t count = samples->count - first;
+  double rates[count > 0 ? count : 1];
+  for (size_t i = 0; i < count; i++) rates[i] = samples->total_ops[first + i]/samples->elapsed[first + i]/1e9;
+
+  return median(rates, count);
+}
+
+// CPUs the threads are pinned to and whether counters are collected (see main)
+static const int32_t* pinned_cpus = nullptr;
+static size_t n_pinned_cpus = 0;
+static bool counting = false;
+
+// run the benchmark times times (after two warmup runs) and add the samples
+static size_t measure(samples_t* samples, const benchmark_t* bench, const void* params, thread_config_t threads, size_t times) {
+  const size_t warmup = 2;
+  size_t first = samples->count;
+  size_t n_threads = threads.high + threads.low;
+  thread_result_t thread_results[n_threads];
+
+  for (size_t i = 0; i < times + warmup; i++) {
+    benchmark_result_t result = run_benchmark_threads(bench, params, threads.high, threads.low, pinned_cpus, n_pinned_cpus, thread_results);
+    if (i >= warmup) samples_add(samples, result, thread_results, n_threads);
+  }
+
+  return first;
+}
+
+static void print_visit(const char* label, const char* detail, thread_config_t threads, const samples_t* samples, size_t first, const char* unit) {
+  printf(
+    "%-50s | %-28s | threads %zuH+%zuL | \033[0;32m%10.2f %s\033[0m (%.2f ms)\n",
+    label, detail, threads.high, threads.low, median_rate(samples, first), unit,
+    median(samples->elapsed + first, samples->count - first)*1000
+  );
+}
+
+
+// Execution order of a benchmark table (see run_schedule_entry_t): the table order or the
+// randomized rounds of the generator, the repetitions of a benchmark are split over the rounds
+typedef struct {
+  const run_schedule_entry_t* entries;
+  size_t count;
+  size_t n_benchmarks;
+  size_t rounds;
+  size_t position;
+} schedule_t;
+
+static schedule_t make_schedule(size_t n_benchmarks, const run_schedule_entry_t* entries, size_t count) {
+  schedule_t schedule = { .entries = count > 0 ? entries : nullptr, .count = count, .n_benchmarks = n_benchmarks, .rounds = 1 };
+  if (schedule.entries == nullptr) return schedule;
+
+  size_t n_visits = 0;
+  for (size_t i = 0; i < count; i++) n_visits += entries[i].benchmark >= 0;
+  schedule.rounds = n_benchmarks > 0 && n_visits >= n_benchmarks ? n_visits/n_benchmarks : 1;
+
+  return schedule;
+}
+
+// repetitions per visit
+static size_t schedule_share(const schedule_t* schedule, size_t times) {
+  return (times + schedule->rounds - 1)/schedule->rounds;
+}
+
+// index of the next benchmark to run (pausing at cooldown markers), false at the end
+static bool next_visit(schedule_t* schedule, size_t* index) {
+  if (schedule->entries == nullptr) {
+    if (schedule->position >= schedule->n_benchmarks) return false;
+    *index = schedule->position++;
+    return true;
+  }
+
+  while (schedule->position < schedule->count) {
+    run_schedule_entry_t entry = schedule->entries[schedule->position++];
+    if (entry.benchmark >= 0) {
+      *index = (size_t)entry.benchmark;
+      return true;
+    }
+
+    struct timespec pause = { .tv_sec = entry.cooldown_ms/1000, .tv_nsec = (long)(entry.cooldown_ms % 1000)*1000000L };
+    nanosleep(&pause, nullptr);
+  }
+
+  return false;
+}
+
+
+// JSON report (an array of flat objects, one per benchmark configuration)
+typedef struct {
+  FILE* file;
+  size_t n_rows;
+  size_t n_fields;
+} report_t;
+
+static report_t report_open(const char* directory, const char* name) {
+  char path[4096];
+  snprintf(path, sizeof(path), "%s/%s", directory, name);
+
+  report_t report = { .file = fopen(path, "w") };
+  if (report.file == nullptr) {
+    perror(path);
+    exit(1);
+  }
+  fprintf(report.file, "[");
+
+  return report;
+}
+
+static void report_close(report_t* report) {
+  fprintf(report->file, "%s]\n", report->n_rows > 0 ? "\n  }\n" : "");
+  fclose(report->file);
+}
+
+static void report_row(report_t* report) {
+  fprintf(report->file, "%s\n  {", report->n_rows > 0 ? "\n  }," : "");
+  report->n_rows++;
+  report->n_fields = 0;
+}
+
+static void report_key(report_t* report, const char* key) {
+  fprintf(report->file, "%s\n    \"%s\" : ", report->n_fields > 0 ? "," : "", key);
+  report->n_fields++;
+}
+
+static void report_string(report_t* report, const char* key, const char* value) {
+  report_key(report, key);
+  fputc('"', report->file);
+  for (const char* c = value; *c; c++) {
+    if (*c == '"' || *c == '\\') fputc('\\', report->file);
+    fputc(*c, report->file);
+  }
+  fputc('"', report->file);
+}
+
+// sizes are signed in the reports (data_size is -1 for untyped transfers)
+static void report_int(report_t* report, const char* key, long long value) {
+  report_key(report, key);
+  fprintf(report->file, "%lld", value);
+}
+
+// NaN (unavailable counters) is written as null
+static void report_double(report_t* report, const char* key, double value) {
+  report_key(report, key);
+  if (isnan(value)) fprintf(report->file, "null");
+  else fprintf(report->file, "%.17g", value);
+}
+
+// throughput of every sample (billions per second, scaled)
+static void report_rates(report_t* report, const char* key, const samples_t* samples) {
+  report_key(report, key);
+  fprintf(report->file, "[");
+  for (size_t i = 0; i < samples->count; i++) {
+    fprintf(report->file, "%s\n      %.17g", i > 0 ? "," : "", samples->total_ops[i]/samples->elapsed[i]/1e9);
+  }
+  fprintf(report->file, "\n    ]");
+}
+
+static void report_threads(report_t* report, thread_config_t threads) {
+  report_int(report, "threads_h", threads.high);
+  report_int(report, "threads_l", threads.low);
+}
+
+// median elapsed time and per-thread timing
+static void report_timing(report_t* report, const samples_t* samples) {
+  report_double(report, "elapsed", median(samples->elapsed, samples->count));
+  report_double(report, "start_skew", median(samples->start_skew, samples->count));
+  report_double(report, "thread_min", median(samples->thread_min, samples->count));
+  report_double(report, "thread_max", median(samples->thread_max, samples->count));
+  if (!counting) return;
+
+  // counters of a run and the derived rates (medians of the per-sample values)
+  double cpi[samples->count + 1], ghz[samples->count + 1];
+  for (size_t i = 0; i < samples->count; i++) {
+    cpi[i] = samples->cycles[i]/samples->instructions[i];
+    ghz[i] = samples->cycles[i]/samples->thread_time[i]/1e9;
+  }
+  report_double(report, "cycles", median(samples->cycles, samples->count));
+  report_double(report, "instructions", median(samples->instructions, samples->count));
+  report_double(report, "l1d_misses", median(samples->l1d_misses, samples->count));
+  report_double(report, "l2_misses", median(samples->l2_misses, samples->count));
+  report_double(report, "cpi", median(cpi, samples->count));
+  report_double(report, "ghz", median(ghz, samples->count));
+}
+
+
+// CPU info (same fields as the device report)
+static void write_cpu_info(const char* directory, size_t n_cores) {
+  char path[4096];
+  snprintf(path, sizeof(path), "%s/cpu_info.json", directory);
+
+  FILE* file = fopen(path, "w");
+  if (file == nullptr) {
+    perror(path);
+    exit(1);
+  }
+  fprintf(file, "{\n  \"cpu_p_cores\" : %zu,\n  \"cpu_e_cores\" : 0,\n  \"sme_features\" : []\n}\n", n_cores);
+  fclose(file);
+}
+
+// SME/SVE operation benchmarks
+static void run_op_benchmarks(const options_t* options, const thread_config_t* threads, size_t n_threads) {
+  size_t times = options->times > 0 ? options->times : 20;
+  samples_t* samples = calloc(op_benchmarks_count*n_threads, sizeof(samples_t));
+  schedule_t schedule = make_schedule(op_benchmarks_count, op_benchmarks_schedule, op_benchmarks_schedule_count);
+
+  size_t index;
+  while (next_visit(&schedule, &index)) {
+    const op_benchmark_t* bench = &op_benchmarks[index];
+    char detail[64];
+    if (strcmp(bench->mode, "latency") == 0) snprintf(detail, sizeof(detail), "%zux%zu", bench->ilp, bench->chain_length);
+    else snprintf(detail, sizeof(detail), "ILP=%zu", bench->ilp);
+
+    for (size_t i = 0; i < n_threads; i++) {
+      size_t n_iterations = bench->n_iterations;
+      samples_t* visit = &samples[index*n_threads + i];
+      size_t first = measure(visit, &bench->benchmark, &n_iterations, threads[i], schedule_share(&schedule, times));
+      print_visit(bench->label, detail, threads[i], visit, first, "GOP/s");
+    }
+  }
+
+  // results in table order
+  report_t report = report_open(options->output, "op_benchmarks.json");
+  for (size_t index = 0; index < op_benchmarks_count; index++) {
+    const op_benchmark_t* bench = &op_benchmarks[index];
+    for (size_t i = 0; i < n_threads; i++) {
+      const samples_t* result = &samples[index*n_threads + i];
+      if (result->count == 0) continue;
+
+      report_row(&report);
+      report_string(&report, "category", bench->category);
+      report_string(&report, "label", bench->label);
+      report_string(&report, "feature", bench->feature);
+      report_string(&report, "encoding", bench->encoding);
+      report_string(&report, "opcode", bench->opcode);
+      report_string(&report, "output_data", bench->output_data);
+      report_int(&report, "output_elements", bench->output_elements);
+      report_int(&report, "output_vectors", bench->output_vectors);
+      report_string(&report, "input_data", bench->input_data);
+      report_int(&report, "input_elements", bench->input_elements);
+      report_int(&report, "input_vectors", bench->input_vectors);
+      report_int(&report, "ops_per_instruction", bench->ops_per_instruction);
+      report_int(&report, "ilp", bench->ilp);
+      report_string(&report, "mode", bench->mode);
+      report_int(&report, "chain_length", bench->chain_length);
+      report_double(&report, "predicate_density", bench->predicate_density);
+      report_int(&report, "n_iterations", bench->n_iterations);
+      report_threads(&report, threads[i]);
+      report_rates(&report, "gops", result);
+      report_timing(&report, result);
+    }
+  }
+  report_close(&report);
+
+  samples_free(samples, op_benchmarks_count*n_threads);
+}
+
+
+// Memory benchmarks
+typedef struct {
+  size_t size;
+  size_t alignment;
+  thread_config_t threads;
+} mem_config_t;
+
+static void run_mem_benchmarks(const options_t* options, const thread_config_t* threads, size_t n_threads) {
+  size_t times = options->times > 0 ? options->times : 10;
+
+  // sizes from the sweep plan or 4KB to 64MB (switching to multiplicative increases every 4 steps)
+  size_t default_sizes[20];
+  const size_t* sizes = mem_benchmark_sizes;
+  size_t n_sizes = mem_benchmark_sizes_count;
+  if (n_sizes == 0) {
+    size_t step = 4096;
+    for (size_t i = 0; i < 5; i++, step *= 4*2) {
+      for (size_t j = 1; j <= 4; j++) default_sizes[n_sizes++] = j*step;
+    }
+    sizes = default_sizes;
+  }
+  const size_t alignments[] = { 16, 32, 64, 128, 256 };
+  const size_t n_alignments = sizeof(alignments)/sizeof(alignments[0]);
+
+  // skip all configurations that would allocate more than twice the largest size in total
+  size_t max_size = 0;
+  for (size_t i = 0; i < n_sizes; i++) max_size = sizes[i] > max_size ? sizes[i] : max_size;
+  mem_config_t configs[n_sizes*n_alignments*n_threads];
+  size_t n_configs = 0;
+  for (size_t i = 0; i < n_sizes; i++) {
+    for (size_t j = 0; j < n_alignments; j++) {
+      for (size_t k = 0; k < n_threads; k++) {
+        if ((threads[k].high + threads[k].low)*sizes[i] > 2*max_size) continue;
+        configs[n_configs++] = (mem_config_t) { .size = sizes[i], .alignment = alignments[j], .threads = threads[k] };
+      }
+    }
+  }
+
+  samples_t* samples = calloc(mem_benchmarks_count*n_configs, sizeof(samples_t));
+  schedule_t schedule = make_schedule(mem_benchmarks_count, mem_benchmarks_schedule, mem_benchmarks_schedule_count);
+
+  size_t index;
+  while (next_visit(&schedule, &index)) {
+    const mem_benchmark_t* bench = &mem_benchmarks[index];
+    for (size_t i = 0; i < n_configs; i++) {
+      mem_benchmark_params_t params = { .size = configs[i].size, .alignment = configs[i].alignment, .transfer_size = bench->transfer_size };
+      samples_t* visit = &samples[index*n_configs + i];
+      size_t first = measure(visit, &bench->benchmark, &params, configs[i].threads, schedule_share(&schedule, times));
+
+      char detail[64];
+      snprintf(detail, sizeof(detail), "ILP=%zu | %zu KB @%zu", bench->ilp, configs[i].size/1024, configs[i].alignment);
+      print_visit(bench->label, detail, configs[i].threads, visit, first, "GB/s");
+    }
+  }
+
+  // results in table order
+  report_t report = report_open(options->output, "mem_benchmarks.json");
+  for (size_t index = 0; index < mem_benchmarks_count; index++) {
+    const mem_benchmark_t* bench = &mem_benchmarks[index];
+    for (size_t i = 0; i < n_configs; i++) {
+      const samples_t* result = &samples[index*n_configs + i];
+      if (result->count == 0) continue;
+
+      report_row(&report);
+      report_string(&report, "label", bench->label);
+      report_string(&report, "encoding", bench->encoding);
+      report_string(&report, "feature", bench->feature);
+      report_string(&report, "op_type", bench->op_type);
+      report_int(&report, "n_vectors", bench->n_vectors);
+      report_int(&report, "data_size", bench->data_size);
+      report_int(&report, "ilp", bench->ilp);
+      report_double(&report, "predicate_density", bench->predicate_density);
+      report_int(&report, "size", configs[i].size);
+      report_int(&report, "alignment", configs[i].alignment);
+      report_int(&report, "transfer_size", bench->transfer_size);
+      report_threads(&report, configs[i].threads);
+      report_rates(&report, "gbps", result);
+      report_timing(&report, result);
+    }
+  }
+  report_close(&report);
+
+  samples_free(samples, mem_benchmarks_count*n_configs);
+}
+
+
+// Mixed instruction benchmarks
+static void run_mixed_benchmarks(const options_t* options, const thread_config_t* threads, size_t n_threads) {
+  size_t times = options->times > 0 ? options->times : 20;
+  samples_t* samples = calloc(mixed_benchmarks_count*n_threads, sizeof(samples_t));
+  schedule_t schedule = make_schedule(mixed_benchmarks_count, mixed_benchmarks_schedule, mixed_benchmarks_schedule_count);
+
+  size_t index;
+  while (next_visit(&schedule, &index)) {
+    const mixed_benchmark_t* bench = &mixed_benchmarks[index];
+    char detail[64];
+    snprintf(detail, sizeof(detail), "%s x%zu + %s x%zu", bench->first_opcode, bench->first_count, bench->second_opcode, bench->second_count);
+
+    for (size_t i = 0; i < n_threads; i++) {
+      mixed_benchmark_params_t params = { .n_iterations = bench->n_iterations, .buffer_size = bench->buffer_size };
+      samples_t* visit = &samples[index*n_threads + i];
+      size_t first = measure(visit, &bench->benchmark, &params, threads[i], schedule_share(&schedule, times));
+      print_visit(bench->label, detail, threads[i], visit, first, "GIPS");
+    }
+  }
+
+  // results in table order (the benchmarks return the number of loop iterations)
+  report_t report = report_open(options->output, "mixed_benchmarks.json");
+  for (size_t index = 0; index < mixed_benchmarks_count; index++) {
+    const mixed_benchmark_t* bench = &mixed_benchmarks[index];
+    for (size_t i = 0; i < n_threads; i++) {
+      const samples_t* result = &samples[index*n_threads + i];
+      if (result->count == 0) continue;
+      double gips = median_rate(result, 0);
+
+      report_row(&report);
+      report_string(&report, "label", bench->label);
+      report_string(&report, "features", bench->features);
+      report_string(&report, "first", bench->first);
+      report_string(&report, "first_opcode", bench->first_opcode);
+      report_int(&report, "first_count", bench->first_count);
+      report_string(&report, "second", bench->second);
+      report_string(&report, "second_opcode", bench->second_opcode);
+      report_int(&report, "second_count", bench->second_count);
+      report_int(&report, "ops_per_iteration", bench->ops_per_iteration);
+      report_int(&report, "bytes_per_iteration", bench->bytes_per_iteration);
+      report_int(&report, "buffer_size", bench->buffer_size);
+      report_int(&report, "n_iterations", bench->n_iterations);
+      report_threads(&report, threads[i]);
+      report_rates(&report, "gips", result);
+      report_double(&report, "gops", gips*(double)bench->ops_per_iteration);
+      report_double(&report, "gbps", gips*(double)bench->bytes_per_iteration);
+      report_timing(&report, result);
+    }
+  }
+  report_close(&report);
+
+  samples_free(samples, mixed_benchmarks_count*n_threads);
+}
+
+
+// Packed GEMM micro-kernel benchmarks
+typedef struct {
+  gemm_shape_t shape;
+  thread_config_t threads;
+} gemm_config_t;
+
+// shape rounded up to the kernel steps
+static gemm_shape_t rounded_shape(const gemm_benchmark_t* bench, gemm_shape_t shape) {
+  #define ROUND_UP(size, step) (((size) + (step) - 1)/(step)*(step))
+  return (gemm_shape_t) { .m = ROUND_UP(shape.m, bench->m_step), .n = ROUND_UP(shape.n, bench->n_step), .k = ROUND_UP(shape.k, bench->k_step) };
+  #undef ROUND_UP
+}
+
+static void run_gemm_benchmarks(const options_t* options, const thread_config_t* threads, size_t n_threads) {
+  size_t times = options->times > 0 ? options->times : 10;
+  gemm_config_t configs[gemm_benchmark_shapes_count*n_threads];
+  size_t n_configs = 0;
+  for (size_t i = 0; i < gemm_benchmark_shapes_count; i++) {
+    for (size_t j = 0; j < n_threads; j++) configs[n_configs++] = (gemm_config_t) { .shape = gemm_benchmark_shapes[i], .threads = threads[j] };
+  }
+
+  samples_t* samples = calloc(gemm_benchmarks_count*n_configs, sizeof(samples_t));
+  schedule_t schedule = make_schedule(gemm_benchmarks_count, gemm_benchmarks_schedule, gemm_benchmarks_schedule_count);
+
+  size_t index;
+  while (next_visit(&schedule, &index)) {
+    const gemm_benchmark_t* bench = &gemm_benchmarks[index];
+    for (size_t i = 0; i < n_configs; i++) {
+      gemm_benchmark_params_t params = { .benchmark = bench, .shape = rounded_shape(bench, configs[i].shape) };
+      samples_t* visit = &samples[index*n_configs + i];
+      size_t first = measure(visit, &bench->benchmark, &params, configs[i].threads, schedule_share(&schedule, times));
+
+      char detail[64];
+      snprintf(detail, sizeof(detail), "%zux%zu tiles, K x%zu | %zux%zux%zu", bench->tile_rows, bench->tile_cols, bench->k_unroll, params.shape.m, params.shape.n, params.shape.k);
+      print_visit(bench->label, detail, configs[i].threads, visit, first, "GOP/s");
+    }
+  }
+
+  // results in table order
+  report_t report = report_open(options->output, "gemm_benchmarks.json");
+  for (size_t index = 0; index < gemm_benchmarks_count; index++) {
+    const gemm_benchmark_t* bench = &gemm_benchmarks[index];
+    for (size_t i = 0; i < n_configs; i++) {
+      const samples_t* result = &samples[index*n_configs + i];
+      if (result->count == 0) continue;
+      gemm_shape_t shape = rounded_shape(bench, configs[i].shape);
+
+      report_row(&report);
+      report_string(&report, "label", bench->label);
+      report_string(&report, "feature", bench->feature);
+      report_string(&report, "opcode", bench->opcode);
+      report_string(&report, "input_data", bench->input_data);
+      report_int(&report, "input_size", bench->input_size);
+      report_string(&report, "output_data", bench->output_data);
+      report_int(&report, "tile_rows", bench->tile_rows);
+      report_int(&report, "tile_cols", bench->tile_cols);
+      report_int(&report, "k_unroll", bench->k_unroll);
+      report_int(&report, "m_step", bench->m_step);
+      report_int(&report, "n_step", bench->n_step);
+      report_int(&report, "k_step", bench->k_step);
+      report_int(&report, "n_ops", bench->n_ops);
+      report_int(&report, "m", shape.m);
+      report_int(&report, "n", shape.n);
+      report_int(&report, "k", shape.k);
+      report_threads(&report, configs[i].threads);
+      report_rates(&report, "gops", result);
+      report_timing(&report, result);
+    }
+  }
+  report_close(&report);
+
+  samples_free(samples, gemm_benchmarks_count*n_configs);
+}
+
+
+static bool selected(const options_t* options, const char* test) {
+  // comma-separated list of tests
+  size_t length = strlen(test);
+  for (const char* item = options->tests; item != nullptr; item = strchr(item, ',')) {
+    if (*item == ',') item++;
+    if (strncmp(item, test, length) == 0 && (item[length] == ',' || item[length] == '\0')) return true;
+  }
+
+  return false;
+}
+
+static void usage(const char* name) {
+  fprintf(stderr, "usage: %s [-o directory] [-t ops,memory,mixed,gemm] [-j H,L]... [-n repetitions] [-c cpus] [-p]\n", name);
+  exit(2);
+}
+
+int main(int argc, char* argv[]) {
+  options_t options = { .output = ".", .tests = "memory,ops,mixed,gemm" };
+
+  int option;
+  while ((option = getopt(argc, argv, "o:t:j:n:c:ph")) != -1) {
+    switch (option) {
+      case 'o': options.output = optarg; break;
+      case 't': options.tests = optarg; break;
+      case 'j': {
+        thread_config_t threads;
+        if (options.n_threads == MAX_THREAD_CONFIGS || sscanf(optarg, "%zu,%zu", &threads.high, &threads.low) != 2 || threads.high + threads.low == 0) usage(argv[0]);
+        options.threads[options.n_threads++] = threads;
+        break;
+      }
+      case 'n': options.times = strtoul(optarg, nullptr, 10); break;
+      case 'c': {
+        for (char* cpu = strtok(optarg, ","); cpu != nullptr && options.n_cpus < MAX_CPUS; cpu = strtok(nullptr, ",")) {
+          options.cpus[options.n_cpus++] = (int32_t)strtol(cpu, nullptr, 10);
+        }
+        break;
+      }
+      case 'p': options.counters = true; break;
+      default: usage(argv[0]);
+    }
+  }
+
+  pinned_cpus = options.n_cpus > 0 ? options.cpus : nullptr;
+  n_pinned_cpus = options.n_cpus;
+
+  if (options.counters) {
+    const counter_backend_t* backend = perf_event_counter_backend();
+    void* probe = backend != nullptr ? backend->open() : nullptr;
+    if (probe == nullptr) fprintf(stderr, "hardware counters are not available, the counter columns are null\n");
+    else backend->close(probe);
+
+    set_counter_backend(backend);
+    counting = true;
+  }
+
+  // the portable backend has no SME features and no separate efficiency cores
+  size_t n_cores = (size_t)sysconf(_SC_NPROCESSORS_ONLN);
+  printf("\033[0;36m-- CPU info\033[0m\nCores        %zu\n", n_cores);
+  write_cpu_info(options.output, n_cores);
+
+  // thread configurations: the -j options or all cores (instruction benchmarks) and one thread
+  thread_config_t all_cores[n_cores];
+  for (size_t i = 0; i < n_cores; i++) all_cores[i] = (thread_config_t) { .high = i + 1, .low = 0 };
+  const thread_config_t one_thread[] = { { .high = 1, .low = 0 }, { .high = 0, .low = 1 } };
+  const thread_config_t* op_threads = options.n_threads > 0 ? options.threads : all_cores;
+  size_t n_op_threads = options.n_threads > 0 ? options.n_threads : n_cores;
+  const thread_config_t* threads = options.n_threads > 0 ? options.threads : one_thread;
+  size_t n_threads = options.n_threads > 0 ? options.n_threads : 2;
+
+  if (selected(&options, "ops")) {
+    printf("\033[0;36m-- SME/SVE operations\033[0m\n\n");
+    run_op_benchmarks(&options, op_threads, n_op_threads);
+  }
+
+  if (selected(&options, "memory")) {
+    printf("\033[0;36m-- Memory benchmarks\033[0m\n\n");
+    run_mem_benchmarks(&options, threads, n_threads);
+  }
+
+  if (selected(&options, "mixed")) {
+    printf("\033[0;36m-- Mixed instruction benchmarks\033[0m\n\n");
+    run_mixed_benchmarks(&options, threads, n_threads);
+  }
+
+  if (selected(&options, "gemm")) {
+    printf("\033[0;36m-- GEMM micro-kernels\033[0m\n\n");
+    run_gemm_benchmarks(&options, threads, n_threads);
+  }
+
+  return 0;
+}
@@ -1,4 +1,5 @@
 #include "bench.h"
+#include "counters.h"
 
 #include <sys/qos.h>
 #include <pthread.h>
@@ -10,8 +11,8 @@
 #define QUEUE_QOS(qos) dispatch_queue_attr_make_with_qos_class(DISPATCH_QUEUE_CONCURRENT, qos, 0)
 
 benchmark_result_t run_benchmark(
-  const benchmark_t* __nonnull bench,
-  const void* __nullable params,
+  const benchmark_t* _Nonnull bench,
+  const void* _Nullable params,
   size_t n_threads_highp,
   size_t n_threads_lowp
 ) {
@@ -20,6 +21,9 @@ benchmark_result_t run_benchmark(
   __block _Atomic bool ready = false;
 
   void* task_data[n_threads_highp + n_threads_lowp];
+  // hardware counters of the tasks (the blocks capture the pointer, not the array)
+  counter_values_t task_counters[n_threads_highp + n_threads_lowp];
+  counter_values_t* counters = task_counters;
 
   // create queues (low-priority threads run with utility QoS, which should place them on E-cores)
   dispatch_queue_t queue_highp = dispatch_queue_create("SMETest high-priority queue", QUEUE_QOS(QOS_CLASS_USER_INITIATED));
@@ -36,9 +40,13 @@ benchmark_result_t run_benchmark(
       group,
       (i < n_threads_highp) ? queue_highp : queue_lowp,
       ^{
+        thread_counters_t thread_counters = thread_counters_open();
         while (!ready) {} // block until timing starts
+        thread_counters_start(&thread_counters);
         double ops = bench->bench(data);
+        thread_counters_stop(&thread_counters, &counters[i]);
         atomic_fetch_add_explicit(&total_ops, ops, memory_order_relaxed);
+        thread_counters_close(&thread_counters);
       }
     );
   }
@@ -57,9 +65,11 @@ benchmark_result_t run_benchmark(
   dispatch_release(queue_highp);
   dispatch_release(queue_lowp);
 
+  counter_values_t total_counters = {};
   for (size_t i = 0; i < n_threads_highp + n_threads_lowp; i++) {
     bench->teardown(task_data[i]);
+    counters_add(&total_counters, task_counters[i]);
   }
 
-  return (benchmark_result_t) { .elapsed = elapsed, .total_ops = total_ops };
+  return (benchmark_result_t) { .elapsed = elapsed, .total_ops = total_ops, .counters = total_counters };
 }
@@ -5,7 +5,17 @@
 #include <stdbool.h>
 #include <stdint.h>
 
-#define CONST_PTR(T) const T* __nonnull
+// the portable backend also builds with gcc: nullability qualifiers are a clang extension,
+// nullptr needs C23 (gcc 13)
+#ifndef __clang__
+#define _Nonnull
+#define _Nullable
+#if __STDC_VERSION__ < 202311L && __GNUC__ < 13
+#define nullptr ((void*)0)
+#endif
+#endif
+
+#define CONST_PTR(T) const T* _Nonnull
 #define ARRAY_END(x) (x + sizeof(x)/sizeof(x[0]))
 
 
@@ -21,37 +31,116 @@
 // The `run_benchmark()` function accepts a benchmark definition and executes it using
 // the requested number of threads. The result consists of a number of total executed
 // operations (benchmark-dependent) and the combined runtime.
+// `run_benchmark_threads()` is an alternative harness with a start barrier, optional CPU pinning
+// and per-thread timing.
+//
+// Both harnesses can collect hardware performance counters around every call of the benchmark
+// function through a counter backend (`set_counter_backend()`, see counters.c).
 
 // Benchmark definition
 typedef struct {
   // setup the benchmark adata
-  void* __nullable  (*__nonnull setup)(const void* __nullable);
+  void* _Nullable  (*_Nonnull setup)(const void* _Nullable);
   // run the benchmark and return the number of operations executed
-  double (*__nonnull bench)(const void* __nullable);
+  double (*_Nonnull bench)(const void* _Nullable);
   // teardown the benchmark data
-  void   (*__nonnull teardown)(void* __nullable);
+  void   (*_Nonnull teardown)(void* _Nullable);
 } benchmark_t;
 
+// Hardware performance counters (summed over the threads, NaN if not collected)
+typedef struct {
+  double cycles;
+  double instructions;
+  double l1d_misses;
+  double l2_misses;
+} counter_values_t;
+
+// Counter backend: counts the calling thread between start and stop
+typedef struct {
+  CONST_PTR(char) name;
+  // open the counters of the calling thread (null if they are unavailable)
+  void* _Nullable (*_Nonnull open)(void);
+  void (*_Nonnull start)(void* _Nonnull);
+  // stop counting and store the counts (NaN for counters the backend could not open)
+  void (*_Nonnull stop)(void* _Nonnull, counter_values_t* _Nonnull);
+  void (*_Nonnull close)(void* _Nonnull);
+} counter_backend_t;
+
+// Select the counter backend of the harnesses (null: no counters, the default)
+void set_counter_backend(const counter_backend_t* _Nullable backend);
+
+// Linux perf_event_open backend (cycles, instructions, L1D and L2 refills, user space only),
+// null on other platforms
+const counter_backend_t* _Nullable perf_event_counter_backend(void);
+
 // Benchmark result
 typedef struct {
   // elapsed time
   double elapsed;
   // number of operations executed
   double total_ops;
+  // hardware counters of all threads
+  counter_values_t counters;
 } benchmark_result_t;
 
 // Run the provided benchmark using one or more threads
 benchmark_result_t run_benchmark(
   // benchmark to run
-  const benchmark_t* __nonnull bench,
+  const benchmark_t* _Nonnull bench,
   // benchmark parameters (benchmark-dependent)
-  const void* __nullable params,
+  const void* _Nullable params,
   // number of high-priority threads to run
   size_t n_threads_highp,
   // number of low-priority threads to run
   size_t n_threads_lowp
 );
 
+// Timing of one thread of a benchmark run
+typedef struct {
+  // start and stop of the benchmark function, relative to the release of the threads
+  double start;
+  double stop;
+  // number of operations executed by the thread
+  double total_ops;
+  // CPU the thread was pinned to, -1 if it was not pinned
+  int32_t cpu;
+  // hardware counters of the thread
+  counter_values_t counters;
+} thread_result_t;
+
+// Run the provided benchmark using POSIX threads released by a start barrier (see harness.c)
+//
+// The elapsed time runs from the release to the stop of the last thread. Builds on Apple
+// platforms and Linux, pinning is only supported on Linux.
+benchmark_result_t run_benchmark_threads(
+  // benchmark to run
+  const benchmark_t* _Nonnull bench,
+  // benchmark parameters (benchmark-dependent)
+  const void* _Nullable params,
+  // number of high-priority threads to run (the first threads)
+  size_t n_threads_highp,
+  // number of low-priority threads to run
+  size_t n_threads_lowp,
+  // thread i is pinned to cpus[i % n_cpus] (no pinning if cpus is null)
+  const int32_t* _Nullable cpus,
+  size_t n_cpus,
+  // per-thread results (n_threads_highp + n_threads_lowp entries, optional)
+  thread_result_t* _Nullable thread_results
+);
+
+// Execution order of a benchmark table (see tools/codegen.py, RunSchedule)
+//
+// Every generated table is followed by a schedule that lists the table indices in the order
+// the harness should run them. Each benchmark appears once per round and its repetitions are
+// split over the rounds, entries with the index -1 are cooldown markers (an idle pause).
+// The harness runs the table in order if the schedule is empty.
+typedef struct {
+  // index into the benchmark table, -1 for cooldown markers
+  int32_t benchmark;
+  // pause before the next visit (cooldown markers)
+  int32_t cooldown_ms;
+} run_schedule_entry_t;
+
 // SME and SVE instruction benchmarks
 typedef struct {
   // benchmark harness
@@ -80,18 +169,30 @@ typedef struct {
   size_t            input_vectors;
   // total number of operations per instruction
   size_t            ops_per_instruction;
-  // number of data-independent instructions in the benchmark loop
+  // number of data-independent instructions (throughput) or interleaved chains (latency) in the benchmark loop
   size_t            ilp;
+  // benchmark mode (throughput or latency)
+  CONST_PTR(char)   mode;
+  // number of dependent instructions per chain and loop iteration (1 in throughput mode)
+  size_t            chain_length;
+  // fraction of active lanes of the governing predicates (1.0 for all-true predicates)
+  double            predicate_density;
+  // number of benchmark loop iterations (passed to the benchmark as its parameter)
+  size_t            n_iterations;
 } op_benchmark_t;
 
 extern CONST_PTR(op_benchmark_t) op_benchmarks;
 extern const size_t op_benchmarks_count;
+extern const run_schedule_entry_t* _Nullable op_benchmarks_schedule;
+extern const size_t op_benchmarks_schedule_count;
 
 
 // Memory benchmarks
 typedef struct {
   size_t size;
   size_t alignment;
+  // number of bytes to transfer per thread
+  size_t transfer_size;
 } mem_benchmark_params_t;
 
 typedef struct {
@@ -111,13 +212,108 @@ typedef struct {
   size_t            data_size;
   // number of data-independent instructions in the benchmark loop
   size_t            ilp;
+  // fraction of active lanes of the governing predicates (1.0 for all-true or unpredicated transfers)
+  double            predicate_density;
+  // number of bytes to transfer per thread
+  size_t            transfer_size;
 } mem_benchmark_t;
 
 extern CONST_PTR(mem_benchmark_t) mem_benchmarks;
 extern const size_t mem_benchmarks_count;
+extern const run_schedule_entry_t* _Nullable mem_benchmarks_schedule;
+extern const size_t mem_benchmarks_schedule_count;
+
+// Buffer sizes to run the memory benchmarks with (selected by the sweep planner),
+// the harness uses its default sizes if the count is zero
+extern const size_t* _Nullable mem_benchmark_sizes;
+extern const size_t mem_benchmark_sizes_count;
+
+
+// Mixed instruction benchmarks (two interleaved instruction streams)
+typedef struct {
+  size_t n_iterations;
+  // size of the buffer the loads cycle through
+  size_t buffer_size;
+} mixed_benchmark_params_t;
+
+typedef struct {
+  // benchmark harness
+  const benchmark_t benchmark;
+  // descriptive label
+  CONST_PTR(char)   label;
+  // required SVE/SME features (comma-separated)
+  CONST_PTR(char)   features;
+  // first instruction stream (label, opcode, instructions per loop iteration)
+  CONST_PTR(char)   first;
+  CONST_PTR(char)   first_opcode;
+  size_t            first_count;
+  // second instruction stream (label, opcode, instructions per loop iteration)
+  CONST_PTR(char)   second;
+  CONST_PTR(char)   second_opcode;
+  size_t            second_count;
+  // total number of operations per loop iteration
+  size_t            ops_per_iteration;
+  // number of bytes loaded per loop iteration
+  size_t            bytes_per_iteration;
+  // size of the buffer the loads cycle through (0 if there are no loads)
+  size_t            buffer_size;
+  // number of benchmark loop iterations
+  size_t            n_iterations;
+} mixed_benchmark_t;
+
+extern CONST_PTR(mixed_benchmark_t) mixed_benchmarks;
+extern const size_t mixed_benchmarks_count;
+extern const run_schedule_entry_t* _Nullable mixed_benchmarks_schedule;
+extern const size_t mixed_benchmarks_schedule_count;
+
+// Packed GEMM micro-kernel benchmarks
+typedef struct {
+  // benchmark harness
+  const benchmark_t benchmark;
+  // descriptive label (of the outer product)
+  CONST_PTR(char)   label;
+  // required SVE/SME feature
+  CONST_PTR(char)   feature;
+  // ARM opcode of the outer product
+  CONST_PTR(char)   opcode;
+  // input element type (e.g. f16) and bit width
+  CONST_PTR(char)   input_data;
+  size_t            input_size;
+  // output (accumulator) element type (e.g. f32)
+  CONST_PTR(char)   output_data;
+  // ZA tile grid of the micro-kernel
+  size_t            tile_rows;
+  size_t            tile_cols;
+  // number of K steps per loop iteration
+  size_t            k_unroll;
+  // C block size and K elements per loop iteration (the GEMM shape must be a multiple)
+  size_t            m_step;
+  size_t            n_step;
+  size_t            k_step;
+  // number of operations per benchmark run (rounded to whole GEMMs)
+  size_t            n_ops;
+} gemm_benchmark_t;
+
+// GEMM shape (C is M x N, K is the reduction dimension)
+typedef struct {
+  size_t m;
+  size_t n;
+  size_t k;
+} gemm_shape_t;
+
+typedef struct {
+  CONST_PTR(gemm_benchmark_t) benchmark;
+  gemm_shape_t shape;
+} gemm_benchmark_params_t;
+
+extern CONST_PTR(gemm_benchmark_t) gemm_benchmarks;
+extern const size_t gemm_benchmarks_count;
+extern const run_schedule_entry_t* _Nullable gemm_benchmarks_schedule;
+extern const size_t gemm_benchmarks_schedule_count;
 
-extern CONST_PTR(op_benchmark_t) mixed_benchmarks;
-extern const size_t mixed_benchmarks_benchmarks_count;
+// Problem shapes to run the GEMM benchmarks with
+extern CONST_PTR(gemm_shape_t) gemm_benchmark_shapes;
+extern const size_t gemm_benchmark_shapes_count;
 
 
 #endif /* tests_h */
@@ -0,0 +1,147 @@
+#ifdef __linux__
+#define _GNU_SOURCE
+#endif
+
+#include "counters.h"
+
+#include <stdlib.h>
+#include <assert.h>
+#include <stdatomic.h>
+
+#ifdef __linux__
+#include <linux/perf_event.h>
+#include <sys/ioctl.h>
+#include <sys/syscall.h>
+#include <unistd.h>
+#endif
+
+// Hardware counter backends
+//
+// The harnesses call the selected backend on every benchmark thread (see counters.h). The
+// Linux backend opens one perf_event group per thread with the cycles as the group leader, so
+// all counters of a thread cover the same interval. Counters the kernel (or the PMU) does not
+// provide are reported as NaN, if the group leader is unavailable (e.g. perf_event_paranoid,
+// containers) the thread is not counted at all. When the group is multiplexed the counts are
+// scaled by the enabled/running time.
+//
+// There is no public counter interface on Apple platforms (kperf is private), the hook exists
+// so that such a backend can be added.
+
+static _Atomic(const counter_backend_t*) selected_backend = nullptr;
+
+void set_counter_backend(const counter_backend_t* _Nullable backend) {
+  atomic_store(&selected_backend, backend);
+}
+
+const counter_backend_t* _Nullable counter_backend(void) {
+  return atomic_load(&selected_backend);
+}
+
+
+#ifdef __linux__
+
+// counters in the order of counter_values_t
+#define N_PERF_EVENTS 4
+
+static const struct { uint32_t type; uint64_t config; } perf_events[N_PERF_EVENTS] = {
+  { PERF_TYPE_HARDWARE, PERF_COUNT_HW_CPU_CYCLES },
+  { PERF_TYPE_HARDWARE, PERF_COUNT_HW_INSTRUCTIONS },
+  { PERF_TYPE_HW_CACHE, PERF_COUNT_HW_CACHE_L1D | (PERF_COUNT_HW_CACHE_OP_READ << 8) | (PERF_COUNT_HW_CACHE_RESULT_MISS << 16) },
+#ifdef __aarch64__
+  // L2D_CACHE_REFILL (Arm common event), there is no generic L2 event
+  { PERF_TYPE_RAW, 0x17 },
+#else
+  // closest generic event on other architectures: last-level cache misses
+  { PERF_TYPE_HARDWARE, PERF_COUNT_HW_CACHE_MISSES },
+#endif
+};
+
+typedef struct {
+  int fds[N_PERF_EVENTS];
+  // position of each counter in the group read (-1 if it could not be opened)
+  int slots[N_PERF_EVENTS];
+  int n_open;
+} perf_counters_t;
+
+static int perf_event_open(uint32_t type, uint64_t config, int group) {
+  struct perf_event_attr attr = {
+    .size = sizeof(attr),
+    .type = type,
+    .config = config,
+    .disabled = group == -1,
+    .exclude_kernel = 1,
+    .exclude_hv = 1,
+    .read_format = PERF_FORMAT_GROUP | PERF_FORMAT_TOTAL_TIME_ENABLED | PERF_FORMAT_TOTAL_TIME_RUNNING,
+  };
+
+  return (int)syscall(SYS_perf_event_open, &attr, 0, -1, group, 0);
+}
+
+static void* _Nullable perf_open(void) {
+  perf_counters_t* counters = calloc(1, sizeof(perf_counters_t));
+  assert(counters != nullptr);
+
+  for (int i = 0; i < N_PERF_EVENTS; i++) {
+    int fd = perf_event_open(perf_events[i].type, perf_events[i].config, i == 0 ? -1 : counters->fds[0]);
+    counters->fds[i] = fd;
+    counters->slots[i] = fd >= 0 ? counters->n_open++ : -1;
+
+    // no group leader, no counters
+    if (i == 0 && fd < 0) {
+      free(counters);
+      return nullptr;
+    }
+  }
+
+  return counters;
+}
+
+static void perf_start(void* _Nonnull state) {
+  perf_counters_t* counters = state;
+  ioctl(counters->fds[0], PERF_EVENT_IOC_RESET, PERF_IOC_FLAG_GROUP);
+  ioctl(counters->fds[0], PERF_EVENT_IOC_ENABLE, PERF_IOC_FLAG_GROUP);
+}
+
+static void perf_stop(void* _Nonnull state, counter_values_t* _Nonnull values) {
+  perf_counters_t* counters = state;
+  ioctl(counters->fds[0], PERF_EVENT_IOC_DISABLE, PERF_IOC_FLAG_GROUP);
+
+  // group read: number of counters, time enabled, time running and the counts
+  uint64_t data[3 + N_PERF_EVENTS];
+  if (read(counters->fds[0], data, sizeof(data)) < (ssize_t)((3 + counters->n_open)*sizeof(uint64_t))) return;
+  double scale = data[2] > 0 ? (double)data[1]/(double)data[2] : NAN;
+
+  double counts[N_PERF_EVENTS];
+  for (int i = 0; i < N_PERF_EVENTS; i++) {
+    counts[i] = counters->slots[i] >= 0 ? (double)data[3 + counters->slots[i]]*scale : NAN;
+  }
+  *values = (counter_values_t) { .cycles = counts[0], .instructions = counts[1], .l1d_misses = counts[2], .l2_misses = counts[3] };
+}
+
+static void perf_close(void* _Nonnull state) {
+  perf_counters_t* counters = state;
+  for (int i = 0; i < N_PERF_EVENTS; i++) {
+    if (counters->fds[i] >= 0) close(counters->fds[i]);
+  }
+  free(counters);
+}
+
+static const counter_backend_t perf_event_backend = {
+  .name = "perf_event",
+  .open = perf_open,
+  .start = perf_start,
+  .stop = perf_stop,
+  .close = perf_close,
+};
+
+const counter_backend_t* _Nullable perf_event_counter_backend(void) {
+  return &perf_event_backend;
+}
+
+#else
+
+const counter_backend_t* _Nullable perf_event_counter_backend(void) {
+  return nullptr;
+}
+
+#endif
@@ -0,0 +1,50 @@
+#ifndef counters_h
+#define counters_h
+
+#include "bench.h"
+
+#include <math.h>
+
+// Hardware counter collection of the harnesses (bench.c, harness.c)
+//
+// Every benchmark thread opens its counters before it waits for the start of the run, counts
+// around the call of the benchmark function and closes them after the run. Without a counter
+// backend (or if the backend cannot count the thread) the counts are NaN.
+
+// the selected counter backend (see set_counter_backend)
+const counter_backend_t* _Nullable counter_backend(void);
+
+typedef struct {
+  const counter_backend_t* _Nullable backend;
+  void* _Nullable state;
+} thread_counters_t;
+
+static const counter_values_t counters_unavailable = { .cycles = NAN, .instructions = NAN, .l1d_misses = NAN, .l2_misses = NAN };
+
+static inline thread_counters_t thread_counters_open(void) {
+  const counter_backend_t* backend = counter_backend();
+  return (thread_counters_t) { .backend = backend, .state = backend != nullptr ? backend->open() : nullptr };
+}
+
+static inline void thread_counters_start(thread_counters_t* _Nonnull counters) {
+  if (counters->state != nullptr) counters->backend->start(counters->state);
+}
+
+static inline void thread_counters_stop(thread_counters_t* _Nonnull counters, counter_values_t* _Nonnull values) {
+  *values = counters_unavailable;
+  if (counters->state != nullptr) counters->backend->stop(counters->state, values);
+}
+
+static inline void thread_counters_close(thread_counters_t* _Nonnull counters) {
+  if (counters->state != nullptr) counters->backend->close(counters->state);
+}
+
+// add the counts of a thread (a counter is NaN if any thread misses it)
+static inline void counters_add(counter_values_t* _Nonnull total, counter_values_t values) {
+  total->cycles += values.cycles;
+  total->instructions += values.instructions;
+  total->l1d_misses += values.l1d_misses;
+  total->l2_misses += values.l2_misses;
+}
+
+#endif
@@ -0,0 +1,1288 @@
+// generated by tools/gen_gemm_benchmarks.py, do not edit!
+#include <assert.h>
+#include <stdlib.h>
+#include <string.h>
+#include "../bench.h"
+
+// Benchmark parameters (packed operands)
+typedef struct {
+  char*  a;
+  char*  b;
+  char*  c;
+  size_t m;
+  size_t n;
+  size_t k;
+  size_t n_repeats;
+} benchmark_data_t;
+
+// benchmark functions
+
+double gemm_fmopa_f16_f16_1x1_k2(const void* args) {
+  // FMOPA (FP16), 1x1 tiles (32x32 C block), K unrolled 2x
+  //
+  // Per K loop iteration (2 K elements): 2x ld1h (A, 1 vectors) + 2x ld1h (B, 1 vectors), 2 fmopa
+  const benchmark_data_t* data = args;
+
+  for (size_t repeat = 0; repeat < data->n_repeats; repeat++) {
+    __asm__ __volatile__ (
+      "smstart                                                     \n"
+      "ptrue p0.h                                                  \n"
+      "ptrue p1.h                                                  \n"
+      "ptrue pn8.h                                                 \n"
+      "mov x5, %[a]                                                \n"
+      "mov x7, %[c]                                                \n"
+      "mov x9, %[m_blocks]                                         \n"
+      "1:                                                          \n"
+      "  mov x6, %[b]                                              \n"
+      "  mov x10, %[n_blocks]                                      \n"
+      "  2:                                                        \n"
+      "    zero {za}                                               \n"
+      "    mov x1, x5                                              \n"
+      "    mov x2, x6                                              \n"
+      "    mov x0, %[k_iterations]                                 \n"
+      "    3:                                                      \n"
+      "      ld1h z0.h, p0/z, [x1, 0, MUL VL]                      \n"
+      "      ld1h z16.h, p0/z, [x2, 0, MUL VL]                     \n"
+      "      fmopa za0.h, p0/m, p1/m, z0.h, z16.h                  \n"
+      "      ld1h z1.h, p0/z, [x1, 1, MUL VL]                      \n"
+      "      ld1h z17.h, p0/z, [x2, 1, MUL VL]                     \n"
+      "      fmopa za0.h, p0/m, p1/m, z1.h, z17.h                  \n"
+      "                                                            \n"
+      "      add x1, x1, #128                                      \n"
+      "      add x2, x2, #128                                      \n"
+      "      subs x0, x0, #1                                       \n"
+      "      b.ne 3b                                               \n"
+      "                                                            \n"
+      "    mov x12, #0                                             \n"
+      "    mov x3, x7                                              \n"
+      "    4:                                                      \n"
+      "      str za[w12, 0], [x3, 0, MUL VL]                       \n"
+      "      add x3, x3, #128                                      \n"
+      "      add w12, w12, #2                                      \n"
+      "      cmp w12, #64                                          \n"
+      "      b.ne 4b                                               \n"
+      "    add x7, x7, #4096                                       \n"
+      "    mov x6, x2                                              \n"
+      "    subs x10, x10, #1                                       \n"
+      "    b.ne 2b                                                 \n"
+      "  mov x5, x1                                                \n"
+      "  subs x9, x9, #1                                           \n"
+      "  b.ne 1b                                                   \n"
+      "smstop                                                      \n"
+      : // no outputs
+      : [a] "r" (data->a), [b] "r" (data->b), [c] "r" (data->c), [m_blocks] "r" (data->m/32), [n_blocks] "r" (data->n/32), [k_iterations] "r" (data->k/2)
+      : "x0", "x1", "x2", "x3", "x5", "x6", "x7", "x9", "x10", "x12", "memory"
+    );
+  }
+
+  // number of operations (2*M*N*K per GEMM)
+  return 2.0*(double)data->m*(double)data->n*(double)data->k*(double)data->n_repeats;
+}
+
+
+double gemm_fmopa_f32_f32_1x1_k2(const void* args) {
+  // FMOPA (FP32), 1x1 tiles (16x16 C block), K unrolled 2x
+  //
+  // Per K loop iteration (2 K elements): 2x ld1w (A, 1 vectors) + 2x ld1w (B, 1 vectors), 2 fmopa
+  const benchmark_data_t* data = args;
+
+  for (size_t repeat = 0; repeat < data->n_repeats; repeat++) {
+    __asm__ __volatile__ (
+      "smstart                                                     \n"
+      "ptrue p0.s                                                  \n"
+      "ptrue p1.s                                                  \n"
+      "ptrue pn8.s                                                 \n"
+      "mov x5, %[a]                                                \n"
+      "mov x7, %[c]                                                \n"
+      "mov x9, %[m_blocks]                                         \n"
+      "1:                                                          \n"
+      "  mov x6, %[b]                                              \n"
+      "  mov x10, %[n_blocks]                                      \n"
+      "  2:                                                        \n"
+      "    zero {za}                                               \n"
+      "    mov x1, x5                                              \n"
+      "    mov x2, x6                                              \n"
+      "    mov x0, %[k_iterations]                                 \n"
+      "    3:                                                      \n"
+      "      ld1w z0.s, p0/z, [x1, 0, MUL VL]                      \n"
+      "      ld1w z16.s, p0/z, [x2, 0, MUL VL]                     \n"
+      "      fmopa za0.s, p0/m, p1/m, z0.s, z16.s                  \n"
+      "      ld1w z1.s, p0/z, [x1, 1, MUL VL]                      \n"
+      "      ld1w z17.s, p0/z, [x2, 1, MUL VL]                     \n"
+      "      fmopa za0.s, p0/m, p1/m, z1.s, z17.s                  \n"
+      "                                                            \n"
+      "      add x1, x1, #128                                      \n"
+      "      add x2, x2, #128                                      \n"
+      "      subs x0, x0, #1                                       \n"
+      "      b.ne 3b                                               \n"
+      "                                                            \n"
+      "    mov x12, #0                                             \n"
+      "    mov x3, x7                                              \n"
+      "    4:                                                      \n"
+      "      str za[w12, 0], [x3, 0, MUL VL]                       \n"
+      "      add x3, x3, #256                                      \n"
+      "      add w12, w12, #4                                      \n"
+      "      cmp w12, #64                                          \n"
+      "      b.ne 4b                                               \n"
+      "    add x7, x7, #4096                                       \n"
+      "    mov x6, x2                                              \n"
+      "    subs x10, x10, #1                                       \n"
+      "    b.ne 2b                                                 \n"
+      "  mov x5, x1                                                \n"
+      "  subs x9, x9, #1                                           \n"
+      "  b.ne 1b                                                   \n"
+      "smstop                                                      \n"
+      : // no outputs
+      : [a] "r" (data->a), [b] "r" (data->b), [c] "r" (data->c), [m_blocks] "r" (data->m/16), [n_blocks] "r" (data->n/16), [k_iterations] "r" (data->k/2)
+      : "x0", "x1", "x2", "x3", "x5", "x6", "x7", "x9", "x10", "x12", "memory"
+    );
+  }
+
+  // number of operations (2*M*N*K per GEMM)
+  return 2.0*(double)data->m*(double)data->n*(double)data->k*(double)data->n_repeats;
+}
+
+
+double gemm_fmopa_f32_f32_1x4_k1(const void* args) {
+  // FMOPA (FP32), 1x4 tiles (16x64 C block), K unrolled 1x
+  //
+  // Per K loop iteration (1 K elements): 1x ld1w (A, 1 vectors) + 1x ld1w (B, 4 vectors), 4 fmopa
+  const benchmark_data_t* data = args;
+
+  for (size_t repeat = 0; repeat < data->n_repeats; repeat++) {
+    __asm__ __volatile__ (
+      "smstart                                                     \n"
+      "ptrue p0.s                                                  \n"
+      "ptrue p1.s                                                  \n"
+      "ptrue pn8.s                                                 \n"
+      "mov x5, %[a]                                                \n"
+      "mov x7, %[c]                                                \n"
+      "mov x9, %[m_blocks]                                         \n"
+      "1:                                                          \n"
+      "  mov x6, %[b]                                              \n"
+      "  mov x10, %[n_blocks]                                      \n"
+      "  2:                                                        \n"
+      "    zero {za}                                               \n"
+      "    mov x1, x5                                              \n"
+      "    mov x2, x6                                              \n"
+      "    mov x0, %[k_iterations]                                 \n"
+      "    3:                                                      \n"
+      "      ld1w z0.s, p0/z, [x1, 0, MUL VL]                      \n"
+      "      ld1w {z16.s-z19.s}, pn8/z, [x2, 0, MUL VL]            \n"
+      "      fmopa za0.s, p0/m, p1/m, z0.s, z16.s                  \n"
+      "      fmopa za1.s, p0/m, p1/m, z0.s, z17.s                  \n"
+      "      fmopa za2.s, p0/m, p1/m, z0.s, z18.s                  \n"
+      "      fmopa za3.s, p0/m, p1/m, z0.s, z19.s                  \n"
+      "                                                            \n"
+      "      add x1, x1, #64                                       \n"
+      "      add x2, x2, #256                                      \n"
+      "      subs x0, x0, #1                                       \n"
+      "      b.ne 3b                                               \n"
+      "                                                            \n"
+      "    mov x12, #0                                             \n"
+      "    mov x3, x7                                              \n"
+      "    4:                                                      \n"
+      "      str za[w12, 0], [x3, 0, MUL VL]                       \n"
+      "      str za[w12, 1], [x3, 1, MUL VL]                       \n"
+      "      str za[w12, 2], [x3, 2, MUL VL]                       \n"
+      "      str za[w12, 3], [x3, 3, MUL VL]                       \n"
+      "      add x3, x3, #256                                      \n"
+      "      add w12, w12, #4                                      \n"
+      "      cmp w12, #64                                          \n"
+      "      b.ne 4b                                               \n"
+      "    add x7, x7, #4096                                       \n"
+      "    mov x6, x2                                              \n"
+      "    subs x10, x10, #1                                       \n"
+      "    b.ne 2b                                                 \n"
+      "  mov x5, x1                                                \n"
+      "  subs x9, x9, #1                                           \n"
+      "  b.ne 1b                                                   \n"
+      "smstop                                                      \n"
+      : // no outputs
+      : [a] "r" (data->a), [b] "r" (data->b), [c] "r" (data->c), [m_blocks] "r" (data->m/16), [n_blocks] "r" (data->n/64), [k_iterations] "r" (data->k/1)
+      : "x0", "x1", "x2", "x3", "x5", "x6", "x7", "x9", "x10", "x12", "memory"
+    );
+  }
+
+  // number of operations (2*M*N*K per GEMM)
+  return 2.0*(double)data->m*(double)data->n*(double)data->k*(double)data->n_repeats;
+}
+
+
+double gemm_fmopa_f32_f32_2x2_k2(const void* args) {
+  // FMOPA (FP32), 2x2 tiles (32x32 C block), K unrolled 2x
+  //
+  // Per K loop iteration (2 K elements): 2x ld1w (A, 2 vectors) + 2x ld1w (B, 2 vectors), 8 fmopa
+  const benchmark_data_t* data = args;
+
+  for (size_t repeat = 0; repeat < data->n_repeats; repeat++) {
+    __asm__ __volatile__ (
+      "smstart                                                     \n"
+      "ptrue p0.s                                                  \n"
+      "ptrue p1.s                                                  \n"
+      "ptrue pn8.s                                                 \n"
+      "mov x5, %[a]                                                \n"
+      "mov x7, %[c]                                                \n"
+      "mov x9, %[m_blocks]                                         \n"
+      "1:                                                          \n"
+      "  mov x6, %[b]                                              \n"
+      "  mov x10, %[n_blocks]                                      \n"
+      "  2:                                                        \n"
+      "    zero {za}                                               \n"
+      "    mov x1, x5                                              \n"
+      "    mov x2, x6                                              \n"
+      "    mov x0, %[k_iterations]                                 \n"
+      "    3:                                                      \n"
+      "      ld1w {z0.s-z1.s}, pn8/z, [x1, 0, MUL VL]              \n"
+      "      ld1w {z16.s-z17.s}, pn8/z, [x2, 0, MUL VL]            \n"
+      "      fmopa za0.s, p0/m, p1/m, z0.s, z16.s                  \n"
+      "      fmopa za1.s, p0/m, p1/m, z0.s, z17.s                  \n"
+      "      fmopa za2.s, p0/m, p1/m, z1.s, z16.s                  \n"
+      "      fmopa za3.s, p0/m, p1/m, z1.s, z17.s                  \n"
+      "      ld1w {z2.s-z3.s}, pn8/z, [x1, 2, MUL VL]              \n"
+      "      ld1w {z18.s-z19.s}, pn8/z, [x2, 2, MUL VL]            \n"
+      "      fmopa za0.s, p0/m, p1/m, z2.s, z18.s                  \n"
+      "      fmopa za1.s, p0/m, p1/m, z2.s, z19.s                  \n"
+      "      fmopa za2.s, p0/m, p1/m, z3.s, z18.s                  \n"
+      "      fmopa za3.s, p0/m, p1/m, z3.s, z19.s                  \n"
+      "                                                            \n"
+      "      add x1, x1, #256                                      \n"
+      "      add x2, x2, #256                                      \n"
+      "      subs x0, x0, #1                                       \n"
+      "      b.ne 3b                                               \n"
+      "                                                            \n"
+      "    mov x12, #0                                             \n"
+      "    mov x3, x7                                              \n"
+      "    4:                                                      \n"
+      "      str za[w12, 0], [x3, 0, MUL VL]                       \n"
+      "      str za[w12, 1], [x3, 1, MUL VL]                       \n"
+      "      str za[w12, 2], [x3, 2, MUL VL]                       \n"
+      "      str za[w12, 3], [x3, 3, MUL VL]                       \n"
+      "      add x3, x3, #256                                      \n"
+      "      add w12, w12, #4                                      \n"
+      "      cmp w12, #64                                          \n"
+      "      b.ne 4b                                               \n"
+      "    add x7, x7, #4096                                       \n"
+      "    mov x6, x2                                              \n"
+      "    subs x10, x10, #1                                       \n"
+      "    b.ne 2b                                                 \n"
+      "  mov x5, x1                                                \n"
+      "  subs x9, x9, #1                                           \n"
+      "  b.ne 1b                                                   \n"
+      "smstop                                                      \n"
+      : // no outputs
+      : [a] "r" (data->a), [b] "r" (data->b), [c] "r" (data->c), [m_blocks] "r" (data->m/32), [n_blocks] "r" (data->n/32), [k_iterations] "r" (data->k/2)
+      : "x0", "x1", "x2", "x3", "x5", "x6", "x7", "x9", "x10", "x12", "memory"
+    );
+  }
+
+  // number of operations (2*M*N*K per GEMM)
+  return 2.0*(double)data->m*(double)data->n*(double)data->k*(double)data->n_repeats;
+}
+
+
+double gemm_fmopa_f64_f64_1x2_k4(const void* args) {
+  // FMOPA (FP64), 1x2 tiles (8x16 C block), K unrolled 4x
+  //
+  // Per K loop iteration (4 K elements): 4x ld1d (A, 1 vectors) + 4x ld1d (B, 2 vectors), 8 fmopa
+  const benchmark_data_t* data = args;
+
+  for (size_t repeat = 0; repeat < data->n_repeats; repeat++) {
+    __asm__ __volatile__ (
+      "smstart                                                     \n"
+      "ptrue p0.d                                                  \n"
+      "ptrue p1.d                                                  \n"
+      "ptrue pn8.d                                                 \n"
+      "mov x5, %[a]                                                \n"
+      "mov x7, %[c]                                                \n"
+      "mov x9, %[m_blocks]                                         \n"
+      "1:                                                          \n"
+      "  mov x6, %[b]                                              \n"
+      "  mov x10, %[n_blocks]                                      \n"
+      "  2:                                                        \n"
+      "    zero {za}                                               \n"
+      "    mov x1, x5                                              \n"
+      "    mov x2, x6                                              \n"
+      "    mov x0, %[k_iterations]                                 \n"
+      "    3:                                                      \n"
+      "      ld1d z0.d, p0/z, [x1, 0, MUL VL]                      \n"
+      "      ld1d {z16.d-z17.d}, pn8/z, [x2, 0, MUL VL]            \n"
+      "      fmopa za0.d, p0/m, p1/m, z0.d, z16.d                  \n"
+      "      fmopa za1.d, p0/m, p1/m, z0.d, z17.d                  \n"
+      "      ld1d z1.d, p0/z, [x1, 1, MUL VL]                      \n"
+      "      ld1d {z18.d-z19.d}, pn8/z, [x2, 2, MUL VL]            \n"
+      "      fmopa za0.d, p0/m, p1/m, z1.d, z18.d                  \n"
+      "      fmopa za1.d, p0/m, p1/m, z1.d, z19.d                  \n"
+      "      ld1d z2.d, p0/z, [x1, 2, MUL VL]                      \n"
+      "      ld1d {z20.d-z21.d}, pn8/z, [x2, 4, MUL VL]            \n"
+      "      fmopa za0.d, p0/m, p1/m, z2.d, z20.d                  \n"
+      "      fmopa za1.d, p0/m, p1/m, z2.d, z21.d                  \n"
+      "      ld1d z3.d, p0/z, [x1, 3, MUL VL]                      \n"
+      "      ld1d {z22.d-z23.d}, pn8/z, [x2, 6, MUL VL]            \n"
+      "      fmopa za0.d, p0/m, p1/m, z3.d, z22.d                  \n"
+      "      fmopa za1.d, p0/m, p1/m, z3.d, z23.d                  \n"
+      "                                                            \n"
+      "      add x1, x1, #256                                      \n"
+      "      add x2, x2, #512                                      \n"
+      "      subs x0, x0, #1                                       \n"
+      "      b.ne 3b                                               \n"
+      "                                                            \n"
+      "    mov x12, #0                                             \n"
+      "    mov x3, x7                                              \n"
+      "    4:                                                      \n"
+      "      str za[w12, 0], [x3, 0, MUL VL]                       \n"
+      "      str za[w12, 1], [x3, 1, MUL VL]                       \n"
+      "      add x3, x3, #512                                      \n"
+      "      add w12, w12, #8                                      \n"
+      "      cmp w12, #64                                          \n"
+      "      b.ne 4b                                               \n"
+      "    add x7, x7, #4096                                       \n"
+      "    mov x6, x2                                              \n"
+      "    subs x10, x10, #1                                       \n"
+      "    b.ne 2b                                                 \n"
+      "  mov x5, x1                                                \n"
+      "  subs x9, x9, #1                                           \n"
+      "  b.ne 1b                                                   \n"
+      "smstop                                                      \n"
+      : // no outputs
+      : [a] "r" (data->a), [b] "r" (data->b), [c] "r" (data->c), [m_blocks] "r" (data->m/8), [n_blocks] "r" (data->n/16), [k_iterations] "r" (data->k/4)
+      : "x0", "x1", "x2", "x3", "x5", "x6", "x7", "x9", "x10", "x12", "memory"
+    );
+  }
+
+  // number of operations (2*M*N*K per GEMM)
+  return 2.0*(double)data->m*(double)data->n*(double)data->k*(double)data->n_repeats;
+}
+
+
+double gemm_fmopa_f64_f64_2x1_k4(const void* args) {
+  // FMOPA (FP64), 2x1 tiles (16x8 C block), K unrolled 4x
+  //
+  // Per K loop iteration (4 K elements): 4x ld1d (A, 2 vectors) + 4x ld1d (B, 1 vectors), 8 fmopa
+  const benchmark_data_t* data = args;
+
+  for (size_t repeat = 0; repeat < data->n_repeats; repeat++) {
+    __asm__ __volatile__ (
+      "smstart                                                     \n"
+      "ptrue p0.d                                                  \n"
+      "ptrue p1.d                                                  \n"
+      "ptrue pn8.d                                                 \n"
+      "mov x5, %[a]                                                \n"
+      "mov x7, %[c]                                                \n"
+      "mov x9, %[m_blocks]                                         \n"
+      "1:                                                          \n"
+      "  mov x6, %[b]                                              \n"
+      "  mov x10, %[n_blocks]                                      \n"
+      "  2:                                                        \n"
+      "    zero {za}                                               \n"
+      "    mov x1, x5                                              \n"
+      "    mov x2, x6                                              \n"
+      "    mov x0, %[k_iterations]                                 \n"
+      "    3:                                                      \n"
+      "      ld1d {z0.d-z1.d}, pn8/z, [x1, 0, MUL VL]              \n"
+      "      ld1d z16.d, p0/z, [x2, 0, MUL VL]                     \n"
+      "      fmopa za0.d, p0/m, p1/m, z0.d, z16.d                  \n"
+      "      fmopa za1.d, p0/m, p1/m, z1.d, z16.d                  \n"
+      "      ld1d {z2.d-z3.d}, pn8/z, [x1, 2, MUL VL]              \n"
+      "      ld1d z17.d, p0/z, [x2, 1, MUL VL]                     \n"
+      "      fmopa za0.d, p0/m, p1/m, z2.d, z17.d                  \n"
+      "      fmopa za1.d, p0/m, p1/m, z3.d, z17.d                  \n"
+      "      ld1d {z4.d-z5.d}, pn8/z, [x1, 4, MUL VL]              \n"
+      "      ld1d z18.d, p0/z, [x2, 2, MUL VL]                     \n"
+      "      fmopa za0.d, p0/m, p1/m, z4.d, z18.d                  \n"
+      "      fmopa za1.d, p0/m, p1/m, z5.d, z18.d                  \n"
+      "      ld1d {z6.d-z7.d}, pn8/z, [x1, 6, MUL VL]              \n"
+      "      ld1d z19.d, p0/z, [x2, 3, MUL VL]                     \n"
+      "      fmopa za0.d, p0/m, p1/m, z6.d, z19.d                  \n"
+      "      fmopa za1.d, p0/m, p1/m, z7.d, z19.d                  \n"
+      "                                                            \n"
+      "      add x1, x1, #512                                      \n"
+      "      add x2, x2, #256                                      \n"
+      "      subs x0, x0, #1                                       \n"
+      "      b.ne 3b                                               \n"
+      "                                                            \n"
+      "    mov x12, #0                                             \n"
+      "    mov x3, x7                                              \n"
+      "    4:                                                      \n"
+      "      str za[w12, 0], [x3, 0, MUL VL]                       \n"
+      "      str za[w12, 1], [x3, 1, MUL VL]                       \n"
+      "      add x3, x3, #512                                      \n"
+      "      add w12, w12, #8                                      \n"
+      "      cmp w12, #64                                          \n"
+      "      b.ne 4b                                               \n"
+      "    add x7, x7, #4096                                       \n"
+      "    mov x6, x2                                              \n"
+      "    subs x10, x10, #1                                       \n"
+      "    b.ne 2b                                                 \n"
+      "  mov x5, x1                                                \n"
+      "  subs x9, x9, #1                                           \n"
+      "  b.ne 1b                                                   \n"
+      "smstop                                                      \n"
+      : // no outputs
+      : [a] "r" (data->a), [b] "r" (data->b), [c] "r" (data->c), [m_blocks] "r" (data->m/16), [n_blocks] "r" (data->n/8), [k_iterations] "r" (data->k/4)
+      : "x0", "x1", "x2", "x3", "x5", "x6", "x7", "x9", "x10", "x12", "memory"
+    );
+  }
+
+  // number of operations (2*M*N*K per GEMM)
+  return 2.0*(double)data->m*(double)data->n*(double)data->k*(double)data->n_repeats;
+}
+
+
+double gemm_fmopa_f64_f64_4x1_k2(const void* args) {
+  // FMOPA (FP64), 4x1 tiles (32x8 C block), K unrolled 2x
+  //
+  // Per K loop iteration (2 K elements): 2x ld1d (A, 4 vectors) + 2x ld1d (B, 1 vectors), 8 fmopa
+  const benchmark_data_t* data = args;
+
+  for (size_t repeat = 0; repeat < data->n_repeats; repeat++) {
+    __asm__ __volatile__ (
+      "smstart                                                     \n"
+      "ptrue p0.d                                                  \n"
+      "ptrue p1.d                                                  \n"
+      "ptrue pn8.d                                                 \n"
+      "mov x5, %[a]                                                \n"
+      "mov x7, %[c]                                                \n"
+      "mov x9, %[m_blocks]                                         \n"
+      "1:                                                          \n"
+      "  mov x6, %[b]                                              \n"
+      "  mov x10, %[n_blocks]                                      \n"
+      "  2:                                                        \n"
+      "    zero {za}                                               \n"
+      "    mov x1, x5                                              \n"
+      "    mov x2, x6                                              \n"
+      "    mov x0, %[k_iterations]                                 \n"
+      "    3:                                                      \n"
+      "      ld1d {z0.d-z3.d}, pn8/z, [x1, 0, MUL VL]              \n"
+      "      ld1d z16.d, p0/z, [x2, 0, MUL VL]                     \n"
+      "      fmopa za0.d, p0/m, p1/m, z0.d, z16.d                  \n"
+      "      fmopa za1.d, p0/m, p1/m, z1.d, z16.d                  \n"
+      "      fmopa za2.d, p0/m, p1/m, z2.d, z16.d                  \n"
+      "      fmopa za3.d, p0/m, p1/m, z3.d, z16.d                  \n"
+      "      ld1d {z4.d-z7.d}, pn8/z, [x1, 4, MUL VL]              \n"
+      "      ld1d z17.d, p0/z, [x2, 1, MUL VL]                     \n"
+      "      fmopa za0.d, p0/m, p1/m, z4.d, z17.d                  \n"
+      "      fmopa za1.d, p0/m, p1/m, z5.d, z17.d                  \n"
+      "      fmopa za2.d, p0/m, p1/m, z6.d, z17.d                  \n"
+      "      fmopa za3.d, p0/m, p1/m, z7.d, z17.d                  \n"
+      "                                                            \n"
+      "      add x1, x1, #512                                      \n"
+      "      add x2, x2, #128                                      \n"
+      "      subs x0, x0, #1                                       \n"
+      "      b.ne 3b                                               \n"
+      "                                                            \n"
+      "    mov x12, #0                                             \n"
+      "    mov x3, x7                                              \n"
+      "    4:                                                      \n"
+      "      str za[w12, 0], [x3, 0, MUL VL]                       \n"
+      "      str za[w12, 1], [x3, 1, MUL VL]                       \n"
+      "      str za[w12, 2], [x3, 2, MUL VL]                       \n"
+      "      str za[w12, 3], [x3, 3, MUL VL]                       \n"
+      "      add x3, x3, #512                                      \n"
+      "      add w12, w12, #8                                      \n"
+      "      cmp w12, #64                                          \n"
+      "      b.ne 4b                                               \n"
+      "    add x7, x7, #4096                                       \n"
+      "    mov x6, x2                                              \n"
+      "    subs x10, x10, #1                                       \n"
+      "    b.ne 2b                                                 \n"
+      "  mov x5, x1                                                \n"
+      "  subs x9, x9, #1                                           \n"
+      "  b.ne 1b                                                   \n"
+      "smstop                                                      \n"
+      : // no outputs
+      : [a] "r" (data->a), [b] "r" (data->b), [c] "r" (data->c), [m_blocks] "r" (data->m/32), [n_blocks] "r" (data->n/8), [k_iterations] "r" (data->k/2)
+      : "x0", "x1", "x2", "x3", "x5", "x6", "x7", "x9", "x10", "x12", "memory"
+    );
+  }
+
+  // number of operations (2*M*N*K per GEMM)
+  return 2.0*(double)data->m*(double)data->n*(double)data->k*(double)data->n_repeats;
+}
+
+
+double gemm_fmopa_f32_f16_1x2_k1(const void* args) {
+  // FMOPA (FP16 into FP32, 2-way), 1x2 tiles (16x32 C block), K unrolled 1x
+  //
+  // Per K loop iteration (2 K elements): 1x ld1h (A, 1 vectors) + 1x ld1h (B, 2 vectors), 2 fmopa
+  const benchmark_data_t* data = args;
+
+  for (size_t repeat = 0; repeat < data->n_repeats; repeat++) {
+    __asm__ __volatile__ (
+      "smstart                                                     \n"
+      "ptrue p0.h                                                  \n"
+      "ptrue p1.h                                                  \n"
+      "ptrue pn8.h                                                 \n"
+      "mov x5, %[a]                                                \n"
+      "mov x7, %[c]                                                \n"
+      "mov x9, %[m_blocks]                                         \n"
+      "1:                                                          \n"
+      "  mov x6, %[b]                                              \n"
+      "  mov x10, %[n_blocks]                                      \n"
+      "  2:                                                        \n"
+      "    zero {za}                                               \n"
+      "    mov x1, x5                                              \n"
+      "    mov x2, x6                                              \n"
+      "    mov x0, %[k_iterations]                                 \n"
+      "    3:                                                      \n"
+      "      ld1h z0.h, p0/z, [x1, 0, MUL VL]                      \n"
+      "      ld1h {z16.h-z17.h}, pn8/z, [x2, 0, MUL VL]            \n"
+      "      fmopa za0.s, p0/m, p1/m, z0.h, z16.h                  \n"
+      "      fmopa za1.s, p0/m, p1/m, z0.h, z17.h                  \n"
+      "                                                            \n"
+      "      add x1, x1, #64                                       \n"
+      "      add x2, x2, #128                                      \n"
+      "      subs x0, x0, #1                                       \n"
+      "      b.ne 3b                                               \n"
+      "                                                            \n"
+      "    mov x12, #0                                             \n"
+      "    mov x3, x7                                              \n"
+      "    4:                                                      \n"
+      "      str za[w12, 0], [x3, 0, MUL VL]                       \n"
+      "      str za[w12, 1], [x3, 1, MUL VL]                       \n"
+      "      add x3, x3, #256                                      \n"
+      "      add w12, w12, #4                                      \n"
+      "      cmp w12, #64                                          \n"
+      "      b.ne 4b                                               \n"
+      "    add x7, x7, #4096                                       \n"
+      "    mov x6, x2                                              \n"
+      "    subs x10, x10, #1                                       \n"
+      "    b.ne 2b                                                 \n"
+      "  mov x5, x1                                                \n"
+      "  subs x9, x9, #1                                           \n"
+      "  b.ne 1b                                                   \n"
+      "smstop                                                      \n"
+      : // no outputs
+      : [a] "r" (data->a), [b] "r" (data->b), [c] "r" (data->c), [m_blocks] "r" (data->m/16), [n_blocks] "r" (data->n/32), [k_iterations] "r" (data->k/2)
+      : "x0", "x1", "x2", "x3", "x5", "x6", "x7", "x9", "x10", "x12", "memory"
+    );
+  }
+
+  // number of operations (2*M*N*K per GEMM)
+  return 2.0*(double)data->m*(double)data->n*(double)data->k*(double)data->n_repeats;
+}
+
+
+double gemm_fmopa_f32_f16_2x1_k1(const void* args) {
+  // FMOPA (FP16 into FP32, 2-way), 2x1 tiles (32x16 C block), K unrolled 1x
+  //
+  // Per K loop iteration (2 K elements): 1x ld1h (A, 2 vectors) + 1x ld1h (B, 1 vectors), 2 fmopa
+  const benchmark_data_t* data = args;
+
+  for (size_t repeat = 0; repeat < data->n_repeats; repeat++) {
+    __asm__ __volatile__ (
+      "smstart                                                     \n"
+      "ptrue p0.h                                                  \n"
+      "ptrue p1.h                                                  \n"
+      "ptrue pn8.h                                                 \n"
+      "mov x5, %[a]                                                \n"
+      "mov x7, %[c]                                                \n"
+      "mov x9, %[m_blocks]                                         \n"
+      "1:                                                          \n"
+      "  mov x6, %[b]                                              \n"
+      "  mov x10, %[n_blocks]                                      \n"
+      "  2:                                                        \n"
+      "    zero {za}                                               \n"
+      "    mov x1, x5                                              \n"
+      "    mov x2, x6                                              \n"
+      "    mov x0, %[k_iterations]                                 \n"
+      "    3:                                                      \n"
+      "      ld1h {z0.h-z1.h}, pn8/z, [x1, 0, MUL VL]              \n"
+      "      ld1h z16.h, p0/z, [x2, 0, MUL VL]                     \n"
+      "      fmopa za0.s, p0/m, p1/m, z0.h, z16.h                  \n"
+      "      fmopa za1.s, p0/m, p1/m, z1.h, z16.h                  \n"
+      "                                                            \n"
+      "      add x1, x1, #128                                      \n"
+      "      add x2, x2, #64                                       \n"
+      "      subs x0, x0, #1                                       \n"
+      "      b.ne 3b                                               \n"
+      "                                                            \n"
+      "    mov x12, #0                                             \n"
+      "    mov x3, x7                                              \n"
+      "    4:                                                      \n"
+      "      str za[w12, 0], [x3, 0, MUL VL]                       \n"
+      "      str za[w12, 1], [x3, 1, MUL VL]                       \n"
+      "      add x3, x3, #256                                      \n"
+      "      add w12, w12, #4                                      \n"
+      "      cmp w12, #64                                          \n"
+      "      b.ne 4b                                               \n"
+      "    add x7, x7, #4096                                       \n"
+      "    mov x6, x2                                              \n"
+      "    subs x10, x10, #1                                       \n"
+      "    b.ne 2b                                                 \n"
+      "  mov x5, x1                                                \n"
+      "  subs x9, x9, #1                                           \n"
+      "  b.ne 1b                                                   \n"
+      "smstop                                                      \n"
+      : // no outputs
+      : [a] "r" (data->a), [b] "r" (data->b), [c] "r" (data->c), [m_blocks] "r" (data->m/32), [n_blocks] "r" (data->n/16), [k_iterations] "r" (data->k/2)
+      : "x0", "x1", "x2", "x3", "x5", "x6", "x7", "x9", "x10", "x12", "memory"
+    );
+  }
+
+  // number of operations (2*M*N*K per GEMM)
+  return 2.0*(double)data->m*(double)data->n*(double)data->k*(double)data->n_repeats;
+}
+
+
+double gemm_bfmopa_f32_b16_4x1_k1(const void* args) {
+  // BFMOPA (BF16 into FP32, 2-way), 4x1 tiles (64x16 C block), K unrolled 1x
+  //
+  // Per K loop iteration (2 K elements): 1x ld1h (A, 4 vectors) + 1x ld1h (B, 1 vectors), 4 bfmopa
+  const benchmark_data_t* data = args;
+
+  for (size_t repeat = 0; repeat < data->n_repeats; repeat++) {
+    __asm__ __volatile__ (
+      "smstart                                                     \n"
+      "ptrue p0.h                                                  \n"
+      "ptrue p1.h                                                  \n"
+      "ptrue pn8.h                                                 \n"
+      "mov x5, %[a]                                                \n"
+      "mov x7, %[c]                                                \n"
+      "mov x9, %[m_blocks]                                         \n"
+      "1:                                                          \n"
+      "  mov x6, %[b]                                              \n"
+      "  mov x10, %[n_blocks]                                      \n"
+      "  2:                                                        \n"
+      "    zero {za}                                               \n"
+      "    mov x1, x5                                              \n"
+      "    mov x2, x6                                              \n"
+      "    mov x0, %[k_iterations]                                 \n"
+      "    3:                                                      \n"
+      "      ld1h {z0.h-z3.h}, pn8/z, [x1, 0, MUL VL]              \n"
+      "      ld1h z16.h, p0/z, [x2, 0, MUL VL]                     \n"
+      "      bfmopa za0.s, p0/m, p1/m, z0.h, z16.h                 \n"
+      "      bfmopa za1.s, p0/m, p1/m, z1.h, z16.h                 \n"
+      "      bfmopa za2.s, p0/m, p1/m, z2.h, z16.h                 \n"
+      "      bfmopa za3.s, p0/m, p1/m, z3.h, z16.h                 \n"
+      "                                                            \n"
+      "      add x1, x1, #256                                      \n"
+      "      add x2, x2, #64                                       \n"
+      "      subs x0, x0, #1                                       \n"
+      "      b.ne 3b                                               \n"
+      "                                                            \n"
+      "    mov x12, #0                                             \n"
+      "    mov x3, x7                                              \n"
+      "    4:                                                      \n"
+      "      str za[w12, 0], [x3, 0, MUL VL]                       \n"
+      "      str za[w12, 1], [x3, 1, MUL VL]                       \n"
+      "      str za[w12, 2], [x3, 2, MUL VL]                       \n"
+      "      str za[w12, 3], [x3, 3, MUL VL]                       \n"
+      "      add x3, x3, #256                                      \n"
+      "      add w12, w12, #4                                      \n"
+      "      cmp w12, #64                                          \n"
+      "      b.ne 4b                                               \n"
+      "    add x7, x7, #4096                                       \n"
+      "    mov x6, x2                                              \n"
+      "    subs x10, x10, #1                                       \n"
+      "    b.ne 2b                                                 \n"
+      "  mov x5, x1                                                \n"
+      "  subs x9, x9, #1                                           \n"
+      "  b.ne 1b                                                   \n"
+      "smstop                                                      \n"
+      : // no outputs
+      : [a] "r" (data->a), [b] "r" (data->b), [c] "r" (data->c), [m_blocks] "r" (data->m/64), [n_blocks] "r" (data->n/16), [k_iterations] "r" (data->k/2)
+      : "x0", "x1", "x2", "x3", "x5", "x6", "x7", "x9", "x10", "x12", "memory"
+    );
+  }
+
+  // number of operations (2*M*N*K per GEMM)
+  return 2.0*(double)data->m*(double)data->n*(double)data->k*(double)data->n_repeats;
+}
+
+
+double gemm_smopa_i32_i16_1x1_k4(const void* args) {
+  // SMOPA (I16 into I32, 2-way), 1x1 tiles (16x16 C block), K unrolled 4x
+  //
+  // Per K loop iteration (8 K elements): 4x ld1h (A, 1 vectors) + 4x ld1h (B, 1 vectors), 4 smopa
+  const benchmark_data_t* data = args;
+
+  for (size_t repeat = 0; repeat < data->n_repeats; repeat++) {
+    __asm__ __volatile__ (
+      "smstart                                                     \n"
+      "ptrue p0.h                                                  \n"
+      "ptrue p1.h                                                  \n"
+      "ptrue pn8.h                                                 \n"
+      "mov x5, %[a]                                                \n"
+      "mov x7, %[c]                                                \n"
+      "mov x9, %[m_blocks]                                         \n"
+      "1:                                                          \n"
+      "  mov x6, %[b]                                              \n"
+      "  mov x10, %[n_blocks]                                      \n"
+      "  2:                                                        \n"
+      "    zero {za}                                               \n"
+      "    mov x1, x5                                              \n"
+      "    mov x2, x6                                              \n"
+      "    mov x0, %[k_iterations]                                 \n"
+      "    3:                                                      \n"
+      "      ld1h z0.h, p0/z, [x1, 0, MUL VL]                      \n"
+      "      ld1h z16.h, p0/z, [x2, 0, MUL VL]                     \n"
+      "      smopa za0.s, p0/m, p1/m, z0.h, z16.h                  \n"
+      "      ld1h z1.h, p0/z, [x1, 1, MUL VL]                      \n"
+      "      ld1h z17.h, p0/z, [x2, 1, MUL VL]                     \n"
+      "      smopa za0.s, p0/m, p1/m, z1.h, z17.h                  \n"
+      "      ld1h z2.h, p0/z, [x1, 2, MUL VL]                      \n"
+      "      ld1h z18.h, p0/z, [x2, 2, MUL VL]                     \n"
+      "      smopa za0.s, p0/m, p1/m, z2.h, z18.h                  \n"
+      "      ld1h z3.h, p0/z, [x1, 3, MUL VL]                      \n"
+      "      ld1h z19.h, p0/z, [x2, 3, MUL VL]                     \n"
+      "      smopa za0.s, p0/m, p1/m, z3.h, z19.h                  \n"
+      "                                                            \n"
+      "      add x1, x1, #256                                      \n"
+      "      add x2, x2, #256                                      \n"
+      "      subs x0, x0, #1                                       \n"
+      "      b.ne 3b                                               \n"
+      "                                                            \n"
+      "    mov x12, #0                                             \n"
+      "    mov x3, x7                                              \n"
+      "    4:                                                      \n"
+      "      str za[w12, 0], [x3, 0, MUL VL]                       \n"
+      "      add x3, x3, #256                                      \n"
+      "      add w12, w12, #4                                      \n"
+      "      cmp w12, #64                                          \n"
+      "      b.ne 4b                                               \n"
+      "    add x7, x7, #4096                                       \n"
+      "    mov x6, x2                                              \n"
+      "    subs x10, x10, #1                                       \n"
+      "    b.ne 2b                                                 \n"
+      "  mov x5, x1                                                \n"
+      "  subs x9, x9, #1                                           \n"
+      "  b.ne 1b                                                   \n"
+      "smstop                                                      \n"
+      : // no outputs
+      : [a] "r" (data->a), [b] "r" (data->b), [c] "r" (data->c), [m_blocks] "r" (data->m/16), [n_blocks] "r" (data->n/16), [k_iterations] "r" (data->k/8)
+      : "x0", "x1", "x2", "x3", "x5", "x6", "x7", "x9", "x10", "x12", "memory"
+    );
+  }
+
+  // number of operations (2*M*N*K per GEMM)
+  return 2.0*(double)data->m*(double)data->n*(double)data->k*(double)data->n_repeats;
+}
+
+
+double gemm_smopa_i32_i16_2x2_k4(const void* args) {
+  // SMOPA (I16 into I32, 2-way), 2x2 tiles (32x32 C block), K unrolled 4x
+  //
+  // Per K loop iteration (8 K elements): 4x ld1h (A, 2 vectors) + 4x ld1h (B, 2 vectors), 16 smopa
+  const benchmark_data_t* data = args;
+
+  for (size_t repeat = 0; repeat < data->n_repeats; repeat++) {
+    __asm__ __volatile__ (
+      "smstart                                                     \n"
+      "ptrue p0.h                                                  \n"
+      "ptrue p1.h                                                  \n"
+      "ptrue pn8.h                                                 \n"
+      "mov x5, %[a]                                                \n"
+      "mov x7, %[c]                                                \n"
+      "mov x9, %[m_blocks]                                         \n"
+      "1:                                                          \n"
+      "  mov x6, %[b]                                              \n"
+      "  mov x10, %[n_blocks]                                      \n"
+      "  2:                                                        \n"
+      "    zero {za}                                               \n"
+      "    mov x1, x5                                              \n"
+      "    mov x2, x6                                              \n"
+      "    mov x0, %[k_iterations]                                 \n"
+      "    3:                                                      \n"
+      "      ld1h {z0.h-z1.h}, pn8/z, [x1, 0, MUL VL]              \n"
+      "      ld1h {z16.h-z17.h}, pn8/z, [x2, 0, MUL VL]            \n"
+      "      smopa za0.s, p0/m, p1/m, z0.h, z16.h                  \n"
+      "      smopa za1.s, p0/m, p1/m, z0.h, z17.h                  \n"
+      "      smopa za2.s, p0/m, p1/m, z1.h, z16.h                  \n"
+      "      smopa za3.s, p0/m, p1/m, z1.h, z17.h                  \n"
+      "      ld1h {z2.h-z3.h}, pn8/z, [x1, 2, MUL VL]              \n"
+      "      ld1h {z18.h-z19.h}, pn8/z, [x2, 2, MUL VL]            \n"
+      "      smopa za0.s, p0/m, p1/m, z2.h, z18.h                  \n"
+      "      smopa za1.s, p0/m, p1/m, z2.h, z19.h                  \n"
+      "      smopa za2.s, p0/m, p1/m, z3.h, z18.h                  \n"
+      "      smopa za3.s, p0/m, p1/m, z3.h, z19.h                  \n"
+      "      ld1h {z4.h-z5.h}, pn8/z, [x1, 4, MUL VL]              \n"
+      "      ld1h {z20.h-z21.h}, pn8/z, [x2, 4, MUL VL]            \n"
+      "      smopa za0.s, p0/m, p1/m, z4.h, z20.h                  \n"
+      "      smopa za1.s, p0/m, p1/m, z4.h, z21.h                  \n"
+      "      smopa za2.s, p0/m, p1/m, z5.h, z20.h                  \n"
+      "      smopa za3.s, p0/m, p1/m, z5.h, z21.h                  \n"
+      "      ld1h {z6.h-z7.h}, pn8/z, [x1, 6, MUL VL]              \n"
+      "      ld1h {z22.h-z23.h}, pn8/z, [x2, 6, MUL VL]            \n"
+      "      smopa za0.s, p0/m, p1/m, z6.h, z22.h                  \n"
+      "      smopa za1.s, p0/m, p1/m, z6.h, z23.h                  \n"
+      "      smopa za2.s, p0/m, p1/m, z7.h, z22.h                  \n"
+      "      smopa za3.s, p0/m, p1/m, z7.h, z23.h                  \n"
+      "                                                            \n"
+      "      add x1, x1, #512                                      \n"
+      "      add x2, x2, #512                                      \n"
+      "      subs x0, x0, #1                                       \n"
+      "      b.ne 3b                                               \n"
+      "                                                            \n"
+      "    mov x12, #0                                             \n"
+      "    mov x3, x7                                              \n"
+      "    4:                                                      \n"
+      "      str za[w12, 0], [x3, 0, MUL VL]                       \n"
+      "      str za[w12, 1], [x3, 1, MUL VL]                       \n"
+      "      str za[w12, 2], [x3, 2, MUL VL]                       \n"
+      "      str za[w12, 3], [x3, 3, MUL VL]                       \n"
+      "      add x3, x3, #256                                      \n"
+      "      add w12, w12, #4                                      \n"
+      "      cmp w12, #64                                          \n"
+      "      b.ne 4b                                               \n"
+      "    add x7, x7, #4096                                       \n"
+      "    mov x6, x2                                              \n"
+      "    subs x10, x10, #1                                       \n"
+      "    b.ne 2b                                                 \n"
+      "  mov x5, x1                                                \n"
+      "  subs x9, x9, #1                                           \n"
+      "  b.ne 1b                                                   \n"
+      "smstop                                                      \n"
+      : // no outputs
+      : [a] "r" (data->a), [b] "r" (data->b), [c] "r" (data->c), [m_blocks] "r" (data->m/32), [n_blocks] "r" (data->n/32), [k_iterations] "r" (data->k/8)
+      : "x0", "x1", "x2", "x3", "x5", "x6", "x7", "x9", "x10", "x12", "memory"
+    );
+  }
+
+  // number of operations (2*M*N*K per GEMM)
+  return 2.0*(double)data->m*(double)data->n*(double)data->k*(double)data->n_repeats;
+}
+
+
+double gemm_smopa_i32_i8_1x1_k4(const void* args) {
+  // SMOPA (I8 into I32, 4-way), 1x1 tiles (16x16 C block), K unrolled 4x
+  //
+  // Per K loop iteration (16 K elements): 4x ld1b (A, 1 vectors) + 4x ld1b (B, 1 vectors), 4 smopa
+  const benchmark_data_t* data = args;
+
+  for (size_t repeat = 0; repeat < data->n_repeats; repeat++) {
+    __asm__ __volatile__ (
+      "smstart                                                     \n"
+      "ptrue p0.b                                                  \n"
+      "ptrue p1.b                                                  \n"
+      "ptrue pn8.b                                                 \n"
+      "mov x5, %[a]                                                \n"
+      "mov x7, %[c]                                                \n"
+      "mov x9, %[m_blocks]                                         \n"
+      "1:                                                          \n"
+      "  mov x6, %[b]                                              \n"
+      "  mov x10, %[n_blocks]                                      \n"
+      "  2:                                                        \n"
+      "    zero {za}                                               \n"
+      "    mov x1, x5                                              \n"
+      "    mov x2, x6                                              \n"
+      "    mov x0, %[k_iterations]                                 \n"
+      "    3:                                                      \n"
+      "      ld1b z0.b, p0/z, [x1, 0, MUL VL]                      \n"
+      "      ld1b z16.b, p0/z, [x2, 0, MUL VL]                     \n"
+      "      smopa za0.s, p0/m, p1/m, z0.b, z16.b                  \n"
+      "      ld1b z1.b, p0/z, [x1, 1, MUL VL]                      \n"
+      "      ld1b z17.b, p0/z, [x2, 1, MUL VL]                     \n"
+      "      smopa za0.s, p0/m, p1/m, z1.b, z17.b                  \n"
+      "      ld1b z2.b, p0/z, [x1, 2, MUL VL]                      \n"
+      "      ld1b z18.b, p0/z, [x2, 2, MUL VL]                     \n"
+      "      smopa za0.s, p0/m, p1/m, z2.b, z18.b                  \n"
+      "      ld1b z3.b, p0/z, [x1, 3, MUL VL]                      \n"
+      "      ld1b z19.b, p0/z, [x2, 3, MUL VL]                     \n"
+      "      smopa za0.s, p0/m, p1/m, z3.b, z19.b                  \n"
+      "                                                            \n"
+      "      add x1, x1, #256                                      \n"
+      "      add x2, x2, #256                                      \n"
+      "      subs x0, x0, #1                                       \n"
+      "      b.ne 3b                                               \n"
+      "                                                            \n"
+      "    mov x12, #0                                             \n"
+      "    mov x3, x7                                              \n"
+      "    4:                                                      \n"
+      "      str za[w12, 0], [x3, 0, MUL VL]                       \n"
+      "      add x3, x3, #256                                      \n"
+      "      add w12, w12, #4                                      \n"
+      "      cmp w12, #64                                          \n"
+      "      b.ne 4b                                               \n"
+      "    add x7, x7, #4096                                       \n"
+      "    mov x6, x2                                              \n"
+      "    subs x10, x10, #1                                       \n"
+      "    b.ne 2b                                                 \n"
+      "  mov x5, x1                                                \n"
+      "  subs x9, x9, #1                                           \n"
+      "  b.ne 1b                                                   \n"
+      "smstop                                                      \n"
+      : // no outputs
+      : [a] "r" (data->a), [b] "r" (data->b), [c] "r" (data->c), [m_blocks] "r" (data->m/16), [n_blocks] "r" (data->n/16), [k_iterations] "r" (data->k/16)
+      : "x0", "x1", "x2", "x3", "x5", "x6", "x7", "x9", "x10", "x12", "memory"
+    );
+  }
+
+  // number of operations (2*M*N*K per GEMM)
+  return 2.0*(double)data->m*(double)data->n*(double)data->k*(double)data->n_repeats;
+}
+
+
+double gemm_smopa_i32_i8_2x2_k4(const void* args) {
+  // SMOPA (I8 into I32, 4-way), 2x2 tiles (32x32 C block), K unrolled 4x
+  //
+  // Per K loop iteration (16 K elements): 4x ld1b (A, 2 vectors) + 4x ld1b (B, 2 vectors), 16 smopa
+  const benchmark_data_t* data = args;
+
+  for (size_t repeat = 0; repeat < data->n_repeats; repeat++) {
+    __asm__ __volatile__ (
+      "smstart                                                     \n"
+      "ptrue p0.b                                                  \n"
+      "ptrue p1.b                                                  \n"
+      "ptrue pn8.b                                                 \n"
+      "mov x5, %[a]                                                \n"
+      "mov x7, %[c]                                                \n"
+      "mov x9, %[m_blocks]                                         \n"
+      "1:                                                          \n"
+      "  mov x6, %[b]                                              \n"
+      "  mov x10, %[n_blocks]                                      \n"
+      "  2:                                                        \n"
+      "    zero {za}                                               \n"
+      "    mov x1, x5                                              \n"
+      "    mov x2, x6                                              \n"
+      "    mov x0, %[k_iterations]                                 \n"
+      "    3:                                                      \n"
+      "      ld1b {z0.b-z1.b}, pn8/z, [x1, 0, MUL VL]              \n"
+      "      ld1b {z16.b-z17.b}, pn8/z, [x2, 0, MUL VL]            \n"
+      "      smopa za0.s, p0/m, p1/m, z0.b, z16.b                  \n"
+      "      smopa za1.s, p0/m, p1/m, z0.b, z17.b                  \n"
+      "      smopa za2.s, p0/m, p1/m, z1.b, z16.b                  \n"
+      "      smopa za3.s, p0/m, p1/m, z1.b, z17.b                  \n"
+      "      ld1b {z2.b-z3.b}, pn8/z, [x1, 2, MUL VL]              \n"
+      "      ld1b {z18.b-z19.b}, pn8/z, [x2, 2, MUL VL]            \n"
+      "      smopa za0.s, p0/m, p1/m, z2.b, z18.b                  \n"
+      "      smopa za1.s, p0/m, p1/m, z2.b, z19.b                  \n"
+      "      smopa za2.s, p0/m, p1/m, z3.b, z18.b                  \n"
+      "      smopa za3.s, p0/m, p1/m, z3.b, z19.b                  \n"
+      "      ld1b {z4.b-z5.b}, pn8/z, [x1, 4, MUL VL]              \n"
+      "      ld1b {z20.b-z21.b}, pn8/z, [x2, 4, MUL VL]            \n"
+      "      smopa za0.s, p0/m, p1/m, z4.b, z20.b                  \n"
+      "      smopa za1.s, p0/m, p1/m, z4.b, z21.b                  \n"
+      "      smopa za2.s, p0/m, p1/m, z5.b, z20.b                  \n"
+      "      smopa za3.s, p0/m, p1/m, z5.b, z21.b                  \n"
+      "      ld1b {z6.b-z7.b}, pn8/z, [x1, 6, MUL VL]              \n"
+      "      ld1b {z22.b-z23.b}, pn8/z, [x2, 6, MUL VL]            \n"
+      "      smopa za0.s, p0/m, p1/m, z6.b, z22.b                  \n"
+      "      smopa za1.s, p0/m, p1/m, z6.b, z23.b                  \n"
+      "      smopa za2.s, p0/m, p1/m, z7.b, z22.b                  \n"
+      "      smopa za3.s, p0/m, p1/m, z7.b, z23.b                  \n"
+      "                                                            \n"
+      "      add x1, x1, #512                                      \n"
+      "      add x2, x2, #512                                      \n"
+      "      subs x0, x0, #1                                       \n"
+      "      b.ne 3b                                               \n"
+      "                                                            \n"
+      "    mov x12, #0                                             \n"
+      "    mov x3, x7                                              \n"
+      "    4:                                                      \n"
+      "      str za[w12, 0], [x3, 0, MUL VL]                       \n"
+      "      str za[w12, 1], [x3, 1, MUL VL]                       \n"
+      "      str za[w12, 2], [x3, 2, MUL VL]                       \n"
+      "      str za[w12, 3], [x3, 3, MUL VL]                       \n"
+      "      add x3, x3, #256                                      \n"
+      "      add w12, w12, #4                                      \n"
+      "      cmp w12, #64                                          \n"
+      "      b.ne 4b                                               \n"
+      "    add x7, x7, #4096                                       \n"
+      "    mov x6, x2                                              \n"
+      "    subs x10, x10, #1                                       \n"
+      "    b.ne 2b                                                 \n"
+      "  mov x5, x1                                                \n"
+      "  subs x9, x9, #1                                           \n"
+      "  b.ne 1b                                                   \n"
+      "smstop                                                      \n"
+      : // no outputs
+      : [a] "r" (data->a), [b] "r" (data->b), [c] "r" (data->c), [m_blocks] "r" (data->m/32), [n_blocks] "r" (data->n/32), [k_iterations] "r" (data->k/16)
+      : "x0", "x1", "x2", "x3", "x5", "x6", "x7", "x9", "x10", "x12", "memory"
+    );
+  }
+
+  // number of operations (2*M*N*K per GEMM)
+  return 2.0*(double)data->m*(double)data->n*(double)data->k*(double)data->n_repeats;
+}
+
+
+double gemm_smopa_i64_i16_1x2_k2(const void* args) {
+  // SMOPA (I16 into I64, 4-way), 1x2 tiles (8x16 C block), K unrolled 2x
+  //
+  // Per K loop iteration (8 K elements): 2x ld1h (A, 1 vectors) + 2x ld1h (B, 2 vectors), 4 smopa
+  const benchmark_data_t* data = args;
+
+  for (size_t repeat = 0; repeat < data->n_repeats; repeat++) {
+    __asm__ __volatile__ (
+      "smstart                                                     \n"
+      "ptrue p0.h                                                  \n"
+      "ptrue p1.h                                                  \n"
+      "ptrue pn8.h                                                 \n"
+      "mov x5, %[a]                                                \n"
+      "mov x7, %[c]                                                \n"
+      "mov x9, %[m_blocks]                                         \n"
+      "1:                                                          \n"
+      "  mov x6, %[b]                                              \n"
+      "  mov x10, %[n_blocks]                                      \n"
+      "  2:                                                        \n"
+      "    zero {za}                                               \n"
+      "    mov x1, x5                                              \n"
+      "    mov x2, x6                                              \n"
+      "    mov x0, %[k_iterations]                                 \n"
+      "    3:                                                      \n"
+      "      ld1h z0.h, p0/z, [x1, 0, MUL VL]                      \n"
+      "      ld1h {z16.h-z17.h}, pn8/z, [x2, 0, MUL VL]            \n"
+      "      smopa za0.d, p0/m, p1/m, z0.h, z16.h                  \n"
+      "      smopa za1.d, p0/m, p1/m, z0.h, z17.h                  \n"
+      "      ld1h z1.h, p0/z, [x1, 1, MUL VL]                      \n"
+      "      ld1h {z18.h-z19.h}, pn8/z, [x2, 2, MUL VL]            \n"
+      "      smopa za0.d, p0/m, p1/m, z1.h, z18.h                  \n"
+      "      smopa za1.d, p0/m, p1/m, z1.h, z19.h                  \n"
+      "                                                            \n"
+      "      add x1, x1, #128                                      \n"
+      "      add x2, x2, #256                                      \n"
+      "      subs x0, x0, #1                                       \n"
+      "      b.ne 3b                                               \n"
+      "                                                            \n"
+      "    mov x12, #0                                             \n"
+      "    mov x3, x7                                              \n"
+      "    4:                                                      \n"
+      "      str za[w12, 0], [x3, 0, MUL VL]                       \n"
+      "      str za[w12, 1], [x3, 1, MUL VL]                       \n"
+      "      add x3, x3, #512                                      \n"
+      "      add w12, w12, #8                                      \n"
+      "      cmp w12, #64                                          \n"
+      "      b.ne 4b                                               \n"
+      "    add x7, x7, #4096                                       \n"
+      "    mov x6, x2                                              \n"
+      "    subs x10, x10, #1                                       \n"
+      "    b.ne 2b                                                 \n"
+      "  mov x5, x1                                                \n"
+      "  subs x9, x9, #1                                           \n"
+      "  b.ne 1b                                                   \n"
+      "smstop                                                      \n"
+      : // no outputs
+      : [a] "r" (data->a), [b] "r" (data->b), [c] "r" (data->c), [m_blocks] "r" (data->m/8), [n_blocks] "r" (data->n/16), [k_iterations] "r" (data->k/8)
+      : "x0", "x1", "x2", "x3", "x5", "x6", "x7", "x9", "x10", "x12", "memory"
+    );
+  }
+
+  // number of operations (2*M*N*K per GEMM)
+  return 2.0*(double)data->m*(double)data->n*(double)data->k*(double)data->n_repeats;
+}
+
+
+double gemm_smopa_i64_i16_2x1_k2(const void* args) {
+  // SMOPA (I16 into I64, 4-way), 2x1 tiles (16x8 C block), K unrolled 2x
+  //
+  // Per K loop iteration (8 K elements): 2x ld1h (A, 2 vectors) + 2x ld1h (B, 1 vectors), 4 smopa
+  const benchmark_data_t* data = args;
+
+  for (size_t repeat = 0; repeat < data->n_repeats; repeat++) {
+    __asm__ __volatile__ (
+      "smstart                                                     \n"
+      "ptrue p0.h                                                  \n"
+      "ptrue p1.h                                                  \n"
+      "ptrue pn8.h                                                 \n"
+      "mov x5, %[a]                                                \n"
+      "mov x7, %[c]                                                \n"
+      "mov x9, %[m_blocks]                                         \n"
+      "1:                                                          \n"
+      "  mov x6, %[b]                                              \n"
+      "  mov x10, %[n_blocks]                                      \n"
+      "  2:                                                        \n"
+      "    zero {za}                                               \n"
+      "    mov x1, x5                                              \n"
+      "    mov x2, x6                                              \n"
+      "    mov x0, %[k_iterations]                                 \n"
+      "    3:                                                      \n"
+      "      ld1h {z0.h-z1.h}, pn8/z, [x1, 0, MUL VL]              \n"
+      "      ld1h z16.h, p0/z, [x2, 0, MUL VL]                     \n"
+      "      smopa za0.d, p0/m, p1/m, z0.h, z16.h                  \n"
+      "      smopa za1.d, p0/m, p1/m, z1.h, z16.h                  \n"
+      "      ld1h {z2.h-z3.h}, pn8/z, [x1, 2, MUL VL]              \n"
+      "      ld1h z17.h, p0/z, [x2, 1, MUL VL]                     \n"
+      "      smopa za0.d, p0/m, p1/m, z2.h, z17.h                  \n"
+      "      smopa za1.d, p0/m, p1/m, z3.h, z17.h                  \n"
+      "                                                            \n"
+      "      add x1, x1, #256                                      \n"
+      "      add x2, x2, #128                                      \n"
+      "      subs x0, x0, #1                                       \n"
+      "      b.ne 3b                                               \n"
+      "                                                            \n"
+      "    mov x12, #0                                             \n"
+      "    mov x3, x7                                              \n"
+      "    4:                                                      \n"
+      "      str za[w12, 0], [x3, 0, MUL VL]                       \n"
+      "      str za[w12, 1], [x3, 1, MUL VL]                       \n"
+      "      add x3, x3, #512                                      \n"
+      "      add w12, w12, #8                                      \n"
+      "      cmp w12, #64                                          \n"
+      "      b.ne 4b                                               \n"
+      "    add x7, x7, #4096                                       \n"
+      "    mov x6, x2                                              \n"
+      "    subs x10, x10, #1                                       \n"
+      "    b.ne 2b                                                 \n"
+      "  mov x5, x1                                                \n"
+      "  subs x9, x9, #1                                           \n"
+      "  b.ne 1b                                                   \n"
+      "smstop                                                      \n"
+      : // no outputs
+      : [a] "r" (data->a), [b] "r" (data->b), [c] "r" (data->c), [m_blocks] "r" (data->m/16), [n_blocks] "r" (data->n/8), [k_iterations] "r" (data->k/8)
+      : "x0", "x1", "x2", "x3", "x5", "x6", "x7", "x9", "x10", "x12", "memory"
+    );
+  }
+
+  // number of operations (2*M*N*K per GEMM)
+  return 2.0*(double)data->m*(double)data->n*(double)data->k*(double)data->n_repeats;
+}
+
+
+double gemm_smopa_i64_i16_2x4_k1(const void* args) {
+  // SMOPA (I16 into I64, 4-way), 2x4 tiles (16x32 C block), K unrolled 1x
+  //
+  // Per K loop iteration (4 K elements): 1x ld1h (A, 2 vectors) + 1x ld1h (B, 4 vectors), 8 smopa
+  const benchmark_data_t* data = args;
+
+  for (size_t repeat = 0; repeat < data->n_repeats; repeat++) {
+    __asm__ __volatile__ (
+      "smstart                                                     \n"
+      "ptrue p0.h                                                  \n"
+      "ptrue p1.h                                                  \n"
+      "ptrue pn8.h                                                 \n"
+      "mov x5, %[a]                                                \n"
+      "mov x7, %[c]                                                \n"
+      "mov x9, %[m_blocks]                                         \n"
+      "1:                                                          \n"
+      "  mov x6, %[b]                                              \n"
+      "  mov x10, %[n_blocks]                                      \n"
+      "  2:                                                        \n"
+      "    zero {za}                                               \n"
+      "    mov x1, x5                                              \n"
+      "    mov x2, x6                                              \n"
+      "    mov x0, %[k_iterations]                                 \n"
+      "    3:                                                      \n"
+      "      ld1h {z0.h-z1.h}, pn8/z, [x1, 0, MUL VL]              \n"
+      "      ld1h {z16.h-z19.h}, pn8/z, [x2, 0, MUL VL]            \n"
+      "      smopa za0.d, p0/m, p1/m, z0.h, z16.h                  \n"
+      "      smopa za1.d, p0/m, p1/m, z0.h, z17.h                  \n"
+      "      smopa za2.d, p0/m, p1/m, z0.h, z18.h                  \n"
+      "      smopa za3.d, p0/m, p1/m, z0.h, z19.h                  \n"
+      "      smopa za4.d, p0/m, p1/m, z1.h, z16.h                  \n"
+      "      smopa za5.d, p0/m, p1/m, z1.h, z17.h                  \n"
+      "      smopa za6.d, p0/m, p1/m, z1.h, z18.h                  \n"
+      "      smopa za7.d, p0/m, p1/m, z1.h, z19.h                  \n"
+      "                                                            \n"
+      "      add x1, x1, #128                                      \n"
+      "      add x2, x2, #256                                      \n"
+      "      subs x0, x0, #1                                       \n"
+      "      b.ne 3b                                               \n"
+      "                                                            \n"
+      "    mov x12, #0                                             \n"
+      "    mov x3, x7                                              \n"
+      "    4:                                                      \n"
+      "      str za[w12, 0], [x3, 0, MUL VL]                       \n"
+      "      str za[w12, 1], [x3, 1, MUL VL]                       \n"
+      "      str za[w12, 2], [x3, 2, MUL VL]                       \n"
+      "      str za[w12, 3], [x3, 3, MUL VL]                       \n"
+      "      str za[w12, 4], [x3, 4, MUL VL]                       \n"
+      "      str za[w12, 5], [x3, 5, MUL VL]                       \n"
+      "      str za[w12, 6], [x3, 6, MUL VL]                       \n"
+      "      str za[w12, 7], [x3, 7, MUL VL]                       \n"
+      "      add x3, x3, #512                                      \n"
+      "      add w12, w12, #8                                      \n"
+      "      cmp w12, #64                                          \n"
+      "      b.ne 4b                                               \n"
+      "    add x7, x7, #4096                                       \n"
+      "    mov x6, x2                                              \n"
+      "    subs x10, x10, #1                                       \n"
+      "    b.ne 2b                                                 \n"
+      "  mov x5, x1                                                \n"
+      "  subs x9, x9, #1                                           \n"
+      "  b.ne 1b                                                   \n"
+      "smstop                                                      \n"
+      : // no outputs
+      : [a] "r" (data->a), [b] "r" (data->b), [c] "r" (data->c), [m_blocks] "r" (data->m/16), [n_blocks] "r" (data->n/32), [k_iterations] "r" (data->k/4)
+      : "x0", "x1", "x2", "x3", "x5", "x6", "x7", "x9", "x10", "x12", "memory"
+    );
+  }
+
+  // number of operations (2*M*N*K per GEMM)
+  return 2.0*(double)data->m*(double)data->n*(double)data->k*(double)data->n_repeats;
+}
+
+
+double gemm_smopa_i64_i16_4x1_k4(const void* args) {
+  // SMOPA (I16 into I64, 4-way), 4x1 tiles (32x8 C block), K unrolled 4x
+  //
+  // Per K loop iteration (16 K elements): 4x ld1h (A, 4 vectors) + 4x ld1h (B, 1 vectors), 16 smopa
+  const benchmark_data_t* data = args;
+
+  for (size_t repeat = 0; repeat < data->n_repeats; repeat++) {
+    __asm__ __volatile__ (
+      "smstart                                                     \n"
+      "ptrue p0.h                                                  \n"
+      "ptrue p1.h                                                  \n"
+      "ptrue pn8.h                                                 \n"
+      "mov x5, %[a]                                                \n"
+      "mov x7, %[c]                                                \n"
+      "mov x9, %[m_blocks]                                         \n"
+      "1:                                                          \n"
+      "  mov x6, %[b]                                              \n"
+      "  mov x10, %[n_blocks]                                      \n"
+      "  2:                                                        \n"
+      "    zero {za}                                               \n"
+      "    mov x1, x5                                              \n"
+      "    mov x2, x6                                              \n"
+      "    mov x0, %[k_iterations]                                 \n"
+      "    3:                                                      \n"
+      "      ld1h {z0.h-z3.h}, pn8/z, [x1, 0, MUL VL]              \n"
+      "      ld1h z16.h, p0/z, [x2, 0, MUL VL]                     \n"
+      "      smopa za0.d, p0/m, p1/m, z0.h, z16.h                  \n"
+      "      smopa za1.d, p0/m, p1/m, z1.h, z16.h                  \n"
+      "      smopa za2.d, p0/m, p1/m, z2.h, z16.h                  \n"
+      "      smopa za3.d, p0/m, p1/m, z3.h, z16.h                  \n"
+      "      ld1h {z4.h-z7.h}, pn8/z, [x1, 4, MUL VL]              \n"
+      "      ld1h z17.h, p0/z, [x2, 1, MUL VL]                     \n"
+      "      smopa za0.d, p0/m, p1/m, z4.h, z17.h                  \n"
+      "      smopa za1.d, p0/m, p1/m, z5.h, z17.h                  \n"
+      "      smopa za2.d, p0/m, p1/m, z6.h, z17.h                  \n"
+      "      smopa za3.d, p0/m, p1/m, z7.h, z17.h                  \n"
+      "      ld1h {z8.h-z11.h}, pn8/z, [x1, 8, MUL VL]             \n"
+      "      ld1h z18.h, p0/z, [x2, 2, MUL VL]                     \n"
+      "      smopa za0.d, p0/m, p1/m, z8.h, z18.h                  \n"
+      "      smopa za1.d, p0/m, p1/m, z9.h, z18.h                  \n"
+      "      smopa za2.d, p0/m, p1/m, z10.h, z18.h                 \n"
+      "      smopa za3.d, p0/m, p1/m, z11.h, z18.h                 \n"
+      "      ld1h {z12.h-z15.h}, pn8/z, [x1, 12, MUL VL]           \n"
+      "      ld1h z19.h, p0/z, [x2, 3, MUL VL]                     \n"
+      "      smopa za0.d, p0/m, p1/m, z12.h, z19.h                 \n"
+      "      smopa za1.d, p0/m, p1/m, z13.h, z19.h                 \n"
+      "      smopa za2.d, p0/m, p1/m, z14.h, z19.h                 \n"
+      "      smopa za3.d, p0/m, p1/m, z15.h, z19.h                 \n"
+      "                                                            \n"
+      "      add x1, x1, #1024                                     \n"
+      "      add x2, x2, #256                                      \n"
+      "      subs x0, x0, #1                                       \n"
+      "      b.ne 3b                                               \n"
+      "                                                            \n"
+      "    mov x12, #0                                             \n"
+      "    mov x3, x7                                              \n"
+      "    4:                                                      \n"
+      "      str za[w12, 0], [x3, 0, MUL VL]                       \n"
+      "      str za[w12, 1], [x3, 1, MUL VL]                       \n"
+      "      str za[w12, 2], [x3, 2, MUL VL]                       \n"
+      "      str za[w12, 3], [x3, 3, MUL VL]                       \n"
+      "      add x3, x3, #512                                      \n"
+      "      add w12, w12, #8                                      \n"
+      "      cmp w12, #64                                          \n"
+      "      b.ne 4b                                               \n"
+      "    add x7, x7, #4096                                       \n"
+      "    mov x6, x2                                              \n"
+      "    subs x10, x10, #1                                       \n"
+      "    b.ne 2b                                                 \n"
+      "  mov x5, x1                                                \n"
+      "  subs x9, x9, #1                                           \n"
+      "  b.ne 1b                                                   \n"
+      "smstop                                                      \n"
+      : // no outputs
+      : [a] "r" (data->a), [b] "r" (data->b), [c] "r" (data->c), [m_blocks] "r" (data->m/32), [n_blocks] "r" (data->n/8), [k_iterations] "r" (data->k/16)
+      : "x0", "x1", "x2", "x3", "x5", "x6", "x7", "x9", "x10", "x12", "memory"
+    );
+  }
+
+  // number of operations (2*M*N*K per GEMM)
+  return 2.0*(double)data->m*(double)data->n*(double)data->k*(double)data->n_repeats;
+}
+
@@ -0,0 +1,375 @@
+// generated by tools/gen_gemm_benchmarks.py, do not edit!
+#include <assert.h>
+#include <stdlib.h>
+#include <string.h>
+#include "../bench.h"
+
+// Benchmark parameters (packed operands)
+typedef struct {
+  char*  a;
+  char*  b;
+  char*  c;
+  size_t m;
+  size_t n;
+  size_t k;
+  size_t n_repeats;
+} benchmark_data_t;
+
+// benchmark functions
+double gemm_fmopa_f16_f16_1x1_k1(const void*);
+double gemm_fmopa_f16_f16_1x1_k2(const void*);
+double gemm_fmopa_f16_f16_1x1_k4(const void*);
+double gemm_fmopa_f16_f16_1x2_k1(const void*);
+double gemm_fmopa_f16_f16_1x2_k2(const void*);
+double gemm_fmopa_f16_f16_1x2_k4(const void*);
+double gemm_fmopa_f16_f16_2x1_k1(const void*);
+double gemm_fmopa_f16_f16_2x1_k2(const void*);
+double gemm_fmopa_f16_f16_2x1_k4(const void*);
+double gemm_fmopa_f32_f32_1x1_k1(const void*);
+double gemm_fmopa_f32_f32_1x1_k2(const void*);
+double gemm_fmopa_f32_f32_1x1_k4(const void*);
+double gemm_fmopa_f32_f32_1x2_k1(const void*);
+double gemm_fmopa_f32_f32_1x2_k2(const void*);
+double gemm_fmopa_f32_f32_1x2_k4(const void*);
+double gemm_fmopa_f32_f32_1x4_k1(const void*);
+double gemm_fmopa_f32_f32_1x4_k2(const void*);
+double gemm_fmopa_f32_f32_1x4_k4(const void*);
+double gemm_fmopa_f32_f32_2x1_k1(const void*);
+double gemm_fmopa_f32_f32_2x1_k2(const void*);
+double gemm_fmopa_f32_f32_2x1_k4(const void*);
+double gemm_fmopa_f32_f32_2x2_k1(const void*);
+double gemm_fmopa_f32_f32_2x2_k2(const void*);
+double gemm_fmopa_f32_f32_2x2_k4(const void*);
+double gemm_fmopa_f32_f32_4x1_k1(const void*);
+double gemm_fmopa_f32_f32_4x1_k2(const void*);
+double gemm_fmopa_f32_f32_4x1_k4(const void*);
+double gemm_fmopa_f64_f64_1x1_k1(const void*);
+double gemm_fmopa_f64_f64_1x1_k2(const void*);
+double gemm_fmopa_f64_f64_1x1_k4(const void*);
+double gemm_fmopa_f64_f64_1x2_k1(const void*);
+double gemm_fmopa_f64_f64_1x2_k2(const void*);
+double gemm_fmopa_f64_f64_1x2_k4(const void*);
+double gemm_fmopa_f64_f64_1x4_k1(const void*);
+double gemm_fmopa_f64_f64_1x4_k2(const void*);
+double gemm_fmopa_f64_f64_1x4_k4(const void*);
+double gemm_fmopa_f64_f64_2x1_k1(const void*);
+double gemm_fmopa_f64_f64_2x1_k2(const void*);
+double gemm_fmopa_f64_f64_2x1_k4(const void*);
+double gemm_fmopa_f64_f64_2x2_k1(const void*);
+double gemm_fmopa_f64_f64_2x2_k2(const void*);
+double gemm_fmopa_f64_f64_2x2_k4(const void*);
+double gemm_fmopa_f64_f64_2x4_k1(const void*);
+double gemm_fmopa_f64_f64_2x4_k2(const void*);
+double gemm_fmopa_f64_f64_2x4_k4(const void*);
+double gemm_fmopa_f64_f64_4x1_k1(const void*);
+double gemm_fmopa_f64_f64_4x1_k2(const void*);
+double gemm_fmopa_f64_f64_4x1_k4(const void*);
+double gemm_fmopa_f64_f64_4x2_k1(const void*);
+double gemm_fmopa_f64_f64_4x2_k2(const void*);
+double gemm_fmopa_f64_f64_4x2_k4(const void*);
+double gemm_fmopa_f32_f16_1x1_k1(const void*);
+double gemm_fmopa_f32_f16_1x1_k2(const void*);
+double gemm_fmopa_f32_f16_1x1_k4(const void*);
+double gemm_fmopa_f32_f16_1x2_k1(const void*);
+double gemm_fmopa_f32_f16_1x2_k2(const void*);
+double gemm_fmopa_f32_f16_1x2_k4(const void*);
+double gemm_fmopa_f32_f16_1x4_k1(const void*);
+double gemm_fmopa_f32_f16_1x4_k2(const void*);
+double gemm_fmopa_f32_f16_1x4_k4(const void*);
+double gemm_fmopa_f32_f16_2x1_k1(const void*);
+double gemm_fmopa_f32_f16_2x1_k2(const void*);
+double gemm_fmopa_f32_f16_2x1_k4(const void*);
+double gemm_fmopa_f32_f16_2x2_k1(const void*);
+double gemm_fmopa_f32_f16_2x2_k2(const void*);
+double gemm_fmopa_f32_f16_2x2_k4(const void*);
+double gemm_fmopa_f32_f16_4x1_k1(const void*);
+double gemm_fmopa_f32_f16_4x1_k2(const void*);
+double gemm_fmopa_f32_f16_4x1_k4(const void*);
+double gemm_bfmopa_f32_b16_1x1_k1(const void*);
+double gemm_bfmopa_f32_b16_1x1_k2(const void*);
+double gemm_bfmopa_f32_b16_1x1_k4(const void*);
+double gemm_bfmopa_f32_b16_1x2_k1(const void*);
+double gemm_bfmopa_f32_b16_1x2_k2(const void*);
+double gemm_bfmopa_f32_b16_1x2_k4(const void*);
+double gemm_bfmopa_f32_b16_1x4_k1(const void*);
+double gemm_bfmopa_f32_b16_1x4_k2(const void*);
+double gemm_bfmopa_f32_b16_1x4_k4(const void*);
+double gemm_bfmopa_f32_b16_2x1_k1(const void*);
+double gemm_bfmopa_f32_b16_2x1_k2(const void*);
+double gemm_bfmopa_f32_b16_2x1_k4(const void*);
+double gemm_bfmopa_f32_b16_2x2_k1(const void*);
+double gemm_bfmopa_f32_b16_2x2_k2(const void*);
+double gemm_bfmopa_f32_b16_2x2_k4(const void*);
+double gemm_bfmopa_f32_b16_4x1_k1(const void*);
+double gemm_bfmopa_f32_b16_4x1_k2(const void*);
+double gemm_bfmopa_f32_b16_4x1_k4(const void*);
+double gemm_smopa_i32_i16_1x1_k1(const void*);
+double gemm_smopa_i32_i16_1x1_k2(const void*);
+double gemm_smopa_i32_i16_1x1_k4(const void*);
+double gemm_smopa_i32_i16_1x2_k1(const void*);
+double gemm_smopa_i32_i16_1x2_k2(const void*);
+double gemm_smopa_i32_i16_1x2_k4(const void*);
+double gemm_smopa_i32_i16_1x4_k1(const void*);
+double gemm_smopa_i32_i16_1x4_k2(const void*);
+double gemm_smopa_i32_i16_1x4_k4(const void*);
+double gemm_smopa_i32_i16_2x1_k1(const void*);
+double gemm_smopa_i32_i16_2x1_k2(const void*);
+double gemm_smopa_i32_i16_2x1_k4(const void*);
+double gemm_smopa_i32_i16_2x2_k1(const void*);
+double gemm_smopa_i32_i16_2x2_k2(const void*);
+double gemm_smopa_i32_i16_2x2_k4(const void*);
+double gemm_smopa_i32_i16_4x1_k1(const void*);
+double gemm_smopa_i32_i16_4x1_k2(const void*);
+double gemm_smopa_i32_i16_4x1_k4(const void*);
+double gemm_smopa_i32_i8_1x1_k1(const void*);
+double gemm_smopa_i32_i8_1x1_k2(const void*);
+double gemm_smopa_i32_i8_1x1_k4(const void*);
+double gemm_smopa_i32_i8_1x2_k1(const void*);
+double gemm_smopa_i32_i8_1x2_k2(const void*);
+double gemm_smopa_i32_i8_1x2_k4(const void*);
+double gemm_smopa_i32_i8_1x4_k1(const void*);
+double gemm_smopa_i32_i8_1x4_k2(const void*);
+double gemm_smopa_i32_i8_1x4_k4(const void*);
+double gemm_smopa_i32_i8_2x1_k1(const void*);
+double gemm_smopa_i32_i8_2x1_k2(const void*);
+double gemm_smopa_i32_i8_2x1_k4(const void*);
+double gemm_smopa_i32_i8_2x2_k1(const void*);
+double gemm_smopa_i32_i8_2x2_k2(const void*);
+double gemm_smopa_i32_i8_2x2_k4(const void*);
+double gemm_smopa_i32_i8_4x1_k1(const void*);
+double gemm_smopa_i32_i8_4x1_k2(const void*);
+double gemm_smopa_i32_i8_4x1_k4(const void*);
+double gemm_smopa_i64_i16_1x1_k1(const void*);
+double gemm_smopa_i64_i16_1x1_k2(const void*);
+double gemm_smopa_i64_i16_1x1_k4(const void*);
+double gemm_smopa_i64_i16_1x2_k1(const void*);
+double gemm_smopa_i64_i16_1x2_k2(const void*);
+double gemm_smopa_i64_i16_1x2_k4(const void*);
+double gemm_smopa_i64_i16_1x4_k1(const void*);
+double gemm_smopa_i64_i16_1x4_k2(const void*);
+double gemm_smopa_i64_i16_1x4_k4(const void*);
+double gemm_smopa_i64_i16_2x1_k1(const void*);
+double gemm_smopa_i64_i16_2x1_k2(const void*);
+double gemm_smopa_i64_i16_2x1_k4(const void*);
+double gemm_smopa_i64_i16_2x2_k1(const void*);
+double gemm_smopa_i64_i16_2x2_k2(const void*);
+double gemm_smopa_i64_i16_2x2_k4(const void*);
+double gemm_smopa_i64_i16_2x4_k1(const void*);
+double gemm_smopa_i64_i16_2x4_k2(const void*);
+double gemm_smopa_i64_i16_2x4_k4(const void*);
+double gemm_smopa_i64_i16_4x1_k1(const void*);
+double gemm_smopa_i64_i16_4x1_k2(const void*);
+double gemm_smopa_i64_i16_4x1_k4(const void*);
+double gemm_smopa_i64_i16_4x2_k1(const void*);
+double gemm_smopa_i64_i16_4x2_k2(const void*);
+double gemm_smopa_i64_i16_4x2_k4(const void*);
+
+// benchmark setup
+#define ALIGNMENT 256UL
+#define ALIGN_UP(size) (((size) + ALIGNMENT - 1)/ALIGNMENT*ALIGNMENT)
+
+static void* setup(const void* args) {
+  const gemm_benchmark_params_t* params = args;
+  const gemm_benchmark_t* bench = params->benchmark;
+  const gemm_shape_t shape = params->shape;
+
+  // the shape must be a multiple of the kernel steps
+  assert(shape.m % bench->m_step == 0 && shape.n % bench->n_step == 0 && shape.k % bench->k_step == 0);
+
+  benchmark_data_t* data = malloc(sizeof(benchmark_data_t));
+  data->m = shape.m;
+  data->n = shape.n;
+  data->k = shape.k;
+  // repeat small GEMMs to execute at least n_ops operations
+  double ops = 2.0*(double)shape.m*(double)shape.n*(double)shape.k;
+  data->n_repeats = ops < (double)bench->n_ops ? (size_t)((double)bench->n_ops/ops) : 1;
+
+  // packed operands and one ZA array per C block (aligned_alloc needs a multiple of the alignment)
+  size_t input_size = bench->input_size/8;
+  size_t a_size = ALIGN_UP(shape.m*shape.k*input_size);
+  size_t b_size = ALIGN_UP(shape.n*shape.k*input_size);
+  size_t c_size = (shape.m/bench->m_step)*(shape.n/bench->n_step)*4096UL;
+  data->a = aligned_alloc(ALIGNMENT, a_size);
+  data->b = aligned_alloc(ALIGNMENT, b_size);
+  data->c = aligned_alloc(ALIGNMENT, c_size);
+  assert(data->a != nullptr && data->b != nullptr && data->c != nullptr);
+
+  // small normal values for every data type (no denormals or NaNs)
+  memset(data->a, 0x3c, a_size);
+  memset(data->b, 0x3c, b_size);
+
+  return data;
+}
+
+static void teardown(void* args) {
+  benchmark_data_t* data = args;
+
+  free(data->a); data->a = nullptr;
+  free(data->b); data->b = nullptr;
+  free(data->c); data->c = nullptr;
+  free(data);
+}
+
+// problem shapes (M, N, K)
+static const gemm_shape_t shapes[] = { { 128UL, 128UL, 128UL }, { 512UL, 512UL, 512UL }, { 1024UL, 1024UL, 1024UL }, { 512UL, 512UL, 64UL } };
+
+CONST_PTR(gemm_shape_t) gemm_benchmark_shapes = shapes;
+const size_t gemm_benchmark_shapes_count = sizeof(shapes)/sizeof(shapes[0]);
+
+// benchmark table
+static const gemm_benchmark_t benchmarks[] = {
+  {{ &setup, &gemm_fmopa_f16_f16_1x1_k1, &teardown }, "FMOPA (FP16)", "FEAT_SME_F16F16", "fmopa", "f16", 16, "f16", 1, 1, 1, 32, 32, 1, 17179869184},
+  {{ &setup, &gemm_fmopa_f16_f16_1x1_k2, &teardown }, "FMOPA (FP16)", "FEAT_SME_F16F16", "fmopa", "f16", 16, "f16", 1, 1, 2, 32, 32, 2, 17179869184},
+  {{ &setup, &gemm_fmopa_f16_f16_1x1_k4, &teardown }, "FMOPA (FP16)", "FEAT_SME_F16F16", "fmopa", "f16", 16, "f16", 1, 1, 4, 32, 32, 4, 17179869184},
+  {{ &setup, &gemm_fmopa_f16_f16_1x2_k1, &teardown }, "FMOPA (FP16)", "FEAT_SME_F16F16", "fmopa", "f16", 16, "f16", 1, 2, 1, 32, 64, 1, 17179869184},
+  {{ &setup, &gemm_fmopa_f16_f16_1x2_k2, &teardown }, "FMOPA (FP16)", "FEAT_SME_F16F16", "fmopa", "f16", 16, "f16", 1, 2, 2, 32, 64, 2, 17179869184},
+  {{ &setup, &gemm_fmopa_f16_f16_1x2_k4, &teardown }, "FMOPA (FP16)", "FEAT_SME_F16F16", "fmopa", "f16", 16, "f16", 1, 2, 4, 32, 64, 4, 17179869184},
+  {{ &setup, &gemm_fmopa_f16_f16_2x1_k1, &teardown }, "FMOPA (FP16)", "FEAT_SME_F16F16", "fmopa", "f16", 16, "f16", 2, 1, 1, 64, 32, 1, 17179869184},
+  {{ &setup, &gemm_fmopa_f16_f16_2x1_k2, &teardown }, "FMOPA (FP16)", "FEAT_SME_F16F16", "fmopa", "f16", 16, "f16", 2, 1, 2, 64, 32, 2, 17179869184},
+  {{ &setup, &gemm_fmopa_f16_f16_2x1_k4, &teardown }, "FMOPA (FP16)", "FEAT_SME_F16F16", "fmopa", "f16", 16, "f16", 2, 1, 4, 64, 32, 4, 17179869184},
+  {{ &setup, &gemm_fmopa_f32_f32_1x1_k1, &teardown }, "FMOPA (FP32)", "SME_F32F32", "fmopa", "f32", 32, "f32", 1, 1, 1, 16, 16, 1, 17179869184},
+  {{ &setup, &gemm_fmopa_f32_f32_1x1_k2, &teardown }, "FMOPA (FP32)", "SME_F32F32", "fmopa", "f32", 32, "f32", 1, 1, 2, 16, 16, 2, 17179869184},
+  {{ &setup, &gemm_fmopa_f32_f32_1x1_k4, &teardown }, "FMOPA (FP32)", "SME_F32F32", "fmopa", "f32", 32, "f32", 1, 1, 4, 16, 16, 4, 17179869184},
+  {{ &setup, &gemm_fmopa_f32_f32_1x2_k1, &teardown }, "FMOPA (FP32)", "SME_F32F32", "fmopa", "f32", 32, "f32", 1, 2, 1, 16, 32, 1, 17179869184},
+  {{ &setup, &gemm_fmopa_f32_f32_1x2_k2, &teardown }, "FMOPA (FP32)", "SME_F32F32", "fmopa", "f32", 32, "f32", 1, 2, 2, 16, 32, 2, 17179869184},
+  {{ &setup, &gemm_fmopa_f32_f32_1x2_k4, &teardown }, "FMOPA (FP32)", "SME_F32F32", "fmopa", "f32", 32, "f32", 1, 2, 4, 16, 32, 4, 17179869184},
+  {{ &setup, &gemm_fmopa_f32_f32_1x4_k1, &teardown }, "FMOPA (FP32)", "SME_F32F32", "fmopa", "f32", 32, "f32", 1, 4, 1, 16, 64, 1, 17179869184},
+  {{ &setup, &gemm_fmopa_f32_f32_1x4_k2, &teardown }, "FMOPA (FP32)", "SME_F32F32", "fmopa", "f32", 32, "f32", 1, 4, 2, 16, 64, 2, 17179869184},
+  {{ &setup, &gemm_fmopa_f32_f32_1x4_k4, &teardown }, "FMOPA (FP32)", "SME_F32F32", "fmopa", "f32", 32, "f32", 1, 4, 4, 16, 64, 4, 17179869184},
+  {{ &setup, &gemm_fmopa_f32_f32_2x1_k1, &teardown }, "FMOPA (FP32)", "SME_F32F32", "fmopa", "f32", 32, "f32", 2, 1, 1, 32, 16, 1, 17179869184},
+  {{ &setup, &gemm_fmopa_f32_f32_2x1_k2, &teardown }, "FMOPA (FP32)", "SME_F32F32", "fmopa", "f32", 32, "f32", 2, 1, 2, 32, 16, 2, 17179869184},
+  {{ &setup, &gemm_fmopa_f32_f32_2x1_k4, &teardown }, "FMOPA (FP32)", "SME_F32F32", "fmopa", "f32", 32, "f32", 2, 1, 4, 32, 16, 4, 17179869184},
+  {{ &setup, &gemm_fmopa_f32_f32_2x2_k1, &teardown }, "FMOPA (FP32)", "SME_F32F32", "fmopa", "f32", 32, "f32", 2, 2, 1, 32, 32, 1, 17179869184},
+  {{ &setup, &gemm_fmopa_f32_f32_2x2_k2, &teardown }, "FMOPA (FP32)", "SME_F32F32", "fmopa", "f32", 32, "f32", 2, 2, 2, 32, 32, 2, 17179869184},
+  {{ &setup, &gemm_fmopa_f32_f32_2x2_k4, &teardown }, "FMOPA (FP32)", "SME_F32F32", "fmopa", "f32", 32, "f32", 2, 2, 4, 32, 32, 4, 17179869184},
+  {{ &setup, &gemm_fmopa_f32_f32_4x1_k1, &teardown }, "FMOPA (FP32)", "SME_F32F32", "fmopa", "f32", 32, "f32", 4, 1, 1, 64, 16, 1, 17179869184},
+  {{ &setup, &gemm_fmopa_f32_f32_4x1_k2, &teardown }, "FMOPA (FP32)", "SME_F32F32", "fmopa", "f32", 32, "f32", 4, 1, 2, 64, 16, 2, 17179869184},
+  {{ &setup, &gemm_fmopa_f32_f32_4x1_k4, &teardown }, "FMOPA (FP32)", "SME_F32F32", "fmopa", "f32", 32, "f32", 4, 1, 4, 64, 16, 4, 17179869184},
+  {{ &setup, &gemm_fmopa_f64_f64_1x1_k1, &teardown }, "FMOPA (FP64)", "FEAT_SME_F64F64", "fmopa", "f64", 64, "f64", 1, 1, 1, 8, 8, 1, 17179869184},
+  {{ &setup, &gemm_fmopa_f64_f64_1x1_k2, &teardown }, "FMOPA (FP64)", "FEAT_SME_F64F64", "fmopa", "f64", 64, "f64", 1, 1, 2, 8, 8, 2, 17179869184},
+  {{ &setup, &gemm_fmopa_f64_f64_1x1_k4, &teardown }, "FMOPA (FP64)", "FEAT_SME_F64F64", "fmopa", "f64", 64, "f64", 1, 1, 4, 8, 8, 4, 17179869184},
+  {{ &setup, &gemm_fmopa_f64_f64_1x2_k1, &teardown }, "FMOPA (FP64)", "FEAT_SME_F64F64", "fmopa", "f64", 64, "f64", 1, 2, 1, 8, 16, 1, 17179869184},
+  {{ &setup, &gemm_fmopa_f64_f64_1x2_k2, &teardown }, "FMOPA (FP64)", "FEAT_SME_F64F64", "fmopa", "f64", 64, "f64", 1, 2, 2, 8, 16, 2, 17179869184},
+  {{ &setup, &gemm_fmopa_f64_f64_1x2_k4, &teardown }, "FMOPA (FP64)", "FEAT_SME_F64F64", "fmopa", "f64", 64, "f64", 1, 2, 4, 8, 16, 4, 17179869184},
+  {{ &setup, &gemm_fmopa_f64_f64_1x4_k1, &teardown }, "FMOPA (FP64)", "FEAT_SME_F64F64", "fmopa", "f64", 64, "f64", 1, 4, 1, 8, 32, 1, 17179869184},
+  {{ &setup, &gemm_fmopa_f64_f64_1x4_k2, &teardown }, "FMOPA (FP64)", "FEAT_SME_F64F64", "fmopa", "f64", 64, "f64", 1, 4, 2, 8, 32, 2, 17179869184},
+  {{ &setup, &gemm_fmopa_f64_f64_1x4_k4, &teardown }, "FMOPA (FP64)", "FEAT_SME_F64F64", "fmopa", "f64", 64, "f64", 1, 4, 4, 8, 32, 4, 17179869184},
+  {{ &setup, &gemm_fmopa_f64_f64_2x1_k1, &teardown }, "FMOPA (FP64)", "FEAT_SME_F64F64", "fmopa", "f64", 64, "f64", 2, 1, 1, 16, 8, 1, 17179869184},
+  {{ &setup, &gemm_fmopa_f64_f64_2x1_k2, &teardown }, "FMOPA (FP64)", "FEAT_SME_F64F64", "fmopa", "f64", 64, "f64", 2, 1, 2, 16, 8, 2, 17179869184},
+  {{ &setup, &gemm_fmopa_f64_f64_2x1_k4, &teardown }, "FMOPA (FP64)", "FEAT_SME_F64F64", "fmopa", "f64", 64, "f64", 2, 1, 4, 16, 8, 4, 17179869184},
+  {{ &setup, &gemm_fmopa_f64_f64_2x2_k1, &teardown }, "FMOPA (FP64)", "FEAT_SME_F64F64", "fmopa", "f64", 64, "f64", 2, 2, 1, 16, 16, 1, 17179869184},
+  {{ &setup, &gemm_fmopa_f64_f64_2x2_k2, &teardown }, "FMOPA (FP64)", "FEAT_SME_F64F64", "fmopa", "f64", 64, "f64", 2, 2, 2, 16, 16, 2, 17179869184},
+  {{ &setup, &gemm_fmopa_f64_f64_2x2_k4, &teardown }, "FMOPA (FP64)", "FEAT_SME_F64F64", "fmopa", "f64", 64, "f64", 2, 2, 4, 16, 16, 4, 17179869184},
+  {{ &setup, &gemm_fmopa_f64_f64_2x4_k1, &teardown }, "FMOPA (FP64)", "FEAT_SME_F64F64", "fmopa", "f64", 64, "f64", 2, 4, 1, 16, 32, 1, 17179869184},
+  {{ &setup, &gemm_fmopa_f64_f64_2x4_k2, &teardown }, "FMOPA (FP64)", "FEAT_SME_F64F64", "fmopa", "f64", 64, "f64", 2, 4, 2, 16, 32, 2, 17179869184},
+  {{ &setup, &gemm_fmopa_f64_f64_2x4_k4, &teardown }, "FMOPA (FP64)", "FEAT_SME_F64F64", "fmopa", "f64", 64, "f64", 2, 4, 4, 16, 32, 4, 17179869184},
+  {{ &setup, &gemm_fmopa_f64_f64_4x1_k1, &teardown }, "FMOPA (FP64)", "FEAT_SME_F64F64", "fmopa", "f64", 64, "f64", 4, 1, 1, 32, 8, 1, 17179869184},
+  {{ &setup, &gemm_fmopa_f64_f64_4x1_k2, &teardown }, "FMOPA (FP64)", "FEAT_SME_F64F64", "fmopa", "f64", 64, "f64", 4, 1, 2, 32, 8, 2, 17179869184},
+  {{ &setup, &gemm_fmopa_f64_f64_4x1_k4, &teardown }, "FMOPA (FP64)", "FEAT_SME_F64F64", "fmopa", "f64", 64, "f64", 4, 1, 4, 32, 8, 4, 17179869184},
+  {{ &setup, &gemm_fmopa_f64_f64_4x2_k1, &teardown }, "FMOPA (FP64)", "FEAT_SME_F64F64", "fmopa", "f64", 64, "f64", 4, 2, 1, 32, 16, 1, 17179869184},
+  {{ &setup, &gemm_fmopa_f64_f64_4x2_k2, &teardown }, "FMOPA (FP64)", "FEAT_SME_F64F64", "fmopa", "f64", 64, "f64", 4, 2, 2, 32, 16, 2, 17179869184},
+  {{ &setup, &gemm_fmopa_f64_f64_4x2_k4, &teardown }, "FMOPA (FP64)", "FEAT_SME_F64F64", "fmopa", "f64", 64, "f64", 4, 2, 4, 32, 16, 4, 17179869184},
+  {{ &setup, &gemm_fmopa_f32_f16_1x1_k1, &teardown }, "FMOPA (FP16 into FP32, 2-way)", "SME_F16F32", "fmopa", "f16", 16, "f32", 1, 1, 1, 16, 16, 2, 17179869184},
+  {{ &setup, &gemm_fmopa_f32_f16_1x1_k2, &teardown }, "FMOPA (FP16 into FP32, 2-way)", "SME_F16F32", "fmopa", "f16", 16, "f32", 1, 1, 2, 16, 16, 4, 17179869184},
+  {{ &setup, &gemm_fmopa_f32_f16_1x1_k4, &teardown }, "FMOPA (FP16 into FP32, 2-way)", "SME_F16F32", "fmopa", "f16", 16, "f32", 1, 1, 4, 16, 16, 8, 17179869184},
+  {{ &setup, &gemm_fmopa_f32_f16_1x2_k1, &teardown }, "FMOPA (FP16 into FP32, 2-way)", "SME_F16F32", "fmopa", "f16", 16, "f32", 1, 2, 1, 16, 32, 2, 17179869184},
+  {{ &setup, &gemm_fmopa_f32_f16_1x2_k2, &teardown }, "FMOPA (FP16 into FP32, 2-way)", "SME_F16F32", "fmopa", "f16", 16, "f32", 1, 2, 2, 16, 32, 4, 17179869184},
+  {{ &setup, &gemm_fmopa_f32_f16_1x2_k4, &teardown }, "FMOPA (FP16 into FP32, 2-way)", "SME_F16F32", "fmopa", "f16", 16, "f32", 1, 2, 4, 16, 32, 8, 17179869184},
+  {{ &setup, &gemm_fmopa_f32_f16_1x4_k1, &teardown }, "FMOPA (FP16 into FP32, 2-way)", "SME_F16F32", "fmopa", "f16", 16, "f32", 1, 4, 1, 16, 64, 2, 17179869184},
+  {{ &setup, &gemm_fmopa_f32_f16_1x4_k2, &teardown }, "FMOPA (FP16 into FP32, 2-way)", "SME_F16F32", "fmopa", "f16", 16, "f32", 1, 4, 2, 16, 64, 4, 17179869184},
+  {{ &setup, &gemm_fmopa_f32_f16_1x4_k4, &teardown }, "FMOPA (FP16 into FP32, 2-way)", "SME_F16F32", "fmopa", "f16", 16, "f32", 1, 4, 4, 16, 64, 8, 17179869184},
+  {{ &setup, &gemm_fmopa_f32_f16_2x1_k1, &teardown }, "FMOPA (FP16 into FP32, 2-way)", "SME_F16F32", "fmopa", "f16", 16, "f32", 2, 1, 1, 32, 16, 2, 17179869184},
+  {{ &setup, &gemm_fmopa_f32_f16_2x1_k2, &teardown }, "FMOPA (FP16 into FP32, 2-way)", "SME_F16F32", "fmopa", "f16", 16, "f32", 2, 1, 2, 32, 16, 4, 17179869184},
+  {{ &setup, &gemm_fmopa_f32_f16_2x1_k4, &teardown }, "FMOPA (FP16 into FP32, 2-way)", "SME_F16F32", "fmopa", "f16", 16, "f32", 2, 1, 4, 32, 16, 8, 17179869184},
+  {{ &setup, &gemm_fmopa_f32_f16_2x2_k1, &teardown }, "FMOPA (FP16 into FP32, 2-way)", "SME_F16F32", "fmopa", "f16", 16, "f32", 2, 2, 1, 32, 32, 2, 17179869184},
+  {{ &setup, &gemm_fmopa_f32_f16_2x2_k2, &teardown }, "FMOPA (FP16 into FP32, 2-way)", "SME_F16F32", "fmopa", "f16", 16, "f32", 2, 2, 2, 32, 32, 4, 17179869184},
+  {{ &setup, &gemm_fmopa_f32_f16_2x2_k4, &teardown }, "FMOPA (FP16 into FP32, 2-way)", "SME_F16F32", "fmopa", "f16", 16, "f32", 2, 2, 4, 32, 32, 8, 17179869184},
+  {{ &setup, &gemm_fmopa_f32_f16_4x1_k1, &teardown }, "FMOPA (FP16 into FP32, 2-way)", "SME_F16F32", "fmopa", "f16", 16, "f32", 4, 1, 1, 64, 16, 2, 17179869184},
+  {{ &setup, &gemm_fmopa_f32_f16_4x1_k2, &teardown }, "FMOPA (FP16 into FP32, 2-way)", "SME_F16F32", "fmopa", "f16", 16, "f32", 4, 1, 2, 64, 16, 4, 17179869184},
+  {{ &setup, &gemm_fmopa_f32_f16_4x1_k4, &teardown }, "FMOPA (FP16 into FP32, 2-way)", "SME_F16F32", "fmopa", "f16", 16, "f32", 4, 1, 4, 64, 16, 8, 17179869184},
+  {{ &setup, &gemm_bfmopa_f32_b16_1x1_k1, &teardown }, "BFMOPA (BF16 into FP32, 2-way)", "SME_B16F32", "bfmopa", "b16", 16, "f32", 1, 1, 1, 16, 16, 2, 17179869184},
+  {{ &setup, &gemm_bfmopa_f32_b16_1x1_k2, &teardown }, "BFMOPA (BF16 into FP32, 2-way)", "SME_B16F32", "bfmopa", "b16", 16, "f32", 1, 1, 2, 16, 16, 4, 17179869184},
+  {{ &setup, &gemm_bfmopa_f32_b16_1x1_k4, &teardown }, "BFMOPA (BF16 into FP32, 2-way)", "SME_B16F32", "bfmopa", "b16", 16, "f32", 1, 1, 4, 16, 16, 8, 17179869184},
+  {{ &setup, &gemm_bfmopa_f32_b16_1x2_k1, &teardown }, "BFMOPA (BF16 into FP32, 2-way)", "SME_B16F32", "bfmopa", "b16", 16, "f32", 1, 2, 1, 16, 32, 2, 17179869184},
+  {{ &setup, &gemm_bfmopa_f32_b16_1x2_k2, &teardown }, "BFMOPA (BF16 into FP32, 2-way)", "SME_B16F32", "bfmopa", "b16", 16, "f32", 1, 2, 2, 16, 32, 4, 17179869184},
+  {{ &setup, &gemm_bfmopa_f32_b16_1x2_k4, &teardown }, "BFMOPA (BF16 into FP32, 2-way)", "SME_B16F32", "bfmopa", "b16", 16, "f32", 1, 2, 4, 16, 32, 8, 17179869184},
+  {{ &setup, &gemm_bfmopa_f32_b16_1x4_k1, &teardown }, "BFMOPA (BF16 into FP32, 2-way)", "SME_B16F32", "bfmopa", "b16", 16, "f32", 1, 4, 1, 16, 64, 2, 17179869184},
+  {{ &setup, &gemm_bfmopa_f32_b16_1x4_k2, &teardown }, "BFMOPA (BF16 into FP32, 2-way)", "SME_B16F32", "bfmopa", "b16", 16, "f32", 1, 4, 2, 16, 64, 4, 17179869184},
+  {{ &setup, &gemm_bfmopa_f32_b16_1x4_k4, &teardown }, "BFMOPA (BF16 into FP32, 2-way)", "SME_B16F32", "bfmopa", "b16", 16, "f32", 1, 4, 4, 16, 64, 8, 17179869184},
+  {{ &setup, &gemm_bfmopa_f32_b16_2x1_k1, &teardown }, "BFMOPA (BF16 into FP32, 2-way)", "SME_B16F32", "bfmopa", "b16", 16, "f32", 2, 1, 1, 32, 16, 2, 17179869184},
+  {{ &setup, &gemm_bfmopa_f32_b16_2x1_k2, &teardown }, "BFMOPA (BF16 into FP32, 2-way)", "SME_B16F32", "bfmopa", "b16", 16, "f32", 2, 1, 2, 32, 16, 4, 17179869184},
+  {{ &setup, &gemm_bfmopa_f32_b16_2x1_k4, &teardown }, "BFMOPA (BF16 into FP32, 2-way)", "SME_B16F32", "bfmopa", "b16", 16, "f32", 2, 1, 4, 32, 16, 8, 17179869184},
+  {{ &setup, &gemm_bfmopa_f32_b16_2x2_k1, &teardown }, "BFMOPA (BF16 into FP32, 2-way)", "SME_B16F32", "bfmopa", "b16", 16, "f32", 2, 2, 1, 32, 32, 2, 17179869184},
+  {{ &setup, &gemm_bfmopa_f32_b16_2x2_k2, &teardown }, "BFMOPA (BF16 into FP32, 2-way)", "SME_B16F32", "bfmopa", "b16", 16, "f32", 2, 2, 2, 32, 32, 4, 17179869184},
+  {{ &setup, &gemm_bfmopa_f32_b16_2x2_k4, &teardown }, "BFMOPA (BF16 into FP32, 2-way)", "SME_B16F32", "bfmopa", "b16", 16, "f32", 2, 2, 4, 32, 32, 8, 17179869184},
+  {{ &setup, &gemm_bfmopa_f32_b16_4x1_k1, &teardown }, "BFMOPA (BF16 into FP32, 2-way)", "SME_B16F32", "bfmopa", "b16", 16, "f32", 4, 1, 1, 64, 16, 2, 17179869184},
+  {{ &setup, &gemm_bfmopa_f32_b16_4x1_k2, &teardown }, "BFMOPA (BF16 into FP32, 2-way)", "SME_B16F32", "bfmopa", "b16", 16, "f32", 4, 1, 2, 64, 16, 4, 17179869184},
+  {{ &setup, &gemm_bfmopa_f32_b16_4x1_k4, &teardown }, "BFMOPA (BF16 into FP32, 2-way)", "SME_B16F32", "bfmopa", "b16", 16, "f32", 4, 1, 4, 64, 16, 8, 17179869184},
+  {{ &setup, &gemm_smopa_i32_i16_1x1_k1, &teardown }, "SMOPA (I16 into I32, 2-way)", "SME_I16I32", "smopa", "i16", 16, "i32", 1, 1, 1, 16, 16, 2, 17179869184},
+  {{ &setup, &gemm_smopa_i32_i16_1x1_k2, &teardown }, "SMOPA (I16 into I32, 2-way)", "SME_I16I32", "smopa", "i16", 16, "i32", 1, 1, 2, 16, 16, 4, 17179869184},
+  {{ &setup, &gemm_smopa_i32_i16_1x1_k4, &teardown }, "SMOPA (I16 into I32, 2-way)", "SME_I16I32", "smopa", "i16", 16, "i32", 1, 1, 4, 16, 16, 8, 17179869184},
+  {{ &setup, &gemm_smopa_i32_i16_1x2_k1, &teardown }, "SMOPA (I16 into I32, 2-way)", "SME_I16I32", "smopa", "i16", 16, "i32", 1, 2, 1, 16, 32, 2, 17179869184},
+  {{ &setup, &gemm_smopa_i32_i16_1x2_k2, &teardown }, "SMOPA (I16 into I32, 2-way)", "SME_I16I32", "smopa", "i16", 16, "i32", 1, 2, 2, 16, 32, 4, 17179869184},
+  {{ &setup, &gemm_smopa_i32_i16_1x2_k4, &teardown }, "SMOPA (I16 into I32, 2-way)", "SME_I16I32", "smopa", "i16", 16, "i32", 1, 2, 4, 16, 32, 8, 17179869184},
+  {{ &setup, &gemm_smopa_i32_i16_1x4_k1, &teardown }, "SMOPA (I16 into I32, 2-way)", "SME_I16I32", "smopa", "i16", 16, "i32", 1, 4, 1, 16, 64, 2, 17179869184},
+  {{ &setup, &gemm_smopa_i32_i16_1x4_k2, &teardown }, "SMOPA (I16 into I32, 2-way)", "SME_I16I32", "smopa", "i16", 16, "i32", 1, 4, 2, 16, 64, 4, 17179869184},
+  {{ &setup, &gemm_smopa_i32_i16_1x4_k4, &teardown }, "SMOPA (I16 into I32, 2-way)", "SME_I16I32", "smopa", "i16", 16, "i32", 1, 4, 4, 16, 64, 8, 17179869184},
+  {{ &setup, &gemm_smopa_i32_i16_2x1_k1, &teardown }, "SMOPA (I16 into I32, 2-way)", "SME_I16I32", "smopa", "i16", 16, "i32", 2, 1, 1, 32, 16, 2, 17179869184},
+  {{ &setup, &gemm_smopa_i32_i16_2x1_k2, &teardown }, "SMOPA (I16 into I32, 2-way)", "SME_I16I32", "smopa", "i16", 16, "i32", 2, 1, 2, 32, 16, 4, 17179869184},
+  {{ &setup, &gemm_smopa_i32_i16_2x1_k4, &teardown }, "SMOPA (I16 into I32, 2-way)", "SME_I16I32", "smopa", "i16", 16, "i32", 2, 1, 4, 32, 16, 8, 17179869184},
+  {{ &setup, &gemm_smopa_i32_i16_2x2_k1, &teardown }, "SMOPA (I16 into I32, 2-way)", "SME_I16I32", "smopa", "i16", 16, "i32", 2, 2, 1, 32, 32, 2, 17179869184},
+  {{ &setup, &gemm_smopa_i32_i16_2x2_k2, &teardown }, "SMOPA (I16 into I32, 2-way)", "SME_I16I32", "smopa", "i16", 16, "i32", 2, 2, 2, 32, 32, 4, 17179869184},
+  {{ &setup, &gemm_smopa_i32_i16_2x2_k4, &teardown }, "SMOPA (I16 into I32, 2-way)", "SME_I16I32", "smopa", "i16", 16, "i32", 2, 2, 4, 32, 32, 8, 17179869184},
+  {{ &setup, &gemm_smopa_i32_i16_4x1_k1, &teardown }, "SMOPA (I16 into I32, 2-way)", "SME_I16I32", "smopa", "i16", 16, "i32", 4, 1, 1, 64, 16, 2, 17179869184},
+  {{ &setup, &gemm_smopa_i32_i16_4x1_k2, &teardown }, "SMOPA (I16 into I32, 2-way)", "SME_I16I32", "smopa", "i16", 16, "i32", 4, 1, 2, 64, 16, 4, 17179869184},
+  {{ &setup, &gemm_smopa_i32_i16_4x1_k4, &teardown }, "SMOPA (I16 into I32, 2-way)", "SME_I16I32", "smopa", "i16", 16, "i32", 4, 1, 4, 64, 16, 8, 17179869184},
+  {{ &setup, &gemm_smopa_i32_i8_1x1_k1, &teardown }, "SMOPA (I8 into I32, 4-way)", "SME_I8I32", "smopa", "i8", 8, "i32", 1, 1, 1, 16, 16, 4, 17179869184},
+  {{ &setup, &gemm_smopa_i32_i8_1x1_k2, &teardown }, "SMOPA (I8 into I32, 4-way)", "SME_I8I32", "smopa", "i8", 8, "i32", 1, 1, 2, 16, 16, 8, 17179869184},
+  {{ &setup, &gemm_smopa_i32_i8_1x1_k4, &teardown }, "SMOPA (I8 into I32, 4-way)", "SME_I8I32", "smopa", "i8", 8, "i32", 1, 1, 4, 16, 16, 16, 17179869184},
+  {{ &setup, &gemm_smopa_i32_i8_1x2_k1, &teardown }, "SMOPA (I8 into I32, 4-way)", "SME_I8I32", "smopa", "i8", 8, "i32", 1, 2, 1, 16, 32, 4, 17179869184},
+  {{ &setup, &gemm_smopa_i32_i8_1x2_k2, &teardown }, "SMOPA (I8 into I32, 4-way)", "SME_I8I32", "smopa", "i8", 8, "i32", 1, 2, 2, 16, 32, 8, 17179869184},
+  {{ &setup, &gemm_smopa_i32_i8_1x2_k4, &teardown }, "SMOPA (I8 into I32, 4-way)", "SME_I8I32", "smopa", "i8", 8, "i32", 1, 2, 4, 16, 32, 16, 17179869184},
+  {{ &setup, &gemm_smopa_i32_i8_1x4_k1, &teardown }, "SMOPA (I8 into I32, 4-way)", "SME_I8I32", "smopa", "i8", 8, "i32", 1, 4, 1, 16, 64, 4, 17179869184},
+  {{ &setup, &gemm_smopa_i32_i8_1x4_k2, &teardown }, "SMOPA (I8 into I32, 4-way)", "SME_I8I32", "smopa", "i8", 8, "i32", 1, 4, 2, 16, 64, 8, 17179869184},
+  {{ &setup, &gemm_smopa_i32_i8_1x4_k4, &teardown }, "SMOPA (I8 into I32, 4-way)", "SME_I8I32", "smopa", "i8", 8, "i32", 1, 4, 4, 16, 64, 16, 17179869184},
+  {{ &setup, &gemm_smopa_i32_i8_2x1_k1, &teardown }, "SMOPA (I8 into I32, 4-way)", "SME_I8I32", "smopa", "i8", 8, "i32", 2, 1, 1, 32, 16, 4, 17179869184},
+  {{ &setup, &gemm_smopa_i32_i8_2x1_k2, &teardown }, "SMOPA (I8 into I32, 4-way)", "SME_I8I32", "smopa", "i8", 8, "i32", 2, 1, 2, 32, 16, 8, 17179869184},
+  {{ &setup, &gemm_smopa_i32_i8_2x1_k4, &teardown }, "SMOPA (I8 into I32, 4-way)", "SME_I8I32", "smopa", "i8", 8, "i32", 2, 1, 4, 32, 16, 16, 17179869184},
+  {{ &setup, &gemm_smopa_i32_i8_2x2_k1, &teardown }, "SMOPA (I8 into I32, 4-way)", "SME_I8I32", "smopa", "i8", 8, "i32", 2, 2, 1, 32, 32, 4, 17179869184},
+  {{ &setup, &gemm_smopa_i32_i8_2x2_k2, &teardown }, "SMOPA (I8 into I32, 4-way)", "SME_I8I32", "smopa", "i8", 8, "i32", 2, 2, 2, 32, 32, 8, 17179869184},
+  {{ &setup, &gemm_smopa_i32_i8_2x2_k4, &teardown }, "SMOPA (I8 into I32, 4-way)", "SME_I8I32", "smopa", "i8", 8, "i32", 2, 2, 4, 32, 32, 16, 17179869184},
+  {{ &setup, &gemm_smopa_i32_i8_4x1_k1, &teardown }, "SMOPA (I8 into I32, 4-way)", "SME_I8I32", "smopa", "i8", 8, "i32", 4, 1, 1, 64, 16, 4, 17179869184},
+  {{ &setup, &gemm_smopa_i32_i8_4x1_k2, &teardown }, "SMOPA (I8 into I32, 4-way)", "SME_I8I32", "smopa", "i8", 8, "i32", 4, 1, 2, 64, 16, 8, 17179869184},
+  {{ &setup, &gemm_smopa_i32_i8_4x1_k4, &teardown }, "SMOPA (I8 into I32, 4-way)", "SME_I8I32", "smopa", "i8", 8, "i32", 4, 1, 4, 64, 16, 16, 17179869184},
+  {{ &setup, &gemm_smopa_i64_i16_1x1_k1, &teardown }, "SMOPA (I16 into I64, 4-way)", "FEAT_SME_I16I64", "smopa", "i16", 16, "i64", 1, 1, 1, 8, 8, 4, 17179869184},
+  {{ &setup, &gemm_smopa_i64_i16_1x1_k2, &teardown }, "SMOPA (I16 into I64, 4-way)", "FEAT_SME_I16I64", "smopa", "i16", 16, "i64", 1, 1, 2, 8, 8, 8, 17179869184},
+  {{ &setup, &gemm_smopa_i64_i16_1x1_k4, &teardown }, "SMOPA (I16 into I64, 4-way)", "FEAT_SME_I16I64", "smopa", "i16", 16, "i64", 1, 1, 4, 8, 8, 16, 17179869184},
+  {{ &setup, &gemm_smopa_i64_i16_1x2_k1, &teardown }, "SMOPA (I16 into I64, 4-way)", "FEAT_SME_I16I64", "smopa", "i16", 16, "i64", 1, 2, 1, 8, 16, 4, 17179869184},
+  {{ &setup, &gemm_smopa_i64_i16_1x2_k2, &teardown }, "SMOPA (I16 into I64, 4-way)", "FEAT_SME_I16I64", "smopa", "i16", 16, "i64", 1, 2, 2, 8, 16, 8, 17179869184},
+  {{ &setup, &gemm_smopa_i64_i16_1x2_k4, &teardown }, "SMOPA (I16 into I64, 4-way)", "FEAT_SME_I16I64", "smopa", "i16", 16, "i64", 1, 2, 4, 8, 16, 16, 17179869184},
+  {{ &setup, &gemm_smopa_i64_i16_1x4_k1, &teardown }, "SMOPA (I16 into I64, 4-way)", "FEAT_SME_I16I64", "smopa", "i16", 16, "i64", 1, 4, 1, 8, 32, 4, 17179869184},
+  {{ &setup, &gemm_smopa_i64_i16_1x4_k2, &teardown }, "SMOPA (I16 into I64, 4-way)", "FEAT_SME_I16I64", "smopa", "i16", 16, "i64", 1, 4, 2, 8, 32, 8, 17179869184},
+  {{ &setup, &gemm_smopa_i64_i16_1x4_k4, &teardown }, "SMOPA (I16 into I64, 4-way)", "FEAT_SME_I16I64", "smopa", "i16", 16, "i64", 1, 4, 4, 8, 32, 16, 17179869184},
+  {{ &setup, &gemm_smopa_i64_i16_2x1_k1, &teardown }, "SMOPA (I16 into I64, 4-way)", "FEAT_SME_I16I64", "smopa", "i16", 16, "i64", 2, 1, 1, 16, 8, 4, 17179869184},
+  {{ &setup, &gemm_smopa_i64_i16_2x1_k2, &teardown }, "SMOPA (I16 into I64, 4-way)", "FEAT_SME_I16I64", "smopa", "i16", 16, "i64", 2, 1, 2, 16, 8, 8, 17179869184},
+  {{ &setup, &gemm_smopa_i64_i16_2x1_k4, &teardown }, "SMOPA (I16 into I64, 4-way)", "FEAT_SME_I16I64", "smopa", "i16", 16, "i64", 2, 1, 4, 16, 8, 16, 17179869184},
+  {{ &setup, &gemm_smopa_i64_i16_2x2_k1, &teardown }, "SMOPA (I16 into I64, 4-way)", "FEAT_SME_I16I64", "smopa", "i16", 16, "i64", 2, 2, 1, 16, 16, 4, 17179869184},
+  {{ &setup, &gemm_smopa_i64_i16_2x2_k2, &teardown }, "SMOPA (I16 into I64, 4-way)", "FEAT_SME_I16I64", "smopa", "i16", 16, "i64", 2, 2, 2, 16, 16, 8, 17179869184},
+  {{ &setup, &gemm_smopa_i64_i16_2x2_k4, &teardown }, "SMOPA (I16 into I64, 4-way)", "FEAT_SME_I16I64", "smopa", "i16", 16, "i64", 2, 2, 4, 16, 16, 16, 17179869184},
+  {{ &setup, &gemm_smopa_i64_i16_2x4_k1, &teardown }, "SMOPA (I16 into I64, 4-way)", "FEAT_SME_I16I64", "smopa", "i16", 16, "i64", 2, 4, 1, 16, 32, 4, 17179869184},
+  {{ &setup, &gemm_smopa_i64_i16_2x4_k2, &teardown }, "SMOPA (I16 into I64, 4-way)", "FEAT_SME_I16I64", "smopa", "i16", 16, "i64", 2, 4, 2, 16, 32, 8, 17179869184},
+  {{ &setup, &gemm_smopa_i64_i16_2x4_k4, &teardown }, "SMOPA (I16 into I64, 4-way)", "FEAT_SME_I16I64", "smopa", "i16", 16, "i64", 2, 4, 4, 16, 32, 16, 17179869184},
+  {{ &setup, &gemm_smopa_i64_i16_4x1_k1, &teardown }, "SMOPA (I16 into I64, 4-way)", "FEAT_SME_I16I64", "smopa", "i16", 16, "i64", 4, 1, 1, 32, 8, 4, 17179869184},
+  {{ &setup, &gemm_smopa_i64_i16_4x1_k2, &teardown }, "SMOPA (I16 into I64, 4-way)", "FEAT_SME_I16I64", "smopa", "i16", 16, "i64", 4, 1, 2, 32, 8, 8, 17179869184},
+  {{ &setup, &gemm_smopa_i64_i16_4x1_k4, &teardown }, "SMOPA (I16 into I64, 4-way)", "FEAT_SME_I16I64", "smopa", "i16", 16, "i64", 4, 1, 4, 32, 8, 16, 17179869184},
+  {{ &setup, &gemm_smopa_i64_i16_4x2_k1, &teardown }, "SMOPA (I16 into I64, 4-way)", "FEAT_SME_I16I64", "smopa", "i16", 16, "i64", 4, 2, 1, 32, 16, 4, 17179869184},
+  {{ &setup, &gemm_smopa_i64_i16_4x2_k2, &teardown }, "SMOPA (I16 into I64, 4-way)", "FEAT_SME_I16I64", "smopa", "i16", 16, "i64", 4, 2, 2, 32, 16, 8, 17179869184},
+  {{ &setup, &gemm_smopa_i64_i16_4x2_k4, &teardown }, "SMOPA (I16 into I64, 4-way)", "FEAT_SME_I16I64", "smopa", "i16", 16, "i64", 4, 2, 4, 32, 16, 16, 17179869184}
+};
+
+CONST_PTR(gemm_benchmark_t) gemm_benchmarks = benchmarks;
+const size_t gemm_benchmarks_count = sizeof(benchmarks)/sizeof(benchmarks[0]);
+
+// execution order (none, run the table in order)
+const run_schedule_entry_t* _Nullable gemm_benchmarks_schedule = nullptr;
+const size_t gemm_benchmarks_schedule_count = 0;
@@ -0,0 +1,154 @@
+#ifdef __linux__
+#define _GNU_SOURCE
+#endif
+
+#include "bench.h"
+#include "counters.h"
+
+#include <pthread.h>
+#include <sched.h>
+#include <stdatomic.h>
+#include <assert.h>
+#include <time.h>
+
+#ifdef __APPLE__
+#include <pthread/qos.h>
+#endif
+
+// Barrier-started POSIX thread harness (run_benchmark_threads)
+//
+// The harness of bench.c releases the threads through a flag before all of them are running
+// and times the whole dispatch group, so thread start skew and stragglers are part of the
+// elapsed time. Here every thread is created (and optionally pinned) up front and reports its
+// arrival at a start barrier, the clock starts when all threads have arrived and the release
+// is observed by spinning threads. Each thread records its own start and stop time, the
+// elapsed time ends with the last thread.
+//
+// Low-priority threads run with utility QoS on Apple platforms (like bench.c) and as ordinary
+// threads elsewhere. Pinning is only supported on Linux (Apple platforms have no thread
+// affinity). Hardware counters are opened by each thread before it arrives at the barrier.
+
+typedef struct {
+  _Atomic size_t arrived;
+  _Atomic bool released;
+  // release time (nanoseconds)
+  uint64_t t0;
+} start_barrier_t;
+
+typedef struct {
+  const benchmark_t* bench;
+  void* data;
+  start_barrier_t* barrier;
+  // start and stop time (nanoseconds), the number of executed operations and the counters
+  uint64_t start;
+  uint64_t stop;
+  double ops;
+  counter_values_t counters;
+} task_t;
+
+static uint64_t clock_ns(void) {
+  struct timespec time;
+  clock_gettime(CLOCK_MONOTONIC, &time);
+
+  return (uint64_t)time.tv_sec*1000000000UL + (uint64_t)time.tv_nsec;
+}
+
+static void* run_task(void* args) {
+  task_t* task = args;
+  thread_counters_t counters = thread_counters_open();
+
+  // arrive at the barrier and wait for the release
+  atomic_fetch_add_explicit(&task->barrier->arrived, 1, memory_order_acq_rel);
+  while (!atomic_load_explicit(&task->barrier->released, memory_order_acquire)) sched_yield();
+
+  task->start = clock_ns();
+  thread_counters_start(&counters);
+  task->ops = task->bench->bench(task->data);
+  thread_counters_stop(&counters, &task->counters);
+  task->stop = clock_ns();
+
+  thread_counters_close(&counters);
+  return nullptr;
+}
+
+// thread attributes: QoS class (Apple) or CPU affinity (Linux), returns the pinned CPU or -1
+static int32_t thread_attributes(pthread_attr_t* attr, bool high_priority, const int32_t* _Nullable cpus, size_t n_cpus, size_t index) {
+  pthread_attr_init(attr);
+
+#ifdef __APPLE__
+  pthread_attr_set_qos_class_np(attr, high_priority ? QOS_CLASS_USER_INITIATED : QOS_CLASS_UTILITY, 0);
+#else
+  (void)high_priority;
+#endif
+
+#ifdef __linux__
+  if (cpus != nullptr && n_cpus > 0) {
+    int32_t cpu = cpus[index % n_cpus];
+    cpu_set_t set;
+    CPU_ZERO(&set);
+    CPU_SET(cpu, &set);
+    if (pthread_attr_setaffinity_np(attr, sizeof(set), &set) == 0) return cpu;
+  }
+#else
+  (void)cpus; (void)n_cpus; (void)index;
+#endif
+
+  return -1;
+}
+
+benchmark_result_t run_benchmark_threads(
+  const benchmark_t* _Nonnull bench,
+  const void* _Nullable params,
+  size_t n_threads_highp,
+  size_t n_threads_lowp,
+  const int32_t* _Nullable cpus,
+  size_t n_cpus,
+  thread_result_t* _Nullable thread_results
+) {
+  size_t n_threads = n_threads_highp + n_threads_lowp;
+  assert(n_threads > 0);
+
+  start_barrier_t barrier = { .arrived = 0, .released = false };
+  task_t tasks[n_threads];
+  pthread_t threads[n_threads];
+  int32_t pinned[n_threads];
+
+  // setup and start the tasks (high-priority threads first)
+  for (size_t i = 0; i < n_threads; i++) {
+    tasks[i] = (task_t) { .bench = bench, .data = bench->setup(params), .barrier = &barrier };
+
+    pthread_attr_t attr;
+    pinned[i] = thread_attributes(&attr, i < n_threads_highp, cpus, n_cpus, i);
+    int error = pthread_create(&threads[i], &attr, run_task, &tasks[i]);
+    assert(error == 0);
+    (void)error;
+    pthread_attr_destroy(&attr);
+  }
+
+  // release the threads once all of them are waiting
+  while (atomic_load_explicit(&barrier.arrived, memory_order_acquire) < n_threads) sched_yield();
+  barrier.t0 = clock_ns();
+  atomic_store_explicit(&barrier.released, true, memory_order_release);
+
+  for (size_t i = 0; i < n_threads; i++) pthread_join(threads[i], nullptr);
+
+  // the run ends with the last thread
+  double elapsed = 0.0;
+  double total_ops = 0.0;
+  counter_values_t counters = {};
+  for (size_t i = 0; i < n_threads; i++) {
+    double start = (double)(tasks[i].start - barrier.t0)/1e9;
+    double stop = (double)(tasks[i].stop - barrier.t0)/1e9;
+    elapsed = stop > elapsed ? stop : elapsed;
+    total_ops += tasks[i].ops;
+    counters_add(&counters, tasks[i].counters);
+
+    if (thread_results != nullptr) {
+      thread_results[i] = (thread_result_t) { .start = start, .stop = stop, .total_ops = tasks[i].ops, .cpu = pinned[i], .counters = tasks[i].counters };
+    }
+
+    bench->teardown(tasks[i].data);
+  }
+
+  return (benchmark_result_t) { .elapsed = elapsed, .total_ops = total_ops, .counters = counters };
+}
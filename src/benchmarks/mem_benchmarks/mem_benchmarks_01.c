@@ -0,0 +1,2932 @@
+// generated by tools/gen_mem_benchmarks.py, do not edit!
+#include <assert.h>
+#include <stdlib.h>
+#include "../bench.h"
+
+// Allocation granularity, must be large enough to align with 4x multivector load/store
+#define SIZE_ALIGNMENT (64*4)
+
+// Benchmark parameters
+typedef struct {
+  char*  src;
+  char*  dst;
+  size_t size;
+  size_t n_iterations;
+  double total_size;
+} benchmark_data_t;
+
+// benchmark functions
+
+double load_za_vector_x1_ilp1(const void* args) {
+  // LDR (ZA vector)
+  //
+  // Bytes per instruction: 64, bytes per loop iteration: 64 (ILP=1)
+  const benchmark_data_t* data = args;
+
+  //printf("starting load_za_vector_x1_ilp1\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x12, #0                                                 \n"
+    "1:                                                          \n"
+    "  mov x1, %[src]                                            \n"
+    "  2:                                                        \n"
+    "    ldr za[w12, 0], [x1, 0, MUL VL]                         \n"
+    "                                                            \n"
+    "    add x1, x1, #64                                         \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 2b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [src] "r" (data->src), [end] "r" (data->src + data->size)
+    : "x0", "x1", "x12"
+  );
+
+  //printf("done load_za_vector_x1_ilp1\n");
+
+  // number of bytes transferred overall
+  return data->total_size;
+}
+
+
+double load_za_vector_x1_ilp13(const void* args) {
+  // LDR (ZA vector)
+  //
+  // Bytes per instruction: 64, bytes per loop iteration: 832 (ILP=13)
+  const benchmark_data_t* data = args;
+  size_t size_aligned = data->size - (data->size % 832);
+
+  //printf("starting load_za_vector_x1_ilp13\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x12, #0                                                 \n"
+    "1:                                                          \n"
+    "  mov x1, %[src]                                            \n"
+    "  2:                                                        \n"
+    "    ldr za[w12, 0], [x1, 0, MUL VL]                         \n"
+    "    ldr za[w12, 1], [x1, 1, MUL VL]                         \n"
+    "    ldr za[w12, 2], [x1, 2, MUL VL]                         \n"
+    "    ldr za[w12, 3], [x1, 3, MUL VL]                         \n"
+    "    ldr za[w12, 4], [x1, 4, MUL VL]                         \n"
+    "    ldr za[w12, 5], [x1, 5, MUL VL]                         \n"
+    "    ldr za[w12, 6], [x1, 6, MUL VL]                         \n"
+    "    ldr za[w12, 7], [x1, 7, MUL VL]                         \n"
+    "    ldr za[w12, 8], [x1, 8, MUL VL]                         \n"
+    "    ldr za[w12, 9], [x1, 9, MUL VL]                         \n"
+    "    ldr za[w12, 10], [x1, 10, MUL VL]                       \n"
+    "    ldr za[w12, 11], [x1, 11, MUL VL]                       \n"
+    "    ldr za[w12, 12], [x1, 12, MUL VL]                       \n"
+    "                                                            \n"
+    "    add x1, x1, #832                                        \n"
+    "    cmp x1, %[end_aligned]                                  \n"
+    "    b.lo 2b                                                 \n"
+    "    b 4f                                                    \n"
+    "  3:                                                        \n"
+    "    ldr za[w12, 0], [x1, 0, MUL VL]                         \n"
+    "    add x1, x1, #64                                         \n"
+    "  4:                                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 3b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [src] "r" (data->src), [end] "r" (data->src + data->size), [end_aligned] "r" (data->src + size_aligned)
+    : "x0", "x1", "x12"
+  );
+
+  //printf("done load_za_vector_x1_ilp13\n");
+
+  // number of bytes transferred overall
+  return data->total_size;
+}
+
+
+double store_za_vector_x1_ilp6(const void* args) {
+  // STR (ZA vector)
+  //
+  // Bytes per instruction: 64, bytes per loop iteration: 384 (ILP=6)
+  const benchmark_data_t* data = args;
+  size_t size_aligned = data->size - (data->size % 384);
+
+  //printf("starting store_za_vector_x1_ilp6\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x12, #0                                                 \n"
+    "1:                                                          \n"
+    "  mov x1, %[dst]                                            \n"
+    "  2:                                                        \n"
+    "    str za[w12, 0], [x1, 0, MUL VL]                         \n"
+    "    str za[w12, 1], [x1, 1, MUL VL]                         \n"
+    "    str za[w12, 2], [x1, 2, MUL VL]                         \n"
+    "    str za[w12, 3], [x1, 3, MUL VL]                         \n"
+    "    str za[w12, 4], [x1, 4, MUL VL]                         \n"
+    "    str za[w12, 5], [x1, 5, MUL VL]                         \n"
+    "                                                            \n"
+    "    add x1, x1, #384                                        \n"
+    "    cmp x1, %[end_aligned]                                  \n"
+    "    b.lo 2b                                                 \n"
+    "    b 4f                                                    \n"
+    "  3:                                                        \n"
+    "    str za[w12, 0], [x1, 0, MUL VL]                         \n"
+    "    add x1, x1, #64                                         \n"
+    "  4:                                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 3b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [dst] "r" (data->dst), [end] "r" (data->dst + data->size), [end_aligned] "r" (data->dst + size_aligned)
+    : "x0", "x1", "x12"
+  );
+
+  //printf("done store_za_vector_x1_ilp6\n");
+
+  // number of bytes transferred overall
+  return data->total_size;
+}
+
+
+double store_za_vector_x1_ilp15(const void* args) {
+  // STR (ZA vector)
+  //
+  // Bytes per instruction: 64, bytes per loop iteration: 960 (ILP=15)
+  const benchmark_data_t* data = args;
+  size_t size_aligned = data->size - (data->size % 960);
+
+  //printf("starting store_za_vector_x1_ilp15\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x12, #0                                                 \n"
+    "1:                                                          \n"
+    "  mov x1, %[dst]                                            \n"
+    "  2:                                                        \n"
+    "    str za[w12, 0], [x1, 0, MUL VL]                         \n"
+    "    str za[w12, 1], [x1, 1, MUL VL]                         \n"
+    "    str za[w12, 2], [x1, 2, MUL VL]                         \n"
+    "    str za[w12, 3], [x1, 3, MUL VL]                         \n"
+    "    str za[w12, 4], [x1, 4, MUL VL]                         \n"
+    "    str za[w12, 5], [x1, 5, MUL VL]                         \n"
+    "    str za[w12, 6], [x1, 6, MUL VL]                         \n"
+    "    str za[w12, 7], [x1, 7, MUL VL]                         \n"
+    "    str za[w12, 8], [x1, 8, MUL VL]                         \n"
+    "    str za[w12, 9], [x1, 9, MUL VL]                         \n"
+    "    str za[w12, 10], [x1, 10, MUL VL]                       \n"
+    "    str za[w12, 11], [x1, 11, MUL VL]                       \n"
+    "    str za[w12, 12], [x1, 12, MUL VL]                       \n"
+    "    str za[w12, 13], [x1, 13, MUL VL]                       \n"
+    "    str za[w12, 14], [x1, 14, MUL VL]                       \n"
+    "                                                            \n"
+    "    add x1, x1, #960                                        \n"
+    "    cmp x1, %[end_aligned]                                  \n"
+    "    b.lo 2b                                                 \n"
+    "    b 4f                                                    \n"
+    "  3:                                                        \n"
+    "    str za[w12, 0], [x1, 0, MUL VL]                         \n"
+    "    add x1, x1, #64                                         \n"
+    "  4:                                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 3b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [dst] "r" (data->dst), [end] "r" (data->dst + data->size), [end_aligned] "r" (data->dst + size_aligned)
+    : "x0", "x1", "x12"
+  );
+
+  //printf("done store_za_vector_x1_ilp15\n");
+
+  // number of bytes transferred overall
+  return data->total_size;
+}
+
+
+double copy_za_vector_x1_ilp10(const void* args) {
+  // LDR/STR (ZA vector)
+  //
+  // Bytes per instruction: 64, bytes per loop iteration: 640 (ILP=10)
+  const benchmark_data_t* data = args;
+  size_t size_aligned = data->size - (data->size % 640);
+
+  //printf("starting copy_za_vector_x1_ilp10\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x12, #0                                                 \n"
+    "1:                                                          \n"
+    "  mov x1, %[src]                                            \n"
+    "  mov x2, %[dst]                                            \n"
+    "  2:                                                        \n"
+    "    ldr za[w12, 0], [x1, 0, MUL VL]                         \n"
+    "    ldr za[w12, 1], [x1, 1, MUL VL]                         \n"
+    "    ldr za[w12, 2], [x1, 2, MUL VL]                         \n"
+    "    ldr za[w12, 3], [x1, 3, MUL VL]                         \n"
+    "    ldr za[w12, 4], [x1, 4, MUL VL]                         \n"
+    "    ldr za[w12, 5], [x1, 5, MUL VL]                         \n"
+    "    ldr za[w12, 6], [x1, 6, MUL VL]                         \n"
+    "    ldr za[w12, 7], [x1, 7, MUL VL]                         \n"
+    "    ldr za[w12, 8], [x1, 8, MUL VL]                         \n"
+    "    ldr za[w12, 9], [x1, 9, MUL VL]                         \n"
+    "                                                            \n"
+    "    str za[w12, 0], [x2, 0, MUL VL]                         \n"
+    "    str za[w12, 1], [x2, 1, MUL VL]                         \n"
+    "    str za[w12, 2], [x2, 2, MUL VL]                         \n"
+    "    str za[w12, 3], [x2, 3, MUL VL]                         \n"
+    "    str za[w12, 4], [x2, 4, MUL VL]                         \n"
+    "    str za[w12, 5], [x2, 5, MUL VL]                         \n"
+    "    str za[w12, 6], [x2, 6, MUL VL]                         \n"
+    "    str za[w12, 7], [x2, 7, MUL VL]                         \n"
+    "    str za[w12, 8], [x2, 8, MUL VL]                         \n"
+    "    str za[w12, 9], [x2, 9, MUL VL]                         \n"
+    "                                                            \n"
+    "    add x1, x1, #640                                        \n"
+    "    add x2, x2, #640                                        \n"
+    "    cmp x1, %[end_aligned]                                  \n"
+    "    b.lo 2b                                                 \n"
+    "    b 4f                                                    \n"
+    "  3:                                                        \n"
+    "    ldr za[w12, 0], [x1, 0, MUL VL]                         \n"
+    "    add x1, x1, #64                                         \n"
+    "    str za[w12, 0], [x2, 0, MUL VL]                         \n"
+    "    add x2, x2, #64                                         \n"
+    "  4:                                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 3b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [src] "r" (data->src), [dst] "r" (data->dst), [end] "r" (data->src + data->size), [end_aligned] "r" (data->src + size_aligned)
+    : "x0", "x1", "x2", "x12"
+  );
+
+  //printf("done copy_za_vector_x1_ilp10\n");
+
+  // number of bytes transferred overall
+  return 2.0*data->total_size;
+}
+
+
+double load_reg_adjacent_x1_ilp2(const void* args) {
+  // LDR (one register, unpredicated)
+  //
+  // Bytes per instruction: 64, bytes per loop iteration: 128 (ILP=2)
+  const benchmark_data_t* data = args;
+  size_t size_aligned = data->size - (data->size % 128);
+
+  //printf("starting load_reg_adjacent_x1_ilp2\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "1:                                                          \n"
+    "  mov x1, %[src]                                            \n"
+    "  2:                                                        \n"
+    "    ldr z0, [x1, 0, MUL VL]                                 \n"
+    "    ldr z1, [x1, 1, MUL VL]                                 \n"
+    "                                                            \n"
+    "    add x1, x1, #128                                        \n"
+    "    cmp x1, %[end_aligned]                                  \n"
+    "    b.lo 2b                                                 \n"
+    "    b 4f                                                    \n"
+    "  3:                                                        \n"
+    "    ldr z0, [x1, 0, MUL VL]                                 \n"
+    "    add x1, x1, #64                                         \n"
+    "  4:                                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 3b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [src] "r" (data->src), [end] "r" (data->src + data->size), [end_aligned] "r" (data->src + size_aligned)
+    : "x0", "x1"
+  );
+
+  //printf("done load_reg_adjacent_x1_ilp2\n");
+
+  // number of bytes transferred overall
+  return data->total_size;
+}
+
+
+double store_reg_adjacent_x1_ilp7(const void* args) {
+  // STR (one register, unpredicated)
+  //
+  // Bytes per instruction: 64, bytes per loop iteration: 448 (ILP=7)
+  const benchmark_data_t* data = args;
+  size_t size_aligned = data->size - (data->size % 448);
+
+  //printf("starting store_reg_adjacent_x1_ilp7\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "1:                                                          \n"
+    "  mov x1, %[dst]                                            \n"
+    "  2:                                                        \n"
+    "    str z0, [x1, 0, MUL VL]                                 \n"
+    "    str z1, [x1, 1, MUL VL]                                 \n"
+    "    str z2, [x1, 2, MUL VL]                                 \n"
+    "    str z3, [x1, 3, MUL VL]                                 \n"
+    "    str z4, [x1, 4, MUL VL]                                 \n"
+    "    str z5, [x1, 5, MUL VL]                                 \n"
+    "    str z6, [x1, 6, MUL VL]                                 \n"
+    "                                                            \n"
+    "    add x1, x1, #448                                        \n"
+    "    cmp x1, %[end_aligned]                                  \n"
+    "    b.lo 2b                                                 \n"
+    "    b 4f                                                    \n"
+    "  3:                                                        \n"
+    "    str z0, [x1, 0, MUL VL]                                 \n"
+    "    add x1, x1, #64                                         \n"
+    "  4:                                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 3b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [dst] "r" (data->dst), [end] "r" (data->dst + data->size), [end_aligned] "r" (data->dst + size_aligned)
+    : "x0", "x1"
+  );
+
+  //printf("done store_reg_adjacent_x1_ilp7\n");
+
+  // number of bytes transferred overall
+  return data->total_size;
+}
+
+
+double copy_reg_adjacent_x1_ilp3(const void* args) {
+  // LDR/STR (one register, unpredicated)
+  //
+  // Bytes per instruction: 64, bytes per loop iteration: 192 (ILP=3)
+  const benchmark_data_t* data = args;
+  size_t size_aligned = data->size - (data->size % 192);
+
+  //printf("starting copy_reg_adjacent_x1_ilp3\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "1:                                                          \n"
+    "  mov x1, %[src]                                            \n"
+    "  mov x2, %[dst]                                            \n"
+    "  2:                                                        \n"
+    "    ldr z0, [x1, 0, MUL VL]                                 \n"
+    "    ldr z1, [x1, 1, MUL VL]                                 \n"
+    "    ldr z2, [x1, 2, MUL VL]                                 \n"
+    "                                                            \n"
+    "    str z0, [x2, 0, MUL VL]                                 \n"
+    "    str z1, [x2, 1, MUL VL]                                 \n"
+    "    str z2, [x2, 2, MUL VL]                                 \n"
+    "                                                            \n"
+    "    add x1, x1, #192                                        \n"
+    "    add x2, x2, #192                                        \n"
+    "    cmp x1, %[end_aligned]                                  \n"
+    "    b.lo 2b                                                 \n"
+    "    b 4f                                                    \n"
+    "  3:                                                        \n"
+    "    ldr z0, [x1, 0, MUL VL]                                 \n"
+    "    add x1, x1, #64                                         \n"
+    "    str z0, [x2, 0, MUL VL]                                 \n"
+    "    add x2, x2, #64                                         \n"
+    "  4:                                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 3b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [src] "r" (data->src), [dst] "r" (data->dst), [end] "r" (data->src + data->size), [end_aligned] "r" (data->src + size_aligned)
+    : "x0", "x1", "x2"
+  );
+
+  //printf("done copy_reg_adjacent_x1_ilp3\n");
+
+  // number of bytes transferred overall
+  return 2.0*data->total_size;
+}
+
+
+double copy_reg_adjacent_x1_ilp8(const void* args) {
+  // LDR/STR (one register, unpredicated)
+  //
+  // Bytes per instruction: 64, bytes per loop iteration: 512 (ILP=8)
+  const benchmark_data_t* data = args;
+  size_t size_aligned = data->size - (data->size % 512);
+
+  //printf("starting copy_reg_adjacent_x1_ilp8\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "1:                                                          \n"
+    "  mov x1, %[src]                                            \n"
+    "  mov x2, %[dst]                                            \n"
+    "  2:                                                        \n"
+    "    ldr z0, [x1, 0, MUL VL]                                 \n"
+    "    ldr z1, [x1, 1, MUL VL]                                 \n"
+    "    ldr z2, [x1, 2, MUL VL]                                 \n"
+    "    ldr z3, [x1, 3, MUL VL]                                 \n"
+    "    ldr z4, [x1, 4, MUL VL]                                 \n"
+    "    ldr z5, [x1, 5, MUL VL]                                 \n"
+    "    ldr z6, [x1, 6, MUL VL]                                 \n"
+    "    ldr z7, [x1, 7, MUL VL]                                 \n"
+    "                                                            \n"
+    "    str z0, [x2, 0, MUL VL]                                 \n"
+    "    str z1, [x2, 1, MUL VL]                                 \n"
+    "    str z2, [x2, 2, MUL VL]                                 \n"
+    "    str z3, [x2, 3, MUL VL]                                 \n"
+    "    str z4, [x2, 4, MUL VL]                                 \n"
+    "    str z5, [x2, 5, MUL VL]                                 \n"
+    "    str z6, [x2, 6, MUL VL]                                 \n"
+    "    str z7, [x2, 7, MUL VL]                                 \n"
+    "                                                            \n"
+    "    add x1, x1, #512                                        \n"
+    "    add x2, x2, #512                                        \n"
+    "    cmp x1, %[end_aligned]                                  \n"
+    "    b.lo 2b                                                 \n"
+    "    b 4f                                                    \n"
+    "  3:                                                        \n"
+    "    ldr z0, [x1, 0, MUL VL]                                 \n"
+    "    add x1, x1, #64                                         \n"
+    "    str z0, [x2, 0, MUL VL]                                 \n"
+    "    add x2, x2, #64                                         \n"
+    "  4:                                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 3b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [src] "r" (data->src), [dst] "r" (data->dst), [end] "r" (data->src + data->size), [end_aligned] "r" (data->src + size_aligned)
+    : "x0", "x1", "x2"
+  );
+
+  //printf("done copy_reg_adjacent_x1_ilp8\n");
+
+  // number of bytes transferred overall
+  return 2.0*data->total_size;
+}
+
+
+double load_reg_adjacent_x2_ilp3(const void* args) {
+  // LD1W (two register, adjacent, predicated)
+  //
+  // Bytes per instruction: 128, bytes per loop iteration: 384 (ILP=3)
+  const benchmark_data_t* data = args;
+  size_t size_aligned = data->size - (data->size % 384);
+
+  //printf("starting load_reg_adjacent_x2_ilp3\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "ptrue pn8.s                                                 \n"
+    "1:                                                          \n"
+    "  mov x1, %[src]                                            \n"
+    "  2:                                                        \n"
+    "    ld1w {z0.s-z1.s}, pn8/z, [x1, 0, MUL VL]                \n"
+    "    ld1w {z2.s-z3.s}, pn8/z, [x1, 2, MUL VL]                \n"
+    "    ld1w {z4.s-z5.s}, pn8/z, [x1, 4, MUL VL]                \n"
+    "                                                            \n"
+    "    add x1, x1, #384                                        \n"
+    "    cmp x1, %[end_aligned]                                  \n"
+    "    b.lo 2b                                                 \n"
+    "    b 4f                                                    \n"
+    "  3:                                                        \n"
+    "    ld1w {z0.s-z1.s}, pn8/z, [x1, 0, MUL VL]                \n"
+    "    add x1, x1, #128                                        \n"
+    "  4:                                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 3b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [src] "r" (data->src), [end] "r" (data->src + data->size), [end_aligned] "r" (data->src + size_aligned)
+    : "x0", "x1"
+  );
+
+  //printf("done load_reg_adjacent_x2_ilp3\n");
+
+  // number of bytes transferred overall
+  return data->total_size;
+}
+
+
+double load_reg_adjacent_x2_ilp8(const void* args) {
+  // LD1W (two register, adjacent, predicated)
+  //
+  // Bytes per instruction: 128, bytes per loop iteration: 1024 (ILP=8)
+  const benchmark_data_t* data = args;
+  size_t size_aligned = data->size - (data->size % 1024);
+
+  //printf("starting load_reg_adjacent_x2_ilp8\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "ptrue pn8.s                                                 \n"
+    "1:                                                          \n"
+    "  mov x1, %[src]                                            \n"
+    "  2:                                                        \n"
+    "    ld1w {z0.s-z1.s}, pn8/z, [x1, 0, MUL VL]                \n"
+    "    ld1w {z2.s-z3.s}, pn8/z, [x1, 2, MUL VL]                \n"
+    "    ld1w {z4.s-z5.s}, pn8/z, [x1, 4, MUL VL]                \n"
+    "    ld1w {z6.s-z7.s}, pn8/z, [x1, 6, MUL VL]                \n"
+    "    ld1w {z8.s-z9.s}, pn8/z, [x1, 8, MUL VL]                \n"
+    "    ld1w {z10.s-z11.s}, pn8/z, [x1, 10, MUL VL]             \n"
+    "    ld1w {z12.s-z13.s}, pn8/z, [x1, 12, MUL VL]             \n"
+    "    ld1w {z14.s-z15.s}, pn8/z, [x1, 14, MUL VL]             \n"
+    "                                                            \n"
+    "    add x1, x1, #1024                                       \n"
+    "    cmp x1, %[end_aligned]                                  \n"
+    "    b.lo 2b                                                 \n"
+    "    b 4f                                                    \n"
+    "  3:                                                        \n"
+    "    ld1w {z0.s-z1.s}, pn8/z, [x1, 0, MUL VL]                \n"
+    "    add x1, x1, #128                                        \n"
+    "  4:                                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 3b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [src] "r" (data->src), [end] "r" (data->src + data->size), [end_aligned] "r" (data->src + size_aligned)
+    : "x0", "x1"
+  );
+
+  //printf("done load_reg_adjacent_x2_ilp8\n");
+
+  // number of bytes transferred overall
+  return data->total_size;
+}
+
+
+double load_reg_adjacent_x2_p75_ilp7(const void* args) {
+  // LD1W (two register, adjacent, predicated), 75% active lanes
+  //
+  // Bytes per instruction: 128 (96 active), bytes per loop iteration: 896 (ILP=7)
+  const benchmark_data_t* data = args;
+  size_t size_aligned = data->size - (data->size % 896);
+
+  //printf("starting load_reg_adjacent_x2_p75_ilp7\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #24                                                \n"
+    "whilelt pn8.s, xzr, x24, vlx2                               \n"
+    "1:                                                          \n"
+    "  mov x1, %[src]                                            \n"
+    "  2:                                                        \n"
+    "    ld1w {z0.s-z1.s}, pn8/z, [x1, 0, MUL VL]                \n"
+    "    ld1w {z2.s-z3.s}, pn8/z, [x1, 2, MUL VL]                \n"
+    "    ld1w {z4.s-z5.s}, pn8/z, [x1, 4, MUL VL]                \n"
+    "    ld1w {z6.s-z7.s}, pn8/z, [x1, 6, MUL VL]                \n"
+    "    ld1w {z8.s-z9.s}, pn8/z, [x1, 8, MUL VL]                \n"
+    "    ld1w {z10.s-z11.s}, pn8/z, [x1, 10, MUL VL]             \n"
+    "    ld1w {z12.s-z13.s}, pn8/z, [x1, 12, MUL VL]             \n"
+    "                                                            \n"
+    "    add x1, x1, #896                                        \n"
+    "    cmp x1, %[end_aligned]                                  \n"
+    "    b.lo 2b                                                 \n"
+    "    b 4f                                                    \n"
+    "  3:                                                        \n"
+    "    ld1w {z0.s-z1.s}, pn8/z, [x1, 0, MUL VL]                \n"
+    "    add x1, x1, #128                                        \n"
+    "  4:                                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 3b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [src] "r" (data->src), [end] "r" (data->src + data->size), [end_aligned] "r" (data->src + size_aligned)
+    : "x0", "x1", "x24"
+  );
+
+  //printf("done load_reg_adjacent_x2_p75_ilp7\n");
+
+  // number of bytes transferred overall
+  return 0.75*data->total_size;
+}
+
+
+double load_reg_adjacent_x2_p50_ilp4(const void* args) {
+  // LD1W (two register, adjacent, predicated), 50% active lanes
+  //
+  // Bytes per instruction: 128 (64 active), bytes per loop iteration: 512 (ILP=4)
+  const benchmark_data_t* data = args;
+  size_t size_aligned = data->size - (data->size % 512);
+
+  //printf("starting load_reg_adjacent_x2_p50_ilp4\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #16                                                \n"
+    "whilelt pn8.s, xzr, x24, vlx2                               \n"
+    "1:                                                          \n"
+    "  mov x1, %[src]                                            \n"
+    "  2:                                                        \n"
+    "    ld1w {z0.s-z1.s}, pn8/z, [x1, 0, MUL VL]                \n"
+    "    ld1w {z2.s-z3.s}, pn8/z, [x1, 2, MUL VL]                \n"
+    "    ld1w {z4.s-z5.s}, pn8/z, [x1, 4, MUL VL]                \n"
+    "    ld1w {z6.s-z7.s}, pn8/z, [x1, 6, MUL VL]                \n"
+    "                                                            \n"
+    "    add x1, x1, #512                                        \n"
+    "    cmp x1, %[end_aligned]                                  \n"
+    "    b.lo 2b                                                 \n"
+    "    b 4f                                                    \n"
+    "  3:                                                        \n"
+    "    ld1w {z0.s-z1.s}, pn8/z, [x1, 0, MUL VL]                \n"
+    "    add x1, x1, #128                                        \n"
+    "  4:                                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 3b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [src] "r" (data->src), [end] "r" (data->src + data->size), [end_aligned] "r" (data->src + size_aligned)
+    : "x0", "x1", "x24"
+  );
+
+  //printf("done load_reg_adjacent_x2_p50_ilp4\n");
+
+  // number of bytes transferred overall
+  return 0.5*data->total_size;
+}
+
+
+double load_reg_adjacent_x2_p25_ilp2(const void* args) {
+  // LD1W (two register, adjacent, predicated), 25% active lanes
+  //
+  // Bytes per instruction: 128 (32 active), bytes per loop iteration: 256 (ILP=2)
+  const benchmark_data_t* data = args;
+  size_t size_aligned = data->size - (data->size % 256);
+
+  //printf("starting load_reg_adjacent_x2_p25_ilp2\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #8                                                 \n"
+    "whilelt pn8.s, xzr, x24, vlx2                               \n"
+    "1:                                                          \n"
+    "  mov x1, %[src]                                            \n"
+    "  2:                                                        \n"
+    "    ld1w {z0.s-z1.s}, pn8/z, [x1, 0, MUL VL]                \n"
+    "    ld1w {z2.s-z3.s}, pn8/z, [x1, 2, MUL VL]                \n"
+    "                                                            \n"
+    "    add x1, x1, #256                                        \n"
+    "    cmp x1, %[end_aligned]                                  \n"
+    "    b.lo 2b                                                 \n"
+    "    b 4f                                                    \n"
+    "  3:                                                        \n"
+    "    ld1w {z0.s-z1.s}, pn8/z, [x1, 0, MUL VL]                \n"
+    "    add x1, x1, #128                                        \n"
+    "  4:                                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 3b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [src] "r" (data->src), [end] "r" (data->src + data->size), [end_aligned] "r" (data->src + size_aligned)
+    : "x0", "x1", "x24"
+  );
+
+  //printf("done load_reg_adjacent_x2_p25_ilp2\n");
+
+  // number of bytes transferred overall
+  return 0.25*data->total_size;
+}
+
+
+double store_reg_adjacent_x2_ilp6(const void* args) {
+  // ST1W (two register, adjacent, predicated)
+  //
+  // Bytes per instruction: 128, bytes per loop iteration: 768 (ILP=6)
+  const benchmark_data_t* data = args;
+  size_t size_aligned = data->size - (data->size % 768);
+
+  //printf("starting store_reg_adjacent_x2_ilp6\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "ptrue pn8.s                                                 \n"
+    "1:                                                          \n"
+    "  mov x1, %[dst]                                            \n"
+    "  2:                                                        \n"
+    "    st1w {z0.s-z1.s}, pn8, [x1, 0, MUL VL]                  \n"
+    "    st1w {z2.s-z3.s}, pn8, [x1, 2, MUL VL]                  \n"
+    "    st1w {z4.s-z5.s}, pn8, [x1, 4, MUL VL]                  \n"
+    "    st1w {z6.s-z7.s}, pn8, [x1, 6, MUL VL]                  \n"
+    "    st1w {z8.s-z9.s}, pn8, [x1, 8, MUL VL]                  \n"
+    "    st1w {z10.s-z11.s}, pn8, [x1, 10, MUL VL]               \n"
+    "                                                            \n"
+    "    add x1, x1, #768                                        \n"
+    "    cmp x1, %[end_aligned]                                  \n"
+    "    b.lo 2b                                                 \n"
+    "    b 4f                                                    \n"
+    "  3:                                                        \n"
+    "    st1w {z0.s-z1.s}, pn8, [x1, 0, MUL VL]                  \n"
+    "    add x1, x1, #128                                        \n"
+    "  4:                                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 3b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [dst] "r" (data->dst), [end] "r" (data->dst + data->size), [end_aligned] "r" (data->dst + size_aligned)
+    : "x0", "x1"
+  );
+
+  //printf("done store_reg_adjacent_x2_ilp6\n");
+
+  // number of bytes transferred overall
+  return data->total_size;
+}
+
+
+double store_reg_adjacent_x2_p75_ilp4(const void* args) {
+  // ST1W (two register, adjacent, predicated), 75% active lanes
+  //
+  // Bytes per instruction: 128 (96 active), bytes per loop iteration: 512 (ILP=4)
+  const benchmark_data_t* data = args;
+  size_t size_aligned = data->size - (data->size % 512);
+
+  //printf("starting store_reg_adjacent_x2_p75_ilp4\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #24                                                \n"
+    "whilelt pn8.s, xzr, x24, vlx2                               \n"
+    "1:                                                          \n"
+    "  mov x1, %[dst]                                            \n"
+    "  2:                                                        \n"
+    "    st1w {z0.s-z1.s}, pn8, [x1, 0, MUL VL]                  \n"
+    "    st1w {z2.s-z3.s}, pn8, [x1, 2, MUL VL]                  \n"
+    "    st1w {z4.s-z5.s}, pn8, [x1, 4, MUL VL]                  \n"
+    "    st1w {z6.s-z7.s}, pn8, [x1, 6, MUL VL]                  \n"
+    "                                                            \n"
+    "    add x1, x1, #512                                        \n"
+    "    cmp x1, %[end_aligned]                                  \n"
+    "    b.lo 2b                                                 \n"
+    "    b 4f                                                    \n"
+    "  3:                                                        \n"
+    "    st1w {z0.s-z1.s}, pn8, [x1, 0, MUL VL]                  \n"
+    "    add x1, x1, #128                                        \n"
+    "  4:                                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 3b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [dst] "r" (data->dst), [end] "r" (data->dst + data->size), [end_aligned] "r" (data->dst + size_aligned)
+    : "x0", "x1", "x24"
+  );
+
+  //printf("done store_reg_adjacent_x2_p75_ilp4\n");
+
+  // number of bytes transferred overall
+  return 0.75*data->total_size;
+}
+
+
+double store_reg_adjacent_x2_p50_ilp7(const void* args) {
+  // ST1W (two register, adjacent, predicated), 50% active lanes
+  //
+  // Bytes per instruction: 128 (64 active), bytes per loop iteration: 896 (ILP=7)
+  const benchmark_data_t* data = args;
+  size_t size_aligned = data->size - (data->size % 896);
+
+  //printf("starting store_reg_adjacent_x2_p50_ilp7\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #16                                                \n"
+    "whilelt pn8.s, xzr, x24, vlx2                               \n"
+    "1:                                                          \n"
+    "  mov x1, %[dst]                                            \n"
+    "  2:                                                        \n"
+    "    st1w {z0.s-z1.s}, pn8, [x1, 0, MUL VL]                  \n"
+    "    st1w {z2.s-z3.s}, pn8, [x1, 2, MUL VL]                  \n"
+    "    st1w {z4.s-z5.s}, pn8, [x1, 4, MUL VL]                  \n"
+    "    st1w {z6.s-z7.s}, pn8, [x1, 6, MUL VL]                  \n"
+    "    st1w {z8.s-z9.s}, pn8, [x1, 8, MUL VL]                  \n"
+    "    st1w {z10.s-z11.s}, pn8, [x1, 10, MUL VL]               \n"
+    "    st1w {z12.s-z13.s}, pn8, [x1, 12, MUL VL]               \n"
+    "                                                            \n"
+    "    add x1, x1, #896                                        \n"
+    "    cmp x1, %[end_aligned]                                  \n"
+    "    b.lo 2b                                                 \n"
+    "    b 4f                                                    \n"
+    "  3:                                                        \n"
+    "    st1w {z0.s-z1.s}, pn8, [x1, 0, MUL VL]                  \n"
+    "    add x1, x1, #128                                        \n"
+    "  4:                                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 3b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [dst] "r" (data->dst), [end] "r" (data->dst + data->size), [end_aligned] "r" (data->dst + size_aligned)
+    : "x0", "x1", "x24"
+  );
+
+  //printf("done store_reg_adjacent_x2_p50_ilp7\n");
+
+  // number of bytes transferred overall
+  return 0.5*data->total_size;
+}
+
+
+double store_reg_adjacent_x2_p25_ilp1(const void* args) {
+  // ST1W (two register, adjacent, predicated), 25% active lanes
+  //
+  // Bytes per instruction: 128 (32 active), bytes per loop iteration: 128 (ILP=1)
+  const benchmark_data_t* data = args;
+
+  //printf("starting store_reg_adjacent_x2_p25_ilp1\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #8                                                 \n"
+    "whilelt pn8.s, xzr, x24, vlx2                               \n"
+    "1:                                                          \n"
+    "  mov x1, %[dst]                                            \n"
+    "  2:                                                        \n"
+    "    st1w {z0.s-z1.s}, pn8, [x1, 0, MUL VL]                  \n"
+    "                                                            \n"
+    "    add x1, x1, #128                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 2b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [dst] "r" (data->dst), [end] "r" (data->dst + data->size)
+    : "x0", "x1", "x24"
+  );
+
+  //printf("done store_reg_adjacent_x2_p25_ilp1\n");
+
+  // number of bytes transferred overall
+  return 0.25*data->total_size;
+}
+
+
+double copy_reg_adjacent_x2_ilp2(const void* args) {
+  // LD1W/ST1W (two register, adjacent, predicated)
+  //
+  // Bytes per instruction: 128, bytes per loop iteration: 256 (ILP=2)
+  const benchmark_data_t* data = args;
+  size_t size_aligned = data->size - (data->size % 256);
+
+  //printf("starting copy_reg_adjacent_x2_ilp2\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "ptrue pn8.s                                                 \n"
+    "1:                                                          \n"
+    "  mov x1, %[src]                                            \n"
+    "  mov x2, %[dst]                                            \n"
+    "  2:                                                        \n"
+    "    ld1w {z0.s-z1.s}, pn8/z, [x1, 0, MUL VL]                \n"
+    "    ld1w {z2.s-z3.s}, pn8/z, [x1, 2, MUL VL]                \n"
+    "                                                            \n"
+    "    st1w {z0.s-z1.s}, pn8, [x2, 0, MUL VL]                  \n"
+    "    st1w {z2.s-z3.s}, pn8, [x2, 2, MUL VL]                  \n"
+    "                                                            \n"
+    "    add x1, x1, #256                                        \n"
+    "    add x2, x2, #256                                        \n"
+    "    cmp x1, %[end_aligned]                                  \n"
+    "    b.lo 2b                                                 \n"
+    "    b 4f                                                    \n"
+    "  3:                                                        \n"
+    "    ld1w {z0.s-z1.s}, pn8/z, [x1, 0, MUL VL]                \n"
+    "    add x1, x1, #128                                        \n"
+    "    st1w {z0.s-z1.s}, pn8, [x2, 0, MUL VL]                  \n"
+    "    add x2, x2, #128                                        \n"
+    "  4:                                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 3b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [src] "r" (data->src), [dst] "r" (data->dst), [end] "r" (data->src + data->size), [end_aligned] "r" (data->src + size_aligned)
+    : "x0", "x1", "x2"
+  );
+
+  //printf("done copy_reg_adjacent_x2_ilp2\n");
+
+  // number of bytes transferred overall
+  return 2.0*data->total_size;
+}
+
+
+double copy_reg_adjacent_x2_p75_ilp6(const void* args) {
+  // LD1W/ST1W (two register, adjacent, predicated), 75% active lanes
+  //
+  // Bytes per instruction: 128 (96 active), bytes per loop iteration: 768 (ILP=6)
+  const benchmark_data_t* data = args;
+  size_t size_aligned = data->size - (data->size % 768);
+
+  //printf("starting copy_reg_adjacent_x2_p75_ilp6\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #24                                                \n"
+    "whilelt pn8.s, xzr, x24, vlx2                               \n"
+    "1:                                                          \n"
+    "  mov x1, %[src]                                            \n"
+    "  mov x2, %[dst]                                            \n"
+    "  2:                                                        \n"
+    "    ld1w {z0.s-z1.s}, pn8/z, [x1, 0, MUL VL]                \n"
+    "    ld1w {z2.s-z3.s}, pn8/z, [x1, 2, MUL VL]                \n"
+    "    ld1w {z4.s-z5.s}, pn8/z, [x1, 4, MUL VL]                \n"
+    "    ld1w {z6.s-z7.s}, pn8/z, [x1, 6, MUL VL]                \n"
+    "    ld1w {z8.s-z9.s}, pn8/z, [x1, 8, MUL VL]                \n"
+    "    ld1w {z10.s-z11.s}, pn8/z, [x1, 10, MUL VL]             \n"
+    "                                                            \n"
+    "    st1w {z0.s-z1.s}, pn8, [x2, 0, MUL VL]                  \n"
+    "    st1w {z2.s-z3.s}, pn8, [x2, 2, MUL VL]                  \n"
+    "    st1w {z4.s-z5.s}, pn8, [x2, 4, MUL VL]                  \n"
+    "    st1w {z6.s-z7.s}, pn8, [x2, 6, MUL VL]                  \n"
+    "    st1w {z8.s-z9.s}, pn8, [x2, 8, MUL VL]                  \n"
+    "    st1w {z10.s-z11.s}, pn8, [x2, 10, MUL VL]               \n"
+    "                                                            \n"
+    "    add x1, x1, #768                                        \n"
+    "    add x2, x2, #768                                        \n"
+    "    cmp x1, %[end_aligned]                                  \n"
+    "    b.lo 2b                                                 \n"
+    "    b 4f                                                    \n"
+    "  3:                                                        \n"
+    "    ld1w {z0.s-z1.s}, pn8/z, [x1, 0, MUL VL]                \n"
+    "    add x1, x1, #128                                        \n"
+    "    st1w {z0.s-z1.s}, pn8, [x2, 0, MUL VL]                  \n"
+    "    add x2, x2, #128                                        \n"
+    "  4:                                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 3b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [src] "r" (data->src), [dst] "r" (data->dst), [end] "r" (data->src + data->size), [end_aligned] "r" (data->src + size_aligned)
+    : "x0", "x1", "x2", "x24"
+  );
+
+  //printf("done copy_reg_adjacent_x2_p75_ilp6\n");
+
+  // number of bytes transferred overall
+  return 0.75*2.0*data->total_size;
+}
+
+
+double copy_reg_adjacent_x2_p50_ilp5(const void* args) {
+  // LD1W/ST1W (two register, adjacent, predicated), 50% active lanes
+  //
+  // Bytes per instruction: 128 (64 active), bytes per loop iteration: 640 (ILP=5)
+  const benchmark_data_t* data = args;
+  size_t size_aligned = data->size - (data->size % 640);
+
+  //printf("starting copy_reg_adjacent_x2_p50_ilp5\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #16                                                \n"
+    "whilelt pn8.s, xzr, x24, vlx2                               \n"
+    "1:                                                          \n"
+    "  mov x1, %[src]                                            \n"
+    "  mov x2, %[dst]                                            \n"
+    "  2:                                                        \n"
+    "    ld1w {z0.s-z1.s}, pn8/z, [x1, 0, MUL VL]                \n"
+    "    ld1w {z2.s-z3.s}, pn8/z, [x1, 2, MUL VL]                \n"
+    "    ld1w {z4.s-z5.s}, pn8/z, [x1, 4, MUL VL]                \n"
+    "    ld1w {z6.s-z7.s}, pn8/z, [x1, 6, MUL VL]                \n"
+    "    ld1w {z8.s-z9.s}, pn8/z, [x1, 8, MUL VL]                \n"
+    "                                                            \n"
+    "    st1w {z0.s-z1.s}, pn8, [x2, 0, MUL VL]                  \n"
+    "    st1w {z2.s-z3.s}, pn8, [x2, 2, MUL VL]                  \n"
+    "    st1w {z4.s-z5.s}, pn8, [x2, 4, MUL VL]                  \n"
+    "    st1w {z6.s-z7.s}, pn8, [x2, 6, MUL VL]                  \n"
+    "    st1w {z8.s-z9.s}, pn8, [x2, 8, MUL VL]                  \n"
+    "                                                            \n"
+    "    add x1, x1, #640                                        \n"
+    "    add x2, x2, #640                                        \n"
+    "    cmp x1, %[end_aligned]                                  \n"
+    "    b.lo 2b                                                 \n"
+    "    b 4f                                                    \n"
+    "  3:                                                        \n"
+    "    ld1w {z0.s-z1.s}, pn8/z, [x1, 0, MUL VL]                \n"
+    "    add x1, x1, #128                                        \n"
+    "    st1w {z0.s-z1.s}, pn8, [x2, 0, MUL VL]                  \n"
+    "    add x2, x2, #128                                        \n"
+    "  4:                                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 3b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [src] "r" (data->src), [dst] "r" (data->dst), [end] "r" (data->src + data->size), [end_aligned] "r" (data->src + size_aligned)
+    : "x0", "x1", "x2", "x24"
+  );
+
+  //printf("done copy_reg_adjacent_x2_p50_ilp5\n");
+
+  // number of bytes transferred overall
+  return 0.5*2.0*data->total_size;
+}
+
+
+double copy_reg_adjacent_x2_p25_ilp3(const void* args) {
+  // LD1W/ST1W (two register, adjacent, predicated), 25% active lanes
+  //
+  // Bytes per instruction: 128 (32 active), bytes per loop iteration: 384 (ILP=3)
+  const benchmark_data_t* data = args;
+  size_t size_aligned = data->size - (data->size % 384);
+
+  //printf("starting copy_reg_adjacent_x2_p25_ilp3\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #8                                                 \n"
+    "whilelt pn8.s, xzr, x24, vlx2                               \n"
+    "1:                                                          \n"
+    "  mov x1, %[src]                                            \n"
+    "  mov x2, %[dst]                                            \n"
+    "  2:                                                        \n"
+    "    ld1w {z0.s-z1.s}, pn8/z, [x1, 0, MUL VL]                \n"
+    "    ld1w {z2.s-z3.s}, pn8/z, [x1, 2, MUL VL]                \n"
+    "    ld1w {z4.s-z5.s}, pn8/z, [x1, 4, MUL VL]                \n"
+    "                                                            \n"
+    "    st1w {z0.s-z1.s}, pn8, [x2, 0, MUL VL]                  \n"
+    "    st1w {z2.s-z3.s}, pn8, [x2, 2, MUL VL]                  \n"
+    "    st1w {z4.s-z5.s}, pn8, [x2, 4, MUL VL]                  \n"
+    "                                                            \n"
+    "    add x1, x1, #384                                        \n"
+    "    add x2, x2, #384                                        \n"
+    "    cmp x1, %[end_aligned]                                  \n"
+    "    b.lo 2b                                                 \n"
+    "    b 4f                                                    \n"
+    "  3:                                                        \n"
+    "    ld1w {z0.s-z1.s}, pn8/z, [x1, 0, MUL VL]                \n"
+    "    add x1, x1, #128                                        \n"
+    "    st1w {z0.s-z1.s}, pn8, [x2, 0, MUL VL]                  \n"
+    "    add x2, x2, #128                                        \n"
+    "  4:                                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 3b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [src] "r" (data->src), [dst] "r" (data->dst), [end] "r" (data->src + data->size), [end_aligned] "r" (data->src + size_aligned)
+    : "x0", "x1", "x2", "x24"
+  );
+
+  //printf("done copy_reg_adjacent_x2_p25_ilp3\n");
+
+  // number of bytes transferred overall
+  return 0.25*2.0*data->total_size;
+}
+
+
+double copy_reg_adjacent_x2_p25_ilp8(const void* args) {
+  // LD1W/ST1W (two register, adjacent, predicated), 25% active lanes
+  //
+  // Bytes per instruction: 128 (32 active), bytes per loop iteration: 1024 (ILP=8)
+  const benchmark_data_t* data = args;
+  size_t size_aligned = data->size - (data->size % 1024);
+
+  //printf("starting copy_reg_adjacent_x2_p25_ilp8\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #8                                                 \n"
+    "whilelt pn8.s, xzr, x24, vlx2                               \n"
+    "1:                                                          \n"
+    "  mov x1, %[src]                                            \n"
+    "  mov x2, %[dst]                                            \n"
+    "  2:                                                        \n"
+    "    ld1w {z0.s-z1.s}, pn8/z, [x1, 0, MUL VL]                \n"
+    "    ld1w {z2.s-z3.s}, pn8/z, [x1, 2, MUL VL]                \n"
+    "    ld1w {z4.s-z5.s}, pn8/z, [x1, 4, MUL VL]                \n"
+    "    ld1w {z6.s-z7.s}, pn8/z, [x1, 6, MUL VL]                \n"
+    "    ld1w {z8.s-z9.s}, pn8/z, [x1, 8, MUL VL]                \n"
+    "    ld1w {z10.s-z11.s}, pn8/z, [x1, 10, MUL VL]             \n"
+    "    ld1w {z12.s-z13.s}, pn8/z, [x1, 12, MUL VL]             \n"
+    "    ld1w {z14.s-z15.s}, pn8/z, [x1, 14, MUL VL]             \n"
+    "                                                            \n"
+    "    st1w {z0.s-z1.s}, pn8, [x2, 0, MUL VL]                  \n"
+    "    st1w {z2.s-z3.s}, pn8, [x2, 2, MUL VL]                  \n"
+    "    st1w {z4.s-z5.s}, pn8, [x2, 4, MUL VL]                  \n"
+    "    st1w {z6.s-z7.s}, pn8, [x2, 6, MUL VL]                  \n"
+    "    st1w {z8.s-z9.s}, pn8, [x2, 8, MUL VL]                  \n"
+    "    st1w {z10.s-z11.s}, pn8, [x2, 10, MUL VL]               \n"
+    "    st1w {z12.s-z13.s}, pn8, [x2, 12, MUL VL]               \n"
+    "    st1w {z14.s-z15.s}, pn8, [x2, 14, MUL VL]               \n"
+    "                                                            \n"
+    "    add x1, x1, #1024                                       \n"
+    "    add x2, x2, #1024                                       \n"
+    "    cmp x1, %[end_aligned]                                  \n"
+    "    b.lo 2b                                                 \n"
+    "    b 4f                                                    \n"
+    "  3:                                                        \n"
+    "    ld1w {z0.s-z1.s}, pn8/z, [x1, 0, MUL VL]                \n"
+    "    add x1, x1, #128                                        \n"
+    "    st1w {z0.s-z1.s}, pn8, [x2, 0, MUL VL]                  \n"
+    "    add x2, x2, #128                                        \n"
+    "  4:                                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 3b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [src] "r" (data->src), [dst] "r" (data->dst), [end] "r" (data->src + data->size), [end_aligned] "r" (data->src + size_aligned)
+    : "x0", "x1", "x2", "x24"
+  );
+
+  //printf("done copy_reg_adjacent_x2_p25_ilp8\n");
+
+  // number of bytes transferred overall
+  return 0.25*2.0*data->total_size;
+}
+
+
+double load_reg_adjacent_x4_ilp5(const void* args) {
+  // LD1W (four register, adjacent, predicated)
+  //
+  // Bytes per instruction: 256, bytes per loop iteration: 1280 (ILP=5)
+  const benchmark_data_t* data = args;
+  size_t size_aligned = data->size - (data->size % 1280);
+
+  //printf("starting load_reg_adjacent_x4_ilp5\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "ptrue pn8.s                                                 \n"
+    "1:                                                          \n"
+    "  mov x1, %[src]                                            \n"
+    "  2:                                                        \n"
+    "    ld1w {z0.s-z3.s}, pn8/z, [x1, 0, MUL VL]                \n"
+    "    ld1w {z4.s-z7.s}, pn8/z, [x1, 4, MUL VL]                \n"
+    "    ld1w {z8.s-z11.s}, pn8/z, [x1, 8, MUL VL]               \n"
+    "    ld1w {z12.s-z15.s}, pn8/z, [x1, 12, MUL VL]             \n"
+    "    ld1w {z16.s-z19.s}, pn8/z, [x1, 16, MUL VL]             \n"
+    "                                                            \n"
+    "    add x1, x1, #1280                                       \n"
+    "    cmp x1, %[end_aligned]                                  \n"
+    "    b.lo 2b                                                 \n"
+    "    b 4f                                                    \n"
+    "  3:                                                        \n"
+    "    ld1w {z0.s-z3.s}, pn8/z, [x1, 0, MUL VL]                \n"
+    "    add x1, x1, #256                                        \n"
+    "  4:                                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 3b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [src] "r" (data->src), [end] "r" (data->src + data->size), [end_aligned] "r" (data->src + size_aligned)
+    : "x0", "x1"
+  );
+
+  //printf("done load_reg_adjacent_x4_ilp5\n");
+
+  // number of bytes transferred overall
+  return data->total_size;
+}
+
+
+double load_reg_adjacent_x4_p75_ilp2(const void* args) {
+  // LD1W (four register, adjacent, predicated), 75% active lanes
+  //
+  // Bytes per instruction: 256 (192 active), bytes per loop iteration: 512 (ILP=2)
+  const benchmark_data_t* data = args;
+  size_t size_aligned = data->size - (data->size % 512);
+
+  //printf("starting load_reg_adjacent_x4_p75_ilp2\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #48                                                \n"
+    "whilelt pn8.s, xzr, x24, vlx4                               \n"
+    "1:                                                          \n"
+    "  mov x1, %[src]                                            \n"
+    "  2:                                                        \n"
+    "    ld1w {z0.s-z3.s}, pn8/z, [x1, 0, MUL VL]                \n"
+    "    ld1w {z4.s-z7.s}, pn8/z, [x1, 4, MUL VL]                \n"
+    "                                                            \n"
+    "    add x1, x1, #512                                        \n"
+    "    cmp x1, %[end_aligned]                                  \n"
+    "    b.lo 2b                                                 \n"
+    "    b 4f                                                    \n"
+    "  3:                                                        \n"
+    "    ld1w {z0.s-z3.s}, pn8/z, [x1, 0, MUL VL]                \n"
+    "    add x1, x1, #256                                        \n"
+    "  4:                                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 3b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [src] "r" (data->src), [end] "r" (data->src + data->size), [end_aligned] "r" (data->src + size_aligned)
+    : "x0", "x1", "x24"
+  );
+
+  //printf("done load_reg_adjacent_x4_p75_ilp2\n");
+
+  // number of bytes transferred overall
+  return 0.75*data->total_size;
+}
+
+
+double load_reg_adjacent_x4_p50_ilp1(const void* args) {
+  // LD1W (four register, adjacent, predicated), 50% active lanes
+  //
+  // Bytes per instruction: 256 (128 active), bytes per loop iteration: 256 (ILP=1)
+  const benchmark_data_t* data = args;
+
+  //printf("starting load_reg_adjacent_x4_p50_ilp1\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #32                                                \n"
+    "whilelt pn8.s, xzr, x24, vlx4                               \n"
+    "1:                                                          \n"
+    "  mov x1, %[src]                                            \n"
+    "  2:                                                        \n"
+    "    ld1w {z0.s-z3.s}, pn8/z, [x1, 0, MUL VL]                \n"
+    "                                                            \n"
+    "    add x1, x1, #256                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 2b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [src] "r" (data->src), [end] "r" (data->src + data->size)
+    : "x0", "x1", "x24"
+  );
+
+  //printf("done load_reg_adjacent_x4_p50_ilp1\n");
+
+  // number of bytes transferred overall
+  return 0.5*data->total_size;
+}
+
+
+double load_reg_adjacent_x4_p25_ilp7(const void* args) {
+  // LD1W (four register, adjacent, predicated), 25% active lanes
+  //
+  // Bytes per instruction: 256 (64 active), bytes per loop iteration: 1792 (ILP=7)
+  const benchmark_data_t* data = args;
+  size_t size_aligned = data->size - (data->size % 1792);
+
+  //printf("starting load_reg_adjacent_x4_p25_ilp7\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #16                                                \n"
+    "whilelt pn8.s, xzr, x24, vlx4                               \n"
+    "1:                                                          \n"
+    "  mov x1, %[src]                                            \n"
+    "  2:                                                        \n"
+    "    ld1w {z0.s-z3.s}, pn8/z, [x1, 0, MUL VL]                \n"
+    "    ld1w {z4.s-z7.s}, pn8/z, [x1, 4, MUL VL]                \n"
+    "    ld1w {z8.s-z11.s}, pn8/z, [x1, 8, MUL VL]               \n"
+    "    ld1w {z12.s-z15.s}, pn8/z, [x1, 12, MUL VL]             \n"
+    "    ld1w {z16.s-z19.s}, pn8/z, [x1, 16, MUL VL]             \n"
+    "    ld1w {z20.s-z23.s}, pn8/z, [x1, 20, MUL VL]             \n"
+    "    ld1w {z24.s-z27.s}, pn8/z, [x1, 24, MUL VL]             \n"
+    "                                                            \n"
+    "    add x1, x1, #1792                                       \n"
+    "    cmp x1, %[end_aligned]                                  \n"
+    "    b.lo 2b                                                 \n"
+    "    b 4f                                                    \n"
+    "  3:                                                        \n"
+    "    ld1w {z0.s-z3.s}, pn8/z, [x1, 0, MUL VL]                \n"
+    "    add x1, x1, #256                                        \n"
+    "  4:                                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 3b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [src] "r" (data->src), [end] "r" (data->src + data->size), [end_aligned] "r" (data->src + size_aligned)
+    : "x0", "x1", "x24"
+  );
+
+  //printf("done load_reg_adjacent_x4_p25_ilp7\n");
+
+  // number of bytes transferred overall
+  return 0.25*data->total_size;
+}
+
+
+double store_reg_adjacent_x4_p75_ilp1(const void* args) {
+  // ST1W (four register, adjacent, predicated), 75% active lanes
+  //
+  // Bytes per instruction: 256 (192 active), bytes per loop iteration: 256 (ILP=1)
+  const benchmark_data_t* data = args;
+
+  //printf("starting store_reg_adjacent_x4_p75_ilp1\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #48                                                \n"
+    "whilelt pn8.s, xzr, x24, vlx4                               \n"
+    "1:                                                          \n"
+    "  mov x1, %[dst]                                            \n"
+    "  2:                                                        \n"
+    "    st1w {z0.s-z3.s}, pn8, [x1, 0, MUL VL]                  \n"
+    "                                                            \n"
+    "    add x1, x1, #256                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 2b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [dst] "r" (data->dst), [end] "r" (data->dst + data->size)
+    : "x0", "x1", "x24"
+  );
+
+  //printf("done store_reg_adjacent_x4_p75_ilp1\n");
+
+  // number of bytes transferred overall
+  return 0.75*data->total_size;
+}
+
+
+double store_reg_adjacent_x4_p50_ilp2(const void* args) {
+  // ST1W (four register, adjacent, predicated), 50% active lanes
+  //
+  // Bytes per instruction: 256 (128 active), bytes per loop iteration: 512 (ILP=2)
+  const benchmark_data_t* data = args;
+  size_t size_aligned = data->size - (data->size % 512);
+
+  //printf("starting store_reg_adjacent_x4_p50_ilp2\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #32                                                \n"
+    "whilelt pn8.s, xzr, x24, vlx4                               \n"
+    "1:                                                          \n"
+    "  mov x1, %[dst]                                            \n"
+    "  2:                                                        \n"
+    "    st1w {z0.s-z3.s}, pn8, [x1, 0, MUL VL]                  \n"
+    "    st1w {z4.s-z7.s}, pn8, [x1, 4, MUL VL]                  \n"
+    "                                                            \n"
+    "    add x1, x1, #512                                        \n"
+    "    cmp x1, %[end_aligned]                                  \n"
+    "    b.lo 2b                                                 \n"
+    "    b 4f                                                    \n"
+    "  3:                                                        \n"
+    "    st1w {z0.s-z3.s}, pn8, [x1, 0, MUL VL]                  \n"
+    "    add x1, x1, #256                                        \n"
+    "  4:                                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 3b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [dst] "r" (data->dst), [end] "r" (data->dst + data->size), [end_aligned] "r" (data->dst + size_aligned)
+    : "x0", "x1", "x24"
+  );
+
+  //printf("done store_reg_adjacent_x4_p50_ilp2\n");
+
+  // number of bytes transferred overall
+  return 0.5*data->total_size;
+}
+
+
+double store_reg_adjacent_x4_p25_ilp4(const void* args) {
+  // ST1W (four register, adjacent, predicated), 25% active lanes
+  //
+  // Bytes per instruction: 256 (64 active), bytes per loop iteration: 1024 (ILP=4)
+  const benchmark_data_t* data = args;
+  size_t size_aligned = data->size - (data->size % 1024);
+
+  //printf("starting store_reg_adjacent_x4_p25_ilp4\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #16                                                \n"
+    "whilelt pn8.s, xzr, x24, vlx4                               \n"
+    "1:                                                          \n"
+    "  mov x1, %[dst]                                            \n"
+    "  2:                                                        \n"
+    "    st1w {z0.s-z3.s}, pn8, [x1, 0, MUL VL]                  \n"
+    "    st1w {z4.s-z7.s}, pn8, [x1, 4, MUL VL]                  \n"
+    "    st1w {z8.s-z11.s}, pn8, [x1, 8, MUL VL]                 \n"
+    "    st1w {z12.s-z15.s}, pn8, [x1, 12, MUL VL]               \n"
+    "                                                            \n"
+    "    add x1, x1, #1024                                       \n"
+    "    cmp x1, %[end_aligned]                                  \n"
+    "    b.lo 2b                                                 \n"
+    "    b 4f                                                    \n"
+    "  3:                                                        \n"
+    "    st1w {z0.s-z3.s}, pn8, [x1, 0, MUL VL]                  \n"
+    "    add x1, x1, #256                                        \n"
+    "  4:                                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 3b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [dst] "r" (data->dst), [end] "r" (data->dst + data->size), [end_aligned] "r" (data->dst + size_aligned)
+    : "x0", "x1", "x24"
+  );
+
+  //printf("done store_reg_adjacent_x4_p25_ilp4\n");
+
+  // number of bytes transferred overall
+  return 0.25*data->total_size;
+}
+
+
+double copy_reg_adjacent_x4_ilp4(const void* args) {
+  // LD1W/ST1W (four register, adjacent, predicated)
+  //
+  // Bytes per instruction: 256, bytes per loop iteration: 1024 (ILP=4)
+  const benchmark_data_t* data = args;
+  size_t size_aligned = data->size - (data->size % 1024);
+
+  //printf("starting copy_reg_adjacent_x4_ilp4\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "ptrue pn8.s                                                 \n"
+    "1:                                                          \n"
+    "  mov x1, %[src]                                            \n"
+    "  mov x2, %[dst]                                            \n"
+    "  2:                                                        \n"
+    "    ld1w {z0.s-z3.s}, pn8/z, [x1, 0, MUL VL]                \n"
+    "    ld1w {z4.s-z7.s}, pn8/z, [x1, 4, MUL VL]                \n"
+    "    ld1w {z8.s-z11.s}, pn8/z, [x1, 8, MUL VL]               \n"
+    "    ld1w {z12.s-z15.s}, pn8/z, [x1, 12, MUL VL]             \n"
+    "                                                            \n"
+    "    st1w {z0.s-z3.s}, pn8, [x2, 0, MUL VL]                  \n"
+    "    st1w {z4.s-z7.s}, pn8, [x2, 4, MUL VL]                  \n"
+    "    st1w {z8.s-z11.s}, pn8, [x2, 8, MUL VL]                 \n"
+    "    st1w {z12.s-z15.s}, pn8, [x2, 12, MUL VL]               \n"
+    "                                                            \n"
+    "    add x1, x1, #1024                                       \n"
+    "    add x2, x2, #1024                                       \n"
+    "    cmp x1, %[end_aligned]                                  \n"
+    "    b.lo 2b                                                 \n"
+    "    b 4f                                                    \n"
+    "  3:                                                        \n"
+    "    ld1w {z0.s-z3.s}, pn8/z, [x1, 0, MUL VL]                \n"
+    "    add x1, x1, #256                                        \n"
+    "    st1w {z0.s-z3.s}, pn8, [x2, 0, MUL VL]                  \n"
+    "    add x2, x2, #256                                        \n"
+    "  4:                                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 3b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [src] "r" (data->src), [dst] "r" (data->dst), [end] "r" (data->src + data->size), [end_aligned] "r" (data->src + size_aligned)
+    : "x0", "x1", "x2"
+  );
+
+  //printf("done copy_reg_adjacent_x4_ilp4\n");
+
+  // number of bytes transferred overall
+  return 2.0*data->total_size;
+}
+
+
+double copy_reg_adjacent_x4_p75_ilp3(const void* args) {
+  // LD1W/ST1W (four register, adjacent, predicated), 75% active lanes
+  //
+  // Bytes per instruction: 256 (192 active), bytes per loop iteration: 768 (ILP=3)
+  const benchmark_data_t* data = args;
+  size_t size_aligned = data->size - (data->size % 768);
+
+  //printf("starting copy_reg_adjacent_x4_p75_ilp3\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #48                                                \n"
+    "whilelt pn8.s, xzr, x24, vlx4                               \n"
+    "1:                                                          \n"
+    "  mov x1, %[src]                                            \n"
+    "  mov x2, %[dst]                                            \n"
+    "  2:                                                        \n"
+    "    ld1w {z0.s-z3.s}, pn8/z, [x1, 0, MUL VL]                \n"
+    "    ld1w {z4.s-z7.s}, pn8/z, [x1, 4, MUL VL]                \n"
+    "    ld1w {z8.s-z11.s}, pn8/z, [x1, 8, MUL VL]               \n"
+    "                                                            \n"
+    "    st1w {z0.s-z3.s}, pn8, [x2, 0, MUL VL]                  \n"
+    "    st1w {z4.s-z7.s}, pn8, [x2, 4, MUL VL]                  \n"
+    "    st1w {z8.s-z11.s}, pn8, [x2, 8, MUL VL]                 \n"
+    "                                                            \n"
+    "    add x1, x1, #768                                        \n"
+    "    add x2, x2, #768                                        \n"
+    "    cmp x1, %[end_aligned]                                  \n"
+    "    b.lo 2b                                                 \n"
+    "    b 4f                                                    \n"
+    "  3:                                                        \n"
+    "    ld1w {z0.s-z3.s}, pn8/z, [x1, 0, MUL VL]                \n"
+    "    add x1, x1, #256                                        \n"
+    "    st1w {z0.s-z3.s}, pn8, [x2, 0, MUL VL]                  \n"
+    "    add x2, x2, #256                                        \n"
+    "  4:                                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 3b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [src] "r" (data->src), [dst] "r" (data->dst), [end] "r" (data->src + data->size), [end_aligned] "r" (data->src + size_aligned)
+    : "x0", "x1", "x2", "x24"
+  );
+
+  //printf("done copy_reg_adjacent_x4_p75_ilp3\n");
+
+  // number of bytes transferred overall
+  return 0.75*2.0*data->total_size;
+}
+
+
+double copy_reg_adjacent_x4_p75_ilp8(const void* args) {
+  // LD1W/ST1W (four register, adjacent, predicated), 75% active lanes
+  //
+  // Bytes per instruction: 256 (192 active), bytes per loop iteration: 2048 (ILP=8)
+  const benchmark_data_t* data = args;
+  size_t size_aligned = data->size - (data->size % 2048);
+
+  //printf("starting copy_reg_adjacent_x4_p75_ilp8\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #48                                                \n"
+    "whilelt pn8.s, xzr, x24, vlx4                               \n"
+    "1:                                                          \n"
+    "  mov x1, %[src]                                            \n"
+    "  mov x2, %[dst]                                            \n"
+    "  2:                                                        \n"
+    "    ld1w {z0.s-z3.s}, pn8/z, [x1, 0, MUL VL]                \n"
+    "    ld1w {z4.s-z7.s}, pn8/z, [x1, 4, MUL VL]                \n"
+    "    ld1w {z8.s-z11.s}, pn8/z, [x1, 8, MUL VL]               \n"
+    "    ld1w {z12.s-z15.s}, pn8/z, [x1, 12, MUL VL]             \n"
+    "    ld1w {z16.s-z19.s}, pn8/z, [x1, 16, MUL VL]             \n"
+    "    ld1w {z20.s-z23.s}, pn8/z, [x1, 20, MUL VL]             \n"
+    "    ld1w {z24.s-z27.s}, pn8/z, [x1, 24, MUL VL]             \n"
+    "    ld1w {z28.s-z31.s}, pn8/z, [x1, 28, MUL VL]             \n"
+    "                                                            \n"
+    "    st1w {z0.s-z3.s}, pn8, [x2, 0, MUL VL]                  \n"
+    "    st1w {z4.s-z7.s}, pn8, [x2, 4, MUL VL]                  \n"
+    "    st1w {z8.s-z11.s}, pn8, [x2, 8, MUL VL]                 \n"
+    "    st1w {z12.s-z15.s}, pn8, [x2, 12, MUL VL]               \n"
+    "    st1w {z16.s-z19.s}, pn8, [x2, 16, MUL VL]               \n"
+    "    st1w {z20.s-z23.s}, pn8, [x2, 20, MUL VL]               \n"
+    "    st1w {z24.s-z27.s}, pn8, [x2, 24, MUL VL]               \n"
+    "    st1w {z28.s-z31.s}, pn8, [x2, 28, MUL VL]               \n"
+    "                                                            \n"
+    "    add x1, x1, #2048                                       \n"
+    "    add x2, x2, #2048                                       \n"
+    "    cmp x1, %[end_aligned]                                  \n"
+    "    b.lo 2b                                                 \n"
+    "    b 4f                                                    \n"
+    "  3:                                                        \n"
+    "    ld1w {z0.s-z3.s}, pn8/z, [x1, 0, MUL VL]                \n"
+    "    add x1, x1, #256                                        \n"
+    "    st1w {z0.s-z3.s}, pn8, [x2, 0, MUL VL]                  \n"
+    "    add x2, x2, #256                                        \n"
+    "  4:                                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 3b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [src] "r" (data->src), [dst] "r" (data->dst), [end] "r" (data->src + data->size), [end_aligned] "r" (data->src + size_aligned)
+    : "x0", "x1", "x2", "x24"
+  );
+
+  //printf("done copy_reg_adjacent_x4_p75_ilp8\n");
+
+  // number of bytes transferred overall
+  return 0.75*2.0*data->total_size;
+}
+
+
+double copy_reg_adjacent_x4_p25_ilp6(const void* args) {
+  // LD1W/ST1W (four register, adjacent, predicated), 25% active lanes
+  //
+  // Bytes per instruction: 256 (64 active), bytes per loop iteration: 1536 (ILP=6)
+  const benchmark_data_t* data = args;
+  size_t size_aligned = data->size - (data->size % 1536);
+
+  //printf("starting copy_reg_adjacent_x4_p25_ilp6\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #16                                                \n"
+    "whilelt pn8.s, xzr, x24, vlx4                               \n"
+    "1:                                                          \n"
+    "  mov x1, %[src]                                            \n"
+    "  mov x2, %[dst]                                            \n"
+    "  2:                                                        \n"
+    "    ld1w {z0.s-z3.s}, pn8/z, [x1, 0, MUL VL]                \n"
+    "    ld1w {z4.s-z7.s}, pn8/z, [x1, 4, MUL VL]                \n"
+    "    ld1w {z8.s-z11.s}, pn8/z, [x1, 8, MUL VL]               \n"
+    "    ld1w {z12.s-z15.s}, pn8/z, [x1, 12, MUL VL]             \n"
+    "    ld1w {z16.s-z19.s}, pn8/z, [x1, 16, MUL VL]             \n"
+    "    ld1w {z20.s-z23.s}, pn8/z, [x1, 20, MUL VL]             \n"
+    "                                                            \n"
+    "    st1w {z0.s-z3.s}, pn8, [x2, 0, MUL VL]                  \n"
+    "    st1w {z4.s-z7.s}, pn8, [x2, 4, MUL VL]                  \n"
+    "    st1w {z8.s-z11.s}, pn8, [x2, 8, MUL VL]                 \n"
+    "    st1w {z12.s-z15.s}, pn8, [x2, 12, MUL VL]               \n"
+    "    st1w {z16.s-z19.s}, pn8, [x2, 16, MUL VL]               \n"
+    "    st1w {z20.s-z23.s}, pn8, [x2, 20, MUL VL]               \n"
+    "                                                            \n"
+    "    add x1, x1, #1536                                       \n"
+    "    add x2, x2, #1536                                       \n"
+    "    cmp x1, %[end_aligned]                                  \n"
+    "    b.lo 2b                                                 \n"
+    "    b 4f                                                    \n"
+    "  3:                                                        \n"
+    "    ld1w {z0.s-z3.s}, pn8/z, [x1, 0, MUL VL]                \n"
+    "    add x1, x1, #256                                        \n"
+    "    st1w {z0.s-z3.s}, pn8, [x2, 0, MUL VL]                  \n"
+    "    add x2, x2, #256                                        \n"
+    "  4:                                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 3b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [src] "r" (data->src), [dst] "r" (data->dst), [end] "r" (data->src + data->size), [end_aligned] "r" (data->src + size_aligned)
+    : "x0", "x1", "x2", "x24"
+  );
+
+  //printf("done copy_reg_adjacent_x4_p25_ilp6\n");
+
+  // number of bytes transferred overall
+  return 0.25*2.0*data->total_size;
+}
+
+
+double load_reg_strided_x2_ilp1(const void* args) {
+  // LD1W (two register, strided, predicated)
+  //
+  // Bytes per instruction: 128, bytes per loop iteration: 128 (ILP=1)
+  const benchmark_data_t* data = args;
+
+  //printf("starting load_reg_strided_x2_ilp1\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "ptrue pn8.s                                                 \n"
+    "1:                                                          \n"
+    "  mov x1, %[src]                                            \n"
+    "  2:                                                        \n"
+    "    ld1w {z0.s, z8.s}, pn8/z, [x1, 0, MUL VL]               \n"
+    "                                                            \n"
+    "    add x1, x1, #128                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 2b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [src] "r" (data->src), [end] "r" (data->src + data->size)
+    : "x0", "x1"
+  );
+
+  //printf("done load_reg_strided_x2_ilp1\n");
+
+  // number of bytes transferred overall
+  return data->total_size;
+}
+
+
+double load_reg_strided_x2_p75_ilp4(const void* args) {
+  // LD1W (two register, strided, predicated), 75% active lanes
+  //
+  // Bytes per instruction: 128 (96 active), bytes per loop iteration: 512 (ILP=4)
+  const benchmark_data_t* data = args;
+  size_t size_aligned = data->size - (data->size % 512);
+
+  //printf("starting load_reg_strided_x2_p75_ilp4\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #24                                                \n"
+    "whilelt pn8.s, xzr, x24, vlx2                               \n"
+    "1:                                                          \n"
+    "  mov x1, %[src]                                            \n"
+    "  2:                                                        \n"
+    "    ld1w {z0.s, z8.s}, pn8/z, [x1, 0, MUL VL]               \n"
+    "    ld1w {z1.s, z9.s}, pn8/z, [x1, 2, MUL VL]               \n"
+    "    ld1w {z2.s, z10.s}, pn8/z, [x1, 4, MUL VL]              \n"
+    "    ld1w {z3.s, z11.s}, pn8/z, [x1, 6, MUL VL]              \n"
+    "                                                            \n"
+    "    add x1, x1, #512                                        \n"
+    "    cmp x1, %[end_aligned]                                  \n"
+    "    b.lo 2b                                                 \n"
+    "    b 4f                                                    \n"
+    "  3:                                                        \n"
+    "    ld1w {z0.s, z8.s}, pn8/z, [x1, 0, MUL VL]               \n"
+    "    add x1, x1, #128                                        \n"
+    "  4:                                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 3b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [src] "r" (data->src), [end] "r" (data->src + data->size), [end_aligned] "r" (data->src + size_aligned)
+    : "x0", "x1", "x24"
+  );
+
+  //printf("done load_reg_strided_x2_p75_ilp4\n");
+
+  // number of bytes transferred overall
+  return 0.75*data->total_size;
+}
+
+
+double load_reg_strided_x2_p50_ilp7(const void* args) {
+  // LD1W (two register, strided, predicated), 50% active lanes
+  //
+  // Bytes per instruction: 128 (64 active), bytes per loop iteration: 896 (ILP=7)
+  const benchmark_data_t* data = args;
+  size_t size_aligned = data->size - (data->size % 896);
+
+  //printf("starting load_reg_strided_x2_p50_ilp7\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #16                                                \n"
+    "whilelt pn8.s, xzr, x24, vlx2                               \n"
+    "1:                                                          \n"
+    "  mov x1, %[src]                                            \n"
+    "  2:                                                        \n"
+    "    ld1w {z0.s, z8.s}, pn8/z, [x1, 0, MUL VL]               \n"
+    "    ld1w {z1.s, z9.s}, pn8/z, [x1, 2, MUL VL]               \n"
+    "    ld1w {z2.s, z10.s}, pn8/z, [x1, 4, MUL VL]              \n"
+    "    ld1w {z3.s, z11.s}, pn8/z, [x1, 6, MUL VL]              \n"
+    "    ld1w {z4.s, z12.s}, pn8/z, [x1, 8, MUL VL]              \n"
+    "    ld1w {z5.s, z13.s}, pn8/z, [x1, 10, MUL VL]             \n"
+    "    ld1w {z6.s, z14.s}, pn8/z, [x1, 12, MUL VL]             \n"
+    "                                                            \n"
+    "    add x1, x1, #896                                        \n"
+    "    cmp x1, %[end_aligned]                                  \n"
+    "    b.lo 2b                                                 \n"
+    "    b 4f                                                    \n"
+    "  3:                                                        \n"
+    "    ld1w {z0.s, z8.s}, pn8/z, [x1, 0, MUL VL]               \n"
+    "    add x1, x1, #128                                        \n"
+    "  4:                                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 3b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [src] "r" (data->src), [end] "r" (data->src + data->size), [end_aligned] "r" (data->src + size_aligned)
+    : "x0", "x1", "x24"
+  );
+
+  //printf("done load_reg_strided_x2_p50_ilp7\n");
+
+  // number of bytes transferred overall
+  return 0.5*data->total_size;
+}
+
+
+double load_reg_strided_x2_p25_ilp1(const void* args) {
+  // LD1W (two register, strided, predicated), 25% active lanes
+  //
+  // Bytes per instruction: 128 (32 active), bytes per loop iteration: 128 (ILP=1)
+  const benchmark_data_t* data = args;
+
+  //printf("starting load_reg_strided_x2_p25_ilp1\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #8                                                 \n"
+    "whilelt pn8.s, xzr, x24, vlx2                               \n"
+    "1:                                                          \n"
+    "  mov x1, %[src]                                            \n"
+    "  2:                                                        \n"
+    "    ld1w {z0.s, z8.s}, pn8/z, [x1, 0, MUL VL]               \n"
+    "                                                            \n"
+    "    add x1, x1, #128                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 2b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [src] "r" (data->src), [end] "r" (data->src + data->size)
+    : "x0", "x1", "x24"
+  );
+
+  //printf("done load_reg_strided_x2_p25_ilp1\n");
+
+  // number of bytes transferred overall
+  return 0.25*data->total_size;
+}
+
+
+double store_reg_strided_x2_ilp6(const void* args) {
+  // ST1W (two register, strided, predicated)
+  //
+  // Bytes per instruction: 128, bytes per loop iteration: 768 (ILP=6)
+  const benchmark_data_t* data = args;
+  size_t size_aligned = data->size - (data->size % 768);
+
+  //printf("starting store_reg_strided_x2_ilp6\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "ptrue pn8.s                                                 \n"
+    "1:                                                          \n"
+    "  mov x1, %[dst]                                            \n"
+    "  2:                                                        \n"
+    "    st1w {z0.s, z8.s}, pn8, [x1, 0, MUL VL]                 \n"
+    "    st1w {z1.s, z9.s}, pn8, [x1, 2, MUL VL]                 \n"
+    "    st1w {z2.s, z10.s}, pn8, [x1, 4, MUL VL]                \n"
+    "    st1w {z3.s, z11.s}, pn8, [x1, 6, MUL VL]                \n"
+    "    st1w {z4.s, z12.s}, pn8, [x1, 8, MUL VL]                \n"
+    "    st1w {z5.s, z13.s}, pn8, [x1, 10, MUL VL]               \n"
+    "                                                            \n"
+    "    add x1, x1, #768                                        \n"
+    "    cmp x1, %[end_aligned]                                  \n"
+    "    b.lo 2b                                                 \n"
+    "    b 4f                                                    \n"
+    "  3:                                                        \n"
+    "    st1w {z0.s, z8.s}, pn8, [x1, 0, MUL VL]                 \n"
+    "    add x1, x1, #128                                        \n"
+    "  4:                                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 3b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [dst] "r" (data->dst), [end] "r" (data->dst + data->size), [end_aligned] "r" (data->dst + size_aligned)
+    : "x0", "x1"
+  );
+
+  //printf("done store_reg_strided_x2_ilp6\n");
+
+  // number of bytes transferred overall
+  return data->total_size;
+}
+
+
+double store_reg_strided_x2_p75_ilp6(const void* args) {
+  // ST1W (two register, strided, predicated), 75% active lanes
+  //
+  // Bytes per instruction: 128 (96 active), bytes per loop iteration: 768 (ILP=6)
+  const benchmark_data_t* data = args;
+  size_t size_aligned = data->size - (data->size % 768);
+
+  //printf("starting store_reg_strided_x2_p75_ilp6\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #24                                                \n"
+    "whilelt pn8.s, xzr, x24, vlx2                               \n"
+    "1:                                                          \n"
+    "  mov x1, %[dst]                                            \n"
+    "  2:                                                        \n"
+    "    st1w {z0.s, z8.s}, pn8, [x1, 0, MUL VL]                 \n"
+    "    st1w {z1.s, z9.s}, pn8, [x1, 2, MUL VL]                 \n"
+    "    st1w {z2.s, z10.s}, pn8, [x1, 4, MUL VL]                \n"
+    "    st1w {z3.s, z11.s}, pn8, [x1, 6, MUL VL]                \n"
+    "    st1w {z4.s, z12.s}, pn8, [x1, 8, MUL VL]                \n"
+    "    st1w {z5.s, z13.s}, pn8, [x1, 10, MUL VL]               \n"
+    "                                                            \n"
+    "    add x1, x1, #768                                        \n"
+    "    cmp x1, %[end_aligned]                                  \n"
+    "    b.lo 2b                                                 \n"
+    "    b 4f                                                    \n"
+    "  3:                                                        \n"
+    "    st1w {z0.s, z8.s}, pn8, [x1, 0, MUL VL]                 \n"
+    "    add x1, x1, #128                                        \n"
+    "  4:                                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 3b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [dst] "r" (data->dst), [end] "r" (data->dst + data->size), [end_aligned] "r" (data->dst + size_aligned)
+    : "x0", "x1", "x24"
+  );
+
+  //printf("done store_reg_strided_x2_p75_ilp6\n");
+
+  // number of bytes transferred overall
+  return 0.75*data->total_size;
+}
+
+
+double store_reg_strided_x2_p50_ilp5(const void* args) {
+  // ST1W (two register, strided, predicated), 50% active lanes
+  //
+  // Bytes per instruction: 128 (64 active), bytes per loop iteration: 640 (ILP=5)
+  const benchmark_data_t* data = args;
+  size_t size_aligned = data->size - (data->size % 640);
+
+  //printf("starting store_reg_strided_x2_p50_ilp5\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #16                                                \n"
+    "whilelt pn8.s, xzr, x24, vlx2                               \n"
+    "1:                                                          \n"
+    "  mov x1, %[dst]                                            \n"
+    "  2:                                                        \n"
+    "    st1w {z0.s, z8.s}, pn8, [x1, 0, MUL VL]                 \n"
+    "    st1w {z1.s, z9.s}, pn8, [x1, 2, MUL VL]                 \n"
+    "    st1w {z2.s, z10.s}, pn8, [x1, 4, MUL VL]                \n"
+    "    st1w {z3.s, z11.s}, pn8, [x1, 6, MUL VL]                \n"
+    "    st1w {z4.s, z12.s}, pn8, [x1, 8, MUL VL]                \n"
+    "                                                            \n"
+    "    add x1, x1, #640                                        \n"
+    "    cmp x1, %[end_aligned]                                  \n"
+    "    b.lo 2b                                                 \n"
+    "    b 4f                                                    \n"
+    "  3:                                                        \n"
+    "    st1w {z0.s, z8.s}, pn8, [x1, 0, MUL VL]                 \n"
+    "    add x1, x1, #128                                        \n"
+    "  4:                                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 3b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [dst] "r" (data->dst), [end] "r" (data->dst + data->size), [end_aligned] "r" (data->dst + size_aligned)
+    : "x0", "x1", "x24"
+  );
+
+  //printf("done store_reg_strided_x2_p50_ilp5\n");
+
+  // number of bytes transferred overall
+  return 0.5*data->total_size;
+}
+
+
+double store_reg_strided_x2_p25_ilp3(const void* args) {
+  // ST1W (two register, strided, predicated), 25% active lanes
+  //
+  // Bytes per instruction: 128 (32 active), bytes per loop iteration: 384 (ILP=3)
+  const benchmark_data_t* data = args;
+  size_t size_aligned = data->size - (data->size % 384);
+
+  //printf("starting store_reg_strided_x2_p25_ilp3\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #8                                                 \n"
+    "whilelt pn8.s, xzr, x24, vlx2                               \n"
+    "1:                                                          \n"
+    "  mov x1, %[dst]                                            \n"
+    "  2:                                                        \n"
+    "    st1w {z0.s, z8.s}, pn8, [x1, 0, MUL VL]                 \n"
+    "    st1w {z1.s, z9.s}, pn8, [x1, 2, MUL VL]                 \n"
+    "    st1w {z2.s, z10.s}, pn8, [x1, 4, MUL VL]                \n"
+    "                                                            \n"
+    "    add x1, x1, #384                                        \n"
+    "    cmp x1, %[end_aligned]                                  \n"
+    "    b.lo 2b                                                 \n"
+    "    b 4f                                                    \n"
+    "  3:                                                        \n"
+    "    st1w {z0.s, z8.s}, pn8, [x1, 0, MUL VL]                 \n"
+    "    add x1, x1, #128                                        \n"
+    "  4:                                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 3b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [dst] "r" (data->dst), [end] "r" (data->dst + data->size), [end_aligned] "r" (data->dst + size_aligned)
+    : "x0", "x1", "x24"
+  );
+
+  //printf("done store_reg_strided_x2_p25_ilp3\n");
+
+  // number of bytes transferred overall
+  return 0.25*data->total_size;
+}
+
+
+double store_reg_strided_x2_p25_ilp8(const void* args) {
+  // ST1W (two register, strided, predicated), 25% active lanes
+  //
+  // Bytes per instruction: 128 (32 active), bytes per loop iteration: 1024 (ILP=8)
+  const benchmark_data_t* data = args;
+  size_t size_aligned = data->size - (data->size % 1024);
+
+  //printf("starting store_reg_strided_x2_p25_ilp8\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #8                                                 \n"
+    "whilelt pn8.s, xzr, x24, vlx2                               \n"
+    "1:                                                          \n"
+    "  mov x1, %[dst]                                            \n"
+    "  2:                                                        \n"
+    "    st1w {z0.s, z8.s}, pn8, [x1, 0, MUL VL]                 \n"
+    "    st1w {z1.s, z9.s}, pn8, [x1, 2, MUL VL]                 \n"
+    "    st1w {z2.s, z10.s}, pn8, [x1, 4, MUL VL]                \n"
+    "    st1w {z3.s, z11.s}, pn8, [x1, 6, MUL VL]                \n"
+    "    st1w {z4.s, z12.s}, pn8, [x1, 8, MUL VL]                \n"
+    "    st1w {z5.s, z13.s}, pn8, [x1, 10, MUL VL]               \n"
+    "    st1w {z6.s, z14.s}, pn8, [x1, 12, MUL VL]               \n"
+    "    st1w {z7.s, z15.s}, pn8, [x1, 14, MUL VL]               \n"
+    "                                                            \n"
+    "    add x1, x1, #1024                                       \n"
+    "    cmp x1, %[end_aligned]                                  \n"
+    "    b.lo 2b                                                 \n"
+    "    b 4f                                                    \n"
+    "  3:                                                        \n"
+    "    st1w {z0.s, z8.s}, pn8, [x1, 0, MUL VL]                 \n"
+    "    add x1, x1, #128                                        \n"
+    "  4:                                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 3b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [dst] "r" (data->dst), [end] "r" (data->dst + data->size), [end_aligned] "r" (data->dst + size_aligned)
+    : "x0", "x1", "x24"
+  );
+
+  //printf("done store_reg_strided_x2_p25_ilp8\n");
+
+  // number of bytes transferred overall
+  return 0.25*data->total_size;
+}
+
+
+double copy_reg_strided_x2_ilp4(const void* args) {
+  // LD1W/ST1W (two register, strided, predicated)
+  //
+  // Bytes per instruction: 128, bytes per loop iteration: 512 (ILP=4)
+  const benchmark_data_t* data = args;
+  size_t size_aligned = data->size - (data->size % 512);
+
+  //printf("starting copy_reg_strided_x2_ilp4\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "ptrue pn8.s                                                 \n"
+    "1:                                                          \n"
+    "  mov x1, %[src]                                            \n"
+    "  mov x2, %[dst]                                            \n"
+    "  2:                                                        \n"
+    "    ld1w {z0.s, z8.s}, pn8/z, [x1, 0, MUL VL]               \n"
+    "    ld1w {z1.s, z9.s}, pn8/z, [x1, 2, MUL VL]               \n"
+    "    ld1w {z2.s, z10.s}, pn8/z, [x1, 4, MUL VL]              \n"
+    "    ld1w {z3.s, z11.s}, pn8/z, [x1, 6, MUL VL]              \n"
+    "                                                            \n"
+    "    st1w {z0.s, z8.s}, pn8, [x2, 0, MUL VL]                 \n"
+    "    st1w {z1.s, z9.s}, pn8, [x2, 2, MUL VL]                 \n"
+    "    st1w {z2.s, z10.s}, pn8, [x2, 4, MUL VL]                \n"
+    "    st1w {z3.s, z11.s}, pn8, [x2, 6, MUL VL]                \n"
+    "                                                            \n"
+    "    add x1, x1, #512                                        \n"
+    "    add x2, x2, #512                                        \n"
+    "    cmp x1, %[end_aligned]                                  \n"
+    "    b.lo 2b                                                 \n"
+    "    b 4f                                                    \n"
+    "  3:                                                        \n"
+    "    ld1w {z0.s, z8.s}, pn8/z, [x1, 0, MUL VL]               \n"
+    "    add x1, x1, #128                                        \n"
+    "    st1w {z0.s, z8.s}, pn8, [x2, 0, MUL VL]                 \n"
+    "    add x2, x2, #128                                        \n"
+    "  4:                                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 3b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [src] "r" (data->src), [dst] "r" (data->dst), [end] "r" (data->src + data->size), [end_aligned] "r" (data->src + size_aligned)
+    : "x0", "x1", "x2"
+  );
+
+  //printf("done copy_reg_strided_x2_ilp4\n");
+
+  // number of bytes transferred overall
+  return 2.0*data->total_size;
+}
+
+
+double copy_reg_strided_x2_p75_ilp4(const void* args) {
+  // LD1W/ST1W (two register, strided, predicated), 75% active lanes
+  //
+  // Bytes per instruction: 128 (96 active), bytes per loop iteration: 512 (ILP=4)
+  const benchmark_data_t* data = args;
+  size_t size_aligned = data->size - (data->size % 512);
+
+  //printf("starting copy_reg_strided_x2_p75_ilp4\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #24                                                \n"
+    "whilelt pn8.s, xzr, x24, vlx2                               \n"
+    "1:                                                          \n"
+    "  mov x1, %[src]                                            \n"
+    "  mov x2, %[dst]                                            \n"
+    "  2:                                                        \n"
+    "    ld1w {z0.s, z8.s}, pn8/z, [x1, 0, MUL VL]               \n"
+    "    ld1w {z1.s, z9.s}, pn8/z, [x1, 2, MUL VL]               \n"
+    "    ld1w {z2.s, z10.s}, pn8/z, [x1, 4, MUL VL]              \n"
+    "    ld1w {z3.s, z11.s}, pn8/z, [x1, 6, MUL VL]              \n"
+    "                                                            \n"
+    "    st1w {z0.s, z8.s}, pn8, [x2, 0, MUL VL]                 \n"
+    "    st1w {z1.s, z9.s}, pn8, [x2, 2, MUL VL]                 \n"
+    "    st1w {z2.s, z10.s}, pn8, [x2, 4, MUL VL]                \n"
+    "    st1w {z3.s, z11.s}, pn8, [x2, 6, MUL VL]                \n"
+    "                                                            \n"
+    "    add x1, x1, #512                                        \n"
+    "    add x2, x2, #512                                        \n"
+    "    cmp x1, %[end_aligned]                                  \n"
+    "    b.lo 2b                                                 \n"
+    "    b 4f                                                    \n"
+    "  3:                                                        \n"
+    "    ld1w {z0.s, z8.s}, pn8/z, [x1, 0, MUL VL]               \n"
+    "    add x1, x1, #128                                        \n"
+    "    st1w {z0.s, z8.s}, pn8, [x2, 0, MUL VL]                 \n"
+    "    add x2, x2, #128                                        \n"
+    "  4:                                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 3b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [src] "r" (data->src), [dst] "r" (data->dst), [end] "r" (data->src + data->size), [end_aligned] "r" (data->src + size_aligned)
+    : "x0", "x1", "x2", "x24"
+  );
+
+  //printf("done copy_reg_strided_x2_p75_ilp4\n");
+
+  // number of bytes transferred overall
+  return 0.75*2.0*data->total_size;
+}
+
+
+double copy_reg_strided_x2_p50_ilp7(const void* args) {
+  // LD1W/ST1W (two register, strided, predicated), 50% active lanes
+  //
+  // Bytes per instruction: 128 (64 active), bytes per loop iteration: 896 (ILP=7)
+  const benchmark_data_t* data = args;
+  size_t size_aligned = data->size - (data->size % 896);
+
+  //printf("starting copy_reg_strided_x2_p50_ilp7\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #16                                                \n"
+    "whilelt pn8.s, xzr, x24, vlx2                               \n"
+    "1:                                                          \n"
+    "  mov x1, %[src]                                            \n"
+    "  mov x2, %[dst]                                            \n"
+    "  2:                                                        \n"
+    "    ld1w {z0.s, z8.s}, pn8/z, [x1, 0, MUL VL]               \n"
+    "    ld1w {z1.s, z9.s}, pn8/z, [x1, 2, MUL VL]               \n"
+    "    ld1w {z2.s, z10.s}, pn8/z, [x1, 4, MUL VL]              \n"
+    "    ld1w {z3.s, z11.s}, pn8/z, [x1, 6, MUL VL]              \n"
+    "    ld1w {z4.s, z12.s}, pn8/z, [x1, 8, MUL VL]              \n"
+    "    ld1w {z5.s, z13.s}, pn8/z, [x1, 10, MUL VL]             \n"
+    "    ld1w {z6.s, z14.s}, pn8/z, [x1, 12, MUL VL]             \n"
+    "                                                            \n"
+    "    st1w {z0.s, z8.s}, pn8, [x2, 0, MUL VL]                 \n"
+    "    st1w {z1.s, z9.s}, pn8, [x2, 2, MUL VL]                 \n"
+    "    st1w {z2.s, z10.s}, pn8, [x2, 4, MUL VL]                \n"
+    "    st1w {z3.s, z11.s}, pn8, [x2, 6, MUL VL]                \n"
+    "    st1w {z4.s, z12.s}, pn8, [x2, 8, MUL VL]                \n"
+    "    st1w {z5.s, z13.s}, pn8, [x2, 10, MUL VL]               \n"
+    "    st1w {z6.s, z14.s}, pn8, [x2, 12, MUL VL]               \n"
+    "                                                            \n"
+    "    add x1, x1, #896                                        \n"
+    "    add x2, x2, #896                                        \n"
+    "    cmp x1, %[end_aligned]                                  \n"
+    "    b.lo 2b                                                 \n"
+    "    b 4f                                                    \n"
+    "  3:                                                        \n"
+    "    ld1w {z0.s, z8.s}, pn8/z, [x1, 0, MUL VL]               \n"
+    "    add x1, x1, #128                                        \n"
+    "    st1w {z0.s, z8.s}, pn8, [x2, 0, MUL VL]                 \n"
+    "    add x2, x2, #128                                        \n"
+    "  4:                                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 3b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [src] "r" (data->src), [dst] "r" (data->dst), [end] "r" (data->src + data->size), [end_aligned] "r" (data->src + size_aligned)
+    : "x0", "x1", "x2", "x24"
+  );
+
+  //printf("done copy_reg_strided_x2_p50_ilp7\n");
+
+  // number of bytes transferred overall
+  return 0.5*2.0*data->total_size;
+}
+
+
+double copy_reg_strided_x2_p25_ilp1(const void* args) {
+  // LD1W/ST1W (two register, strided, predicated), 25% active lanes
+  //
+  // Bytes per instruction: 128 (32 active), bytes per loop iteration: 128 (ILP=1)
+  const benchmark_data_t* data = args;
+
+  //printf("starting copy_reg_strided_x2_p25_ilp1\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #8                                                 \n"
+    "whilelt pn8.s, xzr, x24, vlx2                               \n"
+    "1:                                                          \n"
+    "  mov x1, %[src]                                            \n"
+    "  mov x2, %[dst]                                            \n"
+    "  2:                                                        \n"
+    "    ld1w {z0.s, z8.s}, pn8/z, [x1, 0, MUL VL]               \n"
+    "                                                            \n"
+    "    st1w {z0.s, z8.s}, pn8, [x2, 0, MUL VL]                 \n"
+    "                                                            \n"
+    "    add x1, x1, #128                                        \n"
+    "    add x2, x2, #128                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 2b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [src] "r" (data->src), [dst] "r" (data->dst), [end] "r" (data->src + data->size)
+    : "x0", "x1", "x2", "x24"
+  );
+
+  //printf("done copy_reg_strided_x2_p25_ilp1\n");
+
+  // number of bytes transferred overall
+  return 0.25*2.0*data->total_size;
+}
+
+
+double load_reg_strided_x4_ilp7(const void* args) {
+  // LD1W (four register, strided, predicated)
+  //
+  // Bytes per instruction: 256, bytes per loop iteration: 1792 (ILP=7)
+  const benchmark_data_t* data = args;
+  size_t size_aligned = data->size - (data->size % 1792);
+
+  //printf("starting load_reg_strided_x4_ilp7\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                       \n"
+    "mov x0, %[n]                                                  \n"
+    "ptrue pn8.s                                                   \n"
+    "1:                                                            \n"
+    "  mov x1, %[src]                                              \n"
+    "  2:                                                          \n"
+    "    ld1w {z0.s, z4.s, z8.s, z12.s}, pn8/z, [x1, 0, MUL VL]    \n"
+    "    ld1w {z1.s, z5.s, z9.s, z13.s}, pn8/z, [x1, 4, MUL VL]    \n"
+    "    ld1w {z2.s, z6.s, z10.s, z14.s}, pn8/z, [x1, 8, MUL VL]   \n"
+    "    ld1w {z3.s, z7.s, z11.s, z15.s}, pn8/z, [x1, 12, MUL VL]  \n"
+    "    ld1w {z16.s, z20.s, z24.s, z28.s}, pn8/z, [x1, 16, MUL VL]\n"
+    "    ld1w {z17.s, z21.s, z25.s, z29.s}, pn8/z, [x1, 20, MUL VL]\n"
+    "    ld1w {z18.s, z22.s, z26.s, z30.s}, pn8/z, [x1, 24, MUL VL]\n"
+    "                                                              \n"
+    "    add x1, x1, #1792                                         \n"
+    "    cmp x1, %[end_aligned]                                    \n"
+    "    b.lo 2b                                                   \n"
+    "    b 4f                                                      \n"
+    "  3:                                                          \n"
+    "    ld1w {z0.s, z4.s, z8.s, z12.s}, pn8/z, [x1, 0, MUL VL]    \n"
+    "    add x1, x1, #256                                          \n"
+    "  4:                                                          \n"
+    "    cmp x1, %[end]                                            \n"
+    "    b.lo 3b                                                   \n"
+    "                                                              \n"
+    "  subs x0, x0, #1                                             \n"
+    "  b.ne 1b                                                     \n"
+    "  smstop                                                      \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [src] "r" (data->src), [end] "r" (data->src + data->size), [end_aligned] "r" (data->src + size_aligned)
+    : "x0", "x1"
+  );
+
+  //printf("done load_reg_strided_x4_ilp7\n");
+
+  // number of bytes transferred overall
+  return data->total_size;
+}
+
+
+double load_reg_strided_x4_p75_ilp1(const void* args) {
+  // LD1W (four register, strided, predicated), 75% active lanes
+  //
+  // Bytes per instruction: 256 (192 active), bytes per loop iteration: 256 (ILP=1)
+  const benchmark_data_t* data = args;
+
+  //printf("starting load_reg_strided_x4_p75_ilp1\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #48                                                \n"
+    "whilelt pn8.s, xzr, x24, vlx4                               \n"
+    "1:                                                          \n"
+    "  mov x1, %[src]                                            \n"
+    "  2:                                                        \n"
+    "    ld1w {z0.s, z4.s, z8.s, z12.s}, pn8/z, [x1, 0, MUL VL]  \n"
+    "                                                            \n"
+    "    add x1, x1, #256                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 2b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [src] "r" (data->src), [end] "r" (data->src + data->size)
+    : "x0", "x1", "x24"
+  );
+
+  //printf("done load_reg_strided_x4_p75_ilp1\n");
+
+  // number of bytes transferred overall
+  return 0.75*data->total_size;
+}
+
+
+double load_reg_strided_x4_p50_ilp2(const void* args) {
+  // LD1W (four register, strided, predicated), 50% active lanes
+  //
+  // Bytes per instruction: 256 (128 active), bytes per loop iteration: 512 (ILP=2)
+  const benchmark_data_t* data = args;
+  size_t size_aligned = data->size - (data->size % 512);
+
+  //printf("starting load_reg_strided_x4_p50_ilp2\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #32                                                \n"
+    "whilelt pn8.s, xzr, x24, vlx4                               \n"
+    "1:                                                          \n"
+    "  mov x1, %[src]                                            \n"
+    "  2:                                                        \n"
+    "    ld1w {z0.s, z4.s, z8.s, z12.s}, pn8/z, [x1, 0, MUL VL]  \n"
+    "    ld1w {z1.s, z5.s, z9.s, z13.s}, pn8/z, [x1, 4, MUL VL]  \n"
+    "                                                            \n"
+    "    add x1, x1, #512                                        \n"
+    "    cmp x1, %[end_aligned]                                  \n"
+    "    b.lo 2b                                                 \n"
+    "    b 4f                                                    \n"
+    "  3:                                                        \n"
+    "    ld1w {z0.s, z4.s, z8.s, z12.s}, pn8/z, [x1, 0, MUL VL]  \n"
+    "    add x1, x1, #256                                        \n"
+    "  4:                                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 3b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [src] "r" (data->src), [end] "r" (data->src + data->size), [end_aligned] "r" (data->src + size_aligned)
+    : "x0", "x1", "x24"
+  );
+
+  //printf("done load_reg_strided_x4_p50_ilp2\n");
+
+  // number of bytes transferred overall
+  return 0.5*data->total_size;
+}
+
+
+double load_reg_strided_x4_p25_ilp4(const void* args) {
+  // LD1W (four register, strided, predicated), 25% active lanes
+  //
+  // Bytes per instruction: 256 (64 active), bytes per loop iteration: 1024 (ILP=4)
+  const benchmark_data_t* data = args;
+  size_t size_aligned = data->size - (data->size % 1024);
+
+  //printf("starting load_reg_strided_x4_p25_ilp4\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #16                                                \n"
+    "whilelt pn8.s, xzr, x24, vlx4                               \n"
+    "1:                                                          \n"
+    "  mov x1, %[src]                                            \n"
+    "  2:                                                        \n"
+    "    ld1w {z0.s, z4.s, z8.s, z12.s}, pn8/z, [x1, 0, MUL VL]  \n"
+    "    ld1w {z1.s, z5.s, z9.s, z13.s}, pn8/z, [x1, 4, MUL VL]  \n"
+    "    ld1w {z2.s, z6.s, z10.s, z14.s}, pn8/z, [x1, 8, MUL VL] \n"
+    "    ld1w {z3.s, z7.s, z11.s, z15.s}, pn8/z, [x1, 12, MUL VL]\n"
+    "                                                            \n"
+    "    add x1, x1, #1024                                       \n"
+    "    cmp x1, %[end_aligned]                                  \n"
+    "    b.lo 2b                                                 \n"
+    "    b 4f                                                    \n"
+    "  3:                                                        \n"
+    "    ld1w {z0.s, z4.s, z8.s, z12.s}, pn8/z, [x1, 0, MUL VL]  \n"
+    "    add x1, x1, #256                                        \n"
+    "  4:                                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 3b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [src] "r" (data->src), [end] "r" (data->src + data->size), [end_aligned] "r" (data->src + size_aligned)
+    : "x0", "x1", "x24"
+  );
+
+  //printf("done load_reg_strided_x4_p25_ilp4\n");
+
+  // number of bytes transferred overall
+  return 0.25*data->total_size;
+}
+
+
+double store_reg_strided_x4_p75_ilp3(const void* args) {
+  // ST1W (four register, strided, predicated), 75% active lanes
+  //
+  // Bytes per instruction: 256 (192 active), bytes per loop iteration: 768 (ILP=3)
+  const benchmark_data_t* data = args;
+  size_t size_aligned = data->size - (data->size % 768);
+
+  //printf("starting store_reg_strided_x4_p75_ilp3\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #48                                                \n"
+    "whilelt pn8.s, xzr, x24, vlx4                               \n"
+    "1:                                                          \n"
+    "  mov x1, %[dst]                                            \n"
+    "  2:                                                        \n"
+    "    st1w {z0.s, z4.s, z8.s, z12.s}, pn8, [x1, 0, MUL VL]    \n"
+    "    st1w {z1.s, z5.s, z9.s, z13.s}, pn8, [x1, 4, MUL VL]    \n"
+    "    st1w {z2.s, z6.s, z10.s, z14.s}, pn8, [x1, 8, MUL VL]   \n"
+    "                                                            \n"
+    "    add x1, x1, #768                                        \n"
+    "    cmp x1, %[end_aligned]                                  \n"
+    "    b.lo 2b                                                 \n"
+    "    b 4f                                                    \n"
+    "  3:                                                        \n"
+    "    st1w {z0.s, z4.s, z8.s, z12.s}, pn8, [x1, 0, MUL VL]    \n"
+    "    add x1, x1, #256                                        \n"
+    "  4:                                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 3b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [dst] "r" (data->dst), [end] "r" (data->dst + data->size), [end_aligned] "r" (data->dst + size_aligned)
+    : "x0", "x1", "x24"
+  );
+
+  //printf("done store_reg_strided_x4_p75_ilp3\n");
+
+  // number of bytes transferred overall
+  return 0.75*data->total_size;
+}
+
+
+double store_reg_strided_x4_p75_ilp8(const void* args) {
+  // ST1W (four register, strided, predicated), 75% active lanes
+  //
+  // Bytes per instruction: 256 (192 active), bytes per loop iteration: 2048 (ILP=8)
+  const benchmark_data_t* data = args;
+  size_t size_aligned = data->size - (data->size % 2048);
+
+  //printf("starting store_reg_strided_x4_p75_ilp8\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #48                                                \n"
+    "whilelt pn8.s, xzr, x24, vlx4                               \n"
+    "1:                                                          \n"
+    "  mov x1, %[dst]                                            \n"
+    "  2:                                                        \n"
+    "    st1w {z0.s, z4.s, z8.s, z12.s}, pn8, [x1, 0, MUL VL]    \n"
+    "    st1w {z1.s, z5.s, z9.s, z13.s}, pn8, [x1, 4, MUL VL]    \n"
+    "    st1w {z2.s, z6.s, z10.s, z14.s}, pn8, [x1, 8, MUL VL]   \n"
+    "    st1w {z3.s, z7.s, z11.s, z15.s}, pn8, [x1, 12, MUL VL]  \n"
+    "    st1w {z16.s, z20.s, z24.s, z28.s}, pn8, [x1, 16, MUL VL]\n"
+    "    st1w {z17.s, z21.s, z25.s, z29.s}, pn8, [x1, 20, MUL VL]\n"
+    "    st1w {z18.s, z22.s, z26.s, z30.s}, pn8, [x1, 24, MUL VL]\n"
+    "    st1w {z19.s, z23.s, z27.s, z31.s}, pn8, [x1, 28, MUL VL]\n"
+    "                                                            \n"
+    "    add x1, x1, #2048                                       \n"
+    "    cmp x1, %[end_aligned]                                  \n"
+    "    b.lo 2b                                                 \n"
+    "    b 4f                                                    \n"
+    "  3:                                                        \n"
+    "    st1w {z0.s, z4.s, z8.s, z12.s}, pn8, [x1, 0, MUL VL]    \n"
+    "    add x1, x1, #256                                        \n"
+    "  4:                                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 3b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [dst] "r" (data->dst), [end] "r" (data->dst + data->size), [end_aligned] "r" (data->dst + size_aligned)
+    : "x0", "x1", "x24"
+  );
+
+  //printf("done store_reg_strided_x4_p75_ilp8\n");
+
+  // number of bytes transferred overall
+  return 0.75*data->total_size;
+}
+
+
+double store_reg_strided_x4_p25_ilp6(const void* args) {
+  // ST1W (four register, strided, predicated), 25% active lanes
+  //
+  // Bytes per instruction: 256 (64 active), bytes per loop iteration: 1536 (ILP=6)
+  const benchmark_data_t* data = args;
+  size_t size_aligned = data->size - (data->size % 1536);
+
+  //printf("starting store_reg_strided_x4_p25_ilp6\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #16                                                \n"
+    "whilelt pn8.s, xzr, x24, vlx4                               \n"
+    "1:                                                          \n"
+    "  mov x1, %[dst]                                            \n"
+    "  2:                                                        \n"
+    "    st1w {z0.s, z4.s, z8.s, z12.s}, pn8, [x1, 0, MUL VL]    \n"
+    "    st1w {z1.s, z5.s, z9.s, z13.s}, pn8, [x1, 4, MUL VL]    \n"
+    "    st1w {z2.s, z6.s, z10.s, z14.s}, pn8, [x1, 8, MUL VL]   \n"
+    "    st1w {z3.s, z7.s, z11.s, z15.s}, pn8, [x1, 12, MUL VL]  \n"
+    "    st1w {z16.s, z20.s, z24.s, z28.s}, pn8, [x1, 16, MUL VL]\n"
+    "    st1w {z17.s, z21.s, z25.s, z29.s}, pn8, [x1, 20, MUL VL]\n"
+    "                                                            \n"
+    "    add x1, x1, #1536                                       \n"
+    "    cmp x1, %[end_aligned]                                  \n"
+    "    b.lo 2b                                                 \n"
+    "    b 4f                                                    \n"
+    "  3:                                                        \n"
+    "    st1w {z0.s, z4.s, z8.s, z12.s}, pn8, [x1, 0, MUL VL]    \n"
+    "    add x1, x1, #256                                        \n"
+    "  4:                                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 3b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [dst] "r" (data->dst), [end] "r" (data->dst + data->size), [end_aligned] "r" (data->dst + size_aligned)
+    : "x0", "x1", "x24"
+  );
+
+  //printf("done store_reg_strided_x4_p25_ilp6\n");
+
+  // number of bytes transferred overall
+  return 0.25*data->total_size;
+}
+
+
+double copy_reg_strided_x4_ilp2(const void* args) {
+  // LD1W/ST1W (four register, strided, predicated)
+  //
+  // Bytes per instruction: 256, bytes per loop iteration: 512 (ILP=2)
+  const benchmark_data_t* data = args;
+  size_t size_aligned = data->size - (data->size % 512);
+
+  //printf("starting copy_reg_strided_x4_ilp2\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "ptrue pn8.s                                                 \n"
+    "1:                                                          \n"
+    "  mov x1, %[src]                                            \n"
+    "  mov x2, %[dst]                                            \n"
+    "  2:                                                        \n"
+    "    ld1w {z0.s, z4.s, z8.s, z12.s}, pn8/z, [x1, 0, MUL VL]  \n"
+    "    ld1w {z1.s, z5.s, z9.s, z13.s}, pn8/z, [x1, 4, MUL VL]  \n"
+    "                                                            \n"
+    "    st1w {z0.s, z4.s, z8.s, z12.s}, pn8, [x2, 0, MUL VL]    \n"
+    "    st1w {z1.s, z5.s, z9.s, z13.s}, pn8, [x2, 4, MUL VL]    \n"
+    "                                                            \n"
+    "    add x1, x1, #512                                        \n"
+    "    add x2, x2, #512                                        \n"
+    "    cmp x1, %[end_aligned]                                  \n"
+    "    b.lo 2b                                                 \n"
+    "    b 4f                                                    \n"
+    "  3:                                                        \n"
+    "    ld1w {z0.s, z4.s, z8.s, z12.s}, pn8/z, [x1, 0, MUL VL]  \n"
+    "    add x1, x1, #256                                        \n"
+    "    st1w {z0.s, z4.s, z8.s, z12.s}, pn8, [x2, 0, MUL VL]    \n"
+    "    add x2, x2, #256                                        \n"
+    "  4:                                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 3b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [src] "r" (data->src), [dst] "r" (data->dst), [end] "r" (data->src + data->size), [end_aligned] "r" (data->src + size_aligned)
+    : "x0", "x1", "x2"
+  );
+
+  //printf("done copy_reg_strided_x4_ilp2\n");
+
+  // number of bytes transferred overall
+  return 2.0*data->total_size;
+}
+
+
+double copy_reg_strided_x4_p75_ilp1(const void* args) {
+  // LD1W/ST1W (four register, strided, predicated), 75% active lanes
+  //
+  // Bytes per instruction: 256 (192 active), bytes per loop iteration: 256 (ILP=1)
+  const benchmark_data_t* data = args;
+
+  //printf("starting copy_reg_strided_x4_p75_ilp1\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #48                                                \n"
+    "whilelt pn8.s, xzr, x24, vlx4                               \n"
+    "1:                                                          \n"
+    "  mov x1, %[src]                                            \n"
+    "  mov x2, %[dst]                                            \n"
+    "  2:                                                        \n"
+    "    ld1w {z0.s, z4.s, z8.s, z12.s}, pn8/z, [x1, 0, MUL VL]  \n"
+    "                                                            \n"
+    "    st1w {z0.s, z4.s, z8.s, z12.s}, pn8, [x2, 0, MUL VL]    \n"
+    "                                                            \n"
+    "    add x1, x1, #256                                        \n"
+    "    add x2, x2, #256                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 2b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [src] "r" (data->src), [dst] "r" (data->dst), [end] "r" (data->src + data->size)
+    : "x0", "x1", "x2", "x24"
+  );
+
+  //printf("done copy_reg_strided_x4_p75_ilp1\n");
+
+  // number of bytes transferred overall
+  return 0.75*2.0*data->total_size;
+}
+
+
+double copy_reg_strided_x4_p50_ilp2(const void* args) {
+  // LD1W/ST1W (four register, strided, predicated), 50% active lanes
+  //
+  // Bytes per instruction: 256 (128 active), bytes per loop iteration: 512 (ILP=2)
+  const benchmark_data_t* data = args;
+  size_t size_aligned = data->size - (data->size % 512);
+
+  //printf("starting copy_reg_strided_x4_p50_ilp2\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #32                                                \n"
+    "whilelt pn8.s, xzr, x24, vlx4                               \n"
+    "1:                                                          \n"
+    "  mov x1, %[src]                                            \n"
+    "  mov x2, %[dst]                                            \n"
+    "  2:                                                        \n"
+    "    ld1w {z0.s, z4.s, z8.s, z12.s}, pn8/z, [x1, 0, MUL VL]  \n"
+    "    ld1w {z1.s, z5.s, z9.s, z13.s}, pn8/z, [x1, 4, MUL VL]  \n"
+    "                                                            \n"
+    "    st1w {z0.s, z4.s, z8.s, z12.s}, pn8, [x2, 0, MUL VL]    \n"
+    "    st1w {z1.s, z5.s, z9.s, z13.s}, pn8, [x2, 4, MUL VL]    \n"
+    "                                                            \n"
+    "    add x1, x1, #512                                        \n"
+    "    add x2, x2, #512                                        \n"
+    "    cmp x1, %[end_aligned]                                  \n"
+    "    b.lo 2b                                                 \n"
+    "    b 4f                                                    \n"
+    "  3:                                                        \n"
+    "    ld1w {z0.s, z4.s, z8.s, z12.s}, pn8/z, [x1, 0, MUL VL]  \n"
+    "    add x1, x1, #256                                        \n"
+    "    st1w {z0.s, z4.s, z8.s, z12.s}, pn8, [x2, 0, MUL VL]    \n"
+    "    add x2, x2, #256                                        \n"
+    "  4:                                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 3b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [src] "r" (data->src), [dst] "r" (data->dst), [end] "r" (data->src + data->size), [end_aligned] "r" (data->src + size_aligned)
+    : "x0", "x1", "x2", "x24"
+  );
+
+  //printf("done copy_reg_strided_x4_p50_ilp2\n");
+
+  // number of bytes transferred overall
+  return 0.5*2.0*data->total_size;
+}
+
+
+double copy_reg_strided_x4_p25_ilp4(const void* args) {
+  // LD1W/ST1W (four register, strided, predicated), 25% active lanes
+  //
+  // Bytes per instruction: 256 (64 active), bytes per loop iteration: 1024 (ILP=4)
+  const benchmark_data_t* data = args;
+  size_t size_aligned = data->size - (data->size % 1024);
+
+  //printf("starting copy_reg_strided_x4_p25_ilp4\n");
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #16                                                \n"
+    "whilelt pn8.s, xzr, x24, vlx4                               \n"
+    "1:                                                          \n"
+    "  mov x1, %[src]                                            \n"
+    "  mov x2, %[dst]                                            \n"
+    "  2:                                                        \n"
+    "    ld1w {z0.s, z4.s, z8.s, z12.s}, pn8/z, [x1, 0, MUL VL]  \n"
+    "    ld1w {z1.s, z5.s, z9.s, z13.s}, pn8/z, [x1, 4, MUL VL]  \n"
+    "    ld1w {z2.s, z6.s, z10.s, z14.s}, pn8/z, [x1, 8, MUL VL] \n"
+    "    ld1w {z3.s, z7.s, z11.s, z15.s}, pn8/z, [x1, 12, MUL VL]\n"
+    "                                                            \n"
+    "    st1w {z0.s, z4.s, z8.s, z12.s}, pn8, [x2, 0, MUL VL]    \n"
+    "    st1w {z1.s, z5.s, z9.s, z13.s}, pn8, [x2, 4, MUL VL]    \n"
+    "    st1w {z2.s, z6.s, z10.s, z14.s}, pn8, [x2, 8, MUL VL]   \n"
+    "    st1w {z3.s, z7.s, z11.s, z15.s}, pn8, [x2, 12, MUL VL]  \n"
+    "                                                            \n"
+    "    add x1, x1, #1024                                       \n"
+    "    add x2, x2, #1024                                       \n"
+    "    cmp x1, %[end_aligned]                                  \n"
+    "    b.lo 2b                                                 \n"
+    "    b 4f                                                    \n"
+    "  3:                                                        \n"
+    "    ld1w {z0.s, z4.s, z8.s, z12.s}, pn8/z, [x1, 0, MUL VL]  \n"
+    "    add x1, x1, #256                                        \n"
+    "    st1w {z0.s, z4.s, z8.s, z12.s}, pn8, [x2, 0, MUL VL]    \n"
+    "    add x2, x2, #256                                        \n"
+    "  4:                                                        \n"
+    "    cmp x1, %[end]                                          \n"
+    "    b.lo 3b                                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "  smstop                                                    \n"
+    : // nothing
+    : [n] "r" (data->n_iterations), [src] "r" (data->src), [dst] "r" (data->dst), [end] "r" (data->src + data->size), [end_aligned] "r" (data->src + size_aligned)
+    : "x0", "x1", "x2", "x24"
+  );
+
+  //printf("done copy_reg_strided_x4_p25_ilp4\n");
+
+  // number of bytes transferred overall
+  return 0.25*2.0*data->total_size;
+}
+
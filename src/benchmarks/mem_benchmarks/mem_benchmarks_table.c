@@ -0,0 +1,987 @@
+// generated by tools/gen_mem_benchmarks.py, do not edit!
+#include <assert.h>
+#include <stdlib.h>
+#include "../bench.h"
+
+// Allocation granularity, must be large enough to align with 4x multivector load/store
+#define SIZE_ALIGNMENT (64*4)
+
+// Benchmark parameters
+typedef struct {
+  char*  src;
+  char*  dst;
+  size_t size;
+  size_t n_iterations;
+  double total_size;
+} benchmark_data_t;
+
+// benchmark functions
+double load_za_vector_x1_ilp1(const void*);
+double load_za_vector_x1_ilp2(const void*);
+double load_za_vector_x1_ilp3(const void*);
+double load_za_vector_x1_ilp4(const void*);
+double load_za_vector_x1_ilp5(const void*);
+double load_za_vector_x1_ilp6(const void*);
+double load_za_vector_x1_ilp7(const void*);
+double load_za_vector_x1_ilp8(const void*);
+double load_za_vector_x1_ilp9(const void*);
+double load_za_vector_x1_ilp10(const void*);
+double load_za_vector_x1_ilp11(const void*);
+double load_za_vector_x1_ilp12(const void*);
+double load_za_vector_x1_ilp13(const void*);
+double load_za_vector_x1_ilp14(const void*);
+double load_za_vector_x1_ilp15(const void*);
+double load_za_vector_x1_ilp16(const void*);
+double store_za_vector_x1_ilp1(const void*);
+double store_za_vector_x1_ilp2(const void*);
+double store_za_vector_x1_ilp3(const void*);
+double store_za_vector_x1_ilp4(const void*);
+double store_za_vector_x1_ilp5(const void*);
+double store_za_vector_x1_ilp6(const void*);
+double store_za_vector_x1_ilp7(const void*);
+double store_za_vector_x1_ilp8(const void*);
+double store_za_vector_x1_ilp9(const void*);
+double store_za_vector_x1_ilp10(const void*);
+double store_za_vector_x1_ilp11(const void*);
+double store_za_vector_x1_ilp12(const void*);
+double store_za_vector_x1_ilp13(const void*);
+double store_za_vector_x1_ilp14(const void*);
+double store_za_vector_x1_ilp15(const void*);
+double store_za_vector_x1_ilp16(const void*);
+double copy_za_vector_x1_ilp1(const void*);
+double copy_za_vector_x1_ilp2(const void*);
+double copy_za_vector_x1_ilp3(const void*);
+double copy_za_vector_x1_ilp4(const void*);
+double copy_za_vector_x1_ilp5(const void*);
+double copy_za_vector_x1_ilp6(const void*);
+double copy_za_vector_x1_ilp7(const void*);
+double copy_za_vector_x1_ilp8(const void*);
+double copy_za_vector_x1_ilp9(const void*);
+double copy_za_vector_x1_ilp10(const void*);
+double copy_za_vector_x1_ilp11(const void*);
+double copy_za_vector_x1_ilp12(const void*);
+double copy_za_vector_x1_ilp13(const void*);
+double copy_za_vector_x1_ilp14(const void*);
+double copy_za_vector_x1_ilp15(const void*);
+double copy_za_vector_x1_ilp16(const void*);
+double load_reg_adjacent_x1_ilp1(const void*);
+double load_reg_adjacent_x1_ilp2(const void*);
+double load_reg_adjacent_x1_ilp3(const void*);
+double load_reg_adjacent_x1_ilp4(const void*);
+double load_reg_adjacent_x1_ilp5(const void*);
+double load_reg_adjacent_x1_ilp6(const void*);
+double load_reg_adjacent_x1_ilp7(const void*);
+double load_reg_adjacent_x1_ilp8(const void*);
+double store_reg_adjacent_x1_ilp1(const void*);
+double store_reg_adjacent_x1_ilp2(const void*);
+double store_reg_adjacent_x1_ilp3(const void*);
+double store_reg_adjacent_x1_ilp4(const void*);
+double store_reg_adjacent_x1_ilp5(const void*);
+double store_reg_adjacent_x1_ilp6(const void*);
+double store_reg_adjacent_x1_ilp7(const void*);
+double store_reg_adjacent_x1_ilp8(const void*);
+double copy_reg_adjacent_x1_ilp1(const void*);
+double copy_reg_adjacent_x1_ilp2(const void*);
+double copy_reg_adjacent_x1_ilp3(const void*);
+double copy_reg_adjacent_x1_ilp4(const void*);
+double copy_reg_adjacent_x1_ilp5(const void*);
+double copy_reg_adjacent_x1_ilp6(const void*);
+double copy_reg_adjacent_x1_ilp7(const void*);
+double copy_reg_adjacent_x1_ilp8(const void*);
+double load_reg_adjacent_x2_ilp1(const void*);
+double load_reg_adjacent_x2_ilp2(const void*);
+double load_reg_adjacent_x2_ilp3(const void*);
+double load_reg_adjacent_x2_ilp4(const void*);
+double load_reg_adjacent_x2_ilp5(const void*);
+double load_reg_adjacent_x2_ilp6(const void*);
+double load_reg_adjacent_x2_ilp7(const void*);
+double load_reg_adjacent_x2_ilp8(const void*);
+double load_reg_adjacent_x2_p75_ilp1(const void*);
+double load_reg_adjacent_x2_p75_ilp2(const void*);
+double load_reg_adjacent_x2_p75_ilp3(const void*);
+double load_reg_adjacent_x2_p75_ilp4(const void*);
+double load_reg_adjacent_x2_p75_ilp5(const void*);
+double load_reg_adjacent_x2_p75_ilp6(const void*);
+double load_reg_adjacent_x2_p75_ilp7(const void*);
+double load_reg_adjacent_x2_p75_ilp8(const void*);
+double load_reg_adjacent_x2_p50_ilp1(const void*);
+double load_reg_adjacent_x2_p50_ilp2(const void*);
+double load_reg_adjacent_x2_p50_ilp3(const void*);
+double load_reg_adjacent_x2_p50_ilp4(const void*);
+double load_reg_adjacent_x2_p50_ilp5(const void*);
+double load_reg_adjacent_x2_p50_ilp6(const void*);
+double load_reg_adjacent_x2_p50_ilp7(const void*);
+double load_reg_adjacent_x2_p50_ilp8(const void*);
+double load_reg_adjacent_x2_p25_ilp1(const void*);
+double load_reg_adjacent_x2_p25_ilp2(const void*);
+double load_reg_adjacent_x2_p25_ilp3(const void*);
+double load_reg_adjacent_x2_p25_ilp4(const void*);
+double load_reg_adjacent_x2_p25_ilp5(const void*);
+double load_reg_adjacent_x2_p25_ilp6(const void*);
+double load_reg_adjacent_x2_p25_ilp7(const void*);
+double load_reg_adjacent_x2_p25_ilp8(const void*);
+double store_reg_adjacent_x2_ilp1(const void*);
+double store_reg_adjacent_x2_ilp2(const void*);
+double store_reg_adjacent_x2_ilp3(const void*);
+double store_reg_adjacent_x2_ilp4(const void*);
+double store_reg_adjacent_x2_ilp5(const void*);
+double store_reg_adjacent_x2_ilp6(const void*);
+double store_reg_adjacent_x2_ilp7(const void*);
+double store_reg_adjacent_x2_ilp8(const void*);
+double store_reg_adjacent_x2_p75_ilp1(const void*);
+double store_reg_adjacent_x2_p75_ilp2(const void*);
+double store_reg_adjacent_x2_p75_ilp3(const void*);
+double store_reg_adjacent_x2_p75_ilp4(const void*);
+double store_reg_adjacent_x2_p75_ilp5(const void*);
+double store_reg_adjacent_x2_p75_ilp6(const void*);
+double store_reg_adjacent_x2_p75_ilp7(const void*);
+double store_reg_adjacent_x2_p75_ilp8(const void*);
+double store_reg_adjacent_x2_p50_ilp1(const void*);
+double store_reg_adjacent_x2_p50_ilp2(const void*);
+double store_reg_adjacent_x2_p50_ilp3(const void*);
+double store_reg_adjacent_x2_p50_ilp4(const void*);
+double store_reg_adjacent_x2_p50_ilp5(const void*);
+double store_reg_adjacent_x2_p50_ilp6(const void*);
+double store_reg_adjacent_x2_p50_ilp7(const void*);
+double store_reg_adjacent_x2_p50_ilp8(const void*);
+double store_reg_adjacent_x2_p25_ilp1(const void*);
+double store_reg_adjacent_x2_p25_ilp2(const void*);
+double store_reg_adjacent_x2_p25_ilp3(const void*);
+double store_reg_adjacent_x2_p25_ilp4(const void*);
+double store_reg_adjacent_x2_p25_ilp5(const void*);
+double store_reg_adjacent_x2_p25_ilp6(const void*);
+double store_reg_adjacent_x2_p25_ilp7(const void*);
+double store_reg_adjacent_x2_p25_ilp8(const void*);
+double copy_reg_adjacent_x2_ilp1(const void*);
+double copy_reg_adjacent_x2_ilp2(const void*);
+double copy_reg_adjacent_x2_ilp3(const void*);
+double copy_reg_adjacent_x2_ilp4(const void*);
+double copy_reg_adjacent_x2_ilp5(const void*);
+double copy_reg_adjacent_x2_ilp6(const void*);
+double copy_reg_adjacent_x2_ilp7(const void*);
+double copy_reg_adjacent_x2_ilp8(const void*);
+double copy_reg_adjacent_x2_p75_ilp1(const void*);
+double copy_reg_adjacent_x2_p75_ilp2(const void*);
+double copy_reg_adjacent_x2_p75_ilp3(const void*);
+double copy_reg_adjacent_x2_p75_ilp4(const void*);
+double copy_reg_adjacent_x2_p75_ilp5(const void*);
+double copy_reg_adjacent_x2_p75_ilp6(const void*);
+double copy_reg_adjacent_x2_p75_ilp7(const void*);
+double copy_reg_adjacent_x2_p75_ilp8(const void*);
+double copy_reg_adjacent_x2_p50_ilp1(const void*);
+double copy_reg_adjacent_x2_p50_ilp2(const void*);
+double copy_reg_adjacent_x2_p50_ilp3(const void*);
+double copy_reg_adjacent_x2_p50_ilp4(const void*);
+double copy_reg_adjacent_x2_p50_ilp5(const void*);
+double copy_reg_adjacent_x2_p50_ilp6(const void*);
+double copy_reg_adjacent_x2_p50_ilp7(const void*);
+double copy_reg_adjacent_x2_p50_ilp8(const void*);
+double copy_reg_adjacent_x2_p25_ilp1(const void*);
+double copy_reg_adjacent_x2_p25_ilp2(const void*);
+double copy_reg_adjacent_x2_p25_ilp3(const void*);
+double copy_reg_adjacent_x2_p25_ilp4(const void*);
+double copy_reg_adjacent_x2_p25_ilp5(const void*);
+double copy_reg_adjacent_x2_p25_ilp6(const void*);
+double copy_reg_adjacent_x2_p25_ilp7(const void*);
+double copy_reg_adjacent_x2_p25_ilp8(const void*);
+double load_reg_adjacent_x4_ilp1(const void*);
+double load_reg_adjacent_x4_ilp2(const void*);
+double load_reg_adjacent_x4_ilp3(const void*);
+double load_reg_adjacent_x4_ilp4(const void*);
+double load_reg_adjacent_x4_ilp5(const void*);
+double load_reg_adjacent_x4_ilp6(const void*);
+double load_reg_adjacent_x4_ilp7(const void*);
+double load_reg_adjacent_x4_ilp8(const void*);
+double load_reg_adjacent_x4_p75_ilp1(const void*);
+double load_reg_adjacent_x4_p75_ilp2(const void*);
+double load_reg_adjacent_x4_p75_ilp3(const void*);
+double load_reg_adjacent_x4_p75_ilp4(const void*);
+double load_reg_adjacent_x4_p75_ilp5(const void*);
+double load_reg_adjacent_x4_p75_ilp6(const void*);
+double load_reg_adjacent_x4_p75_ilp7(const void*);
+double load_reg_adjacent_x4_p75_ilp8(const void*);
+double load_reg_adjacent_x4_p50_ilp1(const void*);
+double load_reg_adjacent_x4_p50_ilp2(const void*);
+double load_reg_adjacent_x4_p50_ilp3(const void*);
+double load_reg_adjacent_x4_p50_ilp4(const void*);
+double load_reg_adjacent_x4_p50_ilp5(const void*);
+double load_reg_adjacent_x4_p50_ilp6(const void*);
+double load_reg_adjacent_x4_p50_ilp7(const void*);
+double load_reg_adjacent_x4_p50_ilp8(const void*);
+double load_reg_adjacent_x4_p25_ilp1(const void*);
+double load_reg_adjacent_x4_p25_ilp2(const void*);
+double load_reg_adjacent_x4_p25_ilp3(const void*);
+double load_reg_adjacent_x4_p25_ilp4(const void*);
+double load_reg_adjacent_x4_p25_ilp5(const void*);
+double load_reg_adjacent_x4_p25_ilp6(const void*);
+double load_reg_adjacent_x4_p25_ilp7(const void*);
+double load_reg_adjacent_x4_p25_ilp8(const void*);
+double store_reg_adjacent_x4_ilp1(const void*);
+double store_reg_adjacent_x4_ilp2(const void*);
+double store_reg_adjacent_x4_ilp3(const void*);
+double store_reg_adjacent_x4_ilp4(const void*);
+double store_reg_adjacent_x4_ilp5(const void*);
+double store_reg_adjacent_x4_ilp6(const void*);
+double store_reg_adjacent_x4_ilp7(const void*);
+double store_reg_adjacent_x4_ilp8(const void*);
+double store_reg_adjacent_x4_p75_ilp1(const void*);
+double store_reg_adjacent_x4_p75_ilp2(const void*);
+double store_reg_adjacent_x4_p75_ilp3(const void*);
+double store_reg_adjacent_x4_p75_ilp4(const void*);
+double store_reg_adjacent_x4_p75_ilp5(const void*);
+double store_reg_adjacent_x4_p75_ilp6(const void*);
+double store_reg_adjacent_x4_p75_ilp7(const void*);
+double store_reg_adjacent_x4_p75_ilp8(const void*);
+double store_reg_adjacent_x4_p50_ilp1(const void*);
+double store_reg_adjacent_x4_p50_ilp2(const void*);
+double store_reg_adjacent_x4_p50_ilp3(const void*);
+double store_reg_adjacent_x4_p50_ilp4(const void*);
+double store_reg_adjacent_x4_p50_ilp5(const void*);
+double store_reg_adjacent_x4_p50_ilp6(const void*);
+double store_reg_adjacent_x4_p50_ilp7(const void*);
+double store_reg_adjacent_x4_p50_ilp8(const void*);
+double store_reg_adjacent_x4_p25_ilp1(const void*);
+double store_reg_adjacent_x4_p25_ilp2(const void*);
+double store_reg_adjacent_x4_p25_ilp3(const void*);
+double store_reg_adjacent_x4_p25_ilp4(const void*);
+double store_reg_adjacent_x4_p25_ilp5(const void*);
+double store_reg_adjacent_x4_p25_ilp6(const void*);
+double store_reg_adjacent_x4_p25_ilp7(const void*);
+double store_reg_adjacent_x4_p25_ilp8(const void*);
+double copy_reg_adjacent_x4_ilp1(const void*);
+double copy_reg_adjacent_x4_ilp2(const void*);
+double copy_reg_adjacent_x4_ilp3(const void*);
+double copy_reg_adjacent_x4_ilp4(const void*);
+double copy_reg_adjacent_x4_ilp5(const void*);
+double copy_reg_adjacent_x4_ilp6(const void*);
+double copy_reg_adjacent_x4_ilp7(const void*);
+double copy_reg_adjacent_x4_ilp8(const void*);
+double copy_reg_adjacent_x4_p75_ilp1(const void*);
+double copy_reg_adjacent_x4_p75_ilp2(const void*);
+double copy_reg_adjacent_x4_p75_ilp3(const void*);
+double copy_reg_adjacent_x4_p75_ilp4(const void*);
+double copy_reg_adjacent_x4_p75_ilp5(const void*);
+double copy_reg_adjacent_x4_p75_ilp6(const void*);
+double copy_reg_adjacent_x4_p75_ilp7(const void*);
+double copy_reg_adjacent_x4_p75_ilp8(const void*);
+double copy_reg_adjacent_x4_p50_ilp1(const void*);
+double copy_reg_adjacent_x4_p50_ilp2(const void*);
+double copy_reg_adjacent_x4_p50_ilp3(const void*);
+double copy_reg_adjacent_x4_p50_ilp4(const void*);
+double copy_reg_adjacent_x4_p50_ilp5(const void*);
+double copy_reg_adjacent_x4_p50_ilp6(const void*);
+double copy_reg_adjacent_x4_p50_ilp7(const void*);
+double copy_reg_adjacent_x4_p50_ilp8(const void*);
+double copy_reg_adjacent_x4_p25_ilp1(const void*);
+double copy_reg_adjacent_x4_p25_ilp2(const void*);
+double copy_reg_adjacent_x4_p25_ilp3(const void*);
+double copy_reg_adjacent_x4_p25_ilp4(const void*);
+double copy_reg_adjacent_x4_p25_ilp5(const void*);
+double copy_reg_adjacent_x4_p25_ilp6(const void*);
+double copy_reg_adjacent_x4_p25_ilp7(const void*);
+double copy_reg_adjacent_x4_p25_ilp8(const void*);
+double load_reg_strided_x2_ilp1(const void*);
+double load_reg_strided_x2_ilp2(const void*);
+double load_reg_strided_x2_ilp3(const void*);
+double load_reg_strided_x2_ilp4(const void*);
+double load_reg_strided_x2_ilp5(const void*);
+double load_reg_strided_x2_ilp6(const void*);
+double load_reg_strided_x2_ilp7(const void*);
+double load_reg_strided_x2_ilp8(const void*);
+double load_reg_strided_x2_p75_ilp1(const void*);
+double load_reg_strided_x2_p75_ilp2(const void*);
+double load_reg_strided_x2_p75_ilp3(const void*);
+double load_reg_strided_x2_p75_ilp4(const void*);
+double load_reg_strided_x2_p75_ilp5(const void*);
+double load_reg_strided_x2_p75_ilp6(const void*);
+double load_reg_strided_x2_p75_ilp7(const void*);
+double load_reg_strided_x2_p75_ilp8(const void*);
+double load_reg_strided_x2_p50_ilp1(const void*);
+double load_reg_strided_x2_p50_ilp2(const void*);
+double load_reg_strided_x2_p50_ilp3(const void*);
+double load_reg_strided_x2_p50_ilp4(const void*);
+double load_reg_strided_x2_p50_ilp5(const void*);
+double load_reg_strided_x2_p50_ilp6(const void*);
+double load_reg_strided_x2_p50_ilp7(const void*);
+double load_reg_strided_x2_p50_ilp8(const void*);
+double load_reg_strided_x2_p25_ilp1(const void*);
+double load_reg_strided_x2_p25_ilp2(const void*);
+double load_reg_strided_x2_p25_ilp3(const void*);
+double load_reg_strided_x2_p25_ilp4(const void*);
+double load_reg_strided_x2_p25_ilp5(const void*);
+double load_reg_strided_x2_p25_ilp6(const void*);
+double load_reg_strided_x2_p25_ilp7(const void*);
+double load_reg_strided_x2_p25_ilp8(const void*);
+double store_reg_strided_x2_ilp1(const void*);
+double store_reg_strided_x2_ilp2(const void*);
+double store_reg_strided_x2_ilp3(const void*);
+double store_reg_strided_x2_ilp4(const void*);
+double store_reg_strided_x2_ilp5(const void*);
+double store_reg_strided_x2_ilp6(const void*);
+double store_reg_strided_x2_ilp7(const void*);
+double store_reg_strided_x2_ilp8(const void*);
+double store_reg_strided_x2_p75_ilp1(const void*);
+double store_reg_strided_x2_p75_ilp2(const void*);
+double store_reg_strided_x2_p75_ilp3(const void*);
+double store_reg_strided_x2_p75_ilp4(const void*);
+double store_reg_strided_x2_p75_ilp5(const void*);
+double store_reg_strided_x2_p75_ilp6(const void*);
+double store_reg_strided_x2_p75_ilp7(const void*);
+double store_reg_strided_x2_p75_ilp8(const void*);
+double store_reg_strided_x2_p50_ilp1(const void*);
+double store_reg_strided_x2_p50_ilp2(const void*);
+double store_reg_strided_x2_p50_ilp3(const void*);
+double store_reg_strided_x2_p50_ilp4(const void*);
+double store_reg_strided_x2_p50_ilp5(const void*);
+double store_reg_strided_x2_p50_ilp6(const void*);
+double store_reg_strided_x2_p50_ilp7(const void*);
+double store_reg_strided_x2_p50_ilp8(const void*);
+double store_reg_strided_x2_p25_ilp1(const void*);
+double store_reg_strided_x2_p25_ilp2(const void*);
+double store_reg_strided_x2_p25_ilp3(const void*);
+double store_reg_strided_x2_p25_ilp4(const void*);
+double store_reg_strided_x2_p25_ilp5(const void*);
+double store_reg_strided_x2_p25_ilp6(const void*);
+double store_reg_strided_x2_p25_ilp7(const void*);
+double store_reg_strided_x2_p25_ilp8(const void*);
+double copy_reg_strided_x2_ilp1(const void*);
+double copy_reg_strided_x2_ilp2(const void*);
+double copy_reg_strided_x2_ilp3(const void*);
+double copy_reg_strided_x2_ilp4(const void*);
+double copy_reg_strided_x2_ilp5(const void*);
+double copy_reg_strided_x2_ilp6(const void*);
+double copy_reg_strided_x2_ilp7(const void*);
+double copy_reg_strided_x2_ilp8(const void*);
+double copy_reg_strided_x2_p75_ilp1(const void*);
+double copy_reg_strided_x2_p75_ilp2(const void*);
+double copy_reg_strided_x2_p75_ilp3(const void*);
+double copy_reg_strided_x2_p75_ilp4(const void*);
+double copy_reg_strided_x2_p75_ilp5(const void*);
+double copy_reg_strided_x2_p75_ilp6(const void*);
+double copy_reg_strided_x2_p75_ilp7(const void*);
+double copy_reg_strided_x2_p75_ilp8(const void*);
+double copy_reg_strided_x2_p50_ilp1(const void*);
+double copy_reg_strided_x2_p50_ilp2(const void*);
+double copy_reg_strided_x2_p50_ilp3(const void*);
+double copy_reg_strided_x2_p50_ilp4(const void*);
+double copy_reg_strided_x2_p50_ilp5(const void*);
+double copy_reg_strided_x2_p50_ilp6(const void*);
+double copy_reg_strided_x2_p50_ilp7(const void*);
+double copy_reg_strided_x2_p50_ilp8(const void*);
+double copy_reg_strided_x2_p25_ilp1(const void*);
+double copy_reg_strided_x2_p25_ilp2(const void*);
+double copy_reg_strided_x2_p25_ilp3(const void*);
+double copy_reg_strided_x2_p25_ilp4(const void*);
+double copy_reg_strided_x2_p25_ilp5(const void*);
+double copy_reg_strided_x2_p25_ilp6(const void*);
+double copy_reg_strided_x2_p25_ilp7(const void*);
+double copy_reg_strided_x2_p25_ilp8(const void*);
+double load_reg_strided_x4_ilp1(const void*);
+double load_reg_strided_x4_ilp2(const void*);
+double load_reg_strided_x4_ilp3(const void*);
+double load_reg_strided_x4_ilp4(const void*);
+double load_reg_strided_x4_ilp5(const void*);
+double load_reg_strided_x4_ilp6(const void*);
+double load_reg_strided_x4_ilp7(const void*);
+double load_reg_strided_x4_ilp8(const void*);
+double load_reg_strided_x4_p75_ilp1(const void*);
+double load_reg_strided_x4_p75_ilp2(const void*);
+double load_reg_strided_x4_p75_ilp3(const void*);
+double load_reg_strided_x4_p75_ilp4(const void*);
+double load_reg_strided_x4_p75_ilp5(const void*);
+double load_reg_strided_x4_p75_ilp6(const void*);
+double load_reg_strided_x4_p75_ilp7(const void*);
+double load_reg_strided_x4_p75_ilp8(const void*);
+double load_reg_strided_x4_p50_ilp1(const void*);
+double load_reg_strided_x4_p50_ilp2(const void*);
+double load_reg_strided_x4_p50_ilp3(const void*);
+double load_reg_strided_x4_p50_ilp4(const void*);
+double load_reg_strided_x4_p50_ilp5(const void*);
+double load_reg_strided_x4_p50_ilp6(const void*);
+double load_reg_strided_x4_p50_ilp7(const void*);
+double load_reg_strided_x4_p50_ilp8(const void*);
+double load_reg_strided_x4_p25_ilp1(const void*);
+double load_reg_strided_x4_p25_ilp2(const void*);
+double load_reg_strided_x4_p25_ilp3(const void*);
+double load_reg_strided_x4_p25_ilp4(const void*);
+double load_reg_strided_x4_p25_ilp5(const void*);
+double load_reg_strided_x4_p25_ilp6(const void*);
+double load_reg_strided_x4_p25_ilp7(const void*);
+double load_reg_strided_x4_p25_ilp8(const void*);
+double store_reg_strided_x4_ilp1(const void*);
+double store_reg_strided_x4_ilp2(const void*);
+double store_reg_strided_x4_ilp3(const void*);
+double store_reg_strided_x4_ilp4(const void*);
+double store_reg_strided_x4_ilp5(const void*);
+double store_reg_strided_x4_ilp6(const void*);
+double store_reg_strided_x4_ilp7(const void*);
+double store_reg_strided_x4_ilp8(const void*);
+double store_reg_strided_x4_p75_ilp1(const void*);
+double store_reg_strided_x4_p75_ilp2(const void*);
+double store_reg_strided_x4_p75_ilp3(const void*);
+double store_reg_strided_x4_p75_ilp4(const void*);
+double store_reg_strided_x4_p75_ilp5(const void*);
+double store_reg_strided_x4_p75_ilp6(const void*);
+double store_reg_strided_x4_p75_ilp7(const void*);
+double store_reg_strided_x4_p75_ilp8(const void*);
+double store_reg_strided_x4_p50_ilp1(const void*);
+double store_reg_strided_x4_p50_ilp2(const void*);
+double store_reg_strided_x4_p50_ilp3(const void*);
+double store_reg_strided_x4_p50_ilp4(const void*);
+double store_reg_strided_x4_p50_ilp5(const void*);
+double store_reg_strided_x4_p50_ilp6(const void*);
+double store_reg_strided_x4_p50_ilp7(const void*);
+double store_reg_strided_x4_p50_ilp8(const void*);
+double store_reg_strided_x4_p25_ilp1(const void*);
+double store_reg_strided_x4_p25_ilp2(const void*);
+double store_reg_strided_x4_p25_ilp3(const void*);
+double store_reg_strided_x4_p25_ilp4(const void*);
+double store_reg_strided_x4_p25_ilp5(const void*);
+double store_reg_strided_x4_p25_ilp6(const void*);
+double store_reg_strided_x4_p25_ilp7(const void*);
+double store_reg_strided_x4_p25_ilp8(const void*);
+double copy_reg_strided_x4_ilp1(const void*);
+double copy_reg_strided_x4_ilp2(const void*);
+double copy_reg_strided_x4_ilp3(const void*);
+double copy_reg_strided_x4_ilp4(const void*);
+double copy_reg_strided_x4_ilp5(const void*);
+double copy_reg_strided_x4_ilp6(const void*);
+double copy_reg_strided_x4_ilp7(const void*);
+double copy_reg_strided_x4_ilp8(const void*);
+double copy_reg_strided_x4_p75_ilp1(const void*);
+double copy_reg_strided_x4_p75_ilp2(const void*);
+double copy_reg_strided_x4_p75_ilp3(const void*);
+double copy_reg_strided_x4_p75_ilp4(const void*);
+double copy_reg_strided_x4_p75_ilp5(const void*);
+double copy_reg_strided_x4_p75_ilp6(const void*);
+double copy_reg_strided_x4_p75_ilp7(const void*);
+double copy_reg_strided_x4_p75_ilp8(const void*);
+double copy_reg_strided_x4_p50_ilp1(const void*);
+double copy_reg_strided_x4_p50_ilp2(const void*);
+double copy_reg_strided_x4_p50_ilp3(const void*);
+double copy_reg_strided_x4_p50_ilp4(const void*);
+double copy_reg_strided_x4_p50_ilp5(const void*);
+double copy_reg_strided_x4_p50_ilp6(const void*);
+double copy_reg_strided_x4_p50_ilp7(const void*);
+double copy_reg_strided_x4_p50_ilp8(const void*);
+double copy_reg_strided_x4_p25_ilp1(const void*);
+double copy_reg_strided_x4_p25_ilp2(const void*);
+double copy_reg_strided_x4_p25_ilp3(const void*);
+double copy_reg_strided_x4_p25_ilp4(const void*);
+double copy_reg_strided_x4_p25_ilp5(const void*);
+double copy_reg_strided_x4_p25_ilp6(const void*);
+double copy_reg_strided_x4_p25_ilp7(const void*);
+double copy_reg_strided_x4_p25_ilp8(const void*);
+
+// benchmark setup
+#define MB(x) (size_t)x*1048576UL
+
+static size_t find_n_iterations(size_t size, size_t transfer_size) {
+  // transfer at least transfer_size bytes
+  size_t n = transfer_size/size;
+  n = n < 16 ? 16 : n;
+  return n;
+}
+
+static void* setup(const void* args) {
+  const mem_benchmark_params_t* params = args;
+
+  // allocations must be done in steps of SIZE_ALIGNMENT
+  assert(params->size % SIZE_ALIGNMENT == 0);
+
+  // at least 16-byte alignment
+  assert(params->alignment % 16UL == 0);
+
+  // allocate buffer for the benchmark
+  benchmark_data_t* data = malloc(sizeof(benchmark_data_t));
+  data->size = params->size;
+  data->src = aligned_alloc(params->alignment, params->size);
+  data->dst = aligned_alloc(params->alignment, params->size);
+  data->n_iterations = find_n_iterations(data->size, params->transfer_size);
+  data->total_size = (double)data->size*(double)data->n_iterations;
+
+  assert(data->src != nullptr);
+  assert(data->dst != nullptr);
+
+  return data;
+}
+
+static void teardown(void* args) {
+  benchmark_data_t* data = args;
+
+  free(data->src); data->src = nullptr;
+  free(data->dst); data->src = nullptr;
+  free(data);
+}
+
+
+// benchmark buffer sizes (none, use the harness defaults)
+const size_t* _Nullable mem_benchmark_sizes = nullptr;
+const size_t mem_benchmark_sizes_count = 0;
+
+// benchmark table
+static const mem_benchmark_t benchmarks[] = {
+  {{ &setup, &load_za_vector_x1_ilp1, &teardown }, "LDR (ZA vector)", "za-vector", "FEAT_SME2", "load", 1, -1, 1, 1.0, 536870912},
+  {{ &setup, &load_za_vector_x1_ilp2, &teardown }, "LDR (ZA vector)", "za-vector", "FEAT_SME2", "load", 1, -1, 2, 1.0, 536870912},
+  {{ &setup, &load_za_vector_x1_ilp3, &teardown }, "LDR (ZA vector)", "za-vector", "FEAT_SME2", "load", 1, -1, 3, 1.0, 536870912},
+  {{ &setup, &load_za_vector_x1_ilp4, &teardown }, "LDR (ZA vector)", "za-vector", "FEAT_SME2", "load", 1, -1, 4, 1.0, 536870912},
+  {{ &setup, &load_za_vector_x1_ilp5, &teardown }, "LDR (ZA vector)", "za-vector", "FEAT_SME2", "load", 1, -1, 5, 1.0, 536870912},
+  {{ &setup, &load_za_vector_x1_ilp6, &teardown }, "LDR (ZA vector)", "za-vector", "FEAT_SME2", "load", 1, -1, 6, 1.0, 536870912},
+  {{ &setup, &load_za_vector_x1_ilp7, &teardown }, "LDR (ZA vector)", "za-vector", "FEAT_SME2", "load", 1, -1, 7, 1.0, 536870912},
+  {{ &setup, &load_za_vector_x1_ilp8, &teardown }, "LDR (ZA vector)", "za-vector", "FEAT_SME2", "load", 1, -1, 8, 1.0, 536870912},
+  {{ &setup, &load_za_vector_x1_ilp9, &teardown }, "LDR (ZA vector)", "za-vector", "FEAT_SME2", "load", 1, -1, 9, 1.0, 536870912},
+  {{ &setup, &load_za_vector_x1_ilp10, &teardown }, "LDR (ZA vector)", "za-vector", "FEAT_SME2", "load", 1, -1, 10, 1.0, 536870912},
+  {{ &setup, &load_za_vector_x1_ilp11, &teardown }, "LDR (ZA vector)", "za-vector", "FEAT_SME2", "load", 1, -1, 11, 1.0, 536870912},
+  {{ &setup, &load_za_vector_x1_ilp12, &teardown }, "LDR (ZA vector)", "za-vector", "FEAT_SME2", "load", 1, -1, 12, 1.0, 536870912},
+  {{ &setup, &load_za_vector_x1_ilp13, &teardown }, "LDR (ZA vector)", "za-vector", "FEAT_SME2", "load", 1, -1, 13, 1.0, 536870912},
+  {{ &setup, &load_za_vector_x1_ilp14, &teardown }, "LDR (ZA vector)", "za-vector", "FEAT_SME2", "load", 1, -1, 14, 1.0, 536870912},
+  {{ &setup, &load_za_vector_x1_ilp15, &teardown }, "LDR (ZA vector)", "za-vector", "FEAT_SME2", "load", 1, -1, 15, 1.0, 536870912},
+  {{ &setup, &load_za_vector_x1_ilp16, &teardown }, "LDR (ZA vector)", "za-vector", "FEAT_SME2", "load", 1, -1, 16, 1.0, 536870912},
+  {{ &setup, &store_za_vector_x1_ilp1, &teardown }, "STR (ZA vector)", "za-vector", "FEAT_SME2", "store", 1, -1, 1, 1.0, 536870912},
+  {{ &setup, &store_za_vector_x1_ilp2, &teardown }, "STR (ZA vector)", "za-vector", "FEAT_SME2", "store", 1, -1, 2, 1.0, 536870912},
+  {{ &setup, &store_za_vector_x1_ilp3, &teardown }, "STR (ZA vector)", "za-vector", "FEAT_SME2", "store", 1, -1, 3, 1.0, 536870912},
+  {{ &setup, &store_za_vector_x1_ilp4, &teardown }, "STR (ZA vector)", "za-vector", "FEAT_SME2", "store", 1, -1, 4, 1.0, 536870912},
+  {{ &setup, &store_za_vector_x1_ilp5, &teardown }, "STR (ZA vector)", "za-vector", "FEAT_SME2", "store", 1, -1, 5, 1.0, 536870912},
+  {{ &setup, &store_za_vector_x1_ilp6, &teardown }, "STR (ZA vector)", "za-vector", "FEAT_SME2", "store", 1, -1, 6, 1.0, 536870912},
+  {{ &setup, &store_za_vector_x1_ilp7, &teardown }, "STR (ZA vector)", "za-vector", "FEAT_SME2", "store", 1, -1, 7, 1.0, 536870912},
+  {{ &setup, &store_za_vector_x1_ilp8, &teardown }, "STR (ZA vector)", "za-vector", "FEAT_SME2", "store", 1, -1, 8, 1.0, 536870912},
+  {{ &setup, &store_za_vector_x1_ilp9, &teardown }, "STR (ZA vector)", "za-vector", "FEAT_SME2", "store", 1, -1, 9, 1.0, 536870912},
+  {{ &setup, &store_za_vector_x1_ilp10, &teardown }, "STR (ZA vector)", "za-vector", "FEAT_SME2", "store", 1, -1, 10, 1.0, 536870912},
+  {{ &setup, &store_za_vector_x1_ilp11, &teardown }, "STR (ZA vector)", "za-vector", "FEAT_SME2", "store", 1, -1, 11, 1.0, 536870912},
+  {{ &setup, &store_za_vector_x1_ilp12, &teardown }, "STR (ZA vector)", "za-vector", "FEAT_SME2", "store", 1, -1, 12, 1.0, 536870912},
+  {{ &setup, &store_za_vector_x1_ilp13, &teardown }, "STR (ZA vector)", "za-vector", "FEAT_SME2", "store", 1, -1, 13, 1.0, 536870912},
+  {{ &setup, &store_za_vector_x1_ilp14, &teardown }, "STR (ZA vector)", "za-vector", "FEAT_SME2", "store", 1, -1, 14, 1.0, 536870912},
+  {{ &setup, &store_za_vector_x1_ilp15, &teardown }, "STR (ZA vector)", "za-vector", "FEAT_SME2", "store", 1, -1, 15, 1.0, 536870912},
+  {{ &setup, &store_za_vector_x1_ilp16, &teardown }, "STR (ZA vector)", "za-vector", "FEAT_SME2", "store", 1, -1, 16, 1.0, 536870912},
+  {{ &setup, &copy_za_vector_x1_ilp1, &teardown }, "LDR/STR (ZA vector)", "za-vector", "FEAT_SME2", "copy", 1, -1, 1, 1.0, 536870912},
+  {{ &setup, &copy_za_vector_x1_ilp2, &teardown }, "LDR/STR (ZA vector)", "za-vector", "FEAT_SME2", "copy", 1, -1, 2, 1.0, 536870912},
+  {{ &setup, &copy_za_vector_x1_ilp3, &teardown }, "LDR/STR (ZA vector)", "za-vector", "FEAT_SME2", "copy", 1, -1, 3, 1.0, 536870912},
+  {{ &setup, &copy_za_vector_x1_ilp4, &teardown }, "LDR/STR (ZA vector)", "za-vector", "FEAT_SME2", "copy", 1, -1, 4, 1.0, 536870912},
+  {{ &setup, &copy_za_vector_x1_ilp5, &teardown }, "LDR/STR (ZA vector)", "za-vector", "FEAT_SME2", "copy", 1, -1, 5, 1.0, 536870912},
+  {{ &setup, &copy_za_vector_x1_ilp6, &teardown }, "LDR/STR (ZA vector)", "za-vector", "FEAT_SME2", "copy", 1, -1, 6, 1.0, 536870912},
+  {{ &setup, &copy_za_vector_x1_ilp7, &teardown }, "LDR/STR (ZA vector)", "za-vector", "FEAT_SME2", "copy", 1, -1, 7, 1.0, 536870912},
+  {{ &setup, &copy_za_vector_x1_ilp8, &teardown }, "LDR/STR (ZA vector)", "za-vector", "FEAT_SME2", "copy", 1, -1, 8, 1.0, 536870912},
+  {{ &setup, &copy_za_vector_x1_ilp9, &teardown }, "LDR/STR (ZA vector)", "za-vector", "FEAT_SME2", "copy", 1, -1, 9, 1.0, 536870912},
+  {{ &setup, &copy_za_vector_x1_ilp10, &teardown }, "LDR/STR (ZA vector)", "za-vector", "FEAT_SME2", "copy", 1, -1, 10, 1.0, 536870912},
+  {{ &setup, &copy_za_vector_x1_ilp11, &teardown }, "LDR/STR (ZA vector)", "za-vector", "FEAT_SME2", "copy", 1, -1, 11, 1.0, 536870912},
+  {{ &setup, &copy_za_vector_x1_ilp12, &teardown }, "LDR/STR (ZA vector)", "za-vector", "FEAT_SME2", "copy", 1, -1, 12, 1.0, 536870912},
+  {{ &setup, &copy_za_vector_x1_ilp13, &teardown }, "LDR/STR (ZA vector)", "za-vector", "FEAT_SME2", "copy", 1, -1, 13, 1.0, 536870912},
+  {{ &setup, &copy_za_vector_x1_ilp14, &teardown }, "LDR/STR (ZA vector)", "za-vector", "FEAT_SME2", "copy", 1, -1, 14, 1.0, 536870912},
+  {{ &setup, &copy_za_vector_x1_ilp15, &teardown }, "LDR/STR (ZA vector)", "za-vector", "FEAT_SME2", "copy", 1, -1, 15, 1.0, 536870912},
+  {{ &setup, &copy_za_vector_x1_ilp16, &teardown }, "LDR/STR (ZA vector)", "za-vector", "FEAT_SME2", "copy", 1, -1, 16, 1.0, 536870912},
+  {{ &setup, &load_reg_adjacent_x1_ilp1, &teardown }, "LDR (one register, unpredicated)", "reg-adjacent", "FEAT_SME2", "load", 1, -1, 1, 1.0, 536870912},
+  {{ &setup, &load_reg_adjacent_x1_ilp2, &teardown }, "LDR (one register, unpredicated)", "reg-adjacent", "FEAT_SME2", "load", 1, -1, 2, 1.0, 536870912},
+  {{ &setup, &load_reg_adjacent_x1_ilp3, &teardown }, "LDR (one register, unpredicated)", "reg-adjacent", "FEAT_SME2", "load", 1, -1, 3, 1.0, 536870912},
+  {{ &setup, &load_reg_adjacent_x1_ilp4, &teardown }, "LDR (one register, unpredicated)", "reg-adjacent", "FEAT_SME2", "load", 1, -1, 4, 1.0, 536870912},
+  {{ &setup, &load_reg_adjacent_x1_ilp5, &teardown }, "LDR (one register, unpredicated)", "reg-adjacent", "FEAT_SME2", "load", 1, -1, 5, 1.0, 536870912},
+  {{ &setup, &load_reg_adjacent_x1_ilp6, &teardown }, "LDR (one register, unpredicated)", "reg-adjacent", "FEAT_SME2", "load", 1, -1, 6, 1.0, 536870912},
+  {{ &setup, &load_reg_adjacent_x1_ilp7, &teardown }, "LDR (one register, unpredicated)", "reg-adjacent", "FEAT_SME2", "load", 1, -1, 7, 1.0, 536870912},
+  {{ &setup, &load_reg_adjacent_x1_ilp8, &teardown }, "LDR (one register, unpredicated)", "reg-adjacent", "FEAT_SME2", "load", 1, -1, 8, 1.0, 536870912},
+  {{ &setup, &store_reg_adjacent_x1_ilp1, &teardown }, "STR (one register, unpredicated)", "reg-adjacent", "FEAT_SME2", "store", 1, -1, 1, 1.0, 536870912},
+  {{ &setup, &store_reg_adjacent_x1_ilp2, &teardown }, "STR (one register, unpredicated)", "reg-adjacent", "FEAT_SME2", "store", 1, -1, 2, 1.0, 536870912},
+  {{ &setup, &store_reg_adjacent_x1_ilp3, &teardown }, "STR (one register, unpredicated)", "reg-adjacent", "FEAT_SME2", "store", 1, -1, 3, 1.0, 536870912},
+  {{ &setup, &store_reg_adjacent_x1_ilp4, &teardown }, "STR (one register, unpredicated)", "reg-adjacent", "FEAT_SME2", "store", 1, -1, 4, 1.0, 536870912},
+  {{ &setup, &store_reg_adjacent_x1_ilp5, &teardown }, "STR (one register, unpredicated)", "reg-adjacent", "FEAT_SME2", "store", 1, -1, 5, 1.0, 536870912},
+  {{ &setup, &store_reg_adjacent_x1_ilp6, &teardown }, "STR (one register, unpredicated)", "reg-adjacent", "FEAT_SME2", "store", 1, -1, 6, 1.0, 536870912},
+  {{ &setup, &store_reg_adjacent_x1_ilp7, &teardown }, "STR (one register, unpredicated)", "reg-adjacent", "FEAT_SME2", "store", 1, -1, 7, 1.0, 536870912},
+  {{ &setup, &store_reg_adjacent_x1_ilp8, &teardown }, "STR (one register, unpredicated)", "reg-adjacent", "FEAT_SME2", "store", 1, -1, 8, 1.0, 536870912},
+  {{ &setup, &copy_reg_adjacent_x1_ilp1, &teardown }, "LDR/STR (one register, unpredicated)", "reg-adjacent", "FEAT_SME2", "copy", 1, -1, 1, 1.0, 536870912},
+  {{ &setup, &copy_reg_adjacent_x1_ilp2, &teardown }, "LDR/STR (one register, unpredicated)", "reg-adjacent", "FEAT_SME2", "copy", 1, -1, 2, 1.0, 536870912},
+  {{ &setup, &copy_reg_adjacent_x1_ilp3, &teardown }, "LDR/STR (one register, unpredicated)", "reg-adjacent", "FEAT_SME2", "copy", 1, -1, 3, 1.0, 536870912},
+  {{ &setup, &copy_reg_adjacent_x1_ilp4, &teardown }, "LDR/STR (one register, unpredicated)", "reg-adjacent", "FEAT_SME2", "copy", 1, -1, 4, 1.0, 536870912},
+  {{ &setup, &copy_reg_adjacent_x1_ilp5, &teardown }, "LDR/STR (one register, unpredicated)", "reg-adjacent", "FEAT_SME2", "copy", 1, -1, 5, 1.0, 536870912},
+  {{ &setup, &copy_reg_adjacent_x1_ilp6, &teardown }, "LDR/STR (one register, unpredicated)", "reg-adjacent", "FEAT_SME2", "copy", 1, -1, 6, 1.0, 536870912},
+  {{ &setup, &copy_reg_adjacent_x1_ilp7, &teardown }, "LDR/STR (one register, unpredicated)", "reg-adjacent", "FEAT_SME2", "copy", 1, -1, 7, 1.0, 536870912},
+  {{ &setup, &copy_reg_adjacent_x1_ilp8, &teardown }, "LDR/STR (one register, unpredicated)", "reg-adjacent", "FEAT_SME2", "copy", 1, -1, 8, 1.0, 536870912},
+  {{ &setup, &load_reg_adjacent_x2_ilp1, &teardown }, "LD1W (two register, adjacent, predicated)", "reg-adjacent", "FEAT_SME2", "load", 2, 32, 1, 1.0, 536870912},
+  {{ &setup, &load_reg_adjacent_x2_ilp2, &teardown }, "LD1W (two register, adjacent, predicated)", "reg-adjacent", "FEAT_SME2", "load", 2, 32, 2, 1.0, 536870912},
+  {{ &setup, &load_reg_adjacent_x2_ilp3, &teardown }, "LD1W (two register, adjacent, predicated)", "reg-adjacent", "FEAT_SME2", "load", 2, 32, 3, 1.0, 536870912},
+  {{ &setup, &load_reg_adjacent_x2_ilp4, &teardown }, "LD1W (two register, adjacent, predicated)", "reg-adjacent", "FEAT_SME2", "load", 2, 32, 4, 1.0, 536870912},
+  {{ &setup, &load_reg_adjacent_x2_ilp5, &teardown }, "LD1W (two register, adjacent, predicated)", "reg-adjacent", "FEAT_SME2", "load", 2, 32, 5, 1.0, 536870912},
+  {{ &setup, &load_reg_adjacent_x2_ilp6, &teardown }, "LD1W (two register, adjacent, predicated)", "reg-adjacent", "FEAT_SME2", "load", 2, 32, 6, 1.0, 536870912},
+  {{ &setup, &load_reg_adjacent_x2_ilp7, &teardown }, "LD1W (two register, adjacent, predicated)", "reg-adjacent", "FEAT_SME2", "load", 2, 32, 7, 1.0, 536870912},
+  {{ &setup, &load_reg_adjacent_x2_ilp8, &teardown }, "LD1W (two register, adjacent, predicated)", "reg-adjacent", "FEAT_SME2", "load", 2, 32, 8, 1.0, 536870912},
+  {{ &setup, &load_reg_adjacent_x2_p75_ilp1, &teardown }, "LD1W (two register, adjacent, predicated), 75% active lanes", "reg-adjacent", "FEAT_SME2", "load", 2, 32, 1, 0.75, 536870912},
+  {{ &setup, &load_reg_adjacent_x2_p75_ilp2, &teardown }, "LD1W (two register, adjacent, predicated), 75% active lanes", "reg-adjacent", "FEAT_SME2", "load", 2, 32, 2, 0.75, 536870912},
+  {{ &setup, &load_reg_adjacent_x2_p75_ilp3, &teardown }, "LD1W (two register, adjacent, predicated), 75% active lanes", "reg-adjacent", "FEAT_SME2", "load", 2, 32, 3, 0.75, 536870912},
+  {{ &setup, &load_reg_adjacent_x2_p75_ilp4, &teardown }, "LD1W (two register, adjacent, predicated), 75% active lanes", "reg-adjacent", "FEAT_SME2", "load", 2, 32, 4, 0.75, 536870912},
+  {{ &setup, &load_reg_adjacent_x2_p75_ilp5, &teardown }, "LD1W (two register, adjacent, predicated), 75% active lanes", "reg-adjacent", "FEAT_SME2", "load", 2, 32, 5, 0.75, 536870912},
+  {{ &setup, &load_reg_adjacent_x2_p75_ilp6, &teardown }, "LD1W (two register, adjacent, predicated), 75% active lanes", "reg-adjacent", "FEAT_SME2", "load", 2, 32, 6, 0.75, 536870912},
+  {{ &setup, &load_reg_adjacent_x2_p75_ilp7, &teardown }, "LD1W (two register, adjacent, predicated), 75% active lanes", "reg-adjacent", "FEAT_SME2", "load", 2, 32, 7, 0.75, 536870912},
+  {{ &setup, &load_reg_adjacent_x2_p75_ilp8, &teardown }, "LD1W (two register, adjacent, predicated), 75% active lanes", "reg-adjacent", "FEAT_SME2", "load", 2, 32, 8, 0.75, 536870912},
+  {{ &setup, &load_reg_adjacent_x2_p50_ilp1, &teardown }, "LD1W (two register, adjacent, predicated), 50% active lanes", "reg-adjacent", "FEAT_SME2", "load", 2, 32, 1, 0.5, 536870912},
+  {{ &setup, &load_reg_adjacent_x2_p50_ilp2, &teardown }, "LD1W (two register, adjacent, predicated), 50% active lanes", "reg-adjacent", "FEAT_SME2", "load", 2, 32, 2, 0.5, 536870912},
+  {{ &setup, &load_reg_adjacent_x2_p50_ilp3, &teardown }, "LD1W (two register, adjacent, predicated), 50% active lanes", "reg-adjacent", "FEAT_SME2", "load", 2, 32, 3, 0.5, 536870912},
+  {{ &setup, &load_reg_adjacent_x2_p50_ilp4, &teardown }, "LD1W (two register, adjacent, predicated), 50% active lanes", "reg-adjacent", "FEAT_SME2", "load", 2, 32, 4, 0.5, 536870912},
+  {{ &setup, &load_reg_adjacent_x2_p50_ilp5, &teardown }, "LD1W (two register, adjacent, predicated), 50% active lanes", "reg-adjacent", "FEAT_SME2", "load", 2, 32, 5, 0.5, 536870912},
+  {{ &setup, &load_reg_adjacent_x2_p50_ilp6, &teardown }, "LD1W (two register, adjacent, predicated), 50% active lanes", "reg-adjacent", "FEAT_SME2", "load", 2, 32, 6, 0.5, 536870912},
+  {{ &setup, &load_reg_adjacent_x2_p50_ilp7, &teardown }, "LD1W (two register, adjacent, predicated), 50% active lanes", "reg-adjacent", "FEAT_SME2", "load", 2, 32, 7, 0.5, 536870912},
+  {{ &setup, &load_reg_adjacent_x2_p50_ilp8, &teardown }, "LD1W (two register, adjacent, predicated), 50% active lanes", "reg-adjacent", "FEAT_SME2", "load", 2, 32, 8, 0.5, 536870912},
+  {{ &setup, &load_reg_adjacent_x2_p25_ilp1, &teardown }, "LD1W (two register, adjacent, predicated), 25% active lanes", "reg-adjacent", "FEAT_SME2", "load", 2, 32, 1, 0.25, 536870912},
+  {{ &setup, &load_reg_adjacent_x2_p25_ilp2, &teardown }, "LD1W (two register, adjacent, predicated), 25% active lanes", "reg-adjacent", "FEAT_SME2", "load", 2, 32, 2, 0.25, 536870912},
+  {{ &setup, &load_reg_adjacent_x2_p25_ilp3, &teardown }, "LD1W (two register, adjacent, predicated), 25% active lanes", "reg-adjacent", "FEAT_SME2", "load", 2, 32, 3, 0.25, 536870912},
+  {{ &setup, &load_reg_adjacent_x2_p25_ilp4, &teardown }, "LD1W (two register, adjacent, predicated), 25% active lanes", "reg-adjacent", "FEAT_SME2", "load", 2, 32, 4, 0.25, 536870912},
+  {{ &setup, &load_reg_adjacent_x2_p25_ilp5, &teardown }, "LD1W (two register, adjacent, predicated), 25% active lanes", "reg-adjacent", "FEAT_SME2", "load", 2, 32, 5, 0.25, 536870912},
+  {{ &setup, &load_reg_adjacent_x2_p25_ilp6, &teardown }, "LD1W (two register, adjacent, predicated), 25% active lanes", "reg-adjacent", "FEAT_SME2", "load", 2, 32, 6, 0.25, 536870912},
+  {{ &setup, &load_reg_adjacent_x2_p25_ilp7, &teardown }, "LD1W (two register, adjacent, predicated), 25% active lanes", "reg-adjacent", "FEAT_SME2", "load", 2, 32, 7, 0.25, 536870912},
+  {{ &setup, &load_reg_adjacent_x2_p25_ilp8, &teardown }, "LD1W (two register, adjacent, predicated), 25% active lanes", "reg-adjacent", "FEAT_SME2", "load", 2, 32, 8, 0.25, 536870912},
+  {{ &setup, &store_reg_adjacent_x2_ilp1, &teardown }, "ST1W (two register, adjacent, predicated)", "reg-adjacent", "FEAT_SME2", "store", 2, 32, 1, 1.0, 536870912},
+  {{ &setup, &store_reg_adjacent_x2_ilp2, &teardown }, "ST1W (two register, adjacent, predicated)", "reg-adjacent", "FEAT_SME2", "store", 2, 32, 2, 1.0, 536870912},
+  {{ &setup, &store_reg_adjacent_x2_ilp3, &teardown }, "ST1W (two register, adjacent, predicated)", "reg-adjacent", "FEAT_SME2", "store", 2, 32, 3, 1.0, 536870912},
+  {{ &setup, &store_reg_adjacent_x2_ilp4, &teardown }, "ST1W (two register, adjacent, predicated)", "reg-adjacent", "FEAT_SME2", "store", 2, 32, 4, 1.0, 536870912},
+  {{ &setup, &store_reg_adjacent_x2_ilp5, &teardown }, "ST1W (two register, adjacent, predicated)", "reg-adjacent", "FEAT_SME2", "store", 2, 32, 5, 1.0, 536870912},
+  {{ &setup, &store_reg_adjacent_x2_ilp6, &teardown }, "ST1W (two register, adjacent, predicated)", "reg-adjacent", "FEAT_SME2", "store", 2, 32, 6, 1.0, 536870912},
+  {{ &setup, &store_reg_adjacent_x2_ilp7, &teardown }, "ST1W (two register, adjacent, predicated)", "reg-adjacent", "FEAT_SME2", "store", 2, 32, 7, 1.0, 536870912},
+  {{ &setup, &store_reg_adjacent_x2_ilp8, &teardown }, "ST1W (two register, adjacent, predicated)", "reg-adjacent", "FEAT_SME2", "store", 2, 32, 8, 1.0, 536870912},
+  {{ &setup, &store_reg_adjacent_x2_p75_ilp1, &teardown }, "ST1W (two register, adjacent, predicated), 75% active lanes", "reg-adjacent", "FEAT_SME2", "store", 2, 32, 1, 0.75, 536870912},
+  {{ &setup, &store_reg_adjacent_x2_p75_ilp2, &teardown }, "ST1W (two register, adjacent, predicated), 75% active lanes", "reg-adjacent", "FEAT_SME2", "store", 2, 32, 2, 0.75, 536870912},
+  {{ &setup, &store_reg_adjacent_x2_p75_ilp3, &teardown }, "ST1W (two register, adjacent, predicated), 75% active lanes", "reg-adjacent", "FEAT_SME2", "store", 2, 32, 3, 0.75, 536870912},
+  {{ &setup, &store_reg_adjacent_x2_p75_ilp4, &teardown }, "ST1W (two register, adjacent, predicated), 75% active lanes", "reg-adjacent", "FEAT_SME2", "store", 2, 32, 4, 0.75, 536870912},
+  {{ &setup, &store_reg_adjacent_x2_p75_ilp5, &teardown }, "ST1W (two register, adjacent, predicated), 75% active lanes", "reg-adjacent", "FEAT_SME2", "store", 2, 32, 5, 0.75, 536870912},
+  {{ &setup, &store_reg_adjacent_x2_p75_ilp6, &teardown }, "ST1W (two register, adjacent, predicated), 75% active lanes", "reg-adjacent", "FEAT_SME2", "store", 2, 32, 6, 0.75, 536870912},
+  {{ &setup, &store_reg_adjacent_x2_p75_ilp7, &teardown }, "ST1W (two register, adjacent, predicated), 75% active lanes", "reg-adjacent", "FEAT_SME2", "store", 2, 32, 7, 0.75, 536870912},
+  {{ &setup, &store_reg_adjacent_x2_p75_ilp8, &teardown }, "ST1W (two register, adjacent, predicated), 75% active lanes", "reg-adjacent", "FEAT_SME2", "store", 2, 32, 8, 0.75, 536870912},
+  {{ &setup, &store_reg_adjacent_x2_p50_ilp1, &teardown }, "ST1W (two register, adjacent, predicated), 50% active lanes", "reg-adjacent", "FEAT_SME2", "store", 2, 32, 1, 0.5, 536870912},
+  {{ &setup, &store_reg_adjacent_x2_p50_ilp2, &teardown }, "ST1W (two register, adjacent, predicated), 50% active lanes", "reg-adjacent", "FEAT_SME2", "store", 2, 32, 2, 0.5, 536870912},
+  {{ &setup, &store_reg_adjacent_x2_p50_ilp3, &teardown }, "ST1W (two register, adjacent, predicated), 50% active lanes", "reg-adjacent", "FEAT_SME2", "store", 2, 32, 3, 0.5, 536870912},
+  {{ &setup, &store_reg_adjacent_x2_p50_ilp4, &teardown }, "ST1W (two register, adjacent, predicated), 50% active lanes", "reg-adjacent", "FEAT_SME2", "store", 2, 32, 4, 0.5, 536870912},
+  {{ &setup, &store_reg_adjacent_x2_p50_ilp5, &teardown }, "ST1W (two register, adjacent, predicated), 50% active lanes", "reg-adjacent", "FEAT_SME2", "store", 2, 32, 5, 0.5, 536870912},
+  {{ &setup, &store_reg_adjacent_x2_p50_ilp6, &teardown }, "ST1W (two register, adjacent, predicated), 50% active lanes", "reg-adjacent", "FEAT_SME2", "store", 2, 32, 6, 0.5, 536870912},
+  {{ &setup, &store_reg_adjacent_x2_p50_ilp7, &teardown }, "ST1W (two register, adjacent, predicated), 50% active lanes", "reg-adjacent", "FEAT_SME2", "store", 2, 32, 7, 0.5, 536870912},
+  {{ &setup, &store_reg_adjacent_x2_p50_ilp8, &teardown }, "ST1W (two register, adjacent, predicated), 50% active lanes", "reg-adjacent", "FEAT_SME2", "store", 2, 32, 8, 0.5, 536870912},
+  {{ &setup, &store_reg_adjacent_x2_p25_ilp1, &teardown }, "ST1W (two register, adjacent, predicated), 25% active lanes", "reg-adjacent", "FEAT_SME2", "store", 2, 32, 1, 0.25, 536870912},
+  {{ &setup, &store_reg_adjacent_x2_p25_ilp2, &teardown }, "ST1W (two register, adjacent, predicated), 25% active lanes", "reg-adjacent", "FEAT_SME2", "store", 2, 32, 2, 0.25, 536870912},
+  {{ &setup, &store_reg_adjacent_x2_p25_ilp3, &teardown }, "ST1W (two register, adjacent, predicated), 25% active lanes", "reg-adjacent", "FEAT_SME2", "store", 2, 32, 3, 0.25, 536870912},
+  {{ &setup, &store_reg_adjacent_x2_p25_ilp4, &teardown }, "ST1W (two register, adjacent, predicated), 25% active lanes", "reg-adjacent", "FEAT_SME2", "store", 2, 32, 4, 0.25, 536870912},
+  {{ &setup, &store_reg_adjacent_x2_p25_ilp5, &teardown }, "ST1W (two register, adjacent, predicated), 25% active lanes", "reg-adjacent", "FEAT_SME2", "store", 2, 32, 5, 0.25, 536870912},
+  {{ &setup, &store_reg_adjacent_x2_p25_ilp6, &teardown }, "ST1W (two register, adjacent, predicated), 25% active lanes", "reg-adjacent", "FEAT_SME2", "store", 2, 32, 6, 0.25, 536870912},
+  {{ &setup, &store_reg_adjacent_x2_p25_ilp7, &teardown }, "ST1W (two register, adjacent, predicated), 25% active lanes", "reg-adjacent", "FEAT_SME2", "store", 2, 32, 7, 0.25, 536870912},
+  {{ &setup, &store_reg_adjacent_x2_p25_ilp8, &teardown }, "ST1W (two register, adjacent, predicated), 25% active lanes", "reg-adjacent", "FEAT_SME2", "store", 2, 32, 8, 0.25, 536870912},
+  {{ &setup, &copy_reg_adjacent_x2_ilp1, &teardown }, "LD1W/ST1W (two register, adjacent, predicated)", "reg-adjacent", "FEAT_SME2", "copy", 2, 32, 1, 1.0, 536870912},
+  {{ &setup, &copy_reg_adjacent_x2_ilp2, &teardown }, "LD1W/ST1W (two register, adjacent, predicated)", "reg-adjacent", "FEAT_SME2", "copy", 2, 32, 2, 1.0, 536870912},
+  {{ &setup, &copy_reg_adjacent_x2_ilp3, &teardown }, "LD1W/ST1W (two register, adjacent, predicated)", "reg-adjacent", "FEAT_SME2", "copy", 2, 32, 3, 1.0, 536870912},
+  {{ &setup, &copy_reg_adjacent_x2_ilp4, &teardown }, "LD1W/ST1W (two register, adjacent, predicated)", "reg-adjacent", "FEAT_SME2", "copy", 2, 32, 4, 1.0, 536870912},
+  {{ &setup, &copy_reg_adjacent_x2_ilp5, &teardown }, "LD1W/ST1W (two register, adjacent, predicated)", "reg-adjacent", "FEAT_SME2", "copy", 2, 32, 5, 1.0, 536870912},
+  {{ &setup, &copy_reg_adjacent_x2_ilp6, &teardown }, "LD1W/ST1W (two register, adjacent, predicated)", "reg-adjacent", "FEAT_SME2", "copy", 2, 32, 6, 1.0, 536870912},
+  {{ &setup, &copy_reg_adjacent_x2_ilp7, &teardown }, "LD1W/ST1W (two register, adjacent, predicated)", "reg-adjacent", "FEAT_SME2", "copy", 2, 32, 7, 1.0, 536870912},
+  {{ &setup, &copy_reg_adjacent_x2_ilp8, &teardown }, "LD1W/ST1W (two register, adjacent, predicated)", "reg-adjacent", "FEAT_SME2", "copy", 2, 32, 8, 1.0, 536870912},
+  {{ &setup, &copy_reg_adjacent_x2_p75_ilp1, &teardown }, "LD1W/ST1W (two register, adjacent, predicated), 75% active lanes", "reg-adjacent", "FEAT_SME2", "copy", 2, 32, 1, 0.75, 536870912},
+  {{ &setup, &copy_reg_adjacent_x2_p75_ilp2, &teardown }, "LD1W/ST1W (two register, adjacent, predicated), 75% active lanes", "reg-adjacent", "FEAT_SME2", "copy", 2, 32, 2, 0.75, 536870912},
+  {{ &setup, &copy_reg_adjacent_x2_p75_ilp3, &teardown }, "LD1W/ST1W (two register, adjacent, predicated), 75% active lanes", "reg-adjacent", "FEAT_SME2", "copy", 2, 32, 3, 0.75, 536870912},
+  {{ &setup, &copy_reg_adjacent_x2_p75_ilp4, &teardown }, "LD1W/ST1W (two register, adjacent, predicated), 75% active lanes", "reg-adjacent", "FEAT_SME2", "copy", 2, 32, 4, 0.75, 536870912},
+  {{ &setup, &copy_reg_adjacent_x2_p75_ilp5, &teardown }, "LD1W/ST1W (two register, adjacent, predicated), 75% active lanes", "reg-adjacent", "FEAT_SME2", "copy", 2, 32, 5, 0.75, 536870912},
+  {{ &setup, &copy_reg_adjacent_x2_p75_ilp6, &teardown }, "LD1W/ST1W (two register, adjacent, predicated), 75% active lanes", "reg-adjacent", "FEAT_SME2", "copy", 2, 32, 6, 0.75, 536870912},
+  {{ &setup, &copy_reg_adjacent_x2_p75_ilp7, &teardown }, "LD1W/ST1W (two register, adjacent, predicated), 75% active lanes", "reg-adjacent", "FEAT_SME2", "copy", 2, 32, 7, 0.75, 536870912},
+  {{ &setup, &copy_reg_adjacent_x2_p75_ilp8, &teardown }, "LD1W/ST1W (two register, adjacent, predicated), 75% active lanes", "reg-adjacent", "FEAT_SME2", "copy", 2, 32, 8, 0.75, 536870912},
+  {{ &setup, &copy_reg_adjacent_x2_p50_ilp1, &teardown }, "LD1W/ST1W (two register, adjacent, predicated), 50% active lanes", "reg-adjacent", "FEAT_SME2", "copy", 2, 32, 1, 0.5, 536870912},
+  {{ &setup, &copy_reg_adjacent_x2_p50_ilp2, &teardown }, "LD1W/ST1W (two register, adjacent, predicated), 50% active lanes", "reg-adjacent", "FEAT_SME2", "copy", 2, 32, 2, 0.5, 536870912},
+  {{ &setup, &copy_reg_adjacent_x2_p50_ilp3, &teardown }, "LD1W/ST1W (two register, adjacent, predicated), 50% active lanes", "reg-adjacent", "FEAT_SME2", "copy", 2, 32, 3, 0.5, 536870912},
+  {{ &setup, &copy_reg_adjacent_x2_p50_ilp4, &teardown }, "LD1W/ST1W (two register, adjacent, predicated), 50% active lanes", "reg-adjacent", "FEAT_SME2", "copy", 2, 32, 4, 0.5, 536870912},
+  {{ &setup, &copy_reg_adjacent_x2_p50_ilp5, &teardown }, "LD1W/ST1W (two register, adjacent, predicated), 50% active lanes", "reg-adjacent", "FEAT_SME2", "copy", 2, 32, 5, 0.5, 536870912},
+  {{ &setup, &copy_reg_adjacent_x2_p50_ilp6, &teardown }, "LD1W/ST1W (two register, adjacent, predicated), 50% active lanes", "reg-adjacent", "FEAT_SME2", "copy", 2, 32, 6, 0.5, 536870912},
+  {{ &setup, &copy_reg_adjacent_x2_p50_ilp7, &teardown }, "LD1W/ST1W (two register, adjacent, predicated), 50% active lanes", "reg-adjacent", "FEAT_SME2", "copy", 2, 32, 7, 0.5, 536870912},
+  {{ &setup, &copy_reg_adjacent_x2_p50_ilp8, &teardown }, "LD1W/ST1W (two register, adjacent, predicated), 50% active lanes", "reg-adjacent", "FEAT_SME2", "copy", 2, 32, 8, 0.5, 536870912},
+  {{ &setup, &copy_reg_adjacent_x2_p25_ilp1, &teardown }, "LD1W/ST1W (two register, adjacent, predicated), 25% active lanes", "reg-adjacent", "FEAT_SME2", "copy", 2, 32, 1, 0.25, 536870912},
+  {{ &setup, &copy_reg_adjacent_x2_p25_ilp2, &teardown }, "LD1W/ST1W (two register, adjacent, predicated), 25% active lanes", "reg-adjacent", "FEAT_SME2", "copy", 2, 32, 2, 0.25, 536870912},
+  {{ &setup, &copy_reg_adjacent_x2_p25_ilp3, &teardown }, "LD1W/ST1W (two register, adjacent, predicated), 25% active lanes", "reg-adjacent", "FEAT_SME2", "copy", 2, 32, 3, 0.25, 536870912},
+  {{ &setup, &copy_reg_adjacent_x2_p25_ilp4, &teardown }, "LD1W/ST1W (two register, adjacent, predicated), 25% active lanes", "reg-adjacent", "FEAT_SME2", "copy", 2, 32, 4, 0.25, 536870912},
+  {{ &setup, &copy_reg_adjacent_x2_p25_ilp5, &teardown }, "LD1W/ST1W (two register, adjacent, predicated), 25% active lanes", "reg-adjacent", "FEAT_SME2", "copy", 2, 32, 5, 0.25, 536870912},
+  {{ &setup, &copy_reg_adjacent_x2_p25_ilp6, &teardown }, "LD1W/ST1W (two register, adjacent, predicated), 25% active lanes", "reg-adjacent", "FEAT_SME2", "copy", 2, 32, 6, 0.25, 536870912},
+  {{ &setup, &copy_reg_adjacent_x2_p25_ilp7, &teardown }, "LD1W/ST1W (two register, adjacent, predicated), 25% active lanes", "reg-adjacent", "FEAT_SME2", "copy", 2, 32, 7, 0.25, 536870912},
+  {{ &setup, &copy_reg_adjacent_x2_p25_ilp8, &teardown }, "LD1W/ST1W (two register, adjacent, predicated), 25% active lanes", "reg-adjacent", "FEAT_SME2", "copy", 2, 32, 8, 0.25, 536870912},
+  {{ &setup, &load_reg_adjacent_x4_ilp1, &teardown }, "LD1W (four register, adjacent, predicated)", "reg-adjacent", "FEAT_SME2", "load", 4, 32, 1, 1.0, 536870912},
+  {{ &setup, &load_reg_adjacent_x4_ilp2, &teardown }, "LD1W (four register, adjacent, predicated)", "reg-adjacent", "FEAT_SME2", "load", 4, 32, 2, 1.0, 536870912},
+  {{ &setup, &load_reg_adjacent_x4_ilp3, &teardown }, "LD1W (four register, adjacent, predicated)", "reg-adjacent", "FEAT_SME2", "load", 4, 32, 3, 1.0, 536870912},
+  {{ &setup, &load_reg_adjacent_x4_ilp4, &teardown }, "LD1W (four register, adjacent, predicated)", "reg-adjacent", "FEAT_SME2", "load", 4, 32, 4, 1.0, 536870912},
+  {{ &setup, &load_reg_adjacent_x4_ilp5, &teardown }, "LD1W (four register, adjacent, predicated)", "reg-adjacent", "FEAT_SME2", "load", 4, 32, 5, 1.0, 536870912},
+  {{ &setup, &load_reg_adjacent_x4_ilp6, &teardown }, "LD1W (four register, adjacent, predicated)", "reg-adjacent", "FEAT_SME2", "load", 4, 32, 6, 1.0, 536870912},
+  {{ &setup, &load_reg_adjacent_x4_ilp7, &teardown }, "LD1W (four register, adjacent, predicated)", "reg-adjacent", "FEAT_SME2", "load", 4, 32, 7, 1.0, 536870912},
+  {{ &setup, &load_reg_adjacent_x4_ilp8, &teardown }, "LD1W (four register, adjacent, predicated)", "reg-adjacent", "FEAT_SME2", "load", 4, 32, 8, 1.0, 536870912},
+  {{ &setup, &load_reg_adjacent_x4_p75_ilp1, &teardown }, "LD1W (four register, adjacent, predicated), 75% active lanes", "reg-adjacent", "FEAT_SME2", "load", 4, 32, 1, 0.75, 536870912},
+  {{ &setup, &load_reg_adjacent_x4_p75_ilp2, &teardown }, "LD1W (four register, adjacent, predicated), 75% active lanes", "reg-adjacent", "FEAT_SME2", "load", 4, 32, 2, 0.75, 536870912},
+  {{ &setup, &load_reg_adjacent_x4_p75_ilp3, &teardown }, "LD1W (four register, adjacent, predicated), 75% active lanes", "reg-adjacent", "FEAT_SME2", "load", 4, 32, 3, 0.75, 536870912},
+  {{ &setup, &load_reg_adjacent_x4_p75_ilp4, &teardown }, "LD1W (four register, adjacent, predicated), 75% active lanes", "reg-adjacent", "FEAT_SME2", "load", 4, 32, 4, 0.75, 536870912},
+  {{ &setup, &load_reg_adjacent_x4_p75_ilp5, &teardown }, "LD1W (four register, adjacent, predicated), 75% active lanes", "reg-adjacent", "FEAT_SME2", "load", 4, 32, 5, 0.75, 536870912},
+  {{ &setup, &load_reg_adjacent_x4_p75_ilp6, &teardown }, "LD1W (four register, adjacent, predicated), 75% active lanes", "reg-adjacent", "FEAT_SME2", "load", 4, 32, 6, 0.75, 536870912},
+  {{ &setup, &load_reg_adjacent_x4_p75_ilp7, &teardown }, "LD1W (four register, adjacent, predicated), 75% active lanes", "reg-adjacent", "FEAT_SME2", "load", 4, 32, 7, 0.75, 536870912},
+  {{ &setup, &load_reg_adjacent_x4_p75_ilp8, &teardown }, "LD1W (four register, adjacent, predicated), 75% active lanes", "reg-adjacent", "FEAT_SME2", "load", 4, 32, 8, 0.75, 536870912},
+  {{ &setup, &load_reg_adjacent_x4_p50_ilp1, &teardown }, "LD1W (four register, adjacent, predicated), 50% active lanes", "reg-adjacent", "FEAT_SME2", "load", 4, 32, 1, 0.5, 536870912},
+  {{ &setup, &load_reg_adjacent_x4_p50_ilp2, &teardown }, "LD1W (four register, adjacent, predicated), 50% active lanes", "reg-adjacent", "FEAT_SME2", "load", 4, 32, 2, 0.5, 536870912},
+  {{ &setup, &load_reg_adjacent_x4_p50_ilp3, &teardown }, "LD1W (four register, adjacent, predicated), 50% active lanes", "reg-adjacent", "FEAT_SME2", "load", 4, 32, 3, 0.5, 536870912},
+  {{ &setup, &load_reg_adjacent_x4_p50_ilp4, &teardown }, "LD1W (four register, adjacent, predicated), 50% active lanes", "reg-adjacent", "FEAT_SME2", "load", 4, 32, 4, 0.5, 536870912},
+  {{ &setup, &load_reg_adjacent_x4_p50_ilp5, &teardown }, "LD1W (four register, adjacent, predicated), 50% active lanes", "reg-adjacent", "FEAT_SME2", "load", 4, 32, 5, 0.5, 536870912},
+  {{ &setup, &load_reg_adjacent_x4_p50_ilp6, &teardown }, "LD1W (four register, adjacent, predicated), 50% active lanes", "reg-adjacent", "FEAT_SME2", "load", 4, 32, 6, 0.5, 536870912},
+  {{ &setup, &load_reg_adjacent_x4_p50_ilp7, &teardown }, "LD1W (four register, adjacent, predicated), 50% active lanes", "reg-adjacent", "FEAT_SME2", "load", 4, 32, 7, 0.5, 536870912},
+  {{ &setup, &load_reg_adjacent_x4_p50_ilp8, &teardown }, "LD1W (four register, adjacent, predicated), 50% active lanes", "reg-adjacent", "FEAT_SME2", "load", 4, 32, 8, 0.5, 536870912},
+  {{ &setup, &load_reg_adjacent_x4_p25_ilp1, &teardown }, "LD1W (four register, adjacent, predicated), 25% active lanes", "reg-adjacent", "FEAT_SME2", "load", 4, 32, 1, 0.25, 536870912},
+  {{ &setup, &load_reg_adjacent_x4_p25_ilp2, &teardown }, "LD1W (four register, adjacent, predicated), 25% active lanes", "reg-adjacent", "FEAT_SME2", "load", 4, 32, 2, 0.25, 536870912},
+  {{ &setup, &load_reg_adjacent_x4_p25_ilp3, &teardown }, "LD1W (four register, adjacent, predicated), 25% active lanes", "reg-adjacent", "FEAT_SME2", "load", 4, 32, 3, 0.25, 536870912},
+  {{ &setup, &load_reg_adjacent_x4_p25_ilp4, &teardown }, "LD1W (four register, adjacent, predicated), 25% active lanes", "reg-adjacent", "FEAT_SME2", "load", 4, 32, 4, 0.25, 536870912},
+  {{ &setup, &load_reg_adjacent_x4_p25_ilp5, &teardown }, "LD1W (four register, adjacent, predicated), 25% active lanes", "reg-adjacent", "FEAT_SME2", "load", 4, 32, 5, 0.25, 536870912},
+  {{ &setup, &load_reg_adjacent_x4_p25_ilp6, &teardown }, "LD1W (four register, adjacent, predicated), 25% active lanes", "reg-adjacent", "FEAT_SME2", "load", 4, 32, 6, 0.25, 536870912},
+  {{ &setup, &load_reg_adjacent_x4_p25_ilp7, &teardown }, "LD1W (four register, adjacent, predicated), 25% active lanes", "reg-adjacent", "FEAT_SME2", "load", 4, 32, 7, 0.25, 536870912},
+  {{ &setup, &load_reg_adjacent_x4_p25_ilp8, &teardown }, "LD1W (four register, adjacent, predicated), 25% active lanes", "reg-adjacent", "FEAT_SME2", "load", 4, 32, 8, 0.25, 536870912},
+  {{ &setup, &store_reg_adjacent_x4_ilp1, &teardown }, "ST1W (four register, adjacent, predicated)", "reg-adjacent", "FEAT_SME2", "store", 4, 32, 1, 1.0, 536870912},
+  {{ &setup, &store_reg_adjacent_x4_ilp2, &teardown }, "ST1W (four register, adjacent, predicated)", "reg-adjacent", "FEAT_SME2", "store", 4, 32, 2, 1.0, 536870912},
+  {{ &setup, &store_reg_adjacent_x4_ilp3, &teardown }, "ST1W (four register, adjacent, predicated)", "reg-adjacent", "FEAT_SME2", "store", 4, 32, 3, 1.0, 536870912},
+  {{ &setup, &store_reg_adjacent_x4_ilp4, &teardown }, "ST1W (four register, adjacent, predicated)", "reg-adjacent", "FEAT_SME2", "store", 4, 32, 4, 1.0, 536870912},
+  {{ &setup, &store_reg_adjacent_x4_ilp5, &teardown }, "ST1W (four register, adjacent, predicated)", "reg-adjacent", "FEAT_SME2", "store", 4, 32, 5, 1.0, 536870912},
+  {{ &setup, &store_reg_adjacent_x4_ilp6, &teardown }, "ST1W (four register, adjacent, predicated)", "reg-adjacent", "FEAT_SME2", "store", 4, 32, 6, 1.0, 536870912},
+  {{ &setup, &store_reg_adjacent_x4_ilp7, &teardown }, "ST1W (four register, adjacent, predicated)", "reg-adjacent", "FEAT_SME2", "store", 4, 32, 7, 1.0, 536870912},
+  {{ &setup, &store_reg_adjacent_x4_ilp8, &teardown }, "ST1W (four register, adjacent, predicated)", "reg-adjacent", "FEAT_SME2", "store", 4, 32, 8, 1.0, 536870912},
+  {{ &setup, &store_reg_adjacent_x4_p75_ilp1, &teardown }, "ST1W (four register, adjacent, predicated), 75% active lanes", "reg-adjacent", "FEAT_SME2", "store", 4, 32, 1, 0.75, 536870912},
+  {{ &setup, &store_reg_adjacent_x4_p75_ilp2, &teardown }, "ST1W (four register, adjacent, predicated), 75% active lanes", "reg-adjacent", "FEAT_SME2", "store", 4, 32, 2, 0.75, 536870912},
+  {{ &setup, &store_reg_adjacent_x4_p75_ilp3, &teardown }, "ST1W (four register, adjacent, predicated), 75% active lanes", "reg-adjacent", "FEAT_SME2", "store", 4, 32, 3, 0.75, 536870912},
+  {{ &setup, &store_reg_adjacent_x4_p75_ilp4, &teardown }, "ST1W (four register, adjacent, predicated), 75% active lanes", "reg-adjacent", "FEAT_SME2", "store", 4, 32, 4, 0.75, 536870912},
+  {{ &setup, &store_reg_adjacent_x4_p75_ilp5, &teardown }, "ST1W (four register, adjacent, predicated), 75% active lanes", "reg-adjacent", "FEAT_SME2", "store", 4, 32, 5, 0.75, 536870912},
+  {{ &setup, &store_reg_adjacent_x4_p75_ilp6, &teardown }, "ST1W (four register, adjacent, predicated), 75% active lanes", "reg-adjacent", "FEAT_SME2", "store", 4, 32, 6, 0.75, 536870912},
+  {{ &setup, &store_reg_adjacent_x4_p75_ilp7, &teardown }, "ST1W (four register, adjacent, predicated), 75% active lanes", "reg-adjacent", "FEAT_SME2", "store", 4, 32, 7, 0.75, 536870912},
+  {{ &setup, &store_reg_adjacent_x4_p75_ilp8, &teardown }, "ST1W (four register, adjacent, predicated), 75% active lanes", "reg-adjacent", "FEAT_SME2", "store", 4, 32, 8, 0.75, 536870912},
+  {{ &setup, &store_reg_adjacent_x4_p50_ilp1, &teardown }, "ST1W (four register, adjacent, predicated), 50% active lanes", "reg-adjacent", "FEAT_SME2", "store", 4, 32, 1, 0.5, 536870912},
+  {{ &setup, &store_reg_adjacent_x4_p50_ilp2, &teardown }, "ST1W (four register, adjacent, predicated), 50% active lanes", "reg-adjacent", "FEAT_SME2", "store", 4, 32, 2, 0.5, 536870912},
+  {{ &setup, &store_reg_adjacent_x4_p50_ilp3, &teardown }, "ST1W (four register, adjacent, predicated), 50% active lanes", "reg-adjacent", "FEAT_SME2", "store", 4, 32, 3, 0.5, 536870912},
+  {{ &setup, &store_reg_adjacent_x4_p50_ilp4, &teardown }, "ST1W (four register, adjacent, predicated), 50% active lanes", "reg-adjacent", "FEAT_SME2", "store", 4, 32, 4, 0.5, 536870912},
+  {{ &setup, &store_reg_adjacent_x4_p50_ilp5, &teardown }, "ST1W (four register, adjacent, predicated), 50% active lanes", "reg-adjacent", "FEAT_SME2", "store", 4, 32, 5, 0.5, 536870912},
+  {{ &setup, &store_reg_adjacent_x4_p50_ilp6, &teardown }, "ST1W (four register, adjacent, predicated), 50% active lanes", "reg-adjacent", "FEAT_SME2", "store", 4, 32, 6, 0.5, 536870912},
+  {{ &setup, &store_reg_adjacent_x4_p50_ilp7, &teardown }, "ST1W (four register, adjacent, predicated), 50% active lanes", "reg-adjacent", "FEAT_SME2", "store", 4, 32, 7, 0.5, 536870912},
+  {{ &setup, &store_reg_adjacent_x4_p50_ilp8, &teardown }, "ST1W (four register, adjacent, predicated), 50% active lanes", "reg-adjacent", "FEAT_SME2", "store", 4, 32, 8, 0.5, 536870912},
+  {{ &setup, &store_reg_adjacent_x4_p25_ilp1, &teardown }, "ST1W (four register, adjacent, predicated), 25% active lanes", "reg-adjacent", "FEAT_SME2", "store", 4, 32, 1, 0.25, 536870912},
+  {{ &setup, &store_reg_adjacent_x4_p25_ilp2, &teardown }, "ST1W (four register, adjacent, predicated), 25% active lanes", "reg-adjacent", "FEAT_SME2", "store", 4, 32, 2, 0.25, 536870912},
+  {{ &setup, &store_reg_adjacent_x4_p25_ilp3, &teardown }, "ST1W (four register, adjacent, predicated), 25% active lanes", "reg-adjacent", "FEAT_SME2", "store", 4, 32, 3, 0.25, 536870912},
+  {{ &setup, &store_reg_adjacent_x4_p25_ilp4, &teardown }, "ST1W (four register, adjacent, predicated), 25% active lanes", "reg-adjacent", "FEAT_SME2", "store", 4, 32, 4, 0.25, 536870912},
+  {{ &setup, &store_reg_adjacent_x4_p25_ilp5, &teardown }, "ST1W (four register, adjacent, predicated), 25% active lanes", "reg-adjacent", "FEAT_SME2", "store", 4, 32, 5, 0.25, 536870912},
+  {{ &setup, &store_reg_adjacent_x4_p25_ilp6, &teardown }, "ST1W (four register, adjacent, predicated), 25% active lanes", "reg-adjacent", "FEAT_SME2", "store", 4, 32, 6, 0.25, 536870912},
+  {{ &setup, &store_reg_adjacent_x4_p25_ilp7, &teardown }, "ST1W (four register, adjacent, predicated), 25% active lanes", "reg-adjacent", "FEAT_SME2", "store", 4, 32, 7, 0.25, 536870912},
+  {{ &setup, &store_reg_adjacent_x4_p25_ilp8, &teardown }, "ST1W (four register, adjacent, predicated), 25% active lanes", "reg-adjacent", "FEAT_SME2", "store", 4, 32, 8, 0.25, 536870912},
+  {{ &setup, &copy_reg_adjacent_x4_ilp1, &teardown }, "LD1W/ST1W (four register, adjacent, predicated)", "reg-adjacent", "FEAT_SME2", "copy", 4, 32, 1, 1.0, 536870912},
+  {{ &setup, &copy_reg_adjacent_x4_ilp2, &teardown }, "LD1W/ST1W (four register, adjacent, predicated)", "reg-adjacent", "FEAT_SME2", "copy", 4, 32, 2, 1.0, 536870912},
+  {{ &setup, &copy_reg_adjacent_x4_ilp3, &teardown }, "LD1W/ST1W (four register, adjacent, predicated)", "reg-adjacent", "FEAT_SME2", "copy", 4, 32, 3, 1.0, 536870912},
+  {{ &setup, &copy_reg_adjacent_x4_ilp4, &teardown }, "LD1W/ST1W (four register, adjacent, predicated)", "reg-adjacent", "FEAT_SME2", "copy", 4, 32, 4, 1.0, 536870912},
+  {{ &setup, &copy_reg_adjacent_x4_ilp5, &teardown }, "LD1W/ST1W (four register, adjacent, predicated)", "reg-adjacent", "FEAT_SME2", "copy", 4, 32, 5, 1.0, 536870912},
+  {{ &setup, &copy_reg_adjacent_x4_ilp6, &teardown }, "LD1W/ST1W (four register, adjacent, predicated)", "reg-adjacent", "FEAT_SME2", "copy", 4, 32, 6, 1.0, 536870912},
+  {{ &setup, &copy_reg_adjacent_x4_ilp7, &teardown }, "LD1W/ST1W (four register, adjacent, predicated)", "reg-adjacent", "FEAT_SME2", "copy", 4, 32, 7, 1.0, 536870912},
+  {{ &setup, &copy_reg_adjacent_x4_ilp8, &teardown }, "LD1W/ST1W (four register, adjacent, predicated)", "reg-adjacent", "FEAT_SME2", "copy", 4, 32, 8, 1.0, 536870912},
+  {{ &setup, &copy_reg_adjacent_x4_p75_ilp1, &teardown }, "LD1W/ST1W (four register, adjacent, predicated), 75% active lanes", "reg-adjacent", "FEAT_SME2", "copy", 4, 32, 1, 0.75, 536870912},
+  {{ &setup, &copy_reg_adjacent_x4_p75_ilp2, &teardown }, "LD1W/ST1W (four register, adjacent, predicated), 75% active lanes", "reg-adjacent", "FEAT_SME2", "copy", 4, 32, 2, 0.75, 536870912},
+  {{ &setup, &copy_reg_adjacent_x4_p75_ilp3, &teardown }, "LD1W/ST1W (four register, adjacent, predicated), 75% active lanes", "reg-adjacent", "FEAT_SME2", "copy", 4, 32, 3, 0.75, 536870912},
+  {{ &setup, &copy_reg_adjacent_x4_p75_ilp4, &teardown }, "LD1W/ST1W (four register, adjacent, predicated), 75% active lanes", "reg-adjacent", "FEAT_SME2", "copy", 4, 32, 4, 0.75, 536870912},
+  {{ &setup, &copy_reg_adjacent_x4_p75_ilp5, &teardown }, "LD1W/ST1W (four register, adjacent, predicated), 75% active lanes", "reg-adjacent", "FEAT_SME2", "copy", 4, 32, 5, 0.75, 536870912},
+  {{ &setup, &copy_reg_adjacent_x4_p75_ilp6, &teardown }, "LD1W/ST1W (four register, adjacent, predicated), 75% active lanes", "reg-adjacent", "FEAT_SME2", "copy", 4, 32, 6, 0.75, 536870912},
+  {{ &setup, &copy_reg_adjacent_x4_p75_ilp7, &teardown }, "LD1W/ST1W (four register, adjacent, predicated), 75% active lanes", "reg-adjacent", "FEAT_SME2", "copy", 4, 32, 7, 0.75, 536870912},
+  {{ &setup, &copy_reg_adjacent_x4_p75_ilp8, &teardown }, "LD1W/ST1W (four register, adjacent, predicated), 75% active lanes", "reg-adjacent", "FEAT_SME2", "copy", 4, 32, 8, 0.75, 536870912},
+  {{ &setup, &copy_reg_adjacent_x4_p50_ilp1, &teardown }, "LD1W/ST1W (four register, adjacent, predicated), 50% active lanes", "reg-adjacent", "FEAT_SME2", "copy", 4, 32, 1, 0.5, 536870912},
+  {{ &setup, &copy_reg_adjacent_x4_p50_ilp2, &teardown }, "LD1W/ST1W (four register, adjacent, predicated), 50% active lanes", "reg-adjacent", "FEAT_SME2", "copy", 4, 32, 2, 0.5, 536870912},
+  {{ &setup, &copy_reg_adjacent_x4_p50_ilp3, &teardown }, "LD1W/ST1W (four register, adjacent, predicated), 50% active lanes", "reg-adjacent", "FEAT_SME2", "copy", 4, 32, 3, 0.5, 536870912},
+  {{ &setup, &copy_reg_adjacent_x4_p50_ilp4, &teardown }, "LD1W/ST1W (four register, adjacent, predicated), 50% active lanes", "reg-adjacent", "FEAT_SME2", "copy", 4, 32, 4, 0.5, 536870912},
+  {{ &setup, &copy_reg_adjacent_x4_p50_ilp5, &teardown }, "LD1W/ST1W (four register, adjacent, predicated), 50% active lanes", "reg-adjacent", "FEAT_SME2", "copy", 4, 32, 5, 0.5, 536870912},
+  {{ &setup, &copy_reg_adjacent_x4_p50_ilp6, &teardown }, "LD1W/ST1W (four register, adjacent, predicated), 50% active lanes", "reg-adjacent", "FEAT_SME2", "copy", 4, 32, 6, 0.5, 536870912},
+  {{ &setup, &copy_reg_adjacent_x4_p50_ilp7, &teardown }, "LD1W/ST1W (four register, adjacent, predicated), 50% active lanes", "reg-adjacent", "FEAT_SME2", "copy", 4, 32, 7, 0.5, 536870912},
+  {{ &setup, &copy_reg_adjacent_x4_p50_ilp8, &teardown }, "LD1W/ST1W (four register, adjacent, predicated), 50% active lanes", "reg-adjacent", "FEAT_SME2", "copy", 4, 32, 8, 0.5, 536870912},
+  {{ &setup, &copy_reg_adjacent_x4_p25_ilp1, &teardown }, "LD1W/ST1W (four register, adjacent, predicated), 25% active lanes", "reg-adjacent", "FEAT_SME2", "copy", 4, 32, 1, 0.25, 536870912},
+  {{ &setup, &copy_reg_adjacent_x4_p25_ilp2, &teardown }, "LD1W/ST1W (four register, adjacent, predicated), 25% active lanes", "reg-adjacent", "FEAT_SME2", "copy", 4, 32, 2, 0.25, 536870912},
+  {{ &setup, &copy_reg_adjacent_x4_p25_ilp3, &teardown }, "LD1W/ST1W (four register, adjacent, predicated), 25% active lanes", "reg-adjacent", "FEAT_SME2", "copy", 4, 32, 3, 0.25, 536870912},
+  {{ &setup, &copy_reg_adjacent_x4_p25_ilp4, &teardown }, "LD1W/ST1W (four register, adjacent, predicated), 25% active lanes", "reg-adjacent", "FEAT_SME2", "copy", 4, 32, 4, 0.25, 536870912},
+  {{ &setup, &copy_reg_adjacent_x4_p25_ilp5, &teardown }, "LD1W/ST1W (four register, adjacent, predicated), 25% active lanes", "reg-adjacent", "FEAT_SME2", "copy", 4, 32, 5, 0.25, 536870912},
+  {{ &setup, &copy_reg_adjacent_x4_p25_ilp6, &teardown }, "LD1W/ST1W (four register, adjacent, predicated), 25% active lanes", "reg-adjacent", "FEAT_SME2", "copy", 4, 32, 6, 0.25, 536870912},
+  {{ &setup, &copy_reg_adjacent_x4_p25_ilp7, &teardown }, "LD1W/ST1W (four register, adjacent, predicated), 25% active lanes", "reg-adjacent", "FEAT_SME2", "copy", 4, 32, 7, 0.25, 536870912},
+  {{ &setup, &copy_reg_adjacent_x4_p25_ilp8, &teardown }, "LD1W/ST1W (four register, adjacent, predicated), 25% active lanes", "reg-adjacent", "FEAT_SME2", "copy", 4, 32, 8, 0.25, 536870912},
+  {{ &setup, &load_reg_strided_x2_ilp1, &teardown }, "LD1W (two register, strided, predicated)", "reg-strided", "FEAT_SME2", "load", 2, 32, 1, 1.0, 536870912},
+  {{ &setup, &load_reg_strided_x2_ilp2, &teardown }, "LD1W (two register, strided, predicated)", "reg-strided", "FEAT_SME2", "load", 2, 32, 2, 1.0, 536870912},
+  {{ &setup, &load_reg_strided_x2_ilp3, &teardown }, "LD1W (two register, strided, predicated)", "reg-strided", "FEAT_SME2", "load", 2, 32, 3, 1.0, 536870912},
+  {{ &setup, &load_reg_strided_x2_ilp4, &teardown }, "LD1W (two register, strided, predicated)", "reg-strided", "FEAT_SME2", "load", 2, 32, 4, 1.0, 536870912},
+  {{ &setup, &load_reg_strided_x2_ilp5, &teardown }, "LD1W (two register, strided, predicated)", "reg-strided", "FEAT_SME2", "load", 2, 32, 5, 1.0, 536870912},
+  {{ &setup, &load_reg_strided_x2_ilp6, &teardown }, "LD1W (two register, strided, predicated)", "reg-strided", "FEAT_SME2", "load", 2, 32, 6, 1.0, 536870912},
+  {{ &setup, &load_reg_strided_x2_ilp7, &teardown }, "LD1W (two register, strided, predicated)", "reg-strided", "FEAT_SME2", "load", 2, 32, 7, 1.0, 536870912},
+  {{ &setup, &load_reg_strided_x2_ilp8, &teardown }, "LD1W (two register, strided, predicated)", "reg-strided", "FEAT_SME2", "load", 2, 32, 8, 1.0, 536870912},
+  {{ &setup, &load_reg_strided_x2_p75_ilp1, &teardown }, "LD1W (two register, strided, predicated), 75% active lanes", "reg-strided", "FEAT_SME2", "load", 2, 32, 1, 0.75, 536870912},
+  {{ &setup, &load_reg_strided_x2_p75_ilp2, &teardown }, "LD1W (two register, strided, predicated), 75% active lanes", "reg-strided", "FEAT_SME2", "load", 2, 32, 2, 0.75, 536870912},
+  {{ &setup, &load_reg_strided_x2_p75_ilp3, &teardown }, "LD1W (two register, strided, predicated), 75% active lanes", "reg-strided", "FEAT_SME2", "load", 2, 32, 3, 0.75, 536870912},
+  {{ &setup, &load_reg_strided_x2_p75_ilp4, &teardown }, "LD1W (two register, strided, predicated), 75% active lanes", "reg-strided", "FEAT_SME2", "load", 2, 32, 4, 0.75, 536870912},
+  {{ &setup, &load_reg_strided_x2_p75_ilp5, &teardown }, "LD1W (two register, strided, predicated), 75% active lanes", "reg-strided", "FEAT_SME2", "load", 2, 32, 5, 0.75, 536870912},
+  {{ &setup, &load_reg_strided_x2_p75_ilp6, &teardown }, "LD1W (two register, strided, predicated), 75% active lanes", "reg-strided", "FEAT_SME2", "load", 2, 32, 6, 0.75, 536870912},
+  {{ &setup, &load_reg_strided_x2_p75_ilp7, &teardown }, "LD1W (two register, strided, predicated), 75% active lanes", "reg-strided", "FEAT_SME2", "load", 2, 32, 7, 0.75, 536870912},
+  {{ &setup, &load_reg_strided_x2_p75_ilp8, &teardown }, "LD1W (two register, strided, predicated), 75% active lanes", "reg-strided", "FEAT_SME2", "load", 2, 32, 8, 0.75, 536870912},
+  {{ &setup, &load_reg_strided_x2_p50_ilp1, &teardown }, "LD1W (two register, strided, predicated), 50% active lanes", "reg-strided", "FEAT_SME2", "load", 2, 32, 1, 0.5, 536870912},
+  {{ &setup, &load_reg_strided_x2_p50_ilp2, &teardown }, "LD1W (two register, strided, predicated), 50% active lanes", "reg-strided", "FEAT_SME2", "load", 2, 32, 2, 0.5, 536870912},
+  {{ &setup, &load_reg_strided_x2_p50_ilp3, &teardown }, "LD1W (two register, strided, predicated), 50% active lanes", "reg-strided", "FEAT_SME2", "load", 2, 32, 3, 0.5, 536870912},
+  {{ &setup, &load_reg_strided_x2_p50_ilp4, &teardown }, "LD1W (two register, strided, predicated), 50% active lanes", "reg-strided", "FEAT_SME2", "load", 2, 32, 4, 0.5, 536870912},
+  {{ &setup, &load_reg_strided_x2_p50_ilp5, &teardown }, "LD1W (two register, strided, predicated), 50% active lanes", "reg-strided", "FEAT_SME2", "load", 2, 32, 5, 0.5, 536870912},
+  {{ &setup, &load_reg_strided_x2_p50_ilp6, &teardown }, "LD1W (two register, strided, predicated), 50% active lanes", "reg-strided", "FEAT_SME2", "load", 2, 32, 6, 0.5, 536870912},
+  {{ &setup, &load_reg_strided_x2_p50_ilp7, &teardown }, "LD1W (two register, strided, predicated), 50% active lanes", "reg-strided", "FEAT_SME2", "load", 2, 32, 7, 0.5, 536870912},
+  {{ &setup, &load_reg_strided_x2_p50_ilp8, &teardown }, "LD1W (two register, strided, predicated), 50% active lanes", "reg-strided", "FEAT_SME2", "load", 2, 32, 8, 0.5, 536870912},
+  {{ &setup, &load_reg_strided_x2_p25_ilp1, &teardown }, "LD1W (two register, strided, predicated), 25% active lanes", "reg-strided", "FEAT_SME2", "load", 2, 32, 1, 0.25, 536870912},
+  {{ &setup, &load_reg_strided_x2_p25_ilp2, &teardown }, "LD1W (two register, strided, predicated), 25% active lanes", "reg-strided", "FEAT_SME2", "load", 2, 32, 2, 0.25, 536870912},
+  {{ &setup, &load_reg_strided_x2_p25_ilp3, &teardown }, "LD1W (two register, strided, predicated), 25% active lanes", "reg-strided", "FEAT_SME2", "load", 2, 32, 3, 0.25, 536870912},
+  {{ &setup, &load_reg_strided_x2_p25_ilp4, &teardown }, "LD1W (two register, strided, predicated), 25% active lanes", "reg-strided", "FEAT_SME2", "load", 2, 32, 4, 0.25, 536870912},
+  {{ &setup, &load_reg_strided_x2_p25_ilp5, &teardown }, "LD1W (two register, strided, predicated), 25% active lanes", "reg-strided", "FEAT_SME2", "load", 2, 32, 5, 0.25, 536870912},
+  {{ &setup, &load_reg_strided_x2_p25_ilp6, &teardown }, "LD1W (two register, strided, predicated), 25% active lanes", "reg-strided", "FEAT_SME2", "load", 2, 32, 6, 0.25, 536870912},
+  {{ &setup, &load_reg_strided_x2_p25_ilp7, &teardown }, "LD1W (two register, strided, predicated), 25% active lanes", "reg-strided", "FEAT_SME2", "load", 2, 32, 7, 0.25, 536870912},
+  {{ &setup, &load_reg_strided_x2_p25_ilp8, &teardown }, "LD1W (two register, strided, predicated), 25% active lanes", "reg-strided", "FEAT_SME2", "load", 2, 32, 8, 0.25, 536870912},
+  {{ &setup, &store_reg_strided_x2_ilp1, &teardown }, "ST1W (two register, strided, predicated)", "reg-strided", "FEAT_SME2", "store", 2, 32, 1, 1.0, 536870912},
+  {{ &setup, &store_reg_strided_x2_ilp2, &teardown }, "ST1W (two register, strided, predicated)", "reg-strided", "FEAT_SME2", "store", 2, 32, 2, 1.0, 536870912},
+  {{ &setup, &store_reg_strided_x2_ilp3, &teardown }, "ST1W (two register, strided, predicated)", "reg-strided", "FEAT_SME2", "store", 2, 32, 3, 1.0, 536870912},
+  {{ &setup, &store_reg_strided_x2_ilp4, &teardown }, "ST1W (two register, strided, predicated)", "reg-strided", "FEAT_SME2", "store", 2, 32, 4, 1.0, 536870912},
+  {{ &setup, &store_reg_strided_x2_ilp5, &teardown }, "ST1W (two register, strided, predicated)", "reg-strided", "FEAT_SME2", "store", 2, 32, 5, 1.0, 536870912},
+  {{ &setup, &store_reg_strided_x2_ilp6, &teardown }, "ST1W (two register, strided, predicated)", "reg-strided", "FEAT_SME2", "store", 2, 32, 6, 1.0, 536870912},
+  {{ &setup, &store_reg_strided_x2_ilp7, &teardown }, "ST1W (two register, strided, predicated)", "reg-strided", "FEAT_SME2", "store", 2, 32, 7, 1.0, 536870912},
+  {{ &setup, &store_reg_strided_x2_ilp8, &teardown }, "ST1W (two register, strided, predicated)", "reg-strided", "FEAT_SME2", "store", 2, 32, 8, 1.0, 536870912},
+  {{ &setup, &store_reg_strided_x2_p75_ilp1, &teardown }, "ST1W (two register, strided, predicated), 75% active lanes", "reg-strided", "FEAT_SME2", "store", 2, 32, 1, 0.75, 536870912},
+  {{ &setup, &store_reg_strided_x2_p75_ilp2, &teardown }, "ST1W (two register, strided, predicated), 75% active lanes", "reg-strided", "FEAT_SME2", "store", 2, 32, 2, 0.75, 536870912},
+  {{ &setup, &store_reg_strided_x2_p75_ilp3, &teardown }, "ST1W (two register, strided, predicated), 75% active lanes", "reg-strided", "FEAT_SME2", "store", 2, 32, 3, 0.75, 536870912},
+  {{ &setup, &store_reg_strided_x2_p75_ilp4, &teardown }, "ST1W (two register, strided, predicated), 75% active lanes", "reg-strided", "FEAT_SME2", "store", 2, 32, 4, 0.75, 536870912},
+  {{ &setup, &store_reg_strided_x2_p75_ilp5, &teardown }, "ST1W (two register, strided, predicated), 75% active lanes", "reg-strided", "FEAT_SME2", "store", 2, 32, 5, 0.75, 536870912},
+  {{ &setup, &store_reg_strided_x2_p75_ilp6, &teardown }, "ST1W (two register, strided, predicated), 75% active lanes", "reg-strided", "FEAT_SME2", "store", 2, 32, 6, 0.75, 536870912},
+  {{ &setup, &store_reg_strided_x2_p75_ilp7, &teardown }, "ST1W (two register, strided, predicated), 75% active lanes", "reg-strided", "FEAT_SME2", "store", 2, 32, 7, 0.75, 536870912},
+  {{ &setup, &store_reg_strided_x2_p75_ilp8, &teardown }, "ST1W (two register, strided, predicated), 75% active lanes", "reg-strided", "FEAT_SME2", "store", 2, 32, 8, 0.75, 536870912},
+  {{ &setup, &store_reg_strided_x2_p50_ilp1, &teardown }, "ST1W (two register, strided, predicated), 50% active lanes", "reg-strided", "FEAT_SME2", "store", 2, 32, 1, 0.5, 536870912},
+  {{ &setup, &store_reg_strided_x2_p50_ilp2, &teardown }, "ST1W (two register, strided, predicated), 50% active lanes", "reg-strided", "FEAT_SME2", "store", 2, 32, 2, 0.5, 536870912},
+  {{ &setup, &store_reg_strided_x2_p50_ilp3, &teardown }, "ST1W (two register, strided, predicated), 50% active lanes", "reg-strided", "FEAT_SME2", "store", 2, 32, 3, 0.5, 536870912},
+  {{ &setup, &store_reg_strided_x2_p50_ilp4, &teardown }, "ST1W (two register, strided, predicated), 50% active lanes", "reg-strided", "FEAT_SME2", "store", 2, 32, 4, 0.5, 536870912},
+  {{ &setup, &store_reg_strided_x2_p50_ilp5, &teardown }, "ST1W (two register, strided, predicated), 50% active lanes", "reg-strided", "FEAT_SME2", "store", 2, 32, 5, 0.5, 536870912},
+  {{ &setup, &store_reg_strided_x2_p50_ilp6, &teardown }, "ST1W (two register, strided, predicated), 50% active lanes", "reg-strided", "FEAT_SME2", "store", 2, 32, 6, 0.5, 536870912},
+  {{ &setup, &store_reg_strided_x2_p50_ilp7, &teardown }, "ST1W (two register, strided, predicated), 50% active lanes", "reg-strided", "FEAT_SME2", "store", 2, 32, 7, 0.5, 536870912},
+  {{ &setup, &store_reg_strided_x2_p50_ilp8, &teardown }, "ST1W (two register, strided, predicated), 50% active lanes", "reg-strided", "FEAT_SME2", "store", 2, 32, 8, 0.5, 536870912},
+  {{ &setup, &store_reg_strided_x2_p25_ilp1, &teardown }, "ST1W (two register, strided, predicated), 25% active lanes", "reg-strided", "FEAT_SME2", "store", 2, 32, 1, 0.25, 536870912},
+  {{ &setup, &store_reg_strided_x2_p25_ilp2, &teardown }, "ST1W (two register, strided, predicated), 25% active lanes", "reg-strided", "FEAT_SME2", "store", 2, 32, 2, 0.25, 536870912},
+  {{ &setup, &store_reg_strided_x2_p25_ilp3, &teardown }, "ST1W (two register, strided, predicated), 25% active lanes", "reg-strided", "FEAT_SME2", "store", 2, 32, 3, 0.25, 536870912},
+  {{ &setup, &store_reg_strided_x2_p25_ilp4, &teardown }, "ST1W (two register, strided, predicated), 25% active lanes", "reg-strided", "FEAT_SME2", "store", 2, 32, 4, 0.25, 536870912},
+  {{ &setup, &store_reg_strided_x2_p25_ilp5, &teardown }, "ST1W (two register, strided, predicated), 25% active lanes", "reg-strided", "FEAT_SME2", "store", 2, 32, 5, 0.25, 536870912},
+  {{ &setup, &store_reg_strided_x2_p25_ilp6, &teardown }, "ST1W (two register, strided, predicated), 25% active lanes", "reg-strided", "FEAT_SME2", "store", 2, 32, 6, 0.25, 536870912},
+  {{ &setup, &store_reg_strided_x2_p25_ilp7, &teardown }, "ST1W (two register, strided, predicated), 25% active lanes", "reg-strided", "FEAT_SME2", "store", 2, 32, 7, 0.25, 536870912},
+  {{ &setup, &store_reg_strided_x2_p25_ilp8, &teardown }, "ST1W (two register, strided, predicated), 25% active lanes", "reg-strided", "FEAT_SME2", "store", 2, 32, 8, 0.25, 536870912},
+  {{ &setup, &copy_reg_strided_x2_ilp1, &teardown }, "LD1W/ST1W (two register, strided, predicated)", "reg-strided", "FEAT_SME2", "copy", 2, 32, 1, 1.0, 536870912},
+  {{ &setup, &copy_reg_strided_x2_ilp2, &teardown }, "LD1W/ST1W (two register, strided, predicated)", "reg-strided", "FEAT_SME2", "copy", 2, 32, 2, 1.0, 536870912},
+  {{ &setup, &copy_reg_strided_x2_ilp3, &teardown }, "LD1W/ST1W (two register, strided, predicated)", "reg-strided", "FEAT_SME2", "copy", 2, 32, 3, 1.0, 536870912},
+  {{ &setup, &copy_reg_strided_x2_ilp4, &teardown }, "LD1W/ST1W (two register, strided, predicated)", "reg-strided", "FEAT_SME2", "copy", 2, 32, 4, 1.0, 536870912},
+  {{ &setup, &copy_reg_strided_x2_ilp5, &teardown }, "LD1W/ST1W (two register, strided, predicated)", "reg-strided", "FEAT_SME2", "copy", 2, 32, 5, 1.0, 536870912},
+  {{ &setup, &copy_reg_strided_x2_ilp6, &teardown }, "LD1W/ST1W (two register, strided, predicated)", "reg-strided", "FEAT_SME2", "copy", 2, 32, 6, 1.0, 536870912},
+  {{ &setup, &copy_reg_strided_x2_ilp7, &teardown }, "LD1W/ST1W (two register, strided, predicated)", "reg-strided", "FEAT_SME2", "copy", 2, 32, 7, 1.0, 536870912},
+  {{ &setup, &copy_reg_strided_x2_ilp8, &teardown }, "LD1W/ST1W (two register, strided, predicated)", "reg-strided", "FEAT_SME2", "copy", 2, 32, 8, 1.0, 536870912},
+  {{ &setup, &copy_reg_strided_x2_p75_ilp1, &teardown }, "LD1W/ST1W (two register, strided, predicated), 75% active lanes", "reg-strided", "FEAT_SME2", "copy", 2, 32, 1, 0.75, 536870912},
+  {{ &setup, &copy_reg_strided_x2_p75_ilp2, &teardown }, "LD1W/ST1W (two register, strided, predicated), 75% active lanes", "reg-strided", "FEAT_SME2", "copy", 2, 32, 2, 0.75, 536870912},
+  {{ &setup, &copy_reg_strided_x2_p75_ilp3, &teardown }, "LD1W/ST1W (two register, strided, predicated), 75% active lanes", "reg-strided", "FEAT_SME2", "copy", 2, 32, 3, 0.75, 536870912},
+  {{ &setup, &copy_reg_strided_x2_p75_ilp4, &teardown }, "LD1W/ST1W (two register, strided, predicated), 75% active lanes", "reg-strided", "FEAT_SME2", "copy", 2, 32, 4, 0.75, 536870912},
+  {{ &setup, &copy_reg_strided_x2_p75_ilp5, &teardown }, "LD1W/ST1W (two register, strided, predicated), 75% active lanes", "reg-strided", "FEAT_SME2", "copy", 2, 32, 5, 0.75, 536870912},
+  {{ &setup, &copy_reg_strided_x2_p75_ilp6, &teardown }, "LD1W/ST1W (two register, strided, predicated), 75% active lanes", "reg-strided", "FEAT_SME2", "copy", 2, 32, 6, 0.75, 536870912},
+  {{ &setup, &copy_reg_strided_x2_p75_ilp7, &teardown }, "LD1W/ST1W (two register, strided, predicated), 75% active lanes", "reg-strided", "FEAT_SME2", "copy", 2, 32, 7, 0.75, 536870912},
+  {{ &setup, &copy_reg_strided_x2_p75_ilp8, &teardown }, "LD1W/ST1W (two register, strided, predicated), 75% active lanes", "reg-strided", "FEAT_SME2", "copy", 2, 32, 8, 0.75, 536870912},
+  {{ &setup, &copy_reg_strided_x2_p50_ilp1, &teardown }, "LD1W/ST1W (two register, strided, predicated), 50% active lanes", "reg-strided", "FEAT_SME2", "copy", 2, 32, 1, 0.5, 536870912},
+  {{ &setup, &copy_reg_strided_x2_p50_ilp2, &teardown }, "LD1W/ST1W (two register, strided, predicated), 50% active lanes", "reg-strided", "FEAT_SME2", "copy", 2, 32, 2, 0.5, 536870912},
+  {{ &setup, &copy_reg_strided_x2_p50_ilp3, &teardown }, "LD1W/ST1W (two register, strided, predicated), 50% active lanes", "reg-strided", "FEAT_SME2", "copy", 2, 32, 3, 0.5, 536870912},
+  {{ &setup, &copy_reg_strided_x2_p50_ilp4, &teardown }, "LD1W/ST1W (two register, strided, predicated), 50% active lanes", "reg-strided", "FEAT_SME2", "copy", 2, 32, 4, 0.5, 536870912},
+  {{ &setup, &copy_reg_strided_x2_p50_ilp5, &teardown }, "LD1W/ST1W (two register, strided, predicated), 50% active lanes", "reg-strided", "FEAT_SME2", "copy", 2, 32, 5, 0.5, 536870912},
+  {{ &setup, &copy_reg_strided_x2_p50_ilp6, &teardown }, "LD1W/ST1W (two register, strided, predicated), 50% active lanes", "reg-strided", "FEAT_SME2", "copy", 2, 32, 6, 0.5, 536870912},
+  {{ &setup, &copy_reg_strided_x2_p50_ilp7, &teardown }, "LD1W/ST1W (two register, strided, predicated), 50% active lanes", "reg-strided", "FEAT_SME2", "copy", 2, 32, 7, 0.5, 536870912},
+  {{ &setup, &copy_reg_strided_x2_p50_ilp8, &teardown }, "LD1W/ST1W (two register, strided, predicated), 50% active lanes", "reg-strided", "FEAT_SME2", "copy", 2, 32, 8, 0.5, 536870912},
+  {{ &setup, &copy_reg_strided_x2_p25_ilp1, &teardown }, "LD1W/ST1W (two register, strided, predicated), 25% active lanes", "reg-strided", "FEAT_SME2", "copy", 2, 32, 1, 0.25, 536870912},
+  {{ &setup, &copy_reg_strided_x2_p25_ilp2, &teardown }, "LD1W/ST1W (two register, strided, predicated), 25% active lanes", "reg-strided", "FEAT_SME2", "copy", 2, 32, 2, 0.25, 536870912},
+  {{ &setup, &copy_reg_strided_x2_p25_ilp3, &teardown }, "LD1W/ST1W (two register, strided, predicated), 25% active lanes", "reg-strided", "FEAT_SME2", "copy", 2, 32, 3, 0.25, 536870912},
+  {{ &setup, &copy_reg_strided_x2_p25_ilp4, &teardown }, "LD1W/ST1W (two register, strided, predicated), 25% active lanes", "reg-strided", "FEAT_SME2", "copy", 2, 32, 4, 0.25, 536870912},
+  {{ &setup, &copy_reg_strided_x2_p25_ilp5, &teardown }, "LD1W/ST1W (two register, strided, predicated), 25% active lanes", "reg-strided", "FEAT_SME2", "copy", 2, 32, 5, 0.25, 536870912},
+  {{ &setup, &copy_reg_strided_x2_p25_ilp6, &teardown }, "LD1W/ST1W (two register, strided, predicated), 25% active lanes", "reg-strided", "FEAT_SME2", "copy", 2, 32, 6, 0.25, 536870912},
+  {{ &setup, &copy_reg_strided_x2_p25_ilp7, &teardown }, "LD1W/ST1W (two register, strided, predicated), 25% active lanes", "reg-strided", "FEAT_SME2", "copy", 2, 32, 7, 0.25, 536870912},
+  {{ &setup, &copy_reg_strided_x2_p25_ilp8, &teardown }, "LD1W/ST1W (two register, strided, predicated), 25% active lanes", "reg-strided", "FEAT_SME2", "copy", 2, 32, 8, 0.25, 536870912},
+  {{ &setup, &load_reg_strided_x4_ilp1, &teardown }, "LD1W (four register, strided, predicated)", "reg-strided", "FEAT_SME2", "load", 4, 32, 1, 1.0, 536870912},
+  {{ &setup, &load_reg_strided_x4_ilp2, &teardown }, "LD1W (four register, strided, predicated)", "reg-strided", "FEAT_SME2", "load", 4, 32, 2, 1.0, 536870912},
+  {{ &setup, &load_reg_strided_x4_ilp3, &teardown }, "LD1W (four register, strided, predicated)", "reg-strided", "FEAT_SME2", "load", 4, 32, 3, 1.0, 536870912},
+  {{ &setup, &load_reg_strided_x4_ilp4, &teardown }, "LD1W (four register, strided, predicated)", "reg-strided", "FEAT_SME2", "load", 4, 32, 4, 1.0, 536870912},
+  {{ &setup, &load_reg_strided_x4_ilp5, &teardown }, "LD1W (four register, strided, predicated)", "reg-strided", "FEAT_SME2", "load", 4, 32, 5, 1.0, 536870912},
+  {{ &setup, &load_reg_strided_x4_ilp6, &teardown }, "LD1W (four register, strided, predicated)", "reg-strided", "FEAT_SME2", "load", 4, 32, 6, 1.0, 536870912},
+  {{ &setup, &load_reg_strided_x4_ilp7, &teardown }, "LD1W (four register, strided, predicated)", "reg-strided", "FEAT_SME2", "load", 4, 32, 7, 1.0, 536870912},
+  {{ &setup, &load_reg_strided_x4_ilp8, &teardown }, "LD1W (four register, strided, predicated)", "reg-strided", "FEAT_SME2", "load", 4, 32, 8, 1.0, 536870912},
+  {{ &setup, &load_reg_strided_x4_p75_ilp1, &teardown }, "LD1W (four register, strided, predicated), 75% active lanes", "reg-strided", "FEAT_SME2", "load", 4, 32, 1, 0.75, 536870912},
+  {{ &setup, &load_reg_strided_x4_p75_ilp2, &teardown }, "LD1W (four register, strided, predicated), 75% active lanes", "reg-strided", "FEAT_SME2", "load", 4, 32, 2, 0.75, 536870912},
+  {{ &setup, &load_reg_strided_x4_p75_ilp3, &teardown }, "LD1W (four register, strided, predicated), 75% active lanes", "reg-strided", "FEAT_SME2", "load", 4, 32, 3, 0.75, 536870912},
+  {{ &setup, &load_reg_strided_x4_p75_ilp4, &teardown }, "LD1W (four register, strided, predicated), 75% active lanes", "reg-strided", "FEAT_SME2", "load", 4, 32, 4, 0.75, 536870912},
+  {{ &setup, &load_reg_strided_x4_p75_ilp5, &teardown }, "LD1W (four register, strided, predicated), 75% active lanes", "reg-strided", "FEAT_SME2", "load", 4, 32, 5, 0.75, 536870912},
+  {{ &setup, &load_reg_strided_x4_p75_ilp6, &teardown }, "LD1W (four register, strided, predicated), 75% active lanes", "reg-strided", "FEAT_SME2", "load", 4, 32, 6, 0.75, 536870912},
+  {{ &setup, &load_reg_strided_x4_p75_ilp7, &teardown }, "LD1W (four register, strided, predicated), 75% active lanes", "reg-strided", "FEAT_SME2", "load", 4, 32, 7, 0.75, 536870912},
+  {{ &setup, &load_reg_strided_x4_p75_ilp8, &teardown }, "LD1W (four register, strided, predicated), 75% active lanes", "reg-strided", "FEAT_SME2", "load", 4, 32, 8, 0.75, 536870912},
+  {{ &setup, &load_reg_strided_x4_p50_ilp1, &teardown }, "LD1W (four register, strided, predicated), 50% active lanes", "reg-strided", "FEAT_SME2", "load", 4, 32, 1, 0.5, 536870912},
+  {{ &setup, &load_reg_strided_x4_p50_ilp2, &teardown }, "LD1W (four register, strided, predicated), 50% active lanes", "reg-strided", "FEAT_SME2", "load", 4, 32, 2, 0.5, 536870912},
+  {{ &setup, &load_reg_strided_x4_p50_ilp3, &teardown }, "LD1W (four register, strided, predicated), 50% active lanes", "reg-strided", "FEAT_SME2", "load", 4, 32, 3, 0.5, 536870912},
+  {{ &setup, &load_reg_strided_x4_p50_ilp4, &teardown }, "LD1W (four register, strided, predicated), 50% active lanes", "reg-strided", "FEAT_SME2", "load", 4, 32, 4, 0.5, 536870912},
+  {{ &setup, &load_reg_strided_x4_p50_ilp5, &teardown }, "LD1W (four register, strided, predicated), 50% active lanes", "reg-strided", "FEAT_SME2", "load", 4, 32, 5, 0.5, 536870912},
+  {{ &setup, &load_reg_strided_x4_p50_ilp6, &teardown }, "LD1W (four register, strided, predicated), 50% active lanes", "reg-strided", "FEAT_SME2", "load", 4, 32, 6, 0.5, 536870912},
+  {{ &setup, &load_reg_strided_x4_p50_ilp7, &teardown }, "LD1W (four register, strided, predicated), 50% active lanes", "reg-strided", "FEAT_SME2", "load", 4, 32, 7, 0.5, 536870912},
+  {{ &setup, &load_reg_strided_x4_p50_ilp8, &teardown }, "LD1W (four register, strided, predicated), 50% active lanes", "reg-strided", "FEAT_SME2", "load", 4, 32, 8, 0.5, 536870912},
+  {{ &setup, &load_reg_strided_x4_p25_ilp1, &teardown }, "LD1W (four register, strided, predicated), 25% active lanes", "reg-strided", "FEAT_SME2", "load", 4, 32, 1, 0.25, 536870912},
+  {{ &setup, &load_reg_strided_x4_p25_ilp2, &teardown }, "LD1W (four register, strided, predicated), 25% active lanes", "reg-strided", "FEAT_SME2", "load", 4, 32, 2, 0.25, 536870912},
+  {{ &setup, &load_reg_strided_x4_p25_ilp3, &teardown }, "LD1W (four register, strided, predicated), 25% active lanes", "reg-strided", "FEAT_SME2", "load", 4, 32, 3, 0.25, 536870912},
+  {{ &setup, &load_reg_strided_x4_p25_ilp4, &teardown }, "LD1W (four register, strided, predicated), 25% active lanes", "reg-strided", "FEAT_SME2", "load", 4, 32, 4, 0.25, 536870912},
+  {{ &setup, &load_reg_strided_x4_p25_ilp5, &teardown }, "LD1W (four register, strided, predicated), 25% active lanes", "reg-strided", "FEAT_SME2", "load", 4, 32, 5, 0.25, 536870912},
+  {{ &setup, &load_reg_strided_x4_p25_ilp6, &teardown }, "LD1W (four register, strided, predicated), 25% active lanes", "reg-strided", "FEAT_SME2", "load", 4, 32, 6, 0.25, 536870912},
+  {{ &setup, &load_reg_strided_x4_p25_ilp7, &teardown }, "LD1W (four register, strided, predicated), 25% active lanes", "reg-strided", "FEAT_SME2", "load", 4, 32, 7, 0.25, 536870912},
+  {{ &setup, &load_reg_strided_x4_p25_ilp8, &teardown }, "LD1W (four register, strided, predicated), 25% active lanes", "reg-strided", "FEAT_SME2", "load", 4, 32, 8, 0.25, 536870912},
+  {{ &setup, &store_reg_strided_x4_ilp1, &teardown }, "ST1W (four register, strided, predicated)", "reg-strided", "FEAT_SME2", "store", 4, 32, 1, 1.0, 536870912},
+  {{ &setup, &store_reg_strided_x4_ilp2, &teardown }, "ST1W (four register, strided, predicated)", "reg-strided", "FEAT_SME2", "store", 4, 32, 2, 1.0, 536870912},
+  {{ &setup, &store_reg_strided_x4_ilp3, &teardown }, "ST1W (four register, strided, predicated)", "reg-strided", "FEAT_SME2", "store", 4, 32, 3, 1.0, 536870912},
+  {{ &setup, &store_reg_strided_x4_ilp4, &teardown }, "ST1W (four register, strided, predicated)", "reg-strided", "FEAT_SME2", "store", 4, 32, 4, 1.0, 536870912},
+  {{ &setup, &store_reg_strided_x4_ilp5, &teardown }, "ST1W (four register, strided, predicated)", "reg-strided", "FEAT_SME2", "store", 4, 32, 5, 1.0, 536870912},
+  {{ &setup, &store_reg_strided_x4_ilp6, &teardown }, "ST1W (four register, strided, predicated)", "reg-strided", "FEAT_SME2", "store", 4, 32, 6, 1.0, 536870912},
+  {{ &setup, &store_reg_strided_x4_ilp7, &teardown }, "ST1W (four register, strided, predicated)", "reg-strided", "FEAT_SME2", "store", 4, 32, 7, 1.0, 536870912},
+  {{ &setup, &store_reg_strided_x4_ilp8, &teardown }, "ST1W (four register, strided, predicated)", "reg-strided", "FEAT_SME2", "store", 4, 32, 8, 1.0, 536870912},
+  {{ &setup, &store_reg_strided_x4_p75_ilp1, &teardown }, "ST1W (four register, strided, predicated), 75% active lanes", "reg-strided", "FEAT_SME2", "store", 4, 32, 1, 0.75, 536870912},
+  {{ &setup, &store_reg_strided_x4_p75_ilp2, &teardown }, "ST1W (four register, strided, predicated), 75% active lanes", "reg-strided", "FEAT_SME2", "store", 4, 32, 2, 0.75, 536870912},
+  {{ &setup, &store_reg_strided_x4_p75_ilp3, &teardown }, "ST1W (four register, strided, predicated), 75% active lanes", "reg-strided", "FEAT_SME2", "store", 4, 32, 3, 0.75, 536870912},
+  {{ &setup, &store_reg_strided_x4_p75_ilp4, &teardown }, "ST1W (four register, strided, predicated), 75% active lanes", "reg-strided", "FEAT_SME2", "store", 4, 32, 4, 0.75, 536870912},
+  {{ &setup, &store_reg_strided_x4_p75_ilp5, &teardown }, "ST1W (four register, strided, predicated), 75% active lanes", "reg-strided", "FEAT_SME2", "store", 4, 32, 5, 0.75, 536870912},
+  {{ &setup, &store_reg_strided_x4_p75_ilp6, &teardown }, "ST1W (four register, strided, predicated), 75% active lanes", "reg-strided", "FEAT_SME2", "store", 4, 32, 6, 0.75, 536870912},
+  {{ &setup, &store_reg_strided_x4_p75_ilp7, &teardown }, "ST1W (four register, strided, predicated), 75% active lanes", "reg-strided", "FEAT_SME2", "store", 4, 32, 7, 0.75, 536870912},
+  {{ &setup, &store_reg_strided_x4_p75_ilp8, &teardown }, "ST1W (four register, strided, predicated), 75% active lanes", "reg-strided", "FEAT_SME2", "store", 4, 32, 8, 0.75, 536870912},
+  {{ &setup, &store_reg_strided_x4_p50_ilp1, &teardown }, "ST1W (four register, strided, predicated), 50% active lanes", "reg-strided", "FEAT_SME2", "store", 4, 32, 1, 0.5, 536870912},
+  {{ &setup, &store_reg_strided_x4_p50_ilp2, &teardown }, "ST1W (four register, strided, predicated), 50% active lanes", "reg-strided", "FEAT_SME2", "store", 4, 32, 2, 0.5, 536870912},
+  {{ &setup, &store_reg_strided_x4_p50_ilp3, &teardown }, "ST1W (four register, strided, predicated), 50% active lanes", "reg-strided", "FEAT_SME2", "store", 4, 32, 3, 0.5, 536870912},
+  {{ &setup, &store_reg_strided_x4_p50_ilp4, &teardown }, "ST1W (four register, strided, predicated), 50% active lanes", "reg-strided", "FEAT_SME2", "store", 4, 32, 4, 0.5, 536870912},
+  {{ &setup, &store_reg_strided_x4_p50_ilp5, &teardown }, "ST1W (four register, strided, predicated), 50% active lanes", "reg-strided", "FEAT_SME2", "store", 4, 32, 5, 0.5, 536870912},
+  {{ &setup, &store_reg_strided_x4_p50_ilp6, &teardown }, "ST1W (four register, strided, predicated), 50% active lanes", "reg-strided", "FEAT_SME2", "store", 4, 32, 6, 0.5, 536870912},
+  {{ &setup, &store_reg_strided_x4_p50_ilp7, &teardown }, "ST1W (four register, strided, predicated), 50% active lanes", "reg-strided", "FEAT_SME2", "store", 4, 32, 7, 0.5, 536870912},
+  {{ &setup, &store_reg_strided_x4_p50_ilp8, &teardown }, "ST1W (four register, strided, predicated), 50% active lanes", "reg-strided", "FEAT_SME2", "store", 4, 32, 8, 0.5, 536870912},
+  {{ &setup, &store_reg_strided_x4_p25_ilp1, &teardown }, "ST1W (four register, strided, predicated), 25% active lanes", "reg-strided", "FEAT_SME2", "store", 4, 32, 1, 0.25, 536870912},
+  {{ &setup, &store_reg_strided_x4_p25_ilp2, &teardown }, "ST1W (four register, strided, predicated), 25% active lanes", "reg-strided", "FEAT_SME2", "store", 4, 32, 2, 0.25, 536870912},
+  {{ &setup, &store_reg_strided_x4_p25_ilp3, &teardown }, "ST1W (four register, strided, predicated), 25% active lanes", "reg-strided", "FEAT_SME2", "store", 4, 32, 3, 0.25, 536870912},
+  {{ &setup, &store_reg_strided_x4_p25_ilp4, &teardown }, "ST1W (four register, strided, predicated), 25% active lanes", "reg-strided", "FEAT_SME2", "store", 4, 32, 4, 0.25, 536870912},
+  {{ &setup, &store_reg_strided_x4_p25_ilp5, &teardown }, "ST1W (four register, strided, predicated), 25% active lanes", "reg-strided", "FEAT_SME2", "store", 4, 32, 5, 0.25, 536870912},
+  {{ &setup, &store_reg_strided_x4_p25_ilp6, &teardown }, "ST1W (four register, strided, predicated), 25% active lanes", "reg-strided", "FEAT_SME2", "store", 4, 32, 6, 0.25, 536870912},
+  {{ &setup, &store_reg_strided_x4_p25_ilp7, &teardown }, "ST1W (four register, strided, predicated), 25% active lanes", "reg-strided", "FEAT_SME2", "store", 4, 32, 7, 0.25, 536870912},
+  {{ &setup, &store_reg_strided_x4_p25_ilp8, &teardown }, "ST1W (four register, strided, predicated), 25% active lanes", "reg-strided", "FEAT_SME2", "store", 4, 32, 8, 0.25, 536870912},
+  {{ &setup, &copy_reg_strided_x4_ilp1, &teardown }, "LD1W/ST1W (four register, strided, predicated)", "reg-strided", "FEAT_SME2", "copy", 4, 32, 1, 1.0, 536870912},
+  {{ &setup, &copy_reg_strided_x4_ilp2, &teardown }, "LD1W/ST1W (four register, strided, predicated)", "reg-strided", "FEAT_SME2", "copy", 4, 32, 2, 1.0, 536870912},
+  {{ &setup, &copy_reg_strided_x4_ilp3, &teardown }, "LD1W/ST1W (four register, strided, predicated)", "reg-strided", "FEAT_SME2", "copy", 4, 32, 3, 1.0, 536870912},
+  {{ &setup, &copy_reg_strided_x4_ilp4, &teardown }, "LD1W/ST1W (four register, strided, predicated)", "reg-strided", "FEAT_SME2", "copy", 4, 32, 4, 1.0, 536870912},
+  {{ &setup, &copy_reg_strided_x4_ilp5, &teardown }, "LD1W/ST1W (four register, strided, predicated)", "reg-strided", "FEAT_SME2", "copy", 4, 32, 5, 1.0, 536870912},
+  {{ &setup, &copy_reg_strided_x4_ilp6, &teardown }, "LD1W/ST1W (four register, strided, predicated)", "reg-strided", "FEAT_SME2", "copy", 4, 32, 6, 1.0, 536870912},
+  {{ &setup, &copy_reg_strided_x4_ilp7, &teardown }, "LD1W/ST1W (four register, strided, predicated)", "reg-strided", "FEAT_SME2", "copy", 4, 32, 7, 1.0, 536870912},
+  {{ &setup, &copy_reg_strided_x4_ilp8, &teardown }, "LD1W/ST1W (four register, strided, predicated)", "reg-strided", "FEAT_SME2", "copy", 4, 32, 8, 1.0, 536870912},
+  {{ &setup, &copy_reg_strided_x4_p75_ilp1, &teardown }, "LD1W/ST1W (four register, strided, predicated), 75% active lanes", "reg-strided", "FEAT_SME2", "copy", 4, 32, 1, 0.75, 536870912},
+  {{ &setup, &copy_reg_strided_x4_p75_ilp2, &teardown }, "LD1W/ST1W (four register, strided, predicated), 75% active lanes", "reg-strided", "FEAT_SME2", "copy", 4, 32, 2, 0.75, 536870912},
+  {{ &setup, &copy_reg_strided_x4_p75_ilp3, &teardown }, "LD1W/ST1W (four register, strided, predicated), 75% active lanes", "reg-strided", "FEAT_SME2", "copy", 4, 32, 3, 0.75, 536870912},
+  {{ &setup, &copy_reg_strided_x4_p75_ilp4, &teardown }, "LD1W/ST1W (four register, strided, predicated), 75% active lanes", "reg-strided", "FEAT_SME2", "copy", 4, 32, 4, 0.75, 536870912},
+  {{ &setup, &copy_reg_strided_x4_p75_ilp5, &teardown }, "LD1W/ST1W (four register, strided, predicated), 75% active lanes", "reg-strided", "FEAT_SME2", "copy", 4, 32, 5, 0.75, 536870912},
+  {{ &setup, &copy_reg_strided_x4_p75_ilp6, &teardown }, "LD1W/ST1W (four register, strided, predicated), 75% active lanes", "reg-strided", "FEAT_SME2", "copy", 4, 32, 6, 0.75, 536870912},
+  {{ &setup, &copy_reg_strided_x4_p75_ilp7, &teardown }, "LD1W/ST1W (four register, strided, predicated), 75% active lanes", "reg-strided", "FEAT_SME2", "copy", 4, 32, 7, 0.75, 536870912},
+  {{ &setup, &copy_reg_strided_x4_p75_ilp8, &teardown }, "LD1W/ST1W (four register, strided, predicated), 75% active lanes", "reg-strided", "FEAT_SME2", "copy", 4, 32, 8, 0.75, 536870912},
+  {{ &setup, &copy_reg_strided_x4_p50_ilp1, &teardown }, "LD1W/ST1W (four register, strided, predicated), 50% active lanes", "reg-strided", "FEAT_SME2", "copy", 4, 32, 1, 0.5, 536870912},
+  {{ &setup, &copy_reg_strided_x4_p50_ilp2, &teardown }, "LD1W/ST1W (four register, strided, predicated), 50% active lanes", "reg-strided", "FEAT_SME2", "copy", 4, 32, 2, 0.5, 536870912},
+  {{ &setup, &copy_reg_strided_x4_p50_ilp3, &teardown }, "LD1W/ST1W (four register, strided, predicated), 50% active lanes", "reg-strided", "FEAT_SME2", "copy", 4, 32, 3, 0.5, 536870912},
+  {{ &setup, &copy_reg_strided_x4_p50_ilp4, &teardown }, "LD1W/ST1W (four register, strided, predicated), 50% active lanes", "reg-strided", "FEAT_SME2", "copy", 4, 32, 4, 0.5, 536870912},
+  {{ &setup, &copy_reg_strided_x4_p50_ilp5, &teardown }, "LD1W/ST1W (four register, strided, predicated), 50% active lanes", "reg-strided", "FEAT_SME2", "copy", 4, 32, 5, 0.5, 536870912},
+  {{ &setup, &copy_reg_strided_x4_p50_ilp6, &teardown }, "LD1W/ST1W (four register, strided, predicated), 50% active lanes", "reg-strided", "FEAT_SME2", "copy", 4, 32, 6, 0.5, 536870912},
+  {{ &setup, &copy_reg_strided_x4_p50_ilp7, &teardown }, "LD1W/ST1W (four register, strided, predicated), 50% active lanes", "reg-strided", "FEAT_SME2", "copy", 4, 32, 7, 0.5, 536870912},
+  {{ &setup, &copy_reg_strided_x4_p50_ilp8, &teardown }, "LD1W/ST1W (four register, strided, predicated), 50% active lanes", "reg-strided", "FEAT_SME2", "copy", 4, 32, 8, 0.5, 536870912},
+  {{ &setup, &copy_reg_strided_x4_p25_ilp1, &teardown }, "LD1W/ST1W (four register, strided, predicated), 25% active lanes", "reg-strided", "FEAT_SME2", "copy", 4, 32, 1, 0.25, 536870912},
+  {{ &setup, &copy_reg_strided_x4_p25_ilp2, &teardown }, "LD1W/ST1W (four register, strided, predicated), 25% active lanes", "reg-strided", "FEAT_SME2", "copy", 4, 32, 2, 0.25, 536870912},
+  {{ &setup, &copy_reg_strided_x4_p25_ilp3, &teardown }, "LD1W/ST1W (four register, strided, predicated), 25% active lanes", "reg-strided", "FEAT_SME2", "copy", 4, 32, 3, 0.25, 536870912},
+  {{ &setup, &copy_reg_strided_x4_p25_ilp4, &teardown }, "LD1W/ST1W (four register, strided, predicated), 25% active lanes", "reg-strided", "FEAT_SME2", "copy", 4, 32, 4, 0.25, 536870912},
+  {{ &setup, &copy_reg_strided_x4_p25_ilp5, &teardown }, "LD1W/ST1W (four register, strided, predicated), 25% active lanes", "reg-strided", "FEAT_SME2", "copy", 4, 32, 5, 0.25, 536870912},
+  {{ &setup, &copy_reg_strided_x4_p25_ilp6, &teardown }, "LD1W/ST1W (four register, strided, predicated), 25% active lanes", "reg-strided", "FEAT_SME2", "copy", 4, 32, 6, 0.25, 536870912},
+  {{ &setup, &copy_reg_strided_x4_p25_ilp7, &teardown }, "LD1W/ST1W (four register, strided, predicated), 25% active lanes", "reg-strided", "FEAT_SME2", "copy", 4, 32, 7, 0.25, 536870912},
+  {{ &setup, &copy_reg_strided_x4_p25_ilp8, &teardown }, "LD1W/ST1W (four register, strided, predicated), 25% active lanes", "reg-strided", "FEAT_SME2", "copy", 4, 32, 8, 0.25, 536870912}
+};
+
+CONST_PTR(mem_benchmark_t) mem_benchmarks = benchmarks;
+const size_t mem_benchmarks_count = sizeof(benchmarks)/sizeof(benchmarks[0]);
+
+// execution order (none, run the table in order)
+const run_schedule_entry_t* _Nullable mem_benchmarks_schedule = nullptr;
+const size_t mem_benchmarks_schedule_count = 0;
@@ -0,0 +1,151 @@
+// generated by tools/gen_mixed_benchmarks.py, do not edit!
+#include <assert.h>
+#include <stdlib.h>
+#include "../bench.h"
+
+// Benchmark parameters
+typedef struct {
+  char*  buffer;
+  size_t size;
+  size_t n_iterations;
+} benchmark_data_t;
+
+// benchmark functions
+
+double mix_fmopa_f32_ld1w_x4_4x0(const void* args) {
+  // FMOPA (FP32) + LD1W (four register, adjacent, predicated)
+  //
+  // 4x fmopa + 0x ld1w per loop iteration (2048 OPs, 0 bytes loaded)
+  const benchmark_data_t* data = args;
+  assert(data->size >= 0);
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x1, %[buffer]                                           \n"
+    "mov x2, %[buffer]                                           \n"
+    "mov x3, %[end]                                              \n"
+    "ptrue p0.s                                                  \n"
+    "ptrue p1.s                                                  \n"
+    "ptrue pn8.s                                                 \n"
+    "1:                                                          \n"
+    "  fmopa za0.s, p0/m, p1/m, z0.s, z0.s                       \n"
+    "  fmopa za1.s, p0/m, p1/m, z1.s, z1.s                       \n"
+    "  fmopa za2.s, p0/m, p1/m, z2.s, z2.s                       \n"
+    "  fmopa za3.s, p0/m, p1/m, z3.s, z3.s                       \n"
+    "                                                            \n"
+    "  add x1, x1, #0                                            \n"
+    "  cmp x1, x3                                                \n"
+    "  csel x1, x2, x1, hi                                       \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (data->n_iterations), [buffer] "r" (data->buffer), [end] "r" (data->buffer + data->size - 0)
+    : "x0", "x1", "x2", "x3"
+  );
+
+  // number of loop iterations executed
+  return (double)data->n_iterations;
+}
+
+
+double mix_fmopa_f32_ldr_4x0(const void* args) {
+  // FMOPA (FP32) + LDR (one register, unpredicated)
+  //
+  // 4x fmopa + 0x ldr per loop iteration (2048 OPs, 0 bytes loaded)
+  const benchmark_data_t* data = args;
+  assert(data->size >= 0);
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x1, %[buffer]                                           \n"
+    "mov x2, %[buffer]                                           \n"
+    "mov x3, %[end]                                              \n"
+    "ptrue p0.s                                                  \n"
+    "ptrue p1.s                                                  \n"
+    "1:                                                          \n"
+    "  fmopa za0.s, p0/m, p1/m, z0.s, z0.s                       \n"
+    "  fmopa za1.s, p0/m, p1/m, z1.s, z1.s                       \n"
+    "  fmopa za2.s, p0/m, p1/m, z2.s, z2.s                       \n"
+    "  fmopa za3.s, p0/m, p1/m, z3.s, z3.s                       \n"
+    "                                                            \n"
+    "  add x1, x1, #0                                            \n"
+    "  cmp x1, x3                                                \n"
+    "  csel x1, x2, x1, hi                                       \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (data->n_iterations), [buffer] "r" (data->buffer), [end] "r" (data->buffer + data->size - 0)
+    : "x0", "x1", "x2", "x3"
+  );
+
+  // number of loop iterations executed
+  return (double)data->n_iterations;
+}
+
+
+double mix_fmopa_f32_fmla_f32_1x4(const void* args) {
+  // FMOPA (FP32) + FMLA (FP32, one vector)
+  //
+  // 1x fmopa + 4x fmla per loop iteration (640 OPs, 0 bytes loaded)
+  const benchmark_data_t* data = args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "ptrue p0.s                                                  \n"
+    "ptrue p1.s                                                  \n"
+    "1:                                                          \n"
+    "  fmla z4.s, p0/m, z4.s, z4.s                               \n"
+    "  fmla z5.s, p0/m, z5.s, z5.s                               \n"
+    "  fmopa za0.s, p0/m, p1/m, z0.s, z0.s                       \n"
+    "  fmla z6.s, p0/m, z6.s, z6.s                               \n"
+    "  fmla z7.s, p0/m, z7.s, z7.s                               \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (data->n_iterations)
+    : "x0"
+  );
+
+  // number of loop iterations executed
+  return (double)data->n_iterations;
+}
+
+
+double mix_fdot_f16_fmla_f32_vgx2_4x0(const void* args) {
+  // FDOT (FP16 to FP32, 2-way, two vectors) + FMLA (FP32, two vectors)
+  //
+  // 4x fdot + 0x fmla per loop iteration (512 OPs, 0 bytes loaded)
+  const benchmark_data_t* data = args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  fdot za.s[w8, 0, VGx2], {z0.h-z1.h}, {z0.h-z1.h}          \n"
+    "  fdot za.s[w8, 1, VGx2], {z0.h-z1.h}, {z0.h-z1.h}          \n"
+    "  fdot za.s[w8, 2, VGx2], {z2.h-z3.h}, {z2.h-z3.h}          \n"
+    "  fdot za.s[w8, 3, VGx2], {z2.h-z3.h}, {z2.h-z3.h}          \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (data->n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of loop iterations executed
+  return (double)data->n_iterations;
+}
+
@@ -0,0 +1,153 @@
+// generated by tools/gen_mixed_benchmarks.py, do not edit!
+#include <assert.h>
+#include <stdlib.h>
+#include "../bench.h"
+
+// Benchmark parameters
+typedef struct {
+  char*  buffer;
+  size_t size;
+  size_t n_iterations;
+} benchmark_data_t;
+
+// benchmark functions
+
+double mix_fmopa_f32_ld1w_x4_1x4(const void* args) {
+  // FMOPA (FP32) + LD1W (four register, adjacent, predicated)
+  //
+  // 1x fmopa + 4x ld1w per loop iteration (512 OPs, 1024 bytes loaded)
+  const benchmark_data_t* data = args;
+  assert(data->size >= 1024);
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x1, %[buffer]                                           \n"
+    "mov x2, %[buffer]                                           \n"
+    "mov x3, %[end]                                              \n"
+    "ptrue p0.s                                                  \n"
+    "ptrue p1.s                                                  \n"
+    "ptrue pn8.s                                                 \n"
+    "1:                                                          \n"
+    "  ld1w {z16.s-z19.s}, pn8/z, [x1, 0, MUL VL]                \n"
+    "  ld1w {z20.s-z23.s}, pn8/z, [x1, 4, MUL VL]                \n"
+    "  fmopa za0.s, p0/m, p1/m, z0.s, z0.s                       \n"
+    "  ld1w {z24.s-z27.s}, pn8/z, [x1, 8, MUL VL]                \n"
+    "  ld1w {z28.s-z31.s}, pn8/z, [x1, 12, MUL VL]               \n"
+    "                                                            \n"
+    "  add x1, x1, #1024                                         \n"
+    "  cmp x1, x3                                                \n"
+    "  csel x1, x2, x1, hi                                       \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (data->n_iterations), [buffer] "r" (data->buffer), [end] "r" (data->buffer + data->size - 1024)
+    : "x0", "x1", "x2", "x3"
+  );
+
+  // number of loop iterations executed
+  return (double)data->n_iterations;
+}
+
+
+double mix_fmopa_f32_ldr_1x4(const void* args) {
+  // FMOPA (FP32) + LDR (one register, unpredicated)
+  //
+  // 1x fmopa + 4x ldr per loop iteration (512 OPs, 256 bytes loaded)
+  const benchmark_data_t* data = args;
+  assert(data->size >= 256);
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x1, %[buffer]                                           \n"
+    "mov x2, %[buffer]                                           \n"
+    "mov x3, %[end]                                              \n"
+    "ptrue p0.s                                                  \n"
+    "ptrue p1.s                                                  \n"
+    "1:                                                          \n"
+    "  ldr z16, [x1, 0, MUL VL]                                  \n"
+    "  ldr z17, [x1, 1, MUL VL]                                  \n"
+    "  fmopa za0.s, p0/m, p1/m, z0.s, z0.s                       \n"
+    "  ldr z18, [x1, 2, MUL VL]                                  \n"
+    "  ldr z19, [x1, 3, MUL VL]                                  \n"
+    "                                                            \n"
+    "  add x1, x1, #256                                          \n"
+    "  cmp x1, x3                                                \n"
+    "  csel x1, x2, x1, hi                                       \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (data->n_iterations), [buffer] "r" (data->buffer), [end] "r" (data->buffer + data->size - 256)
+    : "x0", "x1", "x2", "x3"
+  );
+
+  // number of loop iterations executed
+  return (double)data->n_iterations;
+}
+
+
+double mix_fmopa_f32_fmla_f32_4x0(const void* args) {
+  // FMOPA (FP32) + FMLA (FP32, one vector)
+  //
+  // 4x fmopa + 0x fmla per loop iteration (2048 OPs, 0 bytes loaded)
+  const benchmark_data_t* data = args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "ptrue p0.s                                                  \n"
+    "ptrue p1.s                                                  \n"
+    "1:                                                          \n"
+    "  fmopa za0.s, p0/m, p1/m, z0.s, z0.s                       \n"
+    "  fmopa za1.s, p0/m, p1/m, z1.s, z1.s                       \n"
+    "  fmopa za2.s, p0/m, p1/m, z2.s, z2.s                       \n"
+    "  fmopa za3.s, p0/m, p1/m, z3.s, z3.s                       \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (data->n_iterations)
+    : "x0"
+  );
+
+  // number of loop iterations executed
+  return (double)data->n_iterations;
+}
+
+
+double mix_fdot_f16_fmla_f32_vgx2_1x4(const void* args) {
+  // FDOT (FP16 to FP32, 2-way, two vectors) + FMLA (FP32, two vectors)
+  //
+  // 1x fdot + 4x fmla per loop iteration (384 OPs, 0 bytes loaded)
+  const benchmark_data_t* data = args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  fmla za.s[w10, 0, VGx2], {z16.s-z17.s}, {z16.s-z17.s}     \n"
+    "  fmla za.s[w10, 1, VGx2], {z16.s-z17.s}, {z16.s-z17.s}     \n"
+    "  fdot za.s[w8, 0, VGx2], {z0.h-z1.h}, {z0.h-z1.h}          \n"
+    "  fmla za.s[w10, 2, VGx2], {z18.s-z19.s}, {z18.s-z19.s}     \n"
+    "  fmla za.s[w10, 3, VGx2], {z18.s-z19.s}, {z18.s-z19.s}     \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (data->n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of loop iterations executed
+  return (double)data->n_iterations;
+}
+
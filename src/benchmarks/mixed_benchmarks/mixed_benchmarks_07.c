@@ -0,0 +1,43 @@
+// generated by tools/gen_mixed_benchmarks.py, do not edit!
+#include <assert.h>
+#include <stdlib.h>
+#include "../bench.h"
+
+// Benchmark parameters
+typedef struct {
+  char*  buffer;
+  size_t size;
+  size_t n_iterations;
+} benchmark_data_t;
+
+// benchmark functions
+
+double mix_fmopa_f32_fmla_f32_0x4(const void* args) {
+  // FMOPA (FP32) + FMLA (FP32, one vector)
+  //
+  // 0x fmopa + 4x fmla per loop iteration (128 OPs, 0 bytes loaded)
+  const benchmark_data_t* data = args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "ptrue p0.s                                                  \n"
+    "ptrue p1.s                                                  \n"
+    "1:                                                          \n"
+    "  fmla z4.s, p0/m, z4.s, z4.s                               \n"
+    "  fmla z5.s, p0/m, z5.s, z5.s                               \n"
+    "  fmla z6.s, p0/m, z6.s, z6.s                               \n"
+    "  fmla z7.s, p0/m, z7.s, z7.s                               \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (data->n_iterations)
+    : "x0"
+  );
+
+  // number of loop iterations executed
+  return (double)data->n_iterations;
+}
+
@@ -0,0 +1,102 @@
+// generated by tools/gen_mixed_benchmarks.py, do not edit!
+#include <assert.h>
+#include <stdlib.h>
+#include "../bench.h"
+
+// Benchmark parameters
+typedef struct {
+  char*  buffer;
+  size_t size;
+  size_t n_iterations;
+} benchmark_data_t;
+
+// benchmark functions
+double mix_fmopa_f32_ld1w_x4_4x0(const void*);
+double mix_fmopa_f32_ld1w_x4_0x4(const void*);
+double mix_fmopa_f32_ld1w_x4_4x1(const void*);
+double mix_fmopa_f32_ld1w_x4_4x2(const void*);
+double mix_fmopa_f32_ld1w_x4_4x4(const void*);
+double mix_fmopa_f32_ld1w_x4_2x4(const void*);
+double mix_fmopa_f32_ld1w_x4_1x4(const void*);
+double mix_fmopa_f32_ldr_4x0(const void*);
+double mix_fmopa_f32_ldr_0x4(const void*);
+double mix_fmopa_f32_ldr_4x1(const void*);
+double mix_fmopa_f32_ldr_4x2(const void*);
+double mix_fmopa_f32_ldr_4x4(const void*);
+double mix_fmopa_f32_ldr_2x4(const void*);
+double mix_fmopa_f32_ldr_1x4(const void*);
+double mix_fmopa_f32_fmla_f32_4x0(const void*);
+double mix_fmopa_f32_fmla_f32_0x4(const void*);
+double mix_fmopa_f32_fmla_f32_4x1(const void*);
+double mix_fmopa_f32_fmla_f32_4x2(const void*);
+double mix_fmopa_f32_fmla_f32_4x4(const void*);
+double mix_fmopa_f32_fmla_f32_2x4(const void*);
+double mix_fmopa_f32_fmla_f32_1x4(const void*);
+double mix_fdot_f16_fmla_f32_vgx2_4x0(const void*);
+double mix_fdot_f16_fmla_f32_vgx2_0x4(const void*);
+double mix_fdot_f16_fmla_f32_vgx2_4x1(const void*);
+double mix_fdot_f16_fmla_f32_vgx2_4x2(const void*);
+double mix_fdot_f16_fmla_f32_vgx2_4x4(const void*);
+double mix_fdot_f16_fmla_f32_vgx2_2x4(const void*);
+double mix_fdot_f16_fmla_f32_vgx2_1x4(const void*);
+
+// benchmark setup
+static void* setup(const void* args) {
+  const mixed_benchmark_params_t* params = args;
+  assert(params != nullptr);
+
+  benchmark_data_t* data = malloc(sizeof(benchmark_data_t));
+  data->size = params->buffer_size;
+  data->n_iterations = params->n_iterations;
+  // buffer for the loads (aligned for the multi-vector loads)
+  data->buffer = params->buffer_size > 0 ? aligned_alloc(256, params->buffer_size) : nullptr;
+  assert(params->buffer_size == 0 || data->buffer != nullptr);
+
+  return data;
+}
+
+static void teardown(void* args) {
+  benchmark_data_t* data = args;
+
+  free(data->buffer); data->buffer = nullptr;
+  free(data);
+}
+
+// benchmark table
+static const mixed_benchmark_t benchmarks[] = {
+  {{ &setup, &mix_fmopa_f32_ld1w_x4_4x0, &teardown }, "FMOPA (FP32) + LD1W (four register, adjacent, predicated)", "SME_F32F32,FEAT_SME2", "FMOPA (FP32)", "fmopa", 4, "LD1W (four register, adjacent, predicated)", "ld1w", 0, 2048, 0, 16384, 2000000},
+  {{ &setup, &mix_fmopa_f32_ld1w_x4_0x4, &teardown }, "FMOPA (FP32) + LD1W (four register, adjacent, predicated)", "SME_F32F32,FEAT_SME2", "FMOPA (FP32)", "fmopa", 0, "LD1W (four register, adjacent, predicated)", "ld1w", 4, 0, 1024, 16384, 2000000},
+  {{ &setup, &mix_fmopa_f32_ld1w_x4_4x1, &teardown }, "FMOPA (FP32) + LD1W (four register, adjacent, predicated)", "SME_F32F32,FEAT_SME2", "FMOPA (FP32)", "fmopa", 4, "LD1W (four register, adjacent, predicated)", "ld1w", 1, 2048, 256, 16384, 1600000},
+  {{ &setup, &mix_fmopa_f32_ld1w_x4_4x2, &teardown }, "FMOPA (FP32) + LD1W (four register, adjacent, predicated)", "SME_F32F32,FEAT_SME2", "FMOPA (FP32)", "fmopa", 4, "LD1W (four register, adjacent, predicated)", "ld1w", 2, 2048, 512, 16384, 1333333},
+  {{ &setup, &mix_fmopa_f32_ld1w_x4_4x4, &teardown }, "FMOPA (FP32) + LD1W (four register, adjacent, predicated)", "SME_F32F32,FEAT_SME2", "FMOPA (FP32)", "fmopa", 4, "LD1W (four register, adjacent, predicated)", "ld1w", 4, 2048, 1024, 16384, 1000000},
+  {{ &setup, &mix_fmopa_f32_ld1w_x4_2x4, &teardown }, "FMOPA (FP32) + LD1W (four register, adjacent, predicated)", "SME_F32F32,FEAT_SME2", "FMOPA (FP32)", "fmopa", 2, "LD1W (four register, adjacent, predicated)", "ld1w", 4, 1024, 1024, 16384, 1333333},
+  {{ &setup, &mix_fmopa_f32_ld1w_x4_1x4, &teardown }, "FMOPA (FP32) + LD1W (four register, adjacent, predicated)", "SME_F32F32,FEAT_SME2", "FMOPA (FP32)", "fmopa", 1, "LD1W (four register, adjacent, predicated)", "ld1w", 4, 512, 1024, 16384, 1600000},
+  {{ &setup, &mix_fmopa_f32_ldr_4x0, &teardown }, "FMOPA (FP32) + LDR (one register, unpredicated)", "SME_F32F32,FEAT_SME2", "FMOPA (FP32)", "fmopa", 4, "LDR (one register, unpredicated)", "ldr", 0, 2048, 0, 16384, 2000000},
+  {{ &setup, &mix_fmopa_f32_ldr_0x4, &teardown }, "FMOPA (FP32) + LDR (one register, unpredicated)", "SME_F32F32,FEAT_SME2", "FMOPA (FP32)", "fmopa", 0, "LDR (one register, unpredicated)", "ldr", 4, 0, 256, 16384, 2000000},
+  {{ &setup, &mix_fmopa_f32_ldr_4x1, &teardown }, "FMOPA (FP32) + LDR (one register, unpredicated)", "SME_F32F32,FEAT_SME2", "FMOPA (FP32)", "fmopa", 4, "LDR (one register, unpredicated)", "ldr", 1, 2048, 64, 16384, 1600000},
+  {{ &setup, &mix_fmopa_f32_ldr_4x2, &teardown }, "FMOPA (FP32) + LDR (one register, unpredicated)", "SME_F32F32,FEAT_SME2", "FMOPA (FP32)", "fmopa", 4, "LDR (one register, unpredicated)", "ldr", 2, 2048, 128, 16384, 1333333},
+  {{ &setup, &mix_fmopa_f32_ldr_4x4, &teardown }, "FMOPA (FP32) + LDR (one register, unpredicated)", "SME_F32F32,FEAT_SME2", "FMOPA (FP32)", "fmopa", 4, "LDR (one register, unpredicated)", "ldr", 4, 2048, 256, 16384, 1000000},
+  {{ &setup, &mix_fmopa_f32_ldr_2x4, &teardown }, "FMOPA (FP32) + LDR (one register, unpredicated)", "SME_F32F32,FEAT_SME2", "FMOPA (FP32)", "fmopa", 2, "LDR (one register, unpredicated)", "ldr", 4, 1024, 256, 16384, 1333333},
+  {{ &setup, &mix_fmopa_f32_ldr_1x4, &teardown }, "FMOPA (FP32) + LDR (one register, unpredicated)", "SME_F32F32,FEAT_SME2", "FMOPA (FP32)", "fmopa", 1, "LDR (one register, unpredicated)", "ldr", 4, 512, 256, 16384, 1600000},
+  {{ &setup, &mix_fmopa_f32_fmla_f32_4x0, &teardown }, "FMOPA (FP32) + FMLA (FP32, one vector)", "SME_F32F32,FEAT_SME", "FMOPA (FP32)", "fmopa", 4, "FMLA (FP32, one vector)", "fmla", 0, 2048, 0, 0, 2000000},
+  {{ &setup, &mix_fmopa_f32_fmla_f32_0x4, &teardown }, "FMOPA (FP32) + FMLA (FP32, one vector)", "SME_F32F32,FEAT_SME", "FMOPA (FP32)", "fmopa", 0, "FMLA (FP32, one vector)", "fmla", 4, 128, 0, 0, 2000000},
+  {{ &setup, &mix_fmopa_f32_fmla_f32_4x1, &teardown }, "FMOPA (FP32) + FMLA (FP32, one vector)", "SME_F32F32,FEAT_SME", "FMOPA (FP32)", "fmopa", 4, "FMLA (FP32, one vector)", "fmla", 1, 2080, 0, 0, 1600000},
+  {{ &setup, &mix_fmopa_f32_fmla_f32_4x2, &teardown }, "FMOPA (FP32) + FMLA (FP32, one vector)", "SME_F32F32,FEAT_SME", "FMOPA (FP32)", "fmopa", 4, "FMLA (FP32, one vector)", "fmla", 2, 2112, 0, 0, 1333333},
+  {{ &setup, &mix_fmopa_f32_fmla_f32_4x4, &teardown }, "FMOPA (FP32) + FMLA (FP32, one vector)", "SME_F32F32,FEAT_SME", "FMOPA (FP32)", "fmopa", 4, "FMLA (FP32, one vector)", "fmla", 4, 2176, 0, 0, 1000000},
+  {{ &setup, &mix_fmopa_f32_fmla_f32_2x4, &teardown }, "FMOPA (FP32) + FMLA (FP32, one vector)", "SME_F32F32,FEAT_SME", "FMOPA (FP32)", "fmopa", 2, "FMLA (FP32, one vector)", "fmla", 4, 1152, 0, 0, 1333333},
+  {{ &setup, &mix_fmopa_f32_fmla_f32_1x4, &teardown }, "FMOPA (FP32) + FMLA (FP32, one vector)", "SME_F32F32,FEAT_SME", "FMOPA (FP32)", "fmopa", 1, "FMLA (FP32, one vector)", "fmla", 4, 640, 0, 0, 1600000},
+  {{ &setup, &mix_fdot_f16_fmla_f32_vgx2_4x0, &teardown }, "FDOT (FP16 to FP32, 2-way, two vectors) + FMLA (FP32, two vectors)", "FEAT_SME2", "FDOT (FP16 to FP32, 2-way, two vectors)", "fdot", 4, "FMLA (FP32, two vectors)", "fmla", 0, 512, 0, 0, 2000000},
+  {{ &setup, &mix_fdot_f16_fmla_f32_vgx2_0x4, &teardown }, "FDOT (FP16 to FP32, 2-way, two vectors) + FMLA (FP32, two vectors)", "FEAT_SME2", "FDOT (FP16 to FP32, 2-way, two vectors)", "fdot", 0, "FMLA (FP32, two vectors)", "fmla", 4, 256, 0, 0, 2000000},
+  {{ &setup, &mix_fdot_f16_fmla_f32_vgx2_4x1, &teardown }, "FDOT (FP16 to FP32, 2-way, two vectors) + FMLA (FP32, two vectors)", "FEAT_SME2", "FDOT (FP16 to FP32, 2-way, two vectors)", "fdot", 4, "FMLA (FP32, two vectors)", "fmla", 1, 576, 0, 0, 1600000},
+  {{ &setup, &mix_fdot_f16_fmla_f32_vgx2_4x2, &teardown }, "FDOT (FP16 to FP32, 2-way, two vectors) + FMLA (FP32, two vectors)", "FEAT_SME2", "FDOT (FP16 to FP32, 2-way, two vectors)", "fdot", 4, "FMLA (FP32, two vectors)", "fmla", 2, 640, 0, 0, 1333333},
+  {{ &setup, &mix_fdot_f16_fmla_f32_vgx2_4x4, &teardown }, "FDOT (FP16 to FP32, 2-way, two vectors) + FMLA (FP32, two vectors)", "FEAT_SME2", "FDOT (FP16 to FP32, 2-way, two vectors)", "fdot", 4, "FMLA (FP32, two vectors)", "fmla", 4, 768, 0, 0, 1000000},
+  {{ &setup, &mix_fdot_f16_fmla_f32_vgx2_2x4, &teardown }, "FDOT (FP16 to FP32, 2-way, two vectors) + FMLA (FP32, two vectors)", "FEAT_SME2", "FDOT (FP16 to FP32, 2-way, two vectors)", "fdot", 2, "FMLA (FP32, two vectors)", "fmla", 4, 512, 0, 0, 1333333},
+  {{ &setup, &mix_fdot_f16_fmla_f32_vgx2_1x4, &teardown }, "FDOT (FP16 to FP32, 2-way, two vectors) + FMLA (FP32, two vectors)", "FEAT_SME2", "FDOT (FP16 to FP32, 2-way, two vectors)", "fdot", 1, "FMLA (FP32, two vectors)", "fmla", 4, 384, 0, 0, 1600000}
+};
+
+CONST_PTR(mixed_benchmark_t) mixed_benchmarks = benchmarks;
+const size_t mixed_benchmarks_count = sizeof(benchmarks)/sizeof(benchmarks[0]);
+
+// execution order (none, run the table in order)
+const run_schedule_entry_t* _Nullable mixed_benchmarks_schedule = nullptr;
+const size_t mixed_benchmarks_schedule_count = 0;
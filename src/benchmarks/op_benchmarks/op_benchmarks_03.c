@@ -0,0 +1,6291 @@
+// generated by tools/gen_op_benchmarks.py, do not edit!
+#include <assert.h>
+#include "../bench.h"
+
+// benchmark functions
+
+double mova_z_register_f32_f32_ilp1(const void* args) {
+  // MOVA (tile slice to vector, FP32), Data Movement (ZA)
+  //
+  // Each instruction: (16x f32) → 16x f32 (16 OPs)
+  // Total of 16 OPs per loop iteration, ILP = 1
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "ptrue p0.s                                                  \n"
+    "mov x12, #0                                                 \n"
+    "1:                                                          \n"
+    "  mova z0.s, p0/m, za0h.s[w12, 0]                           \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x12"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 16.0*1.0*(double)n_iterations;
+}
+
+
+double mova_z_register_f32_f32_ilp13(const void* args) {
+  // MOVA (tile slice to vector, FP32), Data Movement (ZA)
+  //
+  // Each instruction: (16x f32) → 16x f32 (16 OPs)
+  // Total of 208 OPs per loop iteration, ILP = 13
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "ptrue p0.s                                                  \n"
+    "mov x12, #0                                                 \n"
+    "1:                                                          \n"
+    "  mova z0.s, p0/m, za0h.s[w12, 0]                           \n"
+    "  mova z1.s, p0/m, za1h.s[w12, 0]                           \n"
+    "  mova z2.s, p0/m, za2h.s[w12, 0]                           \n"
+    "  mova z3.s, p0/m, za3h.s[w12, 0]                           \n"
+    "  mova z4.s, p0/m, za0h.s[w12, 1]                           \n"
+    "  mova z5.s, p0/m, za1h.s[w12, 1]                           \n"
+    "  mova z6.s, p0/m, za2h.s[w12, 1]                           \n"
+    "  mova z7.s, p0/m, za3h.s[w12, 1]                           \n"
+    "  mova z8.s, p0/m, za0h.s[w12, 2]                           \n"
+    "  mova z9.s, p0/m, za1h.s[w12, 2]                           \n"
+    "  mova z10.s, p0/m, za2h.s[w12, 2]                          \n"
+    "  mova z11.s, p0/m, za3h.s[w12, 2]                          \n"
+    "  mova z12.s, p0/m, za0h.s[w12, 3]                          \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x12"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 16.0*13.0*(double)n_iterations;
+}
+
+
+double mova_z_register_f32_f32_p75_ilp2(const void* args) {
+  // MOVA (tile slice to vector, FP32), 75% active lanes, Data Movement (ZA)
+  //
+  // Each instruction: (16x f32) → 12 of 16x f32 (12 OPs)
+  // Total of 24 OPs per loop iteration, ILP = 2
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #12                                                \n"
+    "whilelt p0.s, xzr, x24                                      \n"
+    "mov x12, #0                                                 \n"
+    "1:                                                          \n"
+    "  mova z0.s, p0/m, za0h.s[w12, 0]                           \n"
+    "  mova z1.s, p0/m, za1h.s[w12, 0]                           \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24", "x12"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 12.0*2.0*(double)n_iterations;
+}
+
+
+double mova_z_register_f32_f32_p75_ilp9(const void* args) {
+  // MOVA (tile slice to vector, FP32), 75% active lanes, Data Movement (ZA)
+  //
+  // Each instruction: (16x f32) → 12 of 16x f32 (12 OPs)
+  // Total of 108 OPs per loop iteration, ILP = 9
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #12                                                \n"
+    "whilelt p0.s, xzr, x24                                      \n"
+    "mov x12, #0                                                 \n"
+    "1:                                                          \n"
+    "  mova z0.s, p0/m, za0h.s[w12, 0]                           \n"
+    "  mova z1.s, p0/m, za1h.s[w12, 0]                           \n"
+    "  mova z2.s, p0/m, za2h.s[w12, 0]                           \n"
+    "  mova z3.s, p0/m, za3h.s[w12, 0]                           \n"
+    "  mova z4.s, p0/m, za0h.s[w12, 1]                           \n"
+    "  mova z5.s, p0/m, za1h.s[w12, 1]                           \n"
+    "  mova z6.s, p0/m, za2h.s[w12, 1]                           \n"
+    "  mova z7.s, p0/m, za3h.s[w12, 1]                           \n"
+    "  mova z8.s, p0/m, za0h.s[w12, 2]                           \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24", "x12"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 12.0*9.0*(double)n_iterations;
+}
+
+
+double mova_z_register_f32_f32_p75_ilp11(const void* args) {
+  // MOVA (tile slice to vector, FP32), 75% active lanes, Data Movement (ZA)
+  //
+  // Each instruction: (16x f32) → 12 of 16x f32 (12 OPs)
+  // Total of 132 OPs per loop iteration, ILP = 11
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #12                                                \n"
+    "whilelt p0.s, xzr, x24                                      \n"
+    "mov x12, #0                                                 \n"
+    "1:                                                          \n"
+    "  mova z0.s, p0/m, za0h.s[w12, 0]                           \n"
+    "  mova z1.s, p0/m, za1h.s[w12, 0]                           \n"
+    "  mova z2.s, p0/m, za2h.s[w12, 0]                           \n"
+    "  mova z3.s, p0/m, za3h.s[w12, 0]                           \n"
+    "  mova z4.s, p0/m, za0h.s[w12, 1]                           \n"
+    "  mova z5.s, p0/m, za1h.s[w12, 1]                           \n"
+    "  mova z6.s, p0/m, za2h.s[w12, 1]                           \n"
+    "  mova z7.s, p0/m, za3h.s[w12, 1]                           \n"
+    "  mova z8.s, p0/m, za0h.s[w12, 2]                           \n"
+    "  mova z9.s, p0/m, za1h.s[w12, 2]                           \n"
+    "  mova z10.s, p0/m, za2h.s[w12, 2]                          \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24", "x12"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 12.0*11.0*(double)n_iterations;
+}
+
+
+double mova_z_register_f32_f32_p50_ilp1(const void* args) {
+  // MOVA (tile slice to vector, FP32), 50% active lanes, Data Movement (ZA)
+  //
+  // Each instruction: (16x f32) → 8 of 16x f32 (8 OPs)
+  // Total of 8 OPs per loop iteration, ILP = 1
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #8                                                 \n"
+    "whilelt p0.s, xzr, x24                                      \n"
+    "mov x12, #0                                                 \n"
+    "1:                                                          \n"
+    "  mova z0.s, p0/m, za0h.s[w12, 0]                           \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24", "x12"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 8.0*1.0*(double)n_iterations;
+}
+
+
+double mova_z_register_f32_f32_p50_ilp12(const void* args) {
+  // MOVA (tile slice to vector, FP32), 50% active lanes, Data Movement (ZA)
+  //
+  // Each instruction: (16x f32) → 8 of 16x f32 (8 OPs)
+  // Total of 96 OPs per loop iteration, ILP = 12
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #8                                                 \n"
+    "whilelt p0.s, xzr, x24                                      \n"
+    "mov x12, #0                                                 \n"
+    "1:                                                          \n"
+    "  mova z0.s, p0/m, za0h.s[w12, 0]                           \n"
+    "  mova z1.s, p0/m, za1h.s[w12, 0]                           \n"
+    "  mova z2.s, p0/m, za2h.s[w12, 0]                           \n"
+    "  mova z3.s, p0/m, za3h.s[w12, 0]                           \n"
+    "  mova z4.s, p0/m, za0h.s[w12, 1]                           \n"
+    "  mova z5.s, p0/m, za1h.s[w12, 1]                           \n"
+    "  mova z6.s, p0/m, za2h.s[w12, 1]                           \n"
+    "  mova z7.s, p0/m, za3h.s[w12, 1]                           \n"
+    "  mova z8.s, p0/m, za0h.s[w12, 2]                           \n"
+    "  mova z9.s, p0/m, za1h.s[w12, 2]                           \n"
+    "  mova z10.s, p0/m, za2h.s[w12, 2]                          \n"
+    "  mova z11.s, p0/m, za3h.s[w12, 2]                          \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24", "x12"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 8.0*12.0*(double)n_iterations;
+}
+
+
+double mova_z_register_f32_f32_p25_ilp7(const void* args) {
+  // MOVA (tile slice to vector, FP32), 25% active lanes, Data Movement (ZA)
+  //
+  // Each instruction: (16x f32) → 4 of 16x f32 (4 OPs)
+  // Total of 28 OPs per loop iteration, ILP = 7
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #4                                                 \n"
+    "whilelt p0.s, xzr, x24                                      \n"
+    "mov x12, #0                                                 \n"
+    "1:                                                          \n"
+    "  mova z0.s, p0/m, za0h.s[w12, 0]                           \n"
+    "  mova z1.s, p0/m, za1h.s[w12, 0]                           \n"
+    "  mova z2.s, p0/m, za2h.s[w12, 0]                           \n"
+    "  mova z3.s, p0/m, za3h.s[w12, 0]                           \n"
+    "  mova z4.s, p0/m, za0h.s[w12, 1]                           \n"
+    "  mova z5.s, p0/m, za1h.s[w12, 1]                           \n"
+    "  mova z6.s, p0/m, za2h.s[w12, 1]                           \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24", "x12"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 4.0*7.0*(double)n_iterations;
+}
+
+
+double mova_z_register_f32_f32_p25_ilp13(const void* args) {
+  // MOVA (tile slice to vector, FP32), 25% active lanes, Data Movement (ZA)
+  //
+  // Each instruction: (16x f32) → 4 of 16x f32 (4 OPs)
+  // Total of 52 OPs per loop iteration, ILP = 13
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #4                                                 \n"
+    "whilelt p0.s, xzr, x24                                      \n"
+    "mov x12, #0                                                 \n"
+    "1:                                                          \n"
+    "  mova z0.s, p0/m, za0h.s[w12, 0]                           \n"
+    "  mova z1.s, p0/m, za1h.s[w12, 0]                           \n"
+    "  mova z2.s, p0/m, za2h.s[w12, 0]                           \n"
+    "  mova z3.s, p0/m, za3h.s[w12, 0]                           \n"
+    "  mova z4.s, p0/m, za0h.s[w12, 1]                           \n"
+    "  mova z5.s, p0/m, za1h.s[w12, 1]                           \n"
+    "  mova z6.s, p0/m, za2h.s[w12, 1]                           \n"
+    "  mova z7.s, p0/m, za3h.s[w12, 1]                           \n"
+    "  mova z8.s, p0/m, za0h.s[w12, 2]                           \n"
+    "  mova z9.s, p0/m, za1h.s[w12, 2]                           \n"
+    "  mova z10.s, p0/m, za2h.s[w12, 2]                          \n"
+    "  mova z11.s, p0/m, za3h.s[w12, 2]                          \n"
+    "  mova z12.s, p0/m, za0h.s[w12, 3]                          \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24", "x12"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 4.0*13.0*(double)n_iterations;
+}
+
+
+double mova_za_tile_slice_f32_f32_ilp7(const void* args) {
+  // MOVA (vector to tile slice, FP32), Data Movement (ZA)
+  //
+  // Each instruction: (16x f32) → 16x f32 (16 OPs)
+  // Total of 112 OPs per loop iteration, ILP = 7
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x12, #0                                                 \n"
+    "ptrue p0.s                                                  \n"
+    "1:                                                          \n"
+    "  mova za0h.s[w12, 0], p0/m, z31.s                          \n"
+    "  mova za1h.s[w12, 0], p0/m, z31.s                          \n"
+    "  mova za2h.s[w12, 0], p0/m, z31.s                          \n"
+    "  mova za3h.s[w12, 0], p0/m, z31.s                          \n"
+    "  mova za0h.s[w12, 1], p0/m, z31.s                          \n"
+    "  mova za1h.s[w12, 1], p0/m, z31.s                          \n"
+    "  mova za2h.s[w12, 1], p0/m, z31.s                          \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x12"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 16.0*7.0*(double)n_iterations;
+}
+
+
+double mova_za_tile_slice_f32_f32_ilp14(const void* args) {
+  // MOVA (vector to tile slice, FP32), Data Movement (ZA)
+  //
+  // Each instruction: (16x f32) → 16x f32 (16 OPs)
+  // Total of 224 OPs per loop iteration, ILP = 14
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x12, #0                                                 \n"
+    "ptrue p0.s                                                  \n"
+    "1:                                                          \n"
+    "  mova za0h.s[w12, 0], p0/m, z31.s                          \n"
+    "  mova za1h.s[w12, 0], p0/m, z31.s                          \n"
+    "  mova za2h.s[w12, 0], p0/m, z31.s                          \n"
+    "  mova za3h.s[w12, 0], p0/m, z31.s                          \n"
+    "  mova za0h.s[w12, 1], p0/m, z31.s                          \n"
+    "  mova za1h.s[w12, 1], p0/m, z31.s                          \n"
+    "  mova za2h.s[w12, 1], p0/m, z31.s                          \n"
+    "  mova za3h.s[w12, 1], p0/m, z31.s                          \n"
+    "  mova za0h.s[w12, 2], p0/m, z31.s                          \n"
+    "  mova za1h.s[w12, 2], p0/m, z31.s                          \n"
+    "  mova za2h.s[w12, 2], p0/m, z31.s                          \n"
+    "  mova za3h.s[w12, 2], p0/m, z31.s                          \n"
+    "  mova za0h.s[w12, 3], p0/m, z31.s                          \n"
+    "  mova za1h.s[w12, 3], p0/m, z31.s                          \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x12"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 16.0*14.0*(double)n_iterations;
+}
+
+
+double mova_za_tile_slice_f32_f32_p75_ilp1(const void* args) {
+  // MOVA (vector to tile slice, FP32), 75% active lanes, Data Movement (ZA)
+  //
+  // Each instruction: (16x f32) → 12 of 16x f32 (12 OPs)
+  // Total of 12 OPs per loop iteration, ILP = 1
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x12, #0                                                 \n"
+    "mov x24, #12                                                \n"
+    "whilelt p0.s, xzr, x24                                      \n"
+    "1:                                                          \n"
+    "  mova za0h.s[w12, 0], p0/m, z31.s                          \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x12", "x24"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 12.0*1.0*(double)n_iterations;
+}
+
+
+double mova_za_tile_slice_f32_f32_p75_ilp10(const void* args) {
+  // MOVA (vector to tile slice, FP32), 75% active lanes, Data Movement (ZA)
+  //
+  // Each instruction: (16x f32) → 12 of 16x f32 (12 OPs)
+  // Total of 120 OPs per loop iteration, ILP = 10
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x12, #0                                                 \n"
+    "mov x24, #12                                                \n"
+    "whilelt p0.s, xzr, x24                                      \n"
+    "1:                                                          \n"
+    "  mova za0h.s[w12, 0], p0/m, z31.s                          \n"
+    "  mova za1h.s[w12, 0], p0/m, z31.s                          \n"
+    "  mova za2h.s[w12, 0], p0/m, z31.s                          \n"
+    "  mova za3h.s[w12, 0], p0/m, z31.s                          \n"
+    "  mova za0h.s[w12, 1], p0/m, z31.s                          \n"
+    "  mova za1h.s[w12, 1], p0/m, z31.s                          \n"
+    "  mova za2h.s[w12, 1], p0/m, z31.s                          \n"
+    "  mova za3h.s[w12, 1], p0/m, z31.s                          \n"
+    "  mova za0h.s[w12, 2], p0/m, z31.s                          \n"
+    "  mova za1h.s[w12, 2], p0/m, z31.s                          \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x12", "x24"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 12.0*10.0*(double)n_iterations;
+}
+
+
+double mova_za_tile_slice_f32_f32_p50_ilp2(const void* args) {
+  // MOVA (vector to tile slice, FP32), 50% active lanes, Data Movement (ZA)
+  //
+  // Each instruction: (16x f32) → 8 of 16x f32 (8 OPs)
+  // Total of 16 OPs per loop iteration, ILP = 2
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x12, #0                                                 \n"
+    "mov x24, #8                                                 \n"
+    "whilelt p0.s, xzr, x24                                      \n"
+    "1:                                                          \n"
+    "  mova za0h.s[w12, 0], p0/m, z31.s                          \n"
+    "  mova za1h.s[w12, 0], p0/m, z31.s                          \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x12", "x24"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 8.0*2.0*(double)n_iterations;
+}
+
+
+double mova_za_tile_slice_f32_f32_p50_ilp9(const void* args) {
+  // MOVA (vector to tile slice, FP32), 50% active lanes, Data Movement (ZA)
+  //
+  // Each instruction: (16x f32) → 8 of 16x f32 (8 OPs)
+  // Total of 72 OPs per loop iteration, ILP = 9
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x12, #0                                                 \n"
+    "mov x24, #8                                                 \n"
+    "whilelt p0.s, xzr, x24                                      \n"
+    "1:                                                          \n"
+    "  mova za0h.s[w12, 0], p0/m, z31.s                          \n"
+    "  mova za1h.s[w12, 0], p0/m, z31.s                          \n"
+    "  mova za2h.s[w12, 0], p0/m, z31.s                          \n"
+    "  mova za3h.s[w12, 0], p0/m, z31.s                          \n"
+    "  mova za0h.s[w12, 1], p0/m, z31.s                          \n"
+    "  mova za1h.s[w12, 1], p0/m, z31.s                          \n"
+    "  mova za2h.s[w12, 1], p0/m, z31.s                          \n"
+    "  mova za3h.s[w12, 1], p0/m, z31.s                          \n"
+    "  mova za0h.s[w12, 2], p0/m, z31.s                          \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x12", "x24"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 8.0*9.0*(double)n_iterations;
+}
+
+
+double mova_za_tile_slice_f32_f32_p50_ilp13(const void* args) {
+  // MOVA (vector to tile slice, FP32), 50% active lanes, Data Movement (ZA)
+  //
+  // Each instruction: (16x f32) → 8 of 16x f32 (8 OPs)
+  // Total of 104 OPs per loop iteration, ILP = 13
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x12, #0                                                 \n"
+    "mov x24, #8                                                 \n"
+    "whilelt p0.s, xzr, x24                                      \n"
+    "1:                                                          \n"
+    "  mova za0h.s[w12, 0], p0/m, z31.s                          \n"
+    "  mova za1h.s[w12, 0], p0/m, z31.s                          \n"
+    "  mova za2h.s[w12, 0], p0/m, z31.s                          \n"
+    "  mova za3h.s[w12, 0], p0/m, z31.s                          \n"
+    "  mova za0h.s[w12, 1], p0/m, z31.s                          \n"
+    "  mova za1h.s[w12, 1], p0/m, z31.s                          \n"
+    "  mova za2h.s[w12, 1], p0/m, z31.s                          \n"
+    "  mova za3h.s[w12, 1], p0/m, z31.s                          \n"
+    "  mova za0h.s[w12, 2], p0/m, z31.s                          \n"
+    "  mova za1h.s[w12, 2], p0/m, z31.s                          \n"
+    "  mova za2h.s[w12, 2], p0/m, z31.s                          \n"
+    "  mova za3h.s[w12, 2], p0/m, z31.s                          \n"
+    "  mova za0h.s[w12, 3], p0/m, z31.s                          \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x12", "x24"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 8.0*13.0*(double)n_iterations;
+}
+
+
+double mova_za_tile_slice_f32_f32_p25_ilp4(const void* args) {
+  // MOVA (vector to tile slice, FP32), 25% active lanes, Data Movement (ZA)
+  //
+  // Each instruction: (16x f32) → 4 of 16x f32 (4 OPs)
+  // Total of 16 OPs per loop iteration, ILP = 4
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x12, #0                                                 \n"
+    "mov x24, #4                                                 \n"
+    "whilelt p0.s, xzr, x24                                      \n"
+    "1:                                                          \n"
+    "  mova za0h.s[w12, 0], p0/m, z31.s                          \n"
+    "  mova za1h.s[w12, 0], p0/m, z31.s                          \n"
+    "  mova za2h.s[w12, 0], p0/m, z31.s                          \n"
+    "  mova za3h.s[w12, 0], p0/m, z31.s                          \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x12", "x24"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 4.0*4.0*(double)n_iterations;
+}
+
+
+double mova_za_tile_slice_f32_f32_p25_ilp12(const void* args) {
+  // MOVA (vector to tile slice, FP32), 25% active lanes, Data Movement (ZA)
+  //
+  // Each instruction: (16x f32) → 4 of 16x f32 (4 OPs)
+  // Total of 48 OPs per loop iteration, ILP = 12
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x12, #0                                                 \n"
+    "mov x24, #4                                                 \n"
+    "whilelt p0.s, xzr, x24                                      \n"
+    "1:                                                          \n"
+    "  mova za0h.s[w12, 0], p0/m, z31.s                          \n"
+    "  mova za1h.s[w12, 0], p0/m, z31.s                          \n"
+    "  mova za2h.s[w12, 0], p0/m, z31.s                          \n"
+    "  mova za3h.s[w12, 0], p0/m, z31.s                          \n"
+    "  mova za0h.s[w12, 1], p0/m, z31.s                          \n"
+    "  mova za1h.s[w12, 1], p0/m, z31.s                          \n"
+    "  mova za2h.s[w12, 1], p0/m, z31.s                          \n"
+    "  mova za3h.s[w12, 1], p0/m, z31.s                          \n"
+    "  mova za0h.s[w12, 2], p0/m, z31.s                          \n"
+    "  mova za1h.s[w12, 2], p0/m, z31.s                          \n"
+    "  mova za2h.s[w12, 2], p0/m, z31.s                          \n"
+    "  mova za3h.s[w12, 2], p0/m, z31.s                          \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x12", "x24"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 4.0*12.0*(double)n_iterations;
+}
+
+
+double mova_z_register_f64_f64_vgx2_ilp2(const void* args) {
+  // MOVA (ZA array to two vectors), Data Movement (ZA)
+  //
+  // Each instruction: (16x f64) → 16x f64 (16 OPs)
+  // Total of 32 OPs per loop iteration, ILP = 2
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  mova {z0.d-z1.d}, za.d[w8, 0, VGx2]                       \n"
+    "  mova {z2.d-z3.d}, za.d[w8, 1, VGx2]                       \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 16.0*2.0*(double)n_iterations;
+}
+
+
+double mova_z_register_f64_f64_vgx2_ilp9(const void* args) {
+  // MOVA (ZA array to two vectors), Data Movement (ZA)
+  //
+  // Each instruction: (16x f64) → 16x f64 (16 OPs)
+  // Total of 144 OPs per loop iteration, ILP = 9
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  mova {z0.d-z1.d}, za.d[w8, 0, VGx2]                       \n"
+    "  mova {z2.d-z3.d}, za.d[w8, 1, VGx2]                       \n"
+    "  mova {z4.d-z5.d}, za.d[w8, 2, VGx2]                       \n"
+    "  mova {z6.d-z7.d}, za.d[w8, 3, VGx2]                       \n"
+    "  mova {z8.d-z9.d}, za.d[w8, 4, VGx2]                       \n"
+    "  mova {z10.d-z11.d}, za.d[w8, 5, VGx2]                     \n"
+    "  mova {z12.d-z13.d}, za.d[w8, 6, VGx2]                     \n"
+    "  mova {z14.d-z15.d}, za.d[w8, 7, VGx2]                     \n"
+    "  mova {z16.d-z17.d}, za.d[w9, 0, VGx2]                     \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 16.0*9.0*(double)n_iterations;
+}
+
+
+double mova_z_register_f64_f64_vgx2_ilp14(const void* args) {
+  // MOVA (ZA array to two vectors), Data Movement (ZA)
+  //
+  // Each instruction: (16x f64) → 16x f64 (16 OPs)
+  // Total of 224 OPs per loop iteration, ILP = 14
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  mova {z0.d-z1.d}, za.d[w8, 0, VGx2]                       \n"
+    "  mova {z2.d-z3.d}, za.d[w8, 1, VGx2]                       \n"
+    "  mova {z4.d-z5.d}, za.d[w8, 2, VGx2]                       \n"
+    "  mova {z6.d-z7.d}, za.d[w8, 3, VGx2]                       \n"
+    "  mova {z8.d-z9.d}, za.d[w8, 4, VGx2]                       \n"
+    "  mova {z10.d-z11.d}, za.d[w8, 5, VGx2]                     \n"
+    "  mova {z12.d-z13.d}, za.d[w8, 6, VGx2]                     \n"
+    "  mova {z14.d-z15.d}, za.d[w8, 7, VGx2]                     \n"
+    "  mova {z16.d-z17.d}, za.d[w9, 0, VGx2]                     \n"
+    "  mova {z18.d-z19.d}, za.d[w9, 1, VGx2]                     \n"
+    "  mova {z20.d-z21.d}, za.d[w9, 2, VGx2]                     \n"
+    "  mova {z22.d-z23.d}, za.d[w9, 3, VGx2]                     \n"
+    "  mova {z24.d-z25.d}, za.d[w9, 4, VGx2]                     \n"
+    "  mova {z26.d-z27.d}, za.d[w9, 5, VGx2]                     \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 16.0*14.0*(double)n_iterations;
+}
+
+
+double mova_z_register_f64_f64_vgx4_ilp4(const void* args) {
+  // MOVA (ZA array to four vectors), Data Movement (ZA)
+  //
+  // Each instruction: (32x f64) → 32x f64 (32 OPs)
+  // Total of 128 OPs per loop iteration, ILP = 4
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  mova {z0.d-z3.d}, za.d[w8, 0, VGx4]                       \n"
+    "  mova {z4.d-z7.d}, za.d[w8, 1, VGx4]                       \n"
+    "  mova {z8.d-z11.d}, za.d[w8, 2, VGx4]                      \n"
+    "  mova {z12.d-z15.d}, za.d[w8, 3, VGx4]                     \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 32.0*4.0*(double)n_iterations;
+}
+
+
+double mova_za_vector_f64_f64_vgx2_ilp4(const void* args) {
+  // MOVA (two vectors to ZA array), Data Movement (ZA)
+  //
+  // Each instruction: (16x f64) → 16x f64 (16 OPs)
+  // Total of 64 OPs per loop iteration, ILP = 4
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  mova za.d[w8, 0, VGx2], {z30.d-z31.d}                     \n"
+    "  mova za.d[w8, 1, VGx2], {z30.d-z31.d}                     \n"
+    "  mova za.d[w8, 2, VGx2], {z30.d-z31.d}                     \n"
+    "  mova za.d[w8, 3, VGx2], {z30.d-z31.d}                     \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 16.0*4.0*(double)n_iterations;
+}
+
+
+double mova_za_vector_f64_f64_vgx2_ilp15(const void* args) {
+  // MOVA (two vectors to ZA array), Data Movement (ZA)
+  //
+  // Each instruction: (16x f64) → 16x f64 (16 OPs)
+  // Total of 240 OPs per loop iteration, ILP = 15
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  mova za.d[w8, 0, VGx2], {z30.d-z31.d}                     \n"
+    "  mova za.d[w8, 1, VGx2], {z30.d-z31.d}                     \n"
+    "  mova za.d[w8, 2, VGx2], {z30.d-z31.d}                     \n"
+    "  mova za.d[w8, 3, VGx2], {z30.d-z31.d}                     \n"
+    "  mova za.d[w8, 4, VGx2], {z30.d-z31.d}                     \n"
+    "  mova za.d[w8, 5, VGx2], {z30.d-z31.d}                     \n"
+    "  mova za.d[w8, 6, VGx2], {z30.d-z31.d}                     \n"
+    "  mova za.d[w8, 7, VGx2], {z30.d-z31.d}                     \n"
+    "  mova za.d[w9, 0, VGx2], {z30.d-z31.d}                     \n"
+    "  mova za.d[w9, 1, VGx2], {z30.d-z31.d}                     \n"
+    "  mova za.d[w9, 2, VGx2], {z30.d-z31.d}                     \n"
+    "  mova za.d[w9, 3, VGx2], {z30.d-z31.d}                     \n"
+    "  mova za.d[w9, 4, VGx2], {z30.d-z31.d}                     \n"
+    "  mova za.d[w9, 5, VGx2], {z30.d-z31.d}                     \n"
+    "  mova za.d[w9, 6, VGx2], {z30.d-z31.d}                     \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 16.0*15.0*(double)n_iterations;
+}
+
+
+double mova_za_vector_f64_f64_vgx4_ilp2(const void* args) {
+  // MOVA (four vectors to ZA array), Data Movement (ZA)
+  //
+  // Each instruction: (32x f64) → 32x f64 (32 OPs)
+  // Total of 64 OPs per loop iteration, ILP = 2
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  mova za.d[w8, 0, VGx4], {z28.d-z31.d}                     \n"
+    "  mova za.d[w8, 1, VGx4], {z28.d-z31.d}                     \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 32.0*2.0*(double)n_iterations;
+}
+
+
+double zero_za_tiles_i64_i64_ilp5(const void* args) {
+  // ZERO (64-bit tile), Data Movement (ZA)
+  //
+  // Each instruction: () → 64x i64 (64 OPs)
+  // Total of 320 OPs per loop iteration, ILP = 5
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "1:                                                          \n"
+    "  zero {za0.d}                                              \n"
+    "  zero {za1.d}                                              \n"
+    "  zero {za2.d}                                              \n"
+    "  zero {za3.d}                                              \n"
+    "  zero {za4.d}                                              \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 64.0*5.0*(double)n_iterations;
+}
+
+
+double ldr_za_row_u8_u8_ilp7(const void* args) {
+  // LDR (ZA array vector), Data Movement (ZA)
+  //
+  // Each instruction: (64x u8) → 64x u8 (64 OPs)
+  // Total of 448 OPs per loop iteration, ILP = 7
+  size_t n_iterations = *(const size_t*)args;
+  uint8_t buffer[1024] __attribute__((aligned(64)));
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x12, #0                                                 \n"
+    "mov x1, %[buffer]                                           \n"
+    "1:                                                          \n"
+    "  ldr za[w12, 0], [x1, 0, MUL VL]                           \n"
+    "  ldr za[w12, 1], [x1, 1, MUL VL]                           \n"
+    "  ldr za[w12, 2], [x1, 2, MUL VL]                           \n"
+    "  ldr za[w12, 3], [x1, 3, MUL VL]                           \n"
+    "  ldr za[w12, 4], [x1, 4, MUL VL]                           \n"
+    "  ldr za[w12, 5], [x1, 5, MUL VL]                           \n"
+    "  ldr za[w12, 6], [x1, 6, MUL VL]                           \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations), [buffer] "r" (buffer)
+    : "x0", "memory", "x12", "x1"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 64.0*7.0*(double)n_iterations;
+}
+
+
+double ldr_za_row_u8_u8_ilp13(const void* args) {
+  // LDR (ZA array vector), Data Movement (ZA)
+  //
+  // Each instruction: (64x u8) → 64x u8 (64 OPs)
+  // Total of 832 OPs per loop iteration, ILP = 13
+  size_t n_iterations = *(const size_t*)args;
+  uint8_t buffer[1024] __attribute__((aligned(64)));
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x12, #0                                                 \n"
+    "mov x1, %[buffer]                                           \n"
+    "1:                                                          \n"
+    "  ldr za[w12, 0], [x1, 0, MUL VL]                           \n"
+    "  ldr za[w12, 1], [x1, 1, MUL VL]                           \n"
+    "  ldr za[w12, 2], [x1, 2, MUL VL]                           \n"
+    "  ldr za[w12, 3], [x1, 3, MUL VL]                           \n"
+    "  ldr za[w12, 4], [x1, 4, MUL VL]                           \n"
+    "  ldr za[w12, 5], [x1, 5, MUL VL]                           \n"
+    "  ldr za[w12, 6], [x1, 6, MUL VL]                           \n"
+    "  ldr za[w12, 7], [x1, 7, MUL VL]                           \n"
+    "  ldr za[w12, 8], [x1, 8, MUL VL]                           \n"
+    "  ldr za[w12, 9], [x1, 9, MUL VL]                           \n"
+    "  ldr za[w12, 10], [x1, 10, MUL VL]                         \n"
+    "  ldr za[w12, 11], [x1, 11, MUL VL]                         \n"
+    "  ldr za[w12, 12], [x1, 12, MUL VL]                         \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations), [buffer] "r" (buffer)
+    : "x0", "memory", "x12", "x1"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 64.0*13.0*(double)n_iterations;
+}
+
+
+double str_memory_u8_u8_ilp10(const void* args) {
+  // STR (ZA array vector), Data Movement (ZA)
+  //
+  // Each instruction: (64x u8) → 64x u8 (64 OPs)
+  // Total of 640 OPs per loop iteration, ILP = 10
+  size_t n_iterations = *(const size_t*)args;
+  uint8_t buffer[1024] __attribute__((aligned(64)));
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x12, #0                                                 \n"
+    "mov x1, %[buffer]                                           \n"
+    "1:                                                          \n"
+    "  str za[w12, 0], [x1, 0, MUL VL]                           \n"
+    "  str za[w12, 1], [x1, 1, MUL VL]                           \n"
+    "  str za[w12, 2], [x1, 2, MUL VL]                           \n"
+    "  str za[w12, 3], [x1, 3, MUL VL]                           \n"
+    "  str za[w12, 4], [x1, 4, MUL VL]                           \n"
+    "  str za[w12, 5], [x1, 5, MUL VL]                           \n"
+    "  str za[w12, 6], [x1, 6, MUL VL]                           \n"
+    "  str za[w12, 7], [x1, 7, MUL VL]                           \n"
+    "  str za[w12, 8], [x1, 8, MUL VL]                           \n"
+    "  str za[w12, 9], [x1, 9, MUL VL]                           \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations), [buffer] "r" (buffer)
+    : "x0", "memory", "x12", "x1"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 64.0*10.0*(double)n_iterations;
+}
+
+
+double movt_gpr_u64_u64_ilp5(const void* args) {
+  // MOVT (ZT0 to general-purpose register), Data Movement (ZT0)
+  //
+  // Each instruction: (1x u64) → 1x u64 (1 OPs)
+  // Total of 5 OPs per loop iteration, ILP = 5
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "1:                                                          \n"
+    "  movt x2, zt0[0]                                           \n"
+    "  movt x3, zt0[8]                                           \n"
+    "  movt x4, zt0[16]                                          \n"
+    "  movt x5, zt0[24]                                          \n"
+    "  movt x6, zt0[32]                                          \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x2", "x3", "x4", "x5", "x6"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 1.0*5.0*(double)n_iterations;
+}
+
+
+double movt_gpr_u64_u64_ilp14(const void* args) {
+  // MOVT (ZT0 to general-purpose register), Data Movement (ZT0)
+  //
+  // Each instruction: (1x u64) → 1x u64 (1 OPs)
+  // Total of 14 OPs per loop iteration, ILP = 14
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "1:                                                          \n"
+    "  movt x2, zt0[0]                                           \n"
+    "  movt x3, zt0[8]                                           \n"
+    "  movt x4, zt0[16]                                          \n"
+    "  movt x5, zt0[24]                                          \n"
+    "  movt x6, zt0[32]                                          \n"
+    "  movt x7, zt0[40]                                          \n"
+    "  movt x13, zt0[48]                                         \n"
+    "  movt x14, zt0[56]                                         \n"
+    "  movt x15, zt0[0]                                          \n"
+    "  movt x16, zt0[8]                                          \n"
+    "  movt x17, zt0[16]                                         \n"
+    "  movt x19, zt0[24]                                         \n"
+    "  movt x20, zt0[32]                                         \n"
+    "  movt x21, zt0[40]                                         \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x2", "x3", "x4", "x5", "x6", "x7", "x13", "x14", "x15", "x16", "x17", "x19", "x20", "x21"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 1.0*14.0*(double)n_iterations;
+}
+
+
+double luti2_z_register_u8_u8_ilp2(const void* args) {
+  // LUTI2 (8-bit, one vector), Data Movement (ZT0)
+  //
+  // Each instruction: (64x u8, 64x u8) → 64x u8 (64 OPs)
+  // Total of 128 OPs per loop iteration, ILP = 2
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "1:                                                          \n"
+    "  luti2 z0.b, zt0, z31[0]                                   \n"
+    "  luti2 z1.b, zt0, z31[0]                                   \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 64.0*2.0*(double)n_iterations;
+}
+
+
+double luti2_z_register_u8_u8_ilp9(const void* args) {
+  // LUTI2 (8-bit, one vector), Data Movement (ZT0)
+  //
+  // Each instruction: (64x u8, 64x u8) → 64x u8 (64 OPs)
+  // Total of 576 OPs per loop iteration, ILP = 9
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "1:                                                          \n"
+    "  luti2 z0.b, zt0, z31[0]                                   \n"
+    "  luti2 z1.b, zt0, z31[0]                                   \n"
+    "  luti2 z2.b, zt0, z31[0]                                   \n"
+    "  luti2 z3.b, zt0, z31[0]                                   \n"
+    "  luti2 z4.b, zt0, z31[0]                                   \n"
+    "  luti2 z5.b, zt0, z31[0]                                   \n"
+    "  luti2 z6.b, zt0, z31[0]                                   \n"
+    "  luti2 z7.b, zt0, z31[0]                                   \n"
+    "  luti2 z8.b, zt0, z31[0]                                   \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 64.0*9.0*(double)n_iterations;
+}
+
+
+double luti2_z_register_u8_u8_ilp16(const void* args) {
+  // LUTI2 (8-bit, one vector), Data Movement (ZT0)
+  //
+  // Each instruction: (64x u8, 64x u8) → 64x u8 (64 OPs)
+  // Total of 1024 OPs per loop iteration, ILP = 16
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "1:                                                          \n"
+    "  luti2 z0.b, zt0, z31[0]                                   \n"
+    "  luti2 z1.b, zt0, z31[0]                                   \n"
+    "  luti2 z2.b, zt0, z31[0]                                   \n"
+    "  luti2 z3.b, zt0, z31[0]                                   \n"
+    "  luti2 z4.b, zt0, z31[0]                                   \n"
+    "  luti2 z5.b, zt0, z31[0]                                   \n"
+    "  luti2 z6.b, zt0, z31[0]                                   \n"
+    "  luti2 z7.b, zt0, z31[0]                                   \n"
+    "  luti2 z8.b, zt0, z31[0]                                   \n"
+    "  luti2 z9.b, zt0, z31[0]                                   \n"
+    "  luti2 z10.b, zt0, z31[0]                                  \n"
+    "  luti2 z11.b, zt0, z31[0]                                  \n"
+    "  luti2 z12.b, zt0, z31[0]                                  \n"
+    "  luti2 z13.b, zt0, z31[0]                                  \n"
+    "  luti2 z14.b, zt0, z31[0]                                  \n"
+    "  luti2 z15.b, zt0, z31[0]                                  \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 64.0*16.0*(double)n_iterations;
+}
+
+
+double luti4_z_register_u32_u32_ilp1(const void* args) {
+  // LUTI4 (32-bit, one vector), Data Movement (ZT0)
+  //
+  // Each instruction: (16x u32, 64x u8) → 16x u32 (16 OPs)
+  // Total of 16 OPs per loop iteration, ILP = 1
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "1:                                                          \n"
+    "  luti4 z0.s, zt0, z31[0]                                   \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 16.0*1.0*(double)n_iterations;
+}
+
+
+double luti4_z_register_u32_u32_ilp11(const void* args) {
+  // LUTI4 (32-bit, one vector), Data Movement (ZT0)
+  //
+  // Each instruction: (16x u32, 64x u8) → 16x u32 (16 OPs)
+  // Total of 176 OPs per loop iteration, ILP = 11
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "1:                                                          \n"
+    "  luti4 z0.s, zt0, z31[0]                                   \n"
+    "  luti4 z1.s, zt0, z31[0]                                   \n"
+    "  luti4 z2.s, zt0, z31[0]                                   \n"
+    "  luti4 z3.s, zt0, z31[0]                                   \n"
+    "  luti4 z4.s, zt0, z31[0]                                   \n"
+    "  luti4 z5.s, zt0, z31[0]                                   \n"
+    "  luti4 z6.s, zt0, z31[0]                                   \n"
+    "  luti4 z7.s, zt0, z31[0]                                   \n"
+    "  luti4 z8.s, zt0, z31[0]                                   \n"
+    "  luti4 z9.s, zt0, z31[0]                                   \n"
+    "  luti4 z10.s, zt0, z31[0]                                  \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 16.0*11.0*(double)n_iterations;
+}
+
+
+double luti4_z_register_u32_u32_vgx4_ilp3(const void* args) {
+  // LUTI4 (32-bit, four vectors), Data Movement (ZT0)
+  //
+  // Each instruction: (16x u32, 64x u8) → 64x u32 (64 OPs)
+  // Total of 192 OPs per loop iteration, ILP = 3
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "1:                                                          \n"
+    "  luti4 {z0.s-z3.s}, zt0, z28[0]                            \n"
+    "  luti4 {z4.s-z7.s}, zt0, z28[0]                            \n"
+    "  luti4 {z8.s-z11.s}, zt0, z28[0]                           \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 64.0*3.0*(double)n_iterations;
+}
+
+
+double fdot_f32_f16_ilp2(const void* args) {
+  // FDOT (FP16 to FP32, 2-way, one vector), Dot Product (floating-point)
+  //
+  // Each instruction: (32x f16, 32x f16) → 16x f32 (64 OPs)
+  // Total of 128 OPs per loop iteration, ILP = 2
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "1:                                                          \n"
+    "  fdot z0.s, z0.h, z0.h                                     \n"
+    "  fdot z1.s, z1.h, z1.h                                     \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 64.0*2.0*(double)n_iterations;
+}
+
+
+double fdot_f32_f16_ilp9(const void* args) {
+  // FDOT (FP16 to FP32, 2-way, one vector), Dot Product (floating-point)
+  //
+  // Each instruction: (32x f16, 32x f16) → 16x f32 (64 OPs)
+  // Total of 576 OPs per loop iteration, ILP = 9
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "1:                                                          \n"
+    "  fdot z0.s, z0.h, z0.h                                     \n"
+    "  fdot z1.s, z1.h, z1.h                                     \n"
+    "  fdot z2.s, z2.h, z2.h                                     \n"
+    "  fdot z3.s, z3.h, z3.h                                     \n"
+    "  fdot z4.s, z4.h, z4.h                                     \n"
+    "  fdot z5.s, z5.h, z5.h                                     \n"
+    "  fdot z6.s, z6.h, z6.h                                     \n"
+    "  fdot z7.s, z7.h, z7.h                                     \n"
+    "  fdot z8.s, z8.h, z8.h                                     \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 64.0*9.0*(double)n_iterations;
+}
+
+
+double fdot_f32_f16_ilp13(const void* args) {
+  // FDOT (FP16 to FP32, 2-way, one vector), Dot Product (floating-point)
+  //
+  // Each instruction: (32x f16, 32x f16) → 16x f32 (64 OPs)
+  // Total of 832 OPs per loop iteration, ILP = 13
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "1:                                                          \n"
+    "  fdot z0.s, z0.h, z0.h                                     \n"
+    "  fdot z1.s, z1.h, z1.h                                     \n"
+    "  fdot z2.s, z2.h, z2.h                                     \n"
+    "  fdot z3.s, z3.h, z3.h                                     \n"
+    "  fdot z4.s, z4.h, z4.h                                     \n"
+    "  fdot z5.s, z5.h, z5.h                                     \n"
+    "  fdot z6.s, z6.h, z6.h                                     \n"
+    "  fdot z7.s, z7.h, z7.h                                     \n"
+    "  fdot z8.s, z8.h, z8.h                                     \n"
+    "  fdot z9.s, z9.h, z9.h                                     \n"
+    "  fdot z10.s, z10.h, z10.h                                  \n"
+    "  fdot z11.s, z11.h, z11.h                                  \n"
+    "  fdot z12.s, z12.h, z12.h                                  \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 64.0*13.0*(double)n_iterations;
+}
+
+
+double bfdot_f32_b16_ilp6(const void* args) {
+  // BFDOT (BF16 to FP32, 2-way, one vector), Dot Product (floating-point)
+  //
+  // Each instruction: (32x b16, 32x b16) → 16x f32 (64 OPs)
+  // Total of 384 OPs per loop iteration, ILP = 6
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "1:                                                          \n"
+    "  bfdot z0.s, z0.h, z0.h                                    \n"
+    "  bfdot z1.s, z1.h, z1.h                                    \n"
+    "  bfdot z2.s, z2.h, z2.h                                    \n"
+    "  bfdot z3.s, z3.h, z3.h                                    \n"
+    "  bfdot z4.s, z4.h, z4.h                                    \n"
+    "  bfdot z5.s, z5.h, z5.h                                    \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 64.0*6.0*(double)n_iterations;
+}
+
+
+double bfdot_f32_b16_ilp14(const void* args) {
+  // BFDOT (BF16 to FP32, 2-way, one vector), Dot Product (floating-point)
+  //
+  // Each instruction: (32x b16, 32x b16) → 16x f32 (64 OPs)
+  // Total of 896 OPs per loop iteration, ILP = 14
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "1:                                                          \n"
+    "  bfdot z0.s, z0.h, z0.h                                    \n"
+    "  bfdot z1.s, z1.h, z1.h                                    \n"
+    "  bfdot z2.s, z2.h, z2.h                                    \n"
+    "  bfdot z3.s, z3.h, z3.h                                    \n"
+    "  bfdot z4.s, z4.h, z4.h                                    \n"
+    "  bfdot z5.s, z5.h, z5.h                                    \n"
+    "  bfdot z6.s, z6.h, z6.h                                    \n"
+    "  bfdot z7.s, z7.h, z7.h                                    \n"
+    "  bfdot z8.s, z8.h, z8.h                                    \n"
+    "  bfdot z9.s, z9.h, z9.h                                    \n"
+    "  bfdot z10.s, z10.h, z10.h                                 \n"
+    "  bfdot z11.s, z11.h, z11.h                                 \n"
+    "  bfdot z12.s, z12.h, z12.h                                 \n"
+    "  bfdot z13.s, z13.h, z13.h                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 64.0*14.0*(double)n_iterations;
+}
+
+
+double fdot_za_f32_f16_vgx2_ilp5(const void* args) {
+  // FDOT (FP16 to FP32, 2-way, two vectors), Dot Product (floating-point)
+  //
+  // Each instruction: (64x f16, 64x f16) → 32x f32 (128 OPs)
+  // Total of 640 OPs per loop iteration, ILP = 5
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  fdot za.s[w8, 0, VGx2], {z0.h-z1.h}, {z0.h-z1.h}          \n"
+    "  fdot za.s[w8, 1, VGx2], {z0.h-z1.h}, {z0.h-z1.h}          \n"
+    "  fdot za.s[w8, 2, VGx2], {z2.h-z3.h}, {z2.h-z3.h}          \n"
+    "  fdot za.s[w8, 3, VGx2], {z2.h-z3.h}, {z2.h-z3.h}          \n"
+    "  fdot za.s[w8, 4, VGx2], {z4.h-z5.h}, {z4.h-z5.h}          \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 128.0*5.0*(double)n_iterations;
+}
+
+
+double fdot_za_f32_f16_vgx2_ilp15(const void* args) {
+  // FDOT (FP16 to FP32, 2-way, two vectors), Dot Product (floating-point)
+  //
+  // Each instruction: (64x f16, 64x f16) → 32x f32 (128 OPs)
+  // Total of 1920 OPs per loop iteration, ILP = 15
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  fdot za.s[w8, 0, VGx2], {z0.h-z1.h}, {z0.h-z1.h}          \n"
+    "  fdot za.s[w8, 1, VGx2], {z0.h-z1.h}, {z0.h-z1.h}          \n"
+    "  fdot za.s[w8, 2, VGx2], {z2.h-z3.h}, {z2.h-z3.h}          \n"
+    "  fdot za.s[w8, 3, VGx2], {z2.h-z3.h}, {z2.h-z3.h}          \n"
+    "  fdot za.s[w8, 4, VGx2], {z4.h-z5.h}, {z4.h-z5.h}          \n"
+    "  fdot za.s[w8, 5, VGx2], {z4.h-z5.h}, {z4.h-z5.h}          \n"
+    "  fdot za.s[w8, 6, VGx2], {z6.h-z7.h}, {z6.h-z7.h}          \n"
+    "  fdot za.s[w8, 7, VGx2], {z6.h-z7.h}, {z6.h-z7.h}          \n"
+    "  fdot za.s[w9, 0, VGx2], {z8.h-z9.h}, {z8.h-z9.h}          \n"
+    "  fdot za.s[w9, 1, VGx2], {z8.h-z9.h}, {z8.h-z9.h}          \n"
+    "  fdot za.s[w9, 2, VGx2], {z10.h-z11.h}, {z10.h-z11.h}      \n"
+    "  fdot za.s[w9, 3, VGx2], {z10.h-z11.h}, {z10.h-z11.h}      \n"
+    "  fdot za.s[w9, 4, VGx2], {z12.h-z13.h}, {z12.h-z13.h}      \n"
+    "  fdot za.s[w9, 5, VGx2], {z12.h-z13.h}, {z12.h-z13.h}      \n"
+    "  fdot za.s[w9, 6, VGx2], {z14.h-z15.h}, {z14.h-z15.h}      \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 128.0*15.0*(double)n_iterations;
+}
+
+
+double fdot_za_f32_f16_vgx4_ilp3(const void* args) {
+  // FDOT (FP16 to FP32, 2-way, four vectors), Dot Product (floating-point)
+  //
+  // Each instruction: (128x f16, 128x f16) → 64x f32 (256 OPs)
+  // Total of 768 OPs per loop iteration, ILP = 3
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  fdot za.s[w8, 0, VGx4], {z0.h-z3.h}, {z0.h-z3.h}          \n"
+    "  fdot za.s[w8, 1, VGx4], {z0.h-z3.h}, {z0.h-z3.h}          \n"
+    "  fdot za.s[w8, 2, VGx4], {z0.h-z3.h}, {z0.h-z3.h}          \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 256.0*3.0*(double)n_iterations;
+}
+
+
+double fdot_za_f32_f16_vgx4_ilp8(const void* args) {
+  // FDOT (FP16 to FP32, 2-way, four vectors), Dot Product (floating-point)
+  //
+  // Each instruction: (128x f16, 128x f16) → 64x f32 (256 OPs)
+  // Total of 2048 OPs per loop iteration, ILP = 8
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  fdot za.s[w8, 0, VGx4], {z0.h-z3.h}, {z0.h-z3.h}          \n"
+    "  fdot za.s[w8, 1, VGx4], {z0.h-z3.h}, {z0.h-z3.h}          \n"
+    "  fdot za.s[w8, 2, VGx4], {z0.h-z3.h}, {z0.h-z3.h}          \n"
+    "  fdot za.s[w8, 3, VGx4], {z0.h-z3.h}, {z0.h-z3.h}          \n"
+    "  fdot za.s[w8, 4, VGx4], {z4.h-z7.h}, {z4.h-z7.h}          \n"
+    "  fdot za.s[w8, 5, VGx4], {z4.h-z7.h}, {z4.h-z7.h}          \n"
+    "  fdot za.s[w8, 6, VGx4], {z4.h-z7.h}, {z4.h-z7.h}          \n"
+    "  fdot za.s[w8, 7, VGx4], {z4.h-z7.h}, {z4.h-z7.h}          \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 256.0*8.0*(double)n_iterations;
+}
+
+
+double fdot_za_f32_f16_vgx4_ilp16(const void* args) {
+  // FDOT (FP16 to FP32, 2-way, four vectors), Dot Product (floating-point)
+  //
+  // Each instruction: (128x f16, 128x f16) → 64x f32 (256 OPs)
+  // Total of 4096 OPs per loop iteration, ILP = 16
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  fdot za.s[w8, 0, VGx4], {z0.h-z3.h}, {z0.h-z3.h}          \n"
+    "  fdot za.s[w8, 1, VGx4], {z0.h-z3.h}, {z0.h-z3.h}          \n"
+    "  fdot za.s[w8, 2, VGx4], {z0.h-z3.h}, {z0.h-z3.h}          \n"
+    "  fdot za.s[w8, 3, VGx4], {z0.h-z3.h}, {z0.h-z3.h}          \n"
+    "  fdot za.s[w8, 4, VGx4], {z4.h-z7.h}, {z4.h-z7.h}          \n"
+    "  fdot za.s[w8, 5, VGx4], {z4.h-z7.h}, {z4.h-z7.h}          \n"
+    "  fdot za.s[w8, 6, VGx4], {z4.h-z7.h}, {z4.h-z7.h}          \n"
+    "  fdot za.s[w8, 7, VGx4], {z4.h-z7.h}, {z4.h-z7.h}          \n"
+    "  fdot za.s[w9, 0, VGx4], {z8.h-z11.h}, {z8.h-z11.h}        \n"
+    "  fdot za.s[w9, 1, VGx4], {z8.h-z11.h}, {z8.h-z11.h}        \n"
+    "  fdot za.s[w9, 2, VGx4], {z8.h-z11.h}, {z8.h-z11.h}        \n"
+    "  fdot za.s[w9, 3, VGx4], {z8.h-z11.h}, {z8.h-z11.h}        \n"
+    "  fdot za.s[w9, 4, VGx4], {z12.h-z15.h}, {z12.h-z15.h}      \n"
+    "  fdot za.s[w9, 5, VGx4], {z12.h-z15.h}, {z12.h-z15.h}      \n"
+    "  fdot za.s[w9, 6, VGx4], {z12.h-z15.h}, {z12.h-z15.h}      \n"
+    "  fdot za.s[w9, 7, VGx4], {z12.h-z15.h}, {z12.h-z15.h}      \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 256.0*16.0*(double)n_iterations;
+}
+
+
+double fdot_za_f32_f16_vgx4_chain8_ilp2(const void* args) {
+  // FDOT (FP16 to FP32, 2-way, four vectors), Dot Product (floating-point)
+  //
+  // Each instruction: (128x f16, 128x f16) → 64x f32 (256 OPs)
+  // Total of 4096 OPs per loop iteration, 2 interleaved dependent chains of 8 instructions
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  fdot za.s[w8, 0, VGx4], {z0.h-z3.h}, {z0.h-z3.h}          \n"
+    "  fdot za.s[w8, 1, VGx4], {z0.h-z3.h}, {z0.h-z3.h}          \n"
+    "  fdot za.s[w8, 0, VGx4], {z0.h-z3.h}, {z0.h-z3.h}          \n"
+    "  fdot za.s[w8, 1, VGx4], {z0.h-z3.h}, {z0.h-z3.h}          \n"
+    "  fdot za.s[w8, 0, VGx4], {z0.h-z3.h}, {z0.h-z3.h}          \n"
+    "  fdot za.s[w8, 1, VGx4], {z0.h-z3.h}, {z0.h-z3.h}          \n"
+    "  fdot za.s[w8, 0, VGx4], {z0.h-z3.h}, {z0.h-z3.h}          \n"
+    "  fdot za.s[w8, 1, VGx4], {z0.h-z3.h}, {z0.h-z3.h}          \n"
+    "  fdot za.s[w8, 0, VGx4], {z0.h-z3.h}, {z0.h-z3.h}          \n"
+    "  fdot za.s[w8, 1, VGx4], {z0.h-z3.h}, {z0.h-z3.h}          \n"
+    "  fdot za.s[w8, 0, VGx4], {z0.h-z3.h}, {z0.h-z3.h}          \n"
+    "  fdot za.s[w8, 1, VGx4], {z0.h-z3.h}, {z0.h-z3.h}          \n"
+    "  fdot za.s[w8, 0, VGx4], {z0.h-z3.h}, {z0.h-z3.h}          \n"
+    "  fdot za.s[w8, 1, VGx4], {z0.h-z3.h}, {z0.h-z3.h}          \n"
+    "  fdot za.s[w8, 0, VGx4], {z0.h-z3.h}, {z0.h-z3.h}          \n"
+    "  fdot za.s[w8, 1, VGx4], {z0.h-z3.h}, {z0.h-z3.h}          \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 256.0*16.0*(double)n_iterations;
+}
+
+
+double bfdot_za_f32_b16_vgx2_ilp4(const void* args) {
+  // BFDOT (BF16 to FP32, 2-way, two vectors), Dot Product (floating-point)
+  //
+  // Each instruction: (64x b16, 64x b16) → 32x f32 (128 OPs)
+  // Total of 512 OPs per loop iteration, ILP = 4
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  bfdot za.s[w8, 0, VGx2], {z0.h-z1.h}, {z0.h-z1.h}         \n"
+    "  bfdot za.s[w8, 1, VGx2], {z0.h-z1.h}, {z0.h-z1.h}         \n"
+    "  bfdot za.s[w8, 2, VGx2], {z2.h-z3.h}, {z2.h-z3.h}         \n"
+    "  bfdot za.s[w8, 3, VGx2], {z2.h-z3.h}, {z2.h-z3.h}         \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 128.0*4.0*(double)n_iterations;
+}
+
+
+double bfdot_za_f32_b16_vgx2_ilp10(const void* args) {
+  // BFDOT (BF16 to FP32, 2-way, two vectors), Dot Product (floating-point)
+  //
+  // Each instruction: (64x b16, 64x b16) → 32x f32 (128 OPs)
+  // Total of 1280 OPs per loop iteration, ILP = 10
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  bfdot za.s[w8, 0, VGx2], {z0.h-z1.h}, {z0.h-z1.h}         \n"
+    "  bfdot za.s[w8, 1, VGx2], {z0.h-z1.h}, {z0.h-z1.h}         \n"
+    "  bfdot za.s[w8, 2, VGx2], {z2.h-z3.h}, {z2.h-z3.h}         \n"
+    "  bfdot za.s[w8, 3, VGx2], {z2.h-z3.h}, {z2.h-z3.h}         \n"
+    "  bfdot za.s[w8, 4, VGx2], {z4.h-z5.h}, {z4.h-z5.h}         \n"
+    "  bfdot za.s[w8, 5, VGx2], {z4.h-z5.h}, {z4.h-z5.h}         \n"
+    "  bfdot za.s[w8, 6, VGx2], {z6.h-z7.h}, {z6.h-z7.h}         \n"
+    "  bfdot za.s[w8, 7, VGx2], {z6.h-z7.h}, {z6.h-z7.h}         \n"
+    "  bfdot za.s[w9, 0, VGx2], {z8.h-z9.h}, {z8.h-z9.h}         \n"
+    "  bfdot za.s[w9, 1, VGx2], {z8.h-z9.h}, {z8.h-z9.h}         \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 128.0*10.0*(double)n_iterations;
+}
+
+
+double bfdot_za_f32_b16_vgx4_ilp2(const void* args) {
+  // BFDOT (BF16 to FP32, 2-way, two vectors), Dot Product (floating-point)
+  //
+  // Each instruction: (128x b16, 128x b16) → 64x f32 (256 OPs)
+  // Total of 512 OPs per loop iteration, ILP = 2
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  bfdot za.s[w8, 0, VGx4], {z0.h-z3.h}, {z0.h-z3.h}         \n"
+    "  bfdot za.s[w8, 1, VGx4], {z0.h-z3.h}, {z0.h-z3.h}         \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 256.0*2.0*(double)n_iterations;
+}
+
+
+double bfdot_za_f32_b16_vgx4_ilp9(const void* args) {
+  // BFDOT (BF16 to FP32, 2-way, two vectors), Dot Product (floating-point)
+  //
+  // Each instruction: (128x b16, 128x b16) → 64x f32 (256 OPs)
+  // Total of 2304 OPs per loop iteration, ILP = 9
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  bfdot za.s[w8, 0, VGx4], {z0.h-z3.h}, {z0.h-z3.h}         \n"
+    "  bfdot za.s[w8, 1, VGx4], {z0.h-z3.h}, {z0.h-z3.h}         \n"
+    "  bfdot za.s[w8, 2, VGx4], {z0.h-z3.h}, {z0.h-z3.h}         \n"
+    "  bfdot za.s[w8, 3, VGx4], {z0.h-z3.h}, {z0.h-z3.h}         \n"
+    "  bfdot za.s[w8, 4, VGx4], {z4.h-z7.h}, {z4.h-z7.h}         \n"
+    "  bfdot za.s[w8, 5, VGx4], {z4.h-z7.h}, {z4.h-z7.h}         \n"
+    "  bfdot za.s[w8, 6, VGx4], {z4.h-z7.h}, {z4.h-z7.h}         \n"
+    "  bfdot za.s[w8, 7, VGx4], {z4.h-z7.h}, {z4.h-z7.h}         \n"
+    "  bfdot za.s[w9, 0, VGx4], {z8.h-z11.h}, {z8.h-z11.h}       \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 256.0*9.0*(double)n_iterations;
+}
+
+
+double bfdot_za_f32_b16_vgx4_ilp13(const void* args) {
+  // BFDOT (BF16 to FP32, 2-way, two vectors), Dot Product (floating-point)
+  //
+  // Each instruction: (128x b16, 128x b16) → 64x f32 (256 OPs)
+  // Total of 3328 OPs per loop iteration, ILP = 13
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  bfdot za.s[w8, 0, VGx4], {z0.h-z3.h}, {z0.h-z3.h}         \n"
+    "  bfdot za.s[w8, 1, VGx4], {z0.h-z3.h}, {z0.h-z3.h}         \n"
+    "  bfdot za.s[w8, 2, VGx4], {z0.h-z3.h}, {z0.h-z3.h}         \n"
+    "  bfdot za.s[w8, 3, VGx4], {z0.h-z3.h}, {z0.h-z3.h}         \n"
+    "  bfdot za.s[w8, 4, VGx4], {z4.h-z7.h}, {z4.h-z7.h}         \n"
+    "  bfdot za.s[w8, 5, VGx4], {z4.h-z7.h}, {z4.h-z7.h}         \n"
+    "  bfdot za.s[w8, 6, VGx4], {z4.h-z7.h}, {z4.h-z7.h}         \n"
+    "  bfdot za.s[w8, 7, VGx4], {z4.h-z7.h}, {z4.h-z7.h}         \n"
+    "  bfdot za.s[w9, 0, VGx4], {z8.h-z11.h}, {z8.h-z11.h}       \n"
+    "  bfdot za.s[w9, 1, VGx4], {z8.h-z11.h}, {z8.h-z11.h}       \n"
+    "  bfdot za.s[w9, 2, VGx4], {z8.h-z11.h}, {z8.h-z11.h}       \n"
+    "  bfdot za.s[w9, 3, VGx4], {z8.h-z11.h}, {z8.h-z11.h}       \n"
+    "  bfdot za.s[w9, 4, VGx4], {z12.h-z15.h}, {z12.h-z15.h}     \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 256.0*13.0*(double)n_iterations;
+}
+
+
+double bfdot_za_f32_b16_vgx4_chain8_ilp2(const void* args) {
+  // BFDOT (BF16 to FP32, 2-way, two vectors), Dot Product (floating-point)
+  //
+  // Each instruction: (128x b16, 128x b16) → 64x f32 (256 OPs)
+  // Total of 4096 OPs per loop iteration, 2 interleaved dependent chains of 8 instructions
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  bfdot za.s[w8, 0, VGx4], {z0.h-z3.h}, {z0.h-z3.h}         \n"
+    "  bfdot za.s[w8, 1, VGx4], {z0.h-z3.h}, {z0.h-z3.h}         \n"
+    "  bfdot za.s[w8, 0, VGx4], {z0.h-z3.h}, {z0.h-z3.h}         \n"
+    "  bfdot za.s[w8, 1, VGx4], {z0.h-z3.h}, {z0.h-z3.h}         \n"
+    "  bfdot za.s[w8, 0, VGx4], {z0.h-z3.h}, {z0.h-z3.h}         \n"
+    "  bfdot za.s[w8, 1, VGx4], {z0.h-z3.h}, {z0.h-z3.h}         \n"
+    "  bfdot za.s[w8, 0, VGx4], {z0.h-z3.h}, {z0.h-z3.h}         \n"
+    "  bfdot za.s[w8, 1, VGx4], {z0.h-z3.h}, {z0.h-z3.h}         \n"
+    "  bfdot za.s[w8, 0, VGx4], {z0.h-z3.h}, {z0.h-z3.h}         \n"
+    "  bfdot za.s[w8, 1, VGx4], {z0.h-z3.h}, {z0.h-z3.h}         \n"
+    "  bfdot za.s[w8, 0, VGx4], {z0.h-z3.h}, {z0.h-z3.h}         \n"
+    "  bfdot za.s[w8, 1, VGx4], {z0.h-z3.h}, {z0.h-z3.h}         \n"
+    "  bfdot za.s[w8, 0, VGx4], {z0.h-z3.h}, {z0.h-z3.h}         \n"
+    "  bfdot za.s[w8, 1, VGx4], {z0.h-z3.h}, {z0.h-z3.h}         \n"
+    "  bfdot za.s[w8, 0, VGx4], {z0.h-z3.h}, {z0.h-z3.h}         \n"
+    "  bfdot za.s[w8, 1, VGx4], {z0.h-z3.h}, {z0.h-z3.h}         \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 256.0*16.0*(double)n_iterations;
+}
+
+
+double sdot_i32_i16_ilp14(const void* args) {
+  // SDOT (I16 to I32, 2-way, one vector), Dot Product (integer)
+  //
+  // Each instruction: (32x i16, 32x i16) → 16x i32 (64 OPs)
+  // Total of 896 OPs per loop iteration, ILP = 14
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "1:                                                          \n"
+    "  sdot z0.s, z0.h, z0.h                                     \n"
+    "  sdot z1.s, z1.h, z1.h                                     \n"
+    "  sdot z2.s, z2.h, z2.h                                     \n"
+    "  sdot z3.s, z3.h, z3.h                                     \n"
+    "  sdot z4.s, z4.h, z4.h                                     \n"
+    "  sdot z5.s, z5.h, z5.h                                     \n"
+    "  sdot z6.s, z6.h, z6.h                                     \n"
+    "  sdot z7.s, z7.h, z7.h                                     \n"
+    "  sdot z8.s, z8.h, z8.h                                     \n"
+    "  sdot z9.s, z9.h, z9.h                                     \n"
+    "  sdot z10.s, z10.h, z10.h                                  \n"
+    "  sdot z11.s, z11.h, z11.h                                  \n"
+    "  sdot z12.s, z12.h, z12.h                                  \n"
+    "  sdot z13.s, z13.h, z13.h                                  \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 64.0*14.0*(double)n_iterations;
+}
+
+
+double sdot_i32_i8_ilp1(const void* args) {
+  // SDOT (I8 to I32, 4-way, one vector), Dot Product (integer)
+  //
+  // Each instruction: (64x i8, 64x i8) → 16x i32 (128 OPs)
+  // Total of 128 OPs per loop iteration, ILP = 1
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "1:                                                          \n"
+    "  sdot z0.s, z0.b, z0.b                                     \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 128.0*1.0*(double)n_iterations;
+}
+
+
+double sdot_i32_i8_ilp16(const void* args) {
+  // SDOT (I8 to I32, 4-way, one vector), Dot Product (integer)
+  //
+  // Each instruction: (64x i8, 64x i8) → 16x i32 (128 OPs)
+  // Total of 2048 OPs per loop iteration, ILP = 16
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "1:                                                          \n"
+    "  sdot z0.s, z0.b, z0.b                                     \n"
+    "  sdot z1.s, z1.b, z1.b                                     \n"
+    "  sdot z2.s, z2.b, z2.b                                     \n"
+    "  sdot z3.s, z3.b, z3.b                                     \n"
+    "  sdot z4.s, z4.b, z4.b                                     \n"
+    "  sdot z5.s, z5.b, z5.b                                     \n"
+    "  sdot z6.s, z6.b, z6.b                                     \n"
+    "  sdot z7.s, z7.b, z7.b                                     \n"
+    "  sdot z8.s, z8.b, z8.b                                     \n"
+    "  sdot z9.s, z9.b, z9.b                                     \n"
+    "  sdot z10.s, z10.b, z10.b                                  \n"
+    "  sdot z11.s, z11.b, z11.b                                  \n"
+    "  sdot z12.s, z12.b, z12.b                                  \n"
+    "  sdot z13.s, z13.b, z13.b                                  \n"
+    "  sdot z14.s, z14.b, z14.b                                  \n"
+    "  sdot z15.s, z15.b, z15.b                                  \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 128.0*16.0*(double)n_iterations;
+}
+
+
+double sdot_i64_i16_ilp6(const void* args) {
+  // SDOT (I16 to I64, 4-way, one vector), Dot Product (integer)
+  //
+  // Each instruction: (32x i16, 32x i16) → 8x i64 (64 OPs)
+  // Total of 384 OPs per loop iteration, ILP = 6
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "1:                                                          \n"
+    "  sdot z0.d, z0.h, z0.h                                     \n"
+    "  sdot z1.d, z1.h, z1.h                                     \n"
+    "  sdot z2.d, z2.h, z2.h                                     \n"
+    "  sdot z3.d, z3.h, z3.h                                     \n"
+    "  sdot z4.d, z4.h, z4.h                                     \n"
+    "  sdot z5.d, z5.h, z5.h                                     \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 64.0*6.0*(double)n_iterations;
+}
+
+
+double sdot_i64_i16_ilp13(const void* args) {
+  // SDOT (I16 to I64, 4-way, one vector), Dot Product (integer)
+  //
+  // Each instruction: (32x i16, 32x i16) → 8x i64 (64 OPs)
+  // Total of 832 OPs per loop iteration, ILP = 13
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "1:                                                          \n"
+    "  sdot z0.d, z0.h, z0.h                                     \n"
+    "  sdot z1.d, z1.h, z1.h                                     \n"
+    "  sdot z2.d, z2.h, z2.h                                     \n"
+    "  sdot z3.d, z3.h, z3.h                                     \n"
+    "  sdot z4.d, z4.h, z4.h                                     \n"
+    "  sdot z5.d, z5.h, z5.h                                     \n"
+    "  sdot z6.d, z6.h, z6.h                                     \n"
+    "  sdot z7.d, z7.h, z7.h                                     \n"
+    "  sdot z8.d, z8.h, z8.h                                     \n"
+    "  sdot z9.d, z9.h, z9.h                                     \n"
+    "  sdot z10.d, z10.h, z10.h                                  \n"
+    "  sdot z11.d, z11.h, z11.h                                  \n"
+    "  sdot z12.d, z12.h, z12.h                                  \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 64.0*13.0*(double)n_iterations;
+}
+
+
+double sdot_i64_i16_chain8_ilp1(const void* args) {
+  // SDOT (I16 to I64, 4-way, one vector), Dot Product (integer)
+  //
+  // Each instruction: (32x i16, 32x i16) → 8x i64 (64 OPs)
+  // Total of 512 OPs per loop iteration, 1 interleaved dependent chains of 8 instructions
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "1:                                                          \n"
+    "  sdot z1.d, z0.h, z0.h                                     \n"
+    "  sdot z0.d, z1.h, z1.h                                     \n"
+    "  sdot z1.d, z0.h, z0.h                                     \n"
+    "  sdot z0.d, z1.h, z1.h                                     \n"
+    "  sdot z1.d, z0.h, z0.h                                     \n"
+    "  sdot z0.d, z1.h, z1.h                                     \n"
+    "  sdot z1.d, z0.h, z0.h                                     \n"
+    "  sdot z0.d, z1.h, z1.h                                     \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 64.0*8.0*(double)n_iterations;
+}
+
+
+double sdot_za_i32_i16_vgx2_ilp2(const void* args) {
+  // SDOT (I16 to I32, 2-way, two vectors), Dot Product (integer)
+  //
+  // Each instruction: (64x i16, 64x i16) → 32x i32 (128 OPs)
+  // Total of 256 OPs per loop iteration, ILP = 2
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  sdot za.s[w8, 0, VGx2], {z0.h-z1.h}, {z0.h-z1.h}          \n"
+    "  sdot za.s[w8, 1, VGx2], {z0.h-z1.h}, {z0.h-z1.h}          \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 128.0*2.0*(double)n_iterations;
+}
+
+
+double sdot_za_i32_i16_vgx2_ilp9(const void* args) {
+  // SDOT (I16 to I32, 2-way, two vectors), Dot Product (integer)
+  //
+  // Each instruction: (64x i16, 64x i16) → 32x i32 (128 OPs)
+  // Total of 1152 OPs per loop iteration, ILP = 9
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  sdot za.s[w8, 0, VGx2], {z0.h-z1.h}, {z0.h-z1.h}          \n"
+    "  sdot za.s[w8, 1, VGx2], {z0.h-z1.h}, {z0.h-z1.h}          \n"
+    "  sdot za.s[w8, 2, VGx2], {z2.h-z3.h}, {z2.h-z3.h}          \n"
+    "  sdot za.s[w8, 3, VGx2], {z2.h-z3.h}, {z2.h-z3.h}          \n"
+    "  sdot za.s[w8, 4, VGx2], {z4.h-z5.h}, {z4.h-z5.h}          \n"
+    "  sdot za.s[w8, 5, VGx2], {z4.h-z5.h}, {z4.h-z5.h}          \n"
+    "  sdot za.s[w8, 6, VGx2], {z6.h-z7.h}, {z6.h-z7.h}          \n"
+    "  sdot za.s[w8, 7, VGx2], {z6.h-z7.h}, {z6.h-z7.h}          \n"
+    "  sdot za.s[w9, 0, VGx2], {z8.h-z9.h}, {z8.h-z9.h}          \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 128.0*9.0*(double)n_iterations;
+}
+
+
+double sdot_za_i32_i16_vgx2_ilp10(const void* args) {
+  // SDOT (I16 to I32, 2-way, two vectors), Dot Product (integer)
+  //
+  // Each instruction: (64x i16, 64x i16) → 32x i32 (128 OPs)
+  // Total of 1280 OPs per loop iteration, ILP = 10
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  sdot za.s[w8, 0, VGx2], {z0.h-z1.h}, {z0.h-z1.h}          \n"
+    "  sdot za.s[w8, 1, VGx2], {z0.h-z1.h}, {z0.h-z1.h}          \n"
+    "  sdot za.s[w8, 2, VGx2], {z2.h-z3.h}, {z2.h-z3.h}          \n"
+    "  sdot za.s[w8, 3, VGx2], {z2.h-z3.h}, {z2.h-z3.h}          \n"
+    "  sdot za.s[w8, 4, VGx2], {z4.h-z5.h}, {z4.h-z5.h}          \n"
+    "  sdot za.s[w8, 5, VGx2], {z4.h-z5.h}, {z4.h-z5.h}          \n"
+    "  sdot za.s[w8, 6, VGx2], {z6.h-z7.h}, {z6.h-z7.h}          \n"
+    "  sdot za.s[w8, 7, VGx2], {z6.h-z7.h}, {z6.h-z7.h}          \n"
+    "  sdot za.s[w9, 0, VGx2], {z8.h-z9.h}, {z8.h-z9.h}          \n"
+    "  sdot za.s[w9, 1, VGx2], {z8.h-z9.h}, {z8.h-z9.h}          \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 128.0*10.0*(double)n_iterations;
+}
+
+
+double sdot_za_i32_i16_vgx4_ilp4(const void* args) {
+  // SDOT (I16 to I32, 2-way, four vectors), Dot Product (integer)
+  //
+  // Each instruction: (128x i16, 128x i16) → 64x i32 (256 OPs)
+  // Total of 1024 OPs per loop iteration, ILP = 4
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  sdot za.s[w8, 0, VGx4], {z0.h-z3.h}, {z0.h-z3.h}          \n"
+    "  sdot za.s[w8, 1, VGx4], {z0.h-z3.h}, {z0.h-z3.h}          \n"
+    "  sdot za.s[w8, 2, VGx4], {z0.h-z3.h}, {z0.h-z3.h}          \n"
+    "  sdot za.s[w8, 3, VGx4], {z0.h-z3.h}, {z0.h-z3.h}          \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 256.0*4.0*(double)n_iterations;
+}
+
+
+double sdot_za_i32_i16_vgx4_ilp13(const void* args) {
+  // SDOT (I16 to I32, 2-way, four vectors), Dot Product (integer)
+  //
+  // Each instruction: (128x i16, 128x i16) → 64x i32 (256 OPs)
+  // Total of 3328 OPs per loop iteration, ILP = 13
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  sdot za.s[w8, 0, VGx4], {z0.h-z3.h}, {z0.h-z3.h}          \n"
+    "  sdot za.s[w8, 1, VGx4], {z0.h-z3.h}, {z0.h-z3.h}          \n"
+    "  sdot za.s[w8, 2, VGx4], {z0.h-z3.h}, {z0.h-z3.h}          \n"
+    "  sdot za.s[w8, 3, VGx4], {z0.h-z3.h}, {z0.h-z3.h}          \n"
+    "  sdot za.s[w8, 4, VGx4], {z4.h-z7.h}, {z4.h-z7.h}          \n"
+    "  sdot za.s[w8, 5, VGx4], {z4.h-z7.h}, {z4.h-z7.h}          \n"
+    "  sdot za.s[w8, 6, VGx4], {z4.h-z7.h}, {z4.h-z7.h}          \n"
+    "  sdot za.s[w8, 7, VGx4], {z4.h-z7.h}, {z4.h-z7.h}          \n"
+    "  sdot za.s[w9, 0, VGx4], {z8.h-z11.h}, {z8.h-z11.h}        \n"
+    "  sdot za.s[w9, 1, VGx4], {z8.h-z11.h}, {z8.h-z11.h}        \n"
+    "  sdot za.s[w9, 2, VGx4], {z8.h-z11.h}, {z8.h-z11.h}        \n"
+    "  sdot za.s[w9, 3, VGx4], {z8.h-z11.h}, {z8.h-z11.h}        \n"
+    "  sdot za.s[w9, 4, VGx4], {z12.h-z15.h}, {z12.h-z15.h}      \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 256.0*13.0*(double)n_iterations;
+}
+
+
+double sdot_za_i32_i8_vgx2_ilp1(const void* args) {
+  // SDOT (I8 to I32, 4-way, two vectors), Dot Product (integer)
+  //
+  // Each instruction: (128x i8, 128x i8) → 32x i32 (256 OPs)
+  // Total of 256 OPs per loop iteration, ILP = 1
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  sdot za.s[w8, 0, VGx2], {z0.b-z1.b}, {z0.b-z1.b}          \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 256.0*1.0*(double)n_iterations;
+}
+
+
+double sdot_za_i32_i8_vgx2_ilp10(const void* args) {
+  // SDOT (I8 to I32, 4-way, two vectors), Dot Product (integer)
+  //
+  // Each instruction: (128x i8, 128x i8) → 32x i32 (256 OPs)
+  // Total of 2560 OPs per loop iteration, ILP = 10
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  sdot za.s[w8, 0, VGx2], {z0.b-z1.b}, {z0.b-z1.b}          \n"
+    "  sdot za.s[w8, 1, VGx2], {z0.b-z1.b}, {z0.b-z1.b}          \n"
+    "  sdot za.s[w8, 2, VGx2], {z2.b-z3.b}, {z2.b-z3.b}          \n"
+    "  sdot za.s[w8, 3, VGx2], {z2.b-z3.b}, {z2.b-z3.b}          \n"
+    "  sdot za.s[w8, 4, VGx2], {z4.b-z5.b}, {z4.b-z5.b}          \n"
+    "  sdot za.s[w8, 5, VGx2], {z4.b-z5.b}, {z4.b-z5.b}          \n"
+    "  sdot za.s[w8, 6, VGx2], {z6.b-z7.b}, {z6.b-z7.b}          \n"
+    "  sdot za.s[w8, 7, VGx2], {z6.b-z7.b}, {z6.b-z7.b}          \n"
+    "  sdot za.s[w9, 0, VGx2], {z8.b-z9.b}, {z8.b-z9.b}          \n"
+    "  sdot za.s[w9, 1, VGx2], {z8.b-z9.b}, {z8.b-z9.b}          \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 256.0*10.0*(double)n_iterations;
+}
+
+
+double sdot_za_i32_i8_vgx4_ilp7(const void* args) {
+  // SDOT (I8 to I32, 4-way, four vectors), Dot Product (integer)
+  //
+  // Each instruction: (256x i8, 256x i8) → 64x i32 (512 OPs)
+  // Total of 3584 OPs per loop iteration, ILP = 7
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  sdot za.s[w8, 0, VGx4], {z0.b-z3.b}, {z0.b-z3.b}          \n"
+    "  sdot za.s[w8, 1, VGx4], {z0.b-z3.b}, {z0.b-z3.b}          \n"
+    "  sdot za.s[w8, 2, VGx4], {z0.b-z3.b}, {z0.b-z3.b}          \n"
+    "  sdot za.s[w8, 3, VGx4], {z0.b-z3.b}, {z0.b-z3.b}          \n"
+    "  sdot za.s[w8, 4, VGx4], {z4.b-z7.b}, {z4.b-z7.b}          \n"
+    "  sdot za.s[w8, 5, VGx4], {z4.b-z7.b}, {z4.b-z7.b}          \n"
+    "  sdot za.s[w8, 6, VGx4], {z4.b-z7.b}, {z4.b-z7.b}          \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 512.0*7.0*(double)n_iterations;
+}
+
+
+double sdot_za_i32_i8_vgx4_ilp13(const void* args) {
+  // SDOT (I8 to I32, 4-way, four vectors), Dot Product (integer)
+  //
+  // Each instruction: (256x i8, 256x i8) → 64x i32 (512 OPs)
+  // Total of 6656 OPs per loop iteration, ILP = 13
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  sdot za.s[w8, 0, VGx4], {z0.b-z3.b}, {z0.b-z3.b}          \n"
+    "  sdot za.s[w8, 1, VGx4], {z0.b-z3.b}, {z0.b-z3.b}          \n"
+    "  sdot za.s[w8, 2, VGx4], {z0.b-z3.b}, {z0.b-z3.b}          \n"
+    "  sdot za.s[w8, 3, VGx4], {z0.b-z3.b}, {z0.b-z3.b}          \n"
+    "  sdot za.s[w8, 4, VGx4], {z4.b-z7.b}, {z4.b-z7.b}          \n"
+    "  sdot za.s[w8, 5, VGx4], {z4.b-z7.b}, {z4.b-z7.b}          \n"
+    "  sdot za.s[w8, 6, VGx4], {z4.b-z7.b}, {z4.b-z7.b}          \n"
+    "  sdot za.s[w8, 7, VGx4], {z4.b-z7.b}, {z4.b-z7.b}          \n"
+    "  sdot za.s[w9, 0, VGx4], {z8.b-z11.b}, {z8.b-z11.b}        \n"
+    "  sdot za.s[w9, 1, VGx4], {z8.b-z11.b}, {z8.b-z11.b}        \n"
+    "  sdot za.s[w9, 2, VGx4], {z8.b-z11.b}, {z8.b-z11.b}        \n"
+    "  sdot za.s[w9, 3, VGx4], {z8.b-z11.b}, {z8.b-z11.b}        \n"
+    "  sdot za.s[w9, 4, VGx4], {z12.b-z15.b}, {z12.b-z15.b}      \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 512.0*13.0*(double)n_iterations;
+}
+
+
+double sdot_za_i64_i16_vgx2_ilp10(const void* args) {
+  // SDOT (I16 to I64, 4-way, two vectors), Dot Product (integer)
+  //
+  // Each instruction: (64x i16, 64x i16) → 16x i64 (128 OPs)
+  // Total of 1280 OPs per loop iteration, ILP = 10
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  sdot za.d[w8, 0, VGx2], {z0.h-z1.h}, {z0.h-z1.h}          \n"
+    "  sdot za.d[w8, 1, VGx2], {z0.h-z1.h}, {z0.h-z1.h}          \n"
+    "  sdot za.d[w8, 2, VGx2], {z2.h-z3.h}, {z2.h-z3.h}          \n"
+    "  sdot za.d[w8, 3, VGx2], {z2.h-z3.h}, {z2.h-z3.h}          \n"
+    "  sdot za.d[w8, 4, VGx2], {z4.h-z5.h}, {z4.h-z5.h}          \n"
+    "  sdot za.d[w8, 5, VGx2], {z4.h-z5.h}, {z4.h-z5.h}          \n"
+    "  sdot za.d[w8, 6, VGx2], {z6.h-z7.h}, {z6.h-z7.h}          \n"
+    "  sdot za.d[w8, 7, VGx2], {z6.h-z7.h}, {z6.h-z7.h}          \n"
+    "  sdot za.d[w9, 0, VGx2], {z8.h-z9.h}, {z8.h-z9.h}          \n"
+    "  sdot za.d[w9, 1, VGx2], {z8.h-z9.h}, {z8.h-z9.h}          \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 128.0*10.0*(double)n_iterations;
+}
+
+
+double sdot_za_i64_i16_vgx4_ilp6(const void* args) {
+  // SDOT (I16 to I64, 4-way, four vectors), Dot Product (integer)
+  //
+  // Each instruction: (128x i16, 128x i16) → 32x i64 (256 OPs)
+  // Total of 1536 OPs per loop iteration, ILP = 6
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  sdot za.d[w8, 0, VGx4], {z0.h-z3.h}, {z0.h-z3.h}          \n"
+    "  sdot za.d[w8, 1, VGx4], {z0.h-z3.h}, {z0.h-z3.h}          \n"
+    "  sdot za.d[w8, 2, VGx4], {z0.h-z3.h}, {z0.h-z3.h}          \n"
+    "  sdot za.d[w8, 3, VGx4], {z0.h-z3.h}, {z0.h-z3.h}          \n"
+    "  sdot za.d[w8, 4, VGx4], {z4.h-z7.h}, {z4.h-z7.h}          \n"
+    "  sdot za.d[w8, 5, VGx4], {z4.h-z7.h}, {z4.h-z7.h}          \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 256.0*6.0*(double)n_iterations;
+}
+
+
+double sdot_za_i64_i16_vgx4_ilp13(const void* args) {
+  // SDOT (I16 to I64, 4-way, four vectors), Dot Product (integer)
+  //
+  // Each instruction: (128x i16, 128x i16) → 32x i64 (256 OPs)
+  // Total of 3328 OPs per loop iteration, ILP = 13
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  sdot za.d[w8, 0, VGx4], {z0.h-z3.h}, {z0.h-z3.h}          \n"
+    "  sdot za.d[w8, 1, VGx4], {z0.h-z3.h}, {z0.h-z3.h}          \n"
+    "  sdot za.d[w8, 2, VGx4], {z0.h-z3.h}, {z0.h-z3.h}          \n"
+    "  sdot za.d[w8, 3, VGx4], {z0.h-z3.h}, {z0.h-z3.h}          \n"
+    "  sdot za.d[w8, 4, VGx4], {z4.h-z7.h}, {z4.h-z7.h}          \n"
+    "  sdot za.d[w8, 5, VGx4], {z4.h-z7.h}, {z4.h-z7.h}          \n"
+    "  sdot za.d[w8, 6, VGx4], {z4.h-z7.h}, {z4.h-z7.h}          \n"
+    "  sdot za.d[w8, 7, VGx4], {z4.h-z7.h}, {z4.h-z7.h}          \n"
+    "  sdot za.d[w9, 0, VGx4], {z8.h-z11.h}, {z8.h-z11.h}        \n"
+    "  sdot za.d[w9, 1, VGx4], {z8.h-z11.h}, {z8.h-z11.h}        \n"
+    "  sdot za.d[w9, 2, VGx4], {z8.h-z11.h}, {z8.h-z11.h}        \n"
+    "  sdot za.d[w9, 3, VGx4], {z8.h-z11.h}, {z8.h-z11.h}        \n"
+    "  sdot za.d[w9, 4, VGx4], {z12.h-z15.h}, {z12.h-z15.h}      \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 256.0*13.0*(double)n_iterations;
+}
+
+
+double fclamp_z_register_f32_f32_vgx2_ilp11(const void* args) {
+  // FCLAMP (FP32, two vectors), Multi-vector (floating-point)
+  //
+  // Each instruction: (16x f32, 16x f32) → 32x f32 (64 OPs)
+  // Total of 704 OPs per loop iteration, ILP = 11
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "1:                                                          \n"
+    "  fclamp {z0.s-z1.s}, z30.s, z30.s                          \n"
+    "  fclamp {z2.s-z3.s}, z30.s, z30.s                          \n"
+    "  fclamp {z4.s-z5.s}, z30.s, z30.s                          \n"
+    "  fclamp {z6.s-z7.s}, z30.s, z30.s                          \n"
+    "  fclamp {z8.s-z9.s}, z30.s, z30.s                          \n"
+    "  fclamp {z10.s-z11.s}, z30.s, z30.s                        \n"
+    "  fclamp {z12.s-z13.s}, z30.s, z30.s                        \n"
+    "  fclamp {z14.s-z15.s}, z30.s, z30.s                        \n"
+    "  fclamp {z16.s-z17.s}, z30.s, z30.s                        \n"
+    "  fclamp {z18.s-z19.s}, z30.s, z30.s                        \n"
+    "  fclamp {z20.s-z21.s}, z30.s, z30.s                        \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 64.0*11.0*(double)n_iterations;
+}
+
+
+double fcvt_z_register_f16_f32_vgx2_ilp7(const void* args) {
+  // FCVT (FP32 to FP16, two vectors), Multi-vector (floating-point)
+  //
+  // Each instruction: (32x f32) → 32x f16 (32 OPs)
+  // Total of 224 OPs per loop iteration, ILP = 7
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "1:                                                          \n"
+    "  fcvt z0.h, {z30.s-z31.s}                                  \n"
+    "  fcvt z2.h, {z30.s-z31.s}                                  \n"
+    "  fcvt z4.h, {z30.s-z31.s}                                  \n"
+    "  fcvt z6.h, {z30.s-z31.s}                                  \n"
+    "  fcvt z8.h, {z30.s-z31.s}                                  \n"
+    "  fcvt z10.h, {z30.s-z31.s}                                 \n"
+    "  fcvt z12.h, {z30.s-z31.s}                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 32.0*7.0*(double)n_iterations;
+}
+
+
+double fcvt_z_register_f16_f32_vgx2_ilp14(const void* args) {
+  // FCVT (FP32 to FP16, two vectors), Multi-vector (floating-point)
+  //
+  // Each instruction: (32x f32) → 32x f16 (32 OPs)
+  // Total of 448 OPs per loop iteration, ILP = 14
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "1:                                                          \n"
+    "  fcvt z0.h, {z30.s-z31.s}                                  \n"
+    "  fcvt z2.h, {z30.s-z31.s}                                  \n"
+    "  fcvt z4.h, {z30.s-z31.s}                                  \n"
+    "  fcvt z6.h, {z30.s-z31.s}                                  \n"
+    "  fcvt z8.h, {z30.s-z31.s}                                  \n"
+    "  fcvt z10.h, {z30.s-z31.s}                                 \n"
+    "  fcvt z12.h, {z30.s-z31.s}                                 \n"
+    "  fcvt z14.h, {z30.s-z31.s}                                 \n"
+    "  fcvt z16.h, {z30.s-z31.s}                                 \n"
+    "  fcvt z18.h, {z30.s-z31.s}                                 \n"
+    "  fcvt z20.h, {z30.s-z31.s}                                 \n"
+    "  fcvt z22.h, {z30.s-z31.s}                                 \n"
+    "  fcvt z24.h, {z30.s-z31.s}                                 \n"
+    "  fcvt z26.h, {z30.s-z31.s}                                 \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 32.0*14.0*(double)n_iterations;
+}
+
+
+double fmla_f16_f16_ilp4(const void* args) {
+  // FMLA (FP16, one vector), Multiply-Accumulate (floating-point)
+  //
+  // Each instruction: (32x f16, 32x f16) → 32x f16 (64 OPs)
+  // Total of 256 OPs per loop iteration, ILP = 4
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "ptrue p0.h                                                  \n"
+    "1:                                                          \n"
+    "  fmla z0.h, p0/m, z0.h, z0.h                               \n"
+    "  fmla z1.h, p0/m, z1.h, z1.h                               \n"
+    "  fmla z2.h, p0/m, z2.h, z2.h                               \n"
+    "  fmla z3.h, p0/m, z3.h, z3.h                               \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 64.0*4.0*(double)n_iterations;
+}
+
+
+double fmla_f16_f16_ilp12(const void* args) {
+  // FMLA (FP16, one vector), Multiply-Accumulate (floating-point)
+  //
+  // Each instruction: (32x f16, 32x f16) → 32x f16 (64 OPs)
+  // Total of 768 OPs per loop iteration, ILP = 12
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "ptrue p0.h                                                  \n"
+    "1:                                                          \n"
+    "  fmla z0.h, p0/m, z0.h, z0.h                               \n"
+    "  fmla z1.h, p0/m, z1.h, z1.h                               \n"
+    "  fmla z2.h, p0/m, z2.h, z2.h                               \n"
+    "  fmla z3.h, p0/m, z3.h, z3.h                               \n"
+    "  fmla z4.h, p0/m, z4.h, z4.h                               \n"
+    "  fmla z5.h, p0/m, z5.h, z5.h                               \n"
+    "  fmla z6.h, p0/m, z6.h, z6.h                               \n"
+    "  fmla z7.h, p0/m, z7.h, z7.h                               \n"
+    "  fmla z8.h, p0/m, z8.h, z8.h                               \n"
+    "  fmla z9.h, p0/m, z9.h, z9.h                               \n"
+    "  fmla z10.h, p0/m, z10.h, z10.h                            \n"
+    "  fmla z11.h, p0/m, z11.h, z11.h                            \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 64.0*12.0*(double)n_iterations;
+}
+
+
+double fmla_f16_f16_p75_ilp1(const void* args) {
+  // FMLA (FP16, one vector), 75% active lanes, Multiply-Accumulate (floating-point)
+  //
+  // Each instruction: (32x f16, 32x f16) → 24 of 32x f16 (48 OPs)
+  // Total of 48 OPs per loop iteration, ILP = 1
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #24                                                \n"
+    "whilelt p0.h, xzr, x24                                      \n"
+    "1:                                                          \n"
+    "  fmla z0.h, p0/m, z0.h, z0.h                               \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 48.0*1.0*(double)n_iterations;
+}
+
+
+double fmla_f16_f16_p75_ilp11(const void* args) {
+  // FMLA (FP16, one vector), 75% active lanes, Multiply-Accumulate (floating-point)
+  //
+  // Each instruction: (32x f16, 32x f16) → 24 of 32x f16 (48 OPs)
+  // Total of 528 OPs per loop iteration, ILP = 11
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #24                                                \n"
+    "whilelt p0.h, xzr, x24                                      \n"
+    "1:                                                          \n"
+    "  fmla z0.h, p0/m, z0.h, z0.h                               \n"
+    "  fmla z1.h, p0/m, z1.h, z1.h                               \n"
+    "  fmla z2.h, p0/m, z2.h, z2.h                               \n"
+    "  fmla z3.h, p0/m, z3.h, z3.h                               \n"
+    "  fmla z4.h, p0/m, z4.h, z4.h                               \n"
+    "  fmla z5.h, p0/m, z5.h, z5.h                               \n"
+    "  fmla z6.h, p0/m, z6.h, z6.h                               \n"
+    "  fmla z7.h, p0/m, z7.h, z7.h                               \n"
+    "  fmla z8.h, p0/m, z8.h, z8.h                               \n"
+    "  fmla z9.h, p0/m, z9.h, z9.h                               \n"
+    "  fmla z10.h, p0/m, z10.h, z10.h                            \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 48.0*11.0*(double)n_iterations;
+}
+
+
+double fmla_f16_f16_p50_ilp2(const void* args) {
+  // FMLA (FP16, one vector), 50% active lanes, Multiply-Accumulate (floating-point)
+  //
+  // Each instruction: (32x f16, 32x f16) → 16 of 32x f16 (32 OPs)
+  // Total of 64 OPs per loop iteration, ILP = 2
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #16                                                \n"
+    "whilelt p0.h, xzr, x24                                      \n"
+    "1:                                                          \n"
+    "  fmla z0.h, p0/m, z0.h, z0.h                               \n"
+    "  fmla z1.h, p0/m, z1.h, z1.h                               \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 32.0*2.0*(double)n_iterations;
+}
+
+
+double fmla_f16_f16_p50_ilp9(const void* args) {
+  // FMLA (FP16, one vector), 50% active lanes, Multiply-Accumulate (floating-point)
+  //
+  // Each instruction: (32x f16, 32x f16) → 16 of 32x f16 (32 OPs)
+  // Total of 288 OPs per loop iteration, ILP = 9
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #16                                                \n"
+    "whilelt p0.h, xzr, x24                                      \n"
+    "1:                                                          \n"
+    "  fmla z0.h, p0/m, z0.h, z0.h                               \n"
+    "  fmla z1.h, p0/m, z1.h, z1.h                               \n"
+    "  fmla z2.h, p0/m, z2.h, z2.h                               \n"
+    "  fmla z3.h, p0/m, z3.h, z3.h                               \n"
+    "  fmla z4.h, p0/m, z4.h, z4.h                               \n"
+    "  fmla z5.h, p0/m, z5.h, z5.h                               \n"
+    "  fmla z6.h, p0/m, z6.h, z6.h                               \n"
+    "  fmla z7.h, p0/m, z7.h, z7.h                               \n"
+    "  fmla z8.h, p0/m, z8.h, z8.h                               \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 32.0*9.0*(double)n_iterations;
+}
+
+
+double fmla_f16_f16_p50_ilp12(const void* args) {
+  // FMLA (FP16, one vector), 50% active lanes, Multiply-Accumulate (floating-point)
+  //
+  // Each instruction: (32x f16, 32x f16) → 16 of 32x f16 (32 OPs)
+  // Total of 384 OPs per loop iteration, ILP = 12
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #16                                                \n"
+    "whilelt p0.h, xzr, x24                                      \n"
+    "1:                                                          \n"
+    "  fmla z0.h, p0/m, z0.h, z0.h                               \n"
+    "  fmla z1.h, p0/m, z1.h, z1.h                               \n"
+    "  fmla z2.h, p0/m, z2.h, z2.h                               \n"
+    "  fmla z3.h, p0/m, z3.h, z3.h                               \n"
+    "  fmla z4.h, p0/m, z4.h, z4.h                               \n"
+    "  fmla z5.h, p0/m, z5.h, z5.h                               \n"
+    "  fmla z6.h, p0/m, z6.h, z6.h                               \n"
+    "  fmla z7.h, p0/m, z7.h, z7.h                               \n"
+    "  fmla z8.h, p0/m, z8.h, z8.h                               \n"
+    "  fmla z9.h, p0/m, z9.h, z9.h                               \n"
+    "  fmla z10.h, p0/m, z10.h, z10.h                            \n"
+    "  fmla z11.h, p0/m, z11.h, z11.h                            \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 32.0*12.0*(double)n_iterations;
+}
+
+
+double fmla_f16_f16_p25_ilp4(const void* args) {
+  // FMLA (FP16, one vector), 25% active lanes, Multiply-Accumulate (floating-point)
+  //
+  // Each instruction: (32x f16, 32x f16) → 8 of 32x f16 (16 OPs)
+  // Total of 64 OPs per loop iteration, ILP = 4
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #8                                                 \n"
+    "whilelt p0.h, xzr, x24                                      \n"
+    "1:                                                          \n"
+    "  fmla z0.h, p0/m, z0.h, z0.h                               \n"
+    "  fmla z1.h, p0/m, z1.h, z1.h                               \n"
+    "  fmla z2.h, p0/m, z2.h, z2.h                               \n"
+    "  fmla z3.h, p0/m, z3.h, z3.h                               \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 16.0*4.0*(double)n_iterations;
+}
+
+
+double fmla_f16_f16_p25_ilp13(const void* args) {
+  // FMLA (FP16, one vector), 25% active lanes, Multiply-Accumulate (floating-point)
+  //
+  // Each instruction: (32x f16, 32x f16) → 8 of 32x f16 (16 OPs)
+  // Total of 208 OPs per loop iteration, ILP = 13
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #8                                                 \n"
+    "whilelt p0.h, xzr, x24                                      \n"
+    "1:                                                          \n"
+    "  fmla z0.h, p0/m, z0.h, z0.h                               \n"
+    "  fmla z1.h, p0/m, z1.h, z1.h                               \n"
+    "  fmla z2.h, p0/m, z2.h, z2.h                               \n"
+    "  fmla z3.h, p0/m, z3.h, z3.h                               \n"
+    "  fmla z4.h, p0/m, z4.h, z4.h                               \n"
+    "  fmla z5.h, p0/m, z5.h, z5.h                               \n"
+    "  fmla z6.h, p0/m, z6.h, z6.h                               \n"
+    "  fmla z7.h, p0/m, z7.h, z7.h                               \n"
+    "  fmla z8.h, p0/m, z8.h, z8.h                               \n"
+    "  fmla z9.h, p0/m, z9.h, z9.h                               \n"
+    "  fmla z10.h, p0/m, z10.h, z10.h                            \n"
+    "  fmla z11.h, p0/m, z11.h, z11.h                            \n"
+    "  fmla z12.h, p0/m, z12.h, z12.h                            \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 16.0*13.0*(double)n_iterations;
+}
+
+
+double fmla_f32_f32_ilp6(const void* args) {
+  // FMLA (FP32, one vector), Multiply-Accumulate (floating-point)
+  //
+  // Each instruction: (16x f32, 16x f32) → 16x f32 (32 OPs)
+  // Total of 192 OPs per loop iteration, ILP = 6
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "ptrue p0.s                                                  \n"
+    "1:                                                          \n"
+    "  fmla z0.s, p0/m, z0.s, z0.s                               \n"
+    "  fmla z1.s, p0/m, z1.s, z1.s                               \n"
+    "  fmla z2.s, p0/m, z2.s, z2.s                               \n"
+    "  fmla z3.s, p0/m, z3.s, z3.s                               \n"
+    "  fmla z4.s, p0/m, z4.s, z4.s                               \n"
+    "  fmla z5.s, p0/m, z5.s, z5.s                               \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 32.0*6.0*(double)n_iterations;
+}
+
+
+double fmla_f32_f32_ilp15(const void* args) {
+  // FMLA (FP32, one vector), Multiply-Accumulate (floating-point)
+  //
+  // Each instruction: (16x f32, 16x f32) → 16x f32 (32 OPs)
+  // Total of 480 OPs per loop iteration, ILP = 15
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "ptrue p0.s                                                  \n"
+    "1:                                                          \n"
+    "  fmla z0.s, p0/m, z0.s, z0.s                               \n"
+    "  fmla z1.s, p0/m, z1.s, z1.s                               \n"
+    "  fmla z2.s, p0/m, z2.s, z2.s                               \n"
+    "  fmla z3.s, p0/m, z3.s, z3.s                               \n"
+    "  fmla z4.s, p0/m, z4.s, z4.s                               \n"
+    "  fmla z5.s, p0/m, z5.s, z5.s                               \n"
+    "  fmla z6.s, p0/m, z6.s, z6.s                               \n"
+    "  fmla z7.s, p0/m, z7.s, z7.s                               \n"
+    "  fmla z8.s, p0/m, z8.s, z8.s                               \n"
+    "  fmla z9.s, p0/m, z9.s, z9.s                               \n"
+    "  fmla z10.s, p0/m, z10.s, z10.s                            \n"
+    "  fmla z11.s, p0/m, z11.s, z11.s                            \n"
+    "  fmla z12.s, p0/m, z12.s, z12.s                            \n"
+    "  fmla z13.s, p0/m, z13.s, z13.s                            \n"
+    "  fmla z14.s, p0/m, z14.s, z14.s                            \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 32.0*15.0*(double)n_iterations;
+}
+
+
+double fmla_f32_f32_p75_ilp5(const void* args) {
+  // FMLA (FP32, one vector), 75% active lanes, Multiply-Accumulate (floating-point)
+  //
+  // Each instruction: (16x f32, 16x f32) → 12 of 16x f32 (24 OPs)
+  // Total of 120 OPs per loop iteration, ILP = 5
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #12                                                \n"
+    "whilelt p0.s, xzr, x24                                      \n"
+    "1:                                                          \n"
+    "  fmla z0.s, p0/m, z0.s, z0.s                               \n"
+    "  fmla z1.s, p0/m, z1.s, z1.s                               \n"
+    "  fmla z2.s, p0/m, z2.s, z2.s                               \n"
+    "  fmla z3.s, p0/m, z3.s, z3.s                               \n"
+    "  fmla z4.s, p0/m, z4.s, z4.s                               \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 24.0*5.0*(double)n_iterations;
+}
+
+
+double fmla_f32_f32_p50_ilp6(const void* args) {
+  // FMLA (FP32, one vector), 50% active lanes, Multiply-Accumulate (floating-point)
+  //
+  // Each instruction: (16x f32, 16x f32) → 8 of 16x f32 (16 OPs)
+  // Total of 96 OPs per loop iteration, ILP = 6
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #8                                                 \n"
+    "whilelt p0.s, xzr, x24                                      \n"
+    "1:                                                          \n"
+    "  fmla z0.s, p0/m, z0.s, z0.s                               \n"
+    "  fmla z1.s, p0/m, z1.s, z1.s                               \n"
+    "  fmla z2.s, p0/m, z2.s, z2.s                               \n"
+    "  fmla z3.s, p0/m, z3.s, z3.s                               \n"
+    "  fmla z4.s, p0/m, z4.s, z4.s                               \n"
+    "  fmla z5.s, p0/m, z5.s, z5.s                               \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 16.0*6.0*(double)n_iterations;
+}
+
+
+double fmla_f32_f32_p50_ilp14(const void* args) {
+  // FMLA (FP32, one vector), 50% active lanes, Multiply-Accumulate (floating-point)
+  //
+  // Each instruction: (16x f32, 16x f32) → 8 of 16x f32 (16 OPs)
+  // Total of 224 OPs per loop iteration, ILP = 14
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #8                                                 \n"
+    "whilelt p0.s, xzr, x24                                      \n"
+    "1:                                                          \n"
+    "  fmla z0.s, p0/m, z0.s, z0.s                               \n"
+    "  fmla z1.s, p0/m, z1.s, z1.s                               \n"
+    "  fmla z2.s, p0/m, z2.s, z2.s                               \n"
+    "  fmla z3.s, p0/m, z3.s, z3.s                               \n"
+    "  fmla z4.s, p0/m, z4.s, z4.s                               \n"
+    "  fmla z5.s, p0/m, z5.s, z5.s                               \n"
+    "  fmla z6.s, p0/m, z6.s, z6.s                               \n"
+    "  fmla z7.s, p0/m, z7.s, z7.s                               \n"
+    "  fmla z8.s, p0/m, z8.s, z8.s                               \n"
+    "  fmla z9.s, p0/m, z9.s, z9.s                               \n"
+    "  fmla z10.s, p0/m, z10.s, z10.s                            \n"
+    "  fmla z11.s, p0/m, z11.s, z11.s                            \n"
+    "  fmla z12.s, p0/m, z12.s, z12.s                            \n"
+    "  fmla z13.s, p0/m, z13.s, z13.s                            \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 16.0*14.0*(double)n_iterations;
+}
+
+
+double fmla_f32_f32_p25_ilp15(const void* args) {
+  // FMLA (FP32, one vector), 25% active lanes, Multiply-Accumulate (floating-point)
+  //
+  // Each instruction: (16x f32, 16x f32) → 4 of 16x f32 (8 OPs)
+  // Total of 120 OPs per loop iteration, ILP = 15
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #4                                                 \n"
+    "whilelt p0.s, xzr, x24                                      \n"
+    "1:                                                          \n"
+    "  fmla z0.s, p0/m, z0.s, z0.s                               \n"
+    "  fmla z1.s, p0/m, z1.s, z1.s                               \n"
+    "  fmla z2.s, p0/m, z2.s, z2.s                               \n"
+    "  fmla z3.s, p0/m, z3.s, z3.s                               \n"
+    "  fmla z4.s, p0/m, z4.s, z4.s                               \n"
+    "  fmla z5.s, p0/m, z5.s, z5.s                               \n"
+    "  fmla z6.s, p0/m, z6.s, z6.s                               \n"
+    "  fmla z7.s, p0/m, z7.s, z7.s                               \n"
+    "  fmla z8.s, p0/m, z8.s, z8.s                               \n"
+    "  fmla z9.s, p0/m, z9.s, z9.s                               \n"
+    "  fmla z10.s, p0/m, z10.s, z10.s                            \n"
+    "  fmla z11.s, p0/m, z11.s, z11.s                            \n"
+    "  fmla z12.s, p0/m, z12.s, z12.s                            \n"
+    "  fmla z13.s, p0/m, z13.s, z13.s                            \n"
+    "  fmla z14.s, p0/m, z14.s, z14.s                            \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 8.0*15.0*(double)n_iterations;
+}
+
+
+double fmla_f64_f64_ilp3(const void* args) {
+  // FMLA (FP64, one vector), Multiply-Accumulate (floating-point)
+  //
+  // Each instruction: (8x f64, 8x f64) → 8x f64 (16 OPs)
+  // Total of 48 OPs per loop iteration, ILP = 3
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "ptrue p0.d                                                  \n"
+    "1:                                                          \n"
+    "  fmla z0.d, p0/m, z0.d, z0.d                               \n"
+    "  fmla z1.d, p0/m, z1.d, z1.d                               \n"
+    "  fmla z2.d, p0/m, z2.d, z2.d                               \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 16.0*3.0*(double)n_iterations;
+}
+
+
+double fmla_f64_f64_ilp8(const void* args) {
+  // FMLA (FP64, one vector), Multiply-Accumulate (floating-point)
+  //
+  // Each instruction: (8x f64, 8x f64) → 8x f64 (16 OPs)
+  // Total of 128 OPs per loop iteration, ILP = 8
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "ptrue p0.d                                                  \n"
+    "1:                                                          \n"
+    "  fmla z0.d, p0/m, z0.d, z0.d                               \n"
+    "  fmla z1.d, p0/m, z1.d, z1.d                               \n"
+    "  fmla z2.d, p0/m, z2.d, z2.d                               \n"
+    "  fmla z3.d, p0/m, z3.d, z3.d                               \n"
+    "  fmla z4.d, p0/m, z4.d, z4.d                               \n"
+    "  fmla z5.d, p0/m, z5.d, z5.d                               \n"
+    "  fmla z6.d, p0/m, z6.d, z6.d                               \n"
+    "  fmla z7.d, p0/m, z7.d, z7.d                               \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 16.0*8.0*(double)n_iterations;
+}
+
+
+double fmla_f64_f64_ilp13(const void* args) {
+  // FMLA (FP64, one vector), Multiply-Accumulate (floating-point)
+  //
+  // Each instruction: (8x f64, 8x f64) → 8x f64 (16 OPs)
+  // Total of 208 OPs per loop iteration, ILP = 13
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "ptrue p0.d                                                  \n"
+    "1:                                                          \n"
+    "  fmla z0.d, p0/m, z0.d, z0.d                               \n"
+    "  fmla z1.d, p0/m, z1.d, z1.d                               \n"
+    "  fmla z2.d, p0/m, z2.d, z2.d                               \n"
+    "  fmla z3.d, p0/m, z3.d, z3.d                               \n"
+    "  fmla z4.d, p0/m, z4.d, z4.d                               \n"
+    "  fmla z5.d, p0/m, z5.d, z5.d                               \n"
+    "  fmla z6.d, p0/m, z6.d, z6.d                               \n"
+    "  fmla z7.d, p0/m, z7.d, z7.d                               \n"
+    "  fmla z8.d, p0/m, z8.d, z8.d                               \n"
+    "  fmla z9.d, p0/m, z9.d, z9.d                               \n"
+    "  fmla z10.d, p0/m, z10.d, z10.d                            \n"
+    "  fmla z11.d, p0/m, z11.d, z11.d                            \n"
+    "  fmla z12.d, p0/m, z12.d, z12.d                            \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 16.0*13.0*(double)n_iterations;
+}
+
+
+double fmla_f64_f64_p75_ilp5(const void* args) {
+  // FMLA (FP64, one vector), 75% active lanes, Multiply-Accumulate (floating-point)
+  //
+  // Each instruction: (8x f64, 8x f64) → 6 of 8x f64 (12 OPs)
+  // Total of 60 OPs per loop iteration, ILP = 5
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #6                                                 \n"
+    "whilelt p0.d, xzr, x24                                      \n"
+    "1:                                                          \n"
+    "  fmla z0.d, p0/m, z0.d, z0.d                               \n"
+    "  fmla z1.d, p0/m, z1.d, z1.d                               \n"
+    "  fmla z2.d, p0/m, z2.d, z2.d                               \n"
+    "  fmla z3.d, p0/m, z3.d, z3.d                               \n"
+    "  fmla z4.d, p0/m, z4.d, z4.d                               \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 12.0*5.0*(double)n_iterations;
+}
+
+
+double fmla_f64_f64_p75_ilp12(const void* args) {
+  // FMLA (FP64, one vector), 75% active lanes, Multiply-Accumulate (floating-point)
+  //
+  // Each instruction: (8x f64, 8x f64) → 6 of 8x f64 (12 OPs)
+  // Total of 144 OPs per loop iteration, ILP = 12
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #6                                                 \n"
+    "whilelt p0.d, xzr, x24                                      \n"
+    "1:                                                          \n"
+    "  fmla z0.d, p0/m, z0.d, z0.d                               \n"
+    "  fmla z1.d, p0/m, z1.d, z1.d                               \n"
+    "  fmla z2.d, p0/m, z2.d, z2.d                               \n"
+    "  fmla z3.d, p0/m, z3.d, z3.d                               \n"
+    "  fmla z4.d, p0/m, z4.d, z4.d                               \n"
+    "  fmla z5.d, p0/m, z5.d, z5.d                               \n"
+    "  fmla z6.d, p0/m, z6.d, z6.d                               \n"
+    "  fmla z7.d, p0/m, z7.d, z7.d                               \n"
+    "  fmla z8.d, p0/m, z8.d, z8.d                               \n"
+    "  fmla z9.d, p0/m, z9.d, z9.d                               \n"
+    "  fmla z10.d, p0/m, z10.d, z10.d                            \n"
+    "  fmla z11.d, p0/m, z11.d, z11.d                            \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 12.0*12.0*(double)n_iterations;
+}
+
+
+double fmla_f64_f64_p50_ilp6(const void* args) {
+  // FMLA (FP64, one vector), 50% active lanes, Multiply-Accumulate (floating-point)
+  //
+  // Each instruction: (8x f64, 8x f64) → 4 of 8x f64 (8 OPs)
+  // Total of 48 OPs per loop iteration, ILP = 6
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #4                                                 \n"
+    "whilelt p0.d, xzr, x24                                      \n"
+    "1:                                                          \n"
+    "  fmla z0.d, p0/m, z0.d, z0.d                               \n"
+    "  fmla z1.d, p0/m, z1.d, z1.d                               \n"
+    "  fmla z2.d, p0/m, z2.d, z2.d                               \n"
+    "  fmla z3.d, p0/m, z3.d, z3.d                               \n"
+    "  fmla z4.d, p0/m, z4.d, z4.d                               \n"
+    "  fmla z5.d, p0/m, z5.d, z5.d                               \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 8.0*6.0*(double)n_iterations;
+}
+
+
+double fmla_f64_f64_p50_ilp11(const void* args) {
+  // FMLA (FP64, one vector), 50% active lanes, Multiply-Accumulate (floating-point)
+  //
+  // Each instruction: (8x f64, 8x f64) → 4 of 8x f64 (8 OPs)
+  // Total of 88 OPs per loop iteration, ILP = 11
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #4                                                 \n"
+    "whilelt p0.d, xzr, x24                                      \n"
+    "1:                                                          \n"
+    "  fmla z0.d, p0/m, z0.d, z0.d                               \n"
+    "  fmla z1.d, p0/m, z1.d, z1.d                               \n"
+    "  fmla z2.d, p0/m, z2.d, z2.d                               \n"
+    "  fmla z3.d, p0/m, z3.d, z3.d                               \n"
+    "  fmla z4.d, p0/m, z4.d, z4.d                               \n"
+    "  fmla z5.d, p0/m, z5.d, z5.d                               \n"
+    "  fmla z6.d, p0/m, z6.d, z6.d                               \n"
+    "  fmla z7.d, p0/m, z7.d, z7.d                               \n"
+    "  fmla z8.d, p0/m, z8.d, z8.d                               \n"
+    "  fmla z9.d, p0/m, z9.d, z9.d                               \n"
+    "  fmla z10.d, p0/m, z10.d, z10.d                            \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 8.0*11.0*(double)n_iterations;
+}
+
+
+double fmla_f64_f64_p25_ilp10(const void* args) {
+  // FMLA (FP64, one vector), 25% active lanes, Multiply-Accumulate (floating-point)
+  //
+  // Each instruction: (8x f64, 8x f64) → 2 of 8x f64 (4 OPs)
+  // Total of 40 OPs per loop iteration, ILP = 10
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #2                                                 \n"
+    "whilelt p0.d, xzr, x24                                      \n"
+    "1:                                                          \n"
+    "  fmla z0.d, p0/m, z0.d, z0.d                               \n"
+    "  fmla z1.d, p0/m, z1.d, z1.d                               \n"
+    "  fmla z2.d, p0/m, z2.d, z2.d                               \n"
+    "  fmla z3.d, p0/m, z3.d, z3.d                               \n"
+    "  fmla z4.d, p0/m, z4.d, z4.d                               \n"
+    "  fmla z5.d, p0/m, z5.d, z5.d                               \n"
+    "  fmla z6.d, p0/m, z6.d, z6.d                               \n"
+    "  fmla z7.d, p0/m, z7.d, z7.d                               \n"
+    "  fmla z8.d, p0/m, z8.d, z8.d                               \n"
+    "  fmla z9.d, p0/m, z9.d, z9.d                               \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 4.0*10.0*(double)n_iterations;
+}
+
+
+double fmla_za_f32_f32_vgx2_ilp5(const void* args) {
+  // FMLA (FP32, two vectors), Multiply-Accumulate (floating-point)
+  //
+  // Each instruction: (32x f32, 32x f32) → 32x f32 (64 OPs)
+  // Total of 320 OPs per loop iteration, ILP = 5
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  fmla za.s[w8, 0, VGx2], {z0.s-z1.s}, {z0.s-z1.s}          \n"
+    "  fmla za.s[w8, 1, VGx2], {z0.s-z1.s}, {z0.s-z1.s}          \n"
+    "  fmla za.s[w8, 2, VGx2], {z2.s-z3.s}, {z2.s-z3.s}          \n"
+    "  fmla za.s[w8, 3, VGx2], {z2.s-z3.s}, {z2.s-z3.s}          \n"
+    "  fmla za.s[w8, 4, VGx2], {z4.s-z5.s}, {z4.s-z5.s}          \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 64.0*5.0*(double)n_iterations;
+}
+
+
+double fmla_za_f32_f32_vgx2_ilp14(const void* args) {
+  // FMLA (FP32, two vectors), Multiply-Accumulate (floating-point)
+  //
+  // Each instruction: (32x f32, 32x f32) → 32x f32 (64 OPs)
+  // Total of 896 OPs per loop iteration, ILP = 14
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  fmla za.s[w8, 0, VGx2], {z0.s-z1.s}, {z0.s-z1.s}          \n"
+    "  fmla za.s[w8, 1, VGx2], {z0.s-z1.s}, {z0.s-z1.s}          \n"
+    "  fmla za.s[w8, 2, VGx2], {z2.s-z3.s}, {z2.s-z3.s}          \n"
+    "  fmla za.s[w8, 3, VGx2], {z2.s-z3.s}, {z2.s-z3.s}          \n"
+    "  fmla za.s[w8, 4, VGx2], {z4.s-z5.s}, {z4.s-z5.s}          \n"
+    "  fmla za.s[w8, 5, VGx2], {z4.s-z5.s}, {z4.s-z5.s}          \n"
+    "  fmla za.s[w8, 6, VGx2], {z6.s-z7.s}, {z6.s-z7.s}          \n"
+    "  fmla za.s[w8, 7, VGx2], {z6.s-z7.s}, {z6.s-z7.s}          \n"
+    "  fmla za.s[w9, 0, VGx2], {z8.s-z9.s}, {z8.s-z9.s}          \n"
+    "  fmla za.s[w9, 1, VGx2], {z8.s-z9.s}, {z8.s-z9.s}          \n"
+    "  fmla za.s[w9, 2, VGx2], {z10.s-z11.s}, {z10.s-z11.s}      \n"
+    "  fmla za.s[w9, 3, VGx2], {z10.s-z11.s}, {z10.s-z11.s}      \n"
+    "  fmla za.s[w9, 4, VGx2], {z12.s-z13.s}, {z12.s-z13.s}      \n"
+    "  fmla za.s[w9, 5, VGx2], {z12.s-z13.s}, {z12.s-z13.s}      \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 64.0*14.0*(double)n_iterations;
+}
+
+
+double fmla_za_f32_f32_vgx4_ilp3(const void* args) {
+  // FMLA (FP32, four vectors), Multiply-Accumulate (floating-point)
+  //
+  // Each instruction: (64x f32, 64x f32) → 64x f32 (128 OPs)
+  // Total of 384 OPs per loop iteration, ILP = 3
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  fmla za.s[w8, 0, VGx4], {z0.s-z3.s}, {z0.s-z3.s}          \n"
+    "  fmla za.s[w8, 1, VGx4], {z0.s-z3.s}, {z0.s-z3.s}          \n"
+    "  fmla za.s[w8, 2, VGx4], {z0.s-z3.s}, {z0.s-z3.s}          \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 128.0*3.0*(double)n_iterations;
+}
+
+
+double fmla_za_f32_f32_vgx4_ilp8(const void* args) {
+  // FMLA (FP32, four vectors), Multiply-Accumulate (floating-point)
+  //
+  // Each instruction: (64x f32, 64x f32) → 64x f32 (128 OPs)
+  // Total of 1024 OPs per loop iteration, ILP = 8
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  fmla za.s[w8, 0, VGx4], {z0.s-z3.s}, {z0.s-z3.s}          \n"
+    "  fmla za.s[w8, 1, VGx4], {z0.s-z3.s}, {z0.s-z3.s}          \n"
+    "  fmla za.s[w8, 2, VGx4], {z0.s-z3.s}, {z0.s-z3.s}          \n"
+    "  fmla za.s[w8, 3, VGx4], {z0.s-z3.s}, {z0.s-z3.s}          \n"
+    "  fmla za.s[w8, 4, VGx4], {z4.s-z7.s}, {z4.s-z7.s}          \n"
+    "  fmla za.s[w8, 5, VGx4], {z4.s-z7.s}, {z4.s-z7.s}          \n"
+    "  fmla za.s[w8, 6, VGx4], {z4.s-z7.s}, {z4.s-z7.s}          \n"
+    "  fmla za.s[w8, 7, VGx4], {z4.s-z7.s}, {z4.s-z7.s}          \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 128.0*8.0*(double)n_iterations;
+}
+
+
+double fmla_za_f64_f64_vgx2_ilp13(const void* args) {
+  // FMLA (FP64, two vectors), Multiply-Accumulate (floating-point)
+  //
+  // Each instruction: (16x f64, 16x f64) → 16x f64 (32 OPs)
+  // Total of 416 OPs per loop iteration, ILP = 13
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  fmla za.d[w8, 0, VGx2], {z0.d-z1.d}, {z0.d-z1.d}          \n"
+    "  fmla za.d[w8, 1, VGx2], {z0.d-z1.d}, {z0.d-z1.d}          \n"
+    "  fmla za.d[w8, 2, VGx2], {z2.d-z3.d}, {z2.d-z3.d}          \n"
+    "  fmla za.d[w8, 3, VGx2], {z2.d-z3.d}, {z2.d-z3.d}          \n"
+    "  fmla za.d[w8, 4, VGx2], {z4.d-z5.d}, {z4.d-z5.d}          \n"
+    "  fmla za.d[w8, 5, VGx2], {z4.d-z5.d}, {z4.d-z5.d}          \n"
+    "  fmla za.d[w8, 6, VGx2], {z6.d-z7.d}, {z6.d-z7.d}          \n"
+    "  fmla za.d[w8, 7, VGx2], {z6.d-z7.d}, {z6.d-z7.d}          \n"
+    "  fmla za.d[w9, 0, VGx2], {z8.d-z9.d}, {z8.d-z9.d}          \n"
+    "  fmla za.d[w9, 1, VGx2], {z8.d-z9.d}, {z8.d-z9.d}          \n"
+    "  fmla za.d[w9, 2, VGx2], {z10.d-z11.d}, {z10.d-z11.d}      \n"
+    "  fmla za.d[w9, 3, VGx2], {z10.d-z11.d}, {z10.d-z11.d}      \n"
+    "  fmla za.d[w9, 4, VGx2], {z12.d-z13.d}, {z12.d-z13.d}      \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 32.0*13.0*(double)n_iterations;
+}
+
+
+double fmla_za_f64_f64_vgx4_ilp6(const void* args) {
+  // FMLA (FP64, four vectors), Multiply-Accumulate (floating-point)
+  //
+  // Each instruction: (32x f64, 32x f64) → 32x f64 (64 OPs)
+  // Total of 384 OPs per loop iteration, ILP = 6
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  fmla za.d[w8, 0, VGx4], {z0.d-z3.d}, {z0.d-z3.d}          \n"
+    "  fmla za.d[w8, 1, VGx4], {z0.d-z3.d}, {z0.d-z3.d}          \n"
+    "  fmla za.d[w8, 2, VGx4], {z0.d-z3.d}, {z0.d-z3.d}          \n"
+    "  fmla za.d[w8, 3, VGx4], {z0.d-z3.d}, {z0.d-z3.d}          \n"
+    "  fmla za.d[w8, 4, VGx4], {z4.d-z7.d}, {z4.d-z7.d}          \n"
+    "  fmla za.d[w8, 5, VGx4], {z4.d-z7.d}, {z4.d-z7.d}          \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 64.0*6.0*(double)n_iterations;
+}
+
+
+double fmla_za_f64_f64_vgx4_ilp10(const void* args) {
+  // FMLA (FP64, four vectors), Multiply-Accumulate (floating-point)
+  //
+  // Each instruction: (32x f64, 32x f64) → 32x f64 (64 OPs)
+  // Total of 640 OPs per loop iteration, ILP = 10
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  fmla za.d[w8, 0, VGx4], {z0.d-z3.d}, {z0.d-z3.d}          \n"
+    "  fmla za.d[w8, 1, VGx4], {z0.d-z3.d}, {z0.d-z3.d}          \n"
+    "  fmla za.d[w8, 2, VGx4], {z0.d-z3.d}, {z0.d-z3.d}          \n"
+    "  fmla za.d[w8, 3, VGx4], {z0.d-z3.d}, {z0.d-z3.d}          \n"
+    "  fmla za.d[w8, 4, VGx4], {z4.d-z7.d}, {z4.d-z7.d}          \n"
+    "  fmla za.d[w8, 5, VGx4], {z4.d-z7.d}, {z4.d-z7.d}          \n"
+    "  fmla za.d[w8, 6, VGx4], {z4.d-z7.d}, {z4.d-z7.d}          \n"
+    "  fmla za.d[w8, 7, VGx4], {z4.d-z7.d}, {z4.d-z7.d}          \n"
+    "  fmla za.d[w9, 0, VGx4], {z8.d-z11.d}, {z8.d-z11.d}        \n"
+    "  fmla za.d[w9, 1, VGx4], {z8.d-z11.d}, {z8.d-z11.d}        \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 64.0*10.0*(double)n_iterations;
+}
+
+
+double fmlal_za_f32_f16_vgx2_ilp1(const void* args) {
+  // FMLAL (FP16 to FP32, two vectors), Multiply-Accumulate (floating-point)
+  //
+  // Each instruction: (64x f16, 64x f16) → 64x f32 (128 OPs)
+  // Total of 128 OPs per loop iteration, ILP = 1
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  fmlal za.s[w8, 0:1, VGx2], {z0.h-z1.h}, {z0.h-z1.h}       \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 128.0*1.0*(double)n_iterations;
+}
+
+
+double fmlal_za_f32_f16_vgx2_ilp14(const void* args) {
+  // FMLAL (FP16 to FP32, two vectors), Multiply-Accumulate (floating-point)
+  //
+  // Each instruction: (64x f16, 64x f16) → 64x f32 (128 OPs)
+  // Total of 1792 OPs per loop iteration, ILP = 14
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  fmlal za.s[w8, 0:1, VGx2], {z0.h-z1.h}, {z0.h-z1.h}       \n"
+    "  fmlal za.s[w8, 2:3, VGx2], {z0.h-z1.h}, {z0.h-z1.h}       \n"
+    "  fmlal za.s[w8, 4:5, VGx2], {z2.h-z3.h}, {z2.h-z3.h}       \n"
+    "  fmlal za.s[w8, 6:7, VGx2], {z2.h-z3.h}, {z2.h-z3.h}       \n"
+    "  fmlal za.s[w9, 0:1, VGx2], {z4.h-z5.h}, {z4.h-z5.h}       \n"
+    "  fmlal za.s[w9, 2:3, VGx2], {z4.h-z5.h}, {z4.h-z5.h}       \n"
+    "  fmlal za.s[w9, 4:5, VGx2], {z6.h-z7.h}, {z6.h-z7.h}       \n"
+    "  fmlal za.s[w9, 6:7, VGx2], {z6.h-z7.h}, {z6.h-z7.h}       \n"
+    "  fmlal za.s[w10, 0:1, VGx2], {z8.h-z9.h}, {z8.h-z9.h}      \n"
+    "  fmlal za.s[w10, 2:3, VGx2], {z8.h-z9.h}, {z8.h-z9.h}      \n"
+    "  fmlal za.s[w10, 4:5, VGx2], {z10.h-z11.h}, {z10.h-z11.h}  \n"
+    "  fmlal za.s[w10, 6:7, VGx2], {z10.h-z11.h}, {z10.h-z11.h}  \n"
+    "  fmlal za.s[w11, 0:1, VGx2], {z12.h-z13.h}, {z12.h-z13.h}  \n"
+    "  fmlal za.s[w11, 2:3, VGx2], {z12.h-z13.h}, {z12.h-z13.h}  \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 128.0*14.0*(double)n_iterations;
+}
+
+
+double fmlal_za_f32_f16_vgx4_ilp7(const void* args) {
+  // FMLAL (FP16 to FP32, four vectors), Multiply-Accumulate (floating-point)
+  //
+  // Each instruction: (128x f16, 128x f16) → 128x f32 (256 OPs)
+  // Total of 1792 OPs per loop iteration, ILP = 7
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  fmlal za.s[w8, 0:1, VGx4], {z0.h-z3.h}, {z0.h-z3.h}       \n"
+    "  fmlal za.s[w8, 2:3, VGx4], {z0.h-z3.h}, {z0.h-z3.h}       \n"
+    "  fmlal za.s[w8, 4:5, VGx4], {z0.h-z3.h}, {z0.h-z3.h}       \n"
+    "  fmlal za.s[w8, 6:7, VGx4], {z0.h-z3.h}, {z0.h-z3.h}       \n"
+    "  fmlal za.s[w9, 0:1, VGx4], {z4.h-z7.h}, {z4.h-z7.h}       \n"
+    "  fmlal za.s[w9, 2:3, VGx4], {z4.h-z7.h}, {z4.h-z7.h}       \n"
+    "  fmlal za.s[w9, 4:5, VGx4], {z4.h-z7.h}, {z4.h-z7.h}       \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 256.0*7.0*(double)n_iterations;
+}
+
+
+double fmlal_za_f32_f16_vgx4_chain8_ilp2(const void* args) {
+  // FMLAL (FP16 to FP32, four vectors), Multiply-Accumulate (floating-point)
+  //
+  // Each instruction: (128x f16, 128x f16) → 128x f32 (256 OPs)
+  // Total of 4096 OPs per loop iteration, 2 interleaved dependent chains of 8 instructions
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  fmlal za.s[w8, 0:1, VGx4], {z0.h-z3.h}, {z0.h-z3.h}       \n"
+    "  fmlal za.s[w8, 2:3, VGx4], {z0.h-z3.h}, {z0.h-z3.h}       \n"
+    "  fmlal za.s[w8, 0:1, VGx4], {z0.h-z3.h}, {z0.h-z3.h}       \n"
+    "  fmlal za.s[w8, 2:3, VGx4], {z0.h-z3.h}, {z0.h-z3.h}       \n"
+    "  fmlal za.s[w8, 0:1, VGx4], {z0.h-z3.h}, {z0.h-z3.h}       \n"
+    "  fmlal za.s[w8, 2:3, VGx4], {z0.h-z3.h}, {z0.h-z3.h}       \n"
+    "  fmlal za.s[w8, 0:1, VGx4], {z0.h-z3.h}, {z0.h-z3.h}       \n"
+    "  fmlal za.s[w8, 2:3, VGx4], {z0.h-z3.h}, {z0.h-z3.h}       \n"
+    "  fmlal za.s[w8, 0:1, VGx4], {z0.h-z3.h}, {z0.h-z3.h}       \n"
+    "  fmlal za.s[w8, 2:3, VGx4], {z0.h-z3.h}, {z0.h-z3.h}       \n"
+    "  fmlal za.s[w8, 0:1, VGx4], {z0.h-z3.h}, {z0.h-z3.h}       \n"
+    "  fmlal za.s[w8, 2:3, VGx4], {z0.h-z3.h}, {z0.h-z3.h}       \n"
+    "  fmlal za.s[w8, 0:1, VGx4], {z0.h-z3.h}, {z0.h-z3.h}       \n"
+    "  fmlal za.s[w8, 2:3, VGx4], {z0.h-z3.h}, {z0.h-z3.h}       \n"
+    "  fmlal za.s[w8, 0:1, VGx4], {z0.h-z3.h}, {z0.h-z3.h}       \n"
+    "  fmlal za.s[w8, 2:3, VGx4], {z0.h-z3.h}, {z0.h-z3.h}       \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 256.0*16.0*(double)n_iterations;
+}
+
+
+double bfmlal_za_f32_b16_vgx2_ilp2(const void* args) {
+  // BFMLAL (BF16 to FP32, two vectors), Multiply-Accumulate (floating-point)
+  //
+  // Each instruction: (64x b16, 64x b16) → 64x f32 (128 OPs)
+  // Total of 256 OPs per loop iteration, ILP = 2
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  bfmlal za.s[w8, 0:1, VGx2], {z0.h-z1.h}, {z0.h-z1.h}      \n"
+    "  bfmlal za.s[w8, 2:3, VGx2], {z0.h-z1.h}, {z0.h-z1.h}      \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 128.0*2.0*(double)n_iterations;
+}
+
+
+double bfmlal_za_f32_b16_vgx2_ilp9(const void* args) {
+  // BFMLAL (BF16 to FP32, two vectors), Multiply-Accumulate (floating-point)
+  //
+  // Each instruction: (64x b16, 64x b16) → 64x f32 (128 OPs)
+  // Total of 1152 OPs per loop iteration, ILP = 9
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  bfmlal za.s[w8, 0:1, VGx2], {z0.h-z1.h}, {z0.h-z1.h}      \n"
+    "  bfmlal za.s[w8, 2:3, VGx2], {z0.h-z1.h}, {z0.h-z1.h}      \n"
+    "  bfmlal za.s[w8, 4:5, VGx2], {z2.h-z3.h}, {z2.h-z3.h}      \n"
+    "  bfmlal za.s[w8, 6:7, VGx2], {z2.h-z3.h}, {z2.h-z3.h}      \n"
+    "  bfmlal za.s[w9, 0:1, VGx2], {z4.h-z5.h}, {z4.h-z5.h}      \n"
+    "  bfmlal za.s[w9, 2:3, VGx2], {z4.h-z5.h}, {z4.h-z5.h}      \n"
+    "  bfmlal za.s[w9, 4:5, VGx2], {z6.h-z7.h}, {z6.h-z7.h}      \n"
+    "  bfmlal za.s[w9, 6:7, VGx2], {z6.h-z7.h}, {z6.h-z7.h}      \n"
+    "  bfmlal za.s[w10, 0:1, VGx2], {z8.h-z9.h}, {z8.h-z9.h}     \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 128.0*9.0*(double)n_iterations;
+}
+
+
+double bfmlal_za_f32_b16_vgx2_ilp13(const void* args) {
+  // BFMLAL (BF16 to FP32, two vectors), Multiply-Accumulate (floating-point)
+  //
+  // Each instruction: (64x b16, 64x b16) → 64x f32 (128 OPs)
+  // Total of 1664 OPs per loop iteration, ILP = 13
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  bfmlal za.s[w8, 0:1, VGx2], {z0.h-z1.h}, {z0.h-z1.h}      \n"
+    "  bfmlal za.s[w8, 2:3, VGx2], {z0.h-z1.h}, {z0.h-z1.h}      \n"
+    "  bfmlal za.s[w8, 4:5, VGx2], {z2.h-z3.h}, {z2.h-z3.h}      \n"
+    "  bfmlal za.s[w8, 6:7, VGx2], {z2.h-z3.h}, {z2.h-z3.h}      \n"
+    "  bfmlal za.s[w9, 0:1, VGx2], {z4.h-z5.h}, {z4.h-z5.h}      \n"
+    "  bfmlal za.s[w9, 2:3, VGx2], {z4.h-z5.h}, {z4.h-z5.h}      \n"
+    "  bfmlal za.s[w9, 4:5, VGx2], {z6.h-z7.h}, {z6.h-z7.h}      \n"
+    "  bfmlal za.s[w9, 6:7, VGx2], {z6.h-z7.h}, {z6.h-z7.h}      \n"
+    "  bfmlal za.s[w10, 0:1, VGx2], {z8.h-z9.h}, {z8.h-z9.h}     \n"
+    "  bfmlal za.s[w10, 2:3, VGx2], {z8.h-z9.h}, {z8.h-z9.h}     \n"
+    "  bfmlal za.s[w10, 4:5, VGx2], {z10.h-z11.h}, {z10.h-z11.h} \n"
+    "  bfmlal za.s[w10, 6:7, VGx2], {z10.h-z11.h}, {z10.h-z11.h} \n"
+    "  bfmlal za.s[w11, 0:1, VGx2], {z12.h-z13.h}, {z12.h-z13.h} \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 128.0*13.0*(double)n_iterations;
+}
+
+
+double bfmlal_za_f32_b16_vgx4_ilp4(const void* args) {
+  // BFMLAL (BF16 to FP32, four vectors), Multiply-Accumulate (floating-point)
+  //
+  // Each instruction: (128x b16, 128x b16) → 128x f32 (256 OPs)
+  // Total of 1024 OPs per loop iteration, ILP = 4
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  bfmlal za.s[w8, 0:1, VGx4], {z0.h-z3.h}, {z0.h-z3.h}      \n"
+    "  bfmlal za.s[w8, 2:3, VGx4], {z0.h-z3.h}, {z0.h-z3.h}      \n"
+    "  bfmlal za.s[w8, 4:5, VGx4], {z0.h-z3.h}, {z0.h-z3.h}      \n"
+    "  bfmlal za.s[w8, 6:7, VGx4], {z0.h-z3.h}, {z0.h-z3.h}      \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 256.0*4.0*(double)n_iterations;
+}
+
+
+double bfmlal_za_f32_b16_vgx4_chain8_ilp2(const void* args) {
+  // BFMLAL (BF16 to FP32, four vectors), Multiply-Accumulate (floating-point)
+  //
+  // Each instruction: (128x b16, 128x b16) → 128x f32 (256 OPs)
+  // Total of 4096 OPs per loop iteration, 2 interleaved dependent chains of 8 instructions
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  bfmlal za.s[w8, 0:1, VGx4], {z0.h-z3.h}, {z0.h-z3.h}      \n"
+    "  bfmlal za.s[w8, 2:3, VGx4], {z0.h-z3.h}, {z0.h-z3.h}      \n"
+    "  bfmlal za.s[w8, 0:1, VGx4], {z0.h-z3.h}, {z0.h-z3.h}      \n"
+    "  bfmlal za.s[w8, 2:3, VGx4], {z0.h-z3.h}, {z0.h-z3.h}      \n"
+    "  bfmlal za.s[w8, 0:1, VGx4], {z0.h-z3.h}, {z0.h-z3.h}      \n"
+    "  bfmlal za.s[w8, 2:3, VGx4], {z0.h-z3.h}, {z0.h-z3.h}      \n"
+    "  bfmlal za.s[w8, 0:1, VGx4], {z0.h-z3.h}, {z0.h-z3.h}      \n"
+    "  bfmlal za.s[w8, 2:3, VGx4], {z0.h-z3.h}, {z0.h-z3.h}      \n"
+    "  bfmlal za.s[w8, 0:1, VGx4], {z0.h-z3.h}, {z0.h-z3.h}      \n"
+    "  bfmlal za.s[w8, 2:3, VGx4], {z0.h-z3.h}, {z0.h-z3.h}      \n"
+    "  bfmlal za.s[w8, 0:1, VGx4], {z0.h-z3.h}, {z0.h-z3.h}      \n"
+    "  bfmlal za.s[w8, 2:3, VGx4], {z0.h-z3.h}, {z0.h-z3.h}      \n"
+    "  bfmlal za.s[w8, 0:1, VGx4], {z0.h-z3.h}, {z0.h-z3.h}      \n"
+    "  bfmlal za.s[w8, 2:3, VGx4], {z0.h-z3.h}, {z0.h-z3.h}      \n"
+    "  bfmlal za.s[w8, 0:1, VGx4], {z0.h-z3.h}, {z0.h-z3.h}      \n"
+    "  bfmlal za.s[w8, 2:3, VGx4], {z0.h-z3.h}, {z0.h-z3.h}      \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 256.0*16.0*(double)n_iterations;
+}
+
+
+double mla_i8_i8_ilp5(const void* args) {
+  // MLA (I8, one vector), Multiply-Accumulate (integer)
+  //
+  // Each instruction: (64x i8, 64x i8) → 64x i8 (128 OPs)
+  // Total of 640 OPs per loop iteration, ILP = 5
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "ptrue p0.b                                                  \n"
+    "1:                                                          \n"
+    "  mla z0.b, p0/m, z0.b, z0.b                                \n"
+    "  mla z1.b, p0/m, z1.b, z1.b                                \n"
+    "  mla z2.b, p0/m, z2.b, z2.b                                \n"
+    "  mla z3.b, p0/m, z3.b, z3.b                                \n"
+    "  mla z4.b, p0/m, z4.b, z4.b                                \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 128.0*5.0*(double)n_iterations;
+}
+
+
+double mla_i8_i8_ilp14(const void* args) {
+  // MLA (I8, one vector), Multiply-Accumulate (integer)
+  //
+  // Each instruction: (64x i8, 64x i8) → 64x i8 (128 OPs)
+  // Total of 1792 OPs per loop iteration, ILP = 14
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "ptrue p0.b                                                  \n"
+    "1:                                                          \n"
+    "  mla z0.b, p0/m, z0.b, z0.b                                \n"
+    "  mla z1.b, p0/m, z1.b, z1.b                                \n"
+    "  mla z2.b, p0/m, z2.b, z2.b                                \n"
+    "  mla z3.b, p0/m, z3.b, z3.b                                \n"
+    "  mla z4.b, p0/m, z4.b, z4.b                                \n"
+    "  mla z5.b, p0/m, z5.b, z5.b                                \n"
+    "  mla z6.b, p0/m, z6.b, z6.b                                \n"
+    "  mla z7.b, p0/m, z7.b, z7.b                                \n"
+    "  mla z8.b, p0/m, z8.b, z8.b                                \n"
+    "  mla z9.b, p0/m, z9.b, z9.b                                \n"
+    "  mla z10.b, p0/m, z10.b, z10.b                             \n"
+    "  mla z11.b, p0/m, z11.b, z11.b                             \n"
+    "  mla z12.b, p0/m, z12.b, z12.b                             \n"
+    "  mla z13.b, p0/m, z13.b, z13.b                             \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 128.0*14.0*(double)n_iterations;
+}
+
+
+double mla_i8_i8_p75_ilp2(const void* args) {
+  // MLA (I8, one vector), 75% active lanes, Multiply-Accumulate (integer)
+  //
+  // Each instruction: (64x i8, 64x i8) → 48 of 64x i8 (96 OPs)
+  // Total of 192 OPs per loop iteration, ILP = 2
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #48                                                \n"
+    "whilelt p0.b, xzr, x24                                      \n"
+    "1:                                                          \n"
+    "  mla z0.b, p0/m, z0.b, z0.b                                \n"
+    "  mla z1.b, p0/m, z1.b, z1.b                                \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 96.0*2.0*(double)n_iterations;
+}
+
+
+double mla_i8_i8_p75_ilp9(const void* args) {
+  // MLA (I8, one vector), 75% active lanes, Multiply-Accumulate (integer)
+  //
+  // Each instruction: (64x i8, 64x i8) → 48 of 64x i8 (96 OPs)
+  // Total of 864 OPs per loop iteration, ILP = 9
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #48                                                \n"
+    "whilelt p0.b, xzr, x24                                      \n"
+    "1:                                                          \n"
+    "  mla z0.b, p0/m, z0.b, z0.b                                \n"
+    "  mla z1.b, p0/m, z1.b, z1.b                                \n"
+    "  mla z2.b, p0/m, z2.b, z2.b                                \n"
+    "  mla z3.b, p0/m, z3.b, z3.b                                \n"
+    "  mla z4.b, p0/m, z4.b, z4.b                                \n"
+    "  mla z5.b, p0/m, z5.b, z5.b                                \n"
+    "  mla z6.b, p0/m, z6.b, z6.b                                \n"
+    "  mla z7.b, p0/m, z7.b, z7.b                                \n"
+    "  mla z8.b, p0/m, z8.b, z8.b                                \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 96.0*9.0*(double)n_iterations;
+}
+
+
+double mla_i8_i8_p75_ilp11(const void* args) {
+  // MLA (I8, one vector), 75% active lanes, Multiply-Accumulate (integer)
+  //
+  // Each instruction: (64x i8, 64x i8) → 48 of 64x i8 (96 OPs)
+  // Total of 1056 OPs per loop iteration, ILP = 11
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #48                                                \n"
+    "whilelt p0.b, xzr, x24                                      \n"
+    "1:                                                          \n"
+    "  mla z0.b, p0/m, z0.b, z0.b                                \n"
+    "  mla z1.b, p0/m, z1.b, z1.b                                \n"
+    "  mla z2.b, p0/m, z2.b, z2.b                                \n"
+    "  mla z3.b, p0/m, z3.b, z3.b                                \n"
+    "  mla z4.b, p0/m, z4.b, z4.b                                \n"
+    "  mla z5.b, p0/m, z5.b, z5.b                                \n"
+    "  mla z6.b, p0/m, z6.b, z6.b                                \n"
+    "  mla z7.b, p0/m, z7.b, z7.b                                \n"
+    "  mla z8.b, p0/m, z8.b, z8.b                                \n"
+    "  mla z9.b, p0/m, z9.b, z9.b                                \n"
+    "  mla z10.b, p0/m, z10.b, z10.b                             \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 96.0*11.0*(double)n_iterations;
+}
+
+
+double mla_i8_i8_p50_ilp1(const void* args) {
+  // MLA (I8, one vector), 50% active lanes, Multiply-Accumulate (integer)
+  //
+  // Each instruction: (64x i8, 64x i8) → 32 of 64x i8 (64 OPs)
+  // Total of 64 OPs per loop iteration, ILP = 1
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #32                                                \n"
+    "whilelt p0.b, xzr, x24                                      \n"
+    "1:                                                          \n"
+    "  mla z0.b, p0/m, z0.b, z0.b                                \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 64.0*1.0*(double)n_iterations;
+}
+
+
+double mla_i8_i8_p50_ilp12(const void* args) {
+  // MLA (I8, one vector), 50% active lanes, Multiply-Accumulate (integer)
+  //
+  // Each instruction: (64x i8, 64x i8) → 32 of 64x i8 (64 OPs)
+  // Total of 768 OPs per loop iteration, ILP = 12
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #32                                                \n"
+    "whilelt p0.b, xzr, x24                                      \n"
+    "1:                                                          \n"
+    "  mla z0.b, p0/m, z0.b, z0.b                                \n"
+    "  mla z1.b, p0/m, z1.b, z1.b                                \n"
+    "  mla z2.b, p0/m, z2.b, z2.b                                \n"
+    "  mla z3.b, p0/m, z3.b, z3.b                                \n"
+    "  mla z4.b, p0/m, z4.b, z4.b                                \n"
+    "  mla z5.b, p0/m, z5.b, z5.b                                \n"
+    "  mla z6.b, p0/m, z6.b, z6.b                                \n"
+    "  mla z7.b, p0/m, z7.b, z7.b                                \n"
+    "  mla z8.b, p0/m, z8.b, z8.b                                \n"
+    "  mla z9.b, p0/m, z9.b, z9.b                                \n"
+    "  mla z10.b, p0/m, z10.b, z10.b                             \n"
+    "  mla z11.b, p0/m, z11.b, z11.b                             \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 64.0*12.0*(double)n_iterations;
+}
+
+
+double mla_i8_i8_p25_ilp7(const void* args) {
+  // MLA (I8, one vector), 25% active lanes, Multiply-Accumulate (integer)
+  //
+  // Each instruction: (64x i8, 64x i8) → 16 of 64x i8 (32 OPs)
+  // Total of 224 OPs per loop iteration, ILP = 7
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #16                                                \n"
+    "whilelt p0.b, xzr, x24                                      \n"
+    "1:                                                          \n"
+    "  mla z0.b, p0/m, z0.b, z0.b                                \n"
+    "  mla z1.b, p0/m, z1.b, z1.b                                \n"
+    "  mla z2.b, p0/m, z2.b, z2.b                                \n"
+    "  mla z3.b, p0/m, z3.b, z3.b                                \n"
+    "  mla z4.b, p0/m, z4.b, z4.b                                \n"
+    "  mla z5.b, p0/m, z5.b, z5.b                                \n"
+    "  mla z6.b, p0/m, z6.b, z6.b                                \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 32.0*7.0*(double)n_iterations;
+}
+
+
+double mla_i8_i8_p25_ilp13(const void* args) {
+  // MLA (I8, one vector), 25% active lanes, Multiply-Accumulate (integer)
+  //
+  // Each instruction: (64x i8, 64x i8) → 16 of 64x i8 (32 OPs)
+  // Total of 416 OPs per loop iteration, ILP = 13
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #16                                                \n"
+    "whilelt p0.b, xzr, x24                                      \n"
+    "1:                                                          \n"
+    "  mla z0.b, p0/m, z0.b, z0.b                                \n"
+    "  mla z1.b, p0/m, z1.b, z1.b                                \n"
+    "  mla z2.b, p0/m, z2.b, z2.b                                \n"
+    "  mla z3.b, p0/m, z3.b, z3.b                                \n"
+    "  mla z4.b, p0/m, z4.b, z4.b                                \n"
+    "  mla z5.b, p0/m, z5.b, z5.b                                \n"
+    "  mla z6.b, p0/m, z6.b, z6.b                                \n"
+    "  mla z7.b, p0/m, z7.b, z7.b                                \n"
+    "  mla z8.b, p0/m, z8.b, z8.b                                \n"
+    "  mla z9.b, p0/m, z9.b, z9.b                                \n"
+    "  mla z10.b, p0/m, z10.b, z10.b                             \n"
+    "  mla z11.b, p0/m, z11.b, z11.b                             \n"
+    "  mla z12.b, p0/m, z12.b, z12.b                             \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 32.0*13.0*(double)n_iterations;
+}
+
+
+double mla_i16_i16_ilp3(const void* args) {
+  // MLA (I16, one vector), Multiply-Accumulate (integer)
+  //
+  // Each instruction: (32x i16, 32x i16) → 32x i16 (64 OPs)
+  // Total of 192 OPs per loop iteration, ILP = 3
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "ptrue p0.h                                                  \n"
+    "1:                                                          \n"
+    "  mla z0.h, p0/m, z0.h, z0.h                                \n"
+    "  mla z1.h, p0/m, z1.h, z1.h                                \n"
+    "  mla z2.h, p0/m, z2.h, z2.h                                \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 64.0*3.0*(double)n_iterations;
+}
+
+
+double mla_i16_i16_ilp8(const void* args) {
+  // MLA (I16, one vector), Multiply-Accumulate (integer)
+  //
+  // Each instruction: (32x i16, 32x i16) → 32x i16 (64 OPs)
+  // Total of 512 OPs per loop iteration, ILP = 8
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "ptrue p0.h                                                  \n"
+    "1:                                                          \n"
+    "  mla z0.h, p0/m, z0.h, z0.h                                \n"
+    "  mla z1.h, p0/m, z1.h, z1.h                                \n"
+    "  mla z2.h, p0/m, z2.h, z2.h                                \n"
+    "  mla z3.h, p0/m, z3.h, z3.h                                \n"
+    "  mla z4.h, p0/m, z4.h, z4.h                                \n"
+    "  mla z5.h, p0/m, z5.h, z5.h                                \n"
+    "  mla z6.h, p0/m, z6.h, z6.h                                \n"
+    "  mla z7.h, p0/m, z7.h, z7.h                                \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 64.0*8.0*(double)n_iterations;
+}
+
+
+double mla_i16_i16_ilp16(const void* args) {
+  // MLA (I16, one vector), Multiply-Accumulate (integer)
+  //
+  // Each instruction: (32x i16, 32x i16) → 32x i16 (64 OPs)
+  // Total of 1024 OPs per loop iteration, ILP = 16
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "ptrue p0.h                                                  \n"
+    "1:                                                          \n"
+    "  mla z0.h, p0/m, z0.h, z0.h                                \n"
+    "  mla z1.h, p0/m, z1.h, z1.h                                \n"
+    "  mla z2.h, p0/m, z2.h, z2.h                                \n"
+    "  mla z3.h, p0/m, z3.h, z3.h                                \n"
+    "  mla z4.h, p0/m, z4.h, z4.h                                \n"
+    "  mla z5.h, p0/m, z5.h, z5.h                                \n"
+    "  mla z6.h, p0/m, z6.h, z6.h                                \n"
+    "  mla z7.h, p0/m, z7.h, z7.h                                \n"
+    "  mla z8.h, p0/m, z8.h, z8.h                                \n"
+    "  mla z9.h, p0/m, z9.h, z9.h                                \n"
+    "  mla z10.h, p0/m, z10.h, z10.h                             \n"
+    "  mla z11.h, p0/m, z11.h, z11.h                             \n"
+    "  mla z12.h, p0/m, z12.h, z12.h                             \n"
+    "  mla z13.h, p0/m, z13.h, z13.h                             \n"
+    "  mla z14.h, p0/m, z14.h, z14.h                             \n"
+    "  mla z15.h, p0/m, z15.h, z15.h                             \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 64.0*16.0*(double)n_iterations;
+}
+
+
+double mla_i16_i16_p75_ilp2(const void* args) {
+  // MLA (I16, one vector), 75% active lanes, Multiply-Accumulate (integer)
+  //
+  // Each instruction: (32x i16, 32x i16) → 24 of 32x i16 (48 OPs)
+  // Total of 96 OPs per loop iteration, ILP = 2
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #24                                                \n"
+    "whilelt p0.h, xzr, x24                                      \n"
+    "1:                                                          \n"
+    "  mla z0.h, p0/m, z0.h, z0.h                                \n"
+    "  mla z1.h, p0/m, z1.h, z1.h                                \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 48.0*2.0*(double)n_iterations;
+}
+
+
+double mla_i16_i16_p75_ilp9(const void* args) {
+  // MLA (I16, one vector), 75% active lanes, Multiply-Accumulate (integer)
+  //
+  // Each instruction: (32x i16, 32x i16) → 24 of 32x i16 (48 OPs)
+  // Total of 432 OPs per loop iteration, ILP = 9
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #24                                                \n"
+    "whilelt p0.h, xzr, x24                                      \n"
+    "1:                                                          \n"
+    "  mla z0.h, p0/m, z0.h, z0.h                                \n"
+    "  mla z1.h, p0/m, z1.h, z1.h                                \n"
+    "  mla z2.h, p0/m, z2.h, z2.h                                \n"
+    "  mla z3.h, p0/m, z3.h, z3.h                                \n"
+    "  mla z4.h, p0/m, z4.h, z4.h                                \n"
+    "  mla z5.h, p0/m, z5.h, z5.h                                \n"
+    "  mla z6.h, p0/m, z6.h, z6.h                                \n"
+    "  mla z7.h, p0/m, z7.h, z7.h                                \n"
+    "  mla z8.h, p0/m, z8.h, z8.h                                \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 48.0*9.0*(double)n_iterations;
+}
+
+
+double mla_i16_i16_p75_ilp14(const void* args) {
+  // MLA (I16, one vector), 75% active lanes, Multiply-Accumulate (integer)
+  //
+  // Each instruction: (32x i16, 32x i16) → 24 of 32x i16 (48 OPs)
+  // Total of 672 OPs per loop iteration, ILP = 14
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #24                                                \n"
+    "whilelt p0.h, xzr, x24                                      \n"
+    "1:                                                          \n"
+    "  mla z0.h, p0/m, z0.h, z0.h                                \n"
+    "  mla z1.h, p0/m, z1.h, z1.h                                \n"
+    "  mla z2.h, p0/m, z2.h, z2.h                                \n"
+    "  mla z3.h, p0/m, z3.h, z3.h                                \n"
+    "  mla z4.h, p0/m, z4.h, z4.h                                \n"
+    "  mla z5.h, p0/m, z5.h, z5.h                                \n"
+    "  mla z6.h, p0/m, z6.h, z6.h                                \n"
+    "  mla z7.h, p0/m, z7.h, z7.h                                \n"
+    "  mla z8.h, p0/m, z8.h, z8.h                                \n"
+    "  mla z9.h, p0/m, z9.h, z9.h                                \n"
+    "  mla z10.h, p0/m, z10.h, z10.h                             \n"
+    "  mla z11.h, p0/m, z11.h, z11.h                             \n"
+    "  mla z12.h, p0/m, z12.h, z12.h                             \n"
+    "  mla z13.h, p0/m, z13.h, z13.h                             \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 48.0*14.0*(double)n_iterations;
+}
+
+
+double mla_i16_i16_p50_ilp1(const void* args) {
+  // MLA (I16, one vector), 50% active lanes, Multiply-Accumulate (integer)
+  //
+  // Each instruction: (32x i16, 32x i16) → 16 of 32x i16 (32 OPs)
+  // Total of 32 OPs per loop iteration, ILP = 1
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #16                                                \n"
+    "whilelt p0.h, xzr, x24                                      \n"
+    "1:                                                          \n"
+    "  mla z0.h, p0/m, z0.h, z0.h                                \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 32.0*1.0*(double)n_iterations;
+}
+
+
+double mla_i16_i16_p25_ilp7(const void* args) {
+  // MLA (I16, one vector), 25% active lanes, Multiply-Accumulate (integer)
+  //
+  // Each instruction: (32x i16, 32x i16) → 8 of 32x i16 (16 OPs)
+  // Total of 112 OPs per loop iteration, ILP = 7
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #8                                                 \n"
+    "whilelt p0.h, xzr, x24                                      \n"
+    "1:                                                          \n"
+    "  mla z0.h, p0/m, z0.h, z0.h                                \n"
+    "  mla z1.h, p0/m, z1.h, z1.h                                \n"
+    "  mla z2.h, p0/m, z2.h, z2.h                                \n"
+    "  mla z3.h, p0/m, z3.h, z3.h                                \n"
+    "  mla z4.h, p0/m, z4.h, z4.h                                \n"
+    "  mla z5.h, p0/m, z5.h, z5.h                                \n"
+    "  mla z6.h, p0/m, z6.h, z6.h                                \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 16.0*7.0*(double)n_iterations;
+}
+
+
+double mla_i16_i16_p25_ilp16(const void* args) {
+  // MLA (I16, one vector), 25% active lanes, Multiply-Accumulate (integer)
+  //
+  // Each instruction: (32x i16, 32x i16) → 8 of 32x i16 (16 OPs)
+  // Total of 256 OPs per loop iteration, ILP = 16
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #8                                                 \n"
+    "whilelt p0.h, xzr, x24                                      \n"
+    "1:                                                          \n"
+    "  mla z0.h, p0/m, z0.h, z0.h                                \n"
+    "  mla z1.h, p0/m, z1.h, z1.h                                \n"
+    "  mla z2.h, p0/m, z2.h, z2.h                                \n"
+    "  mla z3.h, p0/m, z3.h, z3.h                                \n"
+    "  mla z4.h, p0/m, z4.h, z4.h                                \n"
+    "  mla z5.h, p0/m, z5.h, z5.h                                \n"
+    "  mla z6.h, p0/m, z6.h, z6.h                                \n"
+    "  mla z7.h, p0/m, z7.h, z7.h                                \n"
+    "  mla z8.h, p0/m, z8.h, z8.h                                \n"
+    "  mla z9.h, p0/m, z9.h, z9.h                                \n"
+    "  mla z10.h, p0/m, z10.h, z10.h                             \n"
+    "  mla z11.h, p0/m, z11.h, z11.h                             \n"
+    "  mla z12.h, p0/m, z12.h, z12.h                             \n"
+    "  mla z13.h, p0/m, z13.h, z13.h                             \n"
+    "  mla z14.h, p0/m, z14.h, z14.h                             \n"
+    "  mla z15.h, p0/m, z15.h, z15.h                             \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 16.0*16.0*(double)n_iterations;
+}
+
+
+double mla_i32_i32_ilp1(const void* args) {
+  // MLA (I32, one vector), Multiply-Accumulate (integer)
+  //
+  // Each instruction: (16x i32, 16x i32) → 16x i32 (32 OPs)
+  // Total of 32 OPs per loop iteration, ILP = 1
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "ptrue p0.s                                                  \n"
+    "1:                                                          \n"
+    "  mla z0.s, p0/m, z0.s, z0.s                                \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 32.0*1.0*(double)n_iterations;
+}
+
+
+double mla_i32_i32_ilp11(const void* args) {
+  // MLA (I32, one vector), Multiply-Accumulate (integer)
+  //
+  // Each instruction: (16x i32, 16x i32) → 16x i32 (32 OPs)
+  // Total of 352 OPs per loop iteration, ILP = 11
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "ptrue p0.s                                                  \n"
+    "1:                                                          \n"
+    "  mla z0.s, p0/m, z0.s, z0.s                                \n"
+    "  mla z1.s, p0/m, z1.s, z1.s                                \n"
+    "  mla z2.s, p0/m, z2.s, z2.s                                \n"
+    "  mla z3.s, p0/m, z3.s, z3.s                                \n"
+    "  mla z4.s, p0/m, z4.s, z4.s                                \n"
+    "  mla z5.s, p0/m, z5.s, z5.s                                \n"
+    "  mla z6.s, p0/m, z6.s, z6.s                                \n"
+    "  mla z7.s, p0/m, z7.s, z7.s                                \n"
+    "  mla z8.s, p0/m, z8.s, z8.s                                \n"
+    "  mla z9.s, p0/m, z9.s, z9.s                                \n"
+    "  mla z10.s, p0/m, z10.s, z10.s                             \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 32.0*11.0*(double)n_iterations;
+}
+
+
+double mla_i32_i32_p75_ilp6(const void* args) {
+  // MLA (I32, one vector), 75% active lanes, Multiply-Accumulate (integer)
+  //
+  // Each instruction: (16x i32, 16x i32) → 12 of 16x i32 (24 OPs)
+  // Total of 144 OPs per loop iteration, ILP = 6
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #12                                                \n"
+    "whilelt p0.s, xzr, x24                                      \n"
+    "1:                                                          \n"
+    "  mla z0.s, p0/m, z0.s, z0.s                                \n"
+    "  mla z1.s, p0/m, z1.s, z1.s                                \n"
+    "  mla z2.s, p0/m, z2.s, z2.s                                \n"
+    "  mla z3.s, p0/m, z3.s, z3.s                                \n"
+    "  mla z4.s, p0/m, z4.s, z4.s                                \n"
+    "  mla z5.s, p0/m, z5.s, z5.s                                \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 24.0*6.0*(double)n_iterations;
+}
+
+
+double mla_i32_i32_p75_ilp12(const void* args) {
+  // MLA (I32, one vector), 75% active lanes, Multiply-Accumulate (integer)
+  //
+  // Each instruction: (16x i32, 16x i32) → 12 of 16x i32 (24 OPs)
+  // Total of 288 OPs per loop iteration, ILP = 12
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #12                                                \n"
+    "whilelt p0.s, xzr, x24                                      \n"
+    "1:                                                          \n"
+    "  mla z0.s, p0/m, z0.s, z0.s                                \n"
+    "  mla z1.s, p0/m, z1.s, z1.s                                \n"
+    "  mla z2.s, p0/m, z2.s, z2.s                                \n"
+    "  mla z3.s, p0/m, z3.s, z3.s                                \n"
+    "  mla z4.s, p0/m, z4.s, z4.s                                \n"
+    "  mla z5.s, p0/m, z5.s, z5.s                                \n"
+    "  mla z6.s, p0/m, z6.s, z6.s                                \n"
+    "  mla z7.s, p0/m, z7.s, z7.s                                \n"
+    "  mla z8.s, p0/m, z8.s, z8.s                                \n"
+    "  mla z9.s, p0/m, z9.s, z9.s                                \n"
+    "  mla z10.s, p0/m, z10.s, z10.s                             \n"
+    "  mla z11.s, p0/m, z11.s, z11.s                             \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 24.0*12.0*(double)n_iterations;
+}
+
+
+double mla_i32_i32_p50_ilp5(const void* args) {
+  // MLA (I32, one vector), 50% active lanes, Multiply-Accumulate (integer)
+  //
+  // Each instruction: (16x i32, 16x i32) → 8 of 16x i32 (16 OPs)
+  // Total of 80 OPs per loop iteration, ILP = 5
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #8                                                 \n"
+    "whilelt p0.s, xzr, x24                                      \n"
+    "1:                                                          \n"
+    "  mla z0.s, p0/m, z0.s, z0.s                                \n"
+    "  mla z1.s, p0/m, z1.s, z1.s                                \n"
+    "  mla z2.s, p0/m, z2.s, z2.s                                \n"
+    "  mla z3.s, p0/m, z3.s, z3.s                                \n"
+    "  mla z4.s, p0/m, z4.s, z4.s                                \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 16.0*5.0*(double)n_iterations;
+}
+
+
+double mla_i32_i32_p50_ilp11(const void* args) {
+  // MLA (I32, one vector), 50% active lanes, Multiply-Accumulate (integer)
+  //
+  // Each instruction: (16x i32, 16x i32) → 8 of 16x i32 (16 OPs)
+  // Total of 176 OPs per loop iteration, ILP = 11
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #8                                                 \n"
+    "whilelt p0.s, xzr, x24                                      \n"
+    "1:                                                          \n"
+    "  mla z0.s, p0/m, z0.s, z0.s                                \n"
+    "  mla z1.s, p0/m, z1.s, z1.s                                \n"
+    "  mla z2.s, p0/m, z2.s, z2.s                                \n"
+    "  mla z3.s, p0/m, z3.s, z3.s                                \n"
+    "  mla z4.s, p0/m, z4.s, z4.s                                \n"
+    "  mla z5.s, p0/m, z5.s, z5.s                                \n"
+    "  mla z6.s, p0/m, z6.s, z6.s                                \n"
+    "  mla z7.s, p0/m, z7.s, z7.s                                \n"
+    "  mla z8.s, p0/m, z8.s, z8.s                                \n"
+    "  mla z9.s, p0/m, z9.s, z9.s                                \n"
+    "  mla z10.s, p0/m, z10.s, z10.s                             \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 16.0*11.0*(double)n_iterations;
+}
+
+
+double mla_i32_i32_p25_ilp3(const void* args) {
+  // MLA (I32, one vector), 25% active lanes, Multiply-Accumulate (integer)
+  //
+  // Each instruction: (16x i32, 16x i32) → 4 of 16x i32 (8 OPs)
+  // Total of 24 OPs per loop iteration, ILP = 3
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #4                                                 \n"
+    "whilelt p0.s, xzr, x24                                      \n"
+    "1:                                                          \n"
+    "  mla z0.s, p0/m, z0.s, z0.s                                \n"
+    "  mla z1.s, p0/m, z1.s, z1.s                                \n"
+    "  mla z2.s, p0/m, z2.s, z2.s                                \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 8.0*3.0*(double)n_iterations;
+}
+
+
+double mla_i32_i32_p25_ilp8(const void* args) {
+  // MLA (I32, one vector), 25% active lanes, Multiply-Accumulate (integer)
+  //
+  // Each instruction: (16x i32, 16x i32) → 4 of 16x i32 (8 OPs)
+  // Total of 64 OPs per loop iteration, ILP = 8
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #4                                                 \n"
+    "whilelt p0.s, xzr, x24                                      \n"
+    "1:                                                          \n"
+    "  mla z0.s, p0/m, z0.s, z0.s                                \n"
+    "  mla z1.s, p0/m, z1.s, z1.s                                \n"
+    "  mla z2.s, p0/m, z2.s, z2.s                                \n"
+    "  mla z3.s, p0/m, z3.s, z3.s                                \n"
+    "  mla z4.s, p0/m, z4.s, z4.s                                \n"
+    "  mla z5.s, p0/m, z5.s, z5.s                                \n"
+    "  mla z6.s, p0/m, z6.s, z6.s                                \n"
+    "  mla z7.s, p0/m, z7.s, z7.s                                \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 8.0*8.0*(double)n_iterations;
+}
+
+
+double mla_i32_i32_p25_ilp10(const void* args) {
+  // MLA (I32, one vector), 25% active lanes, Multiply-Accumulate (integer)
+  //
+  // Each instruction: (16x i32, 16x i32) → 4 of 16x i32 (8 OPs)
+  // Total of 80 OPs per loop iteration, ILP = 10
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #4                                                 \n"
+    "whilelt p0.s, xzr, x24                                      \n"
+    "1:                                                          \n"
+    "  mla z0.s, p0/m, z0.s, z0.s                                \n"
+    "  mla z1.s, p0/m, z1.s, z1.s                                \n"
+    "  mla z2.s, p0/m, z2.s, z2.s                                \n"
+    "  mla z3.s, p0/m, z3.s, z3.s                                \n"
+    "  mla z4.s, p0/m, z4.s, z4.s                                \n"
+    "  mla z5.s, p0/m, z5.s, z5.s                                \n"
+    "  mla z6.s, p0/m, z6.s, z6.s                                \n"
+    "  mla z7.s, p0/m, z7.s, z7.s                                \n"
+    "  mla z8.s, p0/m, z8.s, z8.s                                \n"
+    "  mla z9.s, p0/m, z9.s, z9.s                                \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 8.0*10.0*(double)n_iterations;
+}
+
+
+double mla_i64_i64_ilp4(const void* args) {
+  // MLA (I64, one vector), Multiply-Accumulate (integer)
+  //
+  // Each instruction: (8x i64, 8x i64) → 8x i64 (16 OPs)
+  // Total of 64 OPs per loop iteration, ILP = 4
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "ptrue p0.d                                                  \n"
+    "1:                                                          \n"
+    "  mla z0.d, p0/m, z0.d, z0.d                                \n"
+    "  mla z1.d, p0/m, z1.d, z1.d                                \n"
+    "  mla z2.d, p0/m, z2.d, z2.d                                \n"
+    "  mla z3.d, p0/m, z3.d, z3.d                                \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 16.0*4.0*(double)n_iterations;
+}
+
+
+double mla_i64_i64_p75_ilp6(const void* args) {
+  // MLA (I64, one vector), 75% active lanes, Multiply-Accumulate (integer)
+  //
+  // Each instruction: (8x i64, 8x i64) → 6 of 8x i64 (12 OPs)
+  // Total of 72 OPs per loop iteration, ILP = 6
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #6                                                 \n"
+    "whilelt p0.d, xzr, x24                                      \n"
+    "1:                                                          \n"
+    "  mla z0.d, p0/m, z0.d, z0.d                                \n"
+    "  mla z1.d, p0/m, z1.d, z1.d                                \n"
+    "  mla z2.d, p0/m, z2.d, z2.d                                \n"
+    "  mla z3.d, p0/m, z3.d, z3.d                                \n"
+    "  mla z4.d, p0/m, z4.d, z4.d                                \n"
+    "  mla z5.d, p0/m, z5.d, z5.d                                \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 12.0*6.0*(double)n_iterations;
+}
+
+
+double mla_i64_i64_p50_ilp5(const void* args) {
+  // MLA (I64, one vector), 50% active lanes, Multiply-Accumulate (integer)
+  //
+  // Each instruction: (8x i64, 8x i64) → 4 of 8x i64 (8 OPs)
+  // Total of 40 OPs per loop iteration, ILP = 5
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #4                                                 \n"
+    "whilelt p0.d, xzr, x24                                      \n"
+    "1:                                                          \n"
+    "  mla z0.d, p0/m, z0.d, z0.d                                \n"
+    "  mla z1.d, p0/m, z1.d, z1.d                                \n"
+    "  mla z2.d, p0/m, z2.d, z2.d                                \n"
+    "  mla z3.d, p0/m, z3.d, z3.d                                \n"
+    "  mla z4.d, p0/m, z4.d, z4.d                                \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 8.0*5.0*(double)n_iterations;
+}
+
+
+double mla_i64_i64_p50_ilp14(const void* args) {
+  // MLA (I64, one vector), 50% active lanes, Multiply-Accumulate (integer)
+  //
+  // Each instruction: (8x i64, 8x i64) → 4 of 8x i64 (8 OPs)
+  // Total of 112 OPs per loop iteration, ILP = 14
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #4                                                 \n"
+    "whilelt p0.d, xzr, x24                                      \n"
+    "1:                                                          \n"
+    "  mla z0.d, p0/m, z0.d, z0.d                                \n"
+    "  mla z1.d, p0/m, z1.d, z1.d                                \n"
+    "  mla z2.d, p0/m, z2.d, z2.d                                \n"
+    "  mla z3.d, p0/m, z3.d, z3.d                                \n"
+    "  mla z4.d, p0/m, z4.d, z4.d                                \n"
+    "  mla z5.d, p0/m, z5.d, z5.d                                \n"
+    "  mla z6.d, p0/m, z6.d, z6.d                                \n"
+    "  mla z7.d, p0/m, z7.d, z7.d                                \n"
+    "  mla z8.d, p0/m, z8.d, z8.d                                \n"
+    "  mla z9.d, p0/m, z9.d, z9.d                                \n"
+    "  mla z10.d, p0/m, z10.d, z10.d                             \n"
+    "  mla z11.d, p0/m, z11.d, z11.d                             \n"
+    "  mla z12.d, p0/m, z12.d, z12.d                             \n"
+    "  mla z13.d, p0/m, z13.d, z13.d                             \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 8.0*14.0*(double)n_iterations;
+}
+
+
+double mla_i64_i64_p25_ilp3(const void* args) {
+  // MLA (I64, one vector), 25% active lanes, Multiply-Accumulate (integer)
+  //
+  // Each instruction: (8x i64, 8x i64) → 2 of 8x i64 (4 OPs)
+  // Total of 12 OPs per loop iteration, ILP = 3
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #2                                                 \n"
+    "whilelt p0.d, xzr, x24                                      \n"
+    "1:                                                          \n"
+    "  mla z0.d, p0/m, z0.d, z0.d                                \n"
+    "  mla z1.d, p0/m, z1.d, z1.d                                \n"
+    "  mla z2.d, p0/m, z2.d, z2.d                                \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 4.0*3.0*(double)n_iterations;
+}
+
+
+double mla_i64_i64_p25_ilp8(const void* args) {
+  // MLA (I64, one vector), 25% active lanes, Multiply-Accumulate (integer)
+  //
+  // Each instruction: (8x i64, 8x i64) → 2 of 8x i64 (4 OPs)
+  // Total of 32 OPs per loop iteration, ILP = 8
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #2                                                 \n"
+    "whilelt p0.d, xzr, x24                                      \n"
+    "1:                                                          \n"
+    "  mla z0.d, p0/m, z0.d, z0.d                                \n"
+    "  mla z1.d, p0/m, z1.d, z1.d                                \n"
+    "  mla z2.d, p0/m, z2.d, z2.d                                \n"
+    "  mla z3.d, p0/m, z3.d, z3.d                                \n"
+    "  mla z4.d, p0/m, z4.d, z4.d                                \n"
+    "  mla z5.d, p0/m, z5.d, z5.d                                \n"
+    "  mla z6.d, p0/m, z6.d, z6.d                                \n"
+    "  mla z7.d, p0/m, z7.d, z7.d                                \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 4.0*8.0*(double)n_iterations;
+}
+
+
+double mla_i64_i64_p25_ilp15(const void* args) {
+  // MLA (I64, one vector), 25% active lanes, Multiply-Accumulate (integer)
+  //
+  // Each instruction: (8x i64, 8x i64) → 2 of 8x i64 (4 OPs)
+  // Total of 60 OPs per loop iteration, ILP = 15
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #2                                                 \n"
+    "whilelt p0.d, xzr, x24                                      \n"
+    "1:                                                          \n"
+    "  mla z0.d, p0/m, z0.d, z0.d                                \n"
+    "  mla z1.d, p0/m, z1.d, z1.d                                \n"
+    "  mla z2.d, p0/m, z2.d, z2.d                                \n"
+    "  mla z3.d, p0/m, z3.d, z3.d                                \n"
+    "  mla z4.d, p0/m, z4.d, z4.d                                \n"
+    "  mla z5.d, p0/m, z5.d, z5.d                                \n"
+    "  mla z6.d, p0/m, z6.d, z6.d                                \n"
+    "  mla z7.d, p0/m, z7.d, z7.d                                \n"
+    "  mla z8.d, p0/m, z8.d, z8.d                                \n"
+    "  mla z9.d, p0/m, z9.d, z9.d                                \n"
+    "  mla z10.d, p0/m, z10.d, z10.d                             \n"
+    "  mla z11.d, p0/m, z11.d, z11.d                             \n"
+    "  mla z12.d, p0/m, z12.d, z12.d                             \n"
+    "  mla z13.d, p0/m, z13.d, z13.d                             \n"
+    "  mla z14.d, p0/m, z14.d, z14.d                             \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 4.0*15.0*(double)n_iterations;
+}
+
+
+double smlal_za_i32_i16_vgx2_ilp5(const void* args) {
+  // SMLAL (I16 to I32, two vectors), Multiply-Accumulate (integer)
+  //
+  // Each instruction: (64x i16, 64x i16) → 64x i32 (128 OPs)
+  // Total of 640 OPs per loop iteration, ILP = 5
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  smlal za.s[w8, 0:1, VGx2], {z0.h-z1.h}, {z0.h-z1.h}       \n"
+    "  smlal za.s[w8, 2:3, VGx2], {z0.h-z1.h}, {z0.h-z1.h}       \n"
+    "  smlal za.s[w8, 4:5, VGx2], {z2.h-z3.h}, {z2.h-z3.h}       \n"
+    "  smlal za.s[w8, 6:7, VGx2], {z2.h-z3.h}, {z2.h-z3.h}       \n"
+    "  smlal za.s[w9, 0:1, VGx2], {z4.h-z5.h}, {z4.h-z5.h}       \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 128.0*5.0*(double)n_iterations;
+}
+
+
+double smlal_za_i32_i16_vgx2_ilp11(const void* args) {
+  // SMLAL (I16 to I32, two vectors), Multiply-Accumulate (integer)
+  //
+  // Each instruction: (64x i16, 64x i16) → 64x i32 (128 OPs)
+  // Total of 1408 OPs per loop iteration, ILP = 11
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  smlal za.s[w8, 0:1, VGx2], {z0.h-z1.h}, {z0.h-z1.h}       \n"
+    "  smlal za.s[w8, 2:3, VGx2], {z0.h-z1.h}, {z0.h-z1.h}       \n"
+    "  smlal za.s[w8, 4:5, VGx2], {z2.h-z3.h}, {z2.h-z3.h}       \n"
+    "  smlal za.s[w8, 6:7, VGx2], {z2.h-z3.h}, {z2.h-z3.h}       \n"
+    "  smlal za.s[w9, 0:1, VGx2], {z4.h-z5.h}, {z4.h-z5.h}       \n"
+    "  smlal za.s[w9, 2:3, VGx2], {z4.h-z5.h}, {z4.h-z5.h}       \n"
+    "  smlal za.s[w9, 4:5, VGx2], {z6.h-z7.h}, {z6.h-z7.h}       \n"
+    "  smlal za.s[w9, 6:7, VGx2], {z6.h-z7.h}, {z6.h-z7.h}       \n"
+    "  smlal za.s[w10, 0:1, VGx2], {z8.h-z9.h}, {z8.h-z9.h}      \n"
+    "  smlal za.s[w10, 2:3, VGx2], {z8.h-z9.h}, {z8.h-z9.h}      \n"
+    "  smlal za.s[w10, 4:5, VGx2], {z10.h-z11.h}, {z10.h-z11.h}  \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 128.0*11.0*(double)n_iterations;
+}
+
+
+double smlal_za_i32_i16_vgx2_chain8_ilp2(const void* args) {
+  // SMLAL (I16 to I32, two vectors), Multiply-Accumulate (integer)
+  //
+  // Each instruction: (64x i16, 64x i16) → 64x i32 (128 OPs)
+  // Total of 2048 OPs per loop iteration, 2 interleaved dependent chains of 8 instructions
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  smlal za.s[w8, 0:1, VGx2], {z0.h-z1.h}, {z0.h-z1.h}       \n"
+    "  smlal za.s[w8, 2:3, VGx2], {z0.h-z1.h}, {z0.h-z1.h}       \n"
+    "  smlal za.s[w8, 0:1, VGx2], {z0.h-z1.h}, {z0.h-z1.h}       \n"
+    "  smlal za.s[w8, 2:3, VGx2], {z0.h-z1.h}, {z0.h-z1.h}       \n"
+    "  smlal za.s[w8, 0:1, VGx2], {z0.h-z1.h}, {z0.h-z1.h}       \n"
+    "  smlal za.s[w8, 2:3, VGx2], {z0.h-z1.h}, {z0.h-z1.h}       \n"
+    "  smlal za.s[w8, 0:1, VGx2], {z0.h-z1.h}, {z0.h-z1.h}       \n"
+    "  smlal za.s[w8, 2:3, VGx2], {z0.h-z1.h}, {z0.h-z1.h}       \n"
+    "  smlal za.s[w8, 0:1, VGx2], {z0.h-z1.h}, {z0.h-z1.h}       \n"
+    "  smlal za.s[w8, 2:3, VGx2], {z0.h-z1.h}, {z0.h-z1.h}       \n"
+    "  smlal za.s[w8, 0:1, VGx2], {z0.h-z1.h}, {z0.h-z1.h}       \n"
+    "  smlal za.s[w8, 2:3, VGx2], {z0.h-z1.h}, {z0.h-z1.h}       \n"
+    "  smlal za.s[w8, 0:1, VGx2], {z0.h-z1.h}, {z0.h-z1.h}       \n"
+    "  smlal za.s[w8, 2:3, VGx2], {z0.h-z1.h}, {z0.h-z1.h}       \n"
+    "  smlal za.s[w8, 0:1, VGx2], {z0.h-z1.h}, {z0.h-z1.h}       \n"
+    "  smlal za.s[w8, 2:3, VGx2], {z0.h-z1.h}, {z0.h-z1.h}       \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 128.0*16.0*(double)n_iterations;
+}
+
+
+double smlal_za_i32_i16_vgx4_ilp3(const void* args) {
+  // SMLAL (I16 to I32, four vectors), Multiply-Accumulate (integer)
+  //
+  // Each instruction: (128x i16, 128x i16) → 128x i32 (256 OPs)
+  // Total of 768 OPs per loop iteration, ILP = 3
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  smlal za.s[w8, 0:1, VGx4], {z0.h-z3.h}, {z0.h-z3.h}       \n"
+    "  smlal za.s[w8, 2:3, VGx4], {z0.h-z3.h}, {z0.h-z3.h}       \n"
+    "  smlal za.s[w8, 4:5, VGx4], {z0.h-z3.h}, {z0.h-z3.h}       \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 256.0*3.0*(double)n_iterations;
+}
+
+
+double smlal_za_i32_i16_vgx4_ilp8(const void* args) {
+  // SMLAL (I16 to I32, four vectors), Multiply-Accumulate (integer)
+  //
+  // Each instruction: (128x i16, 128x i16) → 128x i32 (256 OPs)
+  // Total of 2048 OPs per loop iteration, ILP = 8
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  smlal za.s[w8, 0:1, VGx4], {z0.h-z3.h}, {z0.h-z3.h}       \n"
+    "  smlal za.s[w8, 2:3, VGx4], {z0.h-z3.h}, {z0.h-z3.h}       \n"
+    "  smlal za.s[w8, 4:5, VGx4], {z0.h-z3.h}, {z0.h-z3.h}       \n"
+    "  smlal za.s[w8, 6:7, VGx4], {z0.h-z3.h}, {z0.h-z3.h}       \n"
+    "  smlal za.s[w9, 0:1, VGx4], {z4.h-z7.h}, {z4.h-z7.h}       \n"
+    "  smlal za.s[w9, 2:3, VGx4], {z4.h-z7.h}, {z4.h-z7.h}       \n"
+    "  smlal za.s[w9, 4:5, VGx4], {z4.h-z7.h}, {z4.h-z7.h}       \n"
+    "  smlal za.s[w9, 6:7, VGx4], {z4.h-z7.h}, {z4.h-z7.h}       \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 256.0*8.0*(double)n_iterations;
+}
+
+
+double smlall_za_i32_i8_vgx4_chain8_ilp2(const void* args) {
+  // SMLALL (I8 to I32, four vectors), Multiply-Accumulate (integer)
+  //
+  // Each instruction: (256x i8, 256x i8) → 256x i32 (512 OPs)
+  // Total of 8192 OPs per loop iteration, 2 interleaved dependent chains of 8 instructions
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  smlall za.s[w8, 0:3, VGx4], {z0.b-z3.b}, {z0.b-z3.b}      \n"
+    "  smlall za.s[w8, 4:7, VGx4], {z0.b-z3.b}, {z0.b-z3.b}      \n"
+    "  smlall za.s[w8, 0:3, VGx4], {z0.b-z3.b}, {z0.b-z3.b}      \n"
+    "  smlall za.s[w8, 4:7, VGx4], {z0.b-z3.b}, {z0.b-z3.b}      \n"
+    "  smlall za.s[w8, 0:3, VGx4], {z0.b-z3.b}, {z0.b-z3.b}      \n"
+    "  smlall za.s[w8, 4:7, VGx4], {z0.b-z3.b}, {z0.b-z3.b}      \n"
+    "  smlall za.s[w8, 0:3, VGx4], {z0.b-z3.b}, {z0.b-z3.b}      \n"
+    "  smlall za.s[w8, 4:7, VGx4], {z0.b-z3.b}, {z0.b-z3.b}      \n"
+    "  smlall za.s[w8, 0:3, VGx4], {z0.b-z3.b}, {z0.b-z3.b}      \n"
+    "  smlall za.s[w8, 4:7, VGx4], {z0.b-z3.b}, {z0.b-z3.b}      \n"
+    "  smlall za.s[w8, 0:3, VGx4], {z0.b-z3.b}, {z0.b-z3.b}      \n"
+    "  smlall za.s[w8, 4:7, VGx4], {z0.b-z3.b}, {z0.b-z3.b}      \n"
+    "  smlall za.s[w8, 0:3, VGx4], {z0.b-z3.b}, {z0.b-z3.b}      \n"
+    "  smlall za.s[w8, 4:7, VGx4], {z0.b-z3.b}, {z0.b-z3.b}      \n"
+    "  smlall za.s[w8, 0:3, VGx4], {z0.b-z3.b}, {z0.b-z3.b}      \n"
+    "  smlall za.s[w8, 4:7, VGx4], {z0.b-z3.b}, {z0.b-z3.b}      \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 512.0*16.0*(double)n_iterations;
+}
+
+
+double smlall_za_i64_i16_vgx2_ilp5(const void* args) {
+  // SMLALL (I16 to I64, two vectors), Multiply-Accumulate (integer)
+  //
+  // Each instruction: (64x i16, 64x i16) → 64x i64 (128 OPs)
+  // Total of 640 OPs per loop iteration, ILP = 5
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  smlall za.d[w8, 0:3, VGx2], {z0.h-z1.h}, {z0.h-z1.h}      \n"
+    "  smlall za.d[w8, 4:7, VGx2], {z0.h-z1.h}, {z0.h-z1.h}      \n"
+    "  smlall za.d[w9, 0:3, VGx2], {z2.h-z3.h}, {z2.h-z3.h}      \n"
+    "  smlall za.d[w9, 4:7, VGx2], {z2.h-z3.h}, {z2.h-z3.h}      \n"
+    "  smlall za.d[w10, 0:3, VGx2], {z4.h-z5.h}, {z4.h-z5.h}     \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 128.0*5.0*(double)n_iterations;
+}
+
+
+double smlall_za_i64_i16_vgx4_ilp3(const void* args) {
+  // SMLALL (I16 to I64, four vectors), Multiply-Accumulate (integer)
+  //
+  // Each instruction: (128x i16, 128x i16) → 128x i64 (256 OPs)
+  // Total of 768 OPs per loop iteration, ILP = 3
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x8, #0                                                  \n"
+    "mov x9, #8                                                  \n"
+    "mov x10, #16                                                \n"
+    "mov x11, #24                                                \n"
+    "1:                                                          \n"
+    "  smlall za.d[w8, 0:3, VGx4], {z0.h-z3.h}, {z0.h-z3.h}      \n"
+    "  smlall za.d[w8, 4:7, VGx4], {z0.h-z3.h}, {z0.h-z3.h}      \n"
+    "  smlall za.d[w9, 0:3, VGx4], {z0.h-z3.h}, {z0.h-z3.h}      \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x8", "x9", "x10", "x11"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 256.0*3.0*(double)n_iterations;
+}
+
+
+double fmopa_za_f16_f16_ilp2(const void* args) {
+  // FMOPA (FP16), Outer Product (floating-point)
+  //
+  // Each instruction: (32x f16, 32x f16) → 1024x f16 (2048 OPs)
+  // Total of 4096 OPs per loop iteration, ILP = 2
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "ptrue p0.h                                                  \n"
+    "ptrue p1.h                                                  \n"
+    "1:                                                          \n"
+    "  fmopa za0.h, p0/m, p1/m, z0.h, z0.h                       \n"
+    "  fmopa za1.h, p0/m, p1/m, z1.h, z1.h                       \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 2048.0*2.0*(double)n_iterations;
+}
+
+
+double fmopa_za_f16_f16_chain8_ilp1(const void* args) {
+  // FMOPA (FP16), Outer Product (floating-point)
+  //
+  // Each instruction: (32x f16, 32x f16) → 1024x f16 (2048 OPs)
+  // Total of 16384 OPs per loop iteration, 1 interleaved dependent chains of 8 instructions
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "ptrue p0.h                                                  \n"
+    "ptrue p1.h                                                  \n"
+    "1:                                                          \n"
+    "  fmopa za0.h, p0/m, p1/m, z0.h, z0.h                       \n"
+    "  fmopa za0.h, p0/m, p1/m, z0.h, z0.h                       \n"
+    "  fmopa za0.h, p0/m, p1/m, z0.h, z0.h                       \n"
+    "  fmopa za0.h, p0/m, p1/m, z0.h, z0.h                       \n"
+    "  fmopa za0.h, p0/m, p1/m, z0.h, z0.h                       \n"
+    "  fmopa za0.h, p0/m, p1/m, z0.h, z0.h                       \n"
+    "  fmopa za0.h, p0/m, p1/m, z0.h, z0.h                       \n"
+    "  fmopa za0.h, p0/m, p1/m, z0.h, z0.h                       \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 2048.0*8.0*(double)n_iterations;
+}
+
+
+double fmopa_za_f16_f16_p75_ilp1(const void* args) {
+  // FMOPA (FP16), 75% active lanes, Outer Product (floating-point)
+  //
+  // Each instruction: (32x f16, 32x f16) → 576 of 1024x f16 (1152 OPs)
+  // Total of 1152 OPs per loop iteration, ILP = 1
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #24                                                \n"
+    "whilelt p0.h, xzr, x24                                      \n"
+    "mov x25, #24                                                \n"
+    "whilelt p1.h, xzr, x25                                      \n"
+    "1:                                                          \n"
+    "  fmopa za0.h, p0/m, p1/m, z0.h, z0.h                       \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24", "x25"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 1152.0*1.0*(double)n_iterations;
+}
+
+
+double fmopa_za_f16_f16_p50_ilp2(const void* args) {
+  // FMOPA (FP16), 50% active lanes, Outer Product (floating-point)
+  //
+  // Each instruction: (32x f16, 32x f16) → 256 of 1024x f16 (512 OPs)
+  // Total of 1024 OPs per loop iteration, ILP = 2
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #16                                                \n"
+    "whilelt p0.h, xzr, x24                                      \n"
+    "mov x25, #16                                                \n"
+    "whilelt p1.h, xzr, x25                                      \n"
+    "1:                                                          \n"
+    "  fmopa za0.h, p0/m, p1/m, z0.h, z0.h                       \n"
+    "  fmopa za1.h, p0/m, p1/m, z1.h, z1.h                       \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24", "x25"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 512.0*2.0*(double)n_iterations;
+}
+
+
+double fmopa_za_f64_f64_ilp5(const void* args) {
+  // FMOPA (FP64), Outer Product (floating-point)
+  //
+  // Each instruction: (8x f64, 8x f64) → 64x f64 (128 OPs)
+  // Total of 640 OPs per loop iteration, ILP = 5
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "ptrue p0.d                                                  \n"
+    "ptrue p1.d                                                  \n"
+    "1:                                                          \n"
+    "  fmopa za0.d, p0/m, p1/m, z0.d, z0.d                       \n"
+    "  fmopa za1.d, p0/m, p1/m, z1.d, z1.d                       \n"
+    "  fmopa za2.d, p0/m, p1/m, z2.d, z2.d                       \n"
+    "  fmopa za3.d, p0/m, p1/m, z3.d, z3.d                       \n"
+    "  fmopa za4.d, p0/m, p1/m, z4.d, z4.d                       \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 128.0*5.0*(double)n_iterations;
+}
+
+
+double fmopa_za_f64_f64_chain8_ilp1(const void* args) {
+  // FMOPA (FP64), Outer Product (floating-point)
+  //
+  // Each instruction: (8x f64, 8x f64) → 64x f64 (128 OPs)
+  // Total of 1024 OPs per loop iteration, 1 interleaved dependent chains of 8 instructions
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "ptrue p0.d                                                  \n"
+    "ptrue p1.d                                                  \n"
+    "1:                                                          \n"
+    "  fmopa za0.d, p0/m, p1/m, z0.d, z0.d                       \n"
+    "  fmopa za0.d, p0/m, p1/m, z0.d, z0.d                       \n"
+    "  fmopa za0.d, p0/m, p1/m, z0.d, z0.d                       \n"
+    "  fmopa za0.d, p0/m, p1/m, z0.d, z0.d                       \n"
+    "  fmopa za0.d, p0/m, p1/m, z0.d, z0.d                       \n"
+    "  fmopa za0.d, p0/m, p1/m, z0.d, z0.d                       \n"
+    "  fmopa za0.d, p0/m, p1/m, z0.d, z0.d                       \n"
+    "  fmopa za0.d, p0/m, p1/m, z0.d, z0.d                       \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 128.0*8.0*(double)n_iterations;
+}
+
+
+double fmopa_za_f64_f64_p75_ilp5(const void* args) {
+  // FMOPA (FP64), 75% active lanes, Outer Product (floating-point)
+  //
+  // Each instruction: (8x f64, 8x f64) → 36 of 64x f64 (72 OPs)
+  // Total of 360 OPs per loop iteration, ILP = 5
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #6                                                 \n"
+    "whilelt p0.d, xzr, x24                                      \n"
+    "mov x25, #6                                                 \n"
+    "whilelt p1.d, xzr, x25                                      \n"
+    "1:                                                          \n"
+    "  fmopa za0.d, p0/m, p1/m, z0.d, z0.d                       \n"
+    "  fmopa za1.d, p0/m, p1/m, z1.d, z1.d                       \n"
+    "  fmopa za2.d, p0/m, p1/m, z2.d, z2.d                       \n"
+    "  fmopa za3.d, p0/m, p1/m, z3.d, z3.d                       \n"
+    "  fmopa za4.d, p0/m, p1/m, z4.d, z4.d                       \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24", "x25"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 72.0*5.0*(double)n_iterations;
+}
+
+
+double fmopa_za_f64_f64_p50_ilp6(const void* args) {
+  // FMOPA (FP64), 50% active lanes, Outer Product (floating-point)
+  //
+  // Each instruction: (8x f64, 8x f64) → 16 of 64x f64 (32 OPs)
+  // Total of 192 OPs per loop iteration, ILP = 6
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #4                                                 \n"
+    "whilelt p0.d, xzr, x24                                      \n"
+    "mov x25, #4                                                 \n"
+    "whilelt p1.d, xzr, x25                                      \n"
+    "1:                                                          \n"
+    "  fmopa za0.d, p0/m, p1/m, z0.d, z0.d                       \n"
+    "  fmopa za1.d, p0/m, p1/m, z1.d, z1.d                       \n"
+    "  fmopa za2.d, p0/m, p1/m, z2.d, z2.d                       \n"
+    "  fmopa za3.d, p0/m, p1/m, z3.d, z3.d                       \n"
+    "  fmopa za4.d, p0/m, p1/m, z4.d, z4.d                       \n"
+    "  fmopa za5.d, p0/m, p1/m, z5.d, z5.d                       \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24", "x25"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 32.0*6.0*(double)n_iterations;
+}
+
+
+double fmopa_za_f32_f16_p75_ilp2(const void* args) {
+  // FMOPA (FP16 into FP32, 2-way), 75% active lanes, Outer Product (floating-point)
+  //
+  // Each instruction: (32x f16, 32x f16) → 144 of 256x f32 (576 OPs)
+  // Total of 1152 OPs per loop iteration, ILP = 2
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #24                                                \n"
+    "whilelt p0.h, xzr, x24                                      \n"
+    "mov x25, #24                                                \n"
+    "whilelt p1.h, xzr, x25                                      \n"
+    "1:                                                          \n"
+    "  fmopa za0.s, p0/m, p1/m, z0.h, z0.h                       \n"
+    "  fmopa za1.s, p0/m, p1/m, z1.h, z1.h                       \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24", "x25"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 576.0*2.0*(double)n_iterations;
+}
+
+
+double fmopa_za_f32_f16_p50_ilp1(const void* args) {
+  // FMOPA (FP16 into FP32, 2-way), 50% active lanes, Outer Product (floating-point)
+  //
+  // Each instruction: (32x f16, 32x f16) → 64 of 256x f32 (256 OPs)
+  // Total of 256 OPs per loop iteration, ILP = 1
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #16                                                \n"
+    "whilelt p0.h, xzr, x24                                      \n"
+    "mov x25, #16                                                \n"
+    "whilelt p1.h, xzr, x25                                      \n"
+    "1:                                                          \n"
+    "  fmopa za0.s, p0/m, p1/m, z0.h, z0.h                       \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24", "x25"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 256.0*1.0*(double)n_iterations;
+}
+
+
+double bfmopa_za_f32_b16_ilp3(const void* args) {
+  // BFMOPA (BF16 into FP32, 2-way), Outer Product (floating-point)
+  //
+  // Each instruction: (32x b16, 32x b16) → 256x f32 (1024 OPs)
+  // Total of 3072 OPs per loop iteration, ILP = 3
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "ptrue p0.h                                                  \n"
+    "ptrue p1.h                                                  \n"
+    "1:                                                          \n"
+    "  bfmopa za0.s, p0/m, p1/m, z0.h, z0.h                      \n"
+    "  bfmopa za1.s, p0/m, p1/m, z1.h, z1.h                      \n"
+    "  bfmopa za2.s, p0/m, p1/m, z2.h, z2.h                      \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 1024.0*3.0*(double)n_iterations;
+}
+
+
+double bfmopa_za_f32_b16_p50_ilp4(const void* args) {
+  // BFMOPA (BF16 into FP32, 2-way), 50% active lanes, Outer Product (floating-point)
+  //
+  // Each instruction: (32x b16, 32x b16) → 64 of 256x f32 (256 OPs)
+  // Total of 1024 OPs per loop iteration, ILP = 4
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #16                                                \n"
+    "whilelt p0.h, xzr, x24                                      \n"
+    "mov x25, #16                                                \n"
+    "whilelt p1.h, xzr, x25                                      \n"
+    "1:                                                          \n"
+    "  bfmopa za0.s, p0/m, p1/m, z0.h, z0.h                      \n"
+    "  bfmopa za1.s, p0/m, p1/m, z1.h, z1.h                      \n"
+    "  bfmopa za2.s, p0/m, p1/m, z2.h, z2.h                      \n"
+    "  bfmopa za3.s, p0/m, p1/m, z3.h, z3.h                      \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24", "x25"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 256.0*4.0*(double)n_iterations;
+}
+
+
+double bfmopa_za_f32_b16_p25_ilp2(const void* args) {
+  // BFMOPA (BF16 into FP32, 2-way), 25% active lanes, Outer Product (floating-point)
+  //
+  // Each instruction: (32x b16, 32x b16) → 16 of 256x f32 (64 OPs)
+  // Total of 128 OPs per loop iteration, ILP = 2
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #8                                                 \n"
+    "whilelt p0.h, xzr, x24                                      \n"
+    "mov x25, #8                                                 \n"
+    "whilelt p1.h, xzr, x25                                      \n"
+    "1:                                                          \n"
+    "  bfmopa za0.s, p0/m, p1/m, z0.h, z0.h                      \n"
+    "  bfmopa za1.s, p0/m, p1/m, z1.h, z1.h                      \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24", "x25"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 64.0*2.0*(double)n_iterations;
+}
+
+
+double smopa_za_i32_i16_p75_ilp2(const void* args) {
+  // SMOPA (I16 into I32, 2-way), 75% active lanes, Outer Product (integer)
+  //
+  // Each instruction: (32x i16, 32x i16) → 144 of 256x i32 (576 OPs)
+  // Total of 1152 OPs per loop iteration, ILP = 2
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #24                                                \n"
+    "whilelt p0.h, xzr, x24                                      \n"
+    "mov x25, #24                                                \n"
+    "whilelt p1.h, xzr, x25                                      \n"
+    "1:                                                          \n"
+    "  smopa za0.s, p0/m, p1/m, z0.h, z0.h                       \n"
+    "  smopa za1.s, p0/m, p1/m, z1.h, z1.h                       \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24", "x25"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 576.0*2.0*(double)n_iterations;
+}
+
+
+double smopa_za_i32_i16_p50_ilp1(const void* args) {
+  // SMOPA (I16 into I32, 2-way), 50% active lanes, Outer Product (integer)
+  //
+  // Each instruction: (32x i16, 32x i16) → 64 of 256x i32 (256 OPs)
+  // Total of 256 OPs per loop iteration, ILP = 1
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #16                                                \n"
+    "whilelt p0.h, xzr, x24                                      \n"
+    "mov x25, #16                                                \n"
+    "whilelt p1.h, xzr, x25                                      \n"
+    "1:                                                          \n"
+    "  smopa za0.s, p0/m, p1/m, z0.h, z0.h                       \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24", "x25"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 256.0*1.0*(double)n_iterations;
+}
+
+
+double smopa_za_i32_i8_ilp1(const void* args) {
+  // SMOPA (I8 into I32, 4-way), Outer Product (integer)
+  //
+  // Each instruction: (64x i8, 64x i8) → 256x i32 (2048 OPs)
+  // Total of 2048 OPs per loop iteration, ILP = 1
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "ptrue p0.b                                                  \n"
+    "ptrue p1.b                                                  \n"
+    "1:                                                          \n"
+    "  smopa za0.s, p0/m, p1/m, z0.b, z0.b                       \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 2048.0*1.0*(double)n_iterations;
+}
+
+
+double smopa_za_i32_i8_p75_ilp4(const void* args) {
+  // SMOPA (I8 into I32, 4-way), 75% active lanes, Outer Product (integer)
+  //
+  // Each instruction: (64x i8, 64x i8) → 144 of 256x i32 (1152 OPs)
+  // Total of 4608 OPs per loop iteration, ILP = 4
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #48                                                \n"
+    "whilelt p0.b, xzr, x24                                      \n"
+    "mov x25, #48                                                \n"
+    "whilelt p1.b, xzr, x25                                      \n"
+    "1:                                                          \n"
+    "  smopa za0.s, p0/m, p1/m, z0.b, z0.b                       \n"
+    "  smopa za1.s, p0/m, p1/m, z1.b, z1.b                       \n"
+    "  smopa za2.s, p0/m, p1/m, z2.b, z2.b                       \n"
+    "  smopa za3.s, p0/m, p1/m, z3.b, z3.b                       \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24", "x25"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 1152.0*4.0*(double)n_iterations;
+}
+
+
+double smopa_za_i32_i8_p25_ilp1(const void* args) {
+  // SMOPA (I8 into I32, 4-way), 25% active lanes, Outer Product (integer)
+  //
+  // Each instruction: (64x i8, 64x i8) → 16 of 256x i32 (128 OPs)
+  // Total of 128 OPs per loop iteration, ILP = 1
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #16                                                \n"
+    "whilelt p0.b, xzr, x24                                      \n"
+    "mov x25, #16                                                \n"
+    "whilelt p1.b, xzr, x25                                      \n"
+    "1:                                                          \n"
+    "  smopa za0.s, p0/m, p1/m, z0.b, z0.b                       \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24", "x25"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 128.0*1.0*(double)n_iterations;
+}
+
+
+double smopa_za_i64_i16_ilp1(const void* args) {
+  // SMOPA (I16 into I64, 4-way), Outer Product (integer)
+  //
+  // Each instruction: (32x i16, 32x i16) → 64x i64 (512 OPs)
+  // Total of 512 OPs per loop iteration, ILP = 1
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "ptrue p0.h                                                  \n"
+    "ptrue p1.h                                                  \n"
+    "1:                                                          \n"
+    "  smopa za0.d, p0/m, p1/m, z0.h, z0.h                       \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 512.0*1.0*(double)n_iterations;
+}
+
+
+double smopa_za_i64_i16_p75_ilp4(const void* args) {
+  // SMOPA (I16 into I64, 4-way), 75% active lanes, Outer Product (integer)
+  //
+  // Each instruction: (32x i16, 32x i16) → 36 of 64x i64 (288 OPs)
+  // Total of 1152 OPs per loop iteration, ILP = 4
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #24                                                \n"
+    "whilelt p0.h, xzr, x24                                      \n"
+    "mov x25, #24                                                \n"
+    "whilelt p1.h, xzr, x25                                      \n"
+    "1:                                                          \n"
+    "  smopa za0.d, p0/m, p1/m, z0.h, z0.h                       \n"
+    "  smopa za1.d, p0/m, p1/m, z1.h, z1.h                       \n"
+    "  smopa za2.d, p0/m, p1/m, z2.h, z2.h                       \n"
+    "  smopa za3.d, p0/m, p1/m, z3.h, z3.h                       \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24", "x25"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 288.0*4.0*(double)n_iterations;
+}
+
+
+double smopa_za_i64_i16_p50_ilp7(const void* args) {
+  // SMOPA (I16 into I64, 4-way), 50% active lanes, Outer Product (integer)
+  //
+  // Each instruction: (32x i16, 32x i16) → 16 of 64x i64 (128 OPs)
+  // Total of 896 OPs per loop iteration, ILP = 7
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #16                                                \n"
+    "whilelt p0.h, xzr, x24                                      \n"
+    "mov x25, #16                                                \n"
+    "whilelt p1.h, xzr, x25                                      \n"
+    "1:                                                          \n"
+    "  smopa za0.d, p0/m, p1/m, z0.h, z0.h                       \n"
+    "  smopa za1.d, p0/m, p1/m, z1.h, z1.h                       \n"
+    "  smopa za2.d, p0/m, p1/m, z2.h, z2.h                       \n"
+    "  smopa za3.d, p0/m, p1/m, z3.h, z3.h                       \n"
+    "  smopa za4.d, p0/m, p1/m, z4.h, z4.h                       \n"
+    "  smopa za5.d, p0/m, p1/m, z5.h, z5.h                       \n"
+    "  smopa za6.d, p0/m, p1/m, z6.h, z6.h                       \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24", "x25"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 128.0*7.0*(double)n_iterations;
+}
+
+
+double smopa_za_i64_i16_p25_ilp1(const void* args) {
+  // SMOPA (I16 into I64, 4-way), 25% active lanes, Outer Product (integer)
+  //
+  // Each instruction: (32x i16, 32x i16) → 4 of 64x i64 (32 OPs)
+  // Total of 32 OPs per loop iteration, ILP = 1
+  size_t n_iterations = *(const size_t*)args;
+
+  __asm__ __volatile__ (
+    "smstart                                                     \n"
+    "mov x0, %[n]                                                \n"
+    "mov x24, #8                                                 \n"
+    "whilelt p0.h, xzr, x24                                      \n"
+    "mov x25, #8                                                 \n"
+    "whilelt p1.h, xzr, x25                                      \n"
+    "1:                                                          \n"
+    "  smopa za0.d, p0/m, p1/m, z0.h, z0.h                       \n"
+    "                                                            \n"
+    "  subs x0, x0, #1                                           \n"
+    "  b.ne 1b                                                   \n"
+    "smstop                                                      \n"
+    : // no outputs
+    : [n] "r" (n_iterations)
+    : "x0", "x24", "x25"
+  );
+
+  // number of OPS executed (ops_per_instruction*instructions*iterations)
+  return 32.0*1.0*(double)n_iterations;
+}
+
@@ -0,0 +1,2805 @@
+// generated by tools/gen_op_benchmarks.py, do not edit!
+#include <assert.h>
+#include "../bench.h"
+
+// benchmark functions
+double mova_z_register_f32_f32_ilp1(const void*);
+double mova_z_register_f32_f32_ilp2(const void*);
+double mova_z_register_f32_f32_ilp3(const void*);
+double mova_z_register_f32_f32_ilp4(const void*);
+double mova_z_register_f32_f32_ilp5(const void*);
+double mova_z_register_f32_f32_ilp6(const void*);
+double mova_z_register_f32_f32_ilp7(const void*);
+double mova_z_register_f32_f32_ilp8(const void*);
+double mova_z_register_f32_f32_ilp9(const void*);
+double mova_z_register_f32_f32_ilp10(const void*);
+double mova_z_register_f32_f32_ilp11(const void*);
+double mova_z_register_f32_f32_ilp12(const void*);
+double mova_z_register_f32_f32_ilp13(const void*);
+double mova_z_register_f32_f32_ilp14(const void*);
+double mova_z_register_f32_f32_ilp15(const void*);
+double mova_z_register_f32_f32_ilp16(const void*);
+double mova_z_register_f32_f32_p75_ilp1(const void*);
+double mova_z_register_f32_f32_p75_ilp2(const void*);
+double mova_z_register_f32_f32_p75_ilp3(const void*);
+double mova_z_register_f32_f32_p75_ilp4(const void*);
+double mova_z_register_f32_f32_p75_ilp5(const void*);
+double mova_z_register_f32_f32_p75_ilp6(const void*);
+double mova_z_register_f32_f32_p75_ilp7(const void*);
+double mova_z_register_f32_f32_p75_ilp8(const void*);
+double mova_z_register_f32_f32_p75_ilp9(const void*);
+double mova_z_register_f32_f32_p75_ilp10(const void*);
+double mova_z_register_f32_f32_p75_ilp11(const void*);
+double mova_z_register_f32_f32_p75_ilp12(const void*);
+double mova_z_register_f32_f32_p75_ilp13(const void*);
+double mova_z_register_f32_f32_p75_ilp14(const void*);
+double mova_z_register_f32_f32_p75_ilp15(const void*);
+double mova_z_register_f32_f32_p75_ilp16(const void*);
+double mova_z_register_f32_f32_p50_ilp1(const void*);
+double mova_z_register_f32_f32_p50_ilp2(const void*);
+double mova_z_register_f32_f32_p50_ilp3(const void*);
+double mova_z_register_f32_f32_p50_ilp4(const void*);
+double mova_z_register_f32_f32_p50_ilp5(const void*);
+double mova_z_register_f32_f32_p50_ilp6(const void*);
+double mova_z_register_f32_f32_p50_ilp7(const void*);
+double mova_z_register_f32_f32_p50_ilp8(const void*);
+double mova_z_register_f32_f32_p50_ilp9(const void*);
+double mova_z_register_f32_f32_p50_ilp10(const void*);
+double mova_z_register_f32_f32_p50_ilp11(const void*);
+double mova_z_register_f32_f32_p50_ilp12(const void*);
+double mova_z_register_f32_f32_p50_ilp13(const void*);
+double mova_z_register_f32_f32_p50_ilp14(const void*);
+double mova_z_register_f32_f32_p50_ilp15(const void*);
+double mova_z_register_f32_f32_p50_ilp16(const void*);
+double mova_z_register_f32_f32_p25_ilp1(const void*);
+double mova_z_register_f32_f32_p25_ilp2(const void*);
+double mova_z_register_f32_f32_p25_ilp3(const void*);
+double mova_z_register_f32_f32_p25_ilp4(const void*);
+double mova_z_register_f32_f32_p25_ilp5(const void*);
+double mova_z_register_f32_f32_p25_ilp6(const void*);
+double mova_z_register_f32_f32_p25_ilp7(const void*);
+double mova_z_register_f32_f32_p25_ilp8(const void*);
+double mova_z_register_f32_f32_p25_ilp9(const void*);
+double mova_z_register_f32_f32_p25_ilp10(const void*);
+double mova_z_register_f32_f32_p25_ilp11(const void*);
+double mova_z_register_f32_f32_p25_ilp12(const void*);
+double mova_z_register_f32_f32_p25_ilp13(const void*);
+double mova_z_register_f32_f32_p25_ilp14(const void*);
+double mova_z_register_f32_f32_p25_ilp15(const void*);
+double mova_z_register_f32_f32_p25_ilp16(const void*);
+double mova_za_tile_slice_f32_f32_ilp1(const void*);
+double mova_za_tile_slice_f32_f32_ilp2(const void*);
+double mova_za_tile_slice_f32_f32_ilp3(const void*);
+double mova_za_tile_slice_f32_f32_ilp4(const void*);
+double mova_za_tile_slice_f32_f32_ilp5(const void*);
+double mova_za_tile_slice_f32_f32_ilp6(const void*);
+double mova_za_tile_slice_f32_f32_ilp7(const void*);
+double mova_za_tile_slice_f32_f32_ilp8(const void*);
+double mova_za_tile_slice_f32_f32_ilp9(const void*);
+double mova_za_tile_slice_f32_f32_ilp10(const void*);
+double mova_za_tile_slice_f32_f32_ilp11(const void*);
+double mova_za_tile_slice_f32_f32_ilp12(const void*);
+double mova_za_tile_slice_f32_f32_ilp13(const void*);
+double mova_za_tile_slice_f32_f32_ilp14(const void*);
+double mova_za_tile_slice_f32_f32_ilp15(const void*);
+double mova_za_tile_slice_f32_f32_ilp16(const void*);
+double mova_za_tile_slice_f32_f32_p75_ilp1(const void*);
+double mova_za_tile_slice_f32_f32_p75_ilp2(const void*);
+double mova_za_tile_slice_f32_f32_p75_ilp3(const void*);
+double mova_za_tile_slice_f32_f32_p75_ilp4(const void*);
+double mova_za_tile_slice_f32_f32_p75_ilp5(const void*);
+double mova_za_tile_slice_f32_f32_p75_ilp6(const void*);
+double mova_za_tile_slice_f32_f32_p75_ilp7(const void*);
+double mova_za_tile_slice_f32_f32_p75_ilp8(const void*);
+double mova_za_tile_slice_f32_f32_p75_ilp9(const void*);
+double mova_za_tile_slice_f32_f32_p75_ilp10(const void*);
+double mova_za_tile_slice_f32_f32_p75_ilp11(const void*);
+double mova_za_tile_slice_f32_f32_p75_ilp12(const void*);
+double mova_za_tile_slice_f32_f32_p75_ilp13(const void*);
+double mova_za_tile_slice_f32_f32_p75_ilp14(const void*);
+double mova_za_tile_slice_f32_f32_p75_ilp15(const void*);
+double mova_za_tile_slice_f32_f32_p75_ilp16(const void*);
+double mova_za_tile_slice_f32_f32_p50_ilp1(const void*);
+double mova_za_tile_slice_f32_f32_p50_ilp2(const void*);
+double mova_za_tile_slice_f32_f32_p50_ilp3(const void*);
+double mova_za_tile_slice_f32_f32_p50_ilp4(const void*);
+double mova_za_tile_slice_f32_f32_p50_ilp5(const void*);
+double mova_za_tile_slice_f32_f32_p50_ilp6(const void*);
+double mova_za_tile_slice_f32_f32_p50_ilp7(const void*);
+double mova_za_tile_slice_f32_f32_p50_ilp8(const void*);
+double mova_za_tile_slice_f32_f32_p50_ilp9(const void*);
+double mova_za_tile_slice_f32_f32_p50_ilp10(const void*);
+double mova_za_tile_slice_f32_f32_p50_ilp11(const void*);
+double mova_za_tile_slice_f32_f32_p50_ilp12(const void*);
+double mova_za_tile_slice_f32_f32_p50_ilp13(const void*);
+double mova_za_tile_slice_f32_f32_p50_ilp14(const void*);
+double mova_za_tile_slice_f32_f32_p50_ilp15(const void*);
+double mova_za_tile_slice_f32_f32_p50_ilp16(const void*);
+double mova_za_tile_slice_f32_f32_p25_ilp1(const void*);
+double mova_za_tile_slice_f32_f32_p25_ilp2(const void*);
+double mova_za_tile_slice_f32_f32_p25_ilp3(const void*);
+double mova_za_tile_slice_f32_f32_p25_ilp4(const void*);
+double mova_za_tile_slice_f32_f32_p25_ilp5(const void*);
+double mova_za_tile_slice_f32_f32_p25_ilp6(const void*);
+double mova_za_tile_slice_f32_f32_p25_ilp7(const void*);
+double mova_za_tile_slice_f32_f32_p25_ilp8(const void*);
+double mova_za_tile_slice_f32_f32_p25_ilp9(const void*);
+double mova_za_tile_slice_f32_f32_p25_ilp10(const void*);
+double mova_za_tile_slice_f32_f32_p25_ilp11(const void*);
+double mova_za_tile_slice_f32_f32_p25_ilp12(const void*);
+double mova_za_tile_slice_f32_f32_p25_ilp13(const void*);
+double mova_za_tile_slice_f32_f32_p25_ilp14(const void*);
+double mova_za_tile_slice_f32_f32_p25_ilp15(const void*);
+double mova_za_tile_slice_f32_f32_p25_ilp16(const void*);
+double mova_z_register_f64_f64_vgx2_ilp1(const void*);
+double mova_z_register_f64_f64_vgx2_ilp2(const void*);
+double mova_z_register_f64_f64_vgx2_ilp3(const void*);
+double mova_z_register_f64_f64_vgx2_ilp4(const void*);
+double mova_z_register_f64_f64_vgx2_ilp5(const void*);
+double mova_z_register_f64_f64_vgx2_ilp6(const void*);
+double mova_z_register_f64_f64_vgx2_ilp7(const void*);
+double mova_z_register_f64_f64_vgx2_ilp8(const void*);
+double mova_z_register_f64_f64_vgx2_ilp9(const void*);
+double mova_z_register_f64_f64_vgx2_ilp10(const void*);
+double mova_z_register_f64_f64_vgx2_ilp11(const void*);
+double mova_z_register_f64_f64_vgx2_ilp12(const void*);
+double mova_z_register_f64_f64_vgx2_ilp13(const void*);
+double mova_z_register_f64_f64_vgx2_ilp14(const void*);
+double mova_z_register_f64_f64_vgx2_ilp15(const void*);
+double mova_z_register_f64_f64_vgx2_ilp16(const void*);
+double mova_z_register_f64_f64_vgx4_ilp1(const void*);
+double mova_z_register_f64_f64_vgx4_ilp2(const void*);
+double mova_z_register_f64_f64_vgx4_ilp3(const void*);
+double mova_z_register_f64_f64_vgx4_ilp4(const void*);
+double mova_z_register_f64_f64_vgx4_ilp5(const void*);
+double mova_z_register_f64_f64_vgx4_ilp6(const void*);
+double mova_z_register_f64_f64_vgx4_ilp7(const void*);
+double mova_z_register_f64_f64_vgx4_ilp8(const void*);
+double mova_za_vector_f64_f64_vgx2_ilp1(const void*);
+double mova_za_vector_f64_f64_vgx2_ilp2(const void*);
+double mova_za_vector_f64_f64_vgx2_ilp3(const void*);
+double mova_za_vector_f64_f64_vgx2_ilp4(const void*);
+double mova_za_vector_f64_f64_vgx2_ilp5(const void*);
+double mova_za_vector_f64_f64_vgx2_ilp6(const void*);
+double mova_za_vector_f64_f64_vgx2_ilp7(const void*);
+double mova_za_vector_f64_f64_vgx2_ilp8(const void*);
+double mova_za_vector_f64_f64_vgx2_ilp9(const void*);
+double mova_za_vector_f64_f64_vgx2_ilp10(const void*);
+double mova_za_vector_f64_f64_vgx2_ilp11(const void*);
+double mova_za_vector_f64_f64_vgx2_ilp12(const void*);
+double mova_za_vector_f64_f64_vgx2_ilp13(const void*);
+double mova_za_vector_f64_f64_vgx2_ilp14(const void*);
+double mova_za_vector_f64_f64_vgx2_ilp15(const void*);
+double mova_za_vector_f64_f64_vgx2_ilp16(const void*);
+double mova_za_vector_f64_f64_vgx4_ilp1(const void*);
+double mova_za_vector_f64_f64_vgx4_ilp2(const void*);
+double mova_za_vector_f64_f64_vgx4_ilp3(const void*);
+double mova_za_vector_f64_f64_vgx4_ilp4(const void*);
+double mova_za_vector_f64_f64_vgx4_ilp5(const void*);
+double mova_za_vector_f64_f64_vgx4_ilp6(const void*);
+double mova_za_vector_f64_f64_vgx4_ilp7(const void*);
+double mova_za_vector_f64_f64_vgx4_ilp8(const void*);
+double zero_za_tiles_i64_i64_ilp1(const void*);
+double zero_za_tiles_i64_i64_ilp2(const void*);
+double zero_za_tiles_i64_i64_ilp3(const void*);
+double zero_za_tiles_i64_i64_ilp4(const void*);
+double zero_za_tiles_i64_i64_ilp5(const void*);
+double zero_za_tiles_i64_i64_ilp6(const void*);
+double zero_za_tiles_i64_i64_ilp7(const void*);
+double zero_za_tiles_i64_i64_ilp8(const void*);
+double ldr_za_row_u8_u8_ilp1(const void*);
+double ldr_za_row_u8_u8_ilp2(const void*);
+double ldr_za_row_u8_u8_ilp3(const void*);
+double ldr_za_row_u8_u8_ilp4(const void*);
+double ldr_za_row_u8_u8_ilp5(const void*);
+double ldr_za_row_u8_u8_ilp6(const void*);
+double ldr_za_row_u8_u8_ilp7(const void*);
+double ldr_za_row_u8_u8_ilp8(const void*);
+double ldr_za_row_u8_u8_ilp9(const void*);
+double ldr_za_row_u8_u8_ilp10(const void*);
+double ldr_za_row_u8_u8_ilp11(const void*);
+double ldr_za_row_u8_u8_ilp12(const void*);
+double ldr_za_row_u8_u8_ilp13(const void*);
+double ldr_za_row_u8_u8_ilp14(const void*);
+double ldr_za_row_u8_u8_ilp15(const void*);
+double ldr_za_row_u8_u8_ilp16(const void*);
+double str_memory_u8_u8_ilp1(const void*);
+double str_memory_u8_u8_ilp2(const void*);
+double str_memory_u8_u8_ilp3(const void*);
+double str_memory_u8_u8_ilp4(const void*);
+double str_memory_u8_u8_ilp5(const void*);
+double str_memory_u8_u8_ilp6(const void*);
+double str_memory_u8_u8_ilp7(const void*);
+double str_memory_u8_u8_ilp8(const void*);
+double str_memory_u8_u8_ilp9(const void*);
+double str_memory_u8_u8_ilp10(const void*);
+double str_memory_u8_u8_ilp11(const void*);
+double str_memory_u8_u8_ilp12(const void*);
+double str_memory_u8_u8_ilp13(const void*);
+double str_memory_u8_u8_ilp14(const void*);
+double str_memory_u8_u8_ilp15(const void*);
+double str_memory_u8_u8_ilp16(const void*);
+double movt_gpr_u64_u64_ilp1(const void*);
+double movt_gpr_u64_u64_ilp2(const void*);
+double movt_gpr_u64_u64_ilp3(const void*);
+double movt_gpr_u64_u64_ilp4(const void*);
+double movt_gpr_u64_u64_ilp5(const void*);
+double movt_gpr_u64_u64_ilp6(const void*);
+double movt_gpr_u64_u64_ilp7(const void*);
+double movt_gpr_u64_u64_ilp8(const void*);
+double movt_gpr_u64_u64_ilp9(const void*);
+double movt_gpr_u64_u64_ilp10(const void*);
+double movt_gpr_u64_u64_ilp11(const void*);
+double movt_gpr_u64_u64_ilp12(const void*);
+double movt_gpr_u64_u64_ilp13(const void*);
+double movt_gpr_u64_u64_ilp14(const void*);
+double movt_gpr_u64_u64_ilp15(const void*);
+double movt_gpr_u64_u64_ilp16(const void*);
+double luti2_z_register_u8_u8_ilp1(const void*);
+double luti2_z_register_u8_u8_ilp2(const void*);
+double luti2_z_register_u8_u8_ilp3(const void*);
+double luti2_z_register_u8_u8_ilp4(const void*);
+double luti2_z_register_u8_u8_ilp5(const void*);
+double luti2_z_register_u8_u8_ilp6(const void*);
+double luti2_z_register_u8_u8_ilp7(const void*);
+double luti2_z_register_u8_u8_ilp8(const void*);
+double luti2_z_register_u8_u8_ilp9(const void*);
+double luti2_z_register_u8_u8_ilp10(const void*);
+double luti2_z_register_u8_u8_ilp11(const void*);
+double luti2_z_register_u8_u8_ilp12(const void*);
+double luti2_z_register_u8_u8_ilp13(const void*);
+double luti2_z_register_u8_u8_ilp14(const void*);
+double luti2_z_register_u8_u8_ilp15(const void*);
+double luti2_z_register_u8_u8_ilp16(const void*);
+double luti4_z_register_u32_u32_ilp1(const void*);
+double luti4_z_register_u32_u32_ilp2(const void*);
+double luti4_z_register_u32_u32_ilp3(const void*);
+double luti4_z_register_u32_u32_ilp4(const void*);
+double luti4_z_register_u32_u32_ilp5(const void*);
+double luti4_z_register_u32_u32_ilp6(const void*);
+double luti4_z_register_u32_u32_ilp7(const void*);
+double luti4_z_register_u32_u32_ilp8(const void*);
+double luti4_z_register_u32_u32_ilp9(const void*);
+double luti4_z_register_u32_u32_ilp10(const void*);
+double luti4_z_register_u32_u32_ilp11(const void*);
+double luti4_z_register_u32_u32_ilp12(const void*);
+double luti4_z_register_u32_u32_ilp13(const void*);
+double luti4_z_register_u32_u32_ilp14(const void*);
+double luti4_z_register_u32_u32_ilp15(const void*);
+double luti4_z_register_u32_u32_ilp16(const void*);
+double luti4_z_register_u32_u32_vgx4_ilp1(const void*);
+double luti4_z_register_u32_u32_vgx4_ilp2(const void*);
+double luti4_z_register_u32_u32_vgx4_ilp3(const void*);
+double luti4_z_register_u32_u32_vgx4_ilp4(const void*);
+double luti4_z_register_u32_u32_vgx4_ilp5(const void*);
+double luti4_z_register_u32_u32_vgx4_ilp6(const void*);
+double luti4_z_register_u32_u32_vgx4_ilp7(const void*);
+double fdot_f32_f16_ilp1(const void*);
+double fdot_f32_f16_ilp2(const void*);
+double fdot_f32_f16_ilp3(const void*);
+double fdot_f32_f16_ilp4(const void*);
+double fdot_f32_f16_ilp5(const void*);
+double fdot_f32_f16_ilp6(const void*);
+double fdot_f32_f16_ilp7(const void*);
+double fdot_f32_f16_ilp8(const void*);
+double fdot_f32_f16_ilp9(const void*);
+double fdot_f32_f16_ilp10(const void*);
+double fdot_f32_f16_ilp11(const void*);
+double fdot_f32_f16_ilp12(const void*);
+double fdot_f32_f16_ilp13(const void*);
+double fdot_f32_f16_ilp14(const void*);
+double fdot_f32_f16_ilp15(const void*);
+double fdot_f32_f16_ilp16(const void*);
+double fdot_f32_f16_chain8_ilp1(const void*);
+double fdot_f32_f16_chain8_ilp2(const void*);
+double bfdot_f32_b16_ilp1(const void*);
+double bfdot_f32_b16_ilp2(const void*);
+double bfdot_f32_b16_ilp3(const void*);
+double bfdot_f32_b16_ilp4(const void*);
+double bfdot_f32_b16_ilp5(const void*);
+double bfdot_f32_b16_ilp6(const void*);
+double bfdot_f32_b16_ilp7(const void*);
+double bfdot_f32_b16_ilp8(const void*);
+double bfdot_f32_b16_ilp9(const void*);
+double bfdot_f32_b16_ilp10(const void*);
+double bfdot_f32_b16_ilp11(const void*);
+double bfdot_f32_b16_ilp12(const void*);
+double bfdot_f32_b16_ilp13(const void*);
+double bfdot_f32_b16_ilp14(const void*);
+double bfdot_f32_b16_ilp15(const void*);
+double bfdot_f32_b16_ilp16(const void*);
+double bfdot_f32_b16_chain8_ilp1(const void*);
+double bfdot_f32_b16_chain8_ilp2(const void*);
+double fdot_za_f32_f16_vgx2_ilp1(const void*);
+double fdot_za_f32_f16_vgx2_ilp2(const void*);
+double fdot_za_f32_f16_vgx2_ilp3(const void*);
+double fdot_za_f32_f16_vgx2_ilp4(const void*);
+double fdot_za_f32_f16_vgx2_ilp5(const void*);
+double fdot_za_f32_f16_vgx2_ilp6(const void*);
+double fdot_za_f32_f16_vgx2_ilp7(const void*);
+double fdot_za_f32_f16_vgx2_ilp8(const void*);
+double fdot_za_f32_f16_vgx2_ilp9(const void*);
+double fdot_za_f32_f16_vgx2_ilp10(const void*);
+double fdot_za_f32_f16_vgx2_ilp11(const void*);
+double fdot_za_f32_f16_vgx2_ilp12(const void*);
+double fdot_za_f32_f16_vgx2_ilp13(const void*);
+double fdot_za_f32_f16_vgx2_ilp14(const void*);
+double fdot_za_f32_f16_vgx2_ilp15(const void*);
+double fdot_za_f32_f16_vgx2_ilp16(const void*);
+double fdot_za_f32_f16_vgx2_chain8_ilp1(const void*);
+double fdot_za_f32_f16_vgx2_chain8_ilp2(const void*);
+double fdot_za_f32_f16_vgx4_ilp1(const void*);
+double fdot_za_f32_f16_vgx4_ilp2(const void*);
+double fdot_za_f32_f16_vgx4_ilp3(const void*);
+double fdot_za_f32_f16_vgx4_ilp4(const void*);
+double fdot_za_f32_f16_vgx4_ilp5(const void*);
+double fdot_za_f32_f16_vgx4_ilp6(const void*);
+double fdot_za_f32_f16_vgx4_ilp7(const void*);
+double fdot_za_f32_f16_vgx4_ilp8(const void*);
+double fdot_za_f32_f16_vgx4_ilp9(const void*);
+double fdot_za_f32_f16_vgx4_ilp10(const void*);
+double fdot_za_f32_f16_vgx4_ilp11(const void*);
+double fdot_za_f32_f16_vgx4_ilp12(const void*);
+double fdot_za_f32_f16_vgx4_ilp13(const void*);
+double fdot_za_f32_f16_vgx4_ilp14(const void*);
+double fdot_za_f32_f16_vgx4_ilp15(const void*);
+double fdot_za_f32_f16_vgx4_ilp16(const void*);
+double fdot_za_f32_f16_vgx4_chain8_ilp1(const void*);
+double fdot_za_f32_f16_vgx4_chain8_ilp2(const void*);
+double bfdot_za_f32_b16_vgx2_ilp1(const void*);
+double bfdot_za_f32_b16_vgx2_ilp2(const void*);
+double bfdot_za_f32_b16_vgx2_ilp3(const void*);
+double bfdot_za_f32_b16_vgx2_ilp4(const void*);
+double bfdot_za_f32_b16_vgx2_ilp5(const void*);
+double bfdot_za_f32_b16_vgx2_ilp6(const void*);
+double bfdot_za_f32_b16_vgx2_ilp7(const void*);
+double bfdot_za_f32_b16_vgx2_ilp8(const void*);
+double bfdot_za_f32_b16_vgx2_ilp9(const void*);
+double bfdot_za_f32_b16_vgx2_ilp10(const void*);
+double bfdot_za_f32_b16_vgx2_ilp11(const void*);
+double bfdot_za_f32_b16_vgx2_ilp12(const void*);
+double bfdot_za_f32_b16_vgx2_ilp13(const void*);
+double bfdot_za_f32_b16_vgx2_ilp14(const void*);
+double bfdot_za_f32_b16_vgx2_ilp15(const void*);
+double bfdot_za_f32_b16_vgx2_ilp16(const void*);
+double bfdot_za_f32_b16_vgx2_chain8_ilp1(const void*);
+double bfdot_za_f32_b16_vgx2_chain8_ilp2(const void*);
+double bfdot_za_f32_b16_vgx4_ilp1(const void*);
+double bfdot_za_f32_b16_vgx4_ilp2(const void*);
+double bfdot_za_f32_b16_vgx4_ilp3(const void*);
+double bfdot_za_f32_b16_vgx4_ilp4(const void*);
+double bfdot_za_f32_b16_vgx4_ilp5(const void*);
+double bfdot_za_f32_b16_vgx4_ilp6(const void*);
+double bfdot_za_f32_b16_vgx4_ilp7(const void*);
+double bfdot_za_f32_b16_vgx4_ilp8(const void*);
+double bfdot_za_f32_b16_vgx4_ilp9(const void*);
+double bfdot_za_f32_b16_vgx4_ilp10(const void*);
+double bfdot_za_f32_b16_vgx4_ilp11(const void*);
+double bfdot_za_f32_b16_vgx4_ilp12(const void*);
+double bfdot_za_f32_b16_vgx4_ilp13(const void*);
+double bfdot_za_f32_b16_vgx4_ilp14(const void*);
+double bfdot_za_f32_b16_vgx4_ilp15(const void*);
+double bfdot_za_f32_b16_vgx4_ilp16(const void*);
+double bfdot_za_f32_b16_vgx4_chain8_ilp1(const void*);
+double bfdot_za_f32_b16_vgx4_chain8_ilp2(const void*);
+double sdot_i32_i16_ilp1(const void*);
+double sdot_i32_i16_ilp2(const void*);
+double sdot_i32_i16_ilp3(const void*);
+double sdot_i32_i16_ilp4(const void*);
+double sdot_i32_i16_ilp5(const void*);
+double sdot_i32_i16_ilp6(const void*);
+double sdot_i32_i16_ilp7(const void*);
+double sdot_i32_i16_ilp8(const void*);
+double sdot_i32_i16_ilp9(const void*);
+double sdot_i32_i16_ilp10(const void*);
+double sdot_i32_i16_ilp11(const void*);
+double sdot_i32_i16_ilp12(const void*);
+double sdot_i32_i16_ilp13(const void*);
+double sdot_i32_i16_ilp14(const void*);
+double sdot_i32_i16_ilp15(const void*);
+double sdot_i32_i16_ilp16(const void*);
+double sdot_i32_i16_chain8_ilp1(const void*);
+double sdot_i32_i16_chain8_ilp2(const void*);
+double sdot_i32_i8_ilp1(const void*);
+double sdot_i32_i8_ilp2(const void*);
+double sdot_i32_i8_ilp3(const void*);
+double sdot_i32_i8_ilp4(const void*);
+double sdot_i32_i8_ilp5(const void*);
+double sdot_i32_i8_ilp6(const void*);
+double sdot_i32_i8_ilp7(const void*);
+double sdot_i32_i8_ilp8(const void*);
+double sdot_i32_i8_ilp9(const void*);
+double sdot_i32_i8_ilp10(const void*);
+double sdot_i32_i8_ilp11(const void*);
+double sdot_i32_i8_ilp12(const void*);
+double sdot_i32_i8_ilp13(const void*);
+double sdot_i32_i8_ilp14(const void*);
+double sdot_i32_i8_ilp15(const void*);
+double sdot_i32_i8_ilp16(const void*);
+double sdot_i32_i8_chain8_ilp1(const void*);
+double sdot_i32_i8_chain8_ilp2(const void*);
+double sdot_i64_i16_ilp1(const void*);
+double sdot_i64_i16_ilp2(const void*);
+double sdot_i64_i16_ilp3(const void*);
+double sdot_i64_i16_ilp4(const void*);
+double sdot_i64_i16_ilp5(const void*);
+double sdot_i64_i16_ilp6(const void*);
+double sdot_i64_i16_ilp7(const void*);
+double sdot_i64_i16_ilp8(const void*);
+double sdot_i64_i16_ilp9(const void*);
+double sdot_i64_i16_ilp10(const void*);
+double sdot_i64_i16_ilp11(const void*);
+double sdot_i64_i16_ilp12(const void*);
+double sdot_i64_i16_ilp13(const void*);
+double sdot_i64_i16_ilp14(const void*);
+double sdot_i64_i16_ilp15(const void*);
+double sdot_i64_i16_ilp16(const void*);
+double sdot_i64_i16_chain8_ilp1(const void*);
+double sdot_i64_i16_chain8_ilp2(const void*);
+double sdot_za_i32_i16_vgx2_ilp1(const void*);
+double sdot_za_i32_i16_vgx2_ilp2(const void*);
+double sdot_za_i32_i16_vgx2_ilp3(const void*);
+double sdot_za_i32_i16_vgx2_ilp4(const void*);
+double sdot_za_i32_i16_vgx2_ilp5(const void*);
+double sdot_za_i32_i16_vgx2_ilp6(const void*);
+double sdot_za_i32_i16_vgx2_ilp7(const void*);
+double sdot_za_i32_i16_vgx2_ilp8(const void*);
+double sdot_za_i32_i16_vgx2_ilp9(const void*);
+double sdot_za_i32_i16_vgx2_ilp10(const void*);
+double sdot_za_i32_i16_vgx2_ilp11(const void*);
+double sdot_za_i32_i16_vgx2_ilp12(const void*);
+double sdot_za_i32_i16_vgx2_ilp13(const void*);
+double sdot_za_i32_i16_vgx2_ilp14(const void*);
+double sdot_za_i32_i16_vgx2_ilp15(const void*);
+double sdot_za_i32_i16_vgx2_ilp16(const void*);
+double sdot_za_i32_i16_vgx2_chain8_ilp1(const void*);
+double sdot_za_i32_i16_vgx2_chain8_ilp2(const void*);
+double sdot_za_i32_i16_vgx4_ilp1(const void*);
+double sdot_za_i32_i16_vgx4_ilp2(const void*);
+double sdot_za_i32_i16_vgx4_ilp3(const void*);
+double sdot_za_i32_i16_vgx4_ilp4(const void*);
+double sdot_za_i32_i16_vgx4_ilp5(const void*);
+double sdot_za_i32_i16_vgx4_ilp6(const void*);
+double sdot_za_i32_i16_vgx4_ilp7(const void*);
+double sdot_za_i32_i16_vgx4_ilp8(const void*);
+double sdot_za_i32_i16_vgx4_ilp9(const void*);
+double sdot_za_i32_i16_vgx4_ilp10(const void*);
+double sdot_za_i32_i16_vgx4_ilp11(const void*);
+double sdot_za_i32_i16_vgx4_ilp12(const void*);
+double sdot_za_i32_i16_vgx4_ilp13(const void*);
+double sdot_za_i32_i16_vgx4_ilp14(const void*);
+double sdot_za_i32_i16_vgx4_ilp15(const void*);
+double sdot_za_i32_i16_vgx4_ilp16(const void*);
+double sdot_za_i32_i16_vgx4_chain8_ilp1(const void*);
+double sdot_za_i32_i16_vgx4_chain8_ilp2(const void*);
+double sdot_za_i32_i8_vgx2_ilp1(const void*);
+double sdot_za_i32_i8_vgx2_ilp2(const void*);
+double sdot_za_i32_i8_vgx2_ilp3(const void*);
+double sdot_za_i32_i8_vgx2_ilp4(const void*);
+double sdot_za_i32_i8_vgx2_ilp5(const void*);
+double sdot_za_i32_i8_vgx2_ilp6(const void*);
+double sdot_za_i32_i8_vgx2_ilp7(const void*);
+double sdot_za_i32_i8_vgx2_ilp8(const void*);
+double sdot_za_i32_i8_vgx2_ilp9(const void*);
+double sdot_za_i32_i8_vgx2_ilp10(const void*);
+double sdot_za_i32_i8_vgx2_ilp11(const void*);
+double sdot_za_i32_i8_vgx2_ilp12(const void*);
+double sdot_za_i32_i8_vgx2_ilp13(const void*);
+double sdot_za_i32_i8_vgx2_ilp14(const void*);
+double sdot_za_i32_i8_vgx2_ilp15(const void*);
+double sdot_za_i32_i8_vgx2_ilp16(const void*);
+double sdot_za_i32_i8_vgx2_chain8_ilp1(const void*);
+double sdot_za_i32_i8_vgx2_chain8_ilp2(const void*);
+double sdot_za_i32_i8_vgx4_ilp1(const void*);
+double sdot_za_i32_i8_vgx4_ilp2(const void*);
+double sdot_za_i32_i8_vgx4_ilp3(const void*);
+double sdot_za_i32_i8_vgx4_ilp4(const void*);
+double sdot_za_i32_i8_vgx4_ilp5(const void*);
+double sdot_za_i32_i8_vgx4_ilp6(const void*);
+double sdot_za_i32_i8_vgx4_ilp7(const void*);
+double sdot_za_i32_i8_vgx4_ilp8(const void*);
+double sdot_za_i32_i8_vgx4_ilp9(const void*);
+double sdot_za_i32_i8_vgx4_ilp10(const void*);
+double sdot_za_i32_i8_vgx4_ilp11(const void*);
+double sdot_za_i32_i8_vgx4_ilp12(const void*);
+double sdot_za_i32_i8_vgx4_ilp13(const void*);
+double sdot_za_i32_i8_vgx4_ilp14(const void*);
+double sdot_za_i32_i8_vgx4_ilp15(const void*);
+double sdot_za_i32_i8_vgx4_ilp16(const void*);
+double sdot_za_i32_i8_vgx4_chain8_ilp1(const void*);
+double sdot_za_i32_i8_vgx4_chain8_ilp2(const void*);
+double sdot_za_i64_i16_vgx2_ilp1(const void*);
+double sdot_za_i64_i16_vgx2_ilp2(const void*);
+double sdot_za_i64_i16_vgx2_ilp3(const void*);
+double sdot_za_i64_i16_vgx2_ilp4(const void*);
+double sdot_za_i64_i16_vgx2_ilp5(const void*);
+double sdot_za_i64_i16_vgx2_ilp6(const void*);
+double sdot_za_i64_i16_vgx2_ilp7(const void*);
+double sdot_za_i64_i16_vgx2_ilp8(const void*);
+double sdot_za_i64_i16_vgx2_ilp9(const void*);
+double sdot_za_i64_i16_vgx2_ilp10(const void*);
+double sdot_za_i64_i16_vgx2_ilp11(const void*);
+double sdot_za_i64_i16_vgx2_ilp12(const void*);
+double sdot_za_i64_i16_vgx2_ilp13(const void*);
+double sdot_za_i64_i16_vgx2_ilp14(const void*);
+double sdot_za_i64_i16_vgx2_ilp15(const void*);
+double sdot_za_i64_i16_vgx2_ilp16(const void*);
+double sdot_za_i64_i16_vgx2_chain8_ilp1(const void*);
+double sdot_za_i64_i16_vgx2_chain8_ilp2(const void*);
+double sdot_za_i64_i16_vgx4_ilp1(const void*);
+double sdot_za_i64_i16_vgx4_ilp2(const void*);
+double sdot_za_i64_i16_vgx4_ilp3(const void*);
+double sdot_za_i64_i16_vgx4_ilp4(const void*);
+double sdot_za_i64_i16_vgx4_ilp5(const void*);
+double sdot_za_i64_i16_vgx4_ilp6(const void*);
+double sdot_za_i64_i16_vgx4_ilp7(const void*);
+double sdot_za_i64_i16_vgx4_ilp8(const void*);
+double sdot_za_i64_i16_vgx4_ilp9(const void*);
+double sdot_za_i64_i16_vgx4_ilp10(const void*);
+double sdot_za_i64_i16_vgx4_ilp11(const void*);
+double sdot_za_i64_i16_vgx4_ilp12(const void*);
+double sdot_za_i64_i16_vgx4_ilp13(const void*);
+double sdot_za_i64_i16_vgx4_ilp14(const void*);
+double sdot_za_i64_i16_vgx4_ilp15(const void*);
+double sdot_za_i64_i16_vgx4_ilp16(const void*);
+double sdot_za_i64_i16_vgx4_chain8_ilp1(const void*);
+double sdot_za_i64_i16_vgx4_chain8_ilp2(const void*);
+double fclamp_z_register_f32_f32_vgx2_ilp1(const void*);
+double fclamp_z_register_f32_f32_vgx2_ilp2(const void*);
+double fclamp_z_register_f32_f32_vgx2_ilp3(const void*);
+double fclamp_z_register_f32_f32_vgx2_ilp4(const void*);
+double fclamp_z_register_f32_f32_vgx2_ilp5(const void*);
+double fclamp_z_register_f32_f32_vgx2_ilp6(const void*);
+double fclamp_z_register_f32_f32_vgx2_ilp7(const void*);
+double fclamp_z_register_f32_f32_vgx2_ilp8(const void*);
+double fclamp_z_register_f32_f32_vgx2_ilp9(const void*);
+double fclamp_z_register_f32_f32_vgx2_ilp10(const void*);
+double fclamp_z_register_f32_f32_vgx2_ilp11(const void*);
+double fclamp_z_register_f32_f32_vgx2_ilp12(const void*);
+double fclamp_z_register_f32_f32_vgx2_ilp13(const void*);
+double fclamp_z_register_f32_f32_vgx2_ilp14(const void*);
+double fclamp_z_register_f32_f32_vgx2_ilp15(const void*);
+double fcvt_z_register_f16_f32_vgx2_ilp1(const void*);
+double fcvt_z_register_f16_f32_vgx2_ilp2(const void*);
+double fcvt_z_register_f16_f32_vgx2_ilp3(const void*);
+double fcvt_z_register_f16_f32_vgx2_ilp4(const void*);
+double fcvt_z_register_f16_f32_vgx2_ilp5(const void*);
+double fcvt_z_register_f16_f32_vgx2_ilp6(const void*);
+double fcvt_z_register_f16_f32_vgx2_ilp7(const void*);
+double fcvt_z_register_f16_f32_vgx2_ilp8(const void*);
+double fcvt_z_register_f16_f32_vgx2_ilp9(const void*);
+double fcvt_z_register_f16_f32_vgx2_ilp10(const void*);
+double fcvt_z_register_f16_f32_vgx2_ilp11(const void*);
+double fcvt_z_register_f16_f32_vgx2_ilp12(const void*);
+double fcvt_z_register_f16_f32_vgx2_ilp13(const void*);
+double fcvt_z_register_f16_f32_vgx2_ilp14(const void*);
+double fcvt_z_register_f16_f32_vgx2_ilp15(const void*);
+double fmla_f16_f16_ilp1(const void*);
+double fmla_f16_f16_ilp2(const void*);
+double fmla_f16_f16_ilp3(const void*);
+double fmla_f16_f16_ilp4(const void*);
+double fmla_f16_f16_ilp5(const void*);
+double fmla_f16_f16_ilp6(const void*);
+double fmla_f16_f16_ilp7(const void*);
+double fmla_f16_f16_ilp8(const void*);
+double fmla_f16_f16_ilp9(const void*);
+double fmla_f16_f16_ilp10(const void*);
+double fmla_f16_f16_ilp11(const void*);
+double fmla_f16_f16_ilp12(const void*);
+double fmla_f16_f16_ilp13(const void*);
+double fmla_f16_f16_ilp14(const void*);
+double fmla_f16_f16_ilp15(const void*);
+double fmla_f16_f16_ilp16(const void*);
+double fmla_f16_f16_chain8_ilp1(const void*);
+double fmla_f16_f16_chain8_ilp2(const void*);
+double fmla_f16_f16_p75_ilp1(const void*);
+double fmla_f16_f16_p75_ilp2(const void*);
+double fmla_f16_f16_p75_ilp3(const void*);
+double fmla_f16_f16_p75_ilp4(const void*);
+double fmla_f16_f16_p75_ilp5(const void*);
+double fmla_f16_f16_p75_ilp6(const void*);
+double fmla_f16_f16_p75_ilp7(const void*);
+double fmla_f16_f16_p75_ilp8(const void*);
+double fmla_f16_f16_p75_ilp9(const void*);
+double fmla_f16_f16_p75_ilp10(const void*);
+double fmla_f16_f16_p75_ilp11(const void*);
+double fmla_f16_f16_p75_ilp12(const void*);
+double fmla_f16_f16_p75_ilp13(const void*);
+double fmla_f16_f16_p75_ilp14(const void*);
+double fmla_f16_f16_p75_ilp15(const void*);
+double fmla_f16_f16_p75_ilp16(const void*);
+double fmla_f16_f16_p50_ilp1(const void*);
+double fmla_f16_f16_p50_ilp2(const void*);
+double fmla_f16_f16_p50_ilp3(const void*);
+double fmla_f16_f16_p50_ilp4(const void*);
+double fmla_f16_f16_p50_ilp5(const void*);
+double fmla_f16_f16_p50_ilp6(const void*);
+double fmla_f16_f16_p50_ilp7(const void*);
+double fmla_f16_f16_p50_ilp8(const void*);
+double fmla_f16_f16_p50_ilp9(const void*);
+double fmla_f16_f16_p50_ilp10(const void*);
+double fmla_f16_f16_p50_ilp11(const void*);
+double fmla_f16_f16_p50_ilp12(const void*);
+double fmla_f16_f16_p50_ilp13(const void*);
+double fmla_f16_f16_p50_ilp14(const void*);
+double fmla_f16_f16_p50_ilp15(const void*);
+double fmla_f16_f16_p50_ilp16(const void*);
+double fmla_f16_f16_p25_ilp1(const void*);
+double fmla_f16_f16_p25_ilp2(const void*);
+double fmla_f16_f16_p25_ilp3(const void*);
+double fmla_f16_f16_p25_ilp4(const void*);
+double fmla_f16_f16_p25_ilp5(const void*);
+double fmla_f16_f16_p25_ilp6(const void*);
+double fmla_f16_f16_p25_ilp7(const void*);
+double fmla_f16_f16_p25_ilp8(const void*);
+double fmla_f16_f16_p25_ilp9(const void*);
+double fmla_f16_f16_p25_ilp10(const void*);
+double fmla_f16_f16_p25_ilp11(const void*);
+double fmla_f16_f16_p25_ilp12(const void*);
+double fmla_f16_f16_p25_ilp13(const void*);
+double fmla_f16_f16_p25_ilp14(const void*);
+double fmla_f16_f16_p25_ilp15(const void*);
+double fmla_f16_f16_p25_ilp16(const void*);
+double fmla_f32_f32_ilp1(const void*);
+double fmla_f32_f32_ilp2(const void*);
+double fmla_f32_f32_ilp3(const void*);
+double fmla_f32_f32_ilp4(const void*);
+double fmla_f32_f32_ilp5(const void*);
+double fmla_f32_f32_ilp6(const void*);
+double fmla_f32_f32_ilp7(const void*);
+double fmla_f32_f32_ilp8(const void*);
+double fmla_f32_f32_ilp9(const void*);
+double fmla_f32_f32_ilp10(const void*);
+double fmla_f32_f32_ilp11(const void*);
+double fmla_f32_f32_ilp12(const void*);
+double fmla_f32_f32_ilp13(const void*);
+double fmla_f32_f32_ilp14(const void*);
+double fmla_f32_f32_ilp15(const void*);
+double fmla_f32_f32_ilp16(const void*);
+double fmla_f32_f32_chain8_ilp1(const void*);
+double fmla_f32_f32_chain8_ilp2(const void*);
+double fmla_f32_f32_p75_ilp1(const void*);
+double fmla_f32_f32_p75_ilp2(const void*);
+double fmla_f32_f32_p75_ilp3(const void*);
+double fmla_f32_f32_p75_ilp4(const void*);
+double fmla_f32_f32_p75_ilp5(const void*);
+double fmla_f32_f32_p75_ilp6(const void*);
+double fmla_f32_f32_p75_ilp7(const void*);
+double fmla_f32_f32_p75_ilp8(const void*);
+double fmla_f32_f32_p75_ilp9(const void*);
+double fmla_f32_f32_p75_ilp10(const void*);
+double fmla_f32_f32_p75_ilp11(const void*);
+double fmla_f32_f32_p75_ilp12(const void*);
+double fmla_f32_f32_p75_ilp13(const void*);
+double fmla_f32_f32_p75_ilp14(const void*);
+double fmla_f32_f32_p75_ilp15(const void*);
+double fmla_f32_f32_p75_ilp16(const void*);
+double fmla_f32_f32_p50_ilp1(const void*);
+double fmla_f32_f32_p50_ilp2(const void*);
+double fmla_f32_f32_p50_ilp3(const void*);
+double fmla_f32_f32_p50_ilp4(const void*);
+double fmla_f32_f32_p50_ilp5(const void*);
+double fmla_f32_f32_p50_ilp6(const void*);
+double fmla_f32_f32_p50_ilp7(const void*);
+double fmla_f32_f32_p50_ilp8(const void*);
+double fmla_f32_f32_p50_ilp9(const void*);
+double fmla_f32_f32_p50_ilp10(const void*);
+double fmla_f32_f32_p50_ilp11(const void*);
+double fmla_f32_f32_p50_ilp12(const void*);
+double fmla_f32_f32_p50_ilp13(const void*);
+double fmla_f32_f32_p50_ilp14(const void*);
+double fmla_f32_f32_p50_ilp15(const void*);
+double fmla_f32_f32_p50_ilp16(const void*);
+double fmla_f32_f32_p25_ilp1(const void*);
+double fmla_f32_f32_p25_ilp2(const void*);
+double fmla_f32_f32_p25_ilp3(const void*);
+double fmla_f32_f32_p25_ilp4(const void*);
+double fmla_f32_f32_p25_ilp5(const void*);
+double fmla_f32_f32_p25_ilp6(const void*);
+double fmla_f32_f32_p25_ilp7(const void*);
+double fmla_f32_f32_p25_ilp8(const void*);
+double fmla_f32_f32_p25_ilp9(const void*);
+double fmla_f32_f32_p25_ilp10(const void*);
+double fmla_f32_f32_p25_ilp11(const void*);
+double fmla_f32_f32_p25_ilp12(const void*);
+double fmla_f32_f32_p25_ilp13(const void*);
+double fmla_f32_f32_p25_ilp14(const void*);
+double fmla_f32_f32_p25_ilp15(const void*);
+double fmla_f32_f32_p25_ilp16(const void*);
+double fmla_f64_f64_ilp1(const void*);
+double fmla_f64_f64_ilp2(const void*);
+double fmla_f64_f64_ilp3(const void*);
+double fmla_f64_f64_ilp4(const void*);
+double fmla_f64_f64_ilp5(const void*);
+double fmla_f64_f64_ilp6(const void*);
+double fmla_f64_f64_ilp7(const void*);
+double fmla_f64_f64_ilp8(const void*);
+double fmla_f64_f64_ilp9(const void*);
+double fmla_f64_f64_ilp10(const void*);
+double fmla_f64_f64_ilp11(const void*);
+double fmla_f64_f64_ilp12(const void*);
+double fmla_f64_f64_ilp13(const void*);
+double fmla_f64_f64_ilp14(const void*);
+double fmla_f64_f64_ilp15(const void*);
+double fmla_f64_f64_ilp16(const void*);
+double fmla_f64_f64_chain8_ilp1(const void*);
+double fmla_f64_f64_chain8_ilp2(const void*);
+double fmla_f64_f64_p75_ilp1(const void*);
+double fmla_f64_f64_p75_ilp2(const void*);
+double fmla_f64_f64_p75_ilp3(const void*);
+double fmla_f64_f64_p75_ilp4(const void*);
+double fmla_f64_f64_p75_ilp5(const void*);
+double fmla_f64_f64_p75_ilp6(const void*);
+double fmla_f64_f64_p75_ilp7(const void*);
+double fmla_f64_f64_p75_ilp8(const void*);
+double fmla_f64_f64_p75_ilp9(const void*);
+double fmla_f64_f64_p75_ilp10(const void*);
+double fmla_f64_f64_p75_ilp11(const void*);
+double fmla_f64_f64_p75_ilp12(const void*);
+double fmla_f64_f64_p75_ilp13(const void*);
+double fmla_f64_f64_p75_ilp14(const void*);
+double fmla_f64_f64_p75_ilp15(const void*);
+double fmla_f64_f64_p75_ilp16(const void*);
+double fmla_f64_f64_p50_ilp1(const void*);
+double fmla_f64_f64_p50_ilp2(const void*);
+double fmla_f64_f64_p50_ilp3(const void*);
+double fmla_f64_f64_p50_ilp4(const void*);
+double fmla_f64_f64_p50_ilp5(const void*);
+double fmla_f64_f64_p50_ilp6(const void*);
+double fmla_f64_f64_p50_ilp7(const void*);
+double fmla_f64_f64_p50_ilp8(const void*);
+double fmla_f64_f64_p50_ilp9(const void*);
+double fmla_f64_f64_p50_ilp10(const void*);
+double fmla_f64_f64_p50_ilp11(const void*);
+double fmla_f64_f64_p50_ilp12(const void*);
+double fmla_f64_f64_p50_ilp13(const void*);
+double fmla_f64_f64_p50_ilp14(const void*);
+double fmla_f64_f64_p50_ilp15(const void*);
+double fmla_f64_f64_p50_ilp16(const void*);
+double fmla_f64_f64_p25_ilp1(const void*);
+double fmla_f64_f64_p25_ilp2(const void*);
+double fmla_f64_f64_p25_ilp3(const void*);
+double fmla_f64_f64_p25_ilp4(const void*);
+double fmla_f64_f64_p25_ilp5(const void*);
+double fmla_f64_f64_p25_ilp6(const void*);
+double fmla_f64_f64_p25_ilp7(const void*);
+double fmla_f64_f64_p25_ilp8(const void*);
+double fmla_f64_f64_p25_ilp9(const void*);
+double fmla_f64_f64_p25_ilp10(const void*);
+double fmla_f64_f64_p25_ilp11(const void*);
+double fmla_f64_f64_p25_ilp12(const void*);
+double fmla_f64_f64_p25_ilp13(const void*);
+double fmla_f64_f64_p25_ilp14(const void*);
+double fmla_f64_f64_p25_ilp15(const void*);
+double fmla_f64_f64_p25_ilp16(const void*);
+double fmla_za_f32_f32_vgx2_ilp1(const void*);
+double fmla_za_f32_f32_vgx2_ilp2(const void*);
+double fmla_za_f32_f32_vgx2_ilp3(const void*);
+double fmla_za_f32_f32_vgx2_ilp4(const void*);
+double fmla_za_f32_f32_vgx2_ilp5(const void*);
+double fmla_za_f32_f32_vgx2_ilp6(const void*);
+double fmla_za_f32_f32_vgx2_ilp7(const void*);
+double fmla_za_f32_f32_vgx2_ilp8(const void*);
+double fmla_za_f32_f32_vgx2_ilp9(const void*);
+double fmla_za_f32_f32_vgx2_ilp10(const void*);
+double fmla_za_f32_f32_vgx2_ilp11(const void*);
+double fmla_za_f32_f32_vgx2_ilp12(const void*);
+double fmla_za_f32_f32_vgx2_ilp13(const void*);
+double fmla_za_f32_f32_vgx2_ilp14(const void*);
+double fmla_za_f32_f32_vgx2_ilp15(const void*);
+double fmla_za_f32_f32_vgx2_ilp16(const void*);
+double fmla_za_f32_f32_vgx2_chain8_ilp1(const void*);
+double fmla_za_f32_f32_vgx2_chain8_ilp2(const void*);
+double fmla_za_f32_f32_vgx4_ilp1(const void*);
+double fmla_za_f32_f32_vgx4_ilp2(const void*);
+double fmla_za_f32_f32_vgx4_ilp3(const void*);
+double fmla_za_f32_f32_vgx4_ilp4(const void*);
+double fmla_za_f32_f32_vgx4_ilp5(const void*);
+double fmla_za_f32_f32_vgx4_ilp6(const void*);
+double fmla_za_f32_f32_vgx4_ilp7(const void*);
+double fmla_za_f32_f32_vgx4_ilp8(const void*);
+double fmla_za_f32_f32_vgx4_ilp9(const void*);
+double fmla_za_f32_f32_vgx4_ilp10(const void*);
+double fmla_za_f32_f32_vgx4_ilp11(const void*);
+double fmla_za_f32_f32_vgx4_ilp12(const void*);
+double fmla_za_f32_f32_vgx4_ilp13(const void*);
+double fmla_za_f32_f32_vgx4_ilp14(const void*);
+double fmla_za_f32_f32_vgx4_ilp15(const void*);
+double fmla_za_f32_f32_vgx4_ilp16(const void*);
+double fmla_za_f32_f32_vgx4_chain8_ilp1(const void*);
+double fmla_za_f32_f32_vgx4_chain8_ilp2(const void*);
+double fmla_za_f64_f64_vgx2_ilp1(const void*);
+double fmla_za_f64_f64_vgx2_ilp2(const void*);
+double fmla_za_f64_f64_vgx2_ilp3(const void*);
+double fmla_za_f64_f64_vgx2_ilp4(const void*);
+double fmla_za_f64_f64_vgx2_ilp5(const void*);
+double fmla_za_f64_f64_vgx2_ilp6(const void*);
+double fmla_za_f64_f64_vgx2_ilp7(const void*);
+double fmla_za_f64_f64_vgx2_ilp8(const void*);
+double fmla_za_f64_f64_vgx2_ilp9(const void*);
+double fmla_za_f64_f64_vgx2_ilp10(const void*);
+double fmla_za_f64_f64_vgx2_ilp11(const void*);
+double fmla_za_f64_f64_vgx2_ilp12(const void*);
+double fmla_za_f64_f64_vgx2_ilp13(const void*);
+double fmla_za_f64_f64_vgx2_ilp14(const void*);
+double fmla_za_f64_f64_vgx2_ilp15(const void*);
+double fmla_za_f64_f64_vgx2_ilp16(const void*);
+double fmla_za_f64_f64_vgx2_chain8_ilp1(const void*);
+double fmla_za_f64_f64_vgx2_chain8_ilp2(const void*);
+double fmla_za_f64_f64_vgx4_ilp1(const void*);
+double fmla_za_f64_f64_vgx4_ilp2(const void*);
+double fmla_za_f64_f64_vgx4_ilp3(const void*);
+double fmla_za_f64_f64_vgx4_ilp4(const void*);
+double fmla_za_f64_f64_vgx4_ilp5(const void*);
+double fmla_za_f64_f64_vgx4_ilp6(const void*);
+double fmla_za_f64_f64_vgx4_ilp7(const void*);
+double fmla_za_f64_f64_vgx4_ilp8(const void*);
+double fmla_za_f64_f64_vgx4_ilp9(const void*);
+double fmla_za_f64_f64_vgx4_ilp10(const void*);
+double fmla_za_f64_f64_vgx4_ilp11(const void*);
+double fmla_za_f64_f64_vgx4_ilp12(const void*);
+double fmla_za_f64_f64_vgx4_ilp13(const void*);
+double fmla_za_f64_f64_vgx4_ilp14(const void*);
+double fmla_za_f64_f64_vgx4_ilp15(const void*);
+double fmla_za_f64_f64_vgx4_ilp16(const void*);
+double fmla_za_f64_f64_vgx4_chain8_ilp1(const void*);
+double fmla_za_f64_f64_vgx4_chain8_ilp2(const void*);
+double fmlal_za_f32_f16_vgx2_ilp1(const void*);
+double fmlal_za_f32_f16_vgx2_ilp2(const void*);
+double fmlal_za_f32_f16_vgx2_ilp3(const void*);
+double fmlal_za_f32_f16_vgx2_ilp4(const void*);
+double fmlal_za_f32_f16_vgx2_ilp5(const void*);
+double fmlal_za_f32_f16_vgx2_ilp6(const void*);
+double fmlal_za_f32_f16_vgx2_ilp7(const void*);
+double fmlal_za_f32_f16_vgx2_ilp8(const void*);
+double fmlal_za_f32_f16_vgx2_ilp9(const void*);
+double fmlal_za_f32_f16_vgx2_ilp10(const void*);
+double fmlal_za_f32_f16_vgx2_ilp11(const void*);
+double fmlal_za_f32_f16_vgx2_ilp12(const void*);
+double fmlal_za_f32_f16_vgx2_ilp13(const void*);
+double fmlal_za_f32_f16_vgx2_ilp14(const void*);
+double fmlal_za_f32_f16_vgx2_ilp15(const void*);
+double fmlal_za_f32_f16_vgx2_ilp16(const void*);
+double fmlal_za_f32_f16_vgx2_chain8_ilp1(const void*);
+double fmlal_za_f32_f16_vgx2_chain8_ilp2(const void*);
+double fmlal_za_f32_f16_vgx4_ilp1(const void*);
+double fmlal_za_f32_f16_vgx4_ilp2(const void*);
+double fmlal_za_f32_f16_vgx4_ilp3(const void*);
+double fmlal_za_f32_f16_vgx4_ilp4(const void*);
+double fmlal_za_f32_f16_vgx4_ilp5(const void*);
+double fmlal_za_f32_f16_vgx4_ilp6(const void*);
+double fmlal_za_f32_f16_vgx4_ilp7(const void*);
+double fmlal_za_f32_f16_vgx4_ilp8(const void*);
+double fmlal_za_f32_f16_vgx4_chain8_ilp1(const void*);
+double fmlal_za_f32_f16_vgx4_chain8_ilp2(const void*);
+double bfmlal_za_f32_b16_vgx2_ilp1(const void*);
+double bfmlal_za_f32_b16_vgx2_ilp2(const void*);
+double bfmlal_za_f32_b16_vgx2_ilp3(const void*);
+double bfmlal_za_f32_b16_vgx2_ilp4(const void*);
+double bfmlal_za_f32_b16_vgx2_ilp5(const void*);
+double bfmlal_za_f32_b16_vgx2_ilp6(const void*);
+double bfmlal_za_f32_b16_vgx2_ilp7(const void*);
+double bfmlal_za_f32_b16_vgx2_ilp8(const void*);
+double bfmlal_za_f32_b16_vgx2_ilp9(const void*);
+double bfmlal_za_f32_b16_vgx2_ilp10(const void*);
+double bfmlal_za_f32_b16_vgx2_ilp11(const void*);
+double bfmlal_za_f32_b16_vgx2_ilp12(const void*);
+double bfmlal_za_f32_b16_vgx2_ilp13(const void*);
+double bfmlal_za_f32_b16_vgx2_ilp14(const void*);
+double bfmlal_za_f32_b16_vgx2_ilp15(const void*);
+double bfmlal_za_f32_b16_vgx2_ilp16(const void*);
+double bfmlal_za_f32_b16_vgx2_chain8_ilp1(const void*);
+double bfmlal_za_f32_b16_vgx2_chain8_ilp2(const void*);
+double bfmlal_za_f32_b16_vgx4_ilp1(const void*);
+double bfmlal_za_f32_b16_vgx4_ilp2(const void*);
+double bfmlal_za_f32_b16_vgx4_ilp3(const void*);
+double bfmlal_za_f32_b16_vgx4_ilp4(const void*);
+double bfmlal_za_f32_b16_vgx4_ilp5(const void*);
+double bfmlal_za_f32_b16_vgx4_ilp6(const void*);
+double bfmlal_za_f32_b16_vgx4_ilp7(const void*);
+double bfmlal_za_f32_b16_vgx4_ilp8(const void*);
+double bfmlal_za_f32_b16_vgx4_chain8_ilp1(const void*);
+double bfmlal_za_f32_b16_vgx4_chain8_ilp2(const void*);
+double mla_i8_i8_ilp1(const void*);
+double mla_i8_i8_ilp2(const void*);
+double mla_i8_i8_ilp3(const void*);
+double mla_i8_i8_ilp4(const void*);
+double mla_i8_i8_ilp5(const void*);
+double mla_i8_i8_ilp6(const void*);
+double mla_i8_i8_ilp7(const void*);
+double mla_i8_i8_ilp8(const void*);
+double mla_i8_i8_ilp9(const void*);
+double mla_i8_i8_ilp10(const void*);
+double mla_i8_i8_ilp11(const void*);
+double mla_i8_i8_ilp12(const void*);
+double mla_i8_i8_ilp13(const void*);
+double mla_i8_i8_ilp14(const void*);
+double mla_i8_i8_ilp15(const void*);
+double mla_i8_i8_ilp16(const void*);
+double mla_i8_i8_chain8_ilp1(const void*);
+double mla_i8_i8_chain8_ilp2(const void*);
+double mla_i8_i8_p75_ilp1(const void*);
+double mla_i8_i8_p75_ilp2(const void*);
+double mla_i8_i8_p75_ilp3(const void*);
+double mla_i8_i8_p75_ilp4(const void*);
+double mla_i8_i8_p75_ilp5(const void*);
+double mla_i8_i8_p75_ilp6(const void*);
+double mla_i8_i8_p75_ilp7(const void*);
+double mla_i8_i8_p75_ilp8(const void*);
+double mla_i8_i8_p75_ilp9(const void*);
+double mla_i8_i8_p75_ilp10(const void*);
+double mla_i8_i8_p75_ilp11(const void*);
+double mla_i8_i8_p75_ilp12(const void*);
+double mla_i8_i8_p75_ilp13(const void*);
+double mla_i8_i8_p75_ilp14(const void*);
+double mla_i8_i8_p75_ilp15(const void*);
+double mla_i8_i8_p75_ilp16(const void*);
+double mla_i8_i8_p50_ilp1(const void*);
+double mla_i8_i8_p50_ilp2(const void*);
+double mla_i8_i8_p50_ilp3(const void*);
+double mla_i8_i8_p50_ilp4(const void*);
+double mla_i8_i8_p50_ilp5(const void*);
+double mla_i8_i8_p50_ilp6(const void*);
+double mla_i8_i8_p50_ilp7(const void*);
+double mla_i8_i8_p50_ilp8(const void*);
+double mla_i8_i8_p50_ilp9(const void*);
+double mla_i8_i8_p50_ilp10(const void*);
+double mla_i8_i8_p50_ilp11(const void*);
+double mla_i8_i8_p50_ilp12(const void*);
+double mla_i8_i8_p50_ilp13(const void*);
+double mla_i8_i8_p50_ilp14(const void*);
+double mla_i8_i8_p50_ilp15(const void*);
+double mla_i8_i8_p50_ilp16(const void*);
+double mla_i8_i8_p25_ilp1(const void*);
+double mla_i8_i8_p25_ilp2(const void*);
+double mla_i8_i8_p25_ilp3(const void*);
+double mla_i8_i8_p25_ilp4(const void*);
+double mla_i8_i8_p25_ilp5(const void*);
+double mla_i8_i8_p25_ilp6(const void*);
+double mla_i8_i8_p25_ilp7(const void*);
+double mla_i8_i8_p25_ilp8(const void*);
+double mla_i8_i8_p25_ilp9(const void*);
+double mla_i8_i8_p25_ilp10(const void*);
+double mla_i8_i8_p25_ilp11(const void*);
+double mla_i8_i8_p25_ilp12(const void*);
+double mla_i8_i8_p25_ilp13(const void*);
+double mla_i8_i8_p25_ilp14(const void*);
+double mla_i8_i8_p25_ilp15(const void*);
+double mla_i8_i8_p25_ilp16(const void*);
+double mla_i16_i16_ilp1(const void*);
+double mla_i16_i16_ilp2(const void*);
+double mla_i16_i16_ilp3(const void*);
+double mla_i16_i16_ilp4(const void*);
+double mla_i16_i16_ilp5(const void*);
+double mla_i16_i16_ilp6(const void*);
+double mla_i16_i16_ilp7(const void*);
+double mla_i16_i16_ilp8(const void*);
+double mla_i16_i16_ilp9(const void*);
+double mla_i16_i16_ilp10(const void*);
+double mla_i16_i16_ilp11(const void*);
+double mla_i16_i16_ilp12(const void*);
+double mla_i16_i16_ilp13(const void*);
+double mla_i16_i16_ilp14(const void*);
+double mla_i16_i16_ilp15(const void*);
+double mla_i16_i16_ilp16(const void*);
+double mla_i16_i16_chain8_ilp1(const void*);
+double mla_i16_i16_chain8_ilp2(const void*);
+double mla_i16_i16_p75_ilp1(const void*);
+double mla_i16_i16_p75_ilp2(const void*);
+double mla_i16_i16_p75_ilp3(const void*);
+double mla_i16_i16_p75_ilp4(const void*);
+double mla_i16_i16_p75_ilp5(const void*);
+double mla_i16_i16_p75_ilp6(const void*);
+double mla_i16_i16_p75_ilp7(const void*);
+double mla_i16_i16_p75_ilp8(const void*);
+double mla_i16_i16_p75_ilp9(const void*);
+double mla_i16_i16_p75_ilp10(const void*);
+double mla_i16_i16_p75_ilp11(const void*);
+double mla_i16_i16_p75_ilp12(const void*);
+double mla_i16_i16_p75_ilp13(const void*);
+double mla_i16_i16_p75_ilp14(const void*);
+double mla_i16_i16_p75_ilp15(const void*);
+double mla_i16_i16_p75_ilp16(const void*);
+double mla_i16_i16_p50_ilp1(const void*);
+double mla_i16_i16_p50_ilp2(const void*);
+double mla_i16_i16_p50_ilp3(const void*);
+double mla_i16_i16_p50_ilp4(const void*);
+double mla_i16_i16_p50_ilp5(const void*);
+double mla_i16_i16_p50_ilp6(const void*);
+double mla_i16_i16_p50_ilp7(const void*);
+double mla_i16_i16_p50_ilp8(const void*);
+double mla_i16_i16_p50_ilp9(const void*);
+double mla_i16_i16_p50_ilp10(const void*);
+double mla_i16_i16_p50_ilp11(const void*);
+double mla_i16_i16_p50_ilp12(const void*);
+double mla_i16_i16_p50_ilp13(const void*);
+double mla_i16_i16_p50_ilp14(const void*);
+double mla_i16_i16_p50_ilp15(const void*);
+double mla_i16_i16_p50_ilp16(const void*);
+double mla_i16_i16_p25_ilp1(const void*);
+double mla_i16_i16_p25_ilp2(const void*);
+double mla_i16_i16_p25_ilp3(const void*);
+double mla_i16_i16_p25_ilp4(const void*);
+double mla_i16_i16_p25_ilp5(const void*);
+double mla_i16_i16_p25_ilp6(const void*);
+double mla_i16_i16_p25_ilp7(const void*);
+double mla_i16_i16_p25_ilp8(const void*);
+double mla_i16_i16_p25_ilp9(const void*);
+double mla_i16_i16_p25_ilp10(const void*);
+double mla_i16_i16_p25_ilp11(const void*);
+double mla_i16_i16_p25_ilp12(const void*);
+double mla_i16_i16_p25_ilp13(const void*);
+double mla_i16_i16_p25_ilp14(const void*);
+double mla_i16_i16_p25_ilp15(const void*);
+double mla_i16_i16_p25_ilp16(const void*);
+double mla_i32_i32_ilp1(const void*);
+double mla_i32_i32_ilp2(const void*);
+double mla_i32_i32_ilp3(const void*);
+double mla_i32_i32_ilp4(const void*);
+double mla_i32_i32_ilp5(const void*);
+double mla_i32_i32_ilp6(const void*);
+double mla_i32_i32_ilp7(const void*);
+double mla_i32_i32_ilp8(const void*);
+double mla_i32_i32_ilp9(const void*);
+double mla_i32_i32_ilp10(const void*);
+double mla_i32_i32_ilp11(const void*);
+double mla_i32_i32_ilp12(const void*);
+double mla_i32_i32_ilp13(const void*);
+double mla_i32_i32_ilp14(const void*);
+double mla_i32_i32_ilp15(const void*);
+double mla_i32_i32_ilp16(const void*);
+double mla_i32_i32_chain8_ilp1(const void*);
+double mla_i32_i32_chain8_ilp2(const void*);
+double mla_i32_i32_p75_ilp1(const void*);
+double mla_i32_i32_p75_ilp2(const void*);
+double mla_i32_i32_p75_ilp3(const void*);
+double mla_i32_i32_p75_ilp4(const void*);
+double mla_i32_i32_p75_ilp5(const void*);
+double mla_i32_i32_p75_ilp6(const void*);
+double mla_i32_i32_p75_ilp7(const void*);
+double mla_i32_i32_p75_ilp8(const void*);
+double mla_i32_i32_p75_ilp9(const void*);
+double mla_i32_i32_p75_ilp10(const void*);
+double mla_i32_i32_p75_ilp11(const void*);
+double mla_i32_i32_p75_ilp12(const void*);
+double mla_i32_i32_p75_ilp13(const void*);
+double mla_i32_i32_p75_ilp14(const void*);
+double mla_i32_i32_p75_ilp15(const void*);
+double mla_i32_i32_p75_ilp16(const void*);
+double mla_i32_i32_p50_ilp1(const void*);
+double mla_i32_i32_p50_ilp2(const void*);
+double mla_i32_i32_p50_ilp3(const void*);
+double mla_i32_i32_p50_ilp4(const void*);
+double mla_i32_i32_p50_ilp5(const void*);
+double mla_i32_i32_p50_ilp6(const void*);
+double mla_i32_i32_p50_ilp7(const void*);
+double mla_i32_i32_p50_ilp8(const void*);
+double mla_i32_i32_p50_ilp9(const void*);
+double mla_i32_i32_p50_ilp10(const void*);
+double mla_i32_i32_p50_ilp11(const void*);
+double mla_i32_i32_p50_ilp12(const void*);
+double mla_i32_i32_p50_ilp13(const void*);
+double mla_i32_i32_p50_ilp14(const void*);
+double mla_i32_i32_p50_ilp15(const void*);
+double mla_i32_i32_p50_ilp16(const void*);
+double mla_i32_i32_p25_ilp1(const void*);
+double mla_i32_i32_p25_ilp2(const void*);
+double mla_i32_i32_p25_ilp3(const void*);
+double mla_i32_i32_p25_ilp4(const void*);
+double mla_i32_i32_p25_ilp5(const void*);
+double mla_i32_i32_p25_ilp6(const void*);
+double mla_i32_i32_p25_ilp7(const void*);
+double mla_i32_i32_p25_ilp8(const void*);
+double mla_i32_i32_p25_ilp9(const void*);
+double mla_i32_i32_p25_ilp10(const void*);
+double mla_i32_i32_p25_ilp11(const void*);
+double mla_i32_i32_p25_ilp12(const void*);
+double mla_i32_i32_p25_ilp13(const void*);
+double mla_i32_i32_p25_ilp14(const void*);
+double mla_i32_i32_p25_ilp15(const void*);
+double mla_i32_i32_p25_ilp16(const void*);
+double mla_i64_i64_ilp1(const void*);
+double mla_i64_i64_ilp2(const void*);
+double mla_i64_i64_ilp3(const void*);
+double mla_i64_i64_ilp4(const void*);
+double mla_i64_i64_ilp5(const void*);
+double mla_i64_i64_ilp6(const void*);
+double mla_i64_i64_ilp7(const void*);
+double mla_i64_i64_ilp8(const void*);
+double mla_i64_i64_ilp9(const void*);
+double mla_i64_i64_ilp10(const void*);
+double mla_i64_i64_ilp11(const void*);
+double mla_i64_i64_ilp12(const void*);
+double mla_i64_i64_ilp13(const void*);
+double mla_i64_i64_ilp14(const void*);
+double mla_i64_i64_ilp15(const void*);
+double mla_i64_i64_ilp16(const void*);
+double mla_i64_i64_chain8_ilp1(const void*);
+double mla_i64_i64_chain8_ilp2(const void*);
+double mla_i64_i64_p75_ilp1(const void*);
+double mla_i64_i64_p75_ilp2(const void*);
+double mla_i64_i64_p75_ilp3(const void*);
+double mla_i64_i64_p75_ilp4(const void*);
+double mla_i64_i64_p75_ilp5(const void*);
+double mla_i64_i64_p75_ilp6(const void*);
+double mla_i64_i64_p75_ilp7(const void*);
+double mla_i64_i64_p75_ilp8(const void*);
+double mla_i64_i64_p75_ilp9(const void*);
+double mla_i64_i64_p75_ilp10(const void*);
+double mla_i64_i64_p75_ilp11(const void*);
+double mla_i64_i64_p75_ilp12(const void*);
+double mla_i64_i64_p75_ilp13(const void*);
+double mla_i64_i64_p75_ilp14(const void*);
+double mla_i64_i64_p75_ilp15(const void*);
+double mla_i64_i64_p75_ilp16(const void*);
+double mla_i64_i64_p50_ilp1(const void*);
+double mla_i64_i64_p50_ilp2(const void*);
+double mla_i64_i64_p50_ilp3(const void*);
+double mla_i64_i64_p50_ilp4(const void*);
+double mla_i64_i64_p50_ilp5(const void*);
+double mla_i64_i64_p50_ilp6(const void*);
+double mla_i64_i64_p50_ilp7(const void*);
+double mla_i64_i64_p50_ilp8(const void*);
+double mla_i64_i64_p50_ilp9(const void*);
+double mla_i64_i64_p50_ilp10(const void*);
+double mla_i64_i64_p50_ilp11(const void*);
+double mla_i64_i64_p50_ilp12(const void*);
+double mla_i64_i64_p50_ilp13(const void*);
+double mla_i64_i64_p50_ilp14(const void*);
+double mla_i64_i64_p50_ilp15(const void*);
+double mla_i64_i64_p50_ilp16(const void*);
+double mla_i64_i64_p25_ilp1(const void*);
+double mla_i64_i64_p25_ilp2(const void*);
+double mla_i64_i64_p25_ilp3(const void*);
+double mla_i64_i64_p25_ilp4(const void*);
+double mla_i64_i64_p25_ilp5(const void*);
+double mla_i64_i64_p25_ilp6(const void*);
+double mla_i64_i64_p25_ilp7(const void*);
+double mla_i64_i64_p25_ilp8(const void*);
+double mla_i64_i64_p25_ilp9(const void*);
+double mla_i64_i64_p25_ilp10(const void*);
+double mla_i64_i64_p25_ilp11(const void*);
+double mla_i64_i64_p25_ilp12(const void*);
+double mla_i64_i64_p25_ilp13(const void*);
+double mla_i64_i64_p25_ilp14(const void*);
+double mla_i64_i64_p25_ilp15(const void*);
+double mla_i64_i64_p25_ilp16(const void*);
+double smlal_za_i32_i16_vgx2_ilp1(const void*);
+double smlal_za_i32_i16_vgx2_ilp2(const void*);
+double smlal_za_i32_i16_vgx2_ilp3(const void*);
+double smlal_za_i32_i16_vgx2_ilp4(const void*);
+double smlal_za_i32_i16_vgx2_ilp5(const void*);
+double smlal_za_i32_i16_vgx2_ilp6(const void*);
+double smlal_za_i32_i16_vgx2_ilp7(const void*);
+double smlal_za_i32_i16_vgx2_ilp8(const void*);
+double smlal_za_i32_i16_vgx2_ilp9(const void*);
+double smlal_za_i32_i16_vgx2_ilp10(const void*);
+double smlal_za_i32_i16_vgx2_ilp11(const void*);
+double smlal_za_i32_i16_vgx2_ilp12(const void*);
+double smlal_za_i32_i16_vgx2_ilp13(const void*);
+double smlal_za_i32_i16_vgx2_ilp14(const void*);
+double smlal_za_i32_i16_vgx2_ilp15(const void*);
+double smlal_za_i32_i16_vgx2_ilp16(const void*);
+double smlal_za_i32_i16_vgx2_chain8_ilp1(const void*);
+double smlal_za_i32_i16_vgx2_chain8_ilp2(const void*);
+double smlal_za_i32_i16_vgx4_ilp1(const void*);
+double smlal_za_i32_i16_vgx4_ilp2(const void*);
+double smlal_za_i32_i16_vgx4_ilp3(const void*);
+double smlal_za_i32_i16_vgx4_ilp4(const void*);
+double smlal_za_i32_i16_vgx4_ilp5(const void*);
+double smlal_za_i32_i16_vgx4_ilp6(const void*);
+double smlal_za_i32_i16_vgx4_ilp7(const void*);
+double smlal_za_i32_i16_vgx4_ilp8(const void*);
+double smlal_za_i32_i16_vgx4_chain8_ilp1(const void*);
+double smlal_za_i32_i16_vgx4_chain8_ilp2(const void*);
+double smlall_za_i32_i8_vgx2_ilp1(const void*);
+double smlall_za_i32_i8_vgx2_ilp2(const void*);
+double smlall_za_i32_i8_vgx2_ilp3(const void*);
+double smlall_za_i32_i8_vgx2_ilp4(const void*);
+double smlall_za_i32_i8_vgx2_ilp5(const void*);
+double smlall_za_i32_i8_vgx2_ilp6(const void*);
+double smlall_za_i32_i8_vgx2_ilp7(const void*);
+double smlall_za_i32_i8_vgx2_ilp8(const void*);
+double smlall_za_i32_i8_vgx2_chain8_ilp1(const void*);
+double smlall_za_i32_i8_vgx2_chain8_ilp2(const void*);
+double smlall_za_i32_i8_vgx4_ilp1(const void*);
+double smlall_za_i32_i8_vgx4_ilp2(const void*);
+double smlall_za_i32_i8_vgx4_ilp3(const void*);
+double smlall_za_i32_i8_vgx4_ilp4(const void*);
+double smlall_za_i32_i8_vgx4_chain8_ilp1(const void*);
+double smlall_za_i32_i8_vgx4_chain8_ilp2(const void*);
+double smlall_za_i64_i16_vgx2_ilp1(const void*);
+double smlall_za_i64_i16_vgx2_ilp2(const void*);
+double smlall_za_i64_i16_vgx2_ilp3(const void*);
+double smlall_za_i64_i16_vgx2_ilp4(const void*);
+double smlall_za_i64_i16_vgx2_ilp5(const void*);
+double smlall_za_i64_i16_vgx2_ilp6(const void*);
+double smlall_za_i64_i16_vgx2_ilp7(const void*);
+double smlall_za_i64_i16_vgx2_ilp8(const void*);
+double smlall_za_i64_i16_vgx2_chain8_ilp1(const void*);
+double smlall_za_i64_i16_vgx2_chain8_ilp2(const void*);
+double smlall_za_i64_i16_vgx4_ilp1(const void*);
+double smlall_za_i64_i16_vgx4_ilp2(const void*);
+double smlall_za_i64_i16_vgx4_ilp3(const void*);
+double smlall_za_i64_i16_vgx4_ilp4(const void*);
+double smlall_za_i64_i16_vgx4_chain8_ilp1(const void*);
+double smlall_za_i64_i16_vgx4_chain8_ilp2(const void*);
+double fmopa_za_f16_f16_ilp1(const void*);
+double fmopa_za_f16_f16_ilp2(const void*);
+double fmopa_za_f16_f16_chain8_ilp1(const void*);
+double fmopa_za_f16_f16_chain8_ilp2(const void*);
+double fmopa_za_f16_f16_p75_ilp1(const void*);
+double fmopa_za_f16_f16_p75_ilp2(const void*);
+double fmopa_za_f16_f16_p50_ilp1(const void*);
+double fmopa_za_f16_f16_p50_ilp2(const void*);
+double fmopa_za_f16_f16_p25_ilp1(const void*);
+double fmopa_za_f16_f16_p25_ilp2(const void*);
+double fmopa_za_f32_f32_ilp1(const void*);
+double fmopa_za_f32_f32_ilp2(const void*);
+double fmopa_za_f32_f32_ilp3(const void*);
+double fmopa_za_f32_f32_ilp4(const void*);
+double fmopa_za_f32_f32_chain8_ilp1(const void*);
+double fmopa_za_f32_f32_chain8_ilp2(const void*);
+double fmopa_za_f32_f32_p75_ilp1(const void*);
+double fmopa_za_f32_f32_p75_ilp2(const void*);
+double fmopa_za_f32_f32_p75_ilp3(const void*);
+double fmopa_za_f32_f32_p75_ilp4(const void*);
+double fmopa_za_f32_f32_p50_ilp1(const void*);
+double fmopa_za_f32_f32_p50_ilp2(const void*);
+double fmopa_za_f32_f32_p50_ilp3(const void*);
+double fmopa_za_f32_f32_p50_ilp4(const void*);
+double fmopa_za_f32_f32_p25_ilp1(const void*);
+double fmopa_za_f32_f32_p25_ilp2(const void*);
+double fmopa_za_f32_f32_p25_ilp3(const void*);
+double fmopa_za_f32_f32_p25_ilp4(const void*);
+double fmopa_za_f64_f64_ilp1(const void*);
+double fmopa_za_f64_f64_ilp2(const void*);
+double fmopa_za_f64_f64_ilp3(const void*);
+double fmopa_za_f64_f64_ilp4(const void*);
+double fmopa_za_f64_f64_ilp5(const void*);
+double fmopa_za_f64_f64_ilp6(const void*);
+double fmopa_za_f64_f64_ilp7(const void*);
+double fmopa_za_f64_f64_ilp8(const void*);
+double fmopa_za_f64_f64_chain8_ilp1(const void*);
+double fmopa_za_f64_f64_chain8_ilp2(const void*);
+double fmopa_za_f64_f64_p75_ilp1(const void*);
+double fmopa_za_f64_f64_p75_ilp2(const void*);
+double fmopa_za_f64_f64_p75_ilp3(const void*);
+double fmopa_za_f64_f64_p75_ilp4(const void*);
+double fmopa_za_f64_f64_p75_ilp5(const void*);
+double fmopa_za_f64_f64_p75_ilp6(const void*);
+double fmopa_za_f64_f64_p75_ilp7(const void*);
+double fmopa_za_f64_f64_p75_ilp8(const void*);
+double fmopa_za_f64_f64_p50_ilp1(const void*);
+double fmopa_za_f64_f64_p50_ilp2(const void*);
+double fmopa_za_f64_f64_p50_ilp3(const void*);
+double fmopa_za_f64_f64_p50_ilp4(const void*);
+double fmopa_za_f64_f64_p50_ilp5(const void*);
+double fmopa_za_f64_f64_p50_ilp6(const void*);
+double fmopa_za_f64_f64_p50_ilp7(const void*);
+double fmopa_za_f64_f64_p50_ilp8(const void*);
+double fmopa_za_f64_f64_p25_ilp1(const void*);
+double fmopa_za_f64_f64_p25_ilp2(const void*);
+double fmopa_za_f64_f64_p25_ilp3(const void*);
+double fmopa_za_f64_f64_p25_ilp4(const void*);
+double fmopa_za_f64_f64_p25_ilp5(const void*);
+double fmopa_za_f64_f64_p25_ilp6(const void*);
+double fmopa_za_f64_f64_p25_ilp7(const void*);
+double fmopa_za_f64_f64_p25_ilp8(const void*);
+double fmopa_za_f32_f16_ilp1(const void*);
+double fmopa_za_f32_f16_ilp2(const void*);
+double fmopa_za_f32_f16_ilp3(const void*);
+double fmopa_za_f32_f16_ilp4(const void*);
+double fmopa_za_f32_f16_chain8_ilp1(const void*);
+double fmopa_za_f32_f16_chain8_ilp2(const void*);
+double fmopa_za_f32_f16_p75_ilp1(const void*);
+double fmopa_za_f32_f16_p75_ilp2(const void*);
+double fmopa_za_f32_f16_p75_ilp3(const void*);
+double fmopa_za_f32_f16_p75_ilp4(const void*);
+double fmopa_za_f32_f16_p50_ilp1(const void*);
+double fmopa_za_f32_f16_p50_ilp2(const void*);
+double fmopa_za_f32_f16_p50_ilp3(const void*);
+double fmopa_za_f32_f16_p50_ilp4(const void*);
+double fmopa_za_f32_f16_p25_ilp1(const void*);
+double fmopa_za_f32_f16_p25_ilp2(const void*);
+double fmopa_za_f32_f16_p25_ilp3(const void*);
+double fmopa_za_f32_f16_p25_ilp4(const void*);
+double bfmopa_za_f32_b16_ilp1(const void*);
+double bfmopa_za_f32_b16_ilp2(const void*);
+double bfmopa_za_f32_b16_ilp3(const void*);
+double bfmopa_za_f32_b16_ilp4(const void*);
+double bfmopa_za_f32_b16_chain8_ilp1(const void*);
+double bfmopa_za_f32_b16_chain8_ilp2(const void*);
+double bfmopa_za_f32_b16_p75_ilp1(const void*);
+double bfmopa_za_f32_b16_p75_ilp2(const void*);
+double bfmopa_za_f32_b16_p75_ilp3(const void*);
+double bfmopa_za_f32_b16_p75_ilp4(const void*);
+double bfmopa_za_f32_b16_p50_ilp1(const void*);
+double bfmopa_za_f32_b16_p50_ilp2(const void*);
+double bfmopa_za_f32_b16_p50_ilp3(const void*);
+double bfmopa_za_f32_b16_p50_ilp4(const void*);
+double bfmopa_za_f32_b16_p25_ilp1(const void*);
+double bfmopa_za_f32_b16_p25_ilp2(const void*);
+double bfmopa_za_f32_b16_p25_ilp3(const void*);
+double bfmopa_za_f32_b16_p25_ilp4(const void*);
+double smopa_za_i32_i16_ilp1(const void*);
+double smopa_za_i32_i16_ilp2(const void*);
+double smopa_za_i32_i16_ilp3(const void*);
+double smopa_za_i32_i16_ilp4(const void*);
+double smopa_za_i32_i16_chain8_ilp1(const void*);
+double smopa_za_i32_i16_chain8_ilp2(const void*);
+double smopa_za_i32_i16_p75_ilp1(const void*);
+double smopa_za_i32_i16_p75_ilp2(const void*);
+double smopa_za_i32_i16_p75_ilp3(const void*);
+double smopa_za_i32_i16_p75_ilp4(const void*);
+double smopa_za_i32_i16_p50_ilp1(const void*);
+double smopa_za_i32_i16_p50_ilp2(const void*);
+double smopa_za_i32_i16_p50_ilp3(const void*);
+double smopa_za_i32_i16_p50_ilp4(const void*);
+double smopa_za_i32_i16_p25_ilp1(const void*);
+double smopa_za_i32_i16_p25_ilp2(const void*);
+double smopa_za_i32_i16_p25_ilp3(const void*);
+double smopa_za_i32_i16_p25_ilp4(const void*);
+double smopa_za_i32_i8_ilp1(const void*);
+double smopa_za_i32_i8_ilp2(const void*);
+double smopa_za_i32_i8_ilp3(const void*);
+double smopa_za_i32_i8_ilp4(const void*);
+double smopa_za_i32_i8_chain8_ilp1(const void*);
+double smopa_za_i32_i8_chain8_ilp2(const void*);
+double smopa_za_i32_i8_p75_ilp1(const void*);
+double smopa_za_i32_i8_p75_ilp2(const void*);
+double smopa_za_i32_i8_p75_ilp3(const void*);
+double smopa_za_i32_i8_p75_ilp4(const void*);
+double smopa_za_i32_i8_p50_ilp1(const void*);
+double smopa_za_i32_i8_p50_ilp2(const void*);
+double smopa_za_i32_i8_p50_ilp3(const void*);
+double smopa_za_i32_i8_p50_ilp4(const void*);
+double smopa_za_i32_i8_p25_ilp1(const void*);
+double smopa_za_i32_i8_p25_ilp2(const void*);
+double smopa_za_i32_i8_p25_ilp3(const void*);
+double smopa_za_i32_i8_p25_ilp4(const void*);
+double smopa_za_i64_i16_ilp1(const void*);
+double smopa_za_i64_i16_ilp2(const void*);
+double smopa_za_i64_i16_ilp3(const void*);
+double smopa_za_i64_i16_ilp4(const void*);
+double smopa_za_i64_i16_ilp5(const void*);
+double smopa_za_i64_i16_ilp6(const void*);
+double smopa_za_i64_i16_ilp7(const void*);
+double smopa_za_i64_i16_ilp8(const void*);
+double smopa_za_i64_i16_chain8_ilp1(const void*);
+double smopa_za_i64_i16_chain8_ilp2(const void*);
+double smopa_za_i64_i16_p75_ilp1(const void*);
+double smopa_za_i64_i16_p75_ilp2(const void*);
+double smopa_za_i64_i16_p75_ilp3(const void*);
+double smopa_za_i64_i16_p75_ilp4(const void*);
+double smopa_za_i64_i16_p75_ilp5(const void*);
+double smopa_za_i64_i16_p75_ilp6(const void*);
+double smopa_za_i64_i16_p75_ilp7(const void*);
+double smopa_za_i64_i16_p75_ilp8(const void*);
+double smopa_za_i64_i16_p50_ilp1(const void*);
+double smopa_za_i64_i16_p50_ilp2(const void*);
+double smopa_za_i64_i16_p50_ilp3(const void*);
+double smopa_za_i64_i16_p50_ilp4(const void*);
+double smopa_za_i64_i16_p50_ilp5(const void*);
+double smopa_za_i64_i16_p50_ilp6(const void*);
+double smopa_za_i64_i16_p50_ilp7(const void*);
+double smopa_za_i64_i16_p50_ilp8(const void*);
+double smopa_za_i64_i16_p25_ilp1(const void*);
+double smopa_za_i64_i16_p25_ilp2(const void*);
+double smopa_za_i64_i16_p25_ilp3(const void*);
+double smopa_za_i64_i16_p25_ilp4(const void*);
+double smopa_za_i64_i16_p25_ilp5(const void*);
+double smopa_za_i64_i16_p25_ilp6(const void*);
+double smopa_za_i64_i16_p25_ilp7(const void*);
+double smopa_za_i64_i16_p25_ilp8(const void*);
+
+// benchmark setup
+static void* setup(const void* params) {
+  // the number of iterations (size_t) is passed as the benchmark parameter
+  assert(params != nullptr);
+  return (void*)params;
+}
+
+static void teardown(void* data) {
+  assert(data != nullptr);
+}
+
+// benchmark table
+static const op_benchmark_t benchmarks[] = {
+  {{ &setup, &mova_z_register_f32_f32_ilp1, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32)", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 16, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &mova_z_register_f32_f32_ilp2, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32)", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 16, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &mova_z_register_f32_f32_ilp3, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32)", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 16, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &mova_z_register_f32_f32_ilp4, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32)", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 16, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &mova_z_register_f32_f32_ilp5, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32)", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 16, 5, "throughput", 1, 1.0, 1600000},
+  {{ &setup, &mova_z_register_f32_f32_ilp6, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32)", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 16, 6, "throughput", 1, 1.0, 1333333},
+  {{ &setup, &mova_z_register_f32_f32_ilp7, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32)", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 16, 7, "throughput", 1, 1.0, 1142857},
+  {{ &setup, &mova_z_register_f32_f32_ilp8, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32)", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 16, 8, "throughput", 1, 1.0, 1000000},
+  {{ &setup, &mova_z_register_f32_f32_ilp9, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32)", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 16, 9, "throughput", 1, 1.0, 888888},
+  {{ &setup, &mova_z_register_f32_f32_ilp10, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32)", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 16, 10, "throughput", 1, 1.0, 800000},
+  {{ &setup, &mova_z_register_f32_f32_ilp11, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32)", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 16, 11, "throughput", 1, 1.0, 727272},
+  {{ &setup, &mova_z_register_f32_f32_ilp12, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32)", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 16, 12, "throughput", 1, 1.0, 666666},
+  {{ &setup, &mova_z_register_f32_f32_ilp13, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32)", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 16, 13, "throughput", 1, 1.0, 615384},
+  {{ &setup, &mova_z_register_f32_f32_ilp14, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32)", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 16, 14, "throughput", 1, 1.0, 571428},
+  {{ &setup, &mova_z_register_f32_f32_ilp15, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32)", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 16, 15, "throughput", 1, 1.0, 533333},
+  {{ &setup, &mova_z_register_f32_f32_ilp16, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32)", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 16, 16, "throughput", 1, 1.0, 500000},
+  {{ &setup, &mova_z_register_f32_f32_p75_ilp1, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32), 75% active lanes", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 12, 1, "throughput", 1, 0.75, 8000000},
+  {{ &setup, &mova_z_register_f32_f32_p75_ilp2, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32), 75% active lanes", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 12, 2, "throughput", 1, 0.75, 4000000},
+  {{ &setup, &mova_z_register_f32_f32_p75_ilp3, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32), 75% active lanes", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 12, 3, "throughput", 1, 0.75, 2666666},
+  {{ &setup, &mova_z_register_f32_f32_p75_ilp4, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32), 75% active lanes", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 12, 4, "throughput", 1, 0.75, 2000000},
+  {{ &setup, &mova_z_register_f32_f32_p75_ilp5, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32), 75% active lanes", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 12, 5, "throughput", 1, 0.75, 1600000},
+  {{ &setup, &mova_z_register_f32_f32_p75_ilp6, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32), 75% active lanes", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 12, 6, "throughput", 1, 0.75, 1333333},
+  {{ &setup, &mova_z_register_f32_f32_p75_ilp7, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32), 75% active lanes", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 12, 7, "throughput", 1, 0.75, 1142857},
+  {{ &setup, &mova_z_register_f32_f32_p75_ilp8, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32), 75% active lanes", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 12, 8, "throughput", 1, 0.75, 1000000},
+  {{ &setup, &mova_z_register_f32_f32_p75_ilp9, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32), 75% active lanes", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 12, 9, "throughput", 1, 0.75, 888888},
+  {{ &setup, &mova_z_register_f32_f32_p75_ilp10, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32), 75% active lanes", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 12, 10, "throughput", 1, 0.75, 800000},
+  {{ &setup, &mova_z_register_f32_f32_p75_ilp11, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32), 75% active lanes", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 12, 11, "throughput", 1, 0.75, 727272},
+  {{ &setup, &mova_z_register_f32_f32_p75_ilp12, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32), 75% active lanes", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 12, 12, "throughput", 1, 0.75, 666666},
+  {{ &setup, &mova_z_register_f32_f32_p75_ilp13, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32), 75% active lanes", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 12, 13, "throughput", 1, 0.75, 615384},
+  {{ &setup, &mova_z_register_f32_f32_p75_ilp14, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32), 75% active lanes", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 12, 14, "throughput", 1, 0.75, 571428},
+  {{ &setup, &mova_z_register_f32_f32_p75_ilp15, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32), 75% active lanes", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 12, 15, "throughput", 1, 0.75, 533333},
+  {{ &setup, &mova_z_register_f32_f32_p75_ilp16, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32), 75% active lanes", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 12, 16, "throughput", 1, 0.75, 500000},
+  {{ &setup, &mova_z_register_f32_f32_p50_ilp1, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32), 50% active lanes", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 8, 1, "throughput", 1, 0.5, 8000000},
+  {{ &setup, &mova_z_register_f32_f32_p50_ilp2, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32), 50% active lanes", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 8, 2, "throughput", 1, 0.5, 4000000},
+  {{ &setup, &mova_z_register_f32_f32_p50_ilp3, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32), 50% active lanes", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 8, 3, "throughput", 1, 0.5, 2666666},
+  {{ &setup, &mova_z_register_f32_f32_p50_ilp4, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32), 50% active lanes", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 8, 4, "throughput", 1, 0.5, 2000000},
+  {{ &setup, &mova_z_register_f32_f32_p50_ilp5, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32), 50% active lanes", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 8, 5, "throughput", 1, 0.5, 1600000},
+  {{ &setup, &mova_z_register_f32_f32_p50_ilp6, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32), 50% active lanes", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 8, 6, "throughput", 1, 0.5, 1333333},
+  {{ &setup, &mova_z_register_f32_f32_p50_ilp7, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32), 50% active lanes", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 8, 7, "throughput", 1, 0.5, 1142857},
+  {{ &setup, &mova_z_register_f32_f32_p50_ilp8, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32), 50% active lanes", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 8, 8, "throughput", 1, 0.5, 1000000},
+  {{ &setup, &mova_z_register_f32_f32_p50_ilp9, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32), 50% active lanes", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 8, 9, "throughput", 1, 0.5, 888888},
+  {{ &setup, &mova_z_register_f32_f32_p50_ilp10, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32), 50% active lanes", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 8, 10, "throughput", 1, 0.5, 800000},
+  {{ &setup, &mova_z_register_f32_f32_p50_ilp11, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32), 50% active lanes", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 8, 11, "throughput", 1, 0.5, 727272},
+  {{ &setup, &mova_z_register_f32_f32_p50_ilp12, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32), 50% active lanes", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 8, 12, "throughput", 1, 0.5, 666666},
+  {{ &setup, &mova_z_register_f32_f32_p50_ilp13, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32), 50% active lanes", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 8, 13, "throughput", 1, 0.5, 615384},
+  {{ &setup, &mova_z_register_f32_f32_p50_ilp14, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32), 50% active lanes", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 8, 14, "throughput", 1, 0.5, 571428},
+  {{ &setup, &mova_z_register_f32_f32_p50_ilp15, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32), 50% active lanes", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 8, 15, "throughput", 1, 0.5, 533333},
+  {{ &setup, &mova_z_register_f32_f32_p50_ilp16, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32), 50% active lanes", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 8, 16, "throughput", 1, 0.5, 500000},
+  {{ &setup, &mova_z_register_f32_f32_p25_ilp1, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32), 25% active lanes", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 4, 1, "throughput", 1, 0.25, 8000000},
+  {{ &setup, &mova_z_register_f32_f32_p25_ilp2, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32), 25% active lanes", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 4, 2, "throughput", 1, 0.25, 4000000},
+  {{ &setup, &mova_z_register_f32_f32_p25_ilp3, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32), 25% active lanes", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 4, 3, "throughput", 1, 0.25, 2666666},
+  {{ &setup, &mova_z_register_f32_f32_p25_ilp4, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32), 25% active lanes", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 4, 4, "throughput", 1, 0.25, 2000000},
+  {{ &setup, &mova_z_register_f32_f32_p25_ilp5, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32), 25% active lanes", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 4, 5, "throughput", 1, 0.25, 1600000},
+  {{ &setup, &mova_z_register_f32_f32_p25_ilp6, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32), 25% active lanes", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 4, 6, "throughput", 1, 0.25, 1333333},
+  {{ &setup, &mova_z_register_f32_f32_p25_ilp7, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32), 25% active lanes", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 4, 7, "throughput", 1, 0.25, 1142857},
+  {{ &setup, &mova_z_register_f32_f32_p25_ilp8, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32), 25% active lanes", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 4, 8, "throughput", 1, 0.25, 1000000},
+  {{ &setup, &mova_z_register_f32_f32_p25_ilp9, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32), 25% active lanes", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 4, 9, "throughput", 1, 0.25, 888888},
+  {{ &setup, &mova_z_register_f32_f32_p25_ilp10, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32), 25% active lanes", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 4, 10, "throughput", 1, 0.25, 800000},
+  {{ &setup, &mova_z_register_f32_f32_p25_ilp11, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32), 25% active lanes", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 4, 11, "throughput", 1, 0.25, 727272},
+  {{ &setup, &mova_z_register_f32_f32_p25_ilp12, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32), 25% active lanes", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 4, 12, "throughput", 1, 0.25, 666666},
+  {{ &setup, &mova_z_register_f32_f32_p25_ilp13, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32), 25% active lanes", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 4, 13, "throughput", 1, 0.25, 615384},
+  {{ &setup, &mova_z_register_f32_f32_p25_ilp14, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32), 25% active lanes", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 4, 14, "throughput", 1, 0.25, 571428},
+  {{ &setup, &mova_z_register_f32_f32_p25_ilp15, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32), 25% active lanes", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 4, 15, "throughput", 1, 0.25, 533333},
+  {{ &setup, &mova_z_register_f32_f32_p25_ilp16, &teardown }, "Data Movement (ZA)", "MOVA (tile slice to vector, FP32), 25% active lanes", "FEAT_SME", "z-register", "mova", "f32", 16, 1, "f32", 16, 1, 4, 16, "throughput", 1, 0.25, 500000},
+  {{ &setup, &mova_za_tile_slice_f32_f32_ilp1, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32)", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 16, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &mova_za_tile_slice_f32_f32_ilp2, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32)", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 16, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &mova_za_tile_slice_f32_f32_ilp3, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32)", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 16, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &mova_za_tile_slice_f32_f32_ilp4, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32)", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 16, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &mova_za_tile_slice_f32_f32_ilp5, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32)", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 16, 5, "throughput", 1, 1.0, 1600000},
+  {{ &setup, &mova_za_tile_slice_f32_f32_ilp6, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32)", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 16, 6, "throughput", 1, 1.0, 1333333},
+  {{ &setup, &mova_za_tile_slice_f32_f32_ilp7, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32)", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 16, 7, "throughput", 1, 1.0, 1142857},
+  {{ &setup, &mova_za_tile_slice_f32_f32_ilp8, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32)", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 16, 8, "throughput", 1, 1.0, 1000000},
+  {{ &setup, &mova_za_tile_slice_f32_f32_ilp9, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32)", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 16, 9, "throughput", 1, 1.0, 888888},
+  {{ &setup, &mova_za_tile_slice_f32_f32_ilp10, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32)", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 16, 10, "throughput", 1, 1.0, 800000},
+  {{ &setup, &mova_za_tile_slice_f32_f32_ilp11, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32)", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 16, 11, "throughput", 1, 1.0, 727272},
+  {{ &setup, &mova_za_tile_slice_f32_f32_ilp12, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32)", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 16, 12, "throughput", 1, 1.0, 666666},
+  {{ &setup, &mova_za_tile_slice_f32_f32_ilp13, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32)", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 16, 13, "throughput", 1, 1.0, 615384},
+  {{ &setup, &mova_za_tile_slice_f32_f32_ilp14, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32)", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 16, 14, "throughput", 1, 1.0, 571428},
+  {{ &setup, &mova_za_tile_slice_f32_f32_ilp15, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32)", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 16, 15, "throughput", 1, 1.0, 533333},
+  {{ &setup, &mova_za_tile_slice_f32_f32_ilp16, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32)", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 16, 16, "throughput", 1, 1.0, 500000},
+  {{ &setup, &mova_za_tile_slice_f32_f32_p75_ilp1, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32), 75% active lanes", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 12, 1, "throughput", 1, 0.75, 8000000},
+  {{ &setup, &mova_za_tile_slice_f32_f32_p75_ilp2, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32), 75% active lanes", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 12, 2, "throughput", 1, 0.75, 4000000},
+  {{ &setup, &mova_za_tile_slice_f32_f32_p75_ilp3, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32), 75% active lanes", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 12, 3, "throughput", 1, 0.75, 2666666},
+  {{ &setup, &mova_za_tile_slice_f32_f32_p75_ilp4, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32), 75% active lanes", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 12, 4, "throughput", 1, 0.75, 2000000},
+  {{ &setup, &mova_za_tile_slice_f32_f32_p75_ilp5, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32), 75% active lanes", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 12, 5, "throughput", 1, 0.75, 1600000},
+  {{ &setup, &mova_za_tile_slice_f32_f32_p75_ilp6, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32), 75% active lanes", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 12, 6, "throughput", 1, 0.75, 1333333},
+  {{ &setup, &mova_za_tile_slice_f32_f32_p75_ilp7, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32), 75% active lanes", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 12, 7, "throughput", 1, 0.75, 1142857},
+  {{ &setup, &mova_za_tile_slice_f32_f32_p75_ilp8, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32), 75% active lanes", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 12, 8, "throughput", 1, 0.75, 1000000},
+  {{ &setup, &mova_za_tile_slice_f32_f32_p75_ilp9, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32), 75% active lanes", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 12, 9, "throughput", 1, 0.75, 888888},
+  {{ &setup, &mova_za_tile_slice_f32_f32_p75_ilp10, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32), 75% active lanes", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 12, 10, "throughput", 1, 0.75, 800000},
+  {{ &setup, &mova_za_tile_slice_f32_f32_p75_ilp11, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32), 75% active lanes", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 12, 11, "throughput", 1, 0.75, 727272},
+  {{ &setup, &mova_za_tile_slice_f32_f32_p75_ilp12, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32), 75% active lanes", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 12, 12, "throughput", 1, 0.75, 666666},
+  {{ &setup, &mova_za_tile_slice_f32_f32_p75_ilp13, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32), 75% active lanes", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 12, 13, "throughput", 1, 0.75, 615384},
+  {{ &setup, &mova_za_tile_slice_f32_f32_p75_ilp14, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32), 75% active lanes", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 12, 14, "throughput", 1, 0.75, 571428},
+  {{ &setup, &mova_za_tile_slice_f32_f32_p75_ilp15, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32), 75% active lanes", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 12, 15, "throughput", 1, 0.75, 533333},
+  {{ &setup, &mova_za_tile_slice_f32_f32_p75_ilp16, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32), 75% active lanes", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 12, 16, "throughput", 1, 0.75, 500000},
+  {{ &setup, &mova_za_tile_slice_f32_f32_p50_ilp1, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32), 50% active lanes", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 8, 1, "throughput", 1, 0.5, 8000000},
+  {{ &setup, &mova_za_tile_slice_f32_f32_p50_ilp2, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32), 50% active lanes", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 8, 2, "throughput", 1, 0.5, 4000000},
+  {{ &setup, &mova_za_tile_slice_f32_f32_p50_ilp3, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32), 50% active lanes", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 8, 3, "throughput", 1, 0.5, 2666666},
+  {{ &setup, &mova_za_tile_slice_f32_f32_p50_ilp4, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32), 50% active lanes", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 8, 4, "throughput", 1, 0.5, 2000000},
+  {{ &setup, &mova_za_tile_slice_f32_f32_p50_ilp5, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32), 50% active lanes", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 8, 5, "throughput", 1, 0.5, 1600000},
+  {{ &setup, &mova_za_tile_slice_f32_f32_p50_ilp6, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32), 50% active lanes", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 8, 6, "throughput", 1, 0.5, 1333333},
+  {{ &setup, &mova_za_tile_slice_f32_f32_p50_ilp7, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32), 50% active lanes", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 8, 7, "throughput", 1, 0.5, 1142857},
+  {{ &setup, &mova_za_tile_slice_f32_f32_p50_ilp8, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32), 50% active lanes", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 8, 8, "throughput", 1, 0.5, 1000000},
+  {{ &setup, &mova_za_tile_slice_f32_f32_p50_ilp9, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32), 50% active lanes", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 8, 9, "throughput", 1, 0.5, 888888},
+  {{ &setup, &mova_za_tile_slice_f32_f32_p50_ilp10, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32), 50% active lanes", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 8, 10, "throughput", 1, 0.5, 800000},
+  {{ &setup, &mova_za_tile_slice_f32_f32_p50_ilp11, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32), 50% active lanes", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 8, 11, "throughput", 1, 0.5, 727272},
+  {{ &setup, &mova_za_tile_slice_f32_f32_p50_ilp12, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32), 50% active lanes", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 8, 12, "throughput", 1, 0.5, 666666},
+  {{ &setup, &mova_za_tile_slice_f32_f32_p50_ilp13, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32), 50% active lanes", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 8, 13, "throughput", 1, 0.5, 615384},
+  {{ &setup, &mova_za_tile_slice_f32_f32_p50_ilp14, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32), 50% active lanes", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 8, 14, "throughput", 1, 0.5, 571428},
+  {{ &setup, &mova_za_tile_slice_f32_f32_p50_ilp15, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32), 50% active lanes", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 8, 15, "throughput", 1, 0.5, 533333},
+  {{ &setup, &mova_za_tile_slice_f32_f32_p50_ilp16, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32), 50% active lanes", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 8, 16, "throughput", 1, 0.5, 500000},
+  {{ &setup, &mova_za_tile_slice_f32_f32_p25_ilp1, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32), 25% active lanes", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 4, 1, "throughput", 1, 0.25, 8000000},
+  {{ &setup, &mova_za_tile_slice_f32_f32_p25_ilp2, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32), 25% active lanes", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 4, 2, "throughput", 1, 0.25, 4000000},
+  {{ &setup, &mova_za_tile_slice_f32_f32_p25_ilp3, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32), 25% active lanes", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 4, 3, "throughput", 1, 0.25, 2666666},
+  {{ &setup, &mova_za_tile_slice_f32_f32_p25_ilp4, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32), 25% active lanes", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 4, 4, "throughput", 1, 0.25, 2000000},
+  {{ &setup, &mova_za_tile_slice_f32_f32_p25_ilp5, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32), 25% active lanes", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 4, 5, "throughput", 1, 0.25, 1600000},
+  {{ &setup, &mova_za_tile_slice_f32_f32_p25_ilp6, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32), 25% active lanes", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 4, 6, "throughput", 1, 0.25, 1333333},
+  {{ &setup, &mova_za_tile_slice_f32_f32_p25_ilp7, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32), 25% active lanes", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 4, 7, "throughput", 1, 0.25, 1142857},
+  {{ &setup, &mova_za_tile_slice_f32_f32_p25_ilp8, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32), 25% active lanes", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 4, 8, "throughput", 1, 0.25, 1000000},
+  {{ &setup, &mova_za_tile_slice_f32_f32_p25_ilp9, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32), 25% active lanes", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 4, 9, "throughput", 1, 0.25, 888888},
+  {{ &setup, &mova_za_tile_slice_f32_f32_p25_ilp10, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32), 25% active lanes", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 4, 10, "throughput", 1, 0.25, 800000},
+  {{ &setup, &mova_za_tile_slice_f32_f32_p25_ilp11, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32), 25% active lanes", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 4, 11, "throughput", 1, 0.25, 727272},
+  {{ &setup, &mova_za_tile_slice_f32_f32_p25_ilp12, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32), 25% active lanes", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 4, 12, "throughput", 1, 0.25, 666666},
+  {{ &setup, &mova_za_tile_slice_f32_f32_p25_ilp13, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32), 25% active lanes", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 4, 13, "throughput", 1, 0.25, 615384},
+  {{ &setup, &mova_za_tile_slice_f32_f32_p25_ilp14, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32), 25% active lanes", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 4, 14, "throughput", 1, 0.25, 571428},
+  {{ &setup, &mova_za_tile_slice_f32_f32_p25_ilp15, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32), 25% active lanes", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 4, 15, "throughput", 1, 0.25, 533333},
+  {{ &setup, &mova_za_tile_slice_f32_f32_p25_ilp16, &teardown }, "Data Movement (ZA)", "MOVA (vector to tile slice, FP32), 25% active lanes", "FEAT_SME", "za-tile-slice", "mova", "f32", 16, 1, "f32", 16, 1, 4, 16, "throughput", 1, 0.25, 500000},
+  {{ &setup, &mova_z_register_f64_f64_vgx2_ilp1, &teardown }, "Data Movement (ZA)", "MOVA (ZA array to two vectors)", "FEAT_SME2", "z-register", "mova", "f64", 16, 2, "f64", 16, 2, 16, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &mova_z_register_f64_f64_vgx2_ilp2, &teardown }, "Data Movement (ZA)", "MOVA (ZA array to two vectors)", "FEAT_SME2", "z-register", "mova", "f64", 16, 2, "f64", 16, 2, 16, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &mova_z_register_f64_f64_vgx2_ilp3, &teardown }, "Data Movement (ZA)", "MOVA (ZA array to two vectors)", "FEAT_SME2", "z-register", "mova", "f64", 16, 2, "f64", 16, 2, 16, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &mova_z_register_f64_f64_vgx2_ilp4, &teardown }, "Data Movement (ZA)", "MOVA (ZA array to two vectors)", "FEAT_SME2", "z-register", "mova", "f64", 16, 2, "f64", 16, 2, 16, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &mova_z_register_f64_f64_vgx2_ilp5, &teardown }, "Data Movement (ZA)", "MOVA (ZA array to two vectors)", "FEAT_SME2", "z-register", "mova", "f64", 16, 2, "f64", 16, 2, 16, 5, "throughput", 1, 1.0, 1600000},
+  {{ &setup, &mova_z_register_f64_f64_vgx2_ilp6, &teardown }, "Data Movement (ZA)", "MOVA (ZA array to two vectors)", "FEAT_SME2", "z-register", "mova", "f64", 16, 2, "f64", 16, 2, 16, 6, "throughput", 1, 1.0, 1333333},
+  {{ &setup, &mova_z_register_f64_f64_vgx2_ilp7, &teardown }, "Data Movement (ZA)", "MOVA (ZA array to two vectors)", "FEAT_SME2", "z-register", "mova", "f64", 16, 2, "f64", 16, 2, 16, 7, "throughput", 1, 1.0, 1142857},
+  {{ &setup, &mova_z_register_f64_f64_vgx2_ilp8, &teardown }, "Data Movement (ZA)", "MOVA (ZA array to two vectors)", "FEAT_SME2", "z-register", "mova", "f64", 16, 2, "f64", 16, 2, 16, 8, "throughput", 1, 1.0, 1000000},
+  {{ &setup, &mova_z_register_f64_f64_vgx2_ilp9, &teardown }, "Data Movement (ZA)", "MOVA (ZA array to two vectors)", "FEAT_SME2", "z-register", "mova", "f64", 16, 2, "f64", 16, 2, 16, 9, "throughput", 1, 1.0, 888888},
+  {{ &setup, &mova_z_register_f64_f64_vgx2_ilp10, &teardown }, "Data Movement (ZA)", "MOVA (ZA array to two vectors)", "FEAT_SME2", "z-register", "mova", "f64", 16, 2, "f64", 16, 2, 16, 10, "throughput", 1, 1.0, 800000},
+  {{ &setup, &mova_z_register_f64_f64_vgx2_ilp11, &teardown }, "Data Movement (ZA)", "MOVA (ZA array to two vectors)", "FEAT_SME2", "z-register", "mova", "f64", 16, 2, "f64", 16, 2, 16, 11, "throughput", 1, 1.0, 727272},
+  {{ &setup, &mova_z_register_f64_f64_vgx2_ilp12, &teardown }, "Data Movement (ZA)", "MOVA (ZA array to two vectors)", "FEAT_SME2", "z-register", "mova", "f64", 16, 2, "f64", 16, 2, 16, 12, "throughput", 1, 1.0, 666666},
+  {{ &setup, &mova_z_register_f64_f64_vgx2_ilp13, &teardown }, "Data Movement (ZA)", "MOVA (ZA array to two vectors)", "FEAT_SME2", "z-register", "mova", "f64", 16, 2, "f64", 16, 2, 16, 13, "throughput", 1, 1.0, 615384},
+  {{ &setup, &mova_z_register_f64_f64_vgx2_ilp14, &teardown }, "Data Movement (ZA)", "MOVA (ZA array to two vectors)", "FEAT_SME2", "z-register", "mova", "f64", 16, 2, "f64", 16, 2, 16, 14, "throughput", 1, 1.0, 571428},
+  {{ &setup, &mova_z_register_f64_f64_vgx2_ilp15, &teardown }, "Data Movement (ZA)", "MOVA (ZA array to two vectors)", "FEAT_SME2", "z-register", "mova", "f64", 16, 2, "f64", 16, 2, 16, 15, "throughput", 1, 1.0, 533333},
+  {{ &setup, &mova_z_register_f64_f64_vgx2_ilp16, &teardown }, "Data Movement (ZA)", "MOVA (ZA array to two vectors)", "FEAT_SME2", "z-register", "mova", "f64", 16, 2, "f64", 16, 2, 16, 16, "throughput", 1, 1.0, 500000},
+  {{ &setup, &mova_z_register_f64_f64_vgx4_ilp1, &teardown }, "Data Movement (ZA)", "MOVA (ZA array to four vectors)", "FEAT_SME2", "z-register", "mova", "f64", 32, 4, "f64", 32, 4, 32, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &mova_z_register_f64_f64_vgx4_ilp2, &teardown }, "Data Movement (ZA)", "MOVA (ZA array to four vectors)", "FEAT_SME2", "z-register", "mova", "f64", 32, 4, "f64", 32, 4, 32, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &mova_z_register_f64_f64_vgx4_ilp3, &teardown }, "Data Movement (ZA)", "MOVA (ZA array to four vectors)", "FEAT_SME2", "z-register", "mova", "f64", 32, 4, "f64", 32, 4, 32, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &mova_z_register_f64_f64_vgx4_ilp4, &teardown }, "Data Movement (ZA)", "MOVA (ZA array to four vectors)", "FEAT_SME2", "z-register", "mova", "f64", 32, 4, "f64", 32, 4, 32, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &mova_z_register_f64_f64_vgx4_ilp5, &teardown }, "Data Movement (ZA)", "MOVA (ZA array to four vectors)", "FEAT_SME2", "z-register", "mova", "f64", 32, 4, "f64", 32, 4, 32, 5, "throughput", 1, 1.0, 1600000},
+  {{ &setup, &mova_z_register_f64_f64_vgx4_ilp6, &teardown }, "Data Movement (ZA)", "MOVA (ZA array to four vectors)", "FEAT_SME2", "z-register", "mova", "f64", 32, 4, "f64", 32, 4, 32, 6, "throughput", 1, 1.0, 1333333},
+  {{ &setup, &mova_z_register_f64_f64_vgx4_ilp7, &teardown }, "Data Movement (ZA)", "MOVA (ZA array to four vectors)", "FEAT_SME2", "z-register", "mova", "f64", 32, 4, "f64", 32, 4, 32, 7, "throughput", 1, 1.0, 1142857},
+  {{ &setup, &mova_z_register_f64_f64_vgx4_ilp8, &teardown }, "Data Movement (ZA)", "MOVA (ZA array to four vectors)", "FEAT_SME2", "z-register", "mova", "f64", 32, 4, "f64", 32, 4, 32, 8, "throughput", 1, 1.0, 1000000},
+  {{ &setup, &mova_za_vector_f64_f64_vgx2_ilp1, &teardown }, "Data Movement (ZA)", "MOVA (two vectors to ZA array)", "FEAT_SME2", "za-vector", "mova", "f64", 16, 2, "f64", 16, 2, 16, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &mova_za_vector_f64_f64_vgx2_ilp2, &teardown }, "Data Movement (ZA)", "MOVA (two vectors to ZA array)", "FEAT_SME2", "za-vector", "mova", "f64", 16, 2, "f64", 16, 2, 16, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &mova_za_vector_f64_f64_vgx2_ilp3, &teardown }, "Data Movement (ZA)", "MOVA (two vectors to ZA array)", "FEAT_SME2", "za-vector", "mova", "f64", 16, 2, "f64", 16, 2, 16, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &mova_za_vector_f64_f64_vgx2_ilp4, &teardown }, "Data Movement (ZA)", "MOVA (two vectors to ZA array)", "FEAT_SME2", "za-vector", "mova", "f64", 16, 2, "f64", 16, 2, 16, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &mova_za_vector_f64_f64_vgx2_ilp5, &teardown }, "Data Movement (ZA)", "MOVA (two vectors to ZA array)", "FEAT_SME2", "za-vector", "mova", "f64", 16, 2, "f64", 16, 2, 16, 5, "throughput", 1, 1.0, 1600000},
+  {{ &setup, &mova_za_vector_f64_f64_vgx2_ilp6, &teardown }, "Data Movement (ZA)", "MOVA (two vectors to ZA array)", "FEAT_SME2", "za-vector", "mova", "f64", 16, 2, "f64", 16, 2, 16, 6, "throughput", 1, 1.0, 1333333},
+  {{ &setup, &mova_za_vector_f64_f64_vgx2_ilp7, &teardown }, "Data Movement (ZA)", "MOVA (two vectors to ZA array)", "FEAT_SME2", "za-vector", "mova", "f64", 16, 2, "f64", 16, 2, 16, 7, "throughput", 1, 1.0, 1142857},
+  {{ &setup, &mova_za_vector_f64_f64_vgx2_ilp8, &teardown }, "Data Movement (ZA)", "MOVA (two vectors to ZA array)", "FEAT_SME2", "za-vector", "mova", "f64", 16, 2, "f64", 16, 2, 16, 8, "throughput", 1, 1.0, 1000000},
+  {{ &setup, &mova_za_vector_f64_f64_vgx2_ilp9, &teardown }, "Data Movement (ZA)", "MOVA (two vectors to ZA array)", "FEAT_SME2", "za-vector", "mova", "f64", 16, 2, "f64", 16, 2, 16, 9, "throughput", 1, 1.0, 888888},
+  {{ &setup, &mova_za_vector_f64_f64_vgx2_ilp10, &teardown }, "Data Movement (ZA)", "MOVA (two vectors to ZA array)", "FEAT_SME2", "za-vector", "mova", "f64", 16, 2, "f64", 16, 2, 16, 10, "throughput", 1, 1.0, 800000},
+  {{ &setup, &mova_za_vector_f64_f64_vgx2_ilp11, &teardown }, "Data Movement (ZA)", "MOVA (two vectors to ZA array)", "FEAT_SME2", "za-vector", "mova", "f64", 16, 2, "f64", 16, 2, 16, 11, "throughput", 1, 1.0, 727272},
+  {{ &setup, &mova_za_vector_f64_f64_vgx2_ilp12, &teardown }, "Data Movement (ZA)", "MOVA (two vectors to ZA array)", "FEAT_SME2", "za-vector", "mova", "f64", 16, 2, "f64", 16, 2, 16, 12, "throughput", 1, 1.0, 666666},
+  {{ &setup, &mova_za_vector_f64_f64_vgx2_ilp13, &teardown }, "Data Movement (ZA)", "MOVA (two vectors to ZA array)", "FEAT_SME2", "za-vector", "mova", "f64", 16, 2, "f64", 16, 2, 16, 13, "throughput", 1, 1.0, 615384},
+  {{ &setup, &mova_za_vector_f64_f64_vgx2_ilp14, &teardown }, "Data Movement (ZA)", "MOVA (two vectors to ZA array)", "FEAT_SME2", "za-vector", "mova", "f64", 16, 2, "f64", 16, 2, 16, 14, "throughput", 1, 1.0, 571428},
+  {{ &setup, &mova_za_vector_f64_f64_vgx2_ilp15, &teardown }, "Data Movement (ZA)", "MOVA (two vectors to ZA array)", "FEAT_SME2", "za-vector", "mova", "f64", 16, 2, "f64", 16, 2, 16, 15, "throughput", 1, 1.0, 533333},
+  {{ &setup, &mova_za_vector_f64_f64_vgx2_ilp16, &teardown }, "Data Movement (ZA)", "MOVA (two vectors to ZA array)", "FEAT_SME2", "za-vector", "mova", "f64", 16, 2, "f64", 16, 2, 16, 16, "throughput", 1, 1.0, 500000},
+  {{ &setup, &mova_za_vector_f64_f64_vgx4_ilp1, &teardown }, "Data Movement (ZA)", "MOVA (four vectors to ZA array)", "FEAT_SME2", "za-vector", "mova", "f64", 32, 4, "f64", 32, 4, 32, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &mova_za_vector_f64_f64_vgx4_ilp2, &teardown }, "Data Movement (ZA)", "MOVA (four vectors to ZA array)", "FEAT_SME2", "za-vector", "mova", "f64", 32, 4, "f64", 32, 4, 32, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &mova_za_vector_f64_f64_vgx4_ilp3, &teardown }, "Data Movement (ZA)", "MOVA (four vectors to ZA array)", "FEAT_SME2", "za-vector", "mova", "f64", 32, 4, "f64", 32, 4, 32, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &mova_za_vector_f64_f64_vgx4_ilp4, &teardown }, "Data Movement (ZA)", "MOVA (four vectors to ZA array)", "FEAT_SME2", "za-vector", "mova", "f64", 32, 4, "f64", 32, 4, 32, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &mova_za_vector_f64_f64_vgx4_ilp5, &teardown }, "Data Movement (ZA)", "MOVA (four vectors to ZA array)", "FEAT_SME2", "za-vector", "mova", "f64", 32, 4, "f64", 32, 4, 32, 5, "throughput", 1, 1.0, 1600000},
+  {{ &setup, &mova_za_vector_f64_f64_vgx4_ilp6, &teardown }, "Data Movement (ZA)", "MOVA (four vectors to ZA array)", "FEAT_SME2", "za-vector", "mova", "f64", 32, 4, "f64", 32, 4, 32, 6, "throughput", 1, 1.0, 1333333},
+  {{ &setup, &mova_za_vector_f64_f64_vgx4_ilp7, &teardown }, "Data Movement (ZA)", "MOVA (four vectors to ZA array)", "FEAT_SME2", "za-vector", "mova", "f64", 32, 4, "f64", 32, 4, 32, 7, "throughput", 1, 1.0, 1142857},
+  {{ &setup, &mova_za_vector_f64_f64_vgx4_ilp8, &teardown }, "Data Movement (ZA)", "MOVA (four vectors to ZA array)", "FEAT_SME2", "za-vector", "mova", "f64", 32, 4, "f64", 32, 4, 32, 8, "throughput", 1, 1.0, 1000000},
+  {{ &setup, &zero_za_tiles_i64_i64_ilp1, &teardown }, "Data Movement (ZA)", "ZERO (64-bit tile)", "FEAT_SME", "za-tiles", "zero", "i64", 64, 8, "i64", 0, 0, 64, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &zero_za_tiles_i64_i64_ilp2, &teardown }, "Data Movement (ZA)", "ZERO (64-bit tile)", "FEAT_SME", "za-tiles", "zero", "i64", 64, 8, "i64", 0, 0, 64, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &zero_za_tiles_i64_i64_ilp3, &teardown }, "Data Movement (ZA)", "ZERO (64-bit tile)", "FEAT_SME", "za-tiles", "zero", "i64", 64, 8, "i64", 0, 0, 64, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &zero_za_tiles_i64_i64_ilp4, &teardown }, "Data Movement (ZA)", "ZERO (64-bit tile)", "FEAT_SME", "za-tiles", "zero", "i64", 64, 8, "i64", 0, 0, 64, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &zero_za_tiles_i64_i64_ilp5, &teardown }, "Data Movement (ZA)", "ZERO (64-bit tile)", "FEAT_SME", "za-tiles", "zero", "i64", 64, 8, "i64", 0, 0, 64, 5, "throughput", 1, 1.0, 1600000},
+  {{ &setup, &zero_za_tiles_i64_i64_ilp6, &teardown }, "Data Movement (ZA)", "ZERO (64-bit tile)", "FEAT_SME", "za-tiles", "zero", "i64", 64, 8, "i64", 0, 0, 64, 6, "throughput", 1, 1.0, 1333333},
+  {{ &setup, &zero_za_tiles_i64_i64_ilp7, &teardown }, "Data Movement (ZA)", "ZERO (64-bit tile)", "FEAT_SME", "za-tiles", "zero", "i64", 64, 8, "i64", 0, 0, 64, 7, "throughput", 1, 1.0, 1142857},
+  {{ &setup, &zero_za_tiles_i64_i64_ilp8, &teardown }, "Data Movement (ZA)", "ZERO (64-bit tile)", "FEAT_SME", "za-tiles", "zero", "i64", 64, 8, "i64", 0, 0, 64, 8, "throughput", 1, 1.0, 1000000},
+  {{ &setup, &ldr_za_row_u8_u8_ilp1, &teardown }, "Data Movement (ZA)", "LDR (ZA array vector)", "FEAT_SME", "za-row", "ldr", "u8", 64, 1, "u8", 64, 1, 64, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &ldr_za_row_u8_u8_ilp2, &teardown }, "Data Movement (ZA)", "LDR (ZA array vector)", "FEAT_SME", "za-row", "ldr", "u8", 64, 1, "u8", 64, 1, 64, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &ldr_za_row_u8_u8_ilp3, &teardown }, "Data Movement (ZA)", "LDR (ZA array vector)", "FEAT_SME", "za-row", "ldr", "u8", 64, 1, "u8", 64, 1, 64, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &ldr_za_row_u8_u8_ilp4, &teardown }, "Data Movement (ZA)", "LDR (ZA array vector)", "FEAT_SME", "za-row", "ldr", "u8", 64, 1, "u8", 64, 1, 64, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &ldr_za_row_u8_u8_ilp5, &teardown }, "Data Movement (ZA)", "LDR (ZA array vector)", "FEAT_SME", "za-row", "ldr", "u8", 64, 1, "u8", 64, 1, 64, 5, "throughput", 1, 1.0, 1600000},
+  {{ &setup, &ldr_za_row_u8_u8_ilp6, &teardown }, "Data Movement (ZA)", "LDR (ZA array vector)", "FEAT_SME", "za-row", "ldr", "u8", 64, 1, "u8", 64, 1, 64, 6, "throughput", 1, 1.0, 1333333},
+  {{ &setup, &ldr_za_row_u8_u8_ilp7, &teardown }, "Data Movement (ZA)", "LDR (ZA array vector)", "FEAT_SME", "za-row", "ldr", "u8", 64, 1, "u8", 64, 1, 64, 7, "throughput", 1, 1.0, 1142857},
+  {{ &setup, &ldr_za_row_u8_u8_ilp8, &teardown }, "Data Movement (ZA)", "LDR (ZA array vector)", "FEAT_SME", "za-row", "ldr", "u8", 64, 1, "u8", 64, 1, 64, 8, "throughput", 1, 1.0, 1000000},
+  {{ &setup, &ldr_za_row_u8_u8_ilp9, &teardown }, "Data Movement (ZA)", "LDR (ZA array vector)", "FEAT_SME", "za-row", "ldr", "u8", 64, 1, "u8", 64, 1, 64, 9, "throughput", 1, 1.0, 888888},
+  {{ &setup, &ldr_za_row_u8_u8_ilp10, &teardown }, "Data Movement (ZA)", "LDR (ZA array vector)", "FEAT_SME", "za-row", "ldr", "u8", 64, 1, "u8", 64, 1, 64, 10, "throughput", 1, 1.0, 800000},
+  {{ &setup, &ldr_za_row_u8_u8_ilp11, &teardown }, "Data Movement (ZA)", "LDR (ZA array vector)", "FEAT_SME", "za-row", "ldr", "u8", 64, 1, "u8", 64, 1, 64, 11, "throughput", 1, 1.0, 727272},
+  {{ &setup, &ldr_za_row_u8_u8_ilp12, &teardown }, "Data Movement (ZA)", "LDR (ZA array vector)", "FEAT_SME", "za-row", "ldr", "u8", 64, 1, "u8", 64, 1, 64, 12, "throughput", 1, 1.0, 666666},
+  {{ &setup, &ldr_za_row_u8_u8_ilp13, &teardown }, "Data Movement (ZA)", "LDR (ZA array vector)", "FEAT_SME", "za-row", "ldr", "u8", 64, 1, "u8", 64, 1, 64, 13, "throughput", 1, 1.0, 615384},
+  {{ &setup, &ldr_za_row_u8_u8_ilp14, &teardown }, "Data Movement (ZA)", "LDR (ZA array vector)", "FEAT_SME", "za-row", "ldr", "u8", 64, 1, "u8", 64, 1, 64, 14, "throughput", 1, 1.0, 571428},
+  {{ &setup, &ldr_za_row_u8_u8_ilp15, &teardown }, "Data Movement (ZA)", "LDR (ZA array vector)", "FEAT_SME", "za-row", "ldr", "u8", 64, 1, "u8", 64, 1, 64, 15, "throughput", 1, 1.0, 533333},
+  {{ &setup, &ldr_za_row_u8_u8_ilp16, &teardown }, "Data Movement (ZA)", "LDR (ZA array vector)", "FEAT_SME", "za-row", "ldr", "u8", 64, 1, "u8", 64, 1, 64, 16, "throughput", 1, 1.0, 500000},
+  {{ &setup, &str_memory_u8_u8_ilp1, &teardown }, "Data Movement (ZA)", "STR (ZA array vector)", "FEAT_SME", "memory", "str", "u8", 64, 1, "u8", 64, 1, 64, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &str_memory_u8_u8_ilp2, &teardown }, "Data Movement (ZA)", "STR (ZA array vector)", "FEAT_SME", "memory", "str", "u8", 64, 1, "u8", 64, 1, 64, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &str_memory_u8_u8_ilp3, &teardown }, "Data Movement (ZA)", "STR (ZA array vector)", "FEAT_SME", "memory", "str", "u8", 64, 1, "u8", 64, 1, 64, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &str_memory_u8_u8_ilp4, &teardown }, "Data Movement (ZA)", "STR (ZA array vector)", "FEAT_SME", "memory", "str", "u8", 64, 1, "u8", 64, 1, 64, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &str_memory_u8_u8_ilp5, &teardown }, "Data Movement (ZA)", "STR (ZA array vector)", "FEAT_SME", "memory", "str", "u8", 64, 1, "u8", 64, 1, 64, 5, "throughput", 1, 1.0, 1600000},
+  {{ &setup, &str_memory_u8_u8_ilp6, &teardown }, "Data Movement (ZA)", "STR (ZA array vector)", "FEAT_SME", "memory", "str", "u8", 64, 1, "u8", 64, 1, 64, 6, "throughput", 1, 1.0, 1333333},
+  {{ &setup, &str_memory_u8_u8_ilp7, &teardown }, "Data Movement (ZA)", "STR (ZA array vector)", "FEAT_SME", "memory", "str", "u8", 64, 1, "u8", 64, 1, 64, 7, "throughput", 1, 1.0, 1142857},
+  {{ &setup, &str_memory_u8_u8_ilp8, &teardown }, "Data Movement (ZA)", "STR (ZA array vector)", "FEAT_SME", "memory", "str", "u8", 64, 1, "u8", 64, 1, 64, 8, "throughput", 1, 1.0, 1000000},
+  {{ &setup, &str_memory_u8_u8_ilp9, &teardown }, "Data Movement (ZA)", "STR (ZA array vector)", "FEAT_SME", "memory", "str", "u8", 64, 1, "u8", 64, 1, 64, 9, "throughput", 1, 1.0, 888888},
+  {{ &setup, &str_memory_u8_u8_ilp10, &teardown }, "Data Movement (ZA)", "STR (ZA array vector)", "FEAT_SME", "memory", "str", "u8", 64, 1, "u8", 64, 1, 64, 10, "throughput", 1, 1.0, 800000},
+  {{ &setup, &str_memory_u8_u8_ilp11, &teardown }, "Data Movement (ZA)", "STR (ZA array vector)", "FEAT_SME", "memory", "str", "u8", 64, 1, "u8", 64, 1, 64, 11, "throughput", 1, 1.0, 727272},
+  {{ &setup, &str_memory_u8_u8_ilp12, &teardown }, "Data Movement (ZA)", "STR (ZA array vector)", "FEAT_SME", "memory", "str", "u8", 64, 1, "u8", 64, 1, 64, 12, "throughput", 1, 1.0, 666666},
+  {{ &setup, &str_memory_u8_u8_ilp13, &teardown }, "Data Movement (ZA)", "STR (ZA array vector)", "FEAT_SME", "memory", "str", "u8", 64, 1, "u8", 64, 1, 64, 13, "throughput", 1, 1.0, 615384},
+  {{ &setup, &str_memory_u8_u8_ilp14, &teardown }, "Data Movement (ZA)", "STR (ZA array vector)", "FEAT_SME", "memory", "str", "u8", 64, 1, "u8", 64, 1, 64, 14, "throughput", 1, 1.0, 571428},
+  {{ &setup, &str_memory_u8_u8_ilp15, &teardown }, "Data Movement (ZA)", "STR (ZA array vector)", "FEAT_SME", "memory", "str", "u8", 64, 1, "u8", 64, 1, 64, 15, "throughput", 1, 1.0, 533333},
+  {{ &setup, &str_memory_u8_u8_ilp16, &teardown }, "Data Movement (ZA)", "STR (ZA array vector)", "FEAT_SME", "memory", "str", "u8", 64, 1, "u8", 64, 1, 64, 16, "throughput", 1, 1.0, 500000},
+  {{ &setup, &movt_gpr_u64_u64_ilp1, &teardown }, "Data Movement (ZT0)", "MOVT (ZT0 to general-purpose register)", "FEAT_SME2", "gpr", "movt", "u64", 1, 0, "u64", 1, 0, 1, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &movt_gpr_u64_u64_ilp2, &teardown }, "Data Movement (ZT0)", "MOVT (ZT0 to general-purpose register)", "FEAT_SME2", "gpr", "movt", "u64", 1, 0, "u64", 1, 0, 1, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &movt_gpr_u64_u64_ilp3, &teardown }, "Data Movement (ZT0)", "MOVT (ZT0 to general-purpose register)", "FEAT_SME2", "gpr", "movt", "u64", 1, 0, "u64", 1, 0, 1, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &movt_gpr_u64_u64_ilp4, &teardown }, "Data Movement (ZT0)", "MOVT (ZT0 to general-purpose register)", "FEAT_SME2", "gpr", "movt", "u64", 1, 0, "u64", 1, 0, 1, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &movt_gpr_u64_u64_ilp5, &teardown }, "Data Movement (ZT0)", "MOVT (ZT0 to general-purpose register)", "FEAT_SME2", "gpr", "movt", "u64", 1, 0, "u64", 1, 0, 1, 5, "throughput", 1, 1.0, 1600000},
+  {{ &setup, &movt_gpr_u64_u64_ilp6, &teardown }, "Data Movement (ZT0)", "MOVT (ZT0 to general-purpose register)", "FEAT_SME2", "gpr", "movt", "u64", 1, 0, "u64", 1, 0, 1, 6, "throughput", 1, 1.0, 1333333},
+  {{ &setup, &movt_gpr_u64_u64_ilp7, &teardown }, "Data Movement (ZT0)", "MOVT (ZT0 to general-purpose register)", "FEAT_SME2", "gpr", "movt", "u64", 1, 0, "u64", 1, 0, 1, 7, "throughput", 1, 1.0, 1142857},
+  {{ &setup, &movt_gpr_u64_u64_ilp8, &teardown }, "Data Movement (ZT0)", "MOVT (ZT0 to general-purpose register)", "FEAT_SME2", "gpr", "movt", "u64", 1, 0, "u64", 1, 0, 1, 8, "throughput", 1, 1.0, 1000000},
+  {{ &setup, &movt_gpr_u64_u64_ilp9, &teardown }, "Data Movement (ZT0)", "MOVT (ZT0 to general-purpose register)", "FEAT_SME2", "gpr", "movt", "u64", 1, 0, "u64", 1, 0, 1, 9, "throughput", 1, 1.0, 888888},
+  {{ &setup, &movt_gpr_u64_u64_ilp10, &teardown }, "Data Movement (ZT0)", "MOVT (ZT0 to general-purpose register)", "FEAT_SME2", "gpr", "movt", "u64", 1, 0, "u64", 1, 0, 1, 10, "throughput", 1, 1.0, 800000},
+  {{ &setup, &movt_gpr_u64_u64_ilp11, &teardown }, "Data Movement (ZT0)", "MOVT (ZT0 to general-purpose register)", "FEAT_SME2", "gpr", "movt", "u64", 1, 0, "u64", 1, 0, 1, 11, "throughput", 1, 1.0, 727272},
+  {{ &setup, &movt_gpr_u64_u64_ilp12, &teardown }, "Data Movement (ZT0)", "MOVT (ZT0 to general-purpose register)", "FEAT_SME2", "gpr", "movt", "u64", 1, 0, "u64", 1, 0, 1, 12, "throughput", 1, 1.0, 666666},
+  {{ &setup, &movt_gpr_u64_u64_ilp13, &teardown }, "Data Movement (ZT0)", "MOVT (ZT0 to general-purpose register)", "FEAT_SME2", "gpr", "movt", "u64", 1, 0, "u64", 1, 0, 1, 13, "throughput", 1, 1.0, 615384},
+  {{ &setup, &movt_gpr_u64_u64_ilp14, &teardown }, "Data Movement (ZT0)", "MOVT (ZT0 to general-purpose register)", "FEAT_SME2", "gpr", "movt", "u64", 1, 0, "u64", 1, 0, 1, 14, "throughput", 1, 1.0, 571428},
+  {{ &setup, &movt_gpr_u64_u64_ilp15, &teardown }, "Data Movement (ZT0)", "MOVT (ZT0 to general-purpose register)", "FEAT_SME2", "gpr", "movt", "u64", 1, 0, "u64", 1, 0, 1, 15, "throughput", 1, 1.0, 533333},
+  {{ &setup, &movt_gpr_u64_u64_ilp16, &teardown }, "Data Movement (ZT0)", "MOVT (ZT0 to general-purpose register)", "FEAT_SME2", "gpr", "movt", "u64", 1, 0, "u64", 1, 0, 1, 16, "throughput", 1, 1.0, 500000},
+  {{ &setup, &luti2_z_register_u8_u8_ilp1, &teardown }, "Data Movement (ZT0)", "LUTI2 (8-bit, one vector)", "FEAT_SME2", "z-register", "luti2", "u8", 64, 1, "u8", 128, 2, 64, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &luti2_z_register_u8_u8_ilp2, &teardown }, "Data Movement (ZT0)", "LUTI2 (8-bit, one vector)", "FEAT_SME2", "z-register", "luti2", "u8", 64, 1, "u8", 128, 2, 64, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &luti2_z_register_u8_u8_ilp3, &teardown }, "Data Movement (ZT0)", "LUTI2 (8-bit, one vector)", "FEAT_SME2", "z-register", "luti2", "u8", 64, 1, "u8", 128, 2, 64, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &luti2_z_register_u8_u8_ilp4, &teardown }, "Data Movement (ZT0)", "LUTI2 (8-bit, one vector)", "FEAT_SME2", "z-register", "luti2", "u8", 64, 1, "u8", 128, 2, 64, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &luti2_z_register_u8_u8_ilp5, &teardown }, "Data Movement (ZT0)", "LUTI2 (8-bit, one vector)", "FEAT_SME2", "z-register", "luti2", "u8", 64, 1, "u8", 128, 2, 64, 5, "throughput", 1, 1.0, 1600000},
+  {{ &setup, &luti2_z_register_u8_u8_ilp6, &teardown }, "Data Movement (ZT0)", "LUTI2 (8-bit, one vector)", "FEAT_SME2", "z-register", "luti2", "u8", 64, 1, "u8", 128, 2, 64, 6, "throughput", 1, 1.0, 1333333},
+  {{ &setup, &luti2_z_register_u8_u8_ilp7, &teardown }, "Data Movement (ZT0)", "LUTI2 (8-bit, one vector)", "FEAT_SME2", "z-register", "luti2", "u8", 64, 1, "u8", 128, 2, 64, 7, "throughput", 1, 1.0, 1142857},
+  {{ &setup, &luti2_z_register_u8_u8_ilp8, &teardown }, "Data Movement (ZT0)", "LUTI2 (8-bit, one vector)", "FEAT_SME2", "z-register", "luti2", "u8", 64, 1, "u8", 128, 2, 64, 8, "throughput", 1, 1.0, 1000000},
+  {{ &setup, &luti2_z_register_u8_u8_ilp9, &teardown }, "Data Movement (ZT0)", "LUTI2 (8-bit, one vector)", "FEAT_SME2", "z-register", "luti2", "u8", 64, 1, "u8", 128, 2, 64, 9, "throughput", 1, 1.0, 888888},
+  {{ &setup, &luti2_z_register_u8_u8_ilp10, &teardown }, "Data Movement (ZT0)", "LUTI2 (8-bit, one vector)", "FEAT_SME2", "z-register", "luti2", "u8", 64, 1, "u8", 128, 2, 64, 10, "throughput", 1, 1.0, 800000},
+  {{ &setup, &luti2_z_register_u8_u8_ilp11, &teardown }, "Data Movement (ZT0)", "LUTI2 (8-bit, one vector)", "FEAT_SME2", "z-register", "luti2", "u8", 64, 1, "u8", 128, 2, 64, 11, "throughput", 1, 1.0, 727272},
+  {{ &setup, &luti2_z_register_u8_u8_ilp12, &teardown }, "Data Movement (ZT0)", "LUTI2 (8-bit, one vector)", "FEAT_SME2", "z-register", "luti2", "u8", 64, 1, "u8", 128, 2, 64, 12, "throughput", 1, 1.0, 666666},
+  {{ &setup, &luti2_z_register_u8_u8_ilp13, &teardown }, "Data Movement (ZT0)", "LUTI2 (8-bit, one vector)", "FEAT_SME2", "z-register", "luti2", "u8", 64, 1, "u8", 128, 2, 64, 13, "throughput", 1, 1.0, 615384},
+  {{ &setup, &luti2_z_register_u8_u8_ilp14, &teardown }, "Data Movement (ZT0)", "LUTI2 (8-bit, one vector)", "FEAT_SME2", "z-register", "luti2", "u8", 64, 1, "u8", 128, 2, 64, 14, "throughput", 1, 1.0, 571428},
+  {{ &setup, &luti2_z_register_u8_u8_ilp15, &teardown }, "Data Movement (ZT0)", "LUTI2 (8-bit, one vector)", "FEAT_SME2", "z-register", "luti2", "u8", 64, 1, "u8", 128, 2, 64, 15, "throughput", 1, 1.0, 533333},
+  {{ &setup, &luti2_z_register_u8_u8_ilp16, &teardown }, "Data Movement (ZT0)", "LUTI2 (8-bit, one vector)", "FEAT_SME2", "z-register", "luti2", "u8", 64, 1, "u8", 128, 2, 64, 16, "throughput", 1, 1.0, 500000},
+  {{ &setup, &luti4_z_register_u32_u32_ilp1, &teardown }, "Data Movement (ZT0)", "LUTI4 (32-bit, one vector)", "FEAT_SME2", "z-register", "luti4", "u32", 16, 1, "u32", 80, 2, 16, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &luti4_z_register_u32_u32_ilp2, &teardown }, "Data Movement (ZT0)", "LUTI4 (32-bit, one vector)", "FEAT_SME2", "z-register", "luti4", "u32", 16, 1, "u32", 80, 2, 16, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &luti4_z_register_u32_u32_ilp3, &teardown }, "Data Movement (ZT0)", "LUTI4 (32-bit, one vector)", "FEAT_SME2", "z-register", "luti4", "u32", 16, 1, "u32", 80, 2, 16, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &luti4_z_register_u32_u32_ilp4, &teardown }, "Data Movement (ZT0)", "LUTI4 (32-bit, one vector)", "FEAT_SME2", "z-register", "luti4", "u32", 16, 1, "u32", 80, 2, 16, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &luti4_z_register_u32_u32_ilp5, &teardown }, "Data Movement (ZT0)", "LUTI4 (32-bit, one vector)", "FEAT_SME2", "z-register", "luti4", "u32", 16, 1, "u32", 80, 2, 16, 5, "throughput", 1, 1.0, 1600000},
+  {{ &setup, &luti4_z_register_u32_u32_ilp6, &teardown }, "Data Movement (ZT0)", "LUTI4 (32-bit, one vector)", "FEAT_SME2", "z-register", "luti4", "u32", 16, 1, "u32", 80, 2, 16, 6, "throughput", 1, 1.0, 1333333},
+  {{ &setup, &luti4_z_register_u32_u32_ilp7, &teardown }, "Data Movement (ZT0)", "LUTI4 (32-bit, one vector)", "FEAT_SME2", "z-register", "luti4", "u32", 16, 1, "u32", 80, 2, 16, 7, "throughput", 1, 1.0, 1142857},
+  {{ &setup, &luti4_z_register_u32_u32_ilp8, &teardown }, "Data Movement (ZT0)", "LUTI4 (32-bit, one vector)", "FEAT_SME2", "z-register", "luti4", "u32", 16, 1, "u32", 80, 2, 16, 8, "throughput", 1, 1.0, 1000000},
+  {{ &setup, &luti4_z_register_u32_u32_ilp9, &teardown }, "Data Movement (ZT0)", "LUTI4 (32-bit, one vector)", "FEAT_SME2", "z-register", "luti4", "u32", 16, 1, "u32", 80, 2, 16, 9, "throughput", 1, 1.0, 888888},
+  {{ &setup, &luti4_z_register_u32_u32_ilp10, &teardown }, "Data Movement (ZT0)", "LUTI4 (32-bit, one vector)", "FEAT_SME2", "z-register", "luti4", "u32", 16, 1, "u32", 80, 2, 16, 10, "throughput", 1, 1.0, 800000},
+  {{ &setup, &luti4_z_register_u32_u32_ilp11, &teardown }, "Data Movement (ZT0)", "LUTI4 (32-bit, one vector)", "FEAT_SME2", "z-register", "luti4", "u32", 16, 1, "u32", 80, 2, 16, 11, "throughput", 1, 1.0, 727272},
+  {{ &setup, &luti4_z_register_u32_u32_ilp12, &teardown }, "Data Movement (ZT0)", "LUTI4 (32-bit, one vector)", "FEAT_SME2", "z-register", "luti4", "u32", 16, 1, "u32", 80, 2, 16, 12, "throughput", 1, 1.0, 666666},
+  {{ &setup, &luti4_z_register_u32_u32_ilp13, &teardown }, "Data Movement (ZT0)", "LUTI4 (32-bit, one vector)", "FEAT_SME2", "z-register", "luti4", "u32", 16, 1, "u32", 80, 2, 16, 13, "throughput", 1, 1.0, 615384},
+  {{ &setup, &luti4_z_register_u32_u32_ilp14, &teardown }, "Data Movement (ZT0)", "LUTI4 (32-bit, one vector)", "FEAT_SME2", "z-register", "luti4", "u32", 16, 1, "u32", 80, 2, 16, 14, "throughput", 1, 1.0, 571428},
+  {{ &setup, &luti4_z_register_u32_u32_ilp15, &teardown }, "Data Movement (ZT0)", "LUTI4 (32-bit, one vector)", "FEAT_SME2", "z-register", "luti4", "u32", 16, 1, "u32", 80, 2, 16, 15, "throughput", 1, 1.0, 533333},
+  {{ &setup, &luti4_z_register_u32_u32_ilp16, &teardown }, "Data Movement (ZT0)", "LUTI4 (32-bit, one vector)", "FEAT_SME2", "z-register", "luti4", "u32", 16, 1, "u32", 80, 2, 16, 16, "throughput", 1, 1.0, 500000},
+  {{ &setup, &luti4_z_register_u32_u32_vgx4_ilp1, &teardown }, "Data Movement (ZT0)", "LUTI4 (32-bit, four vectors)", "FEAT_SME2", "z-register", "luti4", "u32", 64, 4, "u32", 80, 2, 64, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &luti4_z_register_u32_u32_vgx4_ilp2, &teardown }, "Data Movement (ZT0)", "LUTI4 (32-bit, four vectors)", "FEAT_SME2", "z-register", "luti4", "u32", 64, 4, "u32", 80, 2, 64, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &luti4_z_register_u32_u32_vgx4_ilp3, &teardown }, "Data Movement (ZT0)", "LUTI4 (32-bit, four vectors)", "FEAT_SME2", "z-register", "luti4", "u32", 64, 4, "u32", 80, 2, 64, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &luti4_z_register_u32_u32_vgx4_ilp4, &teardown }, "Data Movement (ZT0)", "LUTI4 (32-bit, four vectors)", "FEAT_SME2", "z-register", "luti4", "u32", 64, 4, "u32", 80, 2, 64, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &luti4_z_register_u32_u32_vgx4_ilp5, &teardown }, "Data Movement (ZT0)", "LUTI4 (32-bit, four vectors)", "FEAT_SME2", "z-register", "luti4", "u32", 64, 4, "u32", 80, 2, 64, 5, "throughput", 1, 1.0, 1600000},
+  {{ &setup, &luti4_z_register_u32_u32_vgx4_ilp6, &teardown }, "Data Movement (ZT0)", "LUTI4 (32-bit, four vectors)", "FEAT_SME2", "z-register", "luti4", "u32", 64, 4, "u32", 80, 2, 64, 6, "throughput", 1, 1.0, 1333333},
+  {{ &setup, &luti4_z_register_u32_u32_vgx4_ilp7, &teardown }, "Data Movement (ZT0)", "LUTI4 (32-bit, four vectors)", "FEAT_SME2", "z-register", "luti4", "u32", 64, 4, "u32", 80, 2, 64, 7, "throughput", 1, 1.0, 1142857},
+  {{ &setup, &fdot_f32_f16_ilp1, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, one vector)", "FEAT_SME2", "z-register", "fdot", "f32", 16, 1, "f16", 64, 2, 64, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &fdot_f32_f16_ilp2, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, one vector)", "FEAT_SME2", "z-register", "fdot", "f32", 16, 1, "f16", 64, 2, 64, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &fdot_f32_f16_ilp3, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, one vector)", "FEAT_SME2", "z-register", "fdot", "f32", 16, 1, "f16", 64, 2, 64, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &fdot_f32_f16_ilp4, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, one vector)", "FEAT_SME2", "z-register", "fdot", "f32", 16, 1, "f16", 64, 2, 64, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &fdot_f32_f16_ilp5, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, one vector)", "FEAT_SME2", "z-register", "fdot", "f32", 16, 1, "f16", 64, 2, 64, 5, "throughput", 1, 1.0, 1600000},
+  {{ &setup, &fdot_f32_f16_ilp6, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, one vector)", "FEAT_SME2", "z-register", "fdot", "f32", 16, 1, "f16", 64, 2, 64, 6, "throughput", 1, 1.0, 1333333},
+  {{ &setup, &fdot_f32_f16_ilp7, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, one vector)", "FEAT_SME2", "z-register", "fdot", "f32", 16, 1, "f16", 64, 2, 64, 7, "throughput", 1, 1.0, 1142857},
+  {{ &setup, &fdot_f32_f16_ilp8, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, one vector)", "FEAT_SME2", "z-register", "fdot", "f32", 16, 1, "f16", 64, 2, 64, 8, "throughput", 1, 1.0, 1000000},
+  {{ &setup, &fdot_f32_f16_ilp9, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, one vector)", "FEAT_SME2", "z-register", "fdot", "f32", 16, 1, "f16", 64, 2, 64, 9, "throughput", 1, 1.0, 888888},
+  {{ &setup, &fdot_f32_f16_ilp10, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, one vector)", "FEAT_SME2", "z-register", "fdot", "f32", 16, 1, "f16", 64, 2, 64, 10, "throughput", 1, 1.0, 800000},
+  {{ &setup, &fdot_f32_f16_ilp11, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, one vector)", "FEAT_SME2", "z-register", "fdot", "f32", 16, 1, "f16", 64, 2, 64, 11, "throughput", 1, 1.0, 727272},
+  {{ &setup, &fdot_f32_f16_ilp12, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, one vector)", "FEAT_SME2", "z-register", "fdot", "f32", 16, 1, "f16", 64, 2, 64, 12, "throughput", 1, 1.0, 666666},
+  {{ &setup, &fdot_f32_f16_ilp13, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, one vector)", "FEAT_SME2", "z-register", "fdot", "f32", 16, 1, "f16", 64, 2, 64, 13, "throughput", 1, 1.0, 615384},
+  {{ &setup, &fdot_f32_f16_ilp14, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, one vector)", "FEAT_SME2", "z-register", "fdot", "f32", 16, 1, "f16", 64, 2, 64, 14, "throughput", 1, 1.0, 571428},
+  {{ &setup, &fdot_f32_f16_ilp15, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, one vector)", "FEAT_SME2", "z-register", "fdot", "f32", 16, 1, "f16", 64, 2, 64, 15, "throughput", 1, 1.0, 533333},
+  {{ &setup, &fdot_f32_f16_ilp16, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, one vector)", "FEAT_SME2", "z-register", "fdot", "f32", 16, 1, "f16", 64, 2, 64, 16, "throughput", 1, 1.0, 500000},
+  {{ &setup, &fdot_f32_f16_chain8_ilp1, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, one vector)", "FEAT_SME2", "z-register", "fdot", "f32", 16, 1, "f16", 64, 2, 64, 1, "latency", 8, 1.0, 1000000},
+  {{ &setup, &fdot_f32_f16_chain8_ilp2, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, one vector)", "FEAT_SME2", "z-register", "fdot", "f32", 16, 1, "f16", 64, 2, 64, 2, "latency", 8, 1.0, 500000},
+  {{ &setup, &bfdot_f32_b16_ilp1, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, one vector)", "FEAT_SME2", "z-register", "bfdot", "f32", 16, 1, "b16", 64, 2, 64, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &bfdot_f32_b16_ilp2, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, one vector)", "FEAT_SME2", "z-register", "bfdot", "f32", 16, 1, "b16", 64, 2, 64, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &bfdot_f32_b16_ilp3, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, one vector)", "FEAT_SME2", "z-register", "bfdot", "f32", 16, 1, "b16", 64, 2, 64, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &bfdot_f32_b16_ilp4, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, one vector)", "FEAT_SME2", "z-register", "bfdot", "f32", 16, 1, "b16", 64, 2, 64, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &bfdot_f32_b16_ilp5, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, one vector)", "FEAT_SME2", "z-register", "bfdot", "f32", 16, 1, "b16", 64, 2, 64, 5, "throughput", 1, 1.0, 1600000},
+  {{ &setup, &bfdot_f32_b16_ilp6, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, one vector)", "FEAT_SME2", "z-register", "bfdot", "f32", 16, 1, "b16", 64, 2, 64, 6, "throughput", 1, 1.0, 1333333},
+  {{ &setup, &bfdot_f32_b16_ilp7, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, one vector)", "FEAT_SME2", "z-register", "bfdot", "f32", 16, 1, "b16", 64, 2, 64, 7, "throughput", 1, 1.0, 1142857},
+  {{ &setup, &bfdot_f32_b16_ilp8, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, one vector)", "FEAT_SME2", "z-register", "bfdot", "f32", 16, 1, "b16", 64, 2, 64, 8, "throughput", 1, 1.0, 1000000},
+  {{ &setup, &bfdot_f32_b16_ilp9, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, one vector)", "FEAT_SME2", "z-register", "bfdot", "f32", 16, 1, "b16", 64, 2, 64, 9, "throughput", 1, 1.0, 888888},
+  {{ &setup, &bfdot_f32_b16_ilp10, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, one vector)", "FEAT_SME2", "z-register", "bfdot", "f32", 16, 1, "b16", 64, 2, 64, 10, "throughput", 1, 1.0, 800000},
+  {{ &setup, &bfdot_f32_b16_ilp11, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, one vector)", "FEAT_SME2", "z-register", "bfdot", "f32", 16, 1, "b16", 64, 2, 64, 11, "throughput", 1, 1.0, 727272},
+  {{ &setup, &bfdot_f32_b16_ilp12, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, one vector)", "FEAT_SME2", "z-register", "bfdot", "f32", 16, 1, "b16", 64, 2, 64, 12, "throughput", 1, 1.0, 666666},
+  {{ &setup, &bfdot_f32_b16_ilp13, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, one vector)", "FEAT_SME2", "z-register", "bfdot", "f32", 16, 1, "b16", 64, 2, 64, 13, "throughput", 1, 1.0, 615384},
+  {{ &setup, &bfdot_f32_b16_ilp14, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, one vector)", "FEAT_SME2", "z-register", "bfdot", "f32", 16, 1, "b16", 64, 2, 64, 14, "throughput", 1, 1.0, 571428},
+  {{ &setup, &bfdot_f32_b16_ilp15, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, one vector)", "FEAT_SME2", "z-register", "bfdot", "f32", 16, 1, "b16", 64, 2, 64, 15, "throughput", 1, 1.0, 533333},
+  {{ &setup, &bfdot_f32_b16_ilp16, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, one vector)", "FEAT_SME2", "z-register", "bfdot", "f32", 16, 1, "b16", 64, 2, 64, 16, "throughput", 1, 1.0, 500000},
+  {{ &setup, &bfdot_f32_b16_chain8_ilp1, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, one vector)", "FEAT_SME2", "z-register", "bfdot", "f32", 16, 1, "b16", 64, 2, 64, 1, "latency", 8, 1.0, 1000000},
+  {{ &setup, &bfdot_f32_b16_chain8_ilp2, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, one vector)", "FEAT_SME2", "z-register", "bfdot", "f32", 16, 1, "b16", 64, 2, 64, 2, "latency", 8, 1.0, 500000},
+  {{ &setup, &fdot_za_f32_f16_vgx2_ilp1, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "fdot", "f32", 32, 2, "f16", 128, 4, 128, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &fdot_za_f32_f16_vgx2_ilp2, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "fdot", "f32", 32, 2, "f16", 128, 4, 128, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &fdot_za_f32_f16_vgx2_ilp3, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "fdot", "f32", 32, 2, "f16", 128, 4, 128, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &fdot_za_f32_f16_vgx2_ilp4, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "fdot", "f32", 32, 2, "f16", 128, 4, 128, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &fdot_za_f32_f16_vgx2_ilp5, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "fdot", "f32", 32, 2, "f16", 128, 4, 128, 5, "throughput", 1, 1.0, 1600000},
+  {{ &setup, &fdot_za_f32_f16_vgx2_ilp6, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "fdot", "f32", 32, 2, "f16", 128, 4, 128, 6, "throughput", 1, 1.0, 1333333},
+  {{ &setup, &fdot_za_f32_f16_vgx2_ilp7, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "fdot", "f32", 32, 2, "f16", 128, 4, 128, 7, "throughput", 1, 1.0, 1142857},
+  {{ &setup, &fdot_za_f32_f16_vgx2_ilp8, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "fdot", "f32", 32, 2, "f16", 128, 4, 128, 8, "throughput", 1, 1.0, 1000000},
+  {{ &setup, &fdot_za_f32_f16_vgx2_ilp9, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "fdot", "f32", 32, 2, "f16", 128, 4, 128, 9, "throughput", 1, 1.0, 888888},
+  {{ &setup, &fdot_za_f32_f16_vgx2_ilp10, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "fdot", "f32", 32, 2, "f16", 128, 4, 128, 10, "throughput", 1, 1.0, 800000},
+  {{ &setup, &fdot_za_f32_f16_vgx2_ilp11, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "fdot", "f32", 32, 2, "f16", 128, 4, 128, 11, "throughput", 1, 1.0, 727272},
+  {{ &setup, &fdot_za_f32_f16_vgx2_ilp12, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "fdot", "f32", 32, 2, "f16", 128, 4, 128, 12, "throughput", 1, 1.0, 666666},
+  {{ &setup, &fdot_za_f32_f16_vgx2_ilp13, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "fdot", "f32", 32, 2, "f16", 128, 4, 128, 13, "throughput", 1, 1.0, 615384},
+  {{ &setup, &fdot_za_f32_f16_vgx2_ilp14, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "fdot", "f32", 32, 2, "f16", 128, 4, 128, 14, "throughput", 1, 1.0, 571428},
+  {{ &setup, &fdot_za_f32_f16_vgx2_ilp15, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "fdot", "f32", 32, 2, "f16", 128, 4, 128, 15, "throughput", 1, 1.0, 533333},
+  {{ &setup, &fdot_za_f32_f16_vgx2_ilp16, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "fdot", "f32", 32, 2, "f16", 128, 4, 128, 16, "throughput", 1, 1.0, 500000},
+  {{ &setup, &fdot_za_f32_f16_vgx2_chain8_ilp1, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "fdot", "f32", 32, 2, "f16", 128, 4, 128, 1, "latency", 8, 1.0, 1000000},
+  {{ &setup, &fdot_za_f32_f16_vgx2_chain8_ilp2, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "fdot", "f32", 32, 2, "f16", 128, 4, 128, 2, "latency", 8, 1.0, 500000},
+  {{ &setup, &fdot_za_f32_f16_vgx4_ilp1, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, four vectors)", "FEAT_SME2", "za-vector", "fdot", "f32", 64, 4, "f16", 256, 8, 256, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &fdot_za_f32_f16_vgx4_ilp2, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, four vectors)", "FEAT_SME2", "za-vector", "fdot", "f32", 64, 4, "f16", 256, 8, 256, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &fdot_za_f32_f16_vgx4_ilp3, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, four vectors)", "FEAT_SME2", "za-vector", "fdot", "f32", 64, 4, "f16", 256, 8, 256, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &fdot_za_f32_f16_vgx4_ilp4, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, four vectors)", "FEAT_SME2", "za-vector", "fdot", "f32", 64, 4, "f16", 256, 8, 256, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &fdot_za_f32_f16_vgx4_ilp5, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, four vectors)", "FEAT_SME2", "za-vector", "fdot", "f32", 64, 4, "f16", 256, 8, 256, 5, "throughput", 1, 1.0, 1600000},
+  {{ &setup, &fdot_za_f32_f16_vgx4_ilp6, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, four vectors)", "FEAT_SME2", "za-vector", "fdot", "f32", 64, 4, "f16", 256, 8, 256, 6, "throughput", 1, 1.0, 1333333},
+  {{ &setup, &fdot_za_f32_f16_vgx4_ilp7, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, four vectors)", "FEAT_SME2", "za-vector", "fdot", "f32", 64, 4, "f16", 256, 8, 256, 7, "throughput", 1, 1.0, 1142857},
+  {{ &setup, &fdot_za_f32_f16_vgx4_ilp8, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, four vectors)", "FEAT_SME2", "za-vector", "fdot", "f32", 64, 4, "f16", 256, 8, 256, 8, "throughput", 1, 1.0, 1000000},
+  {{ &setup, &fdot_za_f32_f16_vgx4_ilp9, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, four vectors)", "FEAT_SME2", "za-vector", "fdot", "f32", 64, 4, "f16", 256, 8, 256, 9, "throughput", 1, 1.0, 888888},
+  {{ &setup, &fdot_za_f32_f16_vgx4_ilp10, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, four vectors)", "FEAT_SME2", "za-vector", "fdot", "f32", 64, 4, "f16", 256, 8, 256, 10, "throughput", 1, 1.0, 800000},
+  {{ &setup, &fdot_za_f32_f16_vgx4_ilp11, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, four vectors)", "FEAT_SME2", "za-vector", "fdot", "f32", 64, 4, "f16", 256, 8, 256, 11, "throughput", 1, 1.0, 727272},
+  {{ &setup, &fdot_za_f32_f16_vgx4_ilp12, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, four vectors)", "FEAT_SME2", "za-vector", "fdot", "f32", 64, 4, "f16", 256, 8, 256, 12, "throughput", 1, 1.0, 666666},
+  {{ &setup, &fdot_za_f32_f16_vgx4_ilp13, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, four vectors)", "FEAT_SME2", "za-vector", "fdot", "f32", 64, 4, "f16", 256, 8, 256, 13, "throughput", 1, 1.0, 615384},
+  {{ &setup, &fdot_za_f32_f16_vgx4_ilp14, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, four vectors)", "FEAT_SME2", "za-vector", "fdot", "f32", 64, 4, "f16", 256, 8, 256, 14, "throughput", 1, 1.0, 571428},
+  {{ &setup, &fdot_za_f32_f16_vgx4_ilp15, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, four vectors)", "FEAT_SME2", "za-vector", "fdot", "f32", 64, 4, "f16", 256, 8, 256, 15, "throughput", 1, 1.0, 533333},
+  {{ &setup, &fdot_za_f32_f16_vgx4_ilp16, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, four vectors)", "FEAT_SME2", "za-vector", "fdot", "f32", 64, 4, "f16", 256, 8, 256, 16, "throughput", 1, 1.0, 500000},
+  {{ &setup, &fdot_za_f32_f16_vgx4_chain8_ilp1, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, four vectors)", "FEAT_SME2", "za-vector", "fdot", "f32", 64, 4, "f16", 256, 8, 256, 1, "latency", 8, 1.0, 1000000},
+  {{ &setup, &fdot_za_f32_f16_vgx4_chain8_ilp2, &teardown }, "Dot Product (floating-point)", "FDOT (FP16 to FP32, 2-way, four vectors)", "FEAT_SME2", "za-vector", "fdot", "f32", 64, 4, "f16", 256, 8, 256, 2, "latency", 8, 1.0, 500000},
+  {{ &setup, &bfdot_za_f32_b16_vgx2_ilp1, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "bfdot", "f32", 32, 2, "b16", 128, 4, 128, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &bfdot_za_f32_b16_vgx2_ilp2, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "bfdot", "f32", 32, 2, "b16", 128, 4, 128, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &bfdot_za_f32_b16_vgx2_ilp3, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "bfdot", "f32", 32, 2, "b16", 128, 4, 128, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &bfdot_za_f32_b16_vgx2_ilp4, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "bfdot", "f32", 32, 2, "b16", 128, 4, 128, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &bfdot_za_f32_b16_vgx2_ilp5, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "bfdot", "f32", 32, 2, "b16", 128, 4, 128, 5, "throughput", 1, 1.0, 1600000},
+  {{ &setup, &bfdot_za_f32_b16_vgx2_ilp6, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "bfdot", "f32", 32, 2, "b16", 128, 4, 128, 6, "throughput", 1, 1.0, 1333333},
+  {{ &setup, &bfdot_za_f32_b16_vgx2_ilp7, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "bfdot", "f32", 32, 2, "b16", 128, 4, 128, 7, "throughput", 1, 1.0, 1142857},
+  {{ &setup, &bfdot_za_f32_b16_vgx2_ilp8, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "bfdot", "f32", 32, 2, "b16", 128, 4, 128, 8, "throughput", 1, 1.0, 1000000},
+  {{ &setup, &bfdot_za_f32_b16_vgx2_ilp9, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "bfdot", "f32", 32, 2, "b16", 128, 4, 128, 9, "throughput", 1, 1.0, 888888},
+  {{ &setup, &bfdot_za_f32_b16_vgx2_ilp10, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "bfdot", "f32", 32, 2, "b16", 128, 4, 128, 10, "throughput", 1, 1.0, 800000},
+  {{ &setup, &bfdot_za_f32_b16_vgx2_ilp11, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "bfdot", "f32", 32, 2, "b16", 128, 4, 128, 11, "throughput", 1, 1.0, 727272},
+  {{ &setup, &bfdot_za_f32_b16_vgx2_ilp12, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "bfdot", "f32", 32, 2, "b16", 128, 4, 128, 12, "throughput", 1, 1.0, 666666},
+  {{ &setup, &bfdot_za_f32_b16_vgx2_ilp13, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "bfdot", "f32", 32, 2, "b16", 128, 4, 128, 13, "throughput", 1, 1.0, 615384},
+  {{ &setup, &bfdot_za_f32_b16_vgx2_ilp14, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "bfdot", "f32", 32, 2, "b16", 128, 4, 128, 14, "throughput", 1, 1.0, 571428},
+  {{ &setup, &bfdot_za_f32_b16_vgx2_ilp15, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "bfdot", "f32", 32, 2, "b16", 128, 4, 128, 15, "throughput", 1, 1.0, 533333},
+  {{ &setup, &bfdot_za_f32_b16_vgx2_ilp16, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "bfdot", "f32", 32, 2, "b16", 128, 4, 128, 16, "throughput", 1, 1.0, 500000},
+  {{ &setup, &bfdot_za_f32_b16_vgx2_chain8_ilp1, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "bfdot", "f32", 32, 2, "b16", 128, 4, 128, 1, "latency", 8, 1.0, 1000000},
+  {{ &setup, &bfdot_za_f32_b16_vgx2_chain8_ilp2, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "bfdot", "f32", 32, 2, "b16", 128, 4, 128, 2, "latency", 8, 1.0, 500000},
+  {{ &setup, &bfdot_za_f32_b16_vgx4_ilp1, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "bfdot", "f32", 64, 4, "b16", 256, 8, 256, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &bfdot_za_f32_b16_vgx4_ilp2, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "bfdot", "f32", 64, 4, "b16", 256, 8, 256, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &bfdot_za_f32_b16_vgx4_ilp3, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "bfdot", "f32", 64, 4, "b16", 256, 8, 256, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &bfdot_za_f32_b16_vgx4_ilp4, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "bfdot", "f32", 64, 4, "b16", 256, 8, 256, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &bfdot_za_f32_b16_vgx4_ilp5, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "bfdot", "f32", 64, 4, "b16", 256, 8, 256, 5, "throughput", 1, 1.0, 1600000},
+  {{ &setup, &bfdot_za_f32_b16_vgx4_ilp6, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "bfdot", "f32", 64, 4, "b16", 256, 8, 256, 6, "throughput", 1, 1.0, 1333333},
+  {{ &setup, &bfdot_za_f32_b16_vgx4_ilp7, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "bfdot", "f32", 64, 4, "b16", 256, 8, 256, 7, "throughput", 1, 1.0, 1142857},
+  {{ &setup, &bfdot_za_f32_b16_vgx4_ilp8, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "bfdot", "f32", 64, 4, "b16", 256, 8, 256, 8, "throughput", 1, 1.0, 1000000},
+  {{ &setup, &bfdot_za_f32_b16_vgx4_ilp9, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "bfdot", "f32", 64, 4, "b16", 256, 8, 256, 9, "throughput", 1, 1.0, 888888},
+  {{ &setup, &bfdot_za_f32_b16_vgx4_ilp10, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "bfdot", "f32", 64, 4, "b16", 256, 8, 256, 10, "throughput", 1, 1.0, 800000},
+  {{ &setup, &bfdot_za_f32_b16_vgx4_ilp11, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "bfdot", "f32", 64, 4, "b16", 256, 8, 256, 11, "throughput", 1, 1.0, 727272},
+  {{ &setup, &bfdot_za_f32_b16_vgx4_ilp12, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "bfdot", "f32", 64, 4, "b16", 256, 8, 256, 12, "throughput", 1, 1.0, 666666},
+  {{ &setup, &bfdot_za_f32_b16_vgx4_ilp13, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "bfdot", "f32", 64, 4, "b16", 256, 8, 256, 13, "throughput", 1, 1.0, 615384},
+  {{ &setup, &bfdot_za_f32_b16_vgx4_ilp14, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "bfdot", "f32", 64, 4, "b16", 256, 8, 256, 14, "throughput", 1, 1.0, 571428},
+  {{ &setup, &bfdot_za_f32_b16_vgx4_ilp15, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "bfdot", "f32", 64, 4, "b16", 256, 8, 256, 15, "throughput", 1, 1.0, 533333},
+  {{ &setup, &bfdot_za_f32_b16_vgx4_ilp16, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "bfdot", "f32", 64, 4, "b16", 256, 8, 256, 16, "throughput", 1, 1.0, 500000},
+  {{ &setup, &bfdot_za_f32_b16_vgx4_chain8_ilp1, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "bfdot", "f32", 64, 4, "b16", 256, 8, 256, 1, "latency", 8, 1.0, 1000000},
+  {{ &setup, &bfdot_za_f32_b16_vgx4_chain8_ilp2, &teardown }, "Dot Product (floating-point)", "BFDOT (BF16 to FP32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "bfdot", "f32", 64, 4, "b16", 256, 8, 256, 2, "latency", 8, 1.0, 500000},
+  {{ &setup, &sdot_i32_i16_ilp1, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i32", 16, 1, "i16", 64, 2, 64, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &sdot_i32_i16_ilp2, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i32", 16, 1, "i16", 64, 2, 64, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &sdot_i32_i16_ilp3, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i32", 16, 1, "i16", 64, 2, 64, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &sdot_i32_i16_ilp4, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i32", 16, 1, "i16", 64, 2, 64, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &sdot_i32_i16_ilp5, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i32", 16, 1, "i16", 64, 2, 64, 5, "throughput", 1, 1.0, 1600000},
+  {{ &setup, &sdot_i32_i16_ilp6, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i32", 16, 1, "i16", 64, 2, 64, 6, "throughput", 1, 1.0, 1333333},
+  {{ &setup, &sdot_i32_i16_ilp7, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i32", 16, 1, "i16", 64, 2, 64, 7, "throughput", 1, 1.0, 1142857},
+  {{ &setup, &sdot_i32_i16_ilp8, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i32", 16, 1, "i16", 64, 2, 64, 8, "throughput", 1, 1.0, 1000000},
+  {{ &setup, &sdot_i32_i16_ilp9, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i32", 16, 1, "i16", 64, 2, 64, 9, "throughput", 1, 1.0, 888888},
+  {{ &setup, &sdot_i32_i16_ilp10, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i32", 16, 1, "i16", 64, 2, 64, 10, "throughput", 1, 1.0, 800000},
+  {{ &setup, &sdot_i32_i16_ilp11, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i32", 16, 1, "i16", 64, 2, 64, 11, "throughput", 1, 1.0, 727272},
+  {{ &setup, &sdot_i32_i16_ilp12, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i32", 16, 1, "i16", 64, 2, 64, 12, "throughput", 1, 1.0, 666666},
+  {{ &setup, &sdot_i32_i16_ilp13, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i32", 16, 1, "i16", 64, 2, 64, 13, "throughput", 1, 1.0, 615384},
+  {{ &setup, &sdot_i32_i16_ilp14, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i32", 16, 1, "i16", 64, 2, 64, 14, "throughput", 1, 1.0, 571428},
+  {{ &setup, &sdot_i32_i16_ilp15, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i32", 16, 1, "i16", 64, 2, 64, 15, "throughput", 1, 1.0, 533333},
+  {{ &setup, &sdot_i32_i16_ilp16, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i32", 16, 1, "i16", 64, 2, 64, 16, "throughput", 1, 1.0, 500000},
+  {{ &setup, &sdot_i32_i16_chain8_ilp1, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i32", 16, 1, "i16", 64, 2, 64, 1, "latency", 8, 1.0, 1000000},
+  {{ &setup, &sdot_i32_i16_chain8_ilp2, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i32", 16, 1, "i16", 64, 2, 64, 2, "latency", 8, 1.0, 500000},
+  {{ &setup, &sdot_i32_i8_ilp1, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i32", 16, 1, "i8", 128, 2, 128, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &sdot_i32_i8_ilp2, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i32", 16, 1, "i8", 128, 2, 128, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &sdot_i32_i8_ilp3, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i32", 16, 1, "i8", 128, 2, 128, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &sdot_i32_i8_ilp4, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i32", 16, 1, "i8", 128, 2, 128, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &sdot_i32_i8_ilp5, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i32", 16, 1, "i8", 128, 2, 128, 5, "throughput", 1, 1.0, 1600000},
+  {{ &setup, &sdot_i32_i8_ilp6, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i32", 16, 1, "i8", 128, 2, 128, 6, "throughput", 1, 1.0, 1333333},
+  {{ &setup, &sdot_i32_i8_ilp7, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i32", 16, 1, "i8", 128, 2, 128, 7, "throughput", 1, 1.0, 1142857},
+  {{ &setup, &sdot_i32_i8_ilp8, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i32", 16, 1, "i8", 128, 2, 128, 8, "throughput", 1, 1.0, 1000000},
+  {{ &setup, &sdot_i32_i8_ilp9, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i32", 16, 1, "i8", 128, 2, 128, 9, "throughput", 1, 1.0, 888888},
+  {{ &setup, &sdot_i32_i8_ilp10, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i32", 16, 1, "i8", 128, 2, 128, 10, "throughput", 1, 1.0, 800000},
+  {{ &setup, &sdot_i32_i8_ilp11, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i32", 16, 1, "i8", 128, 2, 128, 11, "throughput", 1, 1.0, 727272},
+  {{ &setup, &sdot_i32_i8_ilp12, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i32", 16, 1, "i8", 128, 2, 128, 12, "throughput", 1, 1.0, 666666},
+  {{ &setup, &sdot_i32_i8_ilp13, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i32", 16, 1, "i8", 128, 2, 128, 13, "throughput", 1, 1.0, 615384},
+  {{ &setup, &sdot_i32_i8_ilp14, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i32", 16, 1, "i8", 128, 2, 128, 14, "throughput", 1, 1.0, 571428},
+  {{ &setup, &sdot_i32_i8_ilp15, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i32", 16, 1, "i8", 128, 2, 128, 15, "throughput", 1, 1.0, 533333},
+  {{ &setup, &sdot_i32_i8_ilp16, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i32", 16, 1, "i8", 128, 2, 128, 16, "throughput", 1, 1.0, 500000},
+  {{ &setup, &sdot_i32_i8_chain8_ilp1, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i32", 16, 1, "i8", 128, 2, 128, 1, "latency", 8, 1.0, 1000000},
+  {{ &setup, &sdot_i32_i8_chain8_ilp2, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i32", 16, 1, "i8", 128, 2, 128, 2, "latency", 8, 1.0, 500000},
+  {{ &setup, &sdot_i64_i16_ilp1, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i64", 8, 1, "i16", 64, 2, 64, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &sdot_i64_i16_ilp2, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i64", 8, 1, "i16", 64, 2, 64, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &sdot_i64_i16_ilp3, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i64", 8, 1, "i16", 64, 2, 64, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &sdot_i64_i16_ilp4, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i64", 8, 1, "i16", 64, 2, 64, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &sdot_i64_i16_ilp5, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i64", 8, 1, "i16", 64, 2, 64, 5, "throughput", 1, 1.0, 1600000},
+  {{ &setup, &sdot_i64_i16_ilp6, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i64", 8, 1, "i16", 64, 2, 64, 6, "throughput", 1, 1.0, 1333333},
+  {{ &setup, &sdot_i64_i16_ilp7, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i64", 8, 1, "i16", 64, 2, 64, 7, "throughput", 1, 1.0, 1142857},
+  {{ &setup, &sdot_i64_i16_ilp8, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i64", 8, 1, "i16", 64, 2, 64, 8, "throughput", 1, 1.0, 1000000},
+  {{ &setup, &sdot_i64_i16_ilp9, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i64", 8, 1, "i16", 64, 2, 64, 9, "throughput", 1, 1.0, 888888},
+  {{ &setup, &sdot_i64_i16_ilp10, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i64", 8, 1, "i16", 64, 2, 64, 10, "throughput", 1, 1.0, 800000},
+  {{ &setup, &sdot_i64_i16_ilp11, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i64", 8, 1, "i16", 64, 2, 64, 11, "throughput", 1, 1.0, 727272},
+  {{ &setup, &sdot_i64_i16_ilp12, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i64", 8, 1, "i16", 64, 2, 64, 12, "throughput", 1, 1.0, 666666},
+  {{ &setup, &sdot_i64_i16_ilp13, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i64", 8, 1, "i16", 64, 2, 64, 13, "throughput", 1, 1.0, 615384},
+  {{ &setup, &sdot_i64_i16_ilp14, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i64", 8, 1, "i16", 64, 2, 64, 14, "throughput", 1, 1.0, 571428},
+  {{ &setup, &sdot_i64_i16_ilp15, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i64", 8, 1, "i16", 64, 2, 64, 15, "throughput", 1, 1.0, 533333},
+  {{ &setup, &sdot_i64_i16_ilp16, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i64", 8, 1, "i16", 64, 2, 64, 16, "throughput", 1, 1.0, 500000},
+  {{ &setup, &sdot_i64_i16_chain8_ilp1, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i64", 8, 1, "i16", 64, 2, 64, 1, "latency", 8, 1.0, 1000000},
+  {{ &setup, &sdot_i64_i16_chain8_ilp2, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, one vector)", "FEAT_SME2", "z-register", "sdot", "i64", 8, 1, "i16", 64, 2, 64, 2, "latency", 8, 1.0, 500000},
+  {{ &setup, &sdot_za_i32_i16_vgx2_ilp1, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 32, 2, "i16", 128, 4, 128, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &sdot_za_i32_i16_vgx2_ilp2, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 32, 2, "i16", 128, 4, 128, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &sdot_za_i32_i16_vgx2_ilp3, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 32, 2, "i16", 128, 4, 128, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &sdot_za_i32_i16_vgx2_ilp4, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 32, 2, "i16", 128, 4, 128, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &sdot_za_i32_i16_vgx2_ilp5, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 32, 2, "i16", 128, 4, 128, 5, "throughput", 1, 1.0, 1600000},
+  {{ &setup, &sdot_za_i32_i16_vgx2_ilp6, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 32, 2, "i16", 128, 4, 128, 6, "throughput", 1, 1.0, 1333333},
+  {{ &setup, &sdot_za_i32_i16_vgx2_ilp7, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 32, 2, "i16", 128, 4, 128, 7, "throughput", 1, 1.0, 1142857},
+  {{ &setup, &sdot_za_i32_i16_vgx2_ilp8, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 32, 2, "i16", 128, 4, 128, 8, "throughput", 1, 1.0, 1000000},
+  {{ &setup, &sdot_za_i32_i16_vgx2_ilp9, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 32, 2, "i16", 128, 4, 128, 9, "throughput", 1, 1.0, 888888},
+  {{ &setup, &sdot_za_i32_i16_vgx2_ilp10, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 32, 2, "i16", 128, 4, 128, 10, "throughput", 1, 1.0, 800000},
+  {{ &setup, &sdot_za_i32_i16_vgx2_ilp11, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 32, 2, "i16", 128, 4, 128, 11, "throughput", 1, 1.0, 727272},
+  {{ &setup, &sdot_za_i32_i16_vgx2_ilp12, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 32, 2, "i16", 128, 4, 128, 12, "throughput", 1, 1.0, 666666},
+  {{ &setup, &sdot_za_i32_i16_vgx2_ilp13, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 32, 2, "i16", 128, 4, 128, 13, "throughput", 1, 1.0, 615384},
+  {{ &setup, &sdot_za_i32_i16_vgx2_ilp14, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 32, 2, "i16", 128, 4, 128, 14, "throughput", 1, 1.0, 571428},
+  {{ &setup, &sdot_za_i32_i16_vgx2_ilp15, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 32, 2, "i16", 128, 4, 128, 15, "throughput", 1, 1.0, 533333},
+  {{ &setup, &sdot_za_i32_i16_vgx2_ilp16, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 32, 2, "i16", 128, 4, 128, 16, "throughput", 1, 1.0, 500000},
+  {{ &setup, &sdot_za_i32_i16_vgx2_chain8_ilp1, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 32, 2, "i16", 128, 4, 128, 1, "latency", 8, 1.0, 1000000},
+  {{ &setup, &sdot_za_i32_i16_vgx2_chain8_ilp2, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 32, 2, "i16", 128, 4, 128, 2, "latency", 8, 1.0, 500000},
+  {{ &setup, &sdot_za_i32_i16_vgx4_ilp1, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 64, 4, "i16", 256, 8, 256, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &sdot_za_i32_i16_vgx4_ilp2, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 64, 4, "i16", 256, 8, 256, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &sdot_za_i32_i16_vgx4_ilp3, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 64, 4, "i16", 256, 8, 256, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &sdot_za_i32_i16_vgx4_ilp4, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 64, 4, "i16", 256, 8, 256, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &sdot_za_i32_i16_vgx4_ilp5, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 64, 4, "i16", 256, 8, 256, 5, "throughput", 1, 1.0, 1600000},
+  {{ &setup, &sdot_za_i32_i16_vgx4_ilp6, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 64, 4, "i16", 256, 8, 256, 6, "throughput", 1, 1.0, 1333333},
+  {{ &setup, &sdot_za_i32_i16_vgx4_ilp7, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 64, 4, "i16", 256, 8, 256, 7, "throughput", 1, 1.0, 1142857},
+  {{ &setup, &sdot_za_i32_i16_vgx4_ilp8, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 64, 4, "i16", 256, 8, 256, 8, "throughput", 1, 1.0, 1000000},
+  {{ &setup, &sdot_za_i32_i16_vgx4_ilp9, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 64, 4, "i16", 256, 8, 256, 9, "throughput", 1, 1.0, 888888},
+  {{ &setup, &sdot_za_i32_i16_vgx4_ilp10, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 64, 4, "i16", 256, 8, 256, 10, "throughput", 1, 1.0, 800000},
+  {{ &setup, &sdot_za_i32_i16_vgx4_ilp11, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 64, 4, "i16", 256, 8, 256, 11, "throughput", 1, 1.0, 727272},
+  {{ &setup, &sdot_za_i32_i16_vgx4_ilp12, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 64, 4, "i16", 256, 8, 256, 12, "throughput", 1, 1.0, 666666},
+  {{ &setup, &sdot_za_i32_i16_vgx4_ilp13, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 64, 4, "i16", 256, 8, 256, 13, "throughput", 1, 1.0, 615384},
+  {{ &setup, &sdot_za_i32_i16_vgx4_ilp14, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 64, 4, "i16", 256, 8, 256, 14, "throughput", 1, 1.0, 571428},
+  {{ &setup, &sdot_za_i32_i16_vgx4_ilp15, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 64, 4, "i16", 256, 8, 256, 15, "throughput", 1, 1.0, 533333},
+  {{ &setup, &sdot_za_i32_i16_vgx4_ilp16, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 64, 4, "i16", 256, 8, 256, 16, "throughput", 1, 1.0, 500000},
+  {{ &setup, &sdot_za_i32_i16_vgx4_chain8_ilp1, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 64, 4, "i16", 256, 8, 256, 1, "latency", 8, 1.0, 1000000},
+  {{ &setup, &sdot_za_i32_i16_vgx4_chain8_ilp2, &teardown }, "Dot Product (integer)", "SDOT (I16 to I32, 2-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 64, 4, "i16", 256, 8, 256, 2, "latency", 8, 1.0, 500000},
+  {{ &setup, &sdot_za_i32_i8_vgx2_ilp1, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 32, 2, "i8", 256, 4, 256, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &sdot_za_i32_i8_vgx2_ilp2, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 32, 2, "i8", 256, 4, 256, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &sdot_za_i32_i8_vgx2_ilp3, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 32, 2, "i8", 256, 4, 256, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &sdot_za_i32_i8_vgx2_ilp4, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 32, 2, "i8", 256, 4, 256, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &sdot_za_i32_i8_vgx2_ilp5, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 32, 2, "i8", 256, 4, 256, 5, "throughput", 1, 1.0, 1600000},
+  {{ &setup, &sdot_za_i32_i8_vgx2_ilp6, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 32, 2, "i8", 256, 4, 256, 6, "throughput", 1, 1.0, 1333333},
+  {{ &setup, &sdot_za_i32_i8_vgx2_ilp7, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 32, 2, "i8", 256, 4, 256, 7, "throughput", 1, 1.0, 1142857},
+  {{ &setup, &sdot_za_i32_i8_vgx2_ilp8, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 32, 2, "i8", 256, 4, 256, 8, "throughput", 1, 1.0, 1000000},
+  {{ &setup, &sdot_za_i32_i8_vgx2_ilp9, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 32, 2, "i8", 256, 4, 256, 9, "throughput", 1, 1.0, 888888},
+  {{ &setup, &sdot_za_i32_i8_vgx2_ilp10, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 32, 2, "i8", 256, 4, 256, 10, "throughput", 1, 1.0, 800000},
+  {{ &setup, &sdot_za_i32_i8_vgx2_ilp11, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 32, 2, "i8", 256, 4, 256, 11, "throughput", 1, 1.0, 727272},
+  {{ &setup, &sdot_za_i32_i8_vgx2_ilp12, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 32, 2, "i8", 256, 4, 256, 12, "throughput", 1, 1.0, 666666},
+  {{ &setup, &sdot_za_i32_i8_vgx2_ilp13, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 32, 2, "i8", 256, 4, 256, 13, "throughput", 1, 1.0, 615384},
+  {{ &setup, &sdot_za_i32_i8_vgx2_ilp14, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 32, 2, "i8", 256, 4, 256, 14, "throughput", 1, 1.0, 571428},
+  {{ &setup, &sdot_za_i32_i8_vgx2_ilp15, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 32, 2, "i8", 256, 4, 256, 15, "throughput", 1, 1.0, 533333},
+  {{ &setup, &sdot_za_i32_i8_vgx2_ilp16, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 32, 2, "i8", 256, 4, 256, 16, "throughput", 1, 1.0, 500000},
+  {{ &setup, &sdot_za_i32_i8_vgx2_chain8_ilp1, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 32, 2, "i8", 256, 4, 256, 1, "latency", 8, 1.0, 1000000},
+  {{ &setup, &sdot_za_i32_i8_vgx2_chain8_ilp2, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 32, 2, "i8", 256, 4, 256, 2, "latency", 8, 1.0, 500000},
+  {{ &setup, &sdot_za_i32_i8_vgx4_ilp1, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 64, 4, "i8", 512, 8, 512, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &sdot_za_i32_i8_vgx4_ilp2, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 64, 4, "i8", 512, 8, 512, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &sdot_za_i32_i8_vgx4_ilp3, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 64, 4, "i8", 512, 8, 512, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &sdot_za_i32_i8_vgx4_ilp4, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 64, 4, "i8", 512, 8, 512, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &sdot_za_i32_i8_vgx4_ilp5, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 64, 4, "i8", 512, 8, 512, 5, "throughput", 1, 1.0, 1600000},
+  {{ &setup, &sdot_za_i32_i8_vgx4_ilp6, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 64, 4, "i8", 512, 8, 512, 6, "throughput", 1, 1.0, 1333333},
+  {{ &setup, &sdot_za_i32_i8_vgx4_ilp7, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 64, 4, "i8", 512, 8, 512, 7, "throughput", 1, 1.0, 1142857},
+  {{ &setup, &sdot_za_i32_i8_vgx4_ilp8, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 64, 4, "i8", 512, 8, 512, 8, "throughput", 1, 1.0, 1000000},
+  {{ &setup, &sdot_za_i32_i8_vgx4_ilp9, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 64, 4, "i8", 512, 8, 512, 9, "throughput", 1, 1.0, 888888},
+  {{ &setup, &sdot_za_i32_i8_vgx4_ilp10, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 64, 4, "i8", 512, 8, 512, 10, "throughput", 1, 1.0, 800000},
+  {{ &setup, &sdot_za_i32_i8_vgx4_ilp11, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 64, 4, "i8", 512, 8, 512, 11, "throughput", 1, 1.0, 727272},
+  {{ &setup, &sdot_za_i32_i8_vgx4_ilp12, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 64, 4, "i8", 512, 8, 512, 12, "throughput", 1, 1.0, 666666},
+  {{ &setup, &sdot_za_i32_i8_vgx4_ilp13, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 64, 4, "i8", 512, 8, 512, 13, "throughput", 1, 1.0, 615384},
+  {{ &setup, &sdot_za_i32_i8_vgx4_ilp14, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 64, 4, "i8", 512, 8, 512, 14, "throughput", 1, 1.0, 571428},
+  {{ &setup, &sdot_za_i32_i8_vgx4_ilp15, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 64, 4, "i8", 512, 8, 512, 15, "throughput", 1, 1.0, 533333},
+  {{ &setup, &sdot_za_i32_i8_vgx4_ilp16, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 64, 4, "i8", 512, 8, 512, 16, "throughput", 1, 1.0, 500000},
+  {{ &setup, &sdot_za_i32_i8_vgx4_chain8_ilp1, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 64, 4, "i8", 512, 8, 512, 1, "latency", 8, 1.0, 1000000},
+  {{ &setup, &sdot_za_i32_i8_vgx4_chain8_ilp2, &teardown }, "Dot Product (integer)", "SDOT (I8 to I32, 4-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i32", 64, 4, "i8", 512, 8, 512, 2, "latency", 8, 1.0, 500000},
+  {{ &setup, &sdot_za_i64_i16_vgx2_ilp1, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i64", 16, 2, "i16", 128, 4, 128, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &sdot_za_i64_i16_vgx2_ilp2, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i64", 16, 2, "i16", 128, 4, 128, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &sdot_za_i64_i16_vgx2_ilp3, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i64", 16, 2, "i16", 128, 4, 128, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &sdot_za_i64_i16_vgx2_ilp4, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i64", 16, 2, "i16", 128, 4, 128, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &sdot_za_i64_i16_vgx2_ilp5, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i64", 16, 2, "i16", 128, 4, 128, 5, "throughput", 1, 1.0, 1600000},
+  {{ &setup, &sdot_za_i64_i16_vgx2_ilp6, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i64", 16, 2, "i16", 128, 4, 128, 6, "throughput", 1, 1.0, 1333333},
+  {{ &setup, &sdot_za_i64_i16_vgx2_ilp7, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i64", 16, 2, "i16", 128, 4, 128, 7, "throughput", 1, 1.0, 1142857},
+  {{ &setup, &sdot_za_i64_i16_vgx2_ilp8, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i64", 16, 2, "i16", 128, 4, 128, 8, "throughput", 1, 1.0, 1000000},
+  {{ &setup, &sdot_za_i64_i16_vgx2_ilp9, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i64", 16, 2, "i16", 128, 4, 128, 9, "throughput", 1, 1.0, 888888},
+  {{ &setup, &sdot_za_i64_i16_vgx2_ilp10, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i64", 16, 2, "i16", 128, 4, 128, 10, "throughput", 1, 1.0, 800000},
+  {{ &setup, &sdot_za_i64_i16_vgx2_ilp11, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i64", 16, 2, "i16", 128, 4, 128, 11, "throughput", 1, 1.0, 727272},
+  {{ &setup, &sdot_za_i64_i16_vgx2_ilp12, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i64", 16, 2, "i16", 128, 4, 128, 12, "throughput", 1, 1.0, 666666},
+  {{ &setup, &sdot_za_i64_i16_vgx2_ilp13, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i64", 16, 2, "i16", 128, 4, 128, 13, "throughput", 1, 1.0, 615384},
+  {{ &setup, &sdot_za_i64_i16_vgx2_ilp14, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i64", 16, 2, "i16", 128, 4, 128, 14, "throughput", 1, 1.0, 571428},
+  {{ &setup, &sdot_za_i64_i16_vgx2_ilp15, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i64", 16, 2, "i16", 128, 4, 128, 15, "throughput", 1, 1.0, 533333},
+  {{ &setup, &sdot_za_i64_i16_vgx2_ilp16, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i64", 16, 2, "i16", 128, 4, 128, 16, "throughput", 1, 1.0, 500000},
+  {{ &setup, &sdot_za_i64_i16_vgx2_chain8_ilp1, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i64", 16, 2, "i16", 128, 4, 128, 1, "latency", 8, 1.0, 1000000},
+  {{ &setup, &sdot_za_i64_i16_vgx2_chain8_ilp2, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, two vectors)", "FEAT_SME2", "za-vector", "sdot", "i64", 16, 2, "i16", 128, 4, 128, 2, "latency", 8, 1.0, 500000},
+  {{ &setup, &sdot_za_i64_i16_vgx4_ilp1, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i64", 32, 4, "i16", 256, 8, 256, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &sdot_za_i64_i16_vgx4_ilp2, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i64", 32, 4, "i16", 256, 8, 256, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &sdot_za_i64_i16_vgx4_ilp3, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i64", 32, 4, "i16", 256, 8, 256, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &sdot_za_i64_i16_vgx4_ilp4, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i64", 32, 4, "i16", 256, 8, 256, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &sdot_za_i64_i16_vgx4_ilp5, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i64", 32, 4, "i16", 256, 8, 256, 5, "throughput", 1, 1.0, 1600000},
+  {{ &setup, &sdot_za_i64_i16_vgx4_ilp6, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i64", 32, 4, "i16", 256, 8, 256, 6, "throughput", 1, 1.0, 1333333},
+  {{ &setup, &sdot_za_i64_i16_vgx4_ilp7, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i64", 32, 4, "i16", 256, 8, 256, 7, "throughput", 1, 1.0, 1142857},
+  {{ &setup, &sdot_za_i64_i16_vgx4_ilp8, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i64", 32, 4, "i16", 256, 8, 256, 8, "throughput", 1, 1.0, 1000000},
+  {{ &setup, &sdot_za_i64_i16_vgx4_ilp9, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i64", 32, 4, "i16", 256, 8, 256, 9, "throughput", 1, 1.0, 888888},
+  {{ &setup, &sdot_za_i64_i16_vgx4_ilp10, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i64", 32, 4, "i16", 256, 8, 256, 10, "throughput", 1, 1.0, 800000},
+  {{ &setup, &sdot_za_i64_i16_vgx4_ilp11, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i64", 32, 4, "i16", 256, 8, 256, 11, "throughput", 1, 1.0, 727272},
+  {{ &setup, &sdot_za_i64_i16_vgx4_ilp12, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i64", 32, 4, "i16", 256, 8, 256, 12, "throughput", 1, 1.0, 666666},
+  {{ &setup, &sdot_za_i64_i16_vgx4_ilp13, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i64", 32, 4, "i16", 256, 8, 256, 13, "throughput", 1, 1.0, 615384},
+  {{ &setup, &sdot_za_i64_i16_vgx4_ilp14, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i64", 32, 4, "i16", 256, 8, 256, 14, "throughput", 1, 1.0, 571428},
+  {{ &setup, &sdot_za_i64_i16_vgx4_ilp15, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i64", 32, 4, "i16", 256, 8, 256, 15, "throughput", 1, 1.0, 533333},
+  {{ &setup, &sdot_za_i64_i16_vgx4_ilp16, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i64", 32, 4, "i16", 256, 8, 256, 16, "throughput", 1, 1.0, 500000},
+  {{ &setup, &sdot_za_i64_i16_vgx4_chain8_ilp1, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i64", 32, 4, "i16", 256, 8, 256, 1, "latency", 8, 1.0, 1000000},
+  {{ &setup, &sdot_za_i64_i16_vgx4_chain8_ilp2, &teardown }, "Dot Product (integer)", "SDOT (I16 to I64, 4-way, four vectors)", "FEAT_SME2", "za-vector", "sdot", "i64", 32, 4, "i16", 256, 8, 256, 2, "latency", 8, 1.0, 500000},
+  {{ &setup, &fclamp_z_register_f32_f32_vgx2_ilp1, &teardown }, "Multi-vector (floating-point)", "FCLAMP (FP32, two vectors)", "FEAT_SME2", "z-register", "fclamp", "f32", 32, 2, "f32", 32, 2, 64, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &fclamp_z_register_f32_f32_vgx2_ilp2, &teardown }, "Multi-vector (floating-point)", "FCLAMP (FP32, two vectors)", "FEAT_SME2", "z-register", "fclamp", "f32", 32, 2, "f32", 32, 2, 64, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &fclamp_z_register_f32_f32_vgx2_ilp3, &teardown }, "Multi-vector (floating-point)", "FCLAMP (FP32, two vectors)", "FEAT_SME2", "z-register", "fclamp", "f32", 32, 2, "f32", 32, 2, 64, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &fclamp_z_register_f32_f32_vgx2_ilp4, &teardown }, "Multi-vector (floating-point)", "FCLAMP (FP32, two vectors)", "FEAT_SME2", "z-register", "fclamp", "f32", 32, 2, "f32", 32, 2, 64, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &fclamp_z_register_f32_f32_vgx2_ilp5, &teardown }, "Multi-vector (floating-point)", "FCLAMP (FP32, two vectors)", "FEAT_SME2", "z-register", "fclamp", "f32", 32, 2, "f32", 32, 2, 64, 5, "throughput", 1, 1.0, 1600000},
+  {{ &setup, &fclamp_z_register_f32_f32_vgx2_ilp6, &teardown }, "Multi-vector (floating-point)", "FCLAMP (FP32, two vectors)", "FEAT_SME2", "z-register", "fclamp", "f32", 32, 2, "f32", 32, 2, 64, 6, "throughput", 1, 1.0, 1333333},
+  {{ &setup, &fclamp_z_register_f32_f32_vgx2_ilp7, &teardown }, "Multi-vector (floating-point)", "FCLAMP (FP32, two vectors)", "FEAT_SME2", "z-register", "fclamp", "f32", 32, 2, "f32", 32, 2, 64, 7, "throughput", 1, 1.0, 1142857},
+  {{ &setup, &fclamp_z_register_f32_f32_vgx2_ilp8, &teardown }, "Multi-vector (floating-point)", "FCLAMP (FP32, two vectors)", "FEAT_SME2", "z-register", "fclamp", "f32", 32, 2, "f32", 32, 2, 64, 8, "throughput", 1, 1.0, 1000000},
+  {{ &setup, &fclamp_z_register_f32_f32_vgx2_ilp9, &teardown }, "Multi-vector (floating-point)", "FCLAMP (FP32, two vectors)", "FEAT_SME2", "z-register", "fclamp", "f32", 32, 2, "f32", 32, 2, 64, 9, "throughput", 1, 1.0, 888888},
+  {{ &setup, &fclamp_z_register_f32_f32_vgx2_ilp10, &teardown }, "Multi-vector (floating-point)", "FCLAMP (FP32, two vectors)", "FEAT_SME2", "z-register", "fclamp", "f32", 32, 2, "f32", 32, 2, 64, 10, "throughput", 1, 1.0, 800000},
+  {{ &setup, &fclamp_z_register_f32_f32_vgx2_ilp11, &teardown }, "Multi-vector (floating-point)", "FCLAMP (FP32, two vectors)", "FEAT_SME2", "z-register", "fclamp", "f32", 32, 2, "f32", 32, 2, 64, 11, "throughput", 1, 1.0, 727272},
+  {{ &setup, &fclamp_z_register_f32_f32_vgx2_ilp12, &teardown }, "Multi-vector (floating-point)", "FCLAMP (FP32, two vectors)", "FEAT_SME2", "z-register", "fclamp", "f32", 32, 2, "f32", 32, 2, 64, 12, "throughput", 1, 1.0, 666666},
+  {{ &setup, &fclamp_z_register_f32_f32_vgx2_ilp13, &teardown }, "Multi-vector (floating-point)", "FCLAMP (FP32, two vectors)", "FEAT_SME2", "z-register", "fclamp", "f32", 32, 2, "f32", 32, 2, 64, 13, "throughput", 1, 1.0, 615384},
+  {{ &setup, &fclamp_z_register_f32_f32_vgx2_ilp14, &teardown }, "Multi-vector (floating-point)", "FCLAMP (FP32, two vectors)", "FEAT_SME2", "z-register", "fclamp", "f32", 32, 2, "f32", 32, 2, 64, 14, "throughput", 1, 1.0, 571428},
+  {{ &setup, &fclamp_z_register_f32_f32_vgx2_ilp15, &teardown }, "Multi-vector (floating-point)", "FCLAMP (FP32, two vectors)", "FEAT_SME2", "z-register", "fclamp", "f32", 32, 2, "f32", 32, 2, 64, 15, "throughput", 1, 1.0, 533333},
+  {{ &setup, &fcvt_z_register_f16_f32_vgx2_ilp1, &teardown }, "Multi-vector (floating-point)", "FCVT (FP32 to FP16, two vectors)", "FEAT_SME2", "z-register", "fcvt", "f16", 32, 1, "f32", 32, 2, 32, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &fcvt_z_register_f16_f32_vgx2_ilp2, &teardown }, "Multi-vector (floating-point)", "FCVT (FP32 to FP16, two vectors)", "FEAT_SME2", "z-register", "fcvt", "f16", 32, 1, "f32", 32, 2, 32, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &fcvt_z_register_f16_f32_vgx2_ilp3, &teardown }, "Multi-vector (floating-point)", "FCVT (FP32 to FP16, two vectors)", "FEAT_SME2", "z-register", "fcvt", "f16", 32, 1, "f32", 32, 2, 32, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &fcvt_z_register_f16_f32_vgx2_ilp4, &teardown }, "Multi-vector (floating-point)", "FCVT (FP32 to FP16, two vectors)", "FEAT_SME2", "z-register", "fcvt", "f16", 32, 1, "f32", 32, 2, 32, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &fcvt_z_register_f16_f32_vgx2_ilp5, &teardown }, "Multi-vector (floating-point)", "FCVT (FP32 to FP16, two vectors)", "FEAT_SME2", "z-register", "fcvt", "f16", 32, 1, "f32", 32, 2, 32, 5, "throughput", 1, 1.0, 1600000},
+  {{ &setup, &fcvt_z_register_f16_f32_vgx2_ilp6, &teardown }, "Multi-vector (floating-point)", "FCVT (FP32 to FP16, two vectors)", "FEAT_SME2", "z-register", "fcvt", "f16", 32, 1, "f32", 32, 2, 32, 6, "throughput", 1, 1.0, 1333333},
+  {{ &setup, &fcvt_z_register_f16_f32_vgx2_ilp7, &teardown }, "Multi-vector (floating-point)", "FCVT (FP32 to FP16, two vectors)", "FEAT_SME2", "z-register", "fcvt", "f16", 32, 1, "f32", 32, 2, 32, 7, "throughput", 1, 1.0, 1142857},
+  {{ &setup, &fcvt_z_register_f16_f32_vgx2_ilp8, &teardown }, "Multi-vector (floating-point)", "FCVT (FP32 to FP16, two vectors)", "FEAT_SME2", "z-register", "fcvt", "f16", 32, 1, "f32", 32, 2, 32, 8, "throughput", 1, 1.0, 1000000},
+  {{ &setup, &fcvt_z_register_f16_f32_vgx2_ilp9, &teardown }, "Multi-vector (floating-point)", "FCVT (FP32 to FP16, two vectors)", "FEAT_SME2", "z-register", "fcvt", "f16", 32, 1, "f32", 32, 2, 32, 9, "throughput", 1, 1.0, 888888},
+  {{ &setup, &fcvt_z_register_f16_f32_vgx2_ilp10, &teardown }, "Multi-vector (floating-point)", "FCVT (FP32 to FP16, two vectors)", "FEAT_SME2", "z-register", "fcvt", "f16", 32, 1, "f32", 32, 2, 32, 10, "throughput", 1, 1.0, 800000},
+  {{ &setup, &fcvt_z_register_f16_f32_vgx2_ilp11, &teardown }, "Multi-vector (floating-point)", "FCVT (FP32 to FP16, two vectors)", "FEAT_SME2", "z-register", "fcvt", "f16", 32, 1, "f32", 32, 2, 32, 11, "throughput", 1, 1.0, 727272},
+  {{ &setup, &fcvt_z_register_f16_f32_vgx2_ilp12, &teardown }, "Multi-vector (floating-point)", "FCVT (FP32 to FP16, two vectors)", "FEAT_SME2", "z-register", "fcvt", "f16", 32, 1, "f32", 32, 2, 32, 12, "throughput", 1, 1.0, 666666},
+  {{ &setup, &fcvt_z_register_f16_f32_vgx2_ilp13, &teardown }, "Multi-vector (floating-point)", "FCVT (FP32 to FP16, two vectors)", "FEAT_SME2", "z-register", "fcvt", "f16", 32, 1, "f32", 32, 2, 32, 13, "throughput", 1, 1.0, 615384},
+  {{ &setup, &fcvt_z_register_f16_f32_vgx2_ilp14, &teardown }, "Multi-vector (floating-point)", "FCVT (FP32 to FP16, two vectors)", "FEAT_SME2", "z-register", "fcvt", "f16", 32, 1, "f32", 32, 2, 32, 14, "throughput", 1, 1.0, 571428},
+  {{ &setup, &fcvt_z_register_f16_f32_vgx2_ilp15, &teardown }, "Multi-vector (floating-point)", "FCVT (FP32 to FP16, two vectors)", "FEAT_SME2", "z-register", "fcvt", "f16", 32, 1, "f32", 32, 2, 32, 15, "throughput", 1, 1.0, 533333},
+  {{ &setup, &fmla_f16_f16_ilp1, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector)", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 64, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &fmla_f16_f16_ilp2, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector)", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 64, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &fmla_f16_f16_ilp3, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector)", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 64, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &fmla_f16_f16_ilp4, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector)", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 64, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &fmla_f16_f16_ilp5, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector)", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 64, 5, "throughput", 1, 1.0, 1600000},
+  {{ &setup, &fmla_f16_f16_ilp6, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector)", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 64, 6, "throughput", 1, 1.0, 1333333},
+  {{ &setup, &fmla_f16_f16_ilp7, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector)", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 64, 7, "throughput", 1, 1.0, 1142857},
+  {{ &setup, &fmla_f16_f16_ilp8, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector)", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 64, 8, "throughput", 1, 1.0, 1000000},
+  {{ &setup, &fmla_f16_f16_ilp9, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector)", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 64, 9, "throughput", 1, 1.0, 888888},
+  {{ &setup, &fmla_f16_f16_ilp10, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector)", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 64, 10, "throughput", 1, 1.0, 800000},
+  {{ &setup, &fmla_f16_f16_ilp11, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector)", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 64, 11, "throughput", 1, 1.0, 727272},
+  {{ &setup, &fmla_f16_f16_ilp12, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector)", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 64, 12, "throughput", 1, 1.0, 666666},
+  {{ &setup, &fmla_f16_f16_ilp13, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector)", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 64, 13, "throughput", 1, 1.0, 615384},
+  {{ &setup, &fmla_f16_f16_ilp14, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector)", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 64, 14, "throughput", 1, 1.0, 571428},
+  {{ &setup, &fmla_f16_f16_ilp15, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector)", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 64, 15, "throughput", 1, 1.0, 533333},
+  {{ &setup, &fmla_f16_f16_ilp16, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector)", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 64, 16, "throughput", 1, 1.0, 500000},
+  {{ &setup, &fmla_f16_f16_chain8_ilp1, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector)", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 64, 1, "latency", 8, 1.0, 1000000},
+  {{ &setup, &fmla_f16_f16_chain8_ilp2, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector)", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 64, 2, "latency", 8, 1.0, 500000},
+  {{ &setup, &fmla_f16_f16_p75_ilp1, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector), 75% active lanes", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 48, 1, "throughput", 1, 0.75, 8000000},
+  {{ &setup, &fmla_f16_f16_p75_ilp2, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector), 75% active lanes", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 48, 2, "throughput", 1, 0.75, 4000000},
+  {{ &setup, &fmla_f16_f16_p75_ilp3, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector), 75% active lanes", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 48, 3, "throughput", 1, 0.75, 2666666},
+  {{ &setup, &fmla_f16_f16_p75_ilp4, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector), 75% active lanes", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 48, 4, "throughput", 1, 0.75, 2000000},
+  {{ &setup, &fmla_f16_f16_p75_ilp5, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector), 75% active lanes", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 48, 5, "throughput", 1, 0.75, 1600000},
+  {{ &setup, &fmla_f16_f16_p75_ilp6, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector), 75% active lanes", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 48, 6, "throughput", 1, 0.75, 1333333},
+  {{ &setup, &fmla_f16_f16_p75_ilp7, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector), 75% active lanes", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 48, 7, "throughput", 1, 0.75, 1142857},
+  {{ &setup, &fmla_f16_f16_p75_ilp8, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector), 75% active lanes", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 48, 8, "throughput", 1, 0.75, 1000000},
+  {{ &setup, &fmla_f16_f16_p75_ilp9, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector), 75% active lanes", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 48, 9, "throughput", 1, 0.75, 888888},
+  {{ &setup, &fmla_f16_f16_p75_ilp10, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector), 75% active lanes", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 48, 10, "throughput", 1, 0.75, 800000},
+  {{ &setup, &fmla_f16_f16_p75_ilp11, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector), 75% active lanes", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 48, 11, "throughput", 1, 0.75, 727272},
+  {{ &setup, &fmla_f16_f16_p75_ilp12, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector), 75% active lanes", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 48, 12, "throughput", 1, 0.75, 666666},
+  {{ &setup, &fmla_f16_f16_p75_ilp13, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector), 75% active lanes", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 48, 13, "throughput", 1, 0.75, 615384},
+  {{ &setup, &fmla_f16_f16_p75_ilp14, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector), 75% active lanes", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 48, 14, "throughput", 1, 0.75, 571428},
+  {{ &setup, &fmla_f16_f16_p75_ilp15, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector), 75% active lanes", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 48, 15, "throughput", 1, 0.75, 533333},
+  {{ &setup, &fmla_f16_f16_p75_ilp16, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector), 75% active lanes", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 48, 16, "throughput", 1, 0.75, 500000},
+  {{ &setup, &fmla_f16_f16_p50_ilp1, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector), 50% active lanes", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 32, 1, "throughput", 1, 0.5, 8000000},
+  {{ &setup, &fmla_f16_f16_p50_ilp2, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector), 50% active lanes", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 32, 2, "throughput", 1, 0.5, 4000000},
+  {{ &setup, &fmla_f16_f16_p50_ilp3, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector), 50% active lanes", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 32, 3, "throughput", 1, 0.5, 2666666},
+  {{ &setup, &fmla_f16_f16_p50_ilp4, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector), 50% active lanes", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 32, 4, "throughput", 1, 0.5, 2000000},
+  {{ &setup, &fmla_f16_f16_p50_ilp5, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector), 50% active lanes", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 32, 5, "throughput", 1, 0.5, 1600000},
+  {{ &setup, &fmla_f16_f16_p50_ilp6, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector), 50% active lanes", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 32, 6, "throughput", 1, 0.5, 1333333},
+  {{ &setup, &fmla_f16_f16_p50_ilp7, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector), 50% active lanes", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 32, 7, "throughput", 1, 0.5, 1142857},
+  {{ &setup, &fmla_f16_f16_p50_ilp8, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector), 50% active lanes", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 32, 8, "throughput", 1, 0.5, 1000000},
+  {{ &setup, &fmla_f16_f16_p50_ilp9, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector), 50% active lanes", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 32, 9, "throughput", 1, 0.5, 888888},
+  {{ &setup, &fmla_f16_f16_p50_ilp10, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector), 50% active lanes", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 32, 10, "throughput", 1, 0.5, 800000},
+  {{ &setup, &fmla_f16_f16_p50_ilp11, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector), 50% active lanes", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 32, 11, "throughput", 1, 0.5, 727272},
+  {{ &setup, &fmla_f16_f16_p50_ilp12, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector), 50% active lanes", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 32, 12, "throughput", 1, 0.5, 666666},
+  {{ &setup, &fmla_f16_f16_p50_ilp13, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector), 50% active lanes", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 32, 13, "throughput", 1, 0.5, 615384},
+  {{ &setup, &fmla_f16_f16_p50_ilp14, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector), 50% active lanes", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 32, 14, "throughput", 1, 0.5, 571428},
+  {{ &setup, &fmla_f16_f16_p50_ilp15, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector), 50% active lanes", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 32, 15, "throughput", 1, 0.5, 533333},
+  {{ &setup, &fmla_f16_f16_p50_ilp16, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector), 50% active lanes", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 32, 16, "throughput", 1, 0.5, 500000},
+  {{ &setup, &fmla_f16_f16_p25_ilp1, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector), 25% active lanes", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 16, 1, "throughput", 1, 0.25, 8000000},
+  {{ &setup, &fmla_f16_f16_p25_ilp2, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector), 25% active lanes", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 16, 2, "throughput", 1, 0.25, 4000000},
+  {{ &setup, &fmla_f16_f16_p25_ilp3, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector), 25% active lanes", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 16, 3, "throughput", 1, 0.25, 2666666},
+  {{ &setup, &fmla_f16_f16_p25_ilp4, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector), 25% active lanes", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 16, 4, "throughput", 1, 0.25, 2000000},
+  {{ &setup, &fmla_f16_f16_p25_ilp5, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector), 25% active lanes", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 16, 5, "throughput", 1, 0.25, 1600000},
+  {{ &setup, &fmla_f16_f16_p25_ilp6, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector), 25% active lanes", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 16, 6, "throughput", 1, 0.25, 1333333},
+  {{ &setup, &fmla_f16_f16_p25_ilp7, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector), 25% active lanes", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 16, 7, "throughput", 1, 0.25, 1142857},
+  {{ &setup, &fmla_f16_f16_p25_ilp8, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector), 25% active lanes", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 16, 8, "throughput", 1, 0.25, 1000000},
+  {{ &setup, &fmla_f16_f16_p25_ilp9, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector), 25% active lanes", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 16, 9, "throughput", 1, 0.25, 888888},
+  {{ &setup, &fmla_f16_f16_p25_ilp10, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector), 25% active lanes", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 16, 10, "throughput", 1, 0.25, 800000},
+  {{ &setup, &fmla_f16_f16_p25_ilp11, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector), 25% active lanes", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 16, 11, "throughput", 1, 0.25, 727272},
+  {{ &setup, &fmla_f16_f16_p25_ilp12, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector), 25% active lanes", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 16, 12, "throughput", 1, 0.25, 666666},
+  {{ &setup, &fmla_f16_f16_p25_ilp13, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector), 25% active lanes", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 16, 13, "throughput", 1, 0.25, 615384},
+  {{ &setup, &fmla_f16_f16_p25_ilp14, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector), 25% active lanes", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 16, 14, "throughput", 1, 0.25, 571428},
+  {{ &setup, &fmla_f16_f16_p25_ilp15, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector), 25% active lanes", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 16, 15, "throughput", 1, 0.25, 533333},
+  {{ &setup, &fmla_f16_f16_p25_ilp16, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP16, one vector), 25% active lanes", "FEAT_SME", "z-register", "fmla", "f16", 32, 1, "f16", 64, 2, 16, 16, "throughput", 1, 0.25, 500000},
+  {{ &setup, &fmla_f32_f32_ilp1, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector)", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 32, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &fmla_f32_f32_ilp2, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector)", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 32, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &fmla_f32_f32_ilp3, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector)", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 32, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &fmla_f32_f32_ilp4, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector)", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 32, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &fmla_f32_f32_ilp5, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector)", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 32, 5, "throughput", 1, 1.0, 1600000},
+  {{ &setup, &fmla_f32_f32_ilp6, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector)", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 32, 6, "throughput", 1, 1.0, 1333333},
+  {{ &setup, &fmla_f32_f32_ilp7, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector)", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 32, 7, "throughput", 1, 1.0, 1142857},
+  {{ &setup, &fmla_f32_f32_ilp8, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector)", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 32, 8, "throughput", 1, 1.0, 1000000},
+  {{ &setup, &fmla_f32_f32_ilp9, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector)", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 32, 9, "throughput", 1, 1.0, 888888},
+  {{ &setup, &fmla_f32_f32_ilp10, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector)", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 32, 10, "throughput", 1, 1.0, 800000},
+  {{ &setup, &fmla_f32_f32_ilp11, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector)", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 32, 11, "throughput", 1, 1.0, 727272},
+  {{ &setup, &fmla_f32_f32_ilp12, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector)", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 32, 12, "throughput", 1, 1.0, 666666},
+  {{ &setup, &fmla_f32_f32_ilp13, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector)", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 32, 13, "throughput", 1, 1.0, 615384},
+  {{ &setup, &fmla_f32_f32_ilp14, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector)", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 32, 14, "throughput", 1, 1.0, 571428},
+  {{ &setup, &fmla_f32_f32_ilp15, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector)", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 32, 15, "throughput", 1, 1.0, 533333},
+  {{ &setup, &fmla_f32_f32_ilp16, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector)", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 32, 16, "throughput", 1, 1.0, 500000},
+  {{ &setup, &fmla_f32_f32_chain8_ilp1, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector)", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 32, 1, "latency", 8, 1.0, 1000000},
+  {{ &setup, &fmla_f32_f32_chain8_ilp2, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector)", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 32, 2, "latency", 8, 1.0, 500000},
+  {{ &setup, &fmla_f32_f32_p75_ilp1, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector), 75% active lanes", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 24, 1, "throughput", 1, 0.75, 8000000},
+  {{ &setup, &fmla_f32_f32_p75_ilp2, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector), 75% active lanes", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 24, 2, "throughput", 1, 0.75, 4000000},
+  {{ &setup, &fmla_f32_f32_p75_ilp3, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector), 75% active lanes", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 24, 3, "throughput", 1, 0.75, 2666666},
+  {{ &setup, &fmla_f32_f32_p75_ilp4, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector), 75% active lanes", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 24, 4, "throughput", 1, 0.75, 2000000},
+  {{ &setup, &fmla_f32_f32_p75_ilp5, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector), 75% active lanes", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 24, 5, "throughput", 1, 0.75, 1600000},
+  {{ &setup, &fmla_f32_f32_p75_ilp6, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector), 75% active lanes", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 24, 6, "throughput", 1, 0.75, 1333333},
+  {{ &setup, &fmla_f32_f32_p75_ilp7, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector), 75% active lanes", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 24, 7, "throughput", 1, 0.75, 1142857},
+  {{ &setup, &fmla_f32_f32_p75_ilp8, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector), 75% active lanes", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 24, 8, "throughput", 1, 0.75, 1000000},
+  {{ &setup, &fmla_f32_f32_p75_ilp9, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector), 75% active lanes", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 24, 9, "throughput", 1, 0.75, 888888},
+  {{ &setup, &fmla_f32_f32_p75_ilp10, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector), 75% active lanes", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 24, 10, "throughput", 1, 0.75, 800000},
+  {{ &setup, &fmla_f32_f32_p75_ilp11, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector), 75% active lanes", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 24, 11, "throughput", 1, 0.75, 727272},
+  {{ &setup, &fmla_f32_f32_p75_ilp12, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector), 75% active lanes", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 24, 12, "throughput", 1, 0.75, 666666},
+  {{ &setup, &fmla_f32_f32_p75_ilp13, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector), 75% active lanes", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 24, 13, "throughput", 1, 0.75, 615384},
+  {{ &setup, &fmla_f32_f32_p75_ilp14, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector), 75% active lanes", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 24, 14, "throughput", 1, 0.75, 571428},
+  {{ &setup, &fmla_f32_f32_p75_ilp15, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector), 75% active lanes", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 24, 15, "throughput", 1, 0.75, 533333},
+  {{ &setup, &fmla_f32_f32_p75_ilp16, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector), 75% active lanes", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 24, 16, "throughput", 1, 0.75, 500000},
+  {{ &setup, &fmla_f32_f32_p50_ilp1, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector), 50% active lanes", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 16, 1, "throughput", 1, 0.5, 8000000},
+  {{ &setup, &fmla_f32_f32_p50_ilp2, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector), 50% active lanes", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 16, 2, "throughput", 1, 0.5, 4000000},
+  {{ &setup, &fmla_f32_f32_p50_ilp3, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector), 50% active lanes", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 16, 3, "throughput", 1, 0.5, 2666666},
+  {{ &setup, &fmla_f32_f32_p50_ilp4, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector), 50% active lanes", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 16, 4, "throughput", 1, 0.5, 2000000},
+  {{ &setup, &fmla_f32_f32_p50_ilp5, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector), 50% active lanes", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 16, 5, "throughput", 1, 0.5, 1600000},
+  {{ &setup, &fmla_f32_f32_p50_ilp6, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector), 50% active lanes", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 16, 6, "throughput", 1, 0.5, 1333333},
+  {{ &setup, &fmla_f32_f32_p50_ilp7, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector), 50% active lanes", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 16, 7, "throughput", 1, 0.5, 1142857},
+  {{ &setup, &fmla_f32_f32_p50_ilp8, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector), 50% active lanes", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 16, 8, "throughput", 1, 0.5, 1000000},
+  {{ &setup, &fmla_f32_f32_p50_ilp9, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector), 50% active lanes", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 16, 9, "throughput", 1, 0.5, 888888},
+  {{ &setup, &fmla_f32_f32_p50_ilp10, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector), 50% active lanes", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 16, 10, "throughput", 1, 0.5, 800000},
+  {{ &setup, &fmla_f32_f32_p50_ilp11, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector), 50% active lanes", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 16, 11, "throughput", 1, 0.5, 727272},
+  {{ &setup, &fmla_f32_f32_p50_ilp12, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector), 50% active lanes", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 16, 12, "throughput", 1, 0.5, 666666},
+  {{ &setup, &fmla_f32_f32_p50_ilp13, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector), 50% active lanes", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 16, 13, "throughput", 1, 0.5, 615384},
+  {{ &setup, &fmla_f32_f32_p50_ilp14, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector), 50% active lanes", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 16, 14, "throughput", 1, 0.5, 571428},
+  {{ &setup, &fmla_f32_f32_p50_ilp15, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector), 50% active lanes", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 16, 15, "throughput", 1, 0.5, 533333},
+  {{ &setup, &fmla_f32_f32_p50_ilp16, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector), 50% active lanes", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 16, 16, "throughput", 1, 0.5, 500000},
+  {{ &setup, &fmla_f32_f32_p25_ilp1, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector), 25% active lanes", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 8, 1, "throughput", 1, 0.25, 8000000},
+  {{ &setup, &fmla_f32_f32_p25_ilp2, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector), 25% active lanes", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 8, 2, "throughput", 1, 0.25, 4000000},
+  {{ &setup, &fmla_f32_f32_p25_ilp3, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector), 25% active lanes", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 8, 3, "throughput", 1, 0.25, 2666666},
+  {{ &setup, &fmla_f32_f32_p25_ilp4, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector), 25% active lanes", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 8, 4, "throughput", 1, 0.25, 2000000},
+  {{ &setup, &fmla_f32_f32_p25_ilp5, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector), 25% active lanes", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 8, 5, "throughput", 1, 0.25, 1600000},
+  {{ &setup, &fmla_f32_f32_p25_ilp6, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector), 25% active lanes", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 8, 6, "throughput", 1, 0.25, 1333333},
+  {{ &setup, &fmla_f32_f32_p25_ilp7, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector), 25% active lanes", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 8, 7, "throughput", 1, 0.25, 1142857},
+  {{ &setup, &fmla_f32_f32_p25_ilp8, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector), 25% active lanes", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 8, 8, "throughput", 1, 0.25, 1000000},
+  {{ &setup, &fmla_f32_f32_p25_ilp9, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector), 25% active lanes", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 8, 9, "throughput", 1, 0.25, 888888},
+  {{ &setup, &fmla_f32_f32_p25_ilp10, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector), 25% active lanes", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 8, 10, "throughput", 1, 0.25, 800000},
+  {{ &setup, &fmla_f32_f32_p25_ilp11, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector), 25% active lanes", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 8, 11, "throughput", 1, 0.25, 727272},
+  {{ &setup, &fmla_f32_f32_p25_ilp12, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector), 25% active lanes", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 8, 12, "throughput", 1, 0.25, 666666},
+  {{ &setup, &fmla_f32_f32_p25_ilp13, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector), 25% active lanes", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 8, 13, "throughput", 1, 0.25, 615384},
+  {{ &setup, &fmla_f32_f32_p25_ilp14, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector), 25% active lanes", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 8, 14, "throughput", 1, 0.25, 571428},
+  {{ &setup, &fmla_f32_f32_p25_ilp15, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector), 25% active lanes", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 8, 15, "throughput", 1, 0.25, 533333},
+  {{ &setup, &fmla_f32_f32_p25_ilp16, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, one vector), 25% active lanes", "FEAT_SME", "z-register", "fmla", "f32", 16, 1, "f32", 32, 2, 8, 16, "throughput", 1, 0.25, 500000},
+  {{ &setup, &fmla_f64_f64_ilp1, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector)", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 16, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &fmla_f64_f64_ilp2, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector)", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 16, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &fmla_f64_f64_ilp3, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector)", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 16, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &fmla_f64_f64_ilp4, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector)", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 16, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &fmla_f64_f64_ilp5, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector)", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 16, 5, "throughput", 1, 1.0, 1600000},
+  {{ &setup, &fmla_f64_f64_ilp6, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector)", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 16, 6, "throughput", 1, 1.0, 1333333},
+  {{ &setup, &fmla_f64_f64_ilp7, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector)", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 16, 7, "throughput", 1, 1.0, 1142857},
+  {{ &setup, &fmla_f64_f64_ilp8, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector)", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 16, 8, "throughput", 1, 1.0, 1000000},
+  {{ &setup, &fmla_f64_f64_ilp9, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector)", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 16, 9, "throughput", 1, 1.0, 888888},
+  {{ &setup, &fmla_f64_f64_ilp10, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector)", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 16, 10, "throughput", 1, 1.0, 800000},
+  {{ &setup, &fmla_f64_f64_ilp11, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector)", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 16, 11, "throughput", 1, 1.0, 727272},
+  {{ &setup, &fmla_f64_f64_ilp12, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector)", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 16, 12, "throughput", 1, 1.0, 666666},
+  {{ &setup, &fmla_f64_f64_ilp13, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector)", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 16, 13, "throughput", 1, 1.0, 615384},
+  {{ &setup, &fmla_f64_f64_ilp14, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector)", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 16, 14, "throughput", 1, 1.0, 571428},
+  {{ &setup, &fmla_f64_f64_ilp15, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector)", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 16, 15, "throughput", 1, 1.0, 533333},
+  {{ &setup, &fmla_f64_f64_ilp16, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector)", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 16, 16, "throughput", 1, 1.0, 500000},
+  {{ &setup, &fmla_f64_f64_chain8_ilp1, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector)", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 16, 1, "latency", 8, 1.0, 1000000},
+  {{ &setup, &fmla_f64_f64_chain8_ilp2, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector)", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 16, 2, "latency", 8, 1.0, 500000},
+  {{ &setup, &fmla_f64_f64_p75_ilp1, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector), 75% active lanes", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 12, 1, "throughput", 1, 0.75, 8000000},
+  {{ &setup, &fmla_f64_f64_p75_ilp2, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector), 75% active lanes", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 12, 2, "throughput", 1, 0.75, 4000000},
+  {{ &setup, &fmla_f64_f64_p75_ilp3, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector), 75% active lanes", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 12, 3, "throughput", 1, 0.75, 2666666},
+  {{ &setup, &fmla_f64_f64_p75_ilp4, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector), 75% active lanes", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 12, 4, "throughput", 1, 0.75, 2000000},
+  {{ &setup, &fmla_f64_f64_p75_ilp5, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector), 75% active lanes", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 12, 5, "throughput", 1, 0.75, 1600000},
+  {{ &setup, &fmla_f64_f64_p75_ilp6, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector), 75% active lanes", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 12, 6, "throughput", 1, 0.75, 1333333},
+  {{ &setup, &fmla_f64_f64_p75_ilp7, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector), 75% active lanes", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 12, 7, "throughput", 1, 0.75, 1142857},
+  {{ &setup, &fmla_f64_f64_p75_ilp8, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector), 75% active lanes", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 12, 8, "throughput", 1, 0.75, 1000000},
+  {{ &setup, &fmla_f64_f64_p75_ilp9, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector), 75% active lanes", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 12, 9, "throughput", 1, 0.75, 888888},
+  {{ &setup, &fmla_f64_f64_p75_ilp10, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector), 75% active lanes", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 12, 10, "throughput", 1, 0.75, 800000},
+  {{ &setup, &fmla_f64_f64_p75_ilp11, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector), 75% active lanes", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 12, 11, "throughput", 1, 0.75, 727272},
+  {{ &setup, &fmla_f64_f64_p75_ilp12, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector), 75% active lanes", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 12, 12, "throughput", 1, 0.75, 666666},
+  {{ &setup, &fmla_f64_f64_p75_ilp13, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector), 75% active lanes", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 12, 13, "throughput", 1, 0.75, 615384},
+  {{ &setup, &fmla_f64_f64_p75_ilp14, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector), 75% active lanes", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 12, 14, "throughput", 1, 0.75, 571428},
+  {{ &setup, &fmla_f64_f64_p75_ilp15, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector), 75% active lanes", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 12, 15, "throughput", 1, 0.75, 533333},
+  {{ &setup, &fmla_f64_f64_p75_ilp16, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector), 75% active lanes", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 12, 16, "throughput", 1, 0.75, 500000},
+  {{ &setup, &fmla_f64_f64_p50_ilp1, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector), 50% active lanes", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 8, 1, "throughput", 1, 0.5, 8000000},
+  {{ &setup, &fmla_f64_f64_p50_ilp2, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector), 50% active lanes", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 8, 2, "throughput", 1, 0.5, 4000000},
+  {{ &setup, &fmla_f64_f64_p50_ilp3, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector), 50% active lanes", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 8, 3, "throughput", 1, 0.5, 2666666},
+  {{ &setup, &fmla_f64_f64_p50_ilp4, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector), 50% active lanes", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 8, 4, "throughput", 1, 0.5, 2000000},
+  {{ &setup, &fmla_f64_f64_p50_ilp5, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector), 50% active lanes", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 8, 5, "throughput", 1, 0.5, 1600000},
+  {{ &setup, &fmla_f64_f64_p50_ilp6, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector), 50% active lanes", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 8, 6, "throughput", 1, 0.5, 1333333},
+  {{ &setup, &fmla_f64_f64_p50_ilp7, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector), 50% active lanes", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 8, 7, "throughput", 1, 0.5, 1142857},
+  {{ &setup, &fmla_f64_f64_p50_ilp8, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector), 50% active lanes", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 8, 8, "throughput", 1, 0.5, 1000000},
+  {{ &setup, &fmla_f64_f64_p50_ilp9, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector), 50% active lanes", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 8, 9, "throughput", 1, 0.5, 888888},
+  {{ &setup, &fmla_f64_f64_p50_ilp10, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector), 50% active lanes", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 8, 10, "throughput", 1, 0.5, 800000},
+  {{ &setup, &fmla_f64_f64_p50_ilp11, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector), 50% active lanes", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 8, 11, "throughput", 1, 0.5, 727272},
+  {{ &setup, &fmla_f64_f64_p50_ilp12, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector), 50% active lanes", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 8, 12, "throughput", 1, 0.5, 666666},
+  {{ &setup, &fmla_f64_f64_p50_ilp13, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector), 50% active lanes", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 8, 13, "throughput", 1, 0.5, 615384},
+  {{ &setup, &fmla_f64_f64_p50_ilp14, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector), 50% active lanes", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 8, 14, "throughput", 1, 0.5, 571428},
+  {{ &setup, &fmla_f64_f64_p50_ilp15, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector), 50% active lanes", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 8, 15, "throughput", 1, 0.5, 533333},
+  {{ &setup, &fmla_f64_f64_p50_ilp16, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector), 50% active lanes", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 8, 16, "throughput", 1, 0.5, 500000},
+  {{ &setup, &fmla_f64_f64_p25_ilp1, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector), 25% active lanes", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 4, 1, "throughput", 1, 0.25, 8000000},
+  {{ &setup, &fmla_f64_f64_p25_ilp2, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector), 25% active lanes", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 4, 2, "throughput", 1, 0.25, 4000000},
+  {{ &setup, &fmla_f64_f64_p25_ilp3, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector), 25% active lanes", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 4, 3, "throughput", 1, 0.25, 2666666},
+  {{ &setup, &fmla_f64_f64_p25_ilp4, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector), 25% active lanes", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 4, 4, "throughput", 1, 0.25, 2000000},
+  {{ &setup, &fmla_f64_f64_p25_ilp5, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector), 25% active lanes", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 4, 5, "throughput", 1, 0.25, 1600000},
+  {{ &setup, &fmla_f64_f64_p25_ilp6, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector), 25% active lanes", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 4, 6, "throughput", 1, 0.25, 1333333},
+  {{ &setup, &fmla_f64_f64_p25_ilp7, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector), 25% active lanes", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 4, 7, "throughput", 1, 0.25, 1142857},
+  {{ &setup, &fmla_f64_f64_p25_ilp8, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector), 25% active lanes", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 4, 8, "throughput", 1, 0.25, 1000000},
+  {{ &setup, &fmla_f64_f64_p25_ilp9, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector), 25% active lanes", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 4, 9, "throughput", 1, 0.25, 888888},
+  {{ &setup, &fmla_f64_f64_p25_ilp10, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector), 25% active lanes", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 4, 10, "throughput", 1, 0.25, 800000},
+  {{ &setup, &fmla_f64_f64_p25_ilp11, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector), 25% active lanes", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 4, 11, "throughput", 1, 0.25, 727272},
+  {{ &setup, &fmla_f64_f64_p25_ilp12, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector), 25% active lanes", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 4, 12, "throughput", 1, 0.25, 666666},
+  {{ &setup, &fmla_f64_f64_p25_ilp13, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector), 25% active lanes", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 4, 13, "throughput", 1, 0.25, 615384},
+  {{ &setup, &fmla_f64_f64_p25_ilp14, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector), 25% active lanes", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 4, 14, "throughput", 1, 0.25, 571428},
+  {{ &setup, &fmla_f64_f64_p25_ilp15, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector), 25% active lanes", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 4, 15, "throughput", 1, 0.25, 533333},
+  {{ &setup, &fmla_f64_f64_p25_ilp16, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, one vector), 25% active lanes", "FEAT_SME", "z-register", "fmla", "f64", 8, 1, "f64", 16, 2, 4, 16, "throughput", 1, 0.25, 500000},
+  {{ &setup, &fmla_za_f32_f32_vgx2_ilp1, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, two vectors)", "FEAT_SME2", "za-vector", "fmla", "f32", 32, 2, "f32", 64, 4, 64, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &fmla_za_f32_f32_vgx2_ilp2, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, two vectors)", "FEAT_SME2", "za-vector", "fmla", "f32", 32, 2, "f32", 64, 4, 64, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &fmla_za_f32_f32_vgx2_ilp3, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, two vectors)", "FEAT_SME2", "za-vector", "fmla", "f32", 32, 2, "f32", 64, 4, 64, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &fmla_za_f32_f32_vgx2_ilp4, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, two vectors)", "FEAT_SME2", "za-vector", "fmla", "f32", 32, 2, "f32", 64, 4, 64, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &fmla_za_f32_f32_vgx2_ilp5, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, two vectors)", "FEAT_SME2", "za-vector", "fmla", "f32", 32, 2, "f32", 64, 4, 64, 5, "throughput", 1, 1.0, 1600000},
+  {{ &setup, &fmla_za_f32_f32_vgx2_ilp6, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, two vectors)", "FEAT_SME2", "za-vector", "fmla", "f32", 32, 2, "f32", 64, 4, 64, 6, "throughput", 1, 1.0, 1333333},
+  {{ &setup, &fmla_za_f32_f32_vgx2_ilp7, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, two vectors)", "FEAT_SME2", "za-vector", "fmla", "f32", 32, 2, "f32", 64, 4, 64, 7, "throughput", 1, 1.0, 1142857},
+  {{ &setup, &fmla_za_f32_f32_vgx2_ilp8, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, two vectors)", "FEAT_SME2", "za-vector", "fmla", "f32", 32, 2, "f32", 64, 4, 64, 8, "throughput", 1, 1.0, 1000000},
+  {{ &setup, &fmla_za_f32_f32_vgx2_ilp9, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, two vectors)", "FEAT_SME2", "za-vector", "fmla", "f32", 32, 2, "f32", 64, 4, 64, 9, "throughput", 1, 1.0, 888888},
+  {{ &setup, &fmla_za_f32_f32_vgx2_ilp10, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, two vectors)", "FEAT_SME2", "za-vector", "fmla", "f32", 32, 2, "f32", 64, 4, 64, 10, "throughput", 1, 1.0, 800000},
+  {{ &setup, &fmla_za_f32_f32_vgx2_ilp11, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, two vectors)", "FEAT_SME2", "za-vector", "fmla", "f32", 32, 2, "f32", 64, 4, 64, 11, "throughput", 1, 1.0, 727272},
+  {{ &setup, &fmla_za_f32_f32_vgx2_ilp12, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, two vectors)", "FEAT_SME2", "za-vector", "fmla", "f32", 32, 2, "f32", 64, 4, 64, 12, "throughput", 1, 1.0, 666666},
+  {{ &setup, &fmla_za_f32_f32_vgx2_ilp13, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, two vectors)", "FEAT_SME2", "za-vector", "fmla", "f32", 32, 2, "f32", 64, 4, 64, 13, "throughput", 1, 1.0, 615384},
+  {{ &setup, &fmla_za_f32_f32_vgx2_ilp14, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, two vectors)", "FEAT_SME2", "za-vector", "fmla", "f32", 32, 2, "f32", 64, 4, 64, 14, "throughput", 1, 1.0, 571428},
+  {{ &setup, &fmla_za_f32_f32_vgx2_ilp15, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, two vectors)", "FEAT_SME2", "za-vector", "fmla", "f32", 32, 2, "f32", 64, 4, 64, 15, "throughput", 1, 1.0, 533333},
+  {{ &setup, &fmla_za_f32_f32_vgx2_ilp16, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, two vectors)", "FEAT_SME2", "za-vector", "fmla", "f32", 32, 2, "f32", 64, 4, 64, 16, "throughput", 1, 1.0, 500000},
+  {{ &setup, &fmla_za_f32_f32_vgx2_chain8_ilp1, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, two vectors)", "FEAT_SME2", "za-vector", "fmla", "f32", 32, 2, "f32", 64, 4, 64, 1, "latency", 8, 1.0, 1000000},
+  {{ &setup, &fmla_za_f32_f32_vgx2_chain8_ilp2, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, two vectors)", "FEAT_SME2", "za-vector", "fmla", "f32", 32, 2, "f32", 64, 4, 64, 2, "latency", 8, 1.0, 500000},
+  {{ &setup, &fmla_za_f32_f32_vgx4_ilp1, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, four vectors)", "FEAT_SME2", "za-vector", "fmla", "f32", 64, 4, "f32", 128, 8, 128, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &fmla_za_f32_f32_vgx4_ilp2, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, four vectors)", "FEAT_SME2", "za-vector", "fmla", "f32", 64, 4, "f32", 128, 8, 128, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &fmla_za_f32_f32_vgx4_ilp3, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, four vectors)", "FEAT_SME2", "za-vector", "fmla", "f32", 64, 4, "f32", 128, 8, 128, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &fmla_za_f32_f32_vgx4_ilp4, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, four vectors)", "FEAT_SME2", "za-vector", "fmla", "f32", 64, 4, "f32", 128, 8, 128, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &fmla_za_f32_f32_vgx4_ilp5, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, four vectors)", "FEAT_SME2", "za-vector", "fmla", "f32", 64, 4, "f32", 128, 8, 128, 5, "throughput", 1, 1.0, 1600000},
+  {{ &setup, &fmla_za_f32_f32_vgx4_ilp6, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, four vectors)", "FEAT_SME2", "za-vector", "fmla", "f32", 64, 4, "f32", 128, 8, 128, 6, "throughput", 1, 1.0, 1333333},
+  {{ &setup, &fmla_za_f32_f32_vgx4_ilp7, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, four vectors)", "FEAT_SME2", "za-vector", "fmla", "f32", 64, 4, "f32", 128, 8, 128, 7, "throughput", 1, 1.0, 1142857},
+  {{ &setup, &fmla_za_f32_f32_vgx4_ilp8, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, four vectors)", "FEAT_SME2", "za-vector", "fmla", "f32", 64, 4, "f32", 128, 8, 128, 8, "throughput", 1, 1.0, 1000000},
+  {{ &setup, &fmla_za_f32_f32_vgx4_ilp9, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, four vectors)", "FEAT_SME2", "za-vector", "fmla", "f32", 64, 4, "f32", 128, 8, 128, 9, "throughput", 1, 1.0, 888888},
+  {{ &setup, &fmla_za_f32_f32_vgx4_ilp10, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, four vectors)", "FEAT_SME2", "za-vector", "fmla", "f32", 64, 4, "f32", 128, 8, 128, 10, "throughput", 1, 1.0, 800000},
+  {{ &setup, &fmla_za_f32_f32_vgx4_ilp11, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, four vectors)", "FEAT_SME2", "za-vector", "fmla", "f32", 64, 4, "f32", 128, 8, 128, 11, "throughput", 1, 1.0, 727272},
+  {{ &setup, &fmla_za_f32_f32_vgx4_ilp12, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, four vectors)", "FEAT_SME2", "za-vector", "fmla", "f32", 64, 4, "f32", 128, 8, 128, 12, "throughput", 1, 1.0, 666666},
+  {{ &setup, &fmla_za_f32_f32_vgx4_ilp13, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, four vectors)", "FEAT_SME2", "za-vector", "fmla", "f32", 64, 4, "f32", 128, 8, 128, 13, "throughput", 1, 1.0, 615384},
+  {{ &setup, &fmla_za_f32_f32_vgx4_ilp14, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, four vectors)", "FEAT_SME2", "za-vector", "fmla", "f32", 64, 4, "f32", 128, 8, 128, 14, "throughput", 1, 1.0, 571428},
+  {{ &setup, &fmla_za_f32_f32_vgx4_ilp15, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, four vectors)", "FEAT_SME2", "za-vector", "fmla", "f32", 64, 4, "f32", 128, 8, 128, 15, "throughput", 1, 1.0, 533333},
+  {{ &setup, &fmla_za_f32_f32_vgx4_ilp16, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, four vectors)", "FEAT_SME2", "za-vector", "fmla", "f32", 64, 4, "f32", 128, 8, 128, 16, "throughput", 1, 1.0, 500000},
+  {{ &setup, &fmla_za_f32_f32_vgx4_chain8_ilp1, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, four vectors)", "FEAT_SME2", "za-vector", "fmla", "f32", 64, 4, "f32", 128, 8, 128, 1, "latency", 8, 1.0, 1000000},
+  {{ &setup, &fmla_za_f32_f32_vgx4_chain8_ilp2, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP32, four vectors)", "FEAT_SME2", "za-vector", "fmla", "f32", 64, 4, "f32", 128, 8, 128, 2, "latency", 8, 1.0, 500000},
+  {{ &setup, &fmla_za_f64_f64_vgx2_ilp1, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, two vectors)", "FEAT_SME2", "za-vector", "fmla", "f64", 16, 2, "f64", 32, 4, 32, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &fmla_za_f64_f64_vgx2_ilp2, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, two vectors)", "FEAT_SME2", "za-vector", "fmla", "f64", 16, 2, "f64", 32, 4, 32, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &fmla_za_f64_f64_vgx2_ilp3, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, two vectors)", "FEAT_SME2", "za-vector", "fmla", "f64", 16, 2, "f64", 32, 4, 32, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &fmla_za_f64_f64_vgx2_ilp4, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, two vectors)", "FEAT_SME2", "za-vector", "fmla", "f64", 16, 2, "f64", 32, 4, 32, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &fmla_za_f64_f64_vgx2_ilp5, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, two vectors)", "FEAT_SME2", "za-vector", "fmla", "f64", 16, 2, "f64", 32, 4, 32, 5, "throughput", 1, 1.0, 1600000},
+  {{ &setup, &fmla_za_f64_f64_vgx2_ilp6, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, two vectors)", "FEAT_SME2", "za-vector", "fmla", "f64", 16, 2, "f64", 32, 4, 32, 6, "throughput", 1, 1.0, 1333333},
+  {{ &setup, &fmla_za_f64_f64_vgx2_ilp7, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, two vectors)", "FEAT_SME2", "za-vector", "fmla", "f64", 16, 2, "f64", 32, 4, 32, 7, "throughput", 1, 1.0, 1142857},
+  {{ &setup, &fmla_za_f64_f64_vgx2_ilp8, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, two vectors)", "FEAT_SME2", "za-vector", "fmla", "f64", 16, 2, "f64", 32, 4, 32, 8, "throughput", 1, 1.0, 1000000},
+  {{ &setup, &fmla_za_f64_f64_vgx2_ilp9, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, two vectors)", "FEAT_SME2", "za-vector", "fmla", "f64", 16, 2, "f64", 32, 4, 32, 9, "throughput", 1, 1.0, 888888},
+  {{ &setup, &fmla_za_f64_f64_vgx2_ilp10, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, two vectors)", "FEAT_SME2", "za-vector", "fmla", "f64", 16, 2, "f64", 32, 4, 32, 10, "throughput", 1, 1.0, 800000},
+  {{ &setup, &fmla_za_f64_f64_vgx2_ilp11, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, two vectors)", "FEAT_SME2", "za-vector", "fmla", "f64", 16, 2, "f64", 32, 4, 32, 11, "throughput", 1, 1.0, 727272},
+  {{ &setup, &fmla_za_f64_f64_vgx2_ilp12, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, two vectors)", "FEAT_SME2", "za-vector", "fmla", "f64", 16, 2, "f64", 32, 4, 32, 12, "throughput", 1, 1.0, 666666},
+  {{ &setup, &fmla_za_f64_f64_vgx2_ilp13, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, two vectors)", "FEAT_SME2", "za-vector", "fmla", "f64", 16, 2, "f64", 32, 4, 32, 13, "throughput", 1, 1.0, 615384},
+  {{ &setup, &fmla_za_f64_f64_vgx2_ilp14, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, two vectors)", "FEAT_SME2", "za-vector", "fmla", "f64", 16, 2, "f64", 32, 4, 32, 14, "throughput", 1, 1.0, 571428},
+  {{ &setup, &fmla_za_f64_f64_vgx2_ilp15, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, two vectors)", "FEAT_SME2", "za-vector", "fmla", "f64", 16, 2, "f64", 32, 4, 32, 15, "throughput", 1, 1.0, 533333},
+  {{ &setup, &fmla_za_f64_f64_vgx2_ilp16, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, two vectors)", "FEAT_SME2", "za-vector", "fmla", "f64", 16, 2, "f64", 32, 4, 32, 16, "throughput", 1, 1.0, 500000},
+  {{ &setup, &fmla_za_f64_f64_vgx2_chain8_ilp1, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, two vectors)", "FEAT_SME2", "za-vector", "fmla", "f64", 16, 2, "f64", 32, 4, 32, 1, "latency", 8, 1.0, 1000000},
+  {{ &setup, &fmla_za_f64_f64_vgx2_chain8_ilp2, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, two vectors)", "FEAT_SME2", "za-vector", "fmla", "f64", 16, 2, "f64", 32, 4, 32, 2, "latency", 8, 1.0, 500000},
+  {{ &setup, &fmla_za_f64_f64_vgx4_ilp1, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, four vectors)", "FEAT_SME2", "za-vector", "fmla", "f64", 32, 4, "f64", 64, 8, 64, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &fmla_za_f64_f64_vgx4_ilp2, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, four vectors)", "FEAT_SME2", "za-vector", "fmla", "f64", 32, 4, "f64", 64, 8, 64, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &fmla_za_f64_f64_vgx4_ilp3, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, four vectors)", "FEAT_SME2", "za-vector", "fmla", "f64", 32, 4, "f64", 64, 8, 64, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &fmla_za_f64_f64_vgx4_ilp4, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, four vectors)", "FEAT_SME2", "za-vector", "fmla", "f64", 32, 4, "f64", 64, 8, 64, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &fmla_za_f64_f64_vgx4_ilp5, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, four vectors)", "FEAT_SME2", "za-vector", "fmla", "f64", 32, 4, "f64", 64, 8, 64, 5, "throughput", 1, 1.0, 1600000},
+  {{ &setup, &fmla_za_f64_f64_vgx4_ilp6, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, four vectors)", "FEAT_SME2", "za-vector", "fmla", "f64", 32, 4, "f64", 64, 8, 64, 6, "throughput", 1, 1.0, 1333333},
+  {{ &setup, &fmla_za_f64_f64_vgx4_ilp7, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, four vectors)", "FEAT_SME2", "za-vector", "fmla", "f64", 32, 4, "f64", 64, 8, 64, 7, "throughput", 1, 1.0, 1142857},
+  {{ &setup, &fmla_za_f64_f64_vgx4_ilp8, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, four vectors)", "FEAT_SME2", "za-vector", "fmla", "f64", 32, 4, "f64", 64, 8, 64, 8, "throughput", 1, 1.0, 1000000},
+  {{ &setup, &fmla_za_f64_f64_vgx4_ilp9, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, four vectors)", "FEAT_SME2", "za-vector", "fmla", "f64", 32, 4, "f64", 64, 8, 64, 9, "throughput", 1, 1.0, 888888},
+  {{ &setup, &fmla_za_f64_f64_vgx4_ilp10, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, four vectors)", "FEAT_SME2", "za-vector", "fmla", "f64", 32, 4, "f64", 64, 8, 64, 10, "throughput", 1, 1.0, 800000},
+  {{ &setup, &fmla_za_f64_f64_vgx4_ilp11, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, four vectors)", "FEAT_SME2", "za-vector", "fmla", "f64", 32, 4, "f64", 64, 8, 64, 11, "throughput", 1, 1.0, 727272},
+  {{ &setup, &fmla_za_f64_f64_vgx4_ilp12, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, four vectors)", "FEAT_SME2", "za-vector", "fmla", "f64", 32, 4, "f64", 64, 8, 64, 12, "throughput", 1, 1.0, 666666},
+  {{ &setup, &fmla_za_f64_f64_vgx4_ilp13, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, four vectors)", "FEAT_SME2", "za-vector", "fmla", "f64", 32, 4, "f64", 64, 8, 64, 13, "throughput", 1, 1.0, 615384},
+  {{ &setup, &fmla_za_f64_f64_vgx4_ilp14, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, four vectors)", "FEAT_SME2", "za-vector", "fmla", "f64", 32, 4, "f64", 64, 8, 64, 14, "throughput", 1, 1.0, 571428},
+  {{ &setup, &fmla_za_f64_f64_vgx4_ilp15, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, four vectors)", "FEAT_SME2", "za-vector", "fmla", "f64", 32, 4, "f64", 64, 8, 64, 15, "throughput", 1, 1.0, 533333},
+  {{ &setup, &fmla_za_f64_f64_vgx4_ilp16, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, four vectors)", "FEAT_SME2", "za-vector", "fmla", "f64", 32, 4, "f64", 64, 8, 64, 16, "throughput", 1, 1.0, 500000},
+  {{ &setup, &fmla_za_f64_f64_vgx4_chain8_ilp1, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, four vectors)", "FEAT_SME2", "za-vector", "fmla", "f64", 32, 4, "f64", 64, 8, 64, 1, "latency", 8, 1.0, 1000000},
+  {{ &setup, &fmla_za_f64_f64_vgx4_chain8_ilp2, &teardown }, "Multiply-Accumulate (floating-point)", "FMLA (FP64, four vectors)", "FEAT_SME2", "za-vector", "fmla", "f64", 32, 4, "f64", 64, 8, 64, 2, "latency", 8, 1.0, 500000},
+  {{ &setup, &fmlal_za_f32_f16_vgx2_ilp1, &teardown }, "Multiply-Accumulate (floating-point)", "FMLAL (FP16 to FP32, two vectors)", "FEAT_SME2", "za-double-vector", "fmlal", "f32", 64, 4, "f16", 128, 4, 128, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &fmlal_za_f32_f16_vgx2_ilp2, &teardown }, "Multiply-Accumulate (floating-point)", "FMLAL (FP16 to FP32, two vectors)", "FEAT_SME2", "za-double-vector", "fmlal", "f32", 64, 4, "f16", 128, 4, 128, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &fmlal_za_f32_f16_vgx2_ilp3, &teardown }, "Multiply-Accumulate (floating-point)", "FMLAL (FP16 to FP32, two vectors)", "FEAT_SME2", "za-double-vector", "fmlal", "f32", 64, 4, "f16", 128, 4, 128, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &fmlal_za_f32_f16_vgx2_ilp4, &teardown }, "Multiply-Accumulate (floating-point)", "FMLAL (FP16 to FP32, two vectors)", "FEAT_SME2", "za-double-vector", "fmlal", "f32", 64, 4, "f16", 128, 4, 128, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &fmlal_za_f32_f16_vgx2_ilp5, &teardown }, "Multiply-Accumulate (floating-point)", "FMLAL (FP16 to FP32, two vectors)", "FEAT_SME2", "za-double-vector", "fmlal", "f32", 64, 4, "f16", 128, 4, 128, 5, "throughput", 1, 1.0, 1600000},
+  {{ &setup, &fmlal_za_f32_f16_vgx2_ilp6, &teardown }, "Multiply-Accumulate (floating-point)", "FMLAL (FP16 to FP32, two vectors)", "FEAT_SME2", "za-double-vector", "fmlal", "f32", 64, 4, "f16", 128, 4, 128, 6, "throughput", 1, 1.0, 1333333},
+  {{ &setup, &fmlal_za_f32_f16_vgx2_ilp7, &teardown }, "Multiply-Accumulate (floating-point)", "FMLAL (FP16 to FP32, two vectors)", "FEAT_SME2", "za-double-vector", "fmlal", "f32", 64, 4, "f16", 128, 4, 128, 7, "throughput", 1, 1.0, 1142857},
+  {{ &setup, &fmlal_za_f32_f16_vgx2_ilp8, &teardown }, "Multiply-Accumulate (floating-point)", "FMLAL (FP16 to FP32, two vectors)", "FEAT_SME2", "za-double-vector", "fmlal", "f32", 64, 4, "f16", 128, 4, 128, 8, "throughput", 1, 1.0, 1000000},
+  {{ &setup, &fmlal_za_f32_f16_vgx2_ilp9, &teardown }, "Multiply-Accumulate (floating-point)", "FMLAL (FP16 to FP32, two vectors)", "FEAT_SME2", "za-double-vector", "fmlal", "f32", 64, 4, "f16", 128, 4, 128, 9, "throughput", 1, 1.0, 888888},
+  {{ &setup, &fmlal_za_f32_f16_vgx2_ilp10, &teardown }, "Multiply-Accumulate (floating-point)", "FMLAL (FP16 to FP32, two vectors)", "FEAT_SME2", "za-double-vector", "fmlal", "f32", 64, 4, "f16", 128, 4, 128, 10, "throughput", 1, 1.0, 800000},
+  {{ &setup, &fmlal_za_f32_f16_vgx2_ilp11, &teardown }, "Multiply-Accumulate (floating-point)", "FMLAL (FP16 to FP32, two vectors)", "FEAT_SME2", "za-double-vector", "fmlal", "f32", 64, 4, "f16", 128, 4, 128, 11, "throughput", 1, 1.0, 727272},
+  {{ &setup, &fmlal_za_f32_f16_vgx2_ilp12, &teardown }, "Multiply-Accumulate (floating-point)", "FMLAL (FP16 to FP32, two vectors)", "FEAT_SME2", "za-double-vector", "fmlal", "f32", 64, 4, "f16", 128, 4, 128, 12, "throughput", 1, 1.0, 666666},
+  {{ &setup, &fmlal_za_f32_f16_vgx2_ilp13, &teardown }, "Multiply-Accumulate (floating-point)", "FMLAL (FP16 to FP32, two vectors)", "FEAT_SME2", "za-double-vector", "fmlal", "f32", 64, 4, "f16", 128, 4, 128, 13, "throughput", 1, 1.0, 615384},
+  {{ &setup, &fmlal_za_f32_f16_vgx2_ilp14, &teardown }, "Multiply-Accumulate (floating-point)", "FMLAL (FP16 to FP32, two vectors)", "FEAT_SME2", "za-double-vector", "fmlal", "f32", 64, 4, "f16", 128, 4, 128, 14, "throughput", 1, 1.0, 571428},
+  {{ &setup, &fmlal_za_f32_f16_vgx2_ilp15, &teardown }, "Multiply-Accumulate (floating-point)", "FMLAL (FP16 to FP32, two vectors)", "FEAT_SME2", "za-double-vector", "fmlal", "f32", 64, 4, "f16", 128, 4, 128, 15, "throughput", 1, 1.0, 533333},
+  {{ &setup, &fmlal_za_f32_f16_vgx2_ilp16, &teardown }, "Multiply-Accumulate (floating-point)", "FMLAL (FP16 to FP32, two vectors)", "FEAT_SME2", "za-double-vector", "fmlal", "f32", 64, 4, "f16", 128, 4, 128, 16, "throughput", 1, 1.0, 500000},
+  {{ &setup, &fmlal_za_f32_f16_vgx2_chain8_ilp1, &teardown }, "Multiply-Accumulate (floating-point)", "FMLAL (FP16 to FP32, two vectors)", "FEAT_SME2", "za-double-vector", "fmlal", "f32", 64, 4, "f16", 128, 4, 128, 1, "latency", 8, 1.0, 1000000},
+  {{ &setup, &fmlal_za_f32_f16_vgx2_chain8_ilp2, &teardown }, "Multiply-Accumulate (floating-point)", "FMLAL (FP16 to FP32, two vectors)", "FEAT_SME2", "za-double-vector", "fmlal", "f32", 64, 4, "f16", 128, 4, 128, 2, "latency", 8, 1.0, 500000},
+  {{ &setup, &fmlal_za_f32_f16_vgx4_ilp1, &teardown }, "Multiply-Accumulate (floating-point)", "FMLAL (FP16 to FP32, four vectors)", "FEAT_SME2", "za-double-vector", "fmlal", "f32", 128, 8, "f16", 256, 8, 256, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &fmlal_za_f32_f16_vgx4_ilp2, &teardown }, "Multiply-Accumulate (floating-point)", "FMLAL (FP16 to FP32, four vectors)", "FEAT_SME2", "za-double-vector", "fmlal", "f32", 128, 8, "f16", 256, 8, 256, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &fmlal_za_f32_f16_vgx4_ilp3, &teardown }, "Multiply-Accumulate (floating-point)", "FMLAL (FP16 to FP32, four vectors)", "FEAT_SME2", "za-double-vector", "fmlal", "f32", 128, 8, "f16", 256, 8, 256, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &fmlal_za_f32_f16_vgx4_ilp4, &teardown }, "Multiply-Accumulate (floating-point)", "FMLAL (FP16 to FP32, four vectors)", "FEAT_SME2", "za-double-vector", "fmlal", "f32", 128, 8, "f16", 256, 8, 256, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &fmlal_za_f32_f16_vgx4_ilp5, &teardown }, "Multiply-Accumulate (floating-point)", "FMLAL (FP16 to FP32, four vectors)", "FEAT_SME2", "za-double-vector", "fmlal", "f32", 128, 8, "f16", 256, 8, 256, 5, "throughput", 1, 1.0, 1600000},
+  {{ &setup, &fmlal_za_f32_f16_vgx4_ilp6, &teardown }, "Multiply-Accumulate (floating-point)", "FMLAL (FP16 to FP32, four vectors)", "FEAT_SME2", "za-double-vector", "fmlal", "f32", 128, 8, "f16", 256, 8, 256, 6, "throughput", 1, 1.0, 1333333},
+  {{ &setup, &fmlal_za_f32_f16_vgx4_ilp7, &teardown }, "Multiply-Accumulate (floating-point)", "FMLAL (FP16 to FP32, four vectors)", "FEAT_SME2", "za-double-vector", "fmlal", "f32", 128, 8, "f16", 256, 8, 256, 7, "throughput", 1, 1.0, 1142857},
+  {{ &setup, &fmlal_za_f32_f16_vgx4_ilp8, &teardown }, "Multiply-Accumulate (floating-point)", "FMLAL (FP16 to FP32, four vectors)", "FEAT_SME2", "za-double-vector", "fmlal", "f32", 128, 8, "f16", 256, 8, 256, 8, "throughput", 1, 1.0, 1000000},
+  {{ &setup, &fmlal_za_f32_f16_vgx4_chain8_ilp1, &teardown }, "Multiply-Accumulate (floating-point)", "FMLAL (FP16 to FP32, four vectors)", "FEAT_SME2", "za-double-vector", "fmlal", "f32", 128, 8, "f16", 256, 8, 256, 1, "latency", 8, 1.0, 1000000},
+  {{ &setup, &fmlal_za_f32_f16_vgx4_chain8_ilp2, &teardown }, "Multiply-Accumulate (floating-point)", "FMLAL (FP16 to FP32, four vectors)", "FEAT_SME2", "za-double-vector", "fmlal", "f32", 128, 8, "f16", 256, 8, 256, 2, "latency", 8, 1.0, 500000},
+  {{ &setup, &bfmlal_za_f32_b16_vgx2_ilp1, &teardown }, "Multiply-Accumulate (floating-point)", "BFMLAL (BF16 to FP32, two vectors)", "FEAT_SME2", "za-double-vector", "bfmlal", "f32", 64, 4, "b16", 128, 4, 128, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &bfmlal_za_f32_b16_vgx2_ilp2, &teardown }, "Multiply-Accumulate (floating-point)", "BFMLAL (BF16 to FP32, two vectors)", "FEAT_SME2", "za-double-vector", "bfmlal", "f32", 64, 4, "b16", 128, 4, 128, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &bfmlal_za_f32_b16_vgx2_ilp3, &teardown }, "Multiply-Accumulate (floating-point)", "BFMLAL (BF16 to FP32, two vectors)", "FEAT_SME2", "za-double-vector", "bfmlal", "f32", 64, 4, "b16", 128, 4, 128, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &bfmlal_za_f32_b16_vgx2_ilp4, &teardown }, "Multiply-Accumulate (floating-point)", "BFMLAL (BF16 to FP32, two vectors)", "FEAT_SME2", "za-double-vector", "bfmlal", "f32", 64, 4, "b16", 128, 4, 128, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &bfmlal_za_f32_b16_vgx2_ilp5, &teardown }, "Multiply-Accumulate (floating-point)", "BFMLAL (BF16 to FP32, two vectors)", "FEAT_SME2", "za-double-vector", "bfmlal", "f32", 64, 4, "b16", 128, 4, 128, 5, "throughput", 1, 1.0, 1600000},
+  {{ &setup, &bfmlal_za_f32_b16_vgx2_ilp6, &teardown }, "Multiply-Accumulate (floating-point)", "BFMLAL (BF16 to FP32, two vectors)", "FEAT_SME2", "za-double-vector", "bfmlal", "f32", 64, 4, "b16", 128, 4, 128, 6, "throughput", 1, 1.0, 1333333},
+  {{ &setup, &bfmlal_za_f32_b16_vgx2_ilp7, &teardown }, "Multiply-Accumulate (floating-point)", "BFMLAL (BF16 to FP32, two vectors)", "FEAT_SME2", "za-double-vector", "bfmlal", "f32", 64, 4, "b16", 128, 4, 128, 7, "throughput", 1, 1.0, 1142857},
+  {{ &setup, &bfmlal_za_f32_b16_vgx2_ilp8, &teardown }, "Multiply-Accumulate (floating-point)", "BFMLAL (BF16 to FP32, two vectors)", "FEAT_SME2", "za-double-vector", "bfmlal", "f32", 64, 4, "b16", 128, 4, 128, 8, "throughput", 1, 1.0, 1000000},
+  {{ &setup, &bfmlal_za_f32_b16_vgx2_ilp9, &teardown }, "Multiply-Accumulate (floating-point)", "BFMLAL (BF16 to FP32, two vectors)", "FEAT_SME2", "za-double-vector", "bfmlal", "f32", 64, 4, "b16", 128, 4, 128, 9, "throughput", 1, 1.0, 888888},
+  {{ &setup, &bfmlal_za_f32_b16_vgx2_ilp10, &teardown }, "Multiply-Accumulate (floating-point)", "BFMLAL (BF16 to FP32, two vectors)", "FEAT_SME2", "za-double-vector", "bfmlal", "f32", 64, 4, "b16", 128, 4, 128, 10, "throughput", 1, 1.0, 800000},
+  {{ &setup, &bfmlal_za_f32_b16_vgx2_ilp11, &teardown }, "Multiply-Accumulate (floating-point)", "BFMLAL (BF16 to FP32, two vectors)", "FEAT_SME2", "za-double-vector", "bfmlal", "f32", 64, 4, "b16", 128, 4, 128, 11, "throughput", 1, 1.0, 727272},
+  {{ &setup, &bfmlal_za_f32_b16_vgx2_ilp12, &teardown }, "Multiply-Accumulate (floating-point)", "BFMLAL (BF16 to FP32, two vectors)", "FEAT_SME2", "za-double-vector", "bfmlal", "f32", 64, 4, "b16", 128, 4, 128, 12, "throughput", 1, 1.0, 666666},
+  {{ &setup, &bfmlal_za_f32_b16_vgx2_ilp13, &teardown }, "Multiply-Accumulate (floating-point)", "BFMLAL (BF16 to FP32, two vectors)", "FEAT_SME2", "za-double-vector", "bfmlal", "f32", 64, 4, "b16", 128, 4, 128, 13, "throughput", 1, 1.0, 615384},
+  {{ &setup, &bfmlal_za_f32_b16_vgx2_ilp14, &teardown }, "Multiply-Accumulate (floating-point)", "BFMLAL (BF16 to FP32, two vectors)", "FEAT_SME2", "za-double-vector", "bfmlal", "f32", 64, 4, "b16", 128, 4, 128, 14, "throughput", 1, 1.0, 571428},
+  {{ &setup, &bfmlal_za_f32_b16_vgx2_ilp15, &teardown }, "Multiply-Accumulate (floating-point)", "BFMLAL (BF16 to FP32, two vectors)", "FEAT_SME2", "za-double-vector", "bfmlal", "f32", 64, 4, "b16", 128, 4, 128, 15, "throughput", 1, 1.0, 533333},
+  {{ &setup, &bfmlal_za_f32_b16_vgx2_ilp16, &teardown }, "Multiply-Accumulate (floating-point)", "BFMLAL (BF16 to FP32, two vectors)", "FEAT_SME2", "za-double-vector", "bfmlal", "f32", 64, 4, "b16", 128, 4, 128, 16, "throughput", 1, 1.0, 500000},
+  {{ &setup, &bfmlal_za_f32_b16_vgx2_chain8_ilp1, &teardown }, "Multiply-Accumulate (floating-point)", "BFMLAL (BF16 to FP32, two vectors)", "FEAT_SME2", "za-double-vector", "bfmlal", "f32", 64, 4, "b16", 128, 4, 128, 1, "latency", 8, 1.0, 1000000},
+  {{ &setup, &bfmlal_za_f32_b16_vgx2_chain8_ilp2, &teardown }, "Multiply-Accumulate (floating-point)", "BFMLAL (BF16 to FP32, two vectors)", "FEAT_SME2", "za-double-vector", "bfmlal", "f32", 64, 4, "b16", 128, 4, 128, 2, "latency", 8, 1.0, 500000},
+  {{ &setup, &bfmlal_za_f32_b16_vgx4_ilp1, &teardown }, "Multiply-Accumulate (floating-point)", "BFMLAL (BF16 to FP32, four vectors)", "FEAT_SME2", "za-double-vector", "bfmlal", "f32", 128, 8, "b16", 256, 8, 256, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &bfmlal_za_f32_b16_vgx4_ilp2, &teardown }, "Multiply-Accumulate (floating-point)", "BFMLAL (BF16 to FP32, four vectors)", "FEAT_SME2", "za-double-vector", "bfmlal", "f32", 128, 8, "b16", 256, 8, 256, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &bfmlal_za_f32_b16_vgx4_ilp3, &teardown }, "Multiply-Accumulate (floating-point)", "BFMLAL (BF16 to FP32, four vectors)", "FEAT_SME2", "za-double-vector", "bfmlal", "f32", 128, 8, "b16", 256, 8, 256, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &bfmlal_za_f32_b16_vgx4_ilp4, &teardown }, "Multiply-Accumulate (floating-point)", "BFMLAL (BF16 to FP32, four vectors)", "FEAT_SME2", "za-double-vector", "bfmlal", "f32", 128, 8, "b16", 256, 8, 256, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &bfmlal_za_f32_b16_vgx4_ilp5, &teardown }, "Multiply-Accumulate (floating-point)", "BFMLAL (BF16 to FP32, four vectors)", "FEAT_SME2", "za-double-vector", "bfmlal", "f32", 128, 8, "b16", 256, 8, 256, 5, "throughput", 1, 1.0, 1600000},
+  {{ &setup, &bfmlal_za_f32_b16_vgx4_ilp6, &teardown }, "Multiply-Accumulate (floating-point)", "BFMLAL (BF16 to FP32, four vectors)", "FEAT_SME2", "za-double-vector", "bfmlal", "f32", 128, 8, "b16", 256, 8, 256, 6, "throughput", 1, 1.0, 1333333},
+  {{ &setup, &bfmlal_za_f32_b16_vgx4_ilp7, &teardown }, "Multiply-Accumulate (floating-point)", "BFMLAL (BF16 to FP32, four vectors)", "FEAT_SME2", "za-double-vector", "bfmlal", "f32", 128, 8, "b16", 256, 8, 256, 7, "throughput", 1, 1.0, 1142857},
+  {{ &setup, &bfmlal_za_f32_b16_vgx4_ilp8, &teardown }, "Multiply-Accumulate (floating-point)", "BFMLAL (BF16 to FP32, four vectors)", "FEAT_SME2", "za-double-vector", "bfmlal", "f32", 128, 8, "b16", 256, 8, 256, 8, "throughput", 1, 1.0, 1000000},
+  {{ &setup, &bfmlal_za_f32_b16_vgx4_chain8_ilp1, &teardown }, "Multiply-Accumulate (floating-point)", "BFMLAL (BF16 to FP32, four vectors)", "FEAT_SME2", "za-double-vector", "bfmlal", "f32", 128, 8, "b16", 256, 8, 256, 1, "latency", 8, 1.0, 1000000},
+  {{ &setup, &bfmlal_za_f32_b16_vgx4_chain8_ilp2, &teardown }, "Multiply-Accumulate (floating-point)", "BFMLAL (BF16 to FP32, four vectors)", "FEAT_SME2", "za-double-vector", "bfmlal", "f32", 128, 8, "b16", 256, 8, 256, 2, "latency", 8, 1.0, 500000},
+  {{ &setup, &mla_i8_i8_ilp1, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector)", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 128, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &mla_i8_i8_ilp2, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector)", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 128, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &mla_i8_i8_ilp3, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector)", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 128, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &mla_i8_i8_ilp4, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector)", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 128, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &mla_i8_i8_ilp5, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector)", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 128, 5, "throughput", 1, 1.0, 1600000},
+  {{ &setup, &mla_i8_i8_ilp6, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector)", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 128, 6, "throughput", 1, 1.0, 1333333},
+  {{ &setup, &mla_i8_i8_ilp7, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector)", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 128, 7, "throughput", 1, 1.0, 1142857},
+  {{ &setup, &mla_i8_i8_ilp8, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector)", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 128, 8, "throughput", 1, 1.0, 1000000},
+  {{ &setup, &mla_i8_i8_ilp9, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector)", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 128, 9, "throughput", 1, 1.0, 888888},
+  {{ &setup, &mla_i8_i8_ilp10, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector)", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 128, 10, "throughput", 1, 1.0, 800000},
+  {{ &setup, &mla_i8_i8_ilp11, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector)", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 128, 11, "throughput", 1, 1.0, 727272},
+  {{ &setup, &mla_i8_i8_ilp12, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector)", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 128, 12, "throughput", 1, 1.0, 666666},
+  {{ &setup, &mla_i8_i8_ilp13, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector)", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 128, 13, "throughput", 1, 1.0, 615384},
+  {{ &setup, &mla_i8_i8_ilp14, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector)", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 128, 14, "throughput", 1, 1.0, 571428},
+  {{ &setup, &mla_i8_i8_ilp15, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector)", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 128, 15, "throughput", 1, 1.0, 533333},
+  {{ &setup, &mla_i8_i8_ilp16, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector)", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 128, 16, "throughput", 1, 1.0, 500000},
+  {{ &setup, &mla_i8_i8_chain8_ilp1, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector)", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 128, 1, "latency", 8, 1.0, 1000000},
+  {{ &setup, &mla_i8_i8_chain8_ilp2, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector)", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 128, 2, "latency", 8, 1.0, 500000},
+  {{ &setup, &mla_i8_i8_p75_ilp1, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 96, 1, "throughput", 1, 0.75, 8000000},
+  {{ &setup, &mla_i8_i8_p75_ilp2, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 96, 2, "throughput", 1, 0.75, 4000000},
+  {{ &setup, &mla_i8_i8_p75_ilp3, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 96, 3, "throughput", 1, 0.75, 2666666},
+  {{ &setup, &mla_i8_i8_p75_ilp4, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 96, 4, "throughput", 1, 0.75, 2000000},
+  {{ &setup, &mla_i8_i8_p75_ilp5, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 96, 5, "throughput", 1, 0.75, 1600000},
+  {{ &setup, &mla_i8_i8_p75_ilp6, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 96, 6, "throughput", 1, 0.75, 1333333},
+  {{ &setup, &mla_i8_i8_p75_ilp7, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 96, 7, "throughput", 1, 0.75, 1142857},
+  {{ &setup, &mla_i8_i8_p75_ilp8, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 96, 8, "throughput", 1, 0.75, 1000000},
+  {{ &setup, &mla_i8_i8_p75_ilp9, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 96, 9, "throughput", 1, 0.75, 888888},
+  {{ &setup, &mla_i8_i8_p75_ilp10, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 96, 10, "throughput", 1, 0.75, 800000},
+  {{ &setup, &mla_i8_i8_p75_ilp11, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 96, 11, "throughput", 1, 0.75, 727272},
+  {{ &setup, &mla_i8_i8_p75_ilp12, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 96, 12, "throughput", 1, 0.75, 666666},
+  {{ &setup, &mla_i8_i8_p75_ilp13, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 96, 13, "throughput", 1, 0.75, 615384},
+  {{ &setup, &mla_i8_i8_p75_ilp14, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 96, 14, "throughput", 1, 0.75, 571428},
+  {{ &setup, &mla_i8_i8_p75_ilp15, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 96, 15, "throughput", 1, 0.75, 533333},
+  {{ &setup, &mla_i8_i8_p75_ilp16, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 96, 16, "throughput", 1, 0.75, 500000},
+  {{ &setup, &mla_i8_i8_p50_ilp1, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 64, 1, "throughput", 1, 0.5, 8000000},
+  {{ &setup, &mla_i8_i8_p50_ilp2, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 64, 2, "throughput", 1, 0.5, 4000000},
+  {{ &setup, &mla_i8_i8_p50_ilp3, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 64, 3, "throughput", 1, 0.5, 2666666},
+  {{ &setup, &mla_i8_i8_p50_ilp4, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 64, 4, "throughput", 1, 0.5, 2000000},
+  {{ &setup, &mla_i8_i8_p50_ilp5, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 64, 5, "throughput", 1, 0.5, 1600000},
+  {{ &setup, &mla_i8_i8_p50_ilp6, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 64, 6, "throughput", 1, 0.5, 1333333},
+  {{ &setup, &mla_i8_i8_p50_ilp7, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 64, 7, "throughput", 1, 0.5, 1142857},
+  {{ &setup, &mla_i8_i8_p50_ilp8, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 64, 8, "throughput", 1, 0.5, 1000000},
+  {{ &setup, &mla_i8_i8_p50_ilp9, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 64, 9, "throughput", 1, 0.5, 888888},
+  {{ &setup, &mla_i8_i8_p50_ilp10, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 64, 10, "throughput", 1, 0.5, 800000},
+  {{ &setup, &mla_i8_i8_p50_ilp11, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 64, 11, "throughput", 1, 0.5, 727272},
+  {{ &setup, &mla_i8_i8_p50_ilp12, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 64, 12, "throughput", 1, 0.5, 666666},
+  {{ &setup, &mla_i8_i8_p50_ilp13, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 64, 13, "throughput", 1, 0.5, 615384},
+  {{ &setup, &mla_i8_i8_p50_ilp14, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 64, 14, "throughput", 1, 0.5, 571428},
+  {{ &setup, &mla_i8_i8_p50_ilp15, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 64, 15, "throughput", 1, 0.5, 533333},
+  {{ &setup, &mla_i8_i8_p50_ilp16, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 64, 16, "throughput", 1, 0.5, 500000},
+  {{ &setup, &mla_i8_i8_p25_ilp1, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 32, 1, "throughput", 1, 0.25, 8000000},
+  {{ &setup, &mla_i8_i8_p25_ilp2, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 32, 2, "throughput", 1, 0.25, 4000000},
+  {{ &setup, &mla_i8_i8_p25_ilp3, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 32, 3, "throughput", 1, 0.25, 2666666},
+  {{ &setup, &mla_i8_i8_p25_ilp4, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 32, 4, "throughput", 1, 0.25, 2000000},
+  {{ &setup, &mla_i8_i8_p25_ilp5, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 32, 5, "throughput", 1, 0.25, 1600000},
+  {{ &setup, &mla_i8_i8_p25_ilp6, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 32, 6, "throughput", 1, 0.25, 1333333},
+  {{ &setup, &mla_i8_i8_p25_ilp7, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 32, 7, "throughput", 1, 0.25, 1142857},
+  {{ &setup, &mla_i8_i8_p25_ilp8, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 32, 8, "throughput", 1, 0.25, 1000000},
+  {{ &setup, &mla_i8_i8_p25_ilp9, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 32, 9, "throughput", 1, 0.25, 888888},
+  {{ &setup, &mla_i8_i8_p25_ilp10, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 32, 10, "throughput", 1, 0.25, 800000},
+  {{ &setup, &mla_i8_i8_p25_ilp11, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 32, 11, "throughput", 1, 0.25, 727272},
+  {{ &setup, &mla_i8_i8_p25_ilp12, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 32, 12, "throughput", 1, 0.25, 666666},
+  {{ &setup, &mla_i8_i8_p25_ilp13, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 32, 13, "throughput", 1, 0.25, 615384},
+  {{ &setup, &mla_i8_i8_p25_ilp14, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 32, 14, "throughput", 1, 0.25, 571428},
+  {{ &setup, &mla_i8_i8_p25_ilp15, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 32, 15, "throughput", 1, 0.25, 533333},
+  {{ &setup, &mla_i8_i8_p25_ilp16, &teardown }, "Multiply-Accumulate (integer)", "MLA (I8, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i8", 64, 1, "i8", 128, 2, 32, 16, "throughput", 1, 0.25, 500000},
+  {{ &setup, &mla_i16_i16_ilp1, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector)", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 64, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &mla_i16_i16_ilp2, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector)", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 64, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &mla_i16_i16_ilp3, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector)", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 64, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &mla_i16_i16_ilp4, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector)", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 64, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &mla_i16_i16_ilp5, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector)", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 64, 5, "throughput", 1, 1.0, 1600000},
+  {{ &setup, &mla_i16_i16_ilp6, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector)", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 64, 6, "throughput", 1, 1.0, 1333333},
+  {{ &setup, &mla_i16_i16_ilp7, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector)", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 64, 7, "throughput", 1, 1.0, 1142857},
+  {{ &setup, &mla_i16_i16_ilp8, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector)", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 64, 8, "throughput", 1, 1.0, 1000000},
+  {{ &setup, &mla_i16_i16_ilp9, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector)", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 64, 9, "throughput", 1, 1.0, 888888},
+  {{ &setup, &mla_i16_i16_ilp10, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector)", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 64, 10, "throughput", 1, 1.0, 800000},
+  {{ &setup, &mla_i16_i16_ilp11, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector)", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 64, 11, "throughput", 1, 1.0, 727272},
+  {{ &setup, &mla_i16_i16_ilp12, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector)", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 64, 12, "throughput", 1, 1.0, 666666},
+  {{ &setup, &mla_i16_i16_ilp13, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector)", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 64, 13, "throughput", 1, 1.0, 615384},
+  {{ &setup, &mla_i16_i16_ilp14, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector)", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 64, 14, "throughput", 1, 1.0, 571428},
+  {{ &setup, &mla_i16_i16_ilp15, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector)", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 64, 15, "throughput", 1, 1.0, 533333},
+  {{ &setup, &mla_i16_i16_ilp16, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector)", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 64, 16, "throughput", 1, 1.0, 500000},
+  {{ &setup, &mla_i16_i16_chain8_ilp1, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector)", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 64, 1, "latency", 8, 1.0, 1000000},
+  {{ &setup, &mla_i16_i16_chain8_ilp2, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector)", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 64, 2, "latency", 8, 1.0, 500000},
+  {{ &setup, &mla_i16_i16_p75_ilp1, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 48, 1, "throughput", 1, 0.75, 8000000},
+  {{ &setup, &mla_i16_i16_p75_ilp2, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 48, 2, "throughput", 1, 0.75, 4000000},
+  {{ &setup, &mla_i16_i16_p75_ilp3, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 48, 3, "throughput", 1, 0.75, 2666666},
+  {{ &setup, &mla_i16_i16_p75_ilp4, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 48, 4, "throughput", 1, 0.75, 2000000},
+  {{ &setup, &mla_i16_i16_p75_ilp5, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 48, 5, "throughput", 1, 0.75, 1600000},
+  {{ &setup, &mla_i16_i16_p75_ilp6, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 48, 6, "throughput", 1, 0.75, 1333333},
+  {{ &setup, &mla_i16_i16_p75_ilp7, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 48, 7, "throughput", 1, 0.75, 1142857},
+  {{ &setup, &mla_i16_i16_p75_ilp8, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 48, 8, "throughput", 1, 0.75, 1000000},
+  {{ &setup, &mla_i16_i16_p75_ilp9, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 48, 9, "throughput", 1, 0.75, 888888},
+  {{ &setup, &mla_i16_i16_p75_ilp10, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 48, 10, "throughput", 1, 0.75, 800000},
+  {{ &setup, &mla_i16_i16_p75_ilp11, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 48, 11, "throughput", 1, 0.75, 727272},
+  {{ &setup, &mla_i16_i16_p75_ilp12, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 48, 12, "throughput", 1, 0.75, 666666},
+  {{ &setup, &mla_i16_i16_p75_ilp13, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 48, 13, "throughput", 1, 0.75, 615384},
+  {{ &setup, &mla_i16_i16_p75_ilp14, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 48, 14, "throughput", 1, 0.75, 571428},
+  {{ &setup, &mla_i16_i16_p75_ilp15, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 48, 15, "throughput", 1, 0.75, 533333},
+  {{ &setup, &mla_i16_i16_p75_ilp16, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 48, 16, "throughput", 1, 0.75, 500000},
+  {{ &setup, &mla_i16_i16_p50_ilp1, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 32, 1, "throughput", 1, 0.5, 8000000},
+  {{ &setup, &mla_i16_i16_p50_ilp2, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 32, 2, "throughput", 1, 0.5, 4000000},
+  {{ &setup, &mla_i16_i16_p50_ilp3, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 32, 3, "throughput", 1, 0.5, 2666666},
+  {{ &setup, &mla_i16_i16_p50_ilp4, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 32, 4, "throughput", 1, 0.5, 2000000},
+  {{ &setup, &mla_i16_i16_p50_ilp5, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 32, 5, "throughput", 1, 0.5, 1600000},
+  {{ &setup, &mla_i16_i16_p50_ilp6, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 32, 6, "throughput", 1, 0.5, 1333333},
+  {{ &setup, &mla_i16_i16_p50_ilp7, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 32, 7, "throughput", 1, 0.5, 1142857},
+  {{ &setup, &mla_i16_i16_p50_ilp8, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 32, 8, "throughput", 1, 0.5, 1000000},
+  {{ &setup, &mla_i16_i16_p50_ilp9, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 32, 9, "throughput", 1, 0.5, 888888},
+  {{ &setup, &mla_i16_i16_p50_ilp10, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 32, 10, "throughput", 1, 0.5, 800000},
+  {{ &setup, &mla_i16_i16_p50_ilp11, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 32, 11, "throughput", 1, 0.5, 727272},
+  {{ &setup, &mla_i16_i16_p50_ilp12, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 32, 12, "throughput", 1, 0.5, 666666},
+  {{ &setup, &mla_i16_i16_p50_ilp13, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 32, 13, "throughput", 1, 0.5, 615384},
+  {{ &setup, &mla_i16_i16_p50_ilp14, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 32, 14, "throughput", 1, 0.5, 571428},
+  {{ &setup, &mla_i16_i16_p50_ilp15, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 32, 15, "throughput", 1, 0.5, 533333},
+  {{ &setup, &mla_i16_i16_p50_ilp16, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 32, 16, "throughput", 1, 0.5, 500000},
+  {{ &setup, &mla_i16_i16_p25_ilp1, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 16, 1, "throughput", 1, 0.25, 8000000},
+  {{ &setup, &mla_i16_i16_p25_ilp2, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 16, 2, "throughput", 1, 0.25, 4000000},
+  {{ &setup, &mla_i16_i16_p25_ilp3, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 16, 3, "throughput", 1, 0.25, 2666666},
+  {{ &setup, &mla_i16_i16_p25_ilp4, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 16, 4, "throughput", 1, 0.25, 2000000},
+  {{ &setup, &mla_i16_i16_p25_ilp5, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 16, 5, "throughput", 1, 0.25, 1600000},
+  {{ &setup, &mla_i16_i16_p25_ilp6, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 16, 6, "throughput", 1, 0.25, 1333333},
+  {{ &setup, &mla_i16_i16_p25_ilp7, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 16, 7, "throughput", 1, 0.25, 1142857},
+  {{ &setup, &mla_i16_i16_p25_ilp8, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 16, 8, "throughput", 1, 0.25, 1000000},
+  {{ &setup, &mla_i16_i16_p25_ilp9, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 16, 9, "throughput", 1, 0.25, 888888},
+  {{ &setup, &mla_i16_i16_p25_ilp10, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 16, 10, "throughput", 1, 0.25, 800000},
+  {{ &setup, &mla_i16_i16_p25_ilp11, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 16, 11, "throughput", 1, 0.25, 727272},
+  {{ &setup, &mla_i16_i16_p25_ilp12, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 16, 12, "throughput", 1, 0.25, 666666},
+  {{ &setup, &mla_i16_i16_p25_ilp13, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 16, 13, "throughput", 1, 0.25, 615384},
+  {{ &setup, &mla_i16_i16_p25_ilp14, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 16, 14, "throughput", 1, 0.25, 571428},
+  {{ &setup, &mla_i16_i16_p25_ilp15, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 16, 15, "throughput", 1, 0.25, 533333},
+  {{ &setup, &mla_i16_i16_p25_ilp16, &teardown }, "Multiply-Accumulate (integer)", "MLA (I16, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i16", 32, 1, "i16", 64, 2, 16, 16, "throughput", 1, 0.25, 500000},
+  {{ &setup, &mla_i32_i32_ilp1, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector)", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 32, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &mla_i32_i32_ilp2, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector)", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 32, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &mla_i32_i32_ilp3, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector)", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 32, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &mla_i32_i32_ilp4, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector)", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 32, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &mla_i32_i32_ilp5, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector)", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 32, 5, "throughput", 1, 1.0, 1600000},
+  {{ &setup, &mla_i32_i32_ilp6, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector)", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 32, 6, "throughput", 1, 1.0, 1333333},
+  {{ &setup, &mla_i32_i32_ilp7, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector)", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 32, 7, "throughput", 1, 1.0, 1142857},
+  {{ &setup, &mla_i32_i32_ilp8, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector)", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 32, 8, "throughput", 1, 1.0, 1000000},
+  {{ &setup, &mla_i32_i32_ilp9, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector)", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 32, 9, "throughput", 1, 1.0, 888888},
+  {{ &setup, &mla_i32_i32_ilp10, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector)", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 32, 10, "throughput", 1, 1.0, 800000},
+  {{ &setup, &mla_i32_i32_ilp11, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector)", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 32, 11, "throughput", 1, 1.0, 727272},
+  {{ &setup, &mla_i32_i32_ilp12, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector)", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 32, 12, "throughput", 1, 1.0, 666666},
+  {{ &setup, &mla_i32_i32_ilp13, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector)", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 32, 13, "throughput", 1, 1.0, 615384},
+  {{ &setup, &mla_i32_i32_ilp14, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector)", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 32, 14, "throughput", 1, 1.0, 571428},
+  {{ &setup, &mla_i32_i32_ilp15, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector)", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 32, 15, "throughput", 1, 1.0, 533333},
+  {{ &setup, &mla_i32_i32_ilp16, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector)", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 32, 16, "throughput", 1, 1.0, 500000},
+  {{ &setup, &mla_i32_i32_chain8_ilp1, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector)", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 32, 1, "latency", 8, 1.0, 1000000},
+  {{ &setup, &mla_i32_i32_chain8_ilp2, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector)", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 32, 2, "latency", 8, 1.0, 500000},
+  {{ &setup, &mla_i32_i32_p75_ilp1, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 24, 1, "throughput", 1, 0.75, 8000000},
+  {{ &setup, &mla_i32_i32_p75_ilp2, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 24, 2, "throughput", 1, 0.75, 4000000},
+  {{ &setup, &mla_i32_i32_p75_ilp3, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 24, 3, "throughput", 1, 0.75, 2666666},
+  {{ &setup, &mla_i32_i32_p75_ilp4, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 24, 4, "throughput", 1, 0.75, 2000000},
+  {{ &setup, &mla_i32_i32_p75_ilp5, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 24, 5, "throughput", 1, 0.75, 1600000},
+  {{ &setup, &mla_i32_i32_p75_ilp6, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 24, 6, "throughput", 1, 0.75, 1333333},
+  {{ &setup, &mla_i32_i32_p75_ilp7, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 24, 7, "throughput", 1, 0.75, 1142857},
+  {{ &setup, &mla_i32_i32_p75_ilp8, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 24, 8, "throughput", 1, 0.75, 1000000},
+  {{ &setup, &mla_i32_i32_p75_ilp9, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 24, 9, "throughput", 1, 0.75, 888888},
+  {{ &setup, &mla_i32_i32_p75_ilp10, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 24, 10, "throughput", 1, 0.75, 800000},
+  {{ &setup, &mla_i32_i32_p75_ilp11, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 24, 11, "throughput", 1, 0.75, 727272},
+  {{ &setup, &mla_i32_i32_p75_ilp12, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 24, 12, "throughput", 1, 0.75, 666666},
+  {{ &setup, &mla_i32_i32_p75_ilp13, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 24, 13, "throughput", 1, 0.75, 615384},
+  {{ &setup, &mla_i32_i32_p75_ilp14, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 24, 14, "throughput", 1, 0.75, 571428},
+  {{ &setup, &mla_i32_i32_p75_ilp15, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 24, 15, "throughput", 1, 0.75, 533333},
+  {{ &setup, &mla_i32_i32_p75_ilp16, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 24, 16, "throughput", 1, 0.75, 500000},
+  {{ &setup, &mla_i32_i32_p50_ilp1, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 16, 1, "throughput", 1, 0.5, 8000000},
+  {{ &setup, &mla_i32_i32_p50_ilp2, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 16, 2, "throughput", 1, 0.5, 4000000},
+  {{ &setup, &mla_i32_i32_p50_ilp3, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 16, 3, "throughput", 1, 0.5, 2666666},
+  {{ &setup, &mla_i32_i32_p50_ilp4, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 16, 4, "throughput", 1, 0.5, 2000000},
+  {{ &setup, &mla_i32_i32_p50_ilp5, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 16, 5, "throughput", 1, 0.5, 1600000},
+  {{ &setup, &mla_i32_i32_p50_ilp6, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 16, 6, "throughput", 1, 0.5, 1333333},
+  {{ &setup, &mla_i32_i32_p50_ilp7, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 16, 7, "throughput", 1, 0.5, 1142857},
+  {{ &setup, &mla_i32_i32_p50_ilp8, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 16, 8, "throughput", 1, 0.5, 1000000},
+  {{ &setup, &mla_i32_i32_p50_ilp9, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 16, 9, "throughput", 1, 0.5, 888888},
+  {{ &setup, &mla_i32_i32_p50_ilp10, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 16, 10, "throughput", 1, 0.5, 800000},
+  {{ &setup, &mla_i32_i32_p50_ilp11, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 16, 11, "throughput", 1, 0.5, 727272},
+  {{ &setup, &mla_i32_i32_p50_ilp12, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 16, 12, "throughput", 1, 0.5, 666666},
+  {{ &setup, &mla_i32_i32_p50_ilp13, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 16, 13, "throughput", 1, 0.5, 615384},
+  {{ &setup, &mla_i32_i32_p50_ilp14, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 16, 14, "throughput", 1, 0.5, 571428},
+  {{ &setup, &mla_i32_i32_p50_ilp15, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 16, 15, "throughput", 1, 0.5, 533333},
+  {{ &setup, &mla_i32_i32_p50_ilp16, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 16, 16, "throughput", 1, 0.5, 500000},
+  {{ &setup, &mla_i32_i32_p25_ilp1, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 8, 1, "throughput", 1, 0.25, 8000000},
+  {{ &setup, &mla_i32_i32_p25_ilp2, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 8, 2, "throughput", 1, 0.25, 4000000},
+  {{ &setup, &mla_i32_i32_p25_ilp3, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 8, 3, "throughput", 1, 0.25, 2666666},
+  {{ &setup, &mla_i32_i32_p25_ilp4, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 8, 4, "throughput", 1, 0.25, 2000000},
+  {{ &setup, &mla_i32_i32_p25_ilp5, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 8, 5, "throughput", 1, 0.25, 1600000},
+  {{ &setup, &mla_i32_i32_p25_ilp6, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 8, 6, "throughput", 1, 0.25, 1333333},
+  {{ &setup, &mla_i32_i32_p25_ilp7, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 8, 7, "throughput", 1, 0.25, 1142857},
+  {{ &setup, &mla_i32_i32_p25_ilp8, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 8, 8, "throughput", 1, 0.25, 1000000},
+  {{ &setup, &mla_i32_i32_p25_ilp9, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 8, 9, "throughput", 1, 0.25, 888888},
+  {{ &setup, &mla_i32_i32_p25_ilp10, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 8, 10, "throughput", 1, 0.25, 800000},
+  {{ &setup, &mla_i32_i32_p25_ilp11, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 8, 11, "throughput", 1, 0.25, 727272},
+  {{ &setup, &mla_i32_i32_p25_ilp12, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 8, 12, "throughput", 1, 0.25, 666666},
+  {{ &setup, &mla_i32_i32_p25_ilp13, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 8, 13, "throughput", 1, 0.25, 615384},
+  {{ &setup, &mla_i32_i32_p25_ilp14, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 8, 14, "throughput", 1, 0.25, 571428},
+  {{ &setup, &mla_i32_i32_p25_ilp15, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 8, 15, "throughput", 1, 0.25, 533333},
+  {{ &setup, &mla_i32_i32_p25_ilp16, &teardown }, "Multiply-Accumulate (integer)", "MLA (I32, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i32", 16, 1, "i32", 32, 2, 8, 16, "throughput", 1, 0.25, 500000},
+  {{ &setup, &mla_i64_i64_ilp1, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector)", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 16, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &mla_i64_i64_ilp2, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector)", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 16, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &mla_i64_i64_ilp3, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector)", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 16, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &mla_i64_i64_ilp4, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector)", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 16, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &mla_i64_i64_ilp5, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector)", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 16, 5, "throughput", 1, 1.0, 1600000},
+  {{ &setup, &mla_i64_i64_ilp6, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector)", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 16, 6, "throughput", 1, 1.0, 1333333},
+  {{ &setup, &mla_i64_i64_ilp7, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector)", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 16, 7, "throughput", 1, 1.0, 1142857},
+  {{ &setup, &mla_i64_i64_ilp8, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector)", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 16, 8, "throughput", 1, 1.0, 1000000},
+  {{ &setup, &mla_i64_i64_ilp9, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector)", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 16, 9, "throughput", 1, 1.0, 888888},
+  {{ &setup, &mla_i64_i64_ilp10, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector)", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 16, 10, "throughput", 1, 1.0, 800000},
+  {{ &setup, &mla_i64_i64_ilp11, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector)", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 16, 11, "throughput", 1, 1.0, 727272},
+  {{ &setup, &mla_i64_i64_ilp12, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector)", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 16, 12, "throughput", 1, 1.0, 666666},
+  {{ &setup, &mla_i64_i64_ilp13, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector)", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 16, 13, "throughput", 1, 1.0, 615384},
+  {{ &setup, &mla_i64_i64_ilp14, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector)", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 16, 14, "throughput", 1, 1.0, 571428},
+  {{ &setup, &mla_i64_i64_ilp15, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector)", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 16, 15, "throughput", 1, 1.0, 533333},
+  {{ &setup, &mla_i64_i64_ilp16, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector)", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 16, 16, "throughput", 1, 1.0, 500000},
+  {{ &setup, &mla_i64_i64_chain8_ilp1, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector)", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 16, 1, "latency", 8, 1.0, 1000000},
+  {{ &setup, &mla_i64_i64_chain8_ilp2, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector)", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 16, 2, "latency", 8, 1.0, 500000},
+  {{ &setup, &mla_i64_i64_p75_ilp1, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 12, 1, "throughput", 1, 0.75, 8000000},
+  {{ &setup, &mla_i64_i64_p75_ilp2, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 12, 2, "throughput", 1, 0.75, 4000000},
+  {{ &setup, &mla_i64_i64_p75_ilp3, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 12, 3, "throughput", 1, 0.75, 2666666},
+  {{ &setup, &mla_i64_i64_p75_ilp4, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 12, 4, "throughput", 1, 0.75, 2000000},
+  {{ &setup, &mla_i64_i64_p75_ilp5, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 12, 5, "throughput", 1, 0.75, 1600000},
+  {{ &setup, &mla_i64_i64_p75_ilp6, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 12, 6, "throughput", 1, 0.75, 1333333},
+  {{ &setup, &mla_i64_i64_p75_ilp7, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 12, 7, "throughput", 1, 0.75, 1142857},
+  {{ &setup, &mla_i64_i64_p75_ilp8, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 12, 8, "throughput", 1, 0.75, 1000000},
+  {{ &setup, &mla_i64_i64_p75_ilp9, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 12, 9, "throughput", 1, 0.75, 888888},
+  {{ &setup, &mla_i64_i64_p75_ilp10, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 12, 10, "throughput", 1, 0.75, 800000},
+  {{ &setup, &mla_i64_i64_p75_ilp11, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 12, 11, "throughput", 1, 0.75, 727272},
+  {{ &setup, &mla_i64_i64_p75_ilp12, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 12, 12, "throughput", 1, 0.75, 666666},
+  {{ &setup, &mla_i64_i64_p75_ilp13, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 12, 13, "throughput", 1, 0.75, 615384},
+  {{ &setup, &mla_i64_i64_p75_ilp14, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 12, 14, "throughput", 1, 0.75, 571428},
+  {{ &setup, &mla_i64_i64_p75_ilp15, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 12, 15, "throughput", 1, 0.75, 533333},
+  {{ &setup, &mla_i64_i64_p75_ilp16, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector), 75% active lanes", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 12, 16, "throughput", 1, 0.75, 500000},
+  {{ &setup, &mla_i64_i64_p50_ilp1, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 8, 1, "throughput", 1, 0.5, 8000000},
+  {{ &setup, &mla_i64_i64_p50_ilp2, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 8, 2, "throughput", 1, 0.5, 4000000},
+  {{ &setup, &mla_i64_i64_p50_ilp3, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 8, 3, "throughput", 1, 0.5, 2666666},
+  {{ &setup, &mla_i64_i64_p50_ilp4, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 8, 4, "throughput", 1, 0.5, 2000000},
+  {{ &setup, &mla_i64_i64_p50_ilp5, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 8, 5, "throughput", 1, 0.5, 1600000},
+  {{ &setup, &mla_i64_i64_p50_ilp6, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 8, 6, "throughput", 1, 0.5, 1333333},
+  {{ &setup, &mla_i64_i64_p50_ilp7, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 8, 7, "throughput", 1, 0.5, 1142857},
+  {{ &setup, &mla_i64_i64_p50_ilp8, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 8, 8, "throughput", 1, 0.5, 1000000},
+  {{ &setup, &mla_i64_i64_p50_ilp9, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 8, 9, "throughput", 1, 0.5, 888888},
+  {{ &setup, &mla_i64_i64_p50_ilp10, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 8, 10, "throughput", 1, 0.5, 800000},
+  {{ &setup, &mla_i64_i64_p50_ilp11, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 8, 11, "throughput", 1, 0.5, 727272},
+  {{ &setup, &mla_i64_i64_p50_ilp12, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 8, 12, "throughput", 1, 0.5, 666666},
+  {{ &setup, &mla_i64_i64_p50_ilp13, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 8, 13, "throughput", 1, 0.5, 615384},
+  {{ &setup, &mla_i64_i64_p50_ilp14, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 8, 14, "throughput", 1, 0.5, 571428},
+  {{ &setup, &mla_i64_i64_p50_ilp15, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 8, 15, "throughput", 1, 0.5, 533333},
+  {{ &setup, &mla_i64_i64_p50_ilp16, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector), 50% active lanes", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 8, 16, "throughput", 1, 0.5, 500000},
+  {{ &setup, &mla_i64_i64_p25_ilp1, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 4, 1, "throughput", 1, 0.25, 8000000},
+  {{ &setup, &mla_i64_i64_p25_ilp2, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 4, 2, "throughput", 1, 0.25, 4000000},
+  {{ &setup, &mla_i64_i64_p25_ilp3, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 4, 3, "throughput", 1, 0.25, 2666666},
+  {{ &setup, &mla_i64_i64_p25_ilp4, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 4, 4, "throughput", 1, 0.25, 2000000},
+  {{ &setup, &mla_i64_i64_p25_ilp5, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 4, 5, "throughput", 1, 0.25, 1600000},
+  {{ &setup, &mla_i64_i64_p25_ilp6, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 4, 6, "throughput", 1, 0.25, 1333333},
+  {{ &setup, &mla_i64_i64_p25_ilp7, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 4, 7, "throughput", 1, 0.25, 1142857},
+  {{ &setup, &mla_i64_i64_p25_ilp8, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 4, 8, "throughput", 1, 0.25, 1000000},
+  {{ &setup, &mla_i64_i64_p25_ilp9, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 4, 9, "throughput", 1, 0.25, 888888},
+  {{ &setup, &mla_i64_i64_p25_ilp10, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 4, 10, "throughput", 1, 0.25, 800000},
+  {{ &setup, &mla_i64_i64_p25_ilp11, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 4, 11, "throughput", 1, 0.25, 727272},
+  {{ &setup, &mla_i64_i64_p25_ilp12, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 4, 12, "throughput", 1, 0.25, 666666},
+  {{ &setup, &mla_i64_i64_p25_ilp13, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 4, 13, "throughput", 1, 0.25, 615384},
+  {{ &setup, &mla_i64_i64_p25_ilp14, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 4, 14, "throughput", 1, 0.25, 571428},
+  {{ &setup, &mla_i64_i64_p25_ilp15, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 4, 15, "throughput", 1, 0.25, 533333},
+  {{ &setup, &mla_i64_i64_p25_ilp16, &teardown }, "Multiply-Accumulate (integer)", "MLA (I64, one vector), 25% active lanes", "FEAT_SME", "z-register", "mla", "i64", 8, 1, "i64", 16, 2, 4, 16, "throughput", 1, 0.25, 500000},
+  {{ &setup, &smlal_za_i32_i16_vgx2_ilp1, &teardown }, "Multiply-Accumulate (integer)", "SMLAL (I16 to I32, two vectors)", "FEAT_SME2", "za-double-vector", "smlal", "i32", 64, 4, "i16", 128, 4, 128, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &smlal_za_i32_i16_vgx2_ilp2, &teardown }, "Multiply-Accumulate (integer)", "SMLAL (I16 to I32, two vectors)", "FEAT_SME2", "za-double-vector", "smlal", "i32", 64, 4, "i16", 128, 4, 128, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &smlal_za_i32_i16_vgx2_ilp3, &teardown }, "Multiply-Accumulate (integer)", "SMLAL (I16 to I32, two vectors)", "FEAT_SME2", "za-double-vector", "smlal", "i32", 64, 4, "i16", 128, 4, 128, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &smlal_za_i32_i16_vgx2_ilp4, &teardown }, "Multiply-Accumulate (integer)", "SMLAL (I16 to I32, two vectors)", "FEAT_SME2", "za-double-vector", "smlal", "i32", 64, 4, "i16", 128, 4, 128, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &smlal_za_i32_i16_vgx2_ilp5, &teardown }, "Multiply-Accumulate (integer)", "SMLAL (I16 to I32, two vectors)", "FEAT_SME2", "za-double-vector", "smlal", "i32", 64, 4, "i16", 128, 4, 128, 5, "throughput", 1, 1.0, 1600000},
+  {{ &setup, &smlal_za_i32_i16_vgx2_ilp6, &teardown }, "Multiply-Accumulate (integer)", "SMLAL (I16 to I32, two vectors)", "FEAT_SME2", "za-double-vector", "smlal", "i32", 64, 4, "i16", 128, 4, 128, 6, "throughput", 1, 1.0, 1333333},
+  {{ &setup, &smlal_za_i32_i16_vgx2_ilp7, &teardown }, "Multiply-Accumulate (integer)", "SMLAL (I16 to I32, two vectors)", "FEAT_SME2", "za-double-vector", "smlal", "i32", 64, 4, "i16", 128, 4, 128, 7, "throughput", 1, 1.0, 1142857},
+  {{ &setup, &smlal_za_i32_i16_vgx2_ilp8, &teardown }, "Multiply-Accumulate (integer)", "SMLAL (I16 to I32, two vectors)", "FEAT_SME2", "za-double-vector", "smlal", "i32", 64, 4, "i16", 128, 4, 128, 8, "throughput", 1, 1.0, 1000000},
+  {{ &setup, &smlal_za_i32_i16_vgx2_ilp9, &teardown }, "Multiply-Accumulate (integer)", "SMLAL (I16 to I32, two vectors)", "FEAT_SME2", "za-double-vector", "smlal", "i32", 64, 4, "i16", 128, 4, 128, 9, "throughput", 1, 1.0, 888888},
+  {{ &setup, &smlal_za_i32_i16_vgx2_ilp10, &teardown }, "Multiply-Accumulate (integer)", "SMLAL (I16 to I32, two vectors)", "FEAT_SME2", "za-double-vector", "smlal", "i32", 64, 4, "i16", 128, 4, 128, 10, "throughput", 1, 1.0, 800000},
+  {{ &setup, &smlal_za_i32_i16_vgx2_ilp11, &teardown }, "Multiply-Accumulate (integer)", "SMLAL (I16 to I32, two vectors)", "FEAT_SME2", "za-double-vector", "smlal", "i32", 64, 4, "i16", 128, 4, 128, 11, "throughput", 1, 1.0, 727272},
+  {{ &setup, &smlal_za_i32_i16_vgx2_ilp12, &teardown }, "Multiply-Accumulate (integer)", "SMLAL (I16 to I32, two vectors)", "FEAT_SME2", "za-double-vector", "smlal", "i32", 64, 4, "i16", 128, 4, 128, 12, "throughput", 1, 1.0, 666666},
+  {{ &setup, &smlal_za_i32_i16_vgx2_ilp13, &teardown }, "Multiply-Accumulate (integer)", "SMLAL (I16 to I32, two vectors)", "FEAT_SME2", "za-double-vector", "smlal", "i32", 64, 4, "i16", 128, 4, 128, 13, "throughput", 1, 1.0, 615384},
+  {{ &setup, &smlal_za_i32_i16_vgx2_ilp14, &teardown }, "Multiply-Accumulate (integer)", "SMLAL (I16 to I32, two vectors)", "FEAT_SME2", "za-double-vector", "smlal", "i32", 64, 4, "i16", 128, 4, 128, 14, "throughput", 1, 1.0, 571428},
+  {{ &setup, &smlal_za_i32_i16_vgx2_ilp15, &teardown }, "Multiply-Accumulate (integer)", "SMLAL (I16 to I32, two vectors)", "FEAT_SME2", "za-double-vector", "smlal", "i32", 64, 4, "i16", 128, 4, 128, 15, "throughput", 1, 1.0, 533333},
+  {{ &setup, &smlal_za_i32_i16_vgx2_ilp16, &teardown }, "Multiply-Accumulate (integer)", "SMLAL (I16 to I32, two vectors)", "FEAT_SME2", "za-double-vector", "smlal", "i32", 64, 4, "i16", 128, 4, 128, 16, "throughput", 1, 1.0, 500000},
+  {{ &setup, &smlal_za_i32_i16_vgx2_chain8_ilp1, &teardown }, "Multiply-Accumulate (integer)", "SMLAL (I16 to I32, two vectors)", "FEAT_SME2", "za-double-vector", "smlal", "i32", 64, 4, "i16", 128, 4, 128, 1, "latency", 8, 1.0, 1000000},
+  {{ &setup, &smlal_za_i32_i16_vgx2_chain8_ilp2, &teardown }, "Multiply-Accumulate (integer)", "SMLAL (I16 to I32, two vectors)", "FEAT_SME2", "za-double-vector", "smlal", "i32", 64, 4, "i16", 128, 4, 128, 2, "latency", 8, 1.0, 500000},
+  {{ &setup, &smlal_za_i32_i16_vgx4_ilp1, &teardown }, "Multiply-Accumulate (integer)", "SMLAL (I16 to I32, four vectors)", "FEAT_SME2", "za-double-vector", "smlal", "i32", 128, 8, "i16", 256, 8, 256, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &smlal_za_i32_i16_vgx4_ilp2, &teardown }, "Multiply-Accumulate (integer)", "SMLAL (I16 to I32, four vectors)", "FEAT_SME2", "za-double-vector", "smlal", "i32", 128, 8, "i16", 256, 8, 256, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &smlal_za_i32_i16_vgx4_ilp3, &teardown }, "Multiply-Accumulate (integer)", "SMLAL (I16 to I32, four vectors)", "FEAT_SME2", "za-double-vector", "smlal", "i32", 128, 8, "i16", 256, 8, 256, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &smlal_za_i32_i16_vgx4_ilp4, &teardown }, "Multiply-Accumulate (integer)", "SMLAL (I16 to I32, four vectors)", "FEAT_SME2", "za-double-vector", "smlal", "i32", 128, 8, "i16", 256, 8, 256, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &smlal_za_i32_i16_vgx4_ilp5, &teardown }, "Multiply-Accumulate (integer)", "SMLAL (I16 to I32, four vectors)", "FEAT_SME2", "za-double-vector", "smlal", "i32", 128, 8, "i16", 256, 8, 256, 5, "throughput", 1, 1.0, 1600000},
+  {{ &setup, &smlal_za_i32_i16_vgx4_ilp6, &teardown }, "Multiply-Accumulate (integer)", "SMLAL (I16 to I32, four vectors)", "FEAT_SME2", "za-double-vector", "smlal", "i32", 128, 8, "i16", 256, 8, 256, 6, "throughput", 1, 1.0, 1333333},
+  {{ &setup, &smlal_za_i32_i16_vgx4_ilp7, &teardown }, "Multiply-Accumulate (integer)", "SMLAL (I16 to I32, four vectors)", "FEAT_SME2", "za-double-vector", "smlal", "i32", 128, 8, "i16", 256, 8, 256, 7, "throughput", 1, 1.0, 1142857},
+  {{ &setup, &smlal_za_i32_i16_vgx4_ilp8, &teardown }, "Multiply-Accumulate (integer)", "SMLAL (I16 to I32, four vectors)", "FEAT_SME2", "za-double-vector", "smlal", "i32", 128, 8, "i16", 256, 8, 256, 8, "throughput", 1, 1.0, 1000000},
+  {{ &setup, &smlal_za_i32_i16_vgx4_chain8_ilp1, &teardown }, "Multiply-Accumulate (integer)", "SMLAL (I16 to I32, four vectors)", "FEAT_SME2", "za-double-vector", "smlal", "i32", 128, 8, "i16", 256, 8, 256, 1, "latency", 8, 1.0, 1000000},
+  {{ &setup, &smlal_za_i32_i16_vgx4_chain8_ilp2, &teardown }, "Multiply-Accumulate (integer)", "SMLAL (I16 to I32, four vectors)", "FEAT_SME2", "za-double-vector", "smlal", "i32", 128, 8, "i16", 256, 8, 256, 2, "latency", 8, 1.0, 500000},
+  {{ &setup, &smlall_za_i32_i8_vgx2_ilp1, &teardown }, "Multiply-Accumulate (integer)", "SMLALL (I8 to I32, two vectors)", "FEAT_SME2", "za-quad-vector", "smlall", "i32", 128, 8, "i8", 256, 4, 256, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &smlall_za_i32_i8_vgx2_ilp2, &teardown }, "Multiply-Accumulate (integer)", "SMLALL (I8 to I32, two vectors)", "FEAT_SME2", "za-quad-vector", "smlall", "i32", 128, 8, "i8", 256, 4, 256, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &smlall_za_i32_i8_vgx2_ilp3, &teardown }, "Multiply-Accumulate (integer)", "SMLALL (I8 to I32, two vectors)", "FEAT_SME2", "za-quad-vector", "smlall", "i32", 128, 8, "i8", 256, 4, 256, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &smlall_za_i32_i8_vgx2_ilp4, &teardown }, "Multiply-Accumulate (integer)", "SMLALL (I8 to I32, two vectors)", "FEAT_SME2", "za-quad-vector", "smlall", "i32", 128, 8, "i8", 256, 4, 256, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &smlall_za_i32_i8_vgx2_ilp5, &teardown }, "Multiply-Accumulate (integer)", "SMLALL (I8 to I32, two vectors)", "FEAT_SME2", "za-quad-vector", "smlall", "i32", 128, 8, "i8", 256, 4, 256, 5, "throughput", 1, 1.0, 1600000},
+  {{ &setup, &smlall_za_i32_i8_vgx2_ilp6, &teardown }, "Multiply-Accumulate (integer)", "SMLALL (I8 to I32, two vectors)", "FEAT_SME2", "za-quad-vector", "smlall", "i32", 128, 8, "i8", 256, 4, 256, 6, "throughput", 1, 1.0, 1333333},
+  {{ &setup, &smlall_za_i32_i8_vgx2_ilp7, &teardown }, "Multiply-Accumulate (integer)", "SMLALL (I8 to I32, two vectors)", "FEAT_SME2", "za-quad-vector", "smlall", "i32", 128, 8, "i8", 256, 4, 256, 7, "throughput", 1, 1.0, 1142857},
+  {{ &setup, &smlall_za_i32_i8_vgx2_ilp8, &teardown }, "Multiply-Accumulate (integer)", "SMLALL (I8 to I32, two vectors)", "FEAT_SME2", "za-quad-vector", "smlall", "i32", 128, 8, "i8", 256, 4, 256, 8, "throughput", 1, 1.0, 1000000},
+  {{ &setup, &smlall_za_i32_i8_vgx2_chain8_ilp1, &teardown }, "Multiply-Accumulate (integer)", "SMLALL (I8 to I32, two vectors)", "FEAT_SME2", "za-quad-vector", "smlall", "i32", 128, 8, "i8", 256, 4, 256, 1, "latency", 8, 1.0, 1000000},
+  {{ &setup, &smlall_za_i32_i8_vgx2_chain8_ilp2, &teardown }, "Multiply-Accumulate (integer)", "SMLALL (I8 to I32, two vectors)", "FEAT_SME2", "za-quad-vector", "smlall", "i32", 128, 8, "i8", 256, 4, 256, 2, "latency", 8, 1.0, 500000},
+  {{ &setup, &smlall_za_i32_i8_vgx4_ilp1, &teardown }, "Multiply-Accumulate (integer)", "SMLALL (I8 to I32, four vectors)", "FEAT_SME2", "za-quad-vector", "smlall", "i32", 256, 16, "i8", 512, 8, 512, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &smlall_za_i32_i8_vgx4_ilp2, &teardown }, "Multiply-Accumulate (integer)", "SMLALL (I8 to I32, four vectors)", "FEAT_SME2", "za-quad-vector", "smlall", "i32", 256, 16, "i8", 512, 8, 512, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &smlall_za_i32_i8_vgx4_ilp3, &teardown }, "Multiply-Accumulate (integer)", "SMLALL (I8 to I32, four vectors)", "FEAT_SME2", "za-quad-vector", "smlall", "i32", 256, 16, "i8", 512, 8, 512, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &smlall_za_i32_i8_vgx4_ilp4, &teardown }, "Multiply-Accumulate (integer)", "SMLALL (I8 to I32, four vectors)", "FEAT_SME2", "za-quad-vector", "smlall", "i32", 256, 16, "i8", 512, 8, 512, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &smlall_za_i32_i8_vgx4_chain8_ilp1, &teardown }, "Multiply-Accumulate (integer)", "SMLALL (I8 to I32, four vectors)", "FEAT_SME2", "za-quad-vector", "smlall", "i32", 256, 16, "i8", 512, 8, 512, 1, "latency", 8, 1.0, 1000000},
+  {{ &setup, &smlall_za_i32_i8_vgx4_chain8_ilp2, &teardown }, "Multiply-Accumulate (integer)", "SMLALL (I8 to I32, four vectors)", "FEAT_SME2", "za-quad-vector", "smlall", "i32", 256, 16, "i8", 512, 8, 512, 2, "latency", 8, 1.0, 500000},
+  {{ &setup, &smlall_za_i64_i16_vgx2_ilp1, &teardown }, "Multiply-Accumulate (integer)", "SMLALL (I16 to I64, two vectors)", "FEAT_SME2", "za-quad-vector", "smlall", "i64", 64, 8, "i16", 128, 4, 128, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &smlall_za_i64_i16_vgx2_ilp2, &teardown }, "Multiply-Accumulate (integer)", "SMLALL (I16 to I64, two vectors)", "FEAT_SME2", "za-quad-vector", "smlall", "i64", 64, 8, "i16", 128, 4, 128, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &smlall_za_i64_i16_vgx2_ilp3, &teardown }, "Multiply-Accumulate (integer)", "SMLALL (I16 to I64, two vectors)", "FEAT_SME2", "za-quad-vector", "smlall", "i64", 64, 8, "i16", 128, 4, 128, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &smlall_za_i64_i16_vgx2_ilp4, &teardown }, "Multiply-Accumulate (integer)", "SMLALL (I16 to I64, two vectors)", "FEAT_SME2", "za-quad-vector", "smlall", "i64", 64, 8, "i16", 128, 4, 128, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &smlall_za_i64_i16_vgx2_ilp5, &teardown }, "Multiply-Accumulate (integer)", "SMLALL (I16 to I64, two vectors)", "FEAT_SME2", "za-quad-vector", "smlall", "i64", 64, 8, "i16", 128, 4, 128, 5, "throughput", 1, 1.0, 1600000},
+  {{ &setup, &smlall_za_i64_i16_vgx2_ilp6, &teardown }, "Multiply-Accumulate (integer)", "SMLALL (I16 to I64, two vectors)", "FEAT_SME2", "za-quad-vector", "smlall", "i64", 64, 8, "i16", 128, 4, 128, 6, "throughput", 1, 1.0, 1333333},
+  {{ &setup, &smlall_za_i64_i16_vgx2_ilp7, &teardown }, "Multiply-Accumulate (integer)", "SMLALL (I16 to I64, two vectors)", "FEAT_SME2", "za-quad-vector", "smlall", "i64", 64, 8, "i16", 128, 4, 128, 7, "throughput", 1, 1.0, 1142857},
+  {{ &setup, &smlall_za_i64_i16_vgx2_ilp8, &teardown }, "Multiply-Accumulate (integer)", "SMLALL (I16 to I64, two vectors)", "FEAT_SME2", "za-quad-vector", "smlall", "i64", 64, 8, "i16", 128, 4, 128, 8, "throughput", 1, 1.0, 1000000},
+  {{ &setup, &smlall_za_i64_i16_vgx2_chain8_ilp1, &teardown }, "Multiply-Accumulate (integer)", "SMLALL (I16 to I64, two vectors)", "FEAT_SME2", "za-quad-vector", "smlall", "i64", 64, 8, "i16", 128, 4, 128, 1, "latency", 8, 1.0, 1000000},
+  {{ &setup, &smlall_za_i64_i16_vgx2_chain8_ilp2, &teardown }, "Multiply-Accumulate (integer)", "SMLALL (I16 to I64, two vectors)", "FEAT_SME2", "za-quad-vector", "smlall", "i64", 64, 8, "i16", 128, 4, 128, 2, "latency", 8, 1.0, 500000},
+  {{ &setup, &smlall_za_i64_i16_vgx4_ilp1, &teardown }, "Multiply-Accumulate (integer)", "SMLALL (I16 to I64, four vectors)", "FEAT_SME2", "za-quad-vector", "smlall", "i64", 128, 16, "i16", 256, 8, 256, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &smlall_za_i64_i16_vgx4_ilp2, &teardown }, "Multiply-Accumulate (integer)", "SMLALL (I16 to I64, four vectors)", "FEAT_SME2", "za-quad-vector", "smlall", "i64", 128, 16, "i16", 256, 8, 256, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &smlall_za_i64_i16_vgx4_ilp3, &teardown }, "Multiply-Accumulate (integer)", "SMLALL (I16 to I64, four vectors)", "FEAT_SME2", "za-quad-vector", "smlall", "i64", 128, 16, "i16", 256, 8, 256, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &smlall_za_i64_i16_vgx4_ilp4, &teardown }, "Multiply-Accumulate (integer)", "SMLALL (I16 to I64, four vectors)", "FEAT_SME2", "za-quad-vector", "smlall", "i64", 128, 16, "i16", 256, 8, 256, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &smlall_za_i64_i16_vgx4_chain8_ilp1, &teardown }, "Multiply-Accumulate (integer)", "SMLALL (I16 to I64, four vectors)", "FEAT_SME2", "za-quad-vector", "smlall", "i64", 128, 16, "i16", 256, 8, 256, 1, "latency", 8, 1.0, 1000000},
+  {{ &setup, &smlall_za_i64_i16_vgx4_chain8_ilp2, &teardown }, "Multiply-Accumulate (integer)", "SMLALL (I16 to I64, four vectors)", "FEAT_SME2", "za-quad-vector", "smlall", "i64", 128, 16, "i16", 256, 8, 256, 2, "latency", 8, 1.0, 500000},
+  {{ &setup, &fmopa_za_f16_f16_ilp1, &teardown }, "Outer Product (floating-point)", "FMOPA (FP16)", "FEAT_SME_F16F16", "za-tile", "fmopa", "f16", 1024, 32, "f16", 64, 2, 2048, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &fmopa_za_f16_f16_ilp2, &teardown }, "Outer Product (floating-point)", "FMOPA (FP16)", "FEAT_SME_F16F16", "za-tile", "fmopa", "f16", 1024, 32, "f16", 64, 2, 2048, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &fmopa_za_f16_f16_chain8_ilp1, &teardown }, "Outer Product (floating-point)", "FMOPA (FP16)", "FEAT_SME_F16F16", "za-tile", "fmopa", "f16", 1024, 32, "f16", 64, 2, 2048, 1, "latency", 8, 1.0, 1000000},
+  {{ &setup, &fmopa_za_f16_f16_chain8_ilp2, &teardown }, "Outer Product (floating-point)", "FMOPA (FP16)", "FEAT_SME_F16F16", "za-tile", "fmopa", "f16", 1024, 32, "f16", 64, 2, 2048, 2, "latency", 8, 1.0, 500000},
+  {{ &setup, &fmopa_za_f16_f16_p75_ilp1, &teardown }, "Outer Product (floating-point)", "FMOPA (FP16), 75% active lanes", "FEAT_SME_F16F16", "za-tile", "fmopa", "f16", 1024, 32, "f16", 64, 2, 1152, 1, "throughput", 1, 0.75, 8000000},
+  {{ &setup, &fmopa_za_f16_f16_p75_ilp2, &teardown }, "Outer Product (floating-point)", "FMOPA (FP16), 75% active lanes", "FEAT_SME_F16F16", "za-tile", "fmopa", "f16", 1024, 32, "f16", 64, 2, 1152, 2, "throughput", 1, 0.75, 4000000},
+  {{ &setup, &fmopa_za_f16_f16_p50_ilp1, &teardown }, "Outer Product (floating-point)", "FMOPA (FP16), 50% active lanes", "FEAT_SME_F16F16", "za-tile", "fmopa", "f16", 1024, 32, "f16", 64, 2, 512, 1, "throughput", 1, 0.5, 8000000},
+  {{ &setup, &fmopa_za_f16_f16_p50_ilp2, &teardown }, "Outer Product (floating-point)", "FMOPA (FP16), 50% active lanes", "FEAT_SME_F16F16", "za-tile", "fmopa", "f16", 1024, 32, "f16", 64, 2, 512, 2, "throughput", 1, 0.5, 4000000},
+  {{ &setup, &fmopa_za_f16_f16_p25_ilp1, &teardown }, "Outer Product (floating-point)", "FMOPA (FP16), 25% active lanes", "FEAT_SME_F16F16", "za-tile", "fmopa", "f16", 1024, 32, "f16", 64, 2, 128, 1, "throughput", 1, 0.25, 8000000},
+  {{ &setup, &fmopa_za_f16_f16_p25_ilp2, &teardown }, "Outer Product (floating-point)", "FMOPA (FP16), 25% active lanes", "FEAT_SME_F16F16", "za-tile", "fmopa", "f16", 1024, 32, "f16", 64, 2, 128, 2, "throughput", 1, 0.25, 4000000},
+  {{ &setup, &fmopa_za_f32_f32_ilp1, &teardown }, "Outer Product (floating-point)", "FMOPA (FP32)", "SME_F32F32", "za-tile", "fmopa", "f32", 256, 16, "f32", 32, 2, 512, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &fmopa_za_f32_f32_ilp2, &teardown }, "Outer Product (floating-point)", "FMOPA (FP32)", "SME_F32F32", "za-tile", "fmopa", "f32", 256, 16, "f32", 32, 2, 512, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &fmopa_za_f32_f32_ilp3, &teardown }, "Outer Product (floating-point)", "FMOPA (FP32)", "SME_F32F32", "za-tile", "fmopa", "f32", 256, 16, "f32", 32, 2, 512, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &fmopa_za_f32_f32_ilp4, &teardown }, "Outer Product (floating-point)", "FMOPA (FP32)", "SME_F32F32", "za-tile", "fmopa", "f32", 256, 16, "f32", 32, 2, 512, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &fmopa_za_f32_f32_chain8_ilp1, &teardown }, "Outer Product (floating-point)", "FMOPA (FP32)", "SME_F32F32", "za-tile", "fmopa", "f32", 256, 16, "f32", 32, 2, 512, 1, "latency", 8, 1.0, 1000000},
+  {{ &setup, &fmopa_za_f32_f32_chain8_ilp2, &teardown }, "Outer Product (floating-point)", "FMOPA (FP32)", "SME_F32F32", "za-tile", "fmopa", "f32", 256, 16, "f32", 32, 2, 512, 2, "latency", 8, 1.0, 500000},
+  {{ &setup, &fmopa_za_f32_f32_p75_ilp1, &teardown }, "Outer Product (floating-point)", "FMOPA (FP32), 75% active lanes", "SME_F32F32", "za-tile", "fmopa", "f32", 256, 16, "f32", 32, 2, 288, 1, "throughput", 1, 0.75, 8000000},
+  {{ &setup, &fmopa_za_f32_f32_p75_ilp2, &teardown }, "Outer Product (floating-point)", "FMOPA (FP32), 75% active lanes", "SME_F32F32", "za-tile", "fmopa", "f32", 256, 16, "f32", 32, 2, 288, 2, "throughput", 1, 0.75, 4000000},
+  {{ &setup, &fmopa_za_f32_f32_p75_ilp3, &teardown }, "Outer Product (floating-point)", "FMOPA (FP32), 75% active lanes", "SME_F32F32", "za-tile", "fmopa", "f32", 256, 16, "f32", 32, 2, 288, 3, "throughput", 1, 0.75, 2666666},
+  {{ &setup, &fmopa_za_f32_f32_p75_ilp4, &teardown }, "Outer Product (floating-point)", "FMOPA (FP32), 75% active lanes", "SME_F32F32", "za-tile", "fmopa", "f32", 256, 16, "f32", 32, 2, 288, 4, "throughput", 1, 0.75, 2000000},
+  {{ &setup, &fmopa_za_f32_f32_p50_ilp1, &teardown }, "Outer Product (floating-point)", "FMOPA (FP32), 50% active lanes", "SME_F32F32", "za-tile", "fmopa", "f32", 256, 16, "f32", 32, 2, 128, 1, "throughput", 1, 0.5, 8000000},
+  {{ &setup, &fmopa_za_f32_f32_p50_ilp2, &teardown }, "Outer Product (floating-point)", "FMOPA (FP32), 50% active lanes", "SME_F32F32", "za-tile", "fmopa", "f32", 256, 16, "f32", 32, 2, 128, 2, "throughput", 1, 0.5, 4000000},
+  {{ &setup, &fmopa_za_f32_f32_p50_ilp3, &teardown }, "Outer Product (floating-point)", "FMOPA (FP32), 50% active lanes", "SME_F32F32", "za-tile", "fmopa", "f32", 256, 16, "f32", 32, 2, 128, 3, "throughput", 1, 0.5, 2666666},
+  {{ &setup, &fmopa_za_f32_f32_p50_ilp4, &teardown }, "Outer Product (floating-point)", "FMOPA (FP32), 50% active lanes", "SME_F32F32", "za-tile", "fmopa", "f32", 256, 16, "f32", 32, 2, 128, 4, "throughput", 1, 0.5, 2000000},
+  {{ &setup, &fmopa_za_f32_f32_p25_ilp1, &teardown }, "Outer Product (floating-point)", "FMOPA (FP32), 25% active lanes", "SME_F32F32", "za-tile", "fmopa", "f32", 256, 16, "f32", 32, 2, 32, 1, "throughput", 1, 0.25, 8000000},
+  {{ &setup, &fmopa_za_f32_f32_p25_ilp2, &teardown }, "Outer Product (floating-point)", "FMOPA (FP32), 25% active lanes", "SME_F32F32", "za-tile", "fmopa", "f32", 256, 16, "f32", 32, 2, 32, 2, "throughput", 1, 0.25, 4000000},
+  {{ &setup, &fmopa_za_f32_f32_p25_ilp3, &teardown }, "Outer Product (floating-point)", "FMOPA (FP32), 25% active lanes", "SME_F32F32", "za-tile", "fmopa", "f32", 256, 16, "f32", 32, 2, 32, 3, "throughput", 1, 0.25, 2666666},
+  {{ &setup, &fmopa_za_f32_f32_p25_ilp4, &teardown }, "Outer Product (floating-point)", "FMOPA (FP32), 25% active lanes", "SME_F32F32", "za-tile", "fmopa", "f32", 256, 16, "f32", 32, 2, 32, 4, "throughput", 1, 0.25, 2000000},
+  {{ &setup, &fmopa_za_f64_f64_ilp1, &teardown }, "Outer Product (floating-point)", "FMOPA (FP64)", "FEAT_SME_F64F64", "za-tile", "fmopa", "f64", 64, 8, "f64", 16, 2, 128, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &fmopa_za_f64_f64_ilp2, &teardown }, "Outer Product (floating-point)", "FMOPA (FP64)", "FEAT_SME_F64F64", "za-tile", "fmopa", "f64", 64, 8, "f64", 16, 2, 128, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &fmopa_za_f64_f64_ilp3, &teardown }, "Outer Product (floating-point)", "FMOPA (FP64)", "FEAT_SME_F64F64", "za-tile", "fmopa", "f64", 64, 8, "f64", 16, 2, 128, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &fmopa_za_f64_f64_ilp4, &teardown }, "Outer Product (floating-point)", "FMOPA (FP64)", "FEAT_SME_F64F64", "za-tile", "fmopa", "f64", 64, 8, "f64", 16, 2, 128, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &fmopa_za_f64_f64_ilp5, &teardown }, "Outer Product (floating-point)", "FMOPA (FP64)", "FEAT_SME_F64F64", "za-tile", "fmopa", "f64", 64, 8, "f64", 16, 2, 128, 5, "throughput", 1, 1.0, 1600000},
+  {{ &setup, &fmopa_za_f64_f64_ilp6, &teardown }, "Outer Product (floating-point)", "FMOPA (FP64)", "FEAT_SME_F64F64", "za-tile", "fmopa", "f64", 64, 8, "f64", 16, 2, 128, 6, "throughput", 1, 1.0, 1333333},
+  {{ &setup, &fmopa_za_f64_f64_ilp7, &teardown }, "Outer Product (floating-point)", "FMOPA (FP64)", "FEAT_SME_F64F64", "za-tile", "fmopa", "f64", 64, 8, "f64", 16, 2, 128, 7, "throughput", 1, 1.0, 1142857},
+  {{ &setup, &fmopa_za_f64_f64_ilp8, &teardown }, "Outer Product (floating-point)", "FMOPA (FP64)", "FEAT_SME_F64F64", "za-tile", "fmopa", "f64", 64, 8, "f64", 16, 2, 128, 8, "throughput", 1, 1.0, 1000000},
+  {{ &setup, &fmopa_za_f64_f64_chain8_ilp1, &teardown }, "Outer Product (floating-point)", "FMOPA (FP64)", "FEAT_SME_F64F64", "za-tile", "fmopa", "f64", 64, 8, "f64", 16, 2, 128, 1, "latency", 8, 1.0, 1000000},
+  {{ &setup, &fmopa_za_f64_f64_chain8_ilp2, &teardown }, "Outer Product (floating-point)", "FMOPA (FP64)", "FEAT_SME_F64F64", "za-tile", "fmopa", "f64", 64, 8, "f64", 16, 2, 128, 2, "latency", 8, 1.0, 500000},
+  {{ &setup, &fmopa_za_f64_f64_p75_ilp1, &teardown }, "Outer Product (floating-point)", "FMOPA (FP64), 75% active lanes", "FEAT_SME_F64F64", "za-tile", "fmopa", "f64", 64, 8, "f64", 16, 2, 72, 1, "throughput", 1, 0.75, 8000000},
+  {{ &setup, &fmopa_za_f64_f64_p75_ilp2, &teardown }, "Outer Product (floating-point)", "FMOPA (FP64), 75% active lanes", "FEAT_SME_F64F64", "za-tile", "fmopa", "f64", 64, 8, "f64", 16, 2, 72, 2, "throughput", 1, 0.75, 4000000},
+  {{ &setup, &fmopa_za_f64_f64_p75_ilp3, &teardown }, "Outer Product (floating-point)", "FMOPA (FP64), 75% active lanes", "FEAT_SME_F64F64", "za-tile", "fmopa", "f64", 64, 8, "f64", 16, 2, 72, 3, "throughput", 1, 0.75, 2666666},
+  {{ &setup, &fmopa_za_f64_f64_p75_ilp4, &teardown }, "Outer Product (floating-point)", "FMOPA (FP64), 75% active lanes", "FEAT_SME_F64F64", "za-tile", "fmopa", "f64", 64, 8, "f64", 16, 2, 72, 4, "throughput", 1, 0.75, 2000000},
+  {{ &setup, &fmopa_za_f64_f64_p75_ilp5, &teardown }, "Outer Product (floating-point)", "FMOPA (FP64), 75% active lanes", "FEAT_SME_F64F64", "za-tile", "fmopa", "f64", 64, 8, "f64", 16, 2, 72, 5, "throughput", 1, 0.75, 1600000},
+  {{ &setup, &fmopa_za_f64_f64_p75_ilp6, &teardown }, "Outer Product (floating-point)", "FMOPA (FP64), 75% active lanes", "FEAT_SME_F64F64", "za-tile", "fmopa", "f64", 64, 8, "f64", 16, 2, 72, 6, "throughput", 1, 0.75, 1333333},
+  {{ &setup, &fmopa_za_f64_f64_p75_ilp7, &teardown }, "Outer Product (floating-point)", "FMOPA (FP64), 75% active lanes", "FEAT_SME_F64F64", "za-tile", "fmopa", "f64", 64, 8, "f64", 16, 2, 72, 7, "throughput", 1, 0.75, 1142857},
+  {{ &setup, &fmopa_za_f64_f64_p75_ilp8, &teardown }, "Outer Product (floating-point)", "FMOPA (FP64), 75% active lanes", "FEAT_SME_F64F64", "za-tile", "fmopa", "f64", 64, 8, "f64", 16, 2, 72, 8, "throughput", 1, 0.75, 1000000},
+  {{ &setup, &fmopa_za_f64_f64_p50_ilp1, &teardown }, "Outer Product (floating-point)", "FMOPA (FP64), 50% active lanes", "FEAT_SME_F64F64", "za-tile", "fmopa", "f64", 64, 8, "f64", 16, 2, 32, 1, "throughput", 1, 0.5, 8000000},
+  {{ &setup, &fmopa_za_f64_f64_p50_ilp2, &teardown }, "Outer Product (floating-point)", "FMOPA (FP64), 50% active lanes", "FEAT_SME_F64F64", "za-tile", "fmopa", "f64", 64, 8, "f64", 16, 2, 32, 2, "throughput", 1, 0.5, 4000000},
+  {{ &setup, &fmopa_za_f64_f64_p50_ilp3, &teardown }, "Outer Product (floating-point)", "FMOPA (FP64), 50% active lanes", "FEAT_SME_F64F64", "za-tile", "fmopa", "f64", 64, 8, "f64", 16, 2, 32, 3, "throughput", 1, 0.5, 2666666},
+  {{ &setup, &fmopa_za_f64_f64_p50_ilp4, &teardown }, "Outer Product (floating-point)", "FMOPA (FP64), 50% active lanes", "FEAT_SME_F64F64", "za-tile", "fmopa", "f64", 64, 8, "f64", 16, 2, 32, 4, "throughput", 1, 0.5, 2000000},
+  {{ &setup, &fmopa_za_f64_f64_p50_ilp5, &teardown }, "Outer Product (floating-point)", "FMOPA (FP64), 50% active lanes", "FEAT_SME_F64F64", "za-tile", "fmopa", "f64", 64, 8, "f64", 16, 2, 32, 5, "throughput", 1, 0.5, 1600000},
+  {{ &setup, &fmopa_za_f64_f64_p50_ilp6, &teardown }, "Outer Product (floating-point)", "FMOPA (FP64), 50% active lanes", "FEAT_SME_F64F64", "za-tile", "fmopa", "f64", 64, 8, "f64", 16, 2, 32, 6, "throughput", 1, 0.5, 1333333},
+  {{ &setup, &fmopa_za_f64_f64_p50_ilp7, &teardown }, "Outer Product (floating-point)", "FMOPA (FP64), 50% active lanes", "FEAT_SME_F64F64", "za-tile", "fmopa", "f64", 64, 8, "f64", 16, 2, 32, 7, "throughput", 1, 0.5, 1142857},
+  {{ &setup, &fmopa_za_f64_f64_p50_ilp8, &teardown }, "Outer Product (floating-point)", "FMOPA (FP64), 50% active lanes", "FEAT_SME_F64F64", "za-tile", "fmopa", "f64", 64, 8, "f64", 16, 2, 32, 8, "throughput", 1, 0.5, 1000000},
+  {{ &setup, &fmopa_za_f64_f64_p25_ilp1, &teardown }, "Outer Product (floating-point)", "FMOPA (FP64), 25% active lanes", "FEAT_SME_F64F64", "za-tile", "fmopa", "f64", 64, 8, "f64", 16, 2, 8, 1, "throughput", 1, 0.25, 8000000},
+  {{ &setup, &fmopa_za_f64_f64_p25_ilp2, &teardown }, "Outer Product (floating-point)", "FMOPA (FP64), 25% active lanes", "FEAT_SME_F64F64", "za-tile", "fmopa", "f64", 64, 8, "f64", 16, 2, 8, 2, "throughput", 1, 0.25, 4000000},
+  {{ &setup, &fmopa_za_f64_f64_p25_ilp3, &teardown }, "Outer Product (floating-point)", "FMOPA (FP64), 25% active lanes", "FEAT_SME_F64F64", "za-tile", "fmopa", "f64", 64, 8, "f64", 16, 2, 8, 3, "throughput", 1, 0.25, 2666666},
+  {{ &setup, &fmopa_za_f64_f64_p25_ilp4, &teardown }, "Outer Product (floating-point)", "FMOPA (FP64), 25% active lanes", "FEAT_SME_F64F64", "za-tile", "fmopa", "f64", 64, 8, "f64", 16, 2, 8, 4, "throughput", 1, 0.25, 2000000},
+  {{ &setup, &fmopa_za_f64_f64_p25_ilp5, &teardown }, "Outer Product (floating-point)", "FMOPA (FP64), 25% active lanes", "FEAT_SME_F64F64", "za-tile", "fmopa", "f64", 64, 8, "f64", 16, 2, 8, 5, "throughput", 1, 0.25, 1600000},
+  {{ &setup, &fmopa_za_f64_f64_p25_ilp6, &teardown }, "Outer Product (floating-point)", "FMOPA (FP64), 25% active lanes", "FEAT_SME_F64F64", "za-tile", "fmopa", "f64", 64, 8, "f64", 16, 2, 8, 6, "throughput", 1, 0.25, 1333333},
+  {{ &setup, &fmopa_za_f64_f64_p25_ilp7, &teardown }, "Outer Product (floating-point)", "FMOPA (FP64), 25% active lanes", "FEAT_SME_F64F64", "za-tile", "fmopa", "f64", 64, 8, "f64", 16, 2, 8, 7, "throughput", 1, 0.25, 1142857},
+  {{ &setup, &fmopa_za_f64_f64_p25_ilp8, &teardown }, "Outer Product (floating-point)", "FMOPA (FP64), 25% active lanes", "FEAT_SME_F64F64", "za-tile", "fmopa", "f64", 64, 8, "f64", 16, 2, 8, 8, "throughput", 1, 0.25, 1000000},
+  {{ &setup, &fmopa_za_f32_f16_ilp1, &teardown }, "Outer Product (floating-point)", "FMOPA (FP16 into FP32, 2-way)", "SME_F16F32", "za-tile", "fmopa", "f32", 256, 16, "f16", 64, 2, 1024, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &fmopa_za_f32_f16_ilp2, &teardown }, "Outer Product (floating-point)", "FMOPA (FP16 into FP32, 2-way)", "SME_F16F32", "za-tile", "fmopa", "f32", 256, 16, "f16", 64, 2, 1024, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &fmopa_za_f32_f16_ilp3, &teardown }, "Outer Product (floating-point)", "FMOPA (FP16 into FP32, 2-way)", "SME_F16F32", "za-tile", "fmopa", "f32", 256, 16, "f16", 64, 2, 1024, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &fmopa_za_f32_f16_ilp4, &teardown }, "Outer Product (floating-point)", "FMOPA (FP16 into FP32, 2-way)", "SME_F16F32", "za-tile", "fmopa", "f32", 256, 16, "f16", 64, 2, 1024, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &fmopa_za_f32_f16_chain8_ilp1, &teardown }, "Outer Product (floating-point)", "FMOPA (FP16 into FP32, 2-way)", "SME_F16F32", "za-tile", "fmopa", "f32", 256, 16, "f16", 64, 2, 1024, 1, "latency", 8, 1.0, 1000000},
+  {{ &setup, &fmopa_za_f32_f16_chain8_ilp2, &teardown }, "Outer Product (floating-point)", "FMOPA (FP16 into FP32, 2-way)", "SME_F16F32", "za-tile", "fmopa", "f32", 256, 16, "f16", 64, 2, 1024, 2, "latency", 8, 1.0, 500000},
+  {{ &setup, &fmopa_za_f32_f16_p75_ilp1, &teardown }, "Outer Product (floating-point)", "FMOPA (FP16 into FP32, 2-way), 75% active lanes", "SME_F16F32", "za-tile", "fmopa", "f32", 256, 16, "f16", 64, 2, 576, 1, "throughput", 1, 0.75, 8000000},
+  {{ &setup, &fmopa_za_f32_f16_p75_ilp2, &teardown }, "Outer Product (floating-point)", "FMOPA (FP16 into FP32, 2-way), 75% active lanes", "SME_F16F32", "za-tile", "fmopa", "f32", 256, 16, "f16", 64, 2, 576, 2, "throughput", 1, 0.75, 4000000},
+  {{ &setup, &fmopa_za_f32_f16_p75_ilp3, &teardown }, "Outer Product (floating-point)", "FMOPA (FP16 into FP32, 2-way), 75% active lanes", "SME_F16F32", "za-tile", "fmopa", "f32", 256, 16, "f16", 64, 2, 576, 3, "throughput", 1, 0.75, 2666666},
+  {{ &setup, &fmopa_za_f32_f16_p75_ilp4, &teardown }, "Outer Product (floating-point)", "FMOPA (FP16 into FP32, 2-way), 75% active lanes", "SME_F16F32", "za-tile", "fmopa", "f32", 256, 16, "f16", 64, 2, 576, 4, "throughput", 1, 0.75, 2000000},
+  {{ &setup, &fmopa_za_f32_f16_p50_ilp1, &teardown }, "Outer Product (floating-point)", "FMOPA (FP16 into FP32, 2-way), 50% active lanes", "SME_F16F32", "za-tile", "fmopa", "f32", 256, 16, "f16", 64, 2, 256, 1, "throughput", 1, 0.5, 8000000},
+  {{ &setup, &fmopa_za_f32_f16_p50_ilp2, &teardown }, "Outer Product (floating-point)", "FMOPA (FP16 into FP32, 2-way), 50% active lanes", "SME_F16F32", "za-tile", "fmopa", "f32", 256, 16, "f16", 64, 2, 256, 2, "throughput", 1, 0.5, 4000000},
+  {{ &setup, &fmopa_za_f32_f16_p50_ilp3, &teardown }, "Outer Product (floating-point)", "FMOPA (FP16 into FP32, 2-way), 50% active lanes", "SME_F16F32", "za-tile", "fmopa", "f32", 256, 16, "f16", 64, 2, 256, 3, "throughput", 1, 0.5, 2666666},
+  {{ &setup, &fmopa_za_f32_f16_p50_ilp4, &teardown }, "Outer Product (floating-point)", "FMOPA (FP16 into FP32, 2-way), 50% active lanes", "SME_F16F32", "za-tile", "fmopa", "f32", 256, 16, "f16", 64, 2, 256, 4, "throughput", 1, 0.5, 2000000},
+  {{ &setup, &fmopa_za_f32_f16_p25_ilp1, &teardown }, "Outer Product (floating-point)", "FMOPA (FP16 into FP32, 2-way), 25% active lanes", "SME_F16F32", "za-tile", "fmopa", "f32", 256, 16, "f16", 64, 2, 64, 1, "throughput", 1, 0.25, 8000000},
+  {{ &setup, &fmopa_za_f32_f16_p25_ilp2, &teardown }, "Outer Product (floating-point)", "FMOPA (FP16 into FP32, 2-way), 25% active lanes", "SME_F16F32", "za-tile", "fmopa", "f32", 256, 16, "f16", 64, 2, 64, 2, "throughput", 1, 0.25, 4000000},
+  {{ &setup, &fmopa_za_f32_f16_p25_ilp3, &teardown }, "Outer Product (floating-point)", "FMOPA (FP16 into FP32, 2-way), 25% active lanes", "SME_F16F32", "za-tile", "fmopa", "f32", 256, 16, "f16", 64, 2, 64, 3, "throughput", 1, 0.25, 2666666},
+  {{ &setup, &fmopa_za_f32_f16_p25_ilp4, &teardown }, "Outer Product (floating-point)", "FMOPA (FP16 into FP32, 2-way), 25% active lanes", "SME_F16F32", "za-tile", "fmopa", "f32", 256, 16, "f16", 64, 2, 64, 4, "throughput", 1, 0.25, 2000000},
+  {{ &setup, &bfmopa_za_f32_b16_ilp1, &teardown }, "Outer Product (floating-point)", "BFMOPA (BF16 into FP32, 2-way)", "SME_B16F32", "za-tile", "bfmopa", "f32", 256, 16, "b16", 64, 2, 1024, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &bfmopa_za_f32_b16_ilp2, &teardown }, "Outer Product (floating-point)", "BFMOPA (BF16 into FP32, 2-way)", "SME_B16F32", "za-tile", "bfmopa", "f32", 256, 16, "b16", 64, 2, 1024, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &bfmopa_za_f32_b16_ilp3, &teardown }, "Outer Product (floating-point)", "BFMOPA (BF16 into FP32, 2-way)", "SME_B16F32", "za-tile", "bfmopa", "f32", 256, 16, "b16", 64, 2, 1024, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &bfmopa_za_f32_b16_ilp4, &teardown }, "Outer Product (floating-point)", "BFMOPA (BF16 into FP32, 2-way)", "SME_B16F32", "za-tile", "bfmopa", "f32", 256, 16, "b16", 64, 2, 1024, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &bfmopa_za_f32_b16_chain8_ilp1, &teardown }, "Outer Product (floating-point)", "BFMOPA (BF16 into FP32, 2-way)", "SME_B16F32", "za-tile", "bfmopa", "f32", 256, 16, "b16", 64, 2, 1024, 1, "latency", 8, 1.0, 1000000},
+  {{ &setup, &bfmopa_za_f32_b16_chain8_ilp2, &teardown }, "Outer Product (floating-point)", "BFMOPA (BF16 into FP32, 2-way)", "SME_B16F32", "za-tile", "bfmopa", "f32", 256, 16, "b16", 64, 2, 1024, 2, "latency", 8, 1.0, 500000},
+  {{ &setup, &bfmopa_za_f32_b16_p75_ilp1, &teardown }, "Outer Product (floating-point)", "BFMOPA (BF16 into FP32, 2-way), 75% active lanes", "SME_B16F32", "za-tile", "bfmopa", "f32", 256, 16, "b16", 64, 2, 576, 1, "throughput", 1, 0.75, 8000000},
+  {{ &setup, &bfmopa_za_f32_b16_p75_ilp2, &teardown }, "Outer Product (floating-point)", "BFMOPA (BF16 into FP32, 2-way), 75% active lanes", "SME_B16F32", "za-tile", "bfmopa", "f32", 256, 16, "b16", 64, 2, 576, 2, "throughput", 1, 0.75, 4000000},
+  {{ &setup, &bfmopa_za_f32_b16_p75_ilp3, &teardown }, "Outer Product (floating-point)", "BFMOPA (BF16 into FP32, 2-way), 75% active lanes", "SME_B16F32", "za-tile", "bfmopa", "f32", 256, 16, "b16", 64, 2, 576, 3, "throughput", 1, 0.75, 2666666},
+  {{ &setup, &bfmopa_za_f32_b16_p75_ilp4, &teardown }, "Outer Product (floating-point)", "BFMOPA (BF16 into FP32, 2-way), 75% active lanes", "SME_B16F32", "za-tile", "bfmopa", "f32", 256, 16, "b16", 64, 2, 576, 4, "throughput", 1, 0.75, 2000000},
+  {{ &setup, &bfmopa_za_f32_b16_p50_ilp1, &teardown }, "Outer Product (floating-point)", "BFMOPA (BF16 into FP32, 2-way), 50% active lanes", "SME_B16F32", "za-tile", "bfmopa", "f32", 256, 16, "b16", 64, 2, 256, 1, "throughput", 1, 0.5, 8000000},
+  {{ &setup, &bfmopa_za_f32_b16_p50_ilp2, &teardown }, "Outer Product (floating-point)", "BFMOPA (BF16 into FP32, 2-way), 50% active lanes", "SME_B16F32", "za-tile", "bfmopa", "f32", 256, 16, "b16", 64, 2, 256, 2, "throughput", 1, 0.5, 4000000},
+  {{ &setup, &bfmopa_za_f32_b16_p50_ilp3, &teardown }, "Outer Product (floating-point)", "BFMOPA (BF16 into FP32, 2-way), 50% active lanes", "SME_B16F32", "za-tile", "bfmopa", "f32", 256, 16, "b16", 64, 2, 256, 3, "throughput", 1, 0.5, 2666666},
+  {{ &setup, &bfmopa_za_f32_b16_p50_ilp4, &teardown }, "Outer Product (floating-point)", "BFMOPA (BF16 into FP32, 2-way), 50% active lanes", "SME_B16F32", "za-tile", "bfmopa", "f32", 256, 16, "b16", 64, 2, 256, 4, "throughput", 1, 0.5, 2000000},
+  {{ &setup, &bfmopa_za_f32_b16_p25_ilp1, &teardown }, "Outer Product (floating-point)", "BFMOPA (BF16 into FP32, 2-way), 25% active lanes", "SME_B16F32", "za-tile", "bfmopa", "f32", 256, 16, "b16", 64, 2, 64, 1, "throughput", 1, 0.25, 8000000},
+  {{ &setup, &bfmopa_za_f32_b16_p25_ilp2, &teardown }, "Outer Product (floating-point)", "BFMOPA (BF16 into FP32, 2-way), 25% active lanes", "SME_B16F32", "za-tile", "bfmopa", "f32", 256, 16, "b16", 64, 2, 64, 2, "throughput", 1, 0.25, 4000000},
+  {{ &setup, &bfmopa_za_f32_b16_p25_ilp3, &teardown }, "Outer Product (floating-point)", "BFMOPA (BF16 into FP32, 2-way), 25% active lanes", "SME_B16F32", "za-tile", "bfmopa", "f32", 256, 16, "b16", 64, 2, 64, 3, "throughput", 1, 0.25, 2666666},
+  {{ &setup, &bfmopa_za_f32_b16_p25_ilp4, &teardown }, "Outer Product (floating-point)", "BFMOPA (BF16 into FP32, 2-way), 25% active lanes", "SME_B16F32", "za-tile", "bfmopa", "f32", 256, 16, "b16", 64, 2, 64, 4, "throughput", 1, 0.25, 2000000},
+  {{ &setup, &smopa_za_i32_i16_ilp1, &teardown }, "Outer Product (integer)", "SMOPA (I16 into I32, 2-way)", "SME_I16I32", "za-tile", "smopa", "i32", 256, 16, "i16", 64, 2, 1024, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &smopa_za_i32_i16_ilp2, &teardown }, "Outer Product (integer)", "SMOPA (I16 into I32, 2-way)", "SME_I16I32", "za-tile", "smopa", "i32", 256, 16, "i16", 64, 2, 1024, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &smopa_za_i32_i16_ilp3, &teardown }, "Outer Product (integer)", "SMOPA (I16 into I32, 2-way)", "SME_I16I32", "za-tile", "smopa", "i32", 256, 16, "i16", 64, 2, 1024, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &smopa_za_i32_i16_ilp4, &teardown }, "Outer Product (integer)", "SMOPA (I16 into I32, 2-way)", "SME_I16I32", "za-tile", "smopa", "i32", 256, 16, "i16", 64, 2, 1024, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &smopa_za_i32_i16_chain8_ilp1, &teardown }, "Outer Product (integer)", "SMOPA (I16 into I32, 2-way)", "SME_I16I32", "za-tile", "smopa", "i32", 256, 16, "i16", 64, 2, 1024, 1, "latency", 8, 1.0, 1000000},
+  {{ &setup, &smopa_za_i32_i16_chain8_ilp2, &teardown }, "Outer Product (integer)", "SMOPA (I16 into I32, 2-way)", "SME_I16I32", "za-tile", "smopa", "i32", 256, 16, "i16", 64, 2, 1024, 2, "latency", 8, 1.0, 500000},
+  {{ &setup, &smopa_za_i32_i16_p75_ilp1, &teardown }, "Outer Product (integer)", "SMOPA (I16 into I32, 2-way), 75% active lanes", "SME_I16I32", "za-tile", "smopa", "i32", 256, 16, "i16", 64, 2, 576, 1, "throughput", 1, 0.75, 8000000},
+  {{ &setup, &smopa_za_i32_i16_p75_ilp2, &teardown }, "Outer Product (integer)", "SMOPA (I16 into I32, 2-way), 75% active lanes", "SME_I16I32", "za-tile", "smopa", "i32", 256, 16, "i16", 64, 2, 576, 2, "throughput", 1, 0.75, 4000000},
+  {{ &setup, &smopa_za_i32_i16_p75_ilp3, &teardown }, "Outer Product (integer)", "SMOPA (I16 into I32, 2-way), 75% active lanes", "SME_I16I32", "za-tile", "smopa", "i32", 256, 16, "i16", 64, 2, 576, 3, "throughput", 1, 0.75, 2666666},
+  {{ &setup, &smopa_za_i32_i16_p75_ilp4, &teardown }, "Outer Product (integer)", "SMOPA (I16 into I32, 2-way), 75% active lanes", "SME_I16I32", "za-tile", "smopa", "i32", 256, 16, "i16", 64, 2, 576, 4, "throughput", 1, 0.75, 2000000},
+  {{ &setup, &smopa_za_i32_i16_p50_ilp1, &teardown }, "Outer Product (integer)", "SMOPA (I16 into I32, 2-way), 50% active lanes", "SME_I16I32", "za-tile", "smopa", "i32", 256, 16, "i16", 64, 2, 256, 1, "throughput", 1, 0.5, 8000000},
+  {{ &setup, &smopa_za_i32_i16_p50_ilp2, &teardown }, "Outer Product (integer)", "SMOPA (I16 into I32, 2-way), 50% active lanes", "SME_I16I32", "za-tile", "smopa", "i32", 256, 16, "i16", 64, 2, 256, 2, "throughput", 1, 0.5, 4000000},
+  {{ &setup, &smopa_za_i32_i16_p50_ilp3, &teardown }, "Outer Product (integer)", "SMOPA (I16 into I32, 2-way), 50% active lanes", "SME_I16I32", "za-tile", "smopa", "i32", 256, 16, "i16", 64, 2, 256, 3, "throughput", 1, 0.5, 2666666},
+  {{ &setup, &smopa_za_i32_i16_p50_ilp4, &teardown }, "Outer Product (integer)", "SMOPA (I16 into I32, 2-way), 50% active lanes", "SME_I16I32", "za-tile", "smopa", "i32", 256, 16, "i16", 64, 2, 256, 4, "throughput", 1, 0.5, 2000000},
+  {{ &setup, &smopa_za_i32_i16_p25_ilp1, &teardown }, "Outer Product (integer)", "SMOPA (I16 into I32, 2-way), 25% active lanes", "SME_I16I32", "za-tile", "smopa", "i32", 256, 16, "i16", 64, 2, 64, 1, "throughput", 1, 0.25, 8000000},
+  {{ &setup, &smopa_za_i32_i16_p25_ilp2, &teardown }, "Outer Product (integer)", "SMOPA (I16 into I32, 2-way), 25% active lanes", "SME_I16I32", "za-tile", "smopa", "i32", 256, 16, "i16", 64, 2, 64, 2, "throughput", 1, 0.25, 4000000},
+  {{ &setup, &smopa_za_i32_i16_p25_ilp3, &teardown }, "Outer Product (integer)", "SMOPA (I16 into I32, 2-way), 25% active lanes", "SME_I16I32", "za-tile", "smopa", "i32", 256, 16, "i16", 64, 2, 64, 3, "throughput", 1, 0.25, 2666666},
+  {{ &setup, &smopa_za_i32_i16_p25_ilp4, &teardown }, "Outer Product (integer)", "SMOPA (I16 into I32, 2-way), 25% active lanes", "SME_I16I32", "za-tile", "smopa", "i32", 256, 16, "i16", 64, 2, 64, 4, "throughput", 1, 0.25, 2000000},
+  {{ &setup, &smopa_za_i32_i8_ilp1, &teardown }, "Outer Product (integer)", "SMOPA (I8 into I32, 4-way)", "SME_I8I32", "za-tile", "smopa", "i32", 256, 16, "i8", 128, 2, 2048, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &smopa_za_i32_i8_ilp2, &teardown }, "Outer Product (integer)", "SMOPA (I8 into I32, 4-way)", "SME_I8I32", "za-tile", "smopa", "i32", 256, 16, "i8", 128, 2, 2048, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &smopa_za_i32_i8_ilp3, &teardown }, "Outer Product (integer)", "SMOPA (I8 into I32, 4-way)", "SME_I8I32", "za-tile", "smopa", "i32", 256, 16, "i8", 128, 2, 2048, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &smopa_za_i32_i8_ilp4, &teardown }, "Outer Product (integer)", "SMOPA (I8 into I32, 4-way)", "SME_I8I32", "za-tile", "smopa", "i32", 256, 16, "i8", 128, 2, 2048, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &smopa_za_i32_i8_chain8_ilp1, &teardown }, "Outer Product (integer)", "SMOPA (I8 into I32, 4-way)", "SME_I8I32", "za-tile", "smopa", "i32", 256, 16, "i8", 128, 2, 2048, 1, "latency", 8, 1.0, 1000000},
+  {{ &setup, &smopa_za_i32_i8_chain8_ilp2, &teardown }, "Outer Product (integer)", "SMOPA (I8 into I32, 4-way)", "SME_I8I32", "za-tile", "smopa", "i32", 256, 16, "i8", 128, 2, 2048, 2, "latency", 8, 1.0, 500000},
+  {{ &setup, &smopa_za_i32_i8_p75_ilp1, &teardown }, "Outer Product (integer)", "SMOPA (I8 into I32, 4-way), 75% active lanes", "SME_I8I32", "za-tile", "smopa", "i32", 256, 16, "i8", 128, 2, 1152, 1, "throughput", 1, 0.75, 8000000},
+  {{ &setup, &smopa_za_i32_i8_p75_ilp2, &teardown }, "Outer Product (integer)", "SMOPA (I8 into I32, 4-way), 75% active lanes", "SME_I8I32", "za-tile", "smopa", "i32", 256, 16, "i8", 128, 2, 1152, 2, "throughput", 1, 0.75, 4000000},
+  {{ &setup, &smopa_za_i32_i8_p75_ilp3, &teardown }, "Outer Product (integer)", "SMOPA (I8 into I32, 4-way), 75% active lanes", "SME_I8I32", "za-tile", "smopa", "i32", 256, 16, "i8", 128, 2, 1152, 3, "throughput", 1, 0.75, 2666666},
+  {{ &setup, &smopa_za_i32_i8_p75_ilp4, &teardown }, "Outer Product (integer)", "SMOPA (I8 into I32, 4-way), 75% active lanes", "SME_I8I32", "za-tile", "smopa", "i32", 256, 16, "i8", 128, 2, 1152, 4, "throughput", 1, 0.75, 2000000},
+  {{ &setup, &smopa_za_i32_i8_p50_ilp1, &teardown }, "Outer Product (integer)", "SMOPA (I8 into I32, 4-way), 50% active lanes", "SME_I8I32", "za-tile", "smopa", "i32", 256, 16, "i8", 128, 2, 512, 1, "throughput", 1, 0.5, 8000000},
+  {{ &setup, &smopa_za_i32_i8_p50_ilp2, &teardown }, "Outer Product (integer)", "SMOPA (I8 into I32, 4-way), 50% active lanes", "SME_I8I32", "za-tile", "smopa", "i32", 256, 16, "i8", 128, 2, 512, 2, "throughput", 1, 0.5, 4000000},
+  {{ &setup, &smopa_za_i32_i8_p50_ilp3, &teardown }, "Outer Product (integer)", "SMOPA (I8 into I32, 4-way), 50% active lanes", "SME_I8I32", "za-tile", "smopa", "i32", 256, 16, "i8", 128, 2, 512, 3, "throughput", 1, 0.5, 2666666},
+  {{ &setup, &smopa_za_i32_i8_p50_ilp4, &teardown }, "Outer Product (integer)", "SMOPA (I8 into I32, 4-way), 50% active lanes", "SME_I8I32", "za-tile", "smopa", "i32", 256, 16, "i8", 128, 2, 512, 4, "throughput", 1, 0.5, 2000000},
+  {{ &setup, &smopa_za_i32_i8_p25_ilp1, &teardown }, "Outer Product (integer)", "SMOPA (I8 into I32, 4-way), 25% active lanes", "SME_I8I32", "za-tile", "smopa", "i32", 256, 16, "i8", 128, 2, 128, 1, "throughput", 1, 0.25, 8000000},
+  {{ &setup, &smopa_za_i32_i8_p25_ilp2, &teardown }, "Outer Product (integer)", "SMOPA (I8 into I32, 4-way), 25% active lanes", "SME_I8I32", "za-tile", "smopa", "i32", 256, 16, "i8", 128, 2, 128, 2, "throughput", 1, 0.25, 4000000},
+  {{ &setup, &smopa_za_i32_i8_p25_ilp3, &teardown }, "Outer Product (integer)", "SMOPA (I8 into I32, 4-way), 25% active lanes", "SME_I8I32", "za-tile", "smopa", "i32", 256, 16, "i8", 128, 2, 128, 3, "throughput", 1, 0.25, 2666666},
+  {{ &setup, &smopa_za_i32_i8_p25_ilp4, &teardown }, "Outer Product (integer)", "SMOPA (I8 into I32, 4-way), 25% active lanes", "SME_I8I32", "za-tile", "smopa", "i32", 256, 16, "i8", 128, 2, 128, 4, "throughput", 1, 0.25, 2000000},
+  {{ &setup, &smopa_za_i64_i16_ilp1, &teardown }, "Outer Product (integer)", "SMOPA (I16 into I64, 4-way)", "FEAT_SME_I16I64", "za-tile", "smopa", "i64", 64, 8, "i16", 64, 2, 512, 1, "throughput", 1, 1.0, 8000000},
+  {{ &setup, &smopa_za_i64_i16_ilp2, &teardown }, "Outer Product (integer)", "SMOPA (I16 into I64, 4-way)", "FEAT_SME_I16I64", "za-tile", "smopa", "i64", 64, 8, "i16", 64, 2, 512, 2, "throughput", 1, 1.0, 4000000},
+  {{ &setup, &smopa_za_i64_i16_ilp3, &teardown }, "Outer Product (integer)", "SMOPA (I16 into I64, 4-way)", "FEAT_SME_I16I64", "za-tile", "smopa", "i64", 64, 8, "i16", 64, 2, 512, 3, "throughput", 1, 1.0, 2666666},
+  {{ &setup, &smopa_za_i64_i16_ilp4, &teardown }, "Outer Product (integer)", "SMOPA (I16 into I64, 4-way)", "FEAT_SME_I16I64", "za-tile", "smopa", "i64", 64, 8, "i16", 64, 2, 512, 4, "throughput", 1, 1.0, 2000000},
+  {{ &setup, &smopa_za_i64_i16_ilp5, &teardown }, "Outer Product (integer)", "SMOPA (I16 into I64, 4-way)", "FEAT_SME_I16I64", "za-tile", "smopa", "i64", 64, 8, "i16", 64, 2, 512, 5, "throughput", 1, 1.0, 1600000},
+  {{ &setup, &smopa_za_i64_i16_ilp6, &teardown }, "Outer Product (integer)", "SMOPA (I16 into I64, 4-way)", "FEAT_SME_I16I64", "za-tile", "smopa", "i64", 64, 8, "i16", 64, 2, 512, 6, "throughput", 1, 1.0, 1333333},
+  {{ &setup, &smopa_za_i64_i16_ilp7, &teardown }, "Outer Product (integer)", "SMOPA (I16 into I64, 4-way)", "FEAT_SME_I16I64", "za-tile", "smopa", "i64", 64, 8, "i16", 64, 2, 512, 7, "throughput", 1, 1.0, 1142857},
+  {{ &setup, &smopa_za_i64_i16_ilp8, &teardown }, "Outer Product (integer)", "SMOPA (I16 into I64, 4-way)", "FEAT_SME_I16I64", "za-tile", "smopa", "i64", 64, 8, "i16", 64, 2, 512, 8, "throughput", 1, 1.0, 1000000},
+  {{ &setup, &smopa_za_i64_i16_chain8_ilp1, &teardown }, "Outer Product (integer)", "SMOPA (I16 into I64, 4-way)", "FEAT_SME_I16I64", "za-tile", "smopa", "i64", 64, 8, "i16", 64, 2, 512, 1, "latency", 8, 1.0, 1000000},
+  {{ &setup, &smopa_za_i64_i16_chain8_ilp2, &teardown }, "Outer Product (integer)", "SMOPA (I16 into I64, 4-way)", "FEAT_SME_I16I64", "za-tile", "smopa", "i64", 64, 8, "i16", 64, 2, 512, 2, "latency", 8, 1.0, 500000},
+  {{ &setup, &smopa_za_i64_i16_p75_ilp1, &teardown }, "Outer Product (integer)", "SMOPA (I16 into I64, 4-way), 75% active lanes", "FEAT_SME_I16I64", "za-tile", "smopa", "i64", 64, 8, "i16", 64, 2, 288, 1, "throughput", 1, 0.75, 8000000},
+  {{ &setup, &smopa_za_i64_i16_p75_ilp2, &teardown }, "Outer Product (integer)", "SMOPA (I16 into I64, 4-way), 75% active lanes", "FEAT_SME_I16I64", "za-tile", "smopa", "i64", 64, 8, "i16", 64, 2, 288, 2, "throughput", 1, 0.75, 4000000},
+  {{ &setup, &smopa_za_i64_i16_p75_ilp3, &teardown }, "Outer Product (integer)", "SMOPA (I16 into I64, 4-way), 75% active lanes", "FEAT_SME_I16I64", "za-tile", "smopa", "i64", 64, 8, "i16", 64, 2, 288, 3, "throughput", 1, 0.75, 2666666},
+  {{ &setup, &smopa_za_i64_i16_p75_ilp4, &teardown }, "Outer Product (integer)", "SMOPA (I16 into I64, 4-way), 75% active lanes", "FEAT_SME_I16I64", "za-tile", "smopa", "i64", 64, 8, "i16", 64, 2, 288, 4, "throughput", 1, 0.75, 2000000},
+  {{ &setup, &smopa_za_i64_i16_p75_ilp5, &teardown }, "Outer Product (integer)", "SMOPA (I16 into I64, 4-way), 75% active lanes", "FEAT_SME_I16I64", "za-tile", "smopa", "i64", 64, 8, "i16", 64, 2, 288, 5, "throughput", 1, 0.75, 1600000},
+  {{ &setup, &smopa_za_i64_i16_p75_ilp6, &teardown }, "Outer Product (integer)", "SMOPA (I16 into I64, 4-way), 75% active lanes", "FEAT_SME_I16I64", "za-tile", "smopa", "i64", 64, 8, "i16", 64, 2, 288, 6, "throughput", 1, 0.75, 1333333},
+  {{ &setup, &smopa_za_i64_i16_p75_ilp7, &teardown }, "Outer Product (integer)", "SMOPA (I16 into I64, 4-way), 75% active lanes", "FEAT_SME_I16I64", "za-tile", "smopa", "i64", 64, 8, "i16", 64, 2, 288, 7, "throughput", 1, 0.75, 1142857},
+  {{ &setup, &smopa_za_i64_i16_p75_ilp8, &teardown }, "Outer Product (integer)", "SMOPA (I16 into I64, 4-way), 75% active lanes", "FEAT_SME_I16I64", "za-tile", "smopa", "i64", 64, 8, "i16", 64, 2, 288, 8, "throughput", 1, 0.75, 1000000},
+  {{ &setup, &smopa_za_i64_i16_p50_ilp1, &teardown }, "Outer Product (integer)", "SMOPA (I16 into I64, 4-way), 50% active lanes", "FEAT_SME_I16I64", "za-tile", "smopa", "i64", 64, 8, "i16", 64, 2, 128, 1, "throughput", 1, 0.5, 8000000},
+  {{ &setup, &smopa_za_i64_i16_p50_ilp2, &teardown }, "Outer Product (integer)", "SMOPA (I16 into I64, 4-way), 50% active lanes", "FEAT_SME_I16I64", "za-tile", "smopa", "i64", 64, 8, "i16", 64, 2, 128, 2, "throughput", 1, 0.5, 4000000},
+  {{ &setup, &smopa_za_i64_i16_p50_ilp3, &teardown }, "Outer Product (integer)", "SMOPA (I16 into I64, 4-way), 50% active lanes", "FEAT_SME_I16I64", "za-tile", "smopa", "i64", 64, 8, "i16", 64, 2, 128, 3, "throughput", 1, 0.5, 2666666},
+  {{ &setup, &smopa_za_i64_i16_p50_ilp4, &teardown }, "Outer Product (integer)", "SMOPA (I16 into I64, 4-way), 50% active lanes", "FEAT_SME_I16I64", "za-tile", "smopa", "i64", 64, 8, "i16", 64, 2, 128, 4, "throughput", 1, 0.5, 2000000},
+  {{ &setup, &smopa_za_i64_i16_p50_ilp5, &teardown }, "Outer Product (integer)", "SMOPA (I16 into I64, 4-way), 50% active lanes", "FEAT_SME_I16I64", "za-tile", "smopa", "i64", 64, 8, "i16", 64, 2, 128, 5, "throughput", 1, 0.5, 1600000},
+  {{ &setup, &smopa_za_i64_i16_p50_ilp6, &teardown }, "Outer Product (integer)", "SMOPA (I16 into I64, 4-way), 50% active lanes", "FEAT_SME_I16I64", "za-tile", "smopa", "i64", 64, 8, "i16", 64, 2, 128, 6, "throughput", 1, 0.5, 1333333},
+  {{ &setup, &smopa_za_i64_i16_p50_ilp7, &teardown }, "Outer Product (integer)", "SMOPA (I16 into I64, 4-way), 50% active lanes", "FEAT_SME_I16I64", "za-tile", "smopa", "i64", 64, 8, "i16", 64, 2, 128, 7, "throughput", 1, 0.5, 1142857},
+  {{ &setup, &smopa_za_i64_i16_p50_ilp8, &teardown }, "Outer Product (integer)", "SMOPA (I16 into I64, 4-way), 50% active lanes", "FEAT_SME_I16I64", "za-tile", "smopa", "i64", 64, 8, "i16", 64, 2, 128, 8, "throughput", 1, 0.5, 1000000},
+  {{ &setup, &smopa_za_i64_i16_p25_ilp1, &teardown }, "Outer Product (integer)", "SMOPA (I16 into I64, 4-way), 25% active lanes", "FEAT_SME_I16I64", "za-tile", "smopa", "i64", 64, 8, "i16", 64, 2, 32, 1, "throughput", 1, 0.25, 8000000},
+  {{ &setup, &smopa_za_i64_i16_p25_ilp2, &teardown }, "Outer Product (integer)", "SMOPA (I16 into I64, 4-way), 25% active lanes", "FEAT_SME_I16I64", "za-tile", "smopa", "i64", 64, 8, "i16", 64, 2, 32, 2, "throughput", 1, 0.25, 4000000},
+  {{ &setup, &smopa_za_i64_i16_p25_ilp3, &teardown }, "Outer Product (integer)", "SMOPA (I16 into I64, 4-way), 25% active lanes", "FEAT_SME_I16I64", "za-tile", "smopa", "i64", 64, 8, "i16", 64, 2, 32, 3, "throughput", 1, 0.25, 2666666},
+  {{ &setup, &smopa_za_i64_i16_p25_ilp4, &teardown }, "Outer Product (integer)", "SMOPA (I16 into I64, 4-way), 25% active lanes", "FEAT_SME_I16I64", "za-tile", "smopa", "i64", 64, 8, "i16", 64, 2, 32, 4, "throughput", 1, 0.25, 2000000},
+  {{ &setup, &smopa_za_i64_i16_p25_ilp5, &teardown }, "Outer Product (integer)", "SMOPA (I16 into I64, 4-way), 25% active lanes", "FEAT_SME_I16I64", "za-tile", "smopa", "i64", 64, 8, "i16", 64, 2, 32, 5, "throughput", 1, 0.25, 1600000},
+  {{ &setup, &smopa_za_i64_i16_p25_ilp6, &teardown }, "Outer Product (integer)", "SMOPA (I16 into I64, 4-way), 25% active lanes", "FEAT_SME_I16I64", "za-tile", "smopa", "i64", 64, 8, "i16", 64, 2, 32, 6, "throughput", 1, 0.25, 1333333},
+  {{ &setup, &smopa_za_i64_i16_p25_ilp7, &teardown }, "Outer Product (integer)", "SMOPA (I16 into I64, 4-way), 25% active lanes", "FEAT_SME_I16I64", "za-tile", "smopa", "i64", 64, 8, "i16", 64, 2, 32, 7, "throughput", 1, 0.25, 1142857},
+  {{ &setup, &smopa_za_i64_i16_p25_ilp8, &teardown }, "Outer Product (integer)", "SMOPA (I16 into I64, 4-way), 25% active lanes", "FEAT_SME_I16I64", "za-tile", "smopa", "i64", 64, 8, "i16", 64, 2, 32, 8, "throughput", 1, 0.25, 1000000}
+};
+
+CONST_PTR(op_benchmark_t) op_benchmarks = benchmarks;
+const size_t op_benchmarks_count = sizeof(benchmarks)/sizeof(benchmarks[0]);
+
+// execution order (none, run the table in order)
+const run_schedule_entry_t* _Nullable op_benchmarks_schedule = nullptr;
+const size_t op_benchmarks_schedule_count = 0;
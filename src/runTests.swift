@@ -1,13 +1,18 @@
 import Foundation
 
 let multiCoreTests = true
-let tests = ["memory", "ops"]
+let tests = ["memory", "ops", "mixed", "gemm"]
 
 func runTests() {
   print("\u{001B}[0;36m-- CPU info\u{001B}[0m")
   let cpu_info = CPUInfo()
   print(cpu_info)
   writeReport(cpu_info, to: "cpu_info.json")
+
+  // hardware counters where the platform has a counter backend (there is none on Apple
+  // platforms, the counter columns of the reports are null)
+  set_counter_backend(perf_event_counter_backend())
+
   let threadCombinations = cpu_info.getThreadCombinations()
 
   // SME/SVE operation benchmarks
@@ -22,12 +27,78 @@ func runTests() {
     print("\u{001B}[0;36m-- Memory benchmarks  (one thread) \u{001B}[0m\n")
     let results = MemoryBenchmark.runHarness(
       threads: [(1, 0), (0, 1)],
-      // 4KB to 64MB (switching to multiplicative increases every 4 steps)
-      sizes: MemoryBenchmark.generateTestSizes(4096, linear: 4, multiplicative: 5),
+      // sizes from the sweep plan or 4KB to 64MB (switching to multiplicative increases every 4 steps)
+      sizes: MemoryBenchmark.plannedSizes() ?? MemoryBenchmark.generateTestSizes(4096, linear: 4, multiplicative: 5),
       alignments: [16, 32, 64, 128, 256]
     )
     writeReport(results, to: "mem_benchmarks.json")
   }
+
+  // mixed instruction benchmarks (overlap of the instruction streams on one core)
+  if tests.contains("mixed") {
+    print("\u{001B}[0;36m-- Mixed instruction benchmarks (one thread)\u{001B}[0m\n")
+    let results = MixedBenchmark.runAllBenchmarks(threads: [(1, 0), (0, 1)])
+    writeReport(results, to: "mixed_benchmarks.json")
+  }
+
+  // packed GEMM micro-kernels
+  if tests.contains("gemm") {
+    print("\u{001B}[0;36m-- GEMM micro-kernels (one thread)\u{001B}[0m\n")
+    let results = GemmBenchmark.runAllBenchmarks(threads: [(1, 0), (0, 1)])
+    writeReport(results, to: "gemm_benchmarks.json")
+  }
+}
+
+typealias Sample = (elapsed: Double, total_ops: Double, threads: Int, counters: counter_values_t)
+
+// A counter column of the reports, unavailable counters (NaN) are written as null
+struct CounterValue: Codable {
+  let value: Double
+
+  init(_ value: Double) {
+    self.value = value
+  }
+
+  init(from decoder: Decoder) throws {
+    let container = try decoder.singleValueContainer()
+    self.value = container.decodeNil() ? .nan : try container.decode(Double.self)
+  }
+
+  func encode(to encoder: Encoder) throws {
+    var container = encoder.singleValueContainer()
+    if self.value.isNaN {
+      try container.encodeNil()
+    } else {
+      try container.encode(self.value)
+    }
+  }
+}
+
+// Hardware counter columns of a result (same as the portable driver): the median counts of a
+// run (summed over the threads), the cycles per instruction and the effective frequency. The
+// harness does not time the threads individually, the frequency divides the cycles by the
+// elapsed time of all threads.
+struct CounterColumns {
+  let cycles: CounterValue
+  let instructions: CounterValue
+  let l1d_misses: CounterValue
+  let l2_misses: CounterValue
+  let cpi: CounterValue
+  let ghz: CounterValue
+
+  init(_ samples: [Sample]) {
+    // a counter is unavailable if any sample misses it
+    func median(_ values: [Double]) -> CounterValue {
+      return CounterValue(values.contains(where: { $0.isNaN }) ? .nan : values.median())
+    }
+
+    self.cycles = median(samples.map({ $0.counters.cycles }))
+    self.instructions = median(samples.map({ $0.counters.instructions }))
+    self.l1d_misses = median(samples.map({ $0.counters.l1d_misses }))
+    self.l2_misses = median(samples.map({ $0.counters.l2_misses }))
+    self.cpi = median(samples.map({ $0.counters.cycles / $0.counters.instructions }))
+    self.ghz = median(samples.map({ $0.counters.cycles / ($0.elapsed * Double($0.threads)) / 1e9 }))
+  }
 }
 
 func runMicrobenchmark(
@@ -36,18 +107,57 @@ func runMicrobenchmark(
   threads: (Int, Int),
   times: Int,
   warmup: Int = 2
-) -> [(elapsed: Double, total_ops: Double)] {
-  var results: [(elapsed: Double, total_ops: Double)] = []
+) -> [Sample] {
+  var results: [Sample] = []
   //var elapsed: [Double] = []
   for i in 0..<times + warmup {
     let result = withUnsafePointer(to: bench) { run_benchmark($0, params, threads.0, threads.1) }
     if i >= warmup {
-      results.append((elapsed: result.elapsed, total_ops: result.total_ops))
+      results.append((elapsed: result.elapsed, total_ops: result.total_ops, threads: threads.0 + threads.1, counters: result.counters))
     }
   }
   return results
 }
 
+// Execution order of a benchmark table: the table order, or the randomized schedule emitted
+// by the generator (see tools/plan_sweep.py --shuffle) that visits every benchmark once per
+// round and pauses at cooldown markers. The repetitions of a benchmark are split over the rounds.
+struct RunSchedule {
+  // table index (-1 for cooldown markers) and pause (seconds) of every visit
+  let visits: [(index: Int, cooldown: Double)]
+  let rounds: Int
+  let isTableOrder: Bool
+
+  init(count: Int, schedule: UnsafePointer<run_schedule_entry_t>?, scheduleCount: Int) {
+    guard scheduleCount > 0, let schedule = schedule else {
+      self.visits = (0..<count).map({ (index: $0, cooldown: 0.0) })
+      self.rounds = 1
+      self.isTableOrder = true
+      return
+    }
+
+    let entries = UnsafeBufferPointer(start: schedule, count: scheduleCount)
+    self.visits = entries.map({ (index: Int($0.benchmark), cooldown: Double($0.cooldown_ms) / 1000) })
+    self.rounds = max(1, self.visits.filter({ $0.index >= 0 }).count / max(count, 1))
+    self.isTableOrder = false
+  }
+
+  // repetitions per visit
+  func share(of times: Int) -> Int {
+    return (times + self.rounds - 1) / self.rounds
+  }
+
+  func run(_ body: (Int) -> Void) {
+    for visit in self.visits {
+      guard visit.index >= 0 else {
+        Thread.sleep(forTimeInterval: visit.cooldown)
+        continue
+      }
+      body(visit.index)
+    }
+  }
+}
+
 // CPU info
 struct CPUInfo: Codable, CustomStringConvertible {
   let cpu_p_cores: Int
@@ -122,6 +232,10 @@ struct OpBenchmark: Codable, CustomStringConvertible {
   let input_vectors: Int
   let ops_per_instruction: Int
   let ilp: Int
+  let mode: String
+  let chain_length: Int
+  let predicate_density: Double
+  let n_iterations: Int
   // number of threads (high-priority, low-priority)
   let threads_h: Int
   let threads_l: Int
@@ -129,6 +243,13 @@ struct OpBenchmark: Codable, CustomStringConvertible {
   let gops: [Double]
   // median elapsed time
   let elapsed: Double
+  // hardware counters (see CounterColumns)
+  let cycles: CounterValue
+  let instructions: CounterValue
+  let l1d_misses: CounterValue
+  let l2_misses: CounterValue
+  let cpi: CounterValue
+  let ghz: CounterValue
 
   static func runAllBenchmarks(
     threads: any Sequence<(Int, Int)>
@@ -143,30 +264,42 @@ struct OpBenchmark: Codable, CustomStringConvertible {
     var last_category = ""
 
     let sme_features = CPUInfo().sme_features
+    let threads = Array(threads)
+    let schedule = RunSchedule(count: benchmarks.count, schedule: op_benchmarks_schedule, scheduleCount: op_benchmarks_schedule_count)
+    // samples of every benchmark and thread configuration (accumulated over the rounds)
+    var samples = Array(repeating: Array(repeating: [Sample](), count: threads.count), count: benchmarks.count)
 
-    for bench in benchmarks {
+    schedule.run { index in
+      let bench = benchmarks[index]
       // skip unsupported tests
       let feature = String(cString: bench.feature)
       guard sme_features.contains(feature) else {
         let label = String(cString: bench.label)
         skip.append("* skipping test '\(label)' due to missing feature \(feature)")
 
-        continue
+        return
       }
 
       // print a divider
       let category = String(cString: bench.category)
-      if last_category != category {
+      if schedule.isTableOrder && last_category != category {
         let hdr = "== \(category) ".padding(toLength: 52, withPad: "=", startingAt: 0)
         print("\n\u{001B}[0;36m\(hdr)\u{001B}[0m\n")
       }
       last_category = category
 
       // run the harness
-      for threadCount in threads {
-        let result = Self.runBenchmark(bench, threads: threadCount, times: 20)
-        print(result)
-        results.append(result)
+      for (i, threadCount) in threads.enumerated() {
+        let visit = Self.measure(bench, threads: threadCount, times: schedule.share(of: 20))
+        print(Self.result(bench, threads: threadCount, samples: visit))
+        samples[index][i] += visit
+      }
+    }
+
+    // results in table order
+    for (index, bench) in benchmarks.enumerated() {
+      for (i, threadCount) in threads.enumerated() where !samples[index][i].isEmpty {
+        results.append(Self.result(bench, threads: threadCount, samples: samples[index][i]))
       }
     }
 
@@ -183,9 +316,13 @@ struct OpBenchmark: Codable, CustomStringConvertible {
     return results
   }
 
-  static func runBenchmark(_ bench: op_benchmark_t, threads: (Int, Int), times: Int = 10) -> Self {
-    let results = runMicrobenchmark(bench.benchmark, params: nil, threads: threads, times: times)
+  static func measure(_ bench: op_benchmark_t, threads: (Int, Int), times: Int = 10) -> [Sample] {
+    var n_iterations = bench.n_iterations
+    return runMicrobenchmark(bench.benchmark, params: &n_iterations, threads: threads, times: times)
+  }
 
+  static func result(_ bench: op_benchmark_t, threads: (Int, Int), samples results: [Sample]) -> Self {
+    let counters = CounterColumns(results)
     return Self(
       category: String(cString: bench.category),
       label: String(cString: bench.label),
@@ -200,16 +337,26 @@ struct OpBenchmark: Codable, CustomStringConvertible {
       input_vectors: Int(bench.input_vectors),
       ops_per_instruction: Int(bench.ops_per_instruction),
       ilp: Int(bench.ilp),
+      mode: String(cString: bench.mode),
+      chain_length: Int(bench.chain_length),
+      predicate_density: bench.predicate_density,
+      n_iterations: Int(bench.n_iterations),
       threads_h: threads.0,
       threads_l: threads.1,
       gops: results.map({ $0.total_ops / $0.elapsed / 1e9 }),
-      elapsed: results.map({ $0.elapsed }).median()
+      elapsed: results.map({ $0.elapsed }).median(),
+      cycles: counters.cycles,
+      instructions: counters.instructions,
+      l1d_misses: counters.l1d_misses,
+      l2_misses: counters.l2_misses,
+      cpi: counters.cpi,
+      ghz: counters.ghz
     )
   }
 
   var description: String {
     let label = self.label.padding(to: 50)
-    let ilp = "ILP=\(self.ilp)".padding(to: 6)
+    let ilp = (self.mode == "latency" ? "\(self.ilp)x\(self.chain_length)" : "ILP=\(self.ilp)").padding(to: 6)
     let vecs = "VLx\(self.output_vectors*self.ilp)".padding(to: 5)
     var gops = "\(self.gops.median().rounded(to: 2)) GOP/s".padding(to: 18, right: false)
     gops = "\u{001B}[0;32m\(gops)\u{001B}[0m"
@@ -229,9 +376,12 @@ struct MemoryBenchmark: Codable, CustomStringConvertible {
   let n_vectors: Int
   let data_size: Int
   let ilp: Int
+  let predicate_density: Double
   // memory buffer size and alignment (for each thread)
   let size: Int
   let alignment: Int
+  // bytes transferred per thread
+  let transfer_size: Int
   // number of threads (high-priority, low-priority)
   let threads_h: Int
   let threads_l: Int
@@ -239,6 +389,13 @@ struct MemoryBenchmark: Codable, CustomStringConvertible {
   let gbps: [Double]
   // median elapsed time
   let elapsed: Double
+  // hardware counters (see CounterColumns)
+  let cycles: CounterValue
+  let instructions: CounterValue
+  let l1d_misses: CounterValue
+  let l2_misses: CounterValue
+  let cpi: CounterValue
+  let ghz: CounterValue
 
   static func runHarness(
     threads: any Sequence<(Int, Int)>,
@@ -254,42 +411,59 @@ struct MemoryBenchmark: Codable, CustomStringConvertible {
     )
     var prev_test = ""
     let sme_features = CPUInfo().sme_features
-    for bench in benchmarks {
+
+    // buffer configurations of every benchmark
+    let maxSize = sizes.max() ?? 0
+    var configs: [(size: Int, alignment: Int, threads: (Int, Int))] = []
+    for size in sizes {
+      for alignment in alignments {
+        for threadCount in threads {
+          // skip all tests that would allocate more than twice the maxSize in total
+          guard (threadCount.0 + threadCount.1) * size <= 2 * maxSize else { continue }
+          configs.append((size: size, alignment: alignment, threads: threadCount))
+        }
+      }
+    }
+
+    let schedule = RunSchedule(count: benchmarks.count, schedule: mem_benchmarks_schedule, scheduleCount: mem_benchmarks_schedule_count)
+    // samples of every benchmark and configuration (accumulated over the rounds)
+    var samples = Array(repeating: Array(repeating: [Sample](), count: configs.count), count: benchmarks.count)
+
+    schedule.run { index in
+      let bench = benchmarks[index]
       // skip unsupported tests
       let feature = String(cString: bench.feature)
       let label = String(cString: bench.label)
       guard sme_features.contains(feature) else {
         skip.append("* skipping test '\(label)' due to missing feature \(feature)")
-        continue
+        return
       }
 
       // print a divider
-      if prev_test != label {
+      if schedule.isTableOrder && prev_test != label {
         let hdr = "== \(label) ".padding(toLength: 52, withPad: "=", startingAt: 0)
         print("\n\u{001B}[0;36m\(hdr)\u{001B}[0m\n")
         prev_test = label
       }
 
       // run the harness
-      let maxSize = sizes.max() ?? 0
-
-      for size in sizes {
-        for alignment in alignments {
-          for threadCount in threads {
-            // skip all tests that would allocate more than twice the maxSize in total
-            guard (threadCount.0 + threadCount.1) * size <= 2 * maxSize else { continue }
-
-            let result = Self.runBenchmark(
-              bench,
-              size: size,
-              alignment: alignment,
-              threads: threadCount,
-              times: 10
-            )
-            print(result)
-            results.append(result)
-          }
-        }
+      for (i, config) in configs.enumerated() {
+        let visit = Self.measure(
+          bench,
+          size: config.size,
+          alignment: config.alignment,
+          threads: config.threads,
+          times: schedule.share(of: 10)
+        )
+        print(Self.result(bench, size: config.size, alignment: config.alignment, threads: config.threads, samples: visit))
+        samples[index][i] += visit
+      }
+    }
+
+    // results in table order
+    for (index, bench) in benchmarks.enumerated() {
+      for (i, config) in configs.enumerated() where !samples[index][i].isEmpty {
+        results.append(Self.result(bench, size: config.size, alignment: config.alignment, threads: config.threads, samples: samples[index][i]))
       }
     }
 
@@ -297,21 +471,30 @@ struct MemoryBenchmark: Codable, CustomStringConvertible {
     return results
   }
 
-  static func runBenchmark(
+  static func measure(
     _ bench: mem_benchmark_t,
     size: Int,
     alignment: Int,
     threads: (Int, Int),
     times: Int = 10
-  ) -> Self {
-    var params = mem_benchmark_params_t(size: size, alignment: alignment)
-    let results = runMicrobenchmark(
+  ) -> [Sample] {
+    var params = mem_benchmark_params_t(size: size, alignment: alignment, transfer_size: bench.transfer_size)
+    return runMicrobenchmark(
       bench.benchmark,
       params: &params,
       threads: threads,
-      times: 10
+      times: times
     )
+  }
 
+  static func result(
+    _ bench: mem_benchmark_t,
+    size: Int,
+    alignment: Int,
+    threads: (Int, Int),
+    samples results: [Sample]
+  ) -> Self {
+    let counters = CounterColumns(results)
     return Self(
       label: String(cString: bench.label),
       encoding: String(cString: bench.encoding),
@@ -320,12 +503,20 @@ struct MemoryBenchmark: Codable, CustomStringConvertible {
       n_vectors: Int(bench.n_vectors),
       data_size: Int(bench.n_vectors),
       ilp: Int(bench.ilp),
+      predicate_density: bench.predicate_density,
       size: size,
       alignment: alignment,
+      transfer_size: Int(bench.transfer_size),
       threads_h: threads.0,
       threads_l: threads.1,
       gbps: results.map({ $0.total_ops / $0.elapsed / 1e9 }),
-      elapsed: results.map({ $0.elapsed }).median()
+      elapsed: results.map({ $0.elapsed }).median(),
+      cycles: counters.cycles,
+      instructions: counters.instructions,
+      l1d_misses: counters.l1d_misses,
+      l2_misses: counters.l2_misses,
+      cpi: counters.cpi,
+      ghz: counters.ghz
     )
   }
 
@@ -347,6 +538,12 @@ struct MemoryBenchmark: Codable, CustomStringConvertible {
     return "\(label) | \(ilp) | \(vecs) | \(mem) | threads \(threads) | \(tops) (\(elapsed))"
   }
 
+  // buffer sizes selected by the sweep planner (tools/plan_sweep.py), if any
+  static func plannedSizes() -> [Int]? {
+    guard mem_benchmark_sizes_count > 0, let sizes = mem_benchmark_sizes else { return nil }
+    return UnsafeBufferPointer(start: sizes, count: mem_benchmark_sizes_count).map({ Int($0) })
+  }
+
   static func generateTestSizes(_ initial: Int, linear: Int, multiplicative: Int, max: Int? = nil)
     -> [Int]
   {
@@ -364,3 +561,313 @@ struct MemoryBenchmark: Codable, CustomStringConvertible {
     return sizes.filter({ $0 <= max })
   }
 }
+
+// Mixed instruction benchmarks
+struct MixedBenchmark: Codable, CustomStringConvertible {
+  // same as mixed_benchmark_t
+  let label: String
+  let features: String
+  let first: String
+  let first_opcode: String
+  let first_count: Int
+  let second: String
+  let second_opcode: String
+  let second_count: Int
+  let ops_per_iteration: Int
+  let bytes_per_iteration: Int
+  let buffer_size: Int
+  let n_iterations: Int
+  // number of threads (high-priority, low-priority)
+  let threads_h: Int
+  let threads_l: Int
+  // loop iterations/second (billions)
+  let gips: [Double]
+  // median OPs/second and loaded bytes/second (billions)
+  let gops: Double
+  let gbps: Double
+  // median elapsed time
+  let elapsed: Double
+  // hardware counters (see CounterColumns)
+  let cycles: CounterValue
+  let instructions: CounterValue
+  let l1d_misses: CounterValue
+  let l2_misses: CounterValue
+  let cpi: CounterValue
+  let ghz: CounterValue
+
+  static func runAllBenchmarks(
+    threads: any Sequence<(Int, Int)>
+  ) -> [Self] {
+    var results: [Self] = []
+    var skip: [String] = []
+
+    let benchmarks = UnsafeBufferPointer(
+      start: mixed_benchmarks,
+      count: mixed_benchmarks_count
+    )
+    var prev_test = ""
+    let sme_features = CPUInfo().sme_features
+    let threads = Array(threads)
+    let schedule = RunSchedule(count: benchmarks.count, schedule: mixed_benchmarks_schedule, scheduleCount: mixed_benchmarks_schedule_count)
+    // samples of every benchmark and thread configuration (accumulated over the rounds)
+    var samples = Array(repeating: Array(repeating: [Sample](), count: threads.count), count: benchmarks.count)
+
+    schedule.run { index in
+      let bench = benchmarks[index]
+      // skip unsupported tests
+      let features = String(cString: bench.features).split(separator: ",").map(String.init)
+      let label = String(cString: bench.label)
+      let missing = features.filter({ !sme_features.contains($0) })
+      guard missing.isEmpty else {
+        skip.append("* skipping test '\(label)' due to missing features \(missing.joined(separator: ", "))")
+        return
+      }
+
+      // print a divider
+      if schedule.isTableOrder && prev_test != label {
+        let hdr = "== \(label) ".padding(toLength: 52, withPad: "=", startingAt: 0)
+        print("\n\u{001B}[0;36m\(hdr)\u{001B}[0m\n")
+        prev_test = label
+      }
+
+      // run the harness
+      for (i, threadCount) in threads.enumerated() {
+        let visit = Self.measure(bench, threads: threadCount, times: schedule.share(of: 20))
+        print(Self.result(bench, threads: threadCount, samples: visit))
+        samples[index][i] += visit
+      }
+    }
+
+    // results in table order
+    for (index, bench) in benchmarks.enumerated() {
+      for (i, threadCount) in threads.enumerated() where !samples[index][i].isEmpty {
+        results.append(Self.result(bench, threads: threadCount, samples: samples[index][i]))
+      }
+    }
+
+    // print skipped tests
+    if skip.count > 0 {
+      skip = Array(Set(skip))
+
+      print("")
+      for test in skip {
+        print(test)
+      }
+    }
+
+    return results
+  }
+
+  static func measure(_ bench: mixed_benchmark_t, threads: (Int, Int), times: Int = 10) -> [Sample] {
+    var params = mixed_benchmark_params_t(n_iterations: bench.n_iterations, buffer_size: bench.buffer_size)
+    return runMicrobenchmark(bench.benchmark, params: &params, threads: threads, times: times)
+  }
+
+  static func result(_ bench: mixed_benchmark_t, threads: (Int, Int), samples results: [Sample]) -> Self {
+    // the benchmarks return the number of loop iterations
+    let gips = results.map({ $0.total_ops / $0.elapsed / 1e9 })
+
+    let counters = CounterColumns(results)
+    return Self(
+      label: String(cString: bench.label),
+      features: String(cString: bench.features),
+      first: String(cString: bench.first),
+      first_opcode: String(cString: bench.first_opcode),
+      first_count: Int(bench.first_count),
+      second: String(cString: bench.second),
+      second_opcode: String(cString: bench.second_opcode),
+      second_count: Int(bench.second_count),
+      ops_per_iteration: Int(bench.ops_per_iteration),
+      bytes_per_iteration: Int(bench.bytes_per_iteration),
+      buffer_size: Int(bench.buffer_size),
+      n_iterations: Int(bench.n_iterations),
+      threads_h: threads.0,
+      threads_l: threads.1,
+      gips: gips,
+      gops: gips.median() * Double(bench.ops_per_iteration),
+      gbps: gips.median() * Double(bench.bytes_per_iteration),
+      elapsed: results.map({ $0.elapsed }).median(),
+      cycles: counters.cycles,
+      instructions: counters.instructions,
+      l1d_misses: counters.l1d_misses,
+      l2_misses: counters.l2_misses,
+      cpi: counters.cpi,
+      ghz: counters.ghz
+    )
+  }
+
+  var description: String {
+    let ratio = "\(self.first_opcode) x\(self.first_count) + \(self.second_opcode) x\(self.second_count)".padding(to: 24)
+    var gops = "\(self.gops.rounded(to: 2)) GOP/s".padding(to: 18, right: false)
+    gops = "\u{001B}[0;32m\(gops)\u{001B}[0m"
+    let gbps = "\(self.gbps.rounded(to: 2)) GB/s".padding(to: 14, right: false)
+    let threads = "\(self.threads_h)H+\(self.threads_l)L".padding(to: 6)
+    let elapsed = "\((self.elapsed*1000).rounded(to: 2)) ms"
+
+    return "\(ratio) | threads \(threads) | \(gops) | \(gbps) (\(elapsed))"
+  }
+}
+
+// Packed GEMM micro-kernel benchmarks
+struct GemmBenchmark: Codable, CustomStringConvertible {
+  // same as gemm_benchmark_t
+  let label: String
+  let feature: String
+  let opcode: String
+  let input_data: String
+  let input_size: Int
+  let output_data: String
+  let tile_rows: Int
+  let tile_cols: Int
+  let k_unroll: Int
+  let m_step: Int
+  let n_step: Int
+  let k_step: Int
+  let n_ops: Int
+  // GEMM shape (rounded up to the kernel steps)
+  let m: Int
+  let n: Int
+  let k: Int
+  // number of threads (high-priority, low-priority)
+  let threads_h: Int
+  let threads_l: Int
+  // effective OPs/second (2*M*N*K per GEMM, billions)
+  let gops: [Double]
+  // median elapsed time
+  let elapsed: Double
+  // hardware counters (see CounterColumns)
+  let cycles: CounterValue
+  let instructions: CounterValue
+  let l1d_misses: CounterValue
+  let l2_misses: CounterValue
+  let cpi: CounterValue
+  let ghz: CounterValue
+
+  static func runAllBenchmarks(
+    threads: any Sequence<(Int, Int)>
+  ) -> [Self] {
+    var results: [Self] = []
+    var skip: [String] = []
+
+    let benchmarks = UnsafeBufferPointer(
+      start: gemm_benchmarks,
+      count: gemm_benchmarks_count
+    )
+    let shapes = UnsafeBufferPointer(
+      start: gemm_benchmark_shapes,
+      count: gemm_benchmark_shapes_count
+    )
+    var prev_test = ""
+    let sme_features = CPUInfo().sme_features
+    let configs = shapes.flatMap({ shape in threads.map({ (shape: shape, threads: $0) }) })
+    let schedule = RunSchedule(count: benchmarks.count, schedule: gemm_benchmarks_schedule, scheduleCount: gemm_benchmarks_schedule_count)
+    // samples of every benchmark and configuration (accumulated over the rounds)
+    var samples = Array(repeating: Array(repeating: [Sample](), count: configs.count), count: benchmarks.count)
+
+    schedule.run { index in
+      let bench = benchmarks[index]
+      // skip unsupported tests
+      let feature = String(cString: bench.feature)
+      let label = String(cString: bench.label)
+      guard sme_features.contains(feature) else {
+        skip.append("* skipping test '\(label)' due to missing feature \(feature)")
+        return
+      }
+
+      // print a divider
+      if schedule.isTableOrder && prev_test != label {
+        let hdr = "== \(label) ".padding(toLength: 52, withPad: "=", startingAt: 0)
+        print("\n\u{001B}[0;36m\(hdr)\u{001B}[0m\n")
+        prev_test = label
+      }
+
+      // run the harness
+      for (i, config) in configs.enumerated() {
+        let visit = Self.measure(bench, shape: config.shape, threads: config.threads, times: schedule.share(of: 10))
+        print(Self.result(bench, shape: config.shape, threads: config.threads, samples: visit))
+        samples[index][i] += visit
+      }
+    }
+
+    // results in table order
+    for (index, bench) in benchmarks.enumerated() {
+      for (i, config) in configs.enumerated() where !samples[index][i].isEmpty {
+        results.append(Self.result(bench, shape: config.shape, threads: config.threads, samples: samples[index][i]))
+      }
+    }
+
+    // print skipped tests
+    if skip.count > 0 {
+      skip = Array(Set(skip))
+
+      print("")
+      for test in skip {
+        print(test)
+      }
+    }
+
+    return results
+  }
+
+  // shape rounded up to the kernel steps
+  static func roundedShape(_ bench: gemm_benchmark_t, _ shape: gemm_shape_t) -> (m: Int, n: Int, k: Int) {
+    let roundUp = { (size: Int, step: Int) in (size + step - 1) / step * step }
+    return (
+      m: roundUp(Int(shape.m), Int(bench.m_step)),
+      n: roundUp(Int(shape.n), Int(bench.n_step)),
+      k: roundUp(Int(shape.k), Int(bench.k_step))
+    )
+  }
+
+  static func measure(_ bench: gemm_benchmark_t, shape: gemm_shape_t, threads: (Int, Int), times: Int = 10) -> [Sample] {
+    let (m, n, k) = Self.roundedShape(bench, shape)
+    return withUnsafePointer(to: bench) { bench_ptr in
+      var params = gemm_benchmark_params_t(benchmark: bench_ptr, shape: gemm_shape_t(m: m, n: n, k: k))
+      return runMicrobenchmark(bench.benchmark, params: &params, threads: threads, times: times)
+    }
+  }
+
+  static func result(_ bench: gemm_benchmark_t, shape: gemm_shape_t, threads: (Int, Int), samples results: [Sample]) -> Self {
+    let (m, n, k) = Self.roundedShape(bench, shape)
+    let counters = CounterColumns(results)
+    return Self(
+      label: String(cString: bench.label),
+      feature: String(cString: bench.feature),
+      opcode: String(cString: bench.opcode),
+      input_data: String(cString: bench.input_data),
+      input_size: Int(bench.input_size),
+      output_data: String(cString: bench.output_data),
+      tile_rows: Int(bench.tile_rows),
+      tile_cols: Int(bench.tile_cols),
+      k_unroll: Int(bench.k_unroll),
+      m_step: Int(bench.m_step),
+      n_step: Int(bench.n_step),
+      k_step: Int(bench.k_step),
+      n_ops: Int(bench.n_ops),
+      m: m,
+      n: n,
+      k: k,
+      threads_h: threads.0,
+      threads_l: threads.1,
+      gops: results.map({ $0.total_ops / $0.elapsed / 1e9 }),
+      elapsed: results.map({ $0.elapsed }).median(),
+      cycles: counters.cycles,
+      instructions: counters.instructions,
+      l1d_misses: counters.l1d_misses,
+      l2_misses: counters.l2_misses,
+      cpi: counters.cpi,
+      ghz: counters.ghz
+    )
+  }
+
+  var description: String {
+    let kernel = "\(self.tile_rows)x\(self.tile_cols) tiles, K x\(self.k_unroll)".padding(to: 20)
+    let shape = "\(self.m)x\(self.n)x\(self.k)".padding(to: 16)
+    var gops = "\(self.gops.median().rounded(to: 2)) GOP/s".padding(to: 18, right: false)
+    gops = "\u{001B}[0;32m\(gops)\u{001B}[0m"
+    let threads = "\(self.threads_h)H+\(self.threads_l)L".padding(to: 6)
+    let elapsed = "\((self.elapsed*1000).rounded(to: 2)) ms"
+
+    return "\(kernel) | \(shape) | threads \(threads) | \(gops) (\(elapsed))"
+  }
+}
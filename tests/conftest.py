@@ -0,0 +1,5 @@
+import os, sys
+
+# the tools are scripts in tools/ that import each other as top-level modules
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "tools"))
@@ -0,0 +1,115 @@
+import glob, os, re
+import SME
+from SME import Instr, GPR, Z, ZGroup, P, PN, Address
+from conftest import ROOT
+
+# Passes over the instruction IR and parsing of generated assembly back into it
+
+def load(register: int, offset: int = 0) -> Instr:
+  return Instr("ld1w", (Z(register, "s"), P(0, qualifier = "z"), Address(GPR(1), offset)))
+
+
+def fmla(accumulator: int, source: int) -> Instr:
+  return Instr("fmla", (Z(accumulator, "s"), P(0, qualifier = "m"), Z(source, "s"), Z(31, "s")))
+
+
+def store(register: int) -> Instr:
+  return Instr("st1w", (Z(register, "s"), P(0), Address(GPR(2))))
+
+
+def test_software_pipeline_stages():
+  """ The kernel runs the last stage first, prologue and epilogue complete the iterations """
+  (first, second, third) = ([load(0)], [fmla(0, 8)], [store(0)])
+  (prologue, kernel, epilogue) = SME.software_pipeline([first, second, third])
+
+  assert prologue == first + second + first
+  assert kernel == third + second + first
+  assert epilogue == third + second + third
+
+
+def test_software_pipeline_runs_every_stage_once_per_iteration():
+  """ A loop of n iterations runs every stage n times (the kernel runs n - depth + 1 times) """
+  stages = [[load(0)], [fmla(0, 8), fmla(0, 9)], [load(1)], [store(1)]]
+  (prologue, kernel, epilogue) = SME.software_pipeline(stages)
+  n = 10
+  executed = prologue + kernel*(n - len(stages) + 1) + epilogue
+
+  for stage in stages:
+    assert executed.count(stage[0]) == n*stage.count(stage[0])
+
+
+def test_software_pipeline_single_stage():
+  body = [load(0), fmla(8, 0)]
+  assert SME.software_pipeline([body]) == ([], body, [])
+
+
+def test_rename_registers_fresh_loads():
+  """ Unrolled loads get fresh registers round-robin, inputs and accumulators keep theirs """
+  body = [load(0), fmla(8, 0)]
+  copies = SME.unroll(body, 4, lambda instruction, copy: instruction.advanced(copy))
+  renamed = SME.rename_registers(copies, range(0, 8))
+
+  loads = [instruction.operands[0].index for instruction in renamed if instruction.opcode == "ld1w"]
+  assert loads == [0, 1, 2, 3]
+  # every fmla reads the register of the load before it and accumulates into z8
+  for (ld, fma) in zip(renamed[0::2], renamed[1::2]):
+    assert fma.operands[2] == ld.operands[0]
+    assert fma.operands[0] == Z(8, "s")
+  assert [instruction.operands[2] for instruction in renamed[0::2]] == [Address(GPR(1), copy) for copy in range(4)]
+
+
+def test_rename_registers_keeps_live_in():
+  """ Registers read before they are written are never allocated """
+  body = [load(0), Instr("fmla", (Z(8, "s"), P(0, qualifier = "m"), Z(0, "s"), Z(1, "s")))]
+  renamed = SME.rename_registers(SME.unroll(body, 3), range(0, 4))
+
+  loads = [instruction.operands[0].index for instruction in renamed if instruction.opcode == "ld1w"]
+  assert loads == [0, 2, 3]
+  assert all(instruction.operands[3] == Z(1, "s") for instruction in renamed if instruction.opcode == "fmla")
+
+
+def test_rename_registers_aligned_groups():
+  """ Multi-vector destinations are allocated aligned to their size, skipping live-in registers """
+  group = Instr("ld1w", (ZGroup(0, 4, "s"), PN(8, qualifier = "z"), Address(GPR(1))))
+  body = [load(0), group, Instr("fmla", (ZGroup(16, 4, "s"), PN(8), ZGroup(0, 4, "s"), Z(5, "s")))]
+  renamed = SME.rename_registers(body, range(0, 16))
+
+  assert renamed[0].operands[0] == Z(0, "s")
+  assert renamed[1].operands[0] == ZGroup(8, 4, "s")
+  assert renamed[2].operands[2] == ZGroup(8, 4, "s")
+  assert renamed[2].operands[0] == ZGroup(16, 4, "s")
+
+
+def test_hot_loop():
+  """ The hot loop is the largest innermost loop """
+  asm = SME.AsmBlock()
+  asm.emit("mov", GPR(0), SME.Imm(10))
+  with asm.labeled_block(1):
+    with asm.labeled_block(2):
+      asm.extend([load(0), load(1), fmla(8, 0), fmla(9, 1)])
+      asm.emit("subs", GPR(3), GPR(3), SME.Imm(1))
+      asm.emit("b.ne", "2b")
+    asm.emit("subs", GPR(0), GPR(0), SME.Imm(1))
+    asm.emit("b.ne", "1b")
+  with asm.labeled_block(3):
+    asm.emit("ld1w", Z(2, "s"), P(0, qualifier = "z"), Address(GPR(1)))
+    asm.emit("b.ne", "3b")
+
+  loop = SME.hot_loop(asm.code)
+  assert [instruction.opcode for instruction in loop] == ["ld1w", "ld1w", "fmla", "fmla", "subs", "b.ne"]
+
+
+def test_parse_generated_sources():
+  """ Every line of assembly in the generated sources parses to typed operands and prints back unchanged """
+  sources = glob.glob(os.path.join(ROOT, "src", "benchmarks", "*", "*.c"))
+  assert sources
+
+  for path in sources:
+    with open(path) as file:
+      for line in SME.asm_lines(file.read()):
+        instruction = SME.parse_instr(line)
+        assert str(instruction).strip() == line
+        if isinstance(instruction, Instr):
+          # only labels, condition codes, xzr and vlx multipliers stay untyped
+          untyped = [operand for operand in instruction.operands if isinstance(operand, str)]
+          assert all(re.fullmatch(r"\d+[bf]|xzr|vlx\d|eq|ne|lo|hi|ls|hs|lt|ge", operand) for operand in untyped), line
@@ -0,0 +1,77 @@
+import os
+import pytest
+import yaml
+import SME, dataflow, gen_op_benchmarks
+from SME import Instr, GPR, Imm, ZT0
+from gen_op_benchmarks import Operation, make_benchmark_function
+from conftest import ROOT
+
+# Register dataflow verification of generated kernels (negative cases and the ZT0 operations)
+
+# movt with a ZT0 element destination (not in benchmarks.yaml, written elements must be distinct)
+MOVT_TO_ZT0 = Operation.from_yaml({
+  "label": "MOVT (general-purpose register to ZT0)", "category": "Data Movement (ZT0)", "opcode": "movt", "feature": "FEAT_SME2",
+  "operands": [{"role": "destination", "type": "zt0-slice", "data": "u64"}, {"role": "source", "type": "gpr", "data": "u64"}],
+  "ops": 1
+})
+
+
+def kernel(body: list[Instr]) -> list[Instr | SME.Label]:
+  asm = SME.AsmBlock()
+  asm.emit("mov", GPR(0), SME.Arg("n"))
+  with asm.labeled_block(1):
+    asm.extend(body)
+    asm.emit("subs", GPR(0), GPR(0), Imm(1))
+    asm.emit("b.ne", "1b")
+  return asm.code
+
+
+def test_zt0_resources():
+  """ The table and its elements overlap by byte offset, w and x views of a register alias """
+  assert dataflow.operand_resources(ZT0(8), {}) == {f"zt0:{byte}" for byte in range(8, 16)}
+  assert dataflow.operand_resources(ZT0(8), {}) < dataflow.operand_resources(ZT0(), {})
+  assert not dataflow.operand_resources(ZT0(0), {}) & dataflow.operand_resources(ZT0(8), {})
+  assert dataflow.operand_resources(GPR(2, 32), {}) == dataflow.operand_resources(GPR(2), {}) == {"x2"}
+
+
+def test_zt0_waw_fails_verification():
+  """ 16 movt to zt0[8*(i % 8)] write every element twice """
+  body = [Instr("movt", (ZT0(8*(i % 8)), GPR(gen_op_benchmarks.GPR_OPERANDS[i]))) for i in range(16)]
+  with pytest.raises(AssertionError, match = r"WAW on zt0:0, [^\n]*: movt zt0\[0\], x2 -> movt zt0\[0\], x15"):
+    dataflow.verify_kernel("movt_zt0", kernel(body), 16)
+
+  dataflow.verify_kernel("movt_zt0", kernel(body[:8]), 8)
+
+
+def test_zt0_waw_at_ilp_16_fails_generation(monkeypatch):
+  """ ZT0 element destinations are limited to 8 independent instructions, beyond that the kernel is rejected """
+  assert gen_op_benchmarks.InstructionEncoder(MOVT_TO_ZT0).max_independent_instructions == 8
+  make_benchmark_function(MOVT_TO_ZT0, 8)
+
+  # lift the limit of the encoder: the elements repeat and the verification catches the WAW
+  init = gen_op_benchmarks.ZT0OperandEncoder.__init__
+  def unlimited(self, *args, **kwargs):
+    init(self, *args, **kwargs)
+    self.max_independent_instructions = 32
+  monkeypatch.setattr(gen_op_benchmarks.ZT0OperandEncoder, "__init__", unlimited)
+
+  with pytest.raises(AssertionError, match = r"^movt_zt0_slice_u64_u64_ilp16: instructions are not independent\n(.|\n)*WAW on zt0:"):
+    make_benchmark_function(MOVT_TO_ZT0, 16)
+
+
+def test_gpr_destination_waw_fails_verification():
+  """ Two movt writing the same general-purpose register (x or w view) are not independent """
+  body = [Instr("movt", (GPR(2), ZT0(0))), Instr("movt", (GPR(2, 32), ZT0(8)))]
+  with pytest.raises(AssertionError, match = r"WAW on x2"):
+    dataflow.verify_kernel("movt_gpr", kernel(body), 2)
+
+
+def test_zt0_operations_verify():
+  """ The ZT0 operations of benchmarks.yaml (movt to x registers, luti) verify at their maximal ILP """
+  with open(os.path.join(ROOT, "benchmarks.yaml")) as file:
+    operations = [Operation.from_yaml(y) for y in yaml.safe_load(file)]
+  operations = [op for op in operations if op.category == "Data Movement (ZT0)"]
+  assert {op.opcode for op in operations} == {"movt", "luti2", "luti4"}
+
+  for op in operations:
+    make_benchmark_function(op, min(gen_op_benchmarks.InstructionEncoder(op).max_independent_instructions, 16))
@@ -0,0 +1,50 @@
+import os, json, shutil, subprocess, sys
+import pytest
+import yaml
+import codegen, gen_gemm_benchmarks
+from conftest import ROOT
+
+# End-to-end run of the portable backend (see tools/portable.py): the generated stand-ins are
+# built with the address and undefined behaviour sanitizers and run by the command line driver
+
+CC = os.environ.get("CC", "cc")
+SANITIZE = ["-fsanitize=address,undefined", "-fno-sanitize-recover=all"]
+SUITES = ["op_benchmarks", "mem_benchmarks", "mixed_benchmarks", "gemm_benchmarks"]
+
+def generate(output: str, suite: str, *args: str):
+  subprocess.run([sys.executable, os.path.join("tools", f"gen_{suite}.py"), os.path.join(output, suite), "--backend", "portable", "--shards", "2", *args], cwd = ROOT, check = True)
+
+
+def build(output: str) -> str:
+  shutil.copy(os.path.join(ROOT, "src", "benchmarks", "bench.h"), output)
+  sources = [os.path.join(ROOT, "portable", "main.c"), *(os.path.join(ROOT, "src", "benchmarks", name) for name in ["harness.c", "counters.c"])]
+  sources += [os.path.join(output, suite, name) for suite in SUITES for name in sorted(os.listdir(os.path.join(output, suite))) if name.endswith(".c")]
+  driver = os.path.join(output, "smetest")
+  subprocess.run([CC, "-std=c2x", "-O1", "-g", "-pthread", *SANITIZE, f"-I{output}", "-o", driver, *sources], check = True)
+  return driver
+
+
+@pytest.mark.skipif(shutil.which(CC) is None, reason = f"no C compiler ({CC})")
+def test_gemm_portable_run(tmp_path):
+  """ Every GEMM stand-in stores its C blocks within the buffers of the setup """
+  output = str(tmp_path)
+  with open(os.path.join(ROOT, "benchmarks.yaml")) as file:
+    operations = [gen_gemm_benchmarks.Operation.from_yaml(y) for y in yaml.safe_load(file)]
+
+  # one repetition of every kernel (the default run length takes minutes under the sanitizers)
+  benchmarks = list(gen_gemm_benchmarks.generate_benchmarks(operations, codegen.KernelCache(None, gen_gemm_benchmarks.Benchmark, []), codegen.Calibration(None, "gemm_benchmarks", "n_ops")))
+  calibration = {"gemm_benchmarks": [{"label": bench.label, "tile_rows": bench.tile_rows, "tile_cols": bench.tile_cols, "k_unroll": bench.k_unroll, "n_ops": 1} for bench in benchmarks]}
+  with open(os.path.join(output, "calibration.json"), "w") as file: json.dump(calibration, file)
+
+  for suite in SUITES[:-1]: generate(output, suite, "--filter", "False")
+  generate(output, "gemm_benchmarks", "--calibration", os.path.join(output, "calibration.json"), "--shapes", "128x128x64")
+  driver = build(output)
+
+  results = os.path.join(output, "results")
+  os.makedirs(results)
+  run = subprocess.run([driver, "-o", results, "-t", "gemm", "-n", "1", "-j", "1,0"], capture_output = True, text = True)
+  assert run.returncode == 0, run.stderr[-4000:]
+
+  with open(os.path.join(results, "gemm_benchmarks.json")) as file: report = json.load(file)
+  assert {row["label"] for row in report} == {bench.label for bench in benchmarks}
+  assert len(report) == len(benchmarks)
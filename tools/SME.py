@@ -1,12 +1,15 @@
 import sys
 assert sys.version_info >= (3, 10), "Requires Python 3.10 or later"
 
-import collections, yaml
+import re, collections, yaml
 from types import SimpleNamespace
-from dataclasses import dataclass
-from typing import assert_never, Literal
+from dataclasses import dataclass, replace
+from typing import assert_never, Literal, Callable
 from contextlib import contextmanager
 
+# streaming vector length in bytes (the generated code assumes SVL = 512 bits)
+SVL_BYTES = 64
+
 # SME data types
 @dataclass(kw_only=True)
 class SMEType:
@@ -42,37 +45,548 @@ class Types:
   def __new__(cls):
     raise Exception("this class cannot be instantiated")
 
+# Instruction IR
+#
+# Kernels are built from Instr values with typed operands instead of text, so that generators
+# can transform them with the passes below (unroll, interleave, software_pipeline,
+# rename_registers) and analysis tools can inspect them without parsing. Every operand renders
+# to the assembly syntax with str(), plain strings (loop labels, condition codes, shifts) are
+# accepted as untyped operands and emitted verbatim. Kernels that are only available as text
+# (the kernel cache, generated sources) are parsed back into the same IR (see parse_kernel).
+#
+# Register effects follow the conventions of the dataflow verification (dataflow.py): stores
+# and compares read all operands, every other instruction writes its first operand and, unless
+# it only produces a value (loads, moves, predicate and ZA initialization), also reads it.
+
+@dataclass(frozen=True)
+class GPR:
+  """ General-purpose register, e.g. x1 or w12 (both views name the register x<index>) """
+  index: int
+  width: Literal[32, 64] = 64
+
+  def __str__(self): return f"{"x" if self.width == 64 else "w"}{self.index}"
+
+  @property
+  def registers(self) -> tuple[str, ...]: return (f"x{self.index}",)
+
+
+@dataclass(frozen=True)
+class Imm:
+  """ Immediate, e.g. #64 """
+  value: int
+
+  def __str__(self): return f"#{self.value}"
+
+  @property
+  def registers(self) -> tuple[str, ...]: return ()
+
+
+@dataclass(frozen=True)
+class Arg:
+  """ Named operand of the enclosing C asm statement, e.g. %[n] """
+  name: str
+
+  def __str__(self): return f"%[{self.name}]"
+
+  @property
+  def registers(self) -> tuple[str, ...]: return ()
+
+
+@dataclass(frozen=True)
+class Z:
+  """ Z register, optionally typed or indexed, e.g. z3, z3.s or z3.s[1] """
+  index: int
+  suffix: str | None = None
+  lane: int | None = None
+
+  def __str__(self):
+    suffix = f".{self.suffix}" if self.suffix is not None else ""
+    lane = f"[{self.lane}]" if self.lane is not None else ""
+    return f"z{self.index}{suffix}{lane}"
+
+  @property
+  def registers(self) -> tuple[str, ...]: return (f"z{self.index}",)
+
+  def renamed(self, mapping: dict[int, int]) -> "Z":
+    return replace(self, index = mapping.get(self.index, self.index))
+
+
+@dataclass(frozen=True)
+class ZGroup:
+  """ Multi-vector group of consecutive or strided Z registers, e.g. {z0.s-z3.s} or {z0.s, z8.s} """
+  first: int
+  count: int
+  suffix: str | None = None
+  stride: int = 1
+
+  def __str__(self):
+    names = [str(Z(index, self.suffix)) for index in self.indices]
+    if self.stride == 1 and self.count > 1: return f"{{{names[0]}-{names[-1]}}}"
+    return f"{{{", ".join(names)}}}"
+
+  @property
+  def indices(self) -> range: return range(self.first, self.first + self.count*self.stride, self.stride)
+
+  @property
+  def registers(self) -> tuple[str, ...]: return tuple(f"z{index}" for index in self.indices)
+
+  def renamed(self, mapping: dict[int, int]) -> "ZGroup":
+    if self.first not in mapping: return self
+    indices = [mapping.get(index, index) for index in self.indices]
+    assert indices == list(range(indices[0], indices[0] + self.count*self.stride, self.stride)), f"{self} is renamed to non-contiguous registers"
+    return replace(self, first = indices[0])
+
+
+@dataclass(frozen=True)
+class ZATile:
+  """ ZA tile, e.g. za1.s """
+  index: int
+  suffix: str
+
+  def __str__(self): return f"za{self.index}.{self.suffix}"
+
+  @property
+  def registers(self) -> tuple[str, ...]: return ("za",)
+
+
+@dataclass(frozen=True)
+class ZASlice:
+  """ ZA array vectors or tile slices selected by a base register and an offset range
+
+      e.g. za[w12, 3], za.s[w8, 0:1, VGx2] (array vectors) or za0h.s[w12, 0] (horizontal slice of tile 0)
+  """
+  base: GPR
+  offset: int
+  count: int = 1
+  vgsize: int = 1
+  suffix: str | None = None
+  tile: int | None = None
+  direction: Literal["h", "v"] | None = None
+
+  def __str__(self):
+    tile = f"{self.tile}{self.direction}" if self.tile is not None else ""
+    suffix = f".{self.suffix}" if self.suffix is not None else ""
+    offsets = f"{self.offset}:{self.offset + self.count - 1}" if self.count > 1 else str(self.offset)
+    vgsize = f", VGx{self.vgsize}" if self.vgsize > 1 else ""
+    return f"za{tile}{suffix}[{self.base}, {offsets}{vgsize}]"
+
+  @property
+  def registers(self) -> tuple[str, ...]: return ("za", *self.base.registers)
+
+
+@dataclass(frozen=True)
+class ZAList:
+  """ List of ZA tiles (zero), {za} for the whole array """
+  tiles: tuple[ZATile, ...] = ()
+
+  def __str__(self): return f"{{{", ".join(str(tile) for tile in self.tiles) or "za"}}}"
+
+  @property
+  def registers(self) -> tuple[str, ...]: return ("za",)
+
+
+@dataclass(frozen=True)
+class ZT0:
+  """ Lookup table register (SME2), e.g. zt0 or zt0[8] (the 64-bit element at byte offset 8) """
+  offset: int | None = None
+
+  def __str__(self): return f"zt0[{self.offset}]" if self.offset is not None else "zt0"
+
+  @property
+  def registers(self) -> tuple[str, ...]: return ("zt0",)
+
+
+@dataclass(frozen=True)
+class P:
+  """ Predicate register, e.g. p0.s, p0/m or p1/z """
+  index: int
+  suffix: str | None = None
+  qualifier: Literal["m", "z"] | None = None
+
+  def __str__(self):
+    suffix = f".{self.suffix}" if self.suffix is not None else ""
+    qualifier = f"/{self.qualifier}" if self.qualifier is not None else ""
+    return f"p{self.index}{suffix}{qualifier}"
+
+  @property
+  def registers(self) -> tuple[str, ...]: return (f"p{self.index}",)
+
+
+@dataclass(frozen=True)
+class PN:
+  """ Predicate-as-counter register (pn8..pn15, aliasing p8..p15), e.g. pn8.s or pn8/z """
+  index: int
+  suffix: str | None = None
+  qualifier: Literal["z"] | None = None
+
+  def __post_init__(self):
+    assert 8 <= self.index <= 15, f"invalid predicate-as-counter register pn{self.index}"
+
+  def __str__(self):
+    suffix = f".{self.suffix}" if self.suffix is not None else ""
+    qualifier = f"/{self.qualifier}" if self.qualifier is not None else ""
+    return f"pn{self.index}{suffix}{qualifier}"
+
+  @property
+  def registers(self) -> tuple[str, ...]: return (f"p{self.index}",)
+
+
+@dataclass(frozen=True)
+class Address:
+  """ Base register plus a vector-length scaled offset, e.g. [x1, 2, MUL VL] """
+  base: GPR
+  offset: int = 0
+
+  def __str__(self): return f"[{self.base}, {self.offset}, MUL VL]"
+
+  @property
+  def registers(self) -> tuple[str, ...]: return self.base.registers
+
+
+Operand = GPR | Imm | Arg | Z | ZGroup | ZATile | ZASlice | ZAList | ZT0 | P | PN | Address | str
+
+# instructions that produce their first operand without reading it (opcode prefixes and scalar opcodes)
+PRODUCING_PREFIXES = ("ld", "mov", "ptrue", "pfalse", "while", "dup", "zero", "index", "csel")
+PRODUCING_OPCODES = ("add", "adds", "sub", "subs")
+# instructions that only read their operands
+CONSUMING_PREFIXES = ("st", "cmp", "b.", "prf")
+CONSUMING_OPCODES = ("b", "cbz", "cbnz", "tst")
+
+@dataclass(frozen=True)
+class Instr:
+  """ An instruction: opcode and typed operands """
+  opcode: str
+  operands: tuple[Operand, ...] = ()
+
+  def __str__(self): return f"{self.opcode} {", ".join(str(operand) for operand in self.operands)}"
+
+  @staticmethod
+  def registers_of(operand: Operand) -> tuple[str, ...]:
+    return () if isinstance(operand, str) else operand.registers
+
+  @property
+  def is_producing(self) -> bool:
+    return self.opcode.startswith(PRODUCING_PREFIXES) or self.opcode in PRODUCING_OPCODES
+
+  @property
+  def writes(self) -> tuple[str, ...]:
+    """ Registers written (Z, P, ZA as a whole and general-purpose registers as x<n>) """
+    if not self.operands or self.opcode.startswith(CONSUMING_PREFIXES) or self.opcode in CONSUMING_OPCODES: return ()
+    destination = self.operands[0]
+    return ("za",) if isinstance(destination, ZASlice) else self.registers_of(destination)
+
+  @property
+  def reads(self) -> tuple[str, ...]:
+    """ Registers read (the base registers of ZA slices and addresses included) """
+    operands = self.operands[1:] if self.writes and self.is_producing else self.operands
+    reads = tuple(register for operand in operands for register in self.registers_of(operand))
+    # the base register of a written ZA slice is read
+    if self.writes and self.is_producing and isinstance(self.operands[0], ZASlice):
+      reads += self.operands[0].base.registers
+    return reads
+
+  @property
+  def signature(self) -> str:
+    """ Instruction form without register numbers and immediates, e.g. fmopa za.s, p/m, p/m, z.s, z.s """
+    text = re.sub(r"\b(za|zt|pn|z|p|w|x)\d+\b", r"\1", str(self))
+    return re.sub(r"#?\b\d+\b", "#", text)
+
+  @property
+  def is_scalar(self) -> bool:
+    """ Loop control and address arithmetic (general-purpose registers, immediates, labels and condition codes only) """
+    return all(isinstance(operand, GPR | Imm | Arg | str) for operand in self.operands)
+
+  @property
+  def is_memory(self) -> bool:
+    return any(isinstance(operand, Address) for operand in self.operands)
+
+  def renamed(self, mapping: dict[int, int]) -> "Instr":
+    """ Instruction with the Z registers renamed (index -> index) """
+    return replace(self, operands = tuple(operand.renamed(mapping) if isinstance(operand, Z | ZGroup) else operand for operand in self.operands))
+
+  def advanced(self, offset: int, base: GPR | None = None) -> "Instr":
+    """ Instruction with the (VL-scaled) offsets of its addresses on base (or all addresses) advanced """
+    return replace(self, operands = tuple(
+      replace(operand, offset = operand.offset + offset) if isinstance(operand, Address) and base in [None, operand.base] else operand
+      for operand in self.operands
+    ))
+
+
+@dataclass(frozen=True)
+class Label:
+  """ Numeric local label (the target of 1b/1f branches) """
+  label: int
+
+  def __str__(self): return f"{self.label}:"
+
+
 class AsmBlock:
-  """ Simple gcc assembly block emitter """
+  """ Simple gcc assembly block emitter
+
+      The block is a list of instructions and labels with their nesting depth, rendered to
+      padded string literals by join (expanded kernels) or compact (compact kernels) in a
+      single pass. Operands may be typed (see Instr) or plain strings.
+  """
   def __init__(self, width: int = 60):
     self.width = width
-    self.lines = []
-    self.indent = ""
+    self.items: list[tuple[int, Instr | Label]] = []
+    self.depth = 0
 
   def emit(self, opcode: str, *args):
-    line = f"{self.indent}{opcode} {", ".join(str(arg) for arg in args if arg is not None)}"
-    self.width = max(self.width, len(line))
-    self.lines.append(line)
+    self.items.append((self.depth, Instr(opcode, tuple(arg for arg in args if arg is not None))))
+
+  def extend(self, instructions):
+    """ Append instructions (e.g. the result of a pass) at the current depth """
+    self.items.extend((self.depth, instruction) for instruction in instructions)
 
   @contextmanager
   def labeled_block(self, label: int):
-    self.emit(f"{label}:")
-    indent = self.indent
-    self.indent = self.indent + "  "
+    self.items.append((self.depth, Label(label)))
+    self.depth += 1
     yield
-    self.indent = indent
+    self.depth -= 1
+
+  @property
+  def code(self) -> list[Instr | Label]:
+    """ The instructions and labels of the block (see hot_loop) """
+    return [item for (_, item) in self.items if isinstance(item, Label) or item.opcode]
+
+  @property
+  def instructions(self) -> list[Instr]:
+    """ The instructions of the block (without labels and spacers) """
+    return [item for (_, item) in self.items if isinstance(item, Instr) and item.opcode]
+
+  @property
+  def lines(self) -> list[str]:
+    return ["  "*depth + str(item) for (depth, item) in self.items]
 
   def join(self, first_ident = 0, second_ident = 8):
-    lines = ['"' + line.ljust(self.width) + '\\n"' for line in self.lines]
+    lines = self.lines
+    width = max([self.width, *(len(line) for line in lines)])
+    lines = ['"' + line.ljust(width) + '\\n"' for line in lines]
 
     first = "".ljust(first_ident)
     second = "".ljust(second_ident)
 
-    if len(lines) == 0:
-      return first
+    return first + f"\n{second}".join(lines)
+
+  def compact(self, indent = 2):
+    """ Unpadded string literals of the non-empty lines (for the compact kernels), "" if there are none """
+    lines = [f'"{line.strip()}\\n"' for line in self.lines if line.strip()]
+
+    return f"\n{"".ljust(indent)}".join(lines) if lines else '""'
+
+
+# Governing predicates of the benchmarks
+#
+# Predicated benchmarks run with all-true predicates (ptrue) or, to measure the cost of partial
+# vectors at matrix edges and loop tails, with only the first lanes active. Partial predicates
+# are generated like in a tail loop, with whilelt from zero to the active lane count (held in
+# x24 for p0/pn8, x25 for p1, ...).
+
+# default fractions of active lanes of the predicated benchmarks (1.0 is all-true)
+PREDICATE_DENSITIES = [1.0, 0.75, 0.5, 0.25]
+
+def active_lanes(lanes: int, density: float) -> int | None:
+  """ Number of active lanes of a predicate covering lanes elements, None if all are active """
+  assert 0.0 < density <= 1.0, f"invalid predicate density {density}"
+  return None if density == 1.0 else max(round(lanes*density), 1)
+
+
+def predicate_label(label: str, density: float) -> str:
+  """ Benchmark label with the fraction of active lanes (unchanged for all-true predicates) """
+  return label if density == 1.0 else f"{label}, {round(density*100)}% active lanes"
+
+
+# registers holding the active lane counts (x29 and x30 are the frame pointer and link register)
+PREDICATE_COUNT_REGISTERS = [24, 25, 26, 27, 28]
+
+def predicate_count(predicate: P | PN) -> GPR:
+  """ Register holding the active lane count of a partial predicate (p0-p4 or pn8-pn12) """
+  index = predicate.index % 8
+  assert index < len(PREDICATE_COUNT_REGISTERS), f"no lane count register for predicate {predicate}"
+  return GPR(PREDICATE_COUNT_REGISTERS[index])
+
+
+def emit_predicate(asm: AsmBlock, predicate: P | PN, active: int | None = None, vgsize: int = 1):
+  """ Initialize a governing predicate: all-true or the first active lanes (predicate-as-counters
+      count the lanes of vgsize vectors)
+  """
+  if active is None:
+    asm.emit("ptrue", predicate)
+    return
+
+  assert isinstance(predicate, P) or vgsize in [2, 4], "predicate-as-counters cover two or four vectors"
+  asm.emit("mov", predicate_count(predicate), Imm(active))
+  asm.emit("whilelt", predicate, "xzr", predicate_count(predicate), f"vlx{vgsize}" if isinstance(predicate, PN) else None)
+
+
+# Passes over instruction lists (the results can be appended with AsmBlock.extend)
+def unroll(body: list[Instr], n: int, rename: Callable[[Instr, int], Instr] | None = None) -> list[Instr]:
+  """ n copies of a loop body, rename(instruction, copy) adjusts the operands of each copy """
+  return [rename(instruction, copy) if rename is not None else instruction for copy in range(n) for instruction in body]
+
+
+def interleave(first: list, second: list) -> list:
+  """ Merge two instruction streams, spreading the instructions of both evenly over the result
+
+      The i-th of n instructions of a stream is placed at (i + 0.5)/n, ties go to the first stream.
+  """
+  slots = [((i + 0.5)/len(first), 0, i) for i in range(len(first))]
+  slots += [((i + 0.5)/len(second), 1, i) for i in range(len(second))]
+
+  return [(first, second)[stream][index] for (_, stream, index) in sorted(slots)]
+
+
+def software_pipeline(stages: list[list[Instr]]) -> tuple[list[Instr], list[Instr], list[Instr]]:
+  """ (prologue, kernel, epilogue) of a loop whose iterations are split into consecutive stages
+
+      The kernel runs stage s of iteration i - s, the last stage first, so that every stage
+      consumes the values of the previous iteration's earlier stage before they are overwritten
+      (values must not live longer than one stage). The prologue starts the first
+      len(stages) - 1 iterations, the epilogue drains them: a loop of n iterations runs the
+      kernel n - len(stages) + 1 times.
+  """
+  depth = len(stages)
+  prologue = [instruction for time in range(depth - 1) for stage in reversed(range(time + 1)) for instruction in stages[stage]]
+  kernel = [instruction for stage in reversed(range(depth)) for instruction in stages[stage]]
+  epilogue = [instruction for time in range(1, depth) for stage in reversed(range(time, depth)) for instruction in stages[stage]]
+
+  return (prologue, kernel, epilogue)
+
+
+def rename_registers(instructions: list[Instr], pool: range) -> list[Instr]:
+  """ Give every Z register value produced in the instructions a fresh register from the pool
+
+      Registers are allocated round-robin, so a register is only reused after all others of
+      the pool (e.g. the loads of unrolled copies of a loop body no longer overwrite each
+      other's registers). Registers read before they are written (inputs and accumulators) and
+      values written by an instruction that also reads them keep their registers, groups are
+      allocated aligned to their size. Linear in the number of instructions.
+  """
+  # live-in registers cannot be renamed or allocated
+  (written, live_in) = (set(), set())
+  for instruction in instructions:
+    live_in.update(register for register in instruction.reads if register not in written)
+    written.update(instruction.writes)
+  free = {index for index in pool if f"z{index}" not in live_in}
+
+  def allocate(count: int) -> int:
+    nonlocal cursor
+    for _ in range(len(pool) + 1):
+      first = cursor + (-cursor % count)
+      if first + count > pool.stop:
+        cursor = pool.start
+        continue
+      cursor = first + count
+      if all(index in free for index in range(first, first + count)): return first
+    assert False, f"no {count} consecutive free registers in {pool}"
+
+  (mapping, renamed, cursor) = ({}, [], pool.start)
+  for instruction in instructions:
+    destination = instruction.operands[0] if instruction.writes else None
+    if isinstance(destination, Z | ZGroup) and not set(instruction.writes) & set(instruction.reads):
+      indices = destination.indices if isinstance(destination, ZGroup) else [destination.index]
+      assert not isinstance(destination, ZGroup) or destination.stride == 1, f"cannot rename the strided group {destination}"
+      # the sources are read with the previous mapping
+      sources = replace(instruction, operands = instruction.operands[1:]).renamed(mapping)
+      first = allocate(len(indices))
+      mapping.update({index: first + i for (i, index) in enumerate(indices)})
+      renamed.append(replace(instruction, operands = (destination.renamed(mapping), *sources.operands)))
+    else:
+      renamed.append(instruction.renamed(mapping))
+
+  return renamed
+
+
+# Parsing of generated assembly into the IR (kernels from the cache and generated sources)
+def asm_lines(source: str) -> list[str]:
+  """ Non-empty lines of the inline assembly blocks in generated C source """
+  lines = (re.fullmatch(r'\s*"(.*)\\n"\s*', line) for line in source.splitlines())
+  return [match[1].strip() for match in lines if match and match[1].strip()]
+
+
+def split_operands(text: str) -> list[str]:
+  """ Split an operand list at the top-level commas (not inside [] or {}) """
+  operands = []
+  (depth, start) = (0, 0)
+  for (i, char) in enumerate(text):
+    if char in "[{": depth += 1
+    if char in "]}": depth -= 1
+    if char == "," and depth == 0:
+      operands.append(text[start:i].strip())
+      start = i + 1
+  if text[start:].strip(): operands.append(text[start:].strip())
+
+  return operands
+
+
+def parse_operand(text: str) -> Operand:
+  """ Typed operand of its assembly syntax (text that names no register is kept as an untyped operand) """
+  if match := re.fullmatch(r"([xw])(\d+)", text):
+    return GPR(int(match[2]), 64 if match[1] == "x" else 32)
+  if match := re.fullmatch(r"#(-?\d+)", text):
+    return Imm(int(match[1]))
+  if match := re.fullmatch(r"%\[(\w+)\]", text):
+    return Arg(match[1])
+  if match := re.fullmatch(r"z(\d+)(?:\.(\w))?(?:\[(\d+)\])?", text):
+    return Z(int(match[1]), match[2], int(match[3]) if match[3] is not None else None)
+  if match := re.fullmatch(r"\{z(\d+)(?:\.(\w))?-z(\d+)(?:\.\w)?\}", text):
+    return ZGroup(int(match[1]), int(match[3]) - int(match[1]) + 1, match[2])
+  if text.startswith("{z") and not text.startswith("{za"):
+    registers = [parse_operand(name) for name in split_operands(text.strip("{}"))]
+    stride = registers[1].index - registers[0].index if len(registers) > 1 else 1
+    return ZGroup(registers[0].index, len(registers), registers[0].suffix, stride)
+  if match := re.fullmatch(r"za(\d+)\.(\w)", text):
+    return ZATile(int(match[1]), match[2])
+  if match := re.fullmatch(r"za(?:(\d+)([hv]))?(?:\.(\w))?\[([xw]\d+), (\d+)(?::(\d+))?(?:, VGx(\d))?\]", text):
+    (tile, direction, suffix, base, first, last, vgsize) = match.groups()
+    return ZASlice(
+      parse_operand(base), int(first), int(last) - int(first) + 1 if last is not None else 1, int(vgsize or 1), suffix,
+      int(tile) if tile is not None else None, direction
+    )
+  if text.startswith("{za"):
+    return ZAList(tuple(parse_operand(tile) for tile in split_operands(text.strip("{}")) if tile != "za"))
+  if match := re.fullmatch(r"zt0(?:\[(\d+)\])?", text):
+    return ZT0(int(match[1]) if match[1] is not None else None)
+  if match := re.fullmatch(r"p(\d+)(?:\.(\w))?(?:/([mz]))?", text):
+    return P(int(match[1]), match[2], match[3])
+  if match := re.fullmatch(r"pn(\d+)(?:\.(\w))?(?:/(z))?", text):
+    return PN(int(match[1]), match[2], match[3])
+  if match := re.fullmatch(r"\[(x\d+)(?:, (-?\d+), MUL VL)?\]", text):
+    return Address(parse_operand(match[1]), int(match[2] or 0))
+
+  return text
+
+
+def parse_instr(line: str) -> Instr | Label:
+  """ IR of a line of assembly (the inverse of str) """
+  if match := re.fullmatch(r"(\d+):", line): return Label(int(match[1]))
+  (opcode, _, operands) = line.partition(" ")
+  return Instr(opcode, tuple(parse_operand(operand) for operand in split_operands(operands)))
+
+
+def parse_kernel(source: str) -> list[Instr | Label]:
+  """ Instructions and labels of the inline assembly of a generated kernel """
+  return [parse_instr(line) for line in asm_lines(source)]
+
+
+def hot_loop(code: list[Instr | Label]) -> list[Instr]:
+  """ Instructions of the main benchmark loop (of AsmBlock.code or parse_kernel)
+
+      Loops are delimited by a numeric label and a backward branch to it. The hot loop is the
+      innermost loop with the most instructions (e.g. the unrolled body rather than the tail loop).
+  """
+  labels = {}
+  loops = []
+  for (i, item) in enumerate(code):
+    if isinstance(item, Label):
+      labels[item.label] = i
+    elif item.opcode.split(".")[0] == "b" and len(item.operands) == 1 and (match := re.fullmatch(r"(\d+)b", str(item.operands[0]))) and int(match[1]) in labels:
+      loops.append((labels[int(match[1])], i))
 
-    out = first + lines[0]
-    for line in lines[1:]:
-      out = f"{out}\n{second}{line}"
+  innermost = [(start, end) for (start, end) in loops if not any(start < s and e < end for (s, e) in loops)]
+  assert len(innermost) > 0, "no benchmark loop found"
+  (start, end) = max(innermost, key = lambda loop: loop[1] - loop[0])
 
-    return out
+  return [item for item in code[start + 1:end + 1] if isinstance(item, Instr)]
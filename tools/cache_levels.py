@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+import sys
+assert sys.version_info >= (3, 10), "Requires Python 3.10 or later"
+
+import json, math, argparse
+from dataclasses import dataclass, asdict
+import numpy as np
+import results, stats
+from plan_sweep import series
+
+# Cache hierarchy detection from bandwidth-vs-size curves
+#
+# The bandwidth of a memory benchmark is piecewise constant over the buffer size: a plateau per
+# cache level, dropping when the working set exceeds its capacity. Every series (benchmark and
+# thread configuration, best alignment) is segmented by binary segmentation on log bandwidth:
+# the split that reduces the squared error most is accepted if the plateaus on both sides differ
+# by more than the minimal change, and both sides are segmented again. A boundary lies between the
+# last size of one plateau and the first size of the next.
+#
+# The sizes are per thread, so the boundaries of shared cache levels move to smaller sizes with
+# more threads. The summary segments the best bandwidth over all load benchmarks of a thread
+# configuration, which is the compact description (capacities and attainable bandwidth per
+# level) for tiling code.
+
+# series identity (the alignment is reduced to the best one, older reports have no predicate density)
+SERIES_KEYS = ["op_type", "encoding", "n_vectors", "predicate_density", "ilp", "threads_h", "threads_l"]
+# older report format (sme-memcpy)
+LEGACY_SERIES_KEYS = ["type", "unroll", "storage", "threads"]
+
+@dataclass(kw_only=True)
+class Level:
+  # median bandwidth of the plateau (GB/s)
+  gbps: float
+  # measured buffer sizes of the plateau
+  min_size: int
+  max_size: int
+
+
+@dataclass(kw_only=True)
+class Boundary:
+  # capacity estimate (geometric mean of the sizes around the drop) and its bracket
+  size: int
+  lower: int
+  upper: int
+  # bandwidth ratio between the plateaus
+  drop: float
+
+
+def segment(y: np.ndarray, min_change: float = 0.15, min_points: int = 2) -> list[int]:
+  """ Start indices of the plateaus of a sequence of log bandwidths (binary segmentation) """
+  def split(start: int, end: int) -> list[int]:
+    best = None
+    for j in range(start + min_points, end - min_points + 1):
+      (left, right) = (y[start:j], y[j:end])
+      cost = np.sum((left - left.mean())**2) + np.sum((right - right.mean())**2)
+      if abs(np.median(left) - np.median(right)) > math.log(1 + min_change) and (best is None or cost < best[0]):
+        best = (cost, j)
+
+    if best is None: return []
+    return split(start, best[1]) + [best[1]] + split(best[1], end)
+
+  return [0] + split(0, len(y))
+
+
+def detect_levels(size: np.ndarray, gbps: np.ndarray, min_change: float = 0.15, min_points: int = 2) -> tuple[list[Level], list[Boundary]]:
+  """ Plateaus and boundaries of one bandwidth curve """
+  order = np.argsort(size)
+  (size, gbps) = (size[order], gbps[order])
+  valid = gbps > 0
+  (size, gbps) = (size[valid], gbps[valid])
+  if len(size) == 0: return ([], [])
+
+  starts = segment(np.log(gbps), min_change, min_points)
+  ends = starts[1:] + [len(size)]
+  levels = [Level(gbps = float(np.median(gbps[s:e])), min_size = int(size[s]), max_size = int(size[e - 1])) for (s, e) in zip(starts, ends)]
+  boundaries = [
+    Boundary(
+      size = int(round(math.sqrt(size[j - 1]*size[j]))),
+      lower = int(size[j - 1]),
+      upper = int(size[j]),
+      drop = before.gbps/after.gbps
+    )
+    for (j, before, after) in zip(starts[1:], levels[:-1], levels[1:])
+  ]
+
+  return (levels, boundaries)
+
+
+def series_table(data: results.Results, min_change: float = 0.15, min_points: int = 2) -> list[dict]:
+  """ Detected levels of every series of a memory report """
+  keys = [key for key in SERIES_KEYS if key in data.columns] if "op_type" in data.columns else LEGACY_SERIES_KEYS
+  gbps = stats.median(data.sample_matrix())
+  columns = {key: data[key] for key in keys + ["size"]}
+
+  table = []
+  for rows in series(data, keys):
+    # best alignment per size
+    sizes = np.unique(columns["size"][rows])
+    best = np.array([np.nanmax(gbps[rows][columns["size"][rows] == s], initial = 0) for s in sizes])
+    (levels, boundaries) = detect_levels(sizes, best, min_change, min_points)
+    key = {name: columns[name][rows[0]].item() if hasattr(columns[name][rows[0]], "item") else columns[name][rows[0]] for name in keys}
+    table.append({**key, "levels": [asdict(level) for level in levels], "boundaries": [asdict(boundary) for boundary in boundaries]})
+
+  return table
+
+
+def thread_configs(data: results.Results) -> tuple[list[str], list[tuple]]:
+  """ Thread configuration columns and their values """
+  keys = ["threads_h", "threads_l"] if "threads_h" in data.columns else ["threads"]
+  values = sorted(set(zip(*(data[key].tolist() for key in keys))))
+  return (keys, values)
+
+
+def summary(data: results.Results, min_change: float = 0.15, min_points: int = 2) -> list[dict]:
+  """ Levels of the best load bandwidth per size for every thread configuration """
+  data = data.where(op_type = "load") if "op_type" in data.columns else data.where(type = "load")
+  # the attainable bandwidth (all-true predicates)
+  if "predicate_density" in data.columns: data = data.where(predicate_density = 1.0)
+  gbps = stats.median(data.sample_matrix())
+  (keys, configs) = thread_configs(data)
+
+  table = []
+  for config in configs:
+    rows = np.flatnonzero(np.all([data[key] == value for (key, value) in zip(keys, config)], axis = 0))
+    sizes = np.unique(data["size"][rows])
+    best = np.array([np.nanmax(gbps[rows][data["size"][rows] == s], initial = 0) for s in sizes])
+    (levels, boundaries) = detect_levels(sizes, best, min_change, min_points)
+    n_threads = sum(config)
+
+    table.append({
+      **dict(zip(keys, config)),
+      # capacities per thread and for all threads (shared levels have a constant total)
+      "capacities": [boundary.size for boundary in boundaries],
+      "total_capacities": [boundary.size*n_threads for boundary in boundaries],
+      "bandwidths": [level.gbps for level in levels]
+    })
+
+  return table
+
+
+def main():
+  parser = argparse.ArgumentParser(description = "Detect cache capacities and per-level bandwidth from a memory benchmark report")
+  parser.add_argument("report", nargs = "?", default = "results/sme-memcpy.json", help = "memory benchmark report")
+  parser.add_argument("--min-change", type = float, default = 0.15, help = "minimal relative bandwidth change between levels")
+  parser.add_argument("--min-points", type = int, default = 2, help = "minimal number of sizes per level")
+  parser.add_argument("-o", "--output", default = None, help = "write the levels to this JSON file")
+  args = parser.parse_args()
+
+  data = results.load(args.report)
+  table = series_table(data, args.min_change, args.min_points)
+  levels = summary(data, args.min_change, args.min_points)
+
+  # the summary per thread configuration
+  fmt = lambda values, unit: " ".join(f"{value/1024:.0f}K" if unit == "size" else f"{value:.0f}" for value in values)
+  results.print_table({
+    "threads": np.array([",".join(str(entry[key]) for key in ["threads_h", "threads_l", "threads"] if key in entry) for entry in levels], dtype = object),
+    "capacities": np.array([fmt(entry["capacities"], "size") for entry in levels], dtype = object),
+    "total": np.array([fmt(entry["total_capacities"], "size") for entry in levels], dtype = object),
+    "GB/s": np.array([fmt(entry["bandwidths"], "gbps") for entry in levels], dtype = object)
+  })
+
+  if args.output is not None:
+    with open(args.output, "w") as file:
+      json.dump({"summary": levels, "series": table}, file, indent = 2, default = lambda value: value.item())
+
+
+if __name__ == "__main__":
+  main()
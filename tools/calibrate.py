@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+import sys
+assert sys.version_info >= (3, 10), "Requires Python 3.10 or later"
+
+import json, argparse
+import numpy as np
+import results
+from plan_sweep import series, round_size
+
+# Per-benchmark run length calibration
+#
+# The fixed iteration counts of the generators make fast benchmarks finish in a fraction of a
+# millisecond (dominated by timer resolution and thread startup) while slow ones run for
+# seconds. The run length of every benchmark is rescaled from a previous run so that its
+# fastest configuration (over threads and buffer sizes) takes about the target time:
+#
+#   new_length = old_length*target_time/elapsed
+#
+# The calibration is consumed by the generators (--calibration), the run length is a field
+# of the benchmark table so calibrating does not change the kernels.
+
+# generator defaults (see gen_op_benchmarks.py and gen_mem_benchmarks.py), used for reports
+# that do not record the run length
+N_ITERATIONS = 8000000
+TRANSFER_SIZE = 512*1048576
+
+def calibrate(
+  data: results.Results,
+  keys: list[str],
+  field: str,
+  default: np.ndarray,
+  target_time: float,
+  bounds: tuple[int, int]
+) -> list[dict]:
+  """ Calibration entries (key columns + run length field) for every benchmark """
+  elapsed = data["elapsed"]
+  length = data[field] if field in data.columns else default
+  columns = {key: data[key] for key in keys}
+
+  entries = []
+  for rows in series(data, keys):
+    rows = rows[elapsed[rows] > 0]
+    if len(rows) == 0: continue
+
+    # scale the fastest configuration to the target time
+    fastest = rows[np.argmin(elapsed[rows])]
+    value = int(np.clip(length[fastest]*target_time/elapsed[fastest], *bounds))
+    entries.append({**{key: columns[key][rows[0]] for key in keys}, field: value})
+
+  return entries
+
+
+def main():
+  parser = argparse.ArgumentParser(description = "Calibrate per-benchmark run lengths from a previous run")
+  parser.add_argument("--ops", default = None, help = "previous instruction benchmark report")
+  parser.add_argument("--mem", default = None, help = "previous memory benchmark report")
+  parser.add_argument("--mixed", default = None, help = "previous mixed instruction benchmark report")
+  parser.add_argument("--gemm", default = None, help = "previous GEMM benchmark report")
+  parser.add_argument("--target-time", type = float, default = 0.05, help = "target run time of the fastest configuration (seconds)")
+  parser.add_argument("--min-iterations", type = int, default = 1000, help = "lower bound of the instruction benchmark iterations")
+  parser.add_argument("--max-iterations", type = int, default = 1 << 32, help = "upper bound of the instruction benchmark iterations")
+  parser.add_argument("--min-transfer", type = int, default = 1048576, help = "lower bound of the memory benchmark transfer size (bytes)")
+  parser.add_argument("--max-transfer", type = int, default = 1 << 36, help = "upper bound of the memory benchmark transfer size (bytes)")
+  parser.add_argument("-o", "--output", default = "calibration.json", help = "output calibration file")
+  args = parser.parse_args()
+
+  calibration = {"target_time": args.target_time}
+
+  if args.ops is not None:
+    data = results.load(args.ops)
+    # older reports only have throughput benchmarks
+    modes = [key for key in ["mode", "chain_length"] if key in data.columns]
+    entries = calibrate(
+      data, ["label", "encoding", "input_vectors", *modes, "ilp"], "n_iterations", N_ITERATIONS//data["ilp"],
+      args.target_time, (args.min_iterations, args.max_iterations)
+    )
+    for entry in entries:
+      # the generator identifies operations by their vector group size (two inputs per instruction)
+      entry["vgsize"] = int(entry.pop("input_vectors"))//2
+      entry.setdefault("mode", "throughput")
+      entry.setdefault("chain_length", 1)
+    calibration["op_benchmarks"] = entries
+    print(f"ops: {len(entries)} benchmarks calibrated", file = sys.stderr)
+
+  if args.mem is not None:
+    data = results.load(args.mem)
+    # older report formats do not identify the generated benchmarks
+    if "ilp" in data.columns and "op_type" in data.columns:
+      entries = calibrate(
+        data, ["label", "encoding", "op_type", "n_vectors", "ilp"], "transfer_size", np.full(len(data), TRANSFER_SIZE),
+        args.target_time, (args.min_transfer, args.max_transfer)
+      )
+      for entry in entries: entry["transfer_size"] = round_size(entry["transfer_size"])
+      calibration["mem_benchmarks"] = entries
+      print(f"mem: {len(entries)} benchmarks calibrated", file = sys.stderr)
+    else:
+      print(f"mem: {args.mem} does not identify the generated benchmarks, skipped", file = sys.stderr)
+
+  if args.mixed is not None:
+    data = results.load(args.mixed)
+    entries = calibrate(
+      data, ["label", "first_count", "second_count"], "n_iterations", data["n_iterations"],
+      args.target_time, (args.min_iterations, args.max_iterations)
+    )
+    calibration["mixed_benchmarks"] = entries
+    print(f"mixed: {len(entries)} benchmarks calibrated", file = sys.stderr)
+
+  if args.gemm is not None:
+    data = results.load(args.gemm)
+    # the run length is given in operations (rounded to whole GEMMs, the fastest shape sets the scale)
+    entries = calibrate(
+      data, ["label", "tile_rows", "tile_cols", "k_unroll"], "n_ops", data["n_ops"],
+      args.target_time, (1 << 20, 1 << 40)
+    )
+    calibration["gemm_benchmarks"] = entries
+    print(f"gemm: {len(entries)} benchmarks calibrated", file = sys.stderr)
+
+  with open(args.output, "w") as file:
+    json.dump(calibration, file, indent = 2, default = lambda value: value.item())
+
+
+if __name__ == "__main__":
+  main()
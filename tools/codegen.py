@@ -0,0 +1,342 @@
+import sys
+assert sys.version_info >= (3, 10), "Requires Python 3.10 or later"
+
+import os, ast, json, random, hashlib, zlib, tempfile, shutil, filecmp
+from textwrap import dedent
+from dataclasses import asdict, fields as get_dataclass_fields
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+
+class KernelCache:
+  """ On-disk cache of generated benchmarks
+
+      Each benchmark is stored as a JSON file keyed by a hash of the generator sources and
+      the benchmark parameters, so only kernels whose definition (or generator) changed are
+      rebuilt. The cache is disabled if path is None.
+  """
+  def __init__(self, path: str | None, cls: type, sources: list[str]):
+    self.path = path
+    self.cls = cls
+    self.hits = 0
+    self.misses = 0
+
+    # hash the generator sources, any change invalidates all entries
+    self.salt = hashlib.sha256()
+    for source in sources:
+      with open(source, "rb") as file: self.salt.update(file.read())
+
+    if path is not None: os.makedirs(path, exist_ok = True)
+
+  def get(self, params: tuple, make: Callable[[], T]) -> T:
+    """ Return the cached benchmark for params or build (and cache) it using make() """
+    if self.path is None: return make()
+
+    key = self.salt.copy()
+    key.update(repr(params).encode())
+    entry_path = os.path.join(self.path, f"{key.hexdigest()}.json")
+
+    try:
+      with open(entry_path, "r") as file:
+        entry = json.load(file)
+      self.hits += 1
+      entry["fn"] = tuple(entry["fn"])
+      return self.cls(**entry)
+    except FileNotFoundError:
+      pass
+
+    self.misses += 1
+    bench = make()
+
+    # write atomically, multiple generators can share the cache directory
+    with open(f"{entry_path}.tmp", "w") as file:
+      json.dump(asdict(bench), file)
+    os.replace(f"{entry_path}.tmp", entry_path)
+
+    return bench
+
+
+def benchmark_key(**key) -> tuple:
+  """ Hashable benchmark identity from its key fields """
+  return tuple(sorted(key.items()))
+
+
+def keyed_entries(entries: list[dict], field: str) -> dict:
+  """ Map the benchmark identity (all fields except field) of each entry to the value of field """
+  out = {}
+  for entry in entries:
+    entry = dict(entry)
+    value = entry.pop(field)
+    out[benchmark_key(**entry)] = value
+
+  return out
+
+
+class SweepPlan:
+  """ Reduced benchmark sweep (see tools/plan_sweep.py)
+
+      A plan is a JSON file listing the ILPs to generate for each benchmark of a suite, e.g.
+
+        {
+          "op_benchmarks": [{"label": "FMOPA (FP32)", "encoding": "za-tile", "vgsize": 1, "ilp": [1, 3, 4, 5, 8]}],
+          "mem_benchmarks": [...],
+          "mem_sizes": [4096, 8192, ...],
+          "schedule": {"seed": 1, "rounds": 4, "cooldown_every": 50, "cooldown_ms": 2000}
+        }
+
+      Benchmarks that are not listed in the plan (or all benchmarks if there is no plan) use
+      their full ILP sweep. The optional schedule (see RunSchedule) applies to every suite.
+  """
+  def __init__(self, path: str | None, suite: str):
+    self.entries = {}
+    self.sizes = None
+    self.schedule = None
+    if path is None: return
+
+    with open(path, "r") as file:
+      plan = json.load(file)
+
+    self.entries = keyed_entries(plan.get(suite, []), "ilp")
+
+    # buffer sizes (memory benchmarks only)
+    self.sizes = plan.get(f"{suite.removesuffix("_benchmarks")}_sizes")
+    if "schedule" in plan: self.schedule = RunSchedule(**plan["schedule"])
+
+  def ilps(self, default: range, **key) -> list[int]:
+    """ ILPs to generate for the benchmark identified by key (limited to the default range) """
+    ilps = self.entries.get(benchmark_key(**key))
+    if ilps is None: return list(default)
+
+    return [ilp for ilp in sorted(ilps) if ilp in default]
+
+
+class RunSchedule:
+  """ Randomized, interleaved execution order of a benchmark table
+
+      By default the harness runs the table in order with all repetitions of a benchmark
+      back-to-back, so slow drifts over a long run (thermal throttling, frequency changes)
+      bias the benchmarks by their position in the table. A schedule visits every benchmark
+      once per round, in an independently shuffled order per round, and the harness splits
+      the repetitions of each benchmark over the rounds. A cooldown marker (an idle pause of
+      cooldown_ms milliseconds) is inserted after every cooldown_every visits.
+
+      The schedule is emitted with the benchmark table as `<name>_schedule` (an array of
+      run_schedule_entry_t, cooldown markers have the benchmark index -1) and
+      `<name>_schedule_count`, an empty schedule selects the table order.
+  """
+  def __init__(self, seed: int = 0, rounds: int = 1, cooldown_every: int = 0, cooldown_ms: int = 0):
+    assert rounds >= 1, "a schedule needs at least one round"
+    assert cooldown_every >= 0 and cooldown_ms >= 0
+    self.seed = seed
+    self.rounds = rounds
+    self.cooldown_every = cooldown_every
+    self.cooldown_ms = cooldown_ms
+
+  def order(self, count: int) -> list[tuple[int, int]]:
+    """ (benchmark index, cooldown in milliseconds) of every visit, the index is -1 for cooldown markers """
+    rng = random.Random(self.seed)
+    entries = []
+    n_visits = 0
+    for _ in range(self.rounds):
+      visits = list(range(count))
+      rng.shuffle(visits)
+      for index in visits:
+        entries.append((index, 0))
+        n_visits += 1
+        if self.cooldown_every > 0 and n_visits % self.cooldown_every == 0:
+          entries.append((-1, self.cooldown_ms))
+
+    return entries
+
+  @staticmethod
+  def table(name: str, entries: list[tuple[int, int]]) -> str:
+    if not entries:
+      return dedent(f"""
+        // execution order (none, run the table in order)
+        const run_schedule_entry_t* _Nullable {name}_schedule = nullptr;
+        const size_t {name}_schedule_count = 0;
+      """)
+
+    rows = ",\n".join(f"  {{ {index}, {cooldown} }}" for (index, cooldown) in entries)
+    return (
+      f"\n// execution order (randomized rounds, cooldown markers have the index -1)\n"
+      f"static const run_schedule_entry_t schedule[] = {{\n{rows}\n}};\n\n"
+      f"const run_schedule_entry_t* _Nullable {name}_schedule = schedule;\n"
+      f"const size_t {name}_schedule_count = sizeof(schedule)/sizeof(schedule[0]);\n"
+    )
+
+
+class Calibration:
+  """ Calibrated per-benchmark run length (see tools/calibrate.py)
+
+      A calibration is a JSON file with the run length for each benchmark of a suite, stored
+      in a suite-specific field (n_iterations for instruction benchmarks, transfer_size for
+      memory benchmarks), e.g.
+
+        {
+          "target_time": 0.05,
+          "op_benchmarks": [{"label": "FMOPA (FP32)", "encoding": "za-tile", "vgsize": 1, "mode": "throughput", "chain_length": 1, "ilp": 4, "n_iterations": 6250000}],
+          "mem_benchmarks": [...]
+        }
+
+      Benchmarks that are not listed (or all benchmarks if there is no calibration) use the
+      generator default.
+  """
+  def __init__(self, path: str | None, suite: str, field: str):
+    self.entries = {}
+    if path is None: return
+
+    with open(path, "r") as file:
+      calibration = json.load(file)
+
+    self.entries = keyed_entries(calibration.get(suite, []), field)
+
+  def get(self, default: int, **key) -> int:
+    return int(self.entries.get(benchmark_key(**key), default))
+
+
+class BenchmarkFilter:
+  """ Selection of benchmarks by an expression over the Benchmark fields
+
+      The expression uses Python syntax restricted to field names, constants, comparisons
+      (including chained comparisons, `in` and substring tests), boolean operators and
+      lists, e.g.
+
+        opcode == "fmopa" and input_data == "f16" and 1 <= ilp <= 4
+        encoding in ["za-tile", "za-vector"] and "FP32" in label
+
+      The expression is validated against the fields of cls when the filter is created.
+      Without an expression every benchmark is selected.
+  """
+  NODES = (
+    ast.Expression, ast.BoolOp, ast.And, ast.Or, ast.UnaryOp, ast.Not, ast.USub, ast.Compare,
+    ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE, ast.In, ast.NotIn,
+    ast.Name, ast.Load, ast.Constant, ast.List, ast.Tuple
+  )
+
+  def __init__(self, expression: str | None, cls: type):
+    self.expression = expression
+    self.code = None
+    if expression is None: return
+
+    self.names = [field.name for field in get_dataclass_fields(cls) if field.name != "fn"]
+    tree = ast.parse(expression, mode = "eval")
+    for node in ast.walk(tree):
+      assert isinstance(node, self.NODES), f"unsupported syntax in filter: {ast.unparse(node)}"
+      if isinstance(node, ast.Name):
+        assert node.id in self.names, f"unknown field '{node.id}' in filter (fields: {", ".join(self.names)})"
+
+    self.code = compile(tree, "<filter>", "eval")
+
+  def __call__(self, bench) -> bool:
+    if self.code is None: return True
+
+    return bool(eval(self.code, {"__builtins__": {}}, {name: getattr(bench, name) for name in self.names}))
+
+
+class KernelWriter:
+  """ Streaming writer for generated benchmark sources
+
+      The output is split into kernel shards and a benchmark table file. Kernels are written
+      to their shard as soon as they are emitted, the declarations and the table rows are
+      spooled to temporary files and assembled into the table file on close, so memory use
+      does not grow with the number of benchmarks.
+
+      Kernels are assigned to shards by a hash of their function name, so the assignment is
+      stable when benchmarks are added or removed and only the affected shards change.
+      Files are only replaced if their content differs to avoid needless recompilation.
+
+      Layout (for name = "op_benchmarks"):
+
+        <path>/op_benchmarks_00.c ... op_benchmarks_NN.c   kernel functions
+        <path>/op_benchmarks_table.c                       declarations and the benchmark table
+
+      The table is exported as `<name>` (an array of `table_type`) and `<name>_count`, followed
+      by its execution order (see RunSchedule).
+  """
+  def __init__(self, path: str, name: str, n_shards: int, preamble: str, table_type: str, setup: str, schedule: RunSchedule | None = None):
+    assert n_shards >= 1
+    self.path = path
+    self.name = name
+    self.n_shards = n_shards
+    self.preamble = preamble
+    self.table_type = table_type
+    self.setup = setup
+    self.schedule = schedule
+    # number of emitted benchmarks and the list of updated files
+    self.count = 0
+    self.updated = []
+
+  def __enter__(self):
+    os.makedirs(self.path, exist_ok = True)
+    # temporary files next to the destination, so that they can be atomically replaced
+    self.files = {}
+    self.shards = [self._open(f"{self.name}_{i:02}.c") for i in range(self.n_shards)]
+    self.table = self._open(f"{self.name}_table.c")
+    self.declarations = tempfile.TemporaryFile("w+")
+    self.rows = tempfile.TemporaryFile("w+")
+
+    for shard in self.shards: shard.write(f"{self.preamble}\n// benchmark functions\n")
+    return self
+
+  def __exit__(self, exc_type, exc, traceback):
+    try:
+      if exc_type is None: self._write_table()
+      for (file_name, file) in self.files.items():
+        file.close()
+        if exc_type is None: self._commit(file_name, file.name)
+    finally:
+      for file in self.files.values():
+        if os.path.exists(file.name): os.remove(file.name)
+      self.declarations.close()
+      self.rows.close()
+
+    if exc_type is None: self._remove_stale()
+
+  def shard_index(self, fn_name: str) -> int:
+    return zlib.crc32(fn_name.encode()) % self.n_shards
+
+  def emit(self, bench):
+    """ Write the benchmark kernel to its shard and spool its declaration and table row """
+    shard = self.shards[self.shard_index(bench.fn[0])]
+    shard.write(bench.fn[1])
+    shard.write("\n")
+    self.declarations.write(f"double {bench.fn[0]}(const void*);\n")
+    self.rows.write(f"{",\n" if self.count > 0 else ""}  {bench.to_c_struct()}")
+    self.count += 1
+
+  def _open(self, file_name: str):
+    file = tempfile.NamedTemporaryFile("w", dir = self.path, prefix = f".{file_name}.", delete = False)
+    self.files[file_name] = file
+    return file
+
+  def _write_table(self):
+    self.table.write(f"{self.preamble}\n// benchmark functions\n")
+    self.declarations.seek(0)
+    shutil.copyfileobj(self.declarations, self.table)
+    self.table.write(self.setup)
+    self.table.write(f"\n// benchmark table\nstatic const {self.table_type} benchmarks[] = {{\n")
+    self.rows.seek(0)
+    shutil.copyfileobj(self.rows, self.table)
+    self.table.write(dedent(f"""
+      }};
+
+      CONST_PTR({self.table_type}) {self.name} = benchmarks;
+      const size_t {self.name}_count = sizeof(benchmarks)/sizeof(benchmarks[0]);
+    """))
+    self.table.write(RunSchedule.table(self.name, self.schedule.order(self.count) if self.schedule is not None else []))
+
+  def _commit(self, file_name: str, tmp_path: str):
+    path = os.path.join(self.path, file_name)
+
+    if os.path.exists(path) and filecmp.cmp(tmp_path, path, shallow = False): return
+    # temporary files are created with owner-only permissions
+    os.chmod(tmp_path, 0o644)
+    os.replace(tmp_path, path)
+    self.updated.append(path)
+
+  def _remove_stale(self):
+    # remove shards that are no longer generated (e.g. if the number of shards was reduced)
+    for file_name in os.listdir(self.path):
+      if file_name.startswith(f"{self.name}_") and file_name.endswith(".c") and file_name not in self.files:
+        os.remove(os.path.join(self.path, file_name))
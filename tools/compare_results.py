@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+import sys
+assert sys.version_info >= (3, 10), "Requires Python 3.10 or later"
+
+import json, argparse
+import numpy as np
+import results, stats
+
+# Regression comparison between two benchmark reports
+#
+# Rows are joined on the benchmark identity, the change of the median throughput is tested
+# with a Mann-Whitney U test over the raw samples (with Benjamini-Hochberg correction for
+# the number of compared rows). A change is significant if it passes the test and exceeds
+# the minimal effect size.
+
+# benchmark identity (only the columns present in both reports are used), the vector count
+# is needed to tell apart multivector variants of the same instruction
+JOIN_KEYS = ["label", "encoding", "input_vectors", "mode", "chain_length", "predicate_density", "ilp", "threads_h", "threads_l", "size", "alignment"]
+
+def join_keys(baseline: results.Results, candidate: results.Results) -> list[str]:
+  if "label" in baseline.columns and "label" in candidate.columns:
+    return [key for key in JOIN_KEYS if key in baseline.columns and key in candidate.columns]
+
+  # reports without the standard fields (e.g. older report formats) are joined on all identity columns
+  return [key for key in stats.identity_columns(baseline) if key in candidate.columns and key != "run"]
+
+
+def join(baseline: results.Results, candidate: results.Results, keys: list[str]) -> tuple[np.ndarray, np.ndarray]:
+  """ Row indices of the matching benchmarks in both reports """
+  def index(data: results.Results):
+    columns = [data[key].tolist() for key in keys]
+    rows = {}
+    for (i, key) in enumerate(zip(*columns)):
+      assert key not in rows, f"duplicate benchmark {dict(zip(keys, key))} in {data.store}"
+      rows[key] = i
+    return rows
+
+  base = index(baseline)
+  cand = index(candidate)
+  matched = [key for key in base if key in cand]
+
+  return (np.array([base[key] for key in matched], dtype = np.int64), np.array([cand[key] for key in matched], dtype = np.int64))
+
+
+def compare(
+  baseline: results.Results,
+  candidate: results.Results,
+  keys: list[str] | None = None,
+  alpha: float = 0.01,
+  min_effect: float = 0.02
+) -> dict[str, np.ndarray]:
+  """ Per-benchmark comparison table of two reports """
+  keys = keys or join_keys(baseline, candidate)
+  (base_rows, cand_rows) = join(baseline, candidate, keys)
+  baseline = baseline.take(base_rows)
+  candidate = candidate.take(cand_rows)
+
+  x = baseline.sample_matrix()
+  y = candidate.sample_matrix()
+  # pad to the same sample count
+  width = max(x.shape[1], y.shape[1])
+  x = np.pad(x, ((0, 0), (0, width - x.shape[1])), constant_values = np.nan)
+  y = np.pad(y, ((0, 0), (0, width - y.shape[1])), constant_values = np.nan)
+
+  base_median = stats.median(x)
+  cand_median = stats.median(y)
+  (_, p) = stats.mann_whitney(x, y)
+  q = stats.benjamini_hochberg(p)
+
+  with np.errstate(invalid = "ignore", divide = "ignore"):
+    change = cand_median/base_median - 1
+
+  significant = (q < alpha) & (np.abs(change) >= min_effect)
+
+  table = {key: baseline[key] for key in keys}
+  table.update({
+    "baseline": base_median,
+    "candidate": cand_median,
+    "change": change,
+    "p": p,
+    "q": q,
+    "regression": significant & (change < 0),
+    "improvement": significant & (change > 0)
+  })
+
+  return table
+
+
+def main():
+  parser = argparse.ArgumentParser(description = "Compare two benchmark reports and detect significant regressions")
+  parser.add_argument("baseline", help = "baseline JSON report (optionally .bz2)")
+  parser.add_argument("candidate", help = "new JSON report (optionally .bz2)")
+  parser.add_argument("--keys", nargs = "+", default = None, help = "columns identifying a benchmark")
+  parser.add_argument("--alpha", type = float, default = 0.01, help = "significance level (false discovery rate)")
+  parser.add_argument("--min-effect", type = float, default = 0.02, help = "minimal relative change to report")
+  parser.add_argument("--json", default = None, help = "write the machine-readable summary to this file")
+  parser.add_argument("--top", type = int, default = 50, help = "number of regressions/improvements to print")
+  args = parser.parse_args()
+
+  baseline = results.load(args.baseline)
+  candidate = results.load(args.candidate)
+  keys = args.keys or join_keys(baseline, candidate)
+  table = compare(baseline, candidate, keys, args.alpha, args.min_effect)
+
+  # ranked by relative change (largest regressions and improvements first)
+  order = np.argsort(table["change"])
+  regressions = [i for i in order if table["regression"][i]]
+  improvements = [i for i in order[::-1] if table["improvement"][i]]
+
+  columns = [*keys, "baseline", "candidate", "change", "q"]
+  for (title, rows) in [("Regressions", regressions), ("Improvements", improvements)]:
+    print(f"\n{title} ({len(rows)})\n")
+    if len(rows) > 0: results.print_table({name: table[name][rows[:args.top]] for name in columns})
+
+  n_matched = len(table["change"])
+  print(f"\n{n_matched} benchmarks compared ({len(baseline) - n_matched} only in baseline, {len(candidate) - n_matched} only in candidate)", file = sys.stderr)
+
+  if args.json is not None:
+    # numpy scalars to plain Python values
+    value = lambda x: x.item() if isinstance(x, np.generic) else x
+    row = lambda i: {name: value(table[name][i]) for name in [*columns, "p"]}
+    with open(args.json, "w") as file:
+      json.dump({
+        "baseline": args.baseline,
+        "candidate": args.candidate,
+        "keys": keys,
+        "alpha": args.alpha,
+        "min_effect": args.min_effect,
+        "compared": n_matched,
+        "only_baseline": len(baseline) - n_matched,
+        "only_candidate": len(candidate) - n_matched,
+        "regressions": [row(i) for i in regressions],
+        "improvements": [row(i) for i in improvements]
+      }, file, indent = 2)
+
+  sys.exit(1 if len(regressions) > 0 else 0)
+
+
+if __name__ == "__main__":
+  main()
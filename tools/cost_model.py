@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+import sys
+assert sys.version_info >= (3, 10), "Requires Python 3.10 or later"
+
+import os, re, math, json, argparse
+from dataclasses import dataclass, asdict
+import numpy as np
+import yaml
+import results, stats, codegen, dataflow, SME
+import gen_op_benchmarks, gen_mem_benchmarks
+from ilp_saturation import fit_saturation
+
+# Static throughput cost model
+#
+# Every instruction form (SME.Instr.signature) is described by a latency L and a
+# reciprocal throughput T (ns per instruction), fitted from measured results with the ILP
+# saturation model (see ilp_saturation.py): a loop iteration with n independent instructions
+# takes max(L, n*T). The time of an arbitrary hot loop is estimated as
+#
+#   max(sum of T over compute instructions, sum of T over memory instructions,
+#       sum of L along the longest dependency chain, max of L over memory instructions)
+#
+# which predicts GOP/s and GB/s of kernel variants offline. Scalar loop control is assumed to
+# be free (it issues to different pipelines). Masked lanes are assumed to cost full
+# throughput: the operations and bytes of an instruction governed by partial predicates
+# (whilelt from a lane count) are scaled by the active fraction of its predicates.
+
+@dataclass(kw_only=True)
+class InstructionCost:
+  signature: str
+  # dependent-chain latency and reciprocal throughput (ns)
+  latency: float
+  reciprocal_throughput: float
+  # operations (compute) or bytes (memory) per instruction
+  ops: int
+  bytes: int
+  # number of measurements used for the fit and relative RMS error
+  n_samples: int
+  fit_error: float
+
+
+@dataclass(kw_only=True)
+class Prediction:
+  time_ns: float
+  gops: float
+  gbps: float
+  # the bound limiting the loop (compute, memory, latency or memory-latency)
+  bound: str
+  unknown: list[str]
+
+
+def vector_count(operand: SME.Operand) -> int:
+  """ Number of vector registers in a register list operand ({z0.s-z3.s}, {z0.s, z8.s}, z0, za[...]) """
+  return operand.count if isinstance(operand, SME.ZGroup) else 1
+
+
+def transfer_bytes(instruction: SME.Instr) -> int:
+  """ Bytes moved by a load/store (the register operand is the first one) """
+  return SME.SVL_BYTES*vector_count(instruction.operands[0])
+
+
+def kernel_loop(bench) -> list[SME.Instr]:
+  """ Vector instructions of the benchmark loop of a generated kernel """
+  return [instruction for instruction in SME.hot_loop(SME.parse_kernel(bench.fn[1])) if not instruction.is_scalar]
+
+
+def kernel_signature(bench) -> str:
+  """ The single instruction form benchmarked by a generated kernel """
+  signatures = {instruction.signature for instruction in kernel_loop(bench)}
+  assert len(signatures) == 1, f"{bench.fn[0]} mixes instruction forms: {signatures}"
+
+  return signatures.pop()
+
+
+def predicate_fractions(code: list[SME.Instr | SME.Label], constants: dict[int, int]) -> dict[str, float]:
+  """ Active lane fraction of the predicates set with whilelt from a lane count (keyed like dataflow.operand_resources) """
+  fractions = {}
+  for instruction in code:
+    if not isinstance(instruction, SME.Instr) or instruction.opcode != "whilelt": continue
+    (predicate, start, count, *vlx) = instruction.operands
+    if start == "xzr" and isinstance(count, SME.GPR) and count.index in constants:
+      lanes = SME.SVL_BYTES//dataflow.ELEMENT_SIZES[predicate.suffix]*int(vlx[0].removeprefix("vlx") if vlx else 1)
+      fractions[predicate.registers[0]] = min(constants[count.index]/lanes, 1.0)
+
+  return fractions
+
+
+def active_fraction(instruction: SME.Instr, fractions: dict[str, float], constants: dict[int, int]) -> float:
+  """ Fraction of the work of an instruction done by the active lanes of its governing predicates """
+  predicates = set().union(*(dataflow.operand_resources(operand, constants) for operand in instruction.operands))
+  return math.prod(fractions.get(register, 1.0) for register in predicates if register.startswith("p"))
+
+
+def predict(model: dict[str, InstructionCost], source: str) -> Prediction:
+  """ Predicted time per iteration and throughput of the benchmark loop of a generated kernel """
+  code = SME.parse_kernel(source)
+  constants = dataflow.register_constants(code)
+  fractions = predicate_fractions(code, constants)
+  bounds = {"compute": 0.0, "memory": 0.0, "latency": 0.0, "memory-latency": 0.0}
+  # completion time and written registers of the compute instructions (for the critical path)
+  finished = []
+  (ops, n_bytes, unknown) = (0, 0, [])
+
+  for instruction in SME.hot_loop(code):
+    if instruction.is_scalar: continue
+    cost = model.get(instruction.signature)
+    if cost is None:
+      unknown.append(instruction.signature)
+      continue
+
+    if instruction.is_memory:
+      bounds["memory"] += cost.reciprocal_throughput
+      bounds["memory-latency"] = max(bounds["memory-latency"], cost.latency)
+      n_bytes += transfer_bytes(instruction)*active_fraction(instruction, fractions, constants)
+    else:
+      bounds["compute"] += cost.reciprocal_throughput
+      # an instruction starts when the latest instruction producing one of its inputs (or its
+      # accumulator) has finished
+      (reads, writes) = dataflow.instruction_effects(instruction, constants)
+      start = max((time for (time, produced) in finished if produced & reads), default = 0.0)
+      finished.append((start + cost.latency, writes))
+      ops += cost.ops*active_fraction(instruction, fractions, constants)
+
+  bounds["latency"] = max((time for (time, _) in finished), default = 0.0)
+  bound = max(bounds, key = bounds.get)
+  time = bounds[bound]
+  if time == 0: bound = "unknown"
+
+  with np.errstate(divide = "ignore", invalid = "ignore"):
+    return Prediction(
+      time_ns = time,
+      gops = ops/time if time > 0 else float("nan"),
+      gbps = n_bytes/time if time > 0 else float("nan"),
+      bound = bound,
+      unknown = sorted(set(unknown))
+    )
+
+
+def fit_costs(signatures: list[str], ilp: np.ndarray, throughput: np.ndarray, units: dict[str, int], memory: bool) -> dict[str, InstructionCost]:
+  """ Fit the cost of every instruction form from the throughput of its kernels over ILP """
+  signatures = np.array(signatures, dtype = object)
+  model = {}
+  for signature in dict.fromkeys(signatures):
+    rows = (signatures == signature) & ~np.isnan(throughput)
+    if not np.any(rows): continue
+
+    fit = fit_saturation(ilp[rows], throughput[rows])
+    unit = units[signature]
+    residual = throughput[rows] - fit.predict(ilp[rows])
+    model[signature] = InstructionCost(
+      signature = signature,
+      latency = unit/fit.slope if fit.slope > 0 else float("inf"),
+      reciprocal_throughput = unit/fit.peak if fit.peak > 0 else float("inf"),
+      ops = 0 if memory else unit,
+      bytes = unit if memory else 0,
+      n_samples = int(np.sum(rows)),
+      fit_error = float(np.sqrt(np.mean(residual**2))/fit.peak) if fit.peak > 0 else float("nan")
+    )
+
+  return model
+
+
+def op_kernels() -> dict[tuple, gen_op_benchmarks.Benchmark]:
+  """ Generated instruction benchmarks keyed by (label, encoding, input_vectors, mode, chain_length, ilp) """
+  with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "benchmarks.yaml"), "r") as file:
+    operations = [gen_op_benchmarks.Operation.from_yaml(y) for y in yaml.safe_load(file)]
+
+  benchmarks = gen_op_benchmarks.generate_benchmarks(
+    operations,
+    codegen.KernelCache(None, gen_op_benchmarks.Benchmark, []),
+    codegen.SweepPlan(None, "op_benchmarks"),
+    codegen.Calibration(None, "op_benchmarks", "n_iterations")
+  )
+  return {(bench.label, bench.encoding, bench.input_vectors, bench.mode, bench.chain_length, bench.ilp): bench for bench in benchmarks}
+
+
+def mem_kernels() -> dict[tuple, gen_mem_benchmarks.Benchmark]:
+  """ Generated memory benchmarks keyed by (encoding, op, n_vectors, predicate_density, ilp) """
+  benchmarks = gen_mem_benchmarks.generate_benchmarks(
+    codegen.KernelCache(None, gen_mem_benchmarks.Benchmark, []),
+    codegen.SweepPlan(None, "mem_benchmarks"),
+    codegen.Calibration(None, "mem_benchmarks", "transfer_size")
+  )
+  return {(bench.encoding, bench.op, bench.n_vectors, bench.predicate_density, bench.ilp): bench for bench in benchmarks}
+
+
+def op_measurements(data: results.Results, kernels: dict) -> tuple[list, np.ndarray]:
+  """ Kernel and median GOP/s of every row of an instruction benchmark report (older reports only have throughput benchmarks) """
+  gops = stats.median(data.sample_matrix())
+  mode = data["mode"].tolist() if "mode" in data.columns else ["throughput"]*len(data)
+  chain_length = data["chain_length"].tolist() if "chain_length" in data.columns else [1]*len(data)
+  keys = zip(data["label"].tolist(), data["encoding"].tolist(), data["input_vectors"].tolist(), mode, chain_length, data["ilp"].tolist())
+  return ([kernels.get(key) for key in keys], gops)
+
+
+def mem_measurements(data: results.Results, kernels: dict) -> tuple[list, np.ndarray]:
+  """ Kernel and peak GB/s over buffer sizes of every benchmark of a memory benchmark report
+
+      Older reports (type, unroll, storage) measured the one-register LDR/STR loop, which is
+      the reg-adjacent kernel with a single vector, reports without a predicate density only
+      have all-true predicates.
+  """
+  if "predicate_density" in data.columns:
+    keys = ["encoding", "op_type", "n_vectors", "predicate_density", "ilp"]
+    make_key = lambda key: key
+  elif "op_type" in data.columns:
+    keys = ["encoding", "op_type", "n_vectors", "ilp"]
+    make_key = lambda key: (*key[:3], 1.0, key[3])
+  else:
+    keys = ["type", "unroll"]
+    make_key = lambda key: ("reg-adjacent", key[0], 1, 1.0, key[1])
+
+  gbps = stats.median(data.sample_matrix())
+  (order, starts) = data.group_index(keys)
+  columns = [data[key].tolist() for key in keys]
+
+  (benchmarks, peaks) = ([], [])
+  for (start, end) in zip(starts, np.append(starts[1:], len(order))):
+    rows = order[start:end]
+    benchmarks.append(kernels.get(make_key(tuple(column[rows[0]] for column in columns))))
+    peaks.append(np.nanmax(gbps[rows]) if np.any(~np.isnan(gbps[rows])) else np.nan)
+
+  return (benchmarks, np.array(peaks))
+
+
+def fit_model(ops: results.Results | None, mem: results.Results | None) -> tuple[dict[str, InstructionCost], list[dict]]:
+  """ Fit the instruction costs and compute the residual of every measured kernel """
+  model = {}
+  measured = []
+
+  if ops is not None:
+    (benchmarks, gops) = op_measurements(ops, op_kernels())
+    valid = [i for (i, bench) in enumerate(benchmarks) if bench is not None]
+    # the costs are fitted from the all-true throughput sweeps, latency benchmarks and partial
+    # predicates validate the model
+    sweep = [i for i in valid if benchmarks[i].mode == "throughput" and benchmarks[i].predicate_density == 1.0]
+    signatures = [kernel_signature(benchmarks[i]) for i in sweep]
+    units = {signature: benchmarks[i].ops_per_instruction for (i, signature) in zip(sweep, signatures)}
+    ilp = np.array([benchmarks[i].ilp for i in sweep])
+    model |= fit_costs(signatures, ilp, gops[sweep], units, memory = False)
+    measured += [(benchmarks[i], "gops", gops[i]) for i in valid]
+
+  if mem is not None:
+    (benchmarks, gbps) = mem_measurements(mem, mem_kernels())
+    valid = [i for (i, bench) in enumerate(benchmarks) if bench is not None]
+    # copies and partial predicates are predicted from the all-true load and store costs
+    single = [i for i in valid if benchmarks[i].op != "copy" and benchmarks[i].predicate_density == 1.0]
+    signatures = [kernel_signature(benchmarks[i]) for i in single]
+    units = {signature: transfer_bytes(kernel_loop(benchmarks[i])[0]) for (i, signature) in zip(single, signatures)}
+    ilp = np.array([benchmarks[i].ilp for i in single])
+    model |= fit_costs(signatures, ilp, gbps[single], units, memory = True)
+    measured += [(benchmarks[i], "gbps", gbps[i]) for i in valid]
+
+  residuals = []
+  for (bench, metric, value) in measured:
+    prediction = predict(model, bench.fn[1])
+    predicted = getattr(prediction, metric)
+    residuals.append({
+      "kernel": bench.fn[0],
+      "label": bench.label,
+      "ilp": bench.ilp,
+      "metric": metric,
+      "measured": float(value),
+      "predicted": float(predicted),
+      "error": float(predicted/value - 1) if value > 0 else float("nan"),
+      "bound": prediction.bound
+    })
+
+  return (model, residuals)
+
+
+def c_functions(path: str) -> dict[str, str]:
+  """ Generated benchmark functions of a C source file """
+  with open(path, "r") as file:
+    source = file.read()
+
+  return dict(re.findall(r"^double (\w+)\(const void\* args\) \{\n(.*?)^\}", source, re.MULTILINE | re.DOTALL))
+
+
+def main():
+  parser = argparse.ArgumentParser(description = "Fit and apply a static throughput cost model of the benchmark kernels")
+  parser.add_argument("--ops", default = None, help = "instruction benchmark report to fit the compute costs")
+  parser.add_argument("--mem", default = None, help = "memory benchmark report to fit the load/store costs")
+  parser.add_argument("--threads", default = "1,0", metavar = "H,L", help = "thread configuration used for fitting (old memory reports: H threads)")
+  parser.add_argument("--model", default = None, help = "previously fitted model (instead of --ops/--mem)")
+  parser.add_argument("-o", "--output", default = None, help = "write the fitted model to this file")
+  parser.add_argument("--residuals", default = None, help = "write the per-kernel residuals to this file")
+  parser.add_argument("--top", type = int, default = 30, help = "number of worst-predicted kernels to print")
+  parser.add_argument("--predict", nargs = "*", default = [], help = "C sources with kernels to predict (e.g. src/benchmarks/op_benchmarks/*.c)")
+  args = parser.parse_args()
+
+  if args.model is not None:
+    with open(args.model, "r") as file:
+      model = {entry["signature"]: InstructionCost(**entry) for entry in json.load(file)}
+  else:
+    (threads_h, threads_l) = (int(t) for t in args.threads.split(","))
+    def load(path):
+      data = results.load(path)
+      if "threads_h" in data.columns: return data.where(threads_h = threads_h, threads_l = threads_l)
+      return data.where(threads = threads_h)
+
+    ops = load(args.ops) if args.ops is not None else None
+    mem = load(args.mem) if args.mem is not None else None
+    (model, residuals) = fit_model(ops, mem)
+
+    results.print_table({name: np.array([getattr(cost, name) for cost in model.values()], dtype = object) for name in ["signature", "latency", "reciprocal_throughput", "n_samples", "fit_error"]})
+
+    residuals.sort(key = lambda row: -abs(row["error"]) if not np.isnan(row["error"]) else 0)
+    print(f"\nWorst predicted kernels\n")
+    shown = residuals[:args.top]
+    results.print_table({name: np.array([row[name] for row in shown], dtype = object) for name in ["kernel", "metric", "measured", "predicted", "error", "bound"]})
+    errors = np.abs([row["error"] for row in residuals])
+    print(f"\n{len(residuals)} kernels, median absolute error {np.nanmedian(errors):.1%}", file = sys.stderr)
+
+    if args.residuals is not None:
+      with open(args.residuals, "w") as file: json.dump(residuals, file, indent = 2)
+
+  if args.output is not None:
+    with open(args.output, "w") as file: json.dump([asdict(cost) for cost in model.values()], file, indent = 2)
+
+  for path in args.predict:
+    for (name, body) in c_functions(path).items():
+      prediction = predict(model, body)
+      unknown = f" (unknown: {"; ".join(prediction.unknown)})" if prediction.unknown else ""
+      print(f"{name}: {prediction.gops:.2f} GOP/s, {prediction.gbps:.2f} GB/s, {prediction.bound}-bound{unknown}")
+
+
+if __name__ == "__main__":
+  main()
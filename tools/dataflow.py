@@ -0,0 +1,185 @@
+import sys
+assert sys.version_info >= (3, 10), "Requires Python 3.10 or later"
+
+import SME
+
+# Register dataflow verification of generated kernels
+#
+# A benchmark with ILP n must issue n data-independent instructions per loop iteration,
+# otherwise it measures latency instead of throughput. The independence relies on the
+# register index arithmetic of the encoders, so it is checked on the instructions the
+# generators emit (SME.Instr, see AsmBlock.code): the vector instructions of the benchmark
+# loop are grouped by opcode, every group must contain exactly n instructions and no
+# instruction may read (RAW) or write (WAW) a register written by another instruction of its
+# group. Dependencies between groups
+# (e.g. the stores of a copy loop reading the loaded registers) are intended.
+#
+# Mixed benchmarks interleave instructions of different opcodes that must all be independent
+# of each other (compute and loads must not feed each other to measure their overlap).
+#
+# Latency benchmarks interleave n chains of dependent instructions instead, every instruction
+# must depend (RAW) on the previous instruction of its own chain and on no other chain.
+#
+# Registers are modelled as sets of resources: Z registers (z0..z31), predicates (p0..p15,
+# pn8 aliases p8), the rows of the ZA array (za:0..za:63), the bytes of the lookup table
+# (zt0:0..zt0:63) and general-purpose register operands (x0..x30, w aliases x), so that tiles,
+# ZA vectors, multi-vector groups and table slices overlap exactly when they share storage.
+# The base registers of addresses and ZA slices only select storage and are ignored.
+
+# number of ZA array rows (vectors) at SVL = 512
+ZA_ROWS = SME.SVL_BYTES
+
+# element size in bytes for each type suffix
+ELEMENT_SIZES = {"b": 1, "h": 2, "s": 4, "d": 8, "q": 16}
+
+# size of the lookup table in bytes and of its elements addressed by movt (zt0[offset])
+ZT0_BYTES = 64
+ZT0_SLICE_BYTES = 8
+
+def register_constants(code: list[SME.Instr | SME.Label]) -> dict[int, int]:
+  """ Values of general-purpose registers set with mov immediates (w and x views alias) """
+  constants = {}
+  for instruction in code:
+    if isinstance(instruction, SME.Instr) and instruction.opcode == "mov" and len(instruction.operands) == 2:
+      (register, value) = instruction.operands
+      if isinstance(register, SME.GPR) and isinstance(value, SME.Imm): constants[register.index] = value.value
+
+  return constants
+
+
+def za_rows(operand: SME.ZATile | SME.ZASlice | SME.ZAList, constants: dict[int, int]) -> set[int]:
+  """ ZA array rows accessed by a ZA operand """
+  match operand:
+    # tile list, e.g. {za0.d, za4.d}, or the whole array {za}
+    case SME.ZAList(tiles = ()):
+      return set(range(ZA_ROWS))
+    case SME.ZAList():
+      return set().union(*(za_rows(tile, constants) for tile in operand.tiles))
+
+    # tile, e.g. za1.s (every esize-th row)
+    case SME.ZATile():
+      return set(range(operand.index, ZA_ROWS, ELEMENT_SIZES[operand.suffix]))
+
+    # horizontal tile slice, e.g. za1h.s[w12, 3] (row w12 + 3 of tile 1), vertical tile slices
+    # are treated as the whole tile
+    case SME.ZASlice(tile = int()):
+      if operand.direction != "h" or operand.base.index not in constants: return za_rows(SME.ZATile(operand.tile, operand.suffix), constants)
+      size = ELEMENT_SIZES[operand.suffix]
+      return {operand.tile + (constants[operand.base.index] + operand.offset) % (ZA_ROWS//size)*size}
+
+  # array vectors, e.g. za.s[w8, 3], za.s[w8, 0:1, VGx2], za[w12, 0]
+  assert operand.base.index in constants, f"cannot resolve the base register {operand.base} of {operand}"
+  base = constants[operand.base.index]
+  stride = ZA_ROWS//operand.vgsize
+  return {(base + offset + group*stride) % ZA_ROWS for offset in range(operand.offset, operand.offset + operand.count) for group in range(operand.vgsize)}
+
+
+def operand_resources(operand: SME.Operand, constants: dict[int, int]) -> set[str]:
+  """ Vector, predicate, ZA, ZT0 and general-purpose register resources named by an operand (memory is ignored) """
+  match operand:
+    case SME.Z() | SME.ZGroup() | SME.P() | SME.PN() | SME.GPR():
+      return set(operand.registers)
+    case SME.ZATile() | SME.ZASlice() | SME.ZAList():
+      return {f"za:{row}" for row in za_rows(operand, constants)}
+    # the whole table (zt0) or the bytes of one element (zt0[8])
+    case SME.ZT0(offset = None):
+      return {f"zt0:{byte}" for byte in range(ZT0_BYTES)}
+    case SME.ZT0():
+      return {f"zt0:{byte}" for byte in range(operand.offset, operand.offset + ZT0_SLICE_BYTES)}
+
+  return set()
+
+
+def instruction_effects(instruction: SME.Instr, constants: dict[int, int]) -> tuple[set[str], set[str]]:
+  """ (reads, writes) of a vector instruction
+
+      Stores read all operands, loads write their first operand. Data-processing instructions
+      write their first operand and are treated as accumulating (the destination is also read).
+  """
+  resources = [operand_resources(operand, constants) for operand in instruction.operands]
+  if instruction.opcode.startswith("st"):
+    return (set().union(*resources), set())
+
+  reads = set().union(*resources[1:])
+  if not instruction.opcode.startswith("ld"): reads |= resources[0]
+
+  return (reads, resources[0])
+
+
+def find_hazards(loop: list[SME.Instr], constants: dict[int, int], same_opcode: bool = True) -> list[str]:
+  """ RAW/WAW hazards between the instructions with the same opcode (or all instructions) of a loop body """
+  effects = [(instruction, *instruction_effects(instruction, constants)) for instruction in loop]
+
+  hazards = []
+  for (i, (first, _, first_writes)) in enumerate(effects):
+    for (second, second_reads, second_writes) in effects[i + 1:]:
+      if same_opcode and first.opcode != second.opcode: continue
+      for (kind, shared) in [("RAW", first_writes & second_reads), ("WAW", first_writes & second_writes)]:
+        if shared:
+          hazards.append(f"{kind} on {", ".join(sorted(shared))}: {first} -> {second}")
+
+  return hazards
+
+
+def find_chains(loop: list[SME.Instr], constants: dict[int, int]) -> list[list[int]]:
+  """ Split a loop body into dependency chains (indices of the instructions of each chain)
+
+      Every instruction is appended to the chain of the latest instruction it reads from,
+      instructions without a producer in the loop body start a new chain. An instruction
+      reading from several chains or skipping the last instruction of its chain is reported
+      by an assertion.
+  """
+  effects = [instruction_effects(instruction, constants) for instruction in loop]
+  chain_of = {}
+  chains = []
+  for (j, (reads, _)) in enumerate(effects):
+    producers = [i for i in range(j) if effects[i][1] & reads]
+    linked = {chain_of[i] for i in producers}
+    assert len(linked) <= 1, f"{loop[j]} depends on several chains"
+
+    if producers:
+      chain_of[j] = chain_of[producers[-1]]
+      assert chains[chain_of[j]][-1] in producers, f"{loop[j]} does not depend on the previous instruction of its chain"
+      chains[chain_of[j]].append(j)
+    else:
+      chain_of[j] = len(chains)
+      chains.append([j])
+
+  return chains
+
+
+def verify_kernel(name: str, code: list[SME.Instr | SME.Label], ilp: int, chain_length: int = 1):
+  """ Check that the benchmark loop of a kernel (AsmBlock.code) has ilp independent instructions of
+      each opcode or, for latency benchmarks (chain_length > 1), ilp independent chains of
+      chain_length dependent instructions
+  """
+  loop = [instruction for instruction in SME.hot_loop(code) if not instruction.is_scalar]
+  constants = register_constants(code)
+
+  counts = {}
+  for instruction in loop: counts[instruction.opcode] = counts.get(instruction.opcode, 0) + 1
+  assert all(count == ilp*chain_length for count in counts.values()), f"{name}: expected {ilp*chain_length} instructions of each opcode, found {counts}"
+
+  if chain_length > 1:
+    chains = find_chains(loop, constants)
+    lengths = [len(chain) for chain in chains]
+    assert lengths == [chain_length]*ilp, f"{name}: expected {ilp} dependent chains of {chain_length} instructions, found {lengths}"
+    return
+
+  hazards = find_hazards(loop, constants)
+  assert not hazards, f"{name}: instructions are not independent\n  " + "\n  ".join(hazards)
+
+
+def verify_mixed_kernel(name: str, code: list[SME.Instr | SME.Label], counts: dict[str, int]):
+  """ Check that the benchmark loop of a mixed kernel (AsmBlock.code) has the expected number of
+      instructions of each opcode and that all of them are independent
+  """
+  loop = [instruction for instruction in SME.hot_loop(code) if not instruction.is_scalar]
+
+  found = {}
+  for instruction in loop: found[instruction.opcode] = found.get(instruction.opcode, 0) + 1
+  expected = {opcode: count for (opcode, count) in counts.items() if count > 0}
+  assert found == expected, f"{name}: expected instructions {expected}, found {found}"
+
+  hazards = find_hazards(loop, register_constants(code), same_opcode = False)
+  assert not hazards, f"{name}: instructions are not independent\n  " + "\n  ".join(hazards)
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+import sys
+assert sys.version_info >= (3, 10), "Requires Python 3.10 or later"
+
+import json, math, argparse
+import numpy as np
+import results, stats
+
+# Thermal drift detection
+#
+# The samples of a row are stored in execution order, so thermal throttling and frequency
+# ramps during its repetitions show up as a monotonic trend or a step in the sample sequence
+# rather than as random noise. Every row is tested for both:
+#
+#   trend  Mann-Kendall test (tie-corrected normal approximation), the size of the trend is
+#          Sen's slope (median of the pairwise slopes) over the whole sequence
+#   step   the split with the largest between-segment sum of squares, tested by the difference
+#          of the segment medians relative to the pooled MAD (normal approximation,
+#          Bonferroni-corrected for the choice of the split), the size of the step is the
+#          relative change of the segment medians
+#
+# p-values are adjusted over all rows (Benjamini-Hochberg) and a row is flagged if a test is
+# significant and the relative change exceeds the minimal change. With a randomized run
+# schedule (plan_sweep.py --shuffle) the samples of a row come from several rounds spread over
+# the run, so the tests also see drift between the rounds.
+
+def valid_positions(matrix: np.ndarray) -> np.ndarray:
+  """ Mask of the valid (non-padding) samples """
+  return ~np.isnan(matrix)
+
+
+def mann_kendall(matrix: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+  """ Mann-Kendall trend test and Sen's slope of each row (samples in execution order)
+
+      Returns the z statistic, the two-sided p-value and the slope per sample, rows with fewer
+      than three samples have p = NaN.
+  """
+  n = stats.sample_counts(matrix).astype(np.float64)
+  width = matrix.shape[1]
+  # pairs i < j of valid samples
+  upper = np.triu(np.ones((width, width), dtype = bool), k = 1)[None, :, :]
+  valid = valid_positions(matrix)
+  pairs = upper & valid[:, :, None] & valid[:, None, :]
+
+  diff = matrix[:, None, :] - matrix[:, :, None]
+  s = np.sum(np.where(pairs, np.sign(diff), 0), axis = (1, 2))
+
+  # tie correction: sum of t(t - 1)(2t + 5) over groups of tied values = sum of (t - 1)(2t + 5) over values
+  ties = np.sum(matrix[:, :, None] == matrix[:, None, :], axis = 2)
+  tie_term = np.sum(np.where(valid, (ties - 1)*(2*ties + 5), 0), axis = 1)
+
+  with np.errstate(invalid = "ignore", divide = "ignore"):
+    sigma = np.sqrt((n*(n - 1)*(2*n + 5) - tie_term)/18)
+    z = (s - np.sign(s))/sigma
+    p = np.array([math.erfc(abs(value)/math.sqrt(2)) if np.isfinite(value) else np.nan for value in z])
+
+    # Sen's slope: median of the pairwise slopes
+    distance = np.arange(width)[None, :] - np.arange(width)[:, None]
+    slopes = np.where(pairs, diff/np.where(distance > 0, distance, 1)[None, :, :], np.nan)
+    slope = stats.median(slopes.reshape(len(matrix), -1))
+
+  p[sigma == 0] = 1.0
+  p[n < 3] = np.nan
+  return (z, p, slope)
+
+
+def step_change(matrix: np.ndarray, min_points: int = 3) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+  """ Most likely step of each row (samples in execution order)
+
+      Returns the index of the first sample after the step, the relative change of the
+      segment medians and the Bonferroni-corrected p-value, rows that are too short to split
+      have p = NaN.
+  """
+  counts = stats.sample_counts(matrix)
+  (n_rows, width) = matrix.shape
+  values = np.nan_to_num(matrix)
+  total = np.sum(values, axis = 1)
+  mean = total/np.maximum(counts, 1)
+
+  # between-segment sum of squares of every split k (left = samples 0..k-1)
+  k = np.arange(1, width)[None, :]
+  left_sum = np.cumsum(values, axis = 1)[:, :-1]
+  (n_left, n_right) = (k.astype(np.float64), (counts[:, None] - k).astype(np.float64))
+  with np.errstate(invalid = "ignore", divide = "ignore"):
+    between = n_left*(left_sum/n_left - mean[:, None])**2 + n_right*((total[:, None] - left_sum)/n_right - mean[:, None])**2
+  candidates = (k >= min_points) & (n_right >= min_points)
+  between = np.where(candidates, between, -np.inf)
+
+  split = np.argmax(between, axis = 1) + 1
+  splittable = np.any(candidates, axis = 1)
+
+  positions = np.arange(width)[None, :]
+  left = np.where(positions < split[:, None], matrix, np.nan)
+  right = np.where(positions >= split[:, None], matrix, np.nan)
+  (left_median, right_median) = (stats.median(left), stats.median(right))
+  (n_left, n_right) = (stats.sample_counts(left), stats.sample_counts(right))
+
+  with np.errstate(invalid = "ignore", divide = "ignore"):
+    change = right_median/left_median - 1
+    # the median difference in units of its standard error (from the pooled MAD)
+    pooled = np.sqrt(((n_left - 1)*stats.mad(left, left_median)**2 + (n_right - 1)*stats.mad(right, right_median)**2)/(n_left + n_right - 2))
+    z = np.abs(right_median - left_median)/(pooled*np.sqrt(1/n_left + 1/n_right))
+    p = np.array([math.erfc(value/math.sqrt(2)) if not np.isnan(value) else np.nan for value in z])
+
+  # identical segments
+  p[right_median == left_median] = 1.0
+  p = np.minimum(p*np.sum(candidates, axis = 1), 1.0)
+  p[~splittable] = np.nan
+
+  return (np.where(splittable, split, 0), change, p)
+
+
+def detect_drift(
+  matrix: np.ndarray,
+  alpha: float = 0.01,
+  min_change: float = 0.02,
+  min_points: int = 3
+) -> dict[str, np.ndarray]:
+  """ Trend and step statistics of each row and the drift flags """
+  center = stats.median(matrix)
+  counts = stats.sample_counts(matrix)
+  (trend_z, trend_p, slope) = mann_kendall(matrix)
+  (step_at, step, step_p) = step_change(matrix, min_points)
+
+  # adjust over all rows
+  (trend_q, step_q) = (stats.benjamini_hochberg(trend_p), stats.benjamini_hochberg(step_p))
+  with np.errstate(invalid = "ignore", divide = "ignore"):
+    # relative change over the whole sequence
+    trend = slope*(counts - 1)/center
+
+  trending = (trend_q < alpha) & (np.abs(trend) >= min_change)
+  stepping = (step_q < alpha) & (np.abs(step) >= min_change)
+
+  return {
+    "n": counts,
+    "median": center,
+    "trend": trend,
+    "trend_z": trend_z,
+    "trend_q": trend_q,
+    "step": step,
+    "step_at": step_at,
+    "step_q": step_q,
+    "drift": np.array([("trend+step" if t and s else "trend" if t else "step" if s else "") for (t, s) in zip(trending, stepping)], dtype = object),
+  }
+
+
+def main():
+  parser = argparse.ArgumentParser(description = "Detect thermal drift (trends and steps) in the sample sequences of benchmark reports")
+  parser.add_argument("reports", nargs = "+", help = "JSON benchmark reports (optionally .bz2)")
+  parser.add_argument("--alpha", type = float, default = 0.01, help = "false discovery rate of the trend and step tests")
+  parser.add_argument("--min-change", type = float, default = 0.02, help = "minimal relative change of a flagged trend or step")
+  parser.add_argument("--min-points", type = int, default = 3, help = "minimal number of samples on each side of a step")
+  parser.add_argument("--all", action = "store_true", help = "print all rows, not only the flagged ones")
+  parser.add_argument("--json", default = None, help = "write the statistics for all rows to this file")
+  args = parser.parse_args()
+
+  # reports are analysed one at a time, they can have different columns and sample fields
+  # (e.g. gops and gbps) and the tests are adjusted over the rows of each report
+  rows = []
+  for path in args.reports:
+    data = results.load(path)
+    table = {name: data[name] for name in stats.identity_columns(data)}
+    table.update(detect_drift(data.sample_matrix(), args.alpha, args.min_change, args.min_points))
+    flagged = table["drift"] != ""
+    rows += [dict(zip(table.keys(), row)) for row in zip(*(column.tolist() for column in table.values()))]
+
+    shown = np.ones(len(data), dtype = bool) if args.all else flagged
+    keys = [name for name in stats.DISPLAY_COLUMNS if name in table] if "label" in table else stats.identity_columns(data)
+    columns = [*keys, "n", "median", "trend", "trend_q", "step", "step_at", "step_q", "drift"]
+    if len(args.reports) > 1: print(f"{results.report_name(path)}:")
+    results.print_table({name: table[name][shown] for name in columns})
+
+    # a systematic slowdown over the repetitions shows as a negative median trend
+    print(f"{results.report_name(path)}: {np.sum(flagged)} of {len(data)} rows drift, median trend {np.nanmedian(table["trend"])*100:+.2f}%", file = sys.stderr)
+
+  if args.json is not None:
+    with open(args.json, "w") as file: json.dump(rows, file, indent = 2)
+
+if __name__ == "__main__":
+  main()
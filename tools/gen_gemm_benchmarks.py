@@ -0,0 +1,488 @@
+#!/usr/bin/env python3
+import sys, argparse
+from textwrap import dedent
+from dataclasses import dataclass, replace, fields as get_dataclass_fields
+import itertools
+import yaml
+import SME, codegen, dataflow, portable, gen_op_benchmarks, gen_mem_benchmarks
+from gen_op_benchmarks import Operation, OutputEncoder
+from gen_mem_benchmarks import LoadStoreEncoder
+
+# Packed GEMM micro-kernel benchmarks
+#
+# The outer product benchmarks feed the instructions from the same registers, which gives the
+# peak rate of the unit. These kernels compute a complete C = A*B on packed operands instead:
+#
+#   - A is packed in panels of m_step rows, each K step is tile_rows consecutive vectors
+#   - B is packed in panels of n_step columns, each K step is tile_cols consecutive vectors
+#   - every m_step x n_step block of C accumulates in tile_rows x tile_cols ZA tiles, which are
+#     stored as the ZA array (row r of tile t is at vector r*n_za_tiles + t of the 4KB block)
+#
+# The K loop loads the operands of k_unroll steps with (multi-vector) loads and issues one outer
+# product per tile and step. Widening operations consume several K elements per step (e.g. two
+# for FP16 into FP32). The benchmark reports the effective GOP/s (2*M*N*K), comparable to the
+# outer product peak of the instruction benchmarks.
+
+# Default micro-kernel parameters
+TILE_SIZES = [1, 2, 4]
+K_UNROLL = [1, 2, 4]
+
+# Default problem shapes (M, N, K), rounded up by the harness to multiples of the kernel steps
+SHAPES = [(128, 128, 128), (512, 512, 512), (1024, 1024, 1024), (512, 512, 64)]
+
+# Default number of operations per benchmark run (the calibration overrides it)
+N_OPS = 1 << 34
+
+# first vector register of the B operands (A uses the registers below)
+B_REGISTER = 16
+
+
+@dataclass(kw_only=True)
+class Benchmark:
+  label: str
+  feature: str
+  opcode: str
+  input_data: str
+  # input element bit width
+  input_size: int
+  output_data: str
+  # micro-kernel: ZA tile grid and unrolled K steps per loop iteration
+  tile_rows: int
+  tile_cols: int
+  k_unroll: int
+  # C block size and K elements per loop iteration (M, N and K must be multiples)
+  m_step: int
+  n_step: int
+  k_step: int
+  # number of operations per benchmark run (rounded to whole GEMMs)
+  n_ops: int
+  fn: tuple[str, str]
+
+  def to_c_struct(self):
+    fields = [f"{{ &setup, &{self.fn[0]}, &teardown }}"]
+
+    for field in get_dataclass_fields(self):
+      if field.name == "fn": continue
+
+      val = getattr(self, field.name)
+      val = f"\"{val}\"" if isinstance(val, str) else str(val)
+
+      fields.append(val)
+
+    return f"{{{", ".join(fields)}}}"
+
+
+def max_k_unroll(tile_rows: int, tile_cols: int) -> int:
+  """ Unrolled K steps fitting the operand registers (and the immediate offsets of the loads) """
+  return min(B_REGISTER//tile_rows, (32 - B_REGISTER)//tile_cols, 8)
+
+
+def make_benchmark_function(op: Operation, tile_rows: int, tile_cols: int, k_unroll: int, compact: bool = False):
+  """ Build the GEMM kernel for the operation with a tile_rows x tile_cols tile grid and k_unroll K steps per loop iteration
+
+      Compact kernels only contain the K loop body and the tile stores, the scaffolding is
+      GEMM_KERNEL (see COMPACT).
+  """
+  output_encoder = OutputEncoder(op)
+  assert op.output.type == "za-tile"
+  assert tile_rows*tile_cols <= output_encoder.max_independent_instructions, f"{op.label}: at most {output_encoder.max_independent_instructions} tiles"
+  assert 1 <= k_unroll <= max_k_unroll(tile_rows, tile_cols)
+
+  # elements per vector and K elements per outer product
+  rows = SME.SVL_BYTES*8//op.output.data.size
+  widening = op.output.data.size//op.input.data.size
+  n_tiles = tile_rows*tile_cols
+
+  # operand loads (A into z0.., B into z16..) and C stores (ZA array vectors)
+  a_loads = LoadStoreEncoder("reg-adjacent", op.input.data, tile_rows)
+  b_loads = LoadStoreEncoder("reg-adjacent", op.input.data, tile_cols)
+  b_loads.first_register = B_REGISTER
+  c_stores = LoadStoreEncoder("za-vector", None, 1)
+  suffix = op.input.data.suffix
+
+  # one K step: the operand loads and an outer product per tile
+  step_body = [a_loads.instruction("load", SME.GPR(1)), b_loads.instruction("load", SME.GPR(2))]
+  for (i, j) in itertools.product(range(tile_rows), range(tile_cols)):
+    step_body.append(SME.Instr(op.opcode, (*output_encoder.encode(i*tile_cols + j), SME.Z(i, suffix), SME.Z(B_REGISTER + j, suffix))))
+
+  def rename(instruction: SME.Instr, step: int) -> SME.Instr:
+    # every step loads the next vectors of the panels into the next registers
+    registers = {i: step*tile_rows + i for i in range(tile_rows)} | {B_REGISTER + j: B_REGISTER + step*tile_cols + j for j in range(tile_cols)}
+    return instruction.renamed(registers).advanced(step*tile_rows, SME.GPR(1)).advanced(step*tile_cols, SME.GPR(2))
+
+  def emit_k_body(asm: SME.AsmBlock):
+    asm.extend(SME.unroll(step_body, k_unroll, rename))
+
+  def emit_stores(asm: SME.AsmBlock):
+    for tile in range(n_tiles): c_stores.emit(asm, "store", SME.GPR(3), tile)
+
+  # generate the micro-kernel assembly
+  asm = SME.AsmBlock()
+
+  # prologue (the predicates of the loads and the outer products)
+  asm.emit("smstart")
+  asm.emit("ptrue", SME.P(0, suffix))
+  asm.emit("ptrue", SME.P(1, suffix))
+  asm.emit("ptrue", SME.PN(8, suffix))
+  asm.emit("mov", "x5", "%[a]")
+  asm.emit("mov", "x7", "%[c]")
+  asm.emit("mov", "x9", "%[m_blocks]")
+
+  # loop over the A panels (C block rows)
+  with asm.labeled_block(1):
+    asm.emit("mov", "x6", "%[b]")
+    asm.emit("mov", "x10", "%[n_blocks]")
+
+    # loop over the B panels (C blocks)
+    with asm.labeled_block(2):
+      asm.emit("zero", SME.ZAList())
+      asm.emit("mov", "x1", "x5")
+      asm.emit("mov", "x2", "x6")
+      asm.emit("mov", "x0", "%[k_iterations]")
+
+      # K loop
+      with asm.labeled_block(3):
+        emit_k_body(asm)
+
+        asm.emit("")
+        asm.emit("add", "x1", "x1", f"#{k_unroll*tile_rows*SME.SVL_BYTES}")
+        asm.emit("add", "x2", "x2", f"#{k_unroll*tile_cols*SME.SVL_BYTES}")
+        asm.emit("subs", "x0", "x0", "#1")
+        asm.emit("b.ne", "3b")
+
+      # store the tiles (one ZA array vector per tile row)
+      asm.emit("")
+      c_stores.emit_prologue(asm)
+      asm.emit("mov", "x3", "x7")
+      with asm.labeled_block(4):
+        emit_stores(asm)
+        asm.emit("add", "x3", "x3", f"#{output_encoder.max_independent_instructions*SME.SVL_BYTES}")
+        asm.emit("add", "w12", "w12", f"#{output_encoder.max_independent_instructions}")
+        asm.emit("cmp", "w12", f"#{SME.SVL_BYTES}")
+        asm.emit("b.ne", "4b")
+
+      # next C block (the B pointer is at the start of the next panel)
+      asm.emit("add", "x7", "x7", f"#{SME.SVL_BYTES*SME.SVL_BYTES}")
+      asm.emit("mov", "x6", "x2")
+      asm.emit("subs", "x10", "x10", "#1")
+      asm.emit("b.ne", "2b")
+
+    # next A panel
+    asm.emit("mov", "x5", "x1")
+    asm.emit("subs", "x9", "x9", "#1")
+    asm.emit("b.ne", "1b")
+
+  # asm epilogue
+  asm.emit("smstop")
+
+  # function declaration
+  fn_name = f"gemm_{op.opcode}_{op.output.data.label}_{op.input.data.label}_{tile_rows}x{tile_cols}_k{k_unroll}"
+  (m_step, n_step, k_step) = (tile_rows*rows, tile_cols*rows, k_unroll*widening)
+  loads = f"{k_unroll}x {a_loads.opcode("load")} (A, {tile_rows} vectors) + {k_unroll}x {b_loads.opcode("load")} (B, {tile_cols} vectors)"
+
+  fn_body = dedent(f"""
+    double {fn_name}(const void* args) {{
+      // {op.label}, {tile_rows}x{tile_cols} tiles ({m_step}x{n_step} C block), K unrolled {k_unroll}x
+      //
+      // Per K loop iteration ({k_step} K elements): {loads}, {k_unroll*n_tiles} {op.opcode}
+      const benchmark_data_t* data = args;
+
+      for (size_t repeat = 0; repeat < data->n_repeats; repeat++) {{
+        __asm__ __volatile__ (
+          {asm.join(second_ident = 10)}
+          : // no outputs
+          : [a] "r" (data->a), [b] "r" (data->b), [c] "r" (data->c), [m_blocks] "r" (data->m/{m_step}), [n_blocks] "r" (data->n/{n_step}), [k_iterations] "r" (data->k/{k_step})
+          : "x0", "x1", "x2", "x3", "x5", "x6", "x7", "x9", "x10"{c_stores.clobber}, "memory"
+        );
+      }}
+
+      // number of operations (2*M*N*K per GEMM)
+      return 2.0*(double)data->m*(double)data->n*(double)data->k*(double)data->n_repeats;
+    }}
+  """)
+
+  if compact:
+    (k_body, stores) = (SME.AsmBlock(), SME.AsmBlock())
+    emit_k_body(k_body)
+    emit_stores(stores)
+    tiles = output_encoder.max_independent_instructions
+    fn_body = dedent(f"""
+      // {op.label}, {tile_rows}x{tile_cols} tiles ({m_step}x{n_step} C block), K unrolled {k_unroll}x
+      GEMM_KERNEL({fn_name}, {suffix}, {m_step}, {n_step}, {k_step}, {k_unroll*tile_rows*SME.SVL_BYTES}, {k_unroll*tile_cols*SME.SVL_BYTES}, {tiles}, {tiles*SME.SVL_BYTES},
+        {k_body.compact(8)},
+        {stores.compact(8)})
+    """)
+
+  return Benchmark(
+    label = op.label,
+    feature = op.feature,
+    opcode = op.opcode,
+    input_data = op.input.data.label,
+    input_size = op.input.data.size,
+    output_data = op.output.data.label,
+    tile_rows = tile_rows,
+    tile_cols = tile_cols,
+    k_unroll = k_unroll,
+    m_step = m_step,
+    n_step = n_step,
+    k_step = k_step,
+    n_ops = N_OPS,
+    fn = (fn_name, fn_body)
+  )
+
+
+def make_portable_function(bench: Benchmark) -> Benchmark:
+  """ Replace the kernel of the benchmark with its portable C stand-in (see portable.py)
+
+      The stand-in computes the same blocked GEMM on the packed operands in plain C: every
+      m_step x n_step C block accumulates over K in a local array, which is stored to the
+      ZA array of the block in the storage type of the output. Elements without a C type are
+      converted from and to integers of their size.
+  """
+  fn_name = bench.fn[0]
+  (input_type, output_type) = (portable.storage_type(bench.input_data), portable.c_type(bench.output_data))
+  (m_step, n_step) = (bench.m_step, bench.n_step)
+  # the C block fills (at most) the ZA array, the setup allocates SVL_BYTES^2 bytes per block
+  assert m_step*n_step*SME.Types.with_label(bench.output_data).size//8 <= SME.SVL_BYTES*SME.SVL_BYTES
+  storage = portable.storage_type(bench.output_data)
+  store = "memcpy(c, acc, sizeof(acc));" if storage == output_type else f"PORTABLE_STORE(c, acc, {m_step*n_step}, {storage});"
+
+  fn_body = dedent(f"""
+    double {fn_name}(const void* args) {{
+      // {bench.label}, {m_step}x{n_step} C block (portable stand-in)
+      const benchmark_data_t* data = args;
+      const {input_type}* a = (const {input_type}*)data->a;
+      const {input_type}* b = (const {input_type}*)data->b;
+      {output_type} acc[{m_step*n_step}];
+
+      for (size_t repeat = 0; repeat < data->n_repeats; repeat++) {{
+        char* c = data->c;
+        for (size_t i = 0; i < data->m/{m_step}; i++) {{
+          for (size_t j = 0; j < data->n/{n_step}; j++) {{
+            // packed panels: K steps of {m_step} (A) and {n_step} (B) consecutive elements
+            const {input_type}* a_panel = a + i*data->k*{m_step};
+            const {input_type}* b_panel = b + j*data->k*{n_step};
+            memset(acc, 0, sizeof(acc));
+            for (size_t kk = 0; kk < data->k; kk++) {{
+              PORTABLE_OUTER(acc, a_panel + kk*{m_step}, b_panel + kk*{n_step}, {m_step}, {n_step}, {output_type});
+            }}
+            {store}
+            c += {SME.SVL_BYTES*SME.SVL_BYTES};
+          }}
+        }}
+        PORTABLE_CLOBBER(data->c);
+      }}
+
+      // number of operations (2*M*N*K per GEMM)
+      return 2.0*(double)data->m*(double)data->n*(double)data->k*(double)data->n_repeats;
+    }}
+  """)
+
+  return replace(bench, fn = (fn_name, fn_body))
+
+
+# C code shared by all generated files
+PREAMBLE = """// generated by tools/gen_gemm_benchmarks.py, do not edit!
+#include <assert.h>
+#include <stdlib.h>
+#include <string.h>
+#include "../bench.h"
+
+// Benchmark parameters (packed operands)
+typedef struct {
+  char*  a;
+  char*  b;
+  char*  c;
+  size_t m;
+  size_t n;
+  size_t k;
+  size_t n_repeats;
+} benchmark_data_t;
+"""
+
+# Compact kernels (--compact): the block loops, loop control and the tile store loop shared by
+# all kernels. GEMM_KERNEL expands to the same function as the expanded kernel
+# (make_benchmark_function), the kernel passes its element suffix, C block and K steps, the
+# operand and store strides, the K loop body and the tile stores.
+COMPACT = f"""
+// GEMM_KERNEL(name, t, m_step, n_step, k_step, a_bytes, b_bytes, tiles, tile_bytes, k_body, stores):
+// C = A*B on the packed operands, n_repeats times
+#define GEMM_KERNEL(name, t, m_step, n_step, k_step, a_bytes, b_bytes, tiles, tile_bytes, k_body, stores) \\
+  double name(const void* args) {{ \\
+    const benchmark_data_t* data = args; \\
+    for (size_t repeat = 0; repeat < data->n_repeats; repeat++) {{ \\
+      __asm__ __volatile__ ( \\
+        "smstart\\n" \\
+        "ptrue p0." #t "\\n" \\
+        "ptrue p1." #t "\\n" \\
+        "ptrue pn8." #t "\\n" \\
+        "mov x5, %[a]\\n" \\
+        "mov x7, %[c]\\n" \\
+        "mov x9, %[m_blocks]\\n" \\
+        "1:\\n" \\
+        "mov x6, %[b]\\n" \\
+        "mov x10, %[n_blocks]\\n" \\
+        "2:\\n" \\
+        "zero {{za}}\\n" \\
+        "mov x1, x5\\n" \\
+        "mov x2, x6\\n" \\
+        "mov x0, %[k_iterations]\\n" \\
+        "3:\\n" \\
+        k_body \\
+        "add x1, x1, #" #a_bytes "\\n" \\
+        "add x2, x2, #" #b_bytes "\\n" \\
+        "subs x0, x0, #1\\n" \\
+        "b.ne 3b\\n" \\
+        "mov x12, #0\\n" \\
+        "mov x3, x7\\n" \\
+        "4:\\n" \\
+        stores \\
+        "add x3, x3, #" #tile_bytes "\\n" \\
+        "add w12, w12, #" #tiles "\\n" \\
+        "cmp w12, #{SME.SVL_BYTES}\\n" \\
+        "b.ne 4b\\n" \\
+        "add x7, x7, #{SME.SVL_BYTES*SME.SVL_BYTES}\\n" \\
+        "mov x6, x2\\n" \\
+        "subs x10, x10, #1\\n" \\
+        "b.ne 2b\\n" \\
+        "mov x5, x1\\n" \\
+        "subs x9, x9, #1\\n" \\
+        "b.ne 1b\\n" \\
+        "smstop\\n" \\
+        : \\
+        : [a] "r" (data->a), [b] "r" (data->b), [c] "r" (data->c), [m_blocks] "r" (data->m/m_step), [n_blocks] "r" (data->n/n_step), [k_iterations] "r" (data->k/k_step) \\
+        : "x0", "x1", "x2", "x3", "x5", "x6", "x7", "x9", "x10", "x12", "memory" \\
+      ); \\
+    }} \\
+    return 2.0*(double)data->m*(double)data->n*(double)data->k*(double)data->n_repeats; \\
+  }}
+"""
+
+# benchmark setup (emitted in the table file)
+SETUP = f"""
+// benchmark setup
+#define ALIGNMENT 256UL
+#define ALIGN_UP(size) (((size) + ALIGNMENT - 1)/ALIGNMENT*ALIGNMENT)
+
+static void* setup(const void* args) {{
+  const gemm_benchmark_params_t* params = args;
+  const gemm_benchmark_t* bench = params->benchmark;
+  const gemm_shape_t shape = params->shape;
+
+  // the shape must be a multiple of the kernel steps
+  assert(shape.m % bench->m_step == 0 && shape.n % bench->n_step == 0 && shape.k % bench->k_step == 0);
+
+  benchmark_data_t* data = malloc(sizeof(benchmark_data_t));
+  data->m = shape.m;
+  data->n = shape.n;
+  data->k = shape.k;
+  // repeat small GEMMs to execute at least n_ops operations
+  double ops = 2.0*(double)shape.m*(double)shape.n*(double)shape.k;
+  data->n_repeats = ops < (double)bench->n_ops ? (size_t)((double)bench->n_ops/ops) : 1;
+
+  // packed operands and one ZA array per C block (aligned_alloc needs a multiple of the alignment)
+  size_t input_size = bench->input_size/8;
+  size_t a_size = ALIGN_UP(shape.m*shape.k*input_size);
+  size_t b_size = ALIGN_UP(shape.n*shape.k*input_size);
+  size_t c_size = (shape.m/bench->m_step)*(shape.n/bench->n_step)*{SME.SVL_BYTES*SME.SVL_BYTES}UL;
+  data->a = aligned_alloc(ALIGNMENT, a_size);
+  data->b = aligned_alloc(ALIGNMENT, b_size);
+  data->c = aligned_alloc(ALIGNMENT, c_size);
+  assert(data->a != nullptr && data->b != nullptr && data->c != nullptr);
+
+  // small normal values for every data type (no denormals or NaNs)
+  memset(data->a, 0x3c, a_size);
+  memset(data->b, 0x3c, b_size);
+
+  return data;
+}}
+
+static void teardown(void* args) {{
+  benchmark_data_t* data = args;
+
+  free(data->a); data->a = nullptr;
+  free(data->b); data->b = nullptr;
+  free(data->c); data->c = nullptr;
+  free(data);
+}}
+"""
+
+
+def make_shape_table(shapes: list[tuple[int, int, int]]):
+  """ Problem shapes to benchmark """
+  rows = ", ".join(f"{{ {m}UL, {n}UL, {k}UL }}" for (m, n, k) in shapes)
+
+  return dedent(f"""
+    // problem shapes (M, N, K)
+    static const gemm_shape_t shapes[] = {{ {rows} }};
+
+    CONST_PTR(gemm_shape_t) gemm_benchmark_shapes = shapes;
+    const size_t gemm_benchmark_shapes_count = sizeof(shapes)/sizeof(shapes[0]);
+  """)
+
+
+def generate_benchmarks(
+  operations: list[Operation],
+  cache: codegen.KernelCache,
+  calibration: codegen.Calibration,
+  tile_sizes: list[int] = TILE_SIZES,
+  k_unroll: list[int] = K_UNROLL,
+  compact: bool = False
+):
+  """ Generate the kernels for each outer product, tile grid and K unroll (reusing unchanged kernels from the cache) """
+  for op in operations:
+    # outer products (opcode za-tile, p/m, p/m, z, z)
+    if op.output.type != "za-tile" or op.operands is not None: continue
+    max_tiles = OutputEncoder(op).max_independent_instructions
+
+    for (tile_rows, tile_cols, unroll) in itertools.product(tile_sizes, tile_sizes, k_unroll):
+      if tile_rows*tile_cols > max_tiles or unroll > max_k_unroll(tile_rows, tile_cols): continue
+
+      bench = cache.get((op, tile_rows, tile_cols, unroll, compact), lambda: make_benchmark_function(op, tile_rows, tile_cols, unroll, compact))
+      # the run length is a table field, so calibration does not change the kernels
+      n_ops = calibration.get(N_OPS, label = op.label, tile_rows = tile_rows, tile_cols = tile_cols, k_unroll = unroll)
+      yield replace(bench, n_ops = n_ops)
+
+
+def parse_shape(text: str) -> tuple[int, int, int]:
+  (m, n, k) = text.split("x")
+  return (int(m), int(n), int(k))
+
+
+def main():
+  parser = argparse.ArgumentParser(description = "Generate the packed GEMM micro-kernel benchmarks")
+  parser.add_argument("output", help = "output directory for the generated C sources")
+  parser.add_argument("--shards", type = int, default = 8, help = "number of kernel source files")
+  parser.add_argument("--cache", default = None, help = "kernel cache directory (disabled if omitted)")
+  parser.add_argument("--plan", default = None, help = "sweep plan, only its run schedule is used (see plan_sweep.py)")
+  parser.add_argument("--calibration", default = None, help = "per-benchmark operation counts (see calibrate.py)")
+  parser.add_argument("--filter", default = None, help = "only generate the benchmarks matching this expression over the Benchmark fields, e.g. 'input_data == \"f32\" and tile_rows*tile_cols == 4'")
+  parser.add_argument("--tile-sizes", type = int, nargs = "+", default = TILE_SIZES, help = "ZA tiles per C block row and column (1, 2 or 4, up to the tiles of the data type)")
+  parser.add_argument("--k-unroll", type = int, nargs = "+", default = K_UNROLL, help = "K steps per loop iteration")
+  parser.add_argument("--shapes", type = parse_shape, nargs = "+", default = SHAPES, help = "problem shapes MxNxK, e.g. 512x512x512")
+  parser.add_argument("--backend", choices = ["sme", "portable"], default = "sme", help = "kernel backend (portable: plain C stand-ins that run on any machine, see portable.py)")
+  parser.add_argument("--compact", action = "store_true", help = "emit the kernels as their loop bodies with shared scaffolding macros (same machine code, smaller sources)")
+  args = parser.parse_args()
+  compact = args.compact and args.backend == "sme"
+
+  # load instruction definitions
+  with open('benchmarks.yaml', 'r') as file:
+    operations = [Operation.from_yaml(y) for y in yaml.safe_load(file)]
+
+  # generate the C code (kernels are written out as they are generated)
+  cache = codegen.KernelCache(args.cache, Benchmark, [__file__, SME.__file__, dataflow.__file__, gen_op_benchmarks.__file__, gen_mem_benchmarks.__file__])
+  selection = codegen.BenchmarkFilter(args.filter, Benchmark)
+  plan = codegen.SweepPlan(args.plan, "gemm_benchmarks")
+  calibration = codegen.Calibration(args.calibration, "gemm_benchmarks", "n_ops")
+  setup = SETUP + make_shape_table(args.shapes)
+  preamble = PREAMBLE + (COMPACT if compact else "") + (portable.PREAMBLE if args.backend == "portable" else "")
+  writer = codegen.KernelWriter(args.output, "gemm_benchmarks", args.shards, preamble, "gemm_benchmark_t", setup, plan.schedule)
+  with writer:
+    for bench in filter(selection, generate_benchmarks(operations, cache, calibration, args.tile_sizes, args.k_unroll, compact)):
+      writer.emit(make_portable_function(bench) if args.backend == "portable" else bench)
+
+  print(f"{writer.count} benchmarks ({cache.hits} cached), {len(writer.updated)} files updated", file = sys.stderr)
+
+
+if __name__ == "__main__":
+  main()
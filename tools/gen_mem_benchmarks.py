@@ -1,11 +1,12 @@
 #!/usr/bin/env python3
+import sys, argparse
 from types import SimpleNamespace
 from textwrap import indent, dedent
 from typing import Literal, assert_never, get_args
 import yaml
-from dataclasses import dataclass, fields as get_dataclass_fields
+from dataclasses import dataclass, replace, fields as get_dataclass_fields
 import itertools
-import SME
+import SME, codegen, dataflow, portable
 
 
 OpEncoding = Literal['reg-adjacent', 'reg-strided', 'za-vector']
@@ -23,6 +24,10 @@ class Benchmark:
   # element bit width, -1 if untyped
   data_size: int
   ilp: int
+  # fraction of active lanes of the governing predicates (1.0 for all-true or unpredicated transfers)
+  predicate_density: float
+  # bytes to transfer per thread (the number of iterations is derived from the buffer size)
+  transfer_size: int
   fn: tuple[str, str]
 
   def to_c_struct(self):
@@ -50,10 +55,25 @@ class LoadStoreEncoder:
   data: SME.SMEType | None
   # registers used
   clobber: str
+  # governing predicate (None for unpredicated transfers), its density and the number of active
+  # lanes per instruction (None if all lanes are active, see SME.emit_predicate)
+  predicate: SME.P | SME.PN | None = None
+  density: float = 1.0
+  active: int | None = None
+  # first vector register of the transfers (a different register range can be
+  # used when the loads are mixed with other instructions, see gen_mixed_benchmarks.py)
+  first_register: int = 0
 
   def emit_prologue(self, asm: SME.AsmBlock): pass
 
-  def emit(self, asm: SME.AsmBlock, op: Literal["load", "store"], base: str, index: int): pass
+  # the first of the independent instructions and the index-th one derived from it (the
+  # renaming of SME.unroll)
+  def instruction(self, op: Literal["load", "store"], base: SME.GPR) -> SME.Instr: pass
+  def rename(self, instruction: SME.Instr, index: int) -> SME.Instr: pass
+
+  def emit(self, asm: SME.AsmBlock, op: Literal["load", "store"], base: SME.GPR, index: int):
+    assert index < self.max_independent_instructions
+    asm.extend([self.rename(self.instruction(op, base), index)])
 
   def make_description(self, op: MemOperation):
     # operations
@@ -76,14 +96,33 @@ class LoadStoreEncoder:
         long = f"{size_desc[self.n_vectors]}, strided, predicated"
 
     short = f"{"+".join(ops)} {short}"
-    long = f"{"/".join(op.upper() for op in ops)} ({long})"
+    long = SME.predicate_label(f"{"/".join(op.upper() for op in ops)} ({long})", self.density)
 
     return (short, long)
 
   def make_function_name(self, op: MemOperation, ilp: int):
     data = f"_{self.data.label}" if self.data is not None else ""
+    predicate = f"_p{round(self.density*100)}" if self.density < 1.0 else ""
+
+    return f"{op}_{self.encoding.replace("-", "_")}_x{self.n_vectors}{predicate}_ilp{ilp}"
 
-    return f"{op}_{self.encoding.replace("-", "_")}_x{self.n_vectors}_ilp{ilp}"
+  @property
+  def active_fraction(self) -> float:
+    """ Fraction of the bytes of an instruction transferred by the active lanes """
+    if self.active is None: return 1.0
+    return self.active/((512//self.data.size)*self.n_vectors)
+
+  def init_predicate(self, predicate: SME.P | SME.PN | None, density: float):
+    """ Governing predicate with the first lanes active (density is the fraction of active lanes) """
+    assert predicate is not None or density == 1.0, "unpredicated transfers cannot be partial"
+    self.predicate = predicate
+    self.density = density
+    self.active = SME.active_lanes((512//self.data.size)*self.n_vectors, density) if predicate is not None else None
+    if self.active is not None: self.clobber += f", \"{SME.predicate_count(predicate)}\""
+
+  def emit_predicate(self, asm: SME.AsmBlock):
+    if self.predicate is None: return
+    SME.emit_predicate(asm, replace(self.predicate, suffix = self.data.suffix), self.active, self.n_vectors)
 
 
   def opcode(self, op: Literal['load', 'store']):
@@ -93,7 +132,7 @@ class LoadStoreEncoder:
       suffix = "w" if self.data.suffix == "s" else self.data.suffix
       return f"ld1{suffix}" if op == "load" else f"st1{suffix}"
 
-  def __new__(cls, encoding: OpEncoding, data: SME.SMEType | None, vgsize: int):
+  def __new__(cls, encoding: OpEncoding, data: SME.SMEType | None, vgsize: int, density: float = 1.0):
     match encoding:
       case "reg-adjacent": cls = RegisterLoadStoreEncoder
       case "reg-strided": cls = StridedRegisterLoadStoreEncoder
@@ -105,63 +144,63 @@ class LoadStoreEncoder:
     return instance
 
 class ZALoadStoreEncoder(LoadStoreEncoder):
-  def __init__(self, encoding: OpEncoding, data: SME.SMEType | None, vgsize: int):
+  def __init__(self, encoding: OpEncoding, data: SME.SMEType | None, vgsize: int, density: float = 1.0):
     assert encoding == "za-vector"
     assert data is None, "za array load must be untyped"
     assert vgsize == 1
     self.max_independent_instructions = 16
     self.n_vectors = 1
     self.data = None
-    self.predicate = None
     self.clobber = ", \"x12\""
+    self.init_predicate(None, density)
 
   def emit_prologue(self, asm: SME.AsmBlock):
-    asm.emit("mov","x12", "#0")
+    asm.emit("mov", SME.GPR(12), SME.Imm(0))
 
-  def emit(self, asm: SME.AsmBlock, op: Literal["load", "store"],  base: str, index: int):
-    assert index < self.max_independent_instructions
-    asm.emit(self.opcode(op), f"za[w12, {index}]", f"[{base}, {index}, MUL VL]")
+  def instruction(self, op: Literal["load", "store"], base: SME.GPR):
+    return SME.Instr(self.opcode(op), (SME.ZASlice(SME.GPR(12, 32), 0), SME.Address(base, 0)))
+
+  def rename(self, instruction: SME.Instr, index: int):
+    # the vector offset of the ZA array and the memory offset are the same
+    (vector, address) = instruction.operands
+    return replace(instruction, operands = (replace(vector, offset = vector.offset + index), address)).advanced(index)
 
 
 class RegisterLoadStoreEncoder(LoadStoreEncoder):
-  def __init__(self, encoding: OpEncoding, data: SME.SMEType | None, vgsize: int):
+  def __init__(self, encoding: OpEncoding, data: SME.SMEType | None, vgsize: int, density: float = 1.0):
     assert encoding == "reg-adjacent"
     assert (data is None and vgsize == 1) or data is not None, "multivector load/stores must be typed"
     assert vgsize in [1, 2, 4]
     self.max_independent_instructions = 8
     self.data = data
     self.n_vectors = vgsize
-    self.predicate = None
     self.clobber = ""
-    if data is not None:
-      self.predicate = "p0" if vgsize == 1 else "pn8"
+    self.init_predicate(None if data is None else SME.P(0) if vgsize == 1 else SME.PN(8), density)
 
   def emit_prologue(self, asm: SME.AsmBlock):
-    if self.predicate is None: return
-    asm.emit("ptrue", f"{self.predicate}.{self.data.suffix}")
-
-  def emit(self, asm: SME.AsmBlock, op: Literal["load", "store"],  base: str, index: int):
-    assert index < self.max_independent_instructions
-
-    # vector group index range
-    i0 = index*self.n_vectors
-    i1 = (index+1)*self.n_vectors - 1
+    self.emit_predicate(asm)
 
+  def instruction(self, op: Literal["load", "store"], base: SME.GPR):
     # encode the storage register(s)
-    suffix = "" if self.data is None else f".{self.data.suffix}"
-    reg = f"z{i0}{suffix}" if i0 == i1 else f"{{z{i0}{suffix}-z{i1}{suffix}}}"
+    suffix = None if self.data is None else self.data.suffix
+    reg = SME.Z(self.first_register, suffix) if self.n_vectors == 1 else SME.ZGroup(self.first_register, self.n_vectors, suffix)
 
     # predicate encoding differts for load and store
     if self.predicate is not None and op == "load":
-      predicate = self.predicate + "/z"
+      predicate = replace(self.predicate, qualifier = "z")
     else:
       predicate = self.predicate
 
-    # emit the instruction
-    asm.emit(self.opcode(op), reg, predicate, f"[{base}, {i0}, MUL VL]")
+    return SME.Instr(self.opcode(op), tuple(operand for operand in (reg, predicate, SME.Address(base, 0)) if operand is not None))
+
+  def rename(self, instruction: SME.Instr, index: int):
+    # the vector group of the index-th instruction follows the previous ones
+    shift = index*self.n_vectors
+    registers = {register: register + shift for register in range(self.first_register, self.first_register + self.n_vectors)}
+    return instruction.renamed(registers).advanced(shift)
 
 class StridedRegisterLoadStoreEncoder(LoadStoreEncoder):
-  def __init__(self, encoding: OpEncoding, data: SME.SMEType | None, vgsize: int):
+  def __init__(self, encoding: OpEncoding, data: SME.SMEType | None, vgsize: int, density: float = 1.0):
     assert encoding == "reg-strided"
     assert data is not None
     assert vgsize in [2, 4]
@@ -169,28 +208,37 @@ class StridedRegisterLoadStoreEncoder(LoadStoreEncoder):
     self.data = data
     self.n_vectors = vgsize
     self.clobber = ""
+    self.init_predicate(SME.PN(8), density)
 
   def emit_prologue(self, asm: SME.AsmBlock):
-    asm.emit("ptrue", f"pn8.{self.data.suffix}")
+    self.emit_predicate(asm)
 
-  def emit(self, asm: SME.AsmBlock, op: Literal["load", "store"],  base: str, index: int):
-    assert index < self.max_independent_instructions
+  def instruction(self, op: Literal["load", "store"], base: SME.GPR):
+    # strided registers
+    regs = SME.ZGroup(0, self.n_vectors, self.data.suffix, 16//self.n_vectors)
+
+    return SME.Instr(self.opcode(op), (regs, SME.PN(8, qualifier = "z" if op == "load" else None), SME.Address(base, 0)))
+
+  def rename(self, instruction: SME.Instr, index: int):
     stride = 16//self.n_vectors
 
     # the initial register has the index 0 <= . < stride or 16 <= . < 16 + stride
     # map the index to that range
     offset = 16*(index // stride) + index % stride
+    registers = {member*stride: offset + member*stride for member in range(self.n_vectors)}
 
-    # strided registers
-    regs = ", ".join(f"z{offset + i*stride}.{self.data.suffix}" for i in range(self.n_vectors))
-    regs = f"{{{regs}}}"
+    return instruction.renamed(registers).advanced(index*self.n_vectors)
 
-    # emit the instruction
-    asm.emit(self.opcode(op), regs, "pn8/z" if op == "load" else "pn8", f"[{base}, {index*self.n_vectors}, MUL VL]")
 
+def make_benchmark_function(encoder: LoadStoreEncoder, op: MemOperation, ilp: int, compact: bool = False):
+  """ Build benchmarking code for the operation using ilp data-parallel instructions per chunk
 
-def make_benchmark_function(encoder: LoadStoreEncoder, op: MemOperation, ilp: int):
-  """ Build benchmarking code for the operation using ilp data-parallel instructions per chunk """
+      With a partial predicate the instructions still step through the buffer one vector group
+      at a time, the returned byte count only includes the bytes of the active lanes. The
+      instructions are verified (see dataflow.py) before they are rendered. Compact kernels only
+      contain the prologue, the main loop body and the tail loop body, the scaffolding is
+      MEM_KERNEL or MEM_KERNEL_1 (see COMPACT).
+  """
   assert ilp >= 1 and ilp <= encoder.max_independent_instructions
 
   # bytes processed per instruction and loop iteration
@@ -207,15 +255,30 @@ def make_benchmark_function(encoder: LoadStoreEncoder, op: MemOperation, ilp: in
 
   # data pointers
   if op == "copy":
-    ptr = [("x1", "load", "src"), ("x2", "store", "dst")]
+    ptr = [(SME.GPR(1), "load", "src"), (SME.GPR(2), "store", "dst")]
   elif op == "load":
-    ptr = [("x1", "load", "src")]
+    ptr = [(SME.GPR(1), "load", "src")]
   else:
-    ptr = [("x1", "store", "dst")]
+    ptr = [(SME.GPR(1), "store", "dst")]
+
+  def emit_body(asm: SME.AsmBlock):
+    # the first instruction unrolled ilp times
+    for (reg, op_type, _) in ptr:
+      asm.extend(SME.unroll([encoder.instruction(op_type, reg)], ilp, encoder.rename))
+      asm.emit("")
+
+    # increment the pointers
+    for (reg, _, _) in ptr: asm.emit("add", reg, reg, SME.Imm(bytes_per_loop))
+
+  def emit_tail(asm: SME.AsmBlock):
+    # one instruction
+    for (reg, op_type, _) in ptr:
+      asm.extend([encoder.instruction(op_type, reg)])
+      asm.emit("add", reg, reg, SME.Imm(bytes_per_instruction))
 
   # the outer loop (repeat n times)
   with asm.labeled_block(1):
-    for (reg, _, addr) in ptr: asm.emit("mov", reg, f"%[{addr}]") # source data pointer
+    for (reg, _, addr) in ptr: asm.emit("mov", reg, SME.Arg(addr)) # source data pointer
 
     # We split the processing in two parts: a main loop that uses multiple
     # instructions to process chunk_size bytes per iteration, and a tail
@@ -223,16 +286,10 @@ def make_benchmark_function(encoder: LoadStoreEncoder, op: MemOperation, ilp: in
 
     # main loop (ILP=ilp)
     with asm.labeled_block(2):
-      # emit intructions
-      for (reg, op_type, _) in ptr:
-        for i in range(ilp): encoder.emit(asm, op_type, reg, i)
-        asm.emit("")
-
-      # increment the pointers
-      for (reg, _, _) in ptr: asm.emit("add", reg, reg, f"#{bytes_per_loop}")
+      emit_body(asm)
 
       # repeat the loop
-      asm.emit("cmp", ptr[0][0], "%[end_aligned]" if ilp > 1 else "%[end]")
+      asm.emit("cmp", ptr[0][0], SME.Arg("end_aligned" if ilp > 1 else "end"))
       asm.emit("b.lo", "2b")
 
       if (ilp > 1): asm.emit("b", "4f")
@@ -240,14 +297,11 @@ def make_benchmark_function(encoder: LoadStoreEncoder, op: MemOperation, ilp: in
     # tail loop (only needed if ilp > 1)
     if ilp > 1:
       with asm.labeled_block(3):
-        # one instruction
-        for (reg, op_type, _) in ptr:
-          encoder.emit(asm, op_type, reg, 0)
-          asm.emit("add", reg, reg, f"#{bytes_per_instruction}")
+        emit_tail(asm)
 
       # tail loop condition
       with asm.labeled_block(4):
-        asm.emit("cmp", ptr[0][0], "%[end]")
+        asm.emit("cmp", ptr[0][0], SME.Arg("end"))
         asm.emit("b.lo", "3b")
 
     # advance the outer loop
@@ -274,20 +328,23 @@ def make_benchmark_function(encoder: LoadStoreEncoder, op: MemOperation, ilp: in
   else:
     tail_computation = ""
 
-  # transfer factor (2.0 if we do a copy)
+  # transfer factor (2.0 if we do a copy) and the fraction of active bytes
   factor = "2.0*" if op == "copy" else ""
+  active = f"{encoder.active_fraction}*" if encoder.active is not None else ""
+  active_bytes = f" ({round(bytes_per_instruction*encoder.active_fraction)} active)" if encoder.active is not None else ""
 
   # description
   (label, description) = encoder.make_description(op)
 
   # build the function
   fn_name = encoder.make_function_name(op, ilp)
+  dataflow.verify_kernel(fn_name, asm.code, ilp)
 
   fn_body =  dedent(f"""
-    static double {fn_name}(const void* args) {{
+    double {fn_name}(const void* args) {{
       // {description}
       //
-      // Bytes per instruction: {bytes_per_instruction}, bytes per loop iteration: {bytes_per_loop} (ILP={ilp})
+      // Bytes per instruction: {bytes_per_instruction}{active_bytes}, bytes per loop iteration: {bytes_per_loop} (ILP={ilp})
       const benchmark_data_t* data = args;{tail_computation}
 
       //printf("starting {fn_name}\\n");
@@ -302,10 +359,26 @@ def make_benchmark_function(encoder: LoadStoreEncoder, op: MemOperation, ilp: in
       //printf("done {fn_name}\\n");
 
       // number of bytes transferred overall
-      return {factor}data->total_size;
+      return {active}{factor}data->total_size;
     }}
   """)
 
+  if compact:
+    (prologue, body, tail) = (SME.AsmBlock(), SME.AsmBlock(), SME.AsmBlock())
+    encoder.emit_prologue(prologue)
+    emit_body(body)
+    emit_tail(tail)
+    fn_body = dedent(f"""
+      // {description}, ILP = {ilp}
+      MEM_KERNEL({op}, {fn_name}, {encoder.active_fraction}, {bytes_per_loop}, {prologue.compact(8)},
+        {body.compact(8)},
+        {tail.compact(8)}{encoder.clobber})
+    """) if ilp > 1 else dedent(f"""
+      // {description}, ILP = {ilp}
+      MEM_KERNEL_1({op}, {fn_name}, {encoder.active_fraction}, {prologue.compact(8)},
+        {body.compact(8)}{encoder.clobber})
+    """)
+
   return Benchmark(
     label = description,
     encoding = encoder.encoding,
@@ -315,9 +388,44 @@ def make_benchmark_function(encoder: LoadStoreEncoder, op: MemOperation, ilp: in
     # data size
     data_size = encoder.data.size if encoder.data is not None else -1,
     ilp = ilp,
+    predicate_density = encoder.density,
+    transfer_size = TRANSFER_SIZE,
     fn = (fn_name, fn_body)
   )
 
+def make_portable_function(bench: Benchmark) -> Benchmark:
+  """ Replace the kernel of the benchmark with its portable C stand-in (see portable.py)
+
+      The stand-in transfers the buffer n_iterations times with plain C (a XOR reduction for
+      loads, memset and memcpy for stores and copies) and returns the same byte count as the
+      SME kernel. The ILP and the instruction encoding are not modelled.
+  """
+  fn_name = bench.fn[0]
+  transfer = {
+    "load":  ["PORTABLE_LOAD(sum, data->src, data->size/8);", "PORTABLE_CLOBBER(sum);"],
+    "store": ["memset(data->dst, (int)i, data->size);", "PORTABLE_CLOBBER(data->dst);"],
+    "copy":  ["memcpy(data->dst, data->src, data->size);", "PORTABLE_CLOBBER(data->dst);"]
+  }[bench.op]
+  accumulator = "\n      uint64_t sum = 0;" if bench.op == "load" else ""
+  factor = "2.0*" if bench.op == "copy" else ""
+
+  fn_body = dedent(f"""
+    double {fn_name}(const void* args) {{
+      // {bench.label} (portable stand-in)
+      const benchmark_data_t* data = args;{accumulator}
+
+      for (size_t i = 0; i < data->n_iterations; i++) {{
+        {"\n        ".join(transfer)}
+      }}
+
+      // number of bytes transferred overall
+      return {factor}data->total_size;
+    }}
+  """)
+
+  return replace(bench, fn = (fn_name, fn_body))
+
+
 # build benchmarks (encoding, data, vgsize)
 #
 benchmark_params = [
@@ -325,45 +433,119 @@ benchmark_params = [
   (["reg-adjacent", "reg-strided"], [SME.Types.f32], [2, 4]),
 ]
 
+# Allocation granularity (same as SIZE_ALIGNMENT in the generated code)
+SIZE_ALIGNMENT = 64*4
+# Default number of bytes to transfer per benchmark run and thread (the calibration overrides it)
+TRANSFER_SIZE = 512*1048576
 
-benchmarks = []
-# ugly nested for
-for params in benchmark_params:
-  for (encoding, data, vgsize, op_type) in itertools.product(*params, get_args(MemOperation)):
-    encoder = LoadStoreEncoder(encoding, data, vgsize)
-    for ilp in (i + 1 for i in range(encoder.max_independent_instructions)):
-      bench = make_benchmark_function(encoder, op_type, ilp)
-      benchmarks.append(bench)
-
-
-
-# build the file
-print(f"""// generated by tools/gen_mem_benchmarks.py, do not edit!
+# C code shared by all generated files
+PREAMBLE = """// generated by tools/gen_mem_benchmarks.py, do not edit!
 #include <assert.h>
 #include <stdlib.h>
-#include "bench.h"
+#include "../bench.h"
 
 // Allocation granularity, must be large enough to align with 4x multivector load/store
 #define SIZE_ALIGNMENT (64*4)
 
 // Benchmark parameters
-typedef struct {{
+typedef struct {
   char*  src;
   char*  dst;
   size_t size;
   size_t n_iterations;
   double total_size;
-}} benchmark_data_t;
-
-// Benchmark functions
-{"\n".join(bench.fn[1] for bench in benchmarks)}
-
+} benchmark_data_t;
+"""
+
+# Compact kernels (--compact): the pointer setup, loop control and epilogue shared by all kernels.
+# MEM_KERNEL (ILP > 1, with a tail loop) and MEM_KERNEL_1 expand to the same function as the
+# expanded kernel (make_benchmark_function), the kernel passes the operation, the fraction of
+# active bytes, its prologue, the loop bodies (transfers and pointer increments) and extra
+# clobbers. The first pointer (x1) is the loop counter.
+COMPACT = """
+// registers, asm inputs and byte factor of the operations
+#define MEM_SETUP_load "mov x1, %[src]\\n"
+#define MEM_SETUP_store "mov x1, %[dst]\\n"
+#define MEM_SETUP_copy "mov x1, %[src]\\n" "mov x2, %[dst]\\n"
+#define MEM_POINTERS_load [src] "r" (data->src)
+#define MEM_POINTERS_store [dst] "r" (data->dst)
+#define MEM_POINTERS_copy [src] "r" (data->src), [dst] "r" (data->dst)
+#define MEM_BASE_load src
+#define MEM_BASE_store dst
+#define MEM_BASE_copy src
+#define MEM_REGISTERS_load "x1"
+#define MEM_REGISTERS_store "x1"
+#define MEM_REGISTERS_copy "x1", "x2"
+#define MEM_FACTOR_load
+#define MEM_FACTOR_store
+#define MEM_FACTOR_copy 2.0*
+
+// MEM_KERNEL(op, name, active, bytes_per_loop, prologue, body, tail, clobbers...): transfer the
+// buffer n_iterations times, bytes_per_loop bytes per iteration of body and the rest with tail
+// (active is the fraction of the bytes transferred by the active lanes, 1.0 without partial predicates)
+#define MEM_KERNEL(op, name, active, bytes_per_loop, prologue, body, tail, ...) \\
+  double name(const void* args) { \\
+    const benchmark_data_t* data = args; \\
+    size_t size_aligned = data->size - (data->size % bytes_per_loop); \\
+    __asm__ __volatile__ ( \\
+      "smstart\\n" \\
+      "mov x0, %[n]\\n" \\
+      prologue \\
+      "1:\\n" \\
+      MEM_SETUP_##op \\
+      "2:\\n" \\
+      body \\
+      "cmp x1, %[end_aligned]\\n" \\
+      "b.lo 2b\\n" \\
+      "b 4f\\n" \\
+      "3:\\n" \\
+      tail \\
+      "4:\\n" \\
+      "cmp x1, %[end]\\n" \\
+      "b.lo 3b\\n" \\
+      "subs x0, x0, #1\\n" \\
+      "b.ne 1b\\n" \\
+      "smstop\\n" \\
+      : \\
+      : [n] "r" (data->n_iterations), MEM_POINTERS_##op, [end] "r" (data->MEM_BASE_##op + data->size), [end_aligned] "r" (data->MEM_BASE_##op + size_aligned) \\
+      : "x0", MEM_REGISTERS_##op __VA_OPT__(,) __VA_ARGS__ \\
+    ); \\
+    return active*MEM_FACTOR_##op data->total_size; \\
+  }
+
+// MEM_KERNEL_1(op, name, active, prologue, body, clobbers...): one transfer per iteration, no tail loop
+#define MEM_KERNEL_1(op, name, active, prologue, body, ...) \\
+  double name(const void* args) { \\
+    const benchmark_data_t* data = args; \\
+    __asm__ __volatile__ ( \\
+      "smstart\\n" \\
+      "mov x0, %[n]\\n" \\
+      prologue \\
+      "1:\\n" \\
+      MEM_SETUP_##op \\
+      "2:\\n" \\
+      body \\
+      "cmp x1, %[end]\\n" \\
+      "b.lo 2b\\n" \\
+      "subs x0, x0, #1\\n" \\
+      "b.ne 1b\\n" \\
+      "smstop\\n" \\
+      : \\
+      : [n] "r" (data->n_iterations), MEM_POINTERS_##op, [end] "r" (data->MEM_BASE_##op + data->size) \\
+      : "x0", MEM_REGISTERS_##op __VA_OPT__(,) __VA_ARGS__ \\
+    ); \\
+    return active*MEM_FACTOR_##op data->total_size; \\
+  }
+"""
+
+# benchmark setup (emitted in the table file)
+SETUP = f"""
 // benchmark setup
 #define MB(x) (size_t)x*1048576UL
 
-static size_t find_n_iterations(size_t size) {{
-  // at least 512MB
-  size_t n = MB(512)/size;
+static size_t find_n_iterations(size_t size, size_t transfer_size) {{
+  // transfer at least transfer_size bytes
+  size_t n = transfer_size/size;
   n = n < 16 ? 16 : n;
   return n;
 }}
@@ -382,7 +564,7 @@ static void* setup(const void* args) {{
   data->size = params->size;
   data->src = aligned_alloc(params->alignment, params->size);
   data->dst = aligned_alloc(params->alignment, params->size);
-  data->n_iterations = find_n_iterations(data->size);
+  data->n_iterations = find_n_iterations(data->size, params->transfer_size);
   data->total_size = (double)data->size*(double)data->n_iterations;
 
   assert(data->src != nullptr);
@@ -399,12 +581,85 @@ static void teardown(void* args) {{
   free(data);
 }}
 
+"""
+
+
+def make_size_table(sizes: list[int] | None):
+  """ Buffer sizes to benchmark (if empty, the harness uses its default sizes) """
+  if not sizes:
+    return dedent("""
+      // benchmark buffer sizes (none, use the harness defaults)
+      const size_t* _Nullable mem_benchmark_sizes = nullptr;
+      const size_t mem_benchmark_sizes_count = 0;
+    """)
+
+  for size in sizes: assert size % SIZE_ALIGNMENT == 0, f"buffer size {size} is not a multiple of {SIZE_ALIGNMENT}"
+
+  return dedent(f"""
+    // benchmark buffer sizes (selected by the sweep plan)
+    static const size_t sizes[] = {{ {", ".join(f"{size}UL" for size in sizes)} }};
+
+    const size_t* _Nullable mem_benchmark_sizes = sizes;
+    const size_t mem_benchmark_sizes_count = sizeof(sizes)/sizeof(sizes[0]);
+  """)
 
-// benchmark table
-static const mem_benchmark_t benchmarks[] = {{
-  {",\n  ".join(bench.to_c_struct() for bench in benchmarks)}
-}};
 
-CONST_PTR(mem_benchmark_t) mem_benchmarks = benchmarks;
-const size_t mem_benchmarks_count = sizeof(benchmarks)/sizeof(benchmarks[0]);
-""")
+def generate_benchmarks(
+  cache: codegen.KernelCache,
+  plan: codegen.SweepPlan,
+  calibration: codegen.Calibration,
+  densities: list[float] = SME.PREDICATE_DENSITIES,
+  compact: bool = False
+):
+  """ Generate the benchmarks for each parameter combination (reusing unchanged kernels from the cache)
+
+      Predicated transfers are also benchmarked with every partial predicate density (as
+      separate benchmarks, the label includes the density). Every kernel is verified when it
+      is built, so the kernel cache is also keyed by dataflow.py.
+  """
+  # ugly nested for
+  for params in benchmark_params:
+    for (encoding, data, vgsize, op_type) in itertools.product(*params, get_args(MemOperation)):
+      predicated = LoadStoreEncoder(encoding, data, vgsize).predicate is not None
+      for density in [1.0, *(density for density in densities if density < 1.0 and predicated)]:
+        encoder = LoadStoreEncoder(encoding, data, vgsize, density)
+        (_, label) = encoder.make_description(op_type)
+        key = dict(label = label, encoding = encoding, op_type = op_type, n_vectors = encoder.n_vectors)
+        for ilp in plan.ilps(range(1, encoder.max_independent_instructions + 1), **key):
+          bench = cache.get((encoding, data, vgsize, density, op_type, ilp), lambda: make_benchmark_function(encoder, op_type, ilp))
+          if compact: bench = cache.get((encoding, data, vgsize, density, op_type, ilp, "compact"), lambda: make_benchmark_function(encoder, op_type, ilp, compact = True))
+          # the transfer size is a table field, so calibration does not change the kernels
+          yield replace(bench, transfer_size = calibration.get(TRANSFER_SIZE, **key, ilp = ilp))
+
+
+def main():
+  parser = argparse.ArgumentParser(description = "Generate the SME memory benchmarks")
+  parser.add_argument("output", help = "output directory for the generated C sources")
+  parser.add_argument("--shards", type = int, default = 8, help = "number of kernel source files")
+  parser.add_argument("--cache", default = None, help = "kernel cache directory (disabled if omitted)")
+  parser.add_argument("--plan", default = None, help = "sweep plan selecting the ILPs, buffer sizes and the run schedule (see plan_sweep.py)")
+  parser.add_argument("--calibration", default = None, help = "per-benchmark transfer sizes (see calibrate.py)")
+  parser.add_argument("--filter", default = None, help = "only generate the benchmarks matching this expression over the Benchmark fields, e.g. 'op == \"copy\" and ilp <= 4'")
+  parser.add_argument("--predicate-densities", type = float, nargs = "*", default = SME.PREDICATE_DENSITIES, help = "fractions of active lanes of the predicated transfers (all-true predicates are always benchmarked)")
+  parser.add_argument("--backend", choices = ["sme", "portable"], default = "sme", help = "kernel backend (portable: plain C stand-ins that run on any machine, see portable.py)")
+  parser.add_argument("--compact", action = "store_true", help = "emit the kernels as their loop bodies with shared scaffolding macros (same machine code, smaller sources)")
+  args = parser.parse_args()
+  compact = args.compact and args.backend == "sme"
+
+  # build the files (kernels are written out as they are generated)
+  cache = codegen.KernelCache(args.cache, Benchmark, [__file__, SME.__file__, dataflow.__file__])
+  plan = codegen.SweepPlan(args.plan, "mem_benchmarks")
+  selection = codegen.BenchmarkFilter(args.filter, Benchmark)
+  calibration = codegen.Calibration(args.calibration, "mem_benchmarks", "transfer_size")
+  setup = SETUP + make_size_table(plan.sizes)
+  preamble = PREAMBLE + (COMPACT if compact else "") + (portable.PREAMBLE if args.backend == "portable" else "")
+  writer = codegen.KernelWriter(args.output, "mem_benchmarks", args.shards, preamble, "mem_benchmark_t", setup, plan.schedule)
+  with writer:
+    for bench in filter(selection, generate_benchmarks(cache, plan, calibration, args.predicate_densities, compact)):
+      writer.emit(make_portable_function(bench) if args.backend == "portable" else bench)
+
+  print(f"{writer.count} benchmarks ({cache.hits} cached), {len(writer.updated)} files updated", file = sys.stderr)
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,484 @@
+#!/usr/bin/env python3
+import sys, argparse
+from textwrap import dedent
+from dataclasses import dataclass, replace, fields as get_dataclass_fields
+import yaml
+import SME, codegen, dataflow, portable, gen_op_benchmarks, gen_mem_benchmarks
+from gen_op_benchmarks import Operation, OutputEncoder, InputEncoder
+from gen_mem_benchmarks import LoadStoreEncoder, OpEncoding
+
+# Mixed instruction benchmarks
+#
+# Two instruction streams (operations from benchmarks.yaml or vector loads) are interleaved in
+# one benchmark loop at a fixed ratio, all instructions being independent of each other. The
+# combined throughput compared to the throughput of each stream alone (the ratios with a zero
+# count) shows whether the units overlap, e.g. whether outer products can be issued at their
+# peak rate while the operands of the next tile are loaded.
+
+# Default number of instructions per benchmark run (divided by the instructions per loop iteration,
+# the calibration overrides it)
+N_ITERATIONS = 8000000
+
+# Default ratios (instructions of the first and second stream per loop iteration)
+RATIOS = [(4, 0), (0, 4), (4, 1), (4, 2), (4, 4), (2, 4), (1, 4)]
+
+# Default size of the buffer the loads cycle through (L1-resident)
+BUFFER_SIZE = 16384
+
+# first vector register of the loads, the operations only read the lower registers
+LOAD_REGISTER = 16
+
+
+@dataclass(kw_only=True)
+class Benchmark:
+  label: str
+  # required SVE/SME features (comma-separated)
+  features: str
+  # first instruction stream
+  first: str
+  first_opcode: str
+  first_count: int
+  # second instruction stream
+  second: str
+  second_opcode: str
+  second_count: int
+  # operations and loaded bytes per loop iteration
+  ops_per_iteration: int
+  bytes_per_iteration: int
+  # size of the buffer the loads cycle through (0 if there are no loads)
+  buffer_size: int
+  # number of benchmark loop iterations
+  n_iterations: int
+  fn: tuple[str, str]
+
+  def to_c_struct(self):
+    fields = [f"{{ &setup, &{self.fn[0]}, &teardown }}"]
+
+    for field in get_dataclass_fields(self):
+      if field.name == "fn": continue
+
+      val = getattr(self, field.name)
+      val = f"\"{val}\"" if isinstance(val, str) else str(val)
+
+      fields.append(val)
+
+    return f"{{{", ".join(fields)}}}"
+
+
+# Instruction streams
+class Stream:
+  # descriptive label
+  label: str
+  opcode: str
+  feature: str
+  # max number of independent instructions per loop iteration
+  max_count: int
+  ops_per_instruction: int
+  bytes_per_instruction: int
+  clobber: str
+
+  def emit_prologue(self, asm: SME.AsmBlock): pass
+  def emit(self, asm: SME.AsmBlock, index: int): pass
+
+
+class OperationStream(Stream):
+  """ Operation instructions, the indices start at offset so that two operation streams use
+      disjoint registers and ZA storage
+  """
+  def __init__(self, op: Operation, offset: int = 0):
+    self.op = op
+    self.offset = offset
+    self.output_encoder = OutputEncoder(op)
+    self.input_encoder = InputEncoder(op)
+    self.label = op.label
+    self.opcode = op.opcode
+    self.feature = op.feature
+    self.max_count = min(self.output_encoder.max_independent_instructions - offset, 16)
+    self.ops_per_instruction = op.ops*self.output_encoder.n_elements
+    self.bytes_per_instruction = 0
+    self.clobber = self.output_encoder.clobber
+
+  def emit_prologue(self, asm: SME.AsmBlock):
+    self.output_encoder.emit_prologue(asm)
+
+  def emit(self, asm: SME.AsmBlock, index: int):
+    index = index + self.offset
+    asm.emit(self.op.opcode, *self.output_encoder.encode(index), self.input_encoder.encode(index), self.input_encoder.encode(index))
+
+
+class LoadStream(Stream):
+  """ Vector loads into the upper registers (z16..z31) from the pointer in x1 """
+  def __init__(self, encoding: OpEncoding, data: SME.SMEType | None, vgsize: int):
+    self.encoder = LoadStoreEncoder(encoding, data, vgsize)
+    assert encoding == "reg-adjacent", "only adjacent register loads leave the lower registers to the operations"
+    self.encoder.first_register = LOAD_REGISTER
+    (_, self.label) = self.encoder.make_description("load")
+    self.opcode = self.encoder.opcode("load")
+    self.feature = "FEAT_SME2"
+    self.max_count = min(self.encoder.max_independent_instructions, (32 - LOAD_REGISTER)//self.encoder.n_vectors)
+    self.ops_per_instruction = 0
+    self.bytes_per_instruction = self.encoder.n_vectors*SME.SVL_BYTES
+    self.clobber = self.encoder.clobber
+
+  def emit_prologue(self, asm: SME.AsmBlock):
+    self.encoder.emit_prologue(asm)
+
+  def emit(self, asm: SME.AsmBlock, index: int):
+    self.encoder.emit(asm, "load", SME.GPR(1), index)
+
+
+@dataclass(kw_only=True)
+class Mix:
+  # short name (used in the function names)
+  name: str
+  # operation label
+  first: str
+  # operation label or load encoding (encoding, data, vgsize)
+  second: str | tuple[OpEncoding, SME.SMEType | None, int]
+
+  def streams(self, operations: dict[str, Operation]) -> tuple[Stream, Stream]:
+    first = OperationStream(operations[self.first])
+    if isinstance(self.second, str):
+      # the second operation continues the register and ZA indices of the first
+      second = OperationStream(operations[self.second], offset = first.max_count)
+    else:
+      second = LoadStream(*self.second)
+
+    return (first, second)
+
+
+# build benchmarks
+MIXES = [
+  # outer products and their operand loads
+  Mix(name = "fmopa_f32_ld1w_x4", first = "FMOPA (FP32)", second = ("reg-adjacent", SME.Types.f32, 4)),
+  Mix(name = "fmopa_f32_ldr", first = "FMOPA (FP32)", second = ("reg-adjacent", None, 1)),
+  # outer products and streaming vector arithmetic
+  Mix(name = "fmopa_f32_fmla_f32", first = "FMOPA (FP32)", second = "FMLA (FP32, one vector)"),
+  # two multi-vector operations accumulating into ZA
+  Mix(name = "fdot_f16_fmla_f32_vgx2", first = "FDOT (FP16 to FP32, 2-way, two vectors)", second = "FMLA (FP32, two vectors)"),
+]
+
+
+def make_benchmark_function(mix: Mix, streams: tuple[Stream, Stream], first_count: int, second_count: int, buffer_size: int, compact: bool = False):
+  """ Build benchmarking code interleaving first_count and second_count instructions of the two streams
+
+      The instructions are verified (see dataflow.py) before they are rendered. Compact kernels
+      only contain the prologue and the loop body, the scaffolding is MIX_KERNEL or
+      MIX_KERNEL_LOADS (see COMPACT).
+  """
+  (first, second) = streams
+  assert 0 <= first_count <= first.max_count and 0 <= second_count <= second.max_count
+  counts = (first_count, second_count)
+  bytes_per_iteration = first_count*first.bytes_per_instruction + second_count*second.bytes_per_instruction
+  ops_per_iteration = first_count*first.ops_per_instruction + second_count*second.ops_per_instruction
+  # the loads advance through the buffer (for every ratio of the mix, so that the loop overhead is the same)
+  loads = any(stream.bytes_per_instruction > 0 for stream in streams)
+
+  # generate the microbenchmark assembly
+  asm = SME.AsmBlock()
+
+  # prologue
+  asm.emit("smstart")
+  asm.emit("mov", "x0", "%[n]")
+  if loads:
+    asm.emit("mov", "x1", "%[buffer]")
+    asm.emit("mov", "x2", "%[buffer]")
+    asm.emit("mov", "x3", "%[end]")
+  prologue = SME.AsmBlock()
+  for stream in streams: stream.emit_prologue(prologue)
+  # streams may share predicates and base registers
+  prologue.items = list(dict.fromkeys(prologue.items))
+  asm.extend(prologue.instructions)
+
+  def emit_body(asm: SME.AsmBlock):
+    # the instructions of both streams, spread evenly over the loop
+    instructions = []
+    for (stream, count) in zip(streams, counts):
+      block = SME.AsmBlock()
+      for index in range(count): stream.emit(block, index)
+      instructions.append(block.instructions)
+    asm.extend(SME.interleave(*instructions))
+
+  # the microbenchmark loop
+  with asm.labeled_block(1):
+    emit_body(asm)
+
+    asm.emit("")
+    if loads:
+      # advance the load pointer, wrapping around at the end of the buffer
+      asm.emit("add", "x1", "x1", f"#{bytes_per_iteration}")
+      asm.emit("cmp", "x1", "x3")
+      asm.emit("csel", "x1", "x2", "x1", "hi")
+    asm.emit("subs", "x0", "x0", "#1")
+    asm.emit("b.ne", "1b")
+
+  # asm epilogue
+  asm.emit("smstop")
+
+  # function declaration
+  fn_name = f"mix_{mix.name}_{first_count}x{second_count}"
+  opcodes = {}
+  for (stream, count) in zip(streams, counts): opcodes[stream.opcode] = opcodes.get(stream.opcode, 0) + count
+  dataflow.verify_mixed_kernel(fn_name, asm.code, opcodes)
+  label = f"{first.label} + {second.label}"
+
+  asm_inputs = "[n] \"r\" (data->n_iterations)"
+  clobber = "\"x0\""
+  check = ""
+  if loads:
+    check = f"\n      assert(data->size >= {bytes_per_iteration});"
+    asm_inputs += f", [buffer] \"r\" (data->buffer), [end] \"r\" (data->buffer + data->size - {bytes_per_iteration})"
+    clobber += ", \"x1\", \"x2\", \"x3\""
+  clobber += "".join(dict.fromkeys(stream.clobber for stream in streams))
+
+  fn_body = dedent(f"""
+    double {fn_name}(const void* args) {{
+      // {label}
+      //
+      // {first_count}x {first.opcode} + {second_count}x {second.opcode} per loop iteration ({ops_per_iteration} OPs, {bytes_per_iteration} bytes loaded)
+      const benchmark_data_t* data = args;{check}
+
+      __asm__ __volatile__ (
+        {asm.join()}
+        : // no outputs
+        : {asm_inputs}
+        : {clobber}
+      );
+
+      // number of loop iterations executed
+      return (double)data->n_iterations;
+    }}
+  """)
+
+  if compact:
+    body = SME.AsmBlock()
+    emit_body(body)
+    clobber = "".join(dict.fromkeys(stream.clobber for stream in streams))
+    kernel = f"MIX_KERNEL_LOADS({fn_name}, {bytes_per_iteration}," if loads else f"MIX_KERNEL({fn_name},"
+    fn_body = dedent(f"""
+      // {label}, {first_count}x {first.opcode} + {second_count}x {second.opcode}
+      {kernel} {prologue.compact(8)},
+        {body.compact(8)}{clobber})
+    """)
+
+  return Benchmark(
+    label = label,
+    features = ",".join(dict.fromkeys(stream.feature for stream in streams)),
+    first = first.label,
+    first_opcode = first.opcode,
+    first_count = first_count,
+    second = second.label,
+    second_opcode = second.opcode,
+    second_count = second_count,
+    ops_per_iteration = ops_per_iteration,
+    bytes_per_iteration = bytes_per_iteration,
+    buffer_size = buffer_size if loads else 0,
+    n_iterations = N_ITERATIONS//(first_count + second_count),
+    fn = (fn_name, fn_body)
+  )
+
+
+def make_portable_function(bench: Benchmark) -> Benchmark:
+  """ Replace the kernel of the benchmark with its portable C stand-in (see portable.py)
+
+      Every loop iteration performs ops_per_iteration/2 multiply-accumulates and loads
+      bytes_per_iteration bytes, advancing through the buffer like the SME kernel. The
+      stand-in returns the number of loop iterations.
+  """
+  fn_name = bench.fn[0]
+  n_macs = bench.ops_per_iteration//2
+  n_bytes = bench.bytes_per_iteration
+  (declarations, body) = ([], [])
+  if n_macs > 0:
+    declarations += [f"float acc[{n_macs}], a[1] = {{ 0 }}, b[1] = {{ 0 }};", "memset(acc, 0, sizeof(acc));", "PORTABLE_CLOBBER(a);", "PORTABLE_CLOBBER(b);"]
+    body += [f"PORTABLE_MAC(acc, a, b, {n_macs}, 1);", "PORTABLE_CLOBBER(acc);"]
+  if n_bytes > 0:
+    declarations += [f"assert(data->size >= {n_bytes});", "uint64_t sum = 0;", "size_t offset = 0;"]
+    # wrap around at the end of the buffer
+    body += [
+      f"PORTABLE_LOAD(sum, data->buffer + offset, {n_bytes//8});",
+      f"offset = offset + {n_bytes} > data->size - {n_bytes} ? 0 : offset + {n_bytes};",
+      "PORTABLE_CLOBBER(sum);"
+    ]
+
+  fn_body = dedent(f"""
+    double {fn_name}(const void* args) {{
+      // {bench.label} (portable stand-in)
+      //
+      // {n_macs} multiply-accumulates + {n_bytes} bytes loaded per loop iteration
+      const benchmark_data_t* data = args;
+      {"\n      ".join(declarations)}
+
+      for (size_t i = 0; i < data->n_iterations; i++) {{
+        {"\n        ".join(body)}
+      }}
+
+      // number of loop iterations executed
+      return (double)data->n_iterations;
+    }}
+  """)
+
+  return replace(bench, fn = (fn_name, fn_body))
+
+
+# C code shared by all generated files
+PREAMBLE = """// generated by tools/gen_mixed_benchmarks.py, do not edit!
+#include <assert.h>
+#include <stdlib.h>
+#include "../bench.h"
+
+// Benchmark parameters
+typedef struct {
+  char*  buffer;
+  size_t size;
+  size_t n_iterations;
+} benchmark_data_t;
+"""
+
+# Compact kernels (--compact): the pointer setup, loop control and epilogue shared by all kernels.
+# MIX_KERNEL and MIX_KERNEL_LOADS (the loads advance through the buffer) expand to the same
+# function as the expanded kernel (make_benchmark_function), the kernel passes its prologue,
+# loop body and extra clobbers.
+COMPACT = """
+// MIX_KERNEL(name, prologue, body, clobbers...): run body n_iterations times
+#define MIX_KERNEL(name, prologue, body, ...) \\
+  double name(const void* args) { \\
+    const benchmark_data_t* data = args; \\
+    __asm__ __volatile__ ( \\
+      "smstart\\n" \\
+      "mov x0, %[n]\\n" \\
+      prologue \\
+      "1:\\n" \\
+      body \\
+      "subs x0, x0, #1\\n" \\
+      "b.ne 1b\\n" \\
+      "smstop\\n" \\
+      : \\
+      : [n] "r" (data->n_iterations) \\
+      : "x0" __VA_OPT__(,) __VA_ARGS__ \\
+    ); \\
+    return (double)data->n_iterations; \\
+  }
+
+// MIX_KERNEL_LOADS(name, bytes, prologue, body, clobbers...): run body n_iterations times,
+// advancing x1 by bytes per iteration and wrapping around at the end of the buffer
+#define MIX_KERNEL_LOADS(name, bytes, prologue, body, ...) \\
+  double name(const void* args) { \\
+    const benchmark_data_t* data = args; \\
+    assert(data->size >= bytes); \\
+    __asm__ __volatile__ ( \\
+      "smstart\\n" \\
+      "mov x0, %[n]\\n" \\
+      "mov x1, %[buffer]\\n" \\
+      "mov x2, %[buffer]\\n" \\
+      "mov x3, %[end]\\n" \\
+      prologue \\
+      "1:\\n" \\
+      body \\
+      "add x1, x1, #" #bytes "\\n" \\
+      "cmp x1, x3\\n" \\
+      "csel x1, x2, x1, hi\\n" \\
+      "subs x0, x0, #1\\n" \\
+      "b.ne 1b\\n" \\
+      "smstop\\n" \\
+      : \\
+      : [n] "r" (data->n_iterations), [buffer] "r" (data->buffer), [end] "r" (data->buffer + data->size - bytes) \\
+      : "x0", "x1", "x2", "x3" __VA_OPT__(,) __VA_ARGS__ \\
+    ); \\
+    return (double)data->n_iterations; \\
+  }
+"""
+
+# benchmark setup (emitted in the table file)
+SETUP = """
+// benchmark setup
+static void* setup(const void* args) {
+  const mixed_benchmark_params_t* params = args;
+  assert(params != nullptr);
+
+  benchmark_data_t* data = malloc(sizeof(benchmark_data_t));
+  data->size = params->buffer_size;
+  data->n_iterations = params->n_iterations;
+  // buffer for the loads (aligned for the multi-vector loads)
+  data->buffer = params->buffer_size > 0 ? aligned_alloc(256, params->buffer_size) : nullptr;
+  assert(params->buffer_size == 0 || data->buffer != nullptr);
+
+  return data;
+}
+
+static void teardown(void* args) {
+  benchmark_data_t* data = args;
+
+  free(data->buffer); data->buffer = nullptr;
+  free(data);
+}
+"""
+
+
+def generate_benchmarks(
+  mixes: list[Mix],
+  operations: dict[str, Operation],
+  cache: codegen.KernelCache,
+  calibration: codegen.Calibration,
+  ratios: list[tuple[int, int]] = RATIOS,
+  buffer_size: int = BUFFER_SIZE,
+  compact: bool = False
+):
+  """ Generate the benchmarks for each mix and ratio (reusing unchanged kernels from the cache)
+
+      Ratios exceeding the independent instructions available to a stream are skipped. Every
+      kernel is verified when it is built, so the kernel cache is also keyed by dataflow.py.
+  """
+  for mix in mixes:
+    streams = mix.streams(operations)
+    for (first_count, second_count) in ratios:
+      if first_count + second_count == 0: continue
+      if first_count > streams[0].max_count or second_count > streams[1].max_count: continue
+
+      bench = cache.get((mix, first_count, second_count, buffer_size), lambda: make_benchmark_function(mix, streams, first_count, second_count, buffer_size))
+      if compact: bench = cache.get((mix, first_count, second_count, buffer_size, "compact"), lambda: make_benchmark_function(mix, streams, first_count, second_count, buffer_size, compact = True))
+      # the iteration count is a table field, so calibration does not change the kernels
+      n_iterations = calibration.get(bench.n_iterations, label = bench.label, first_count = first_count, second_count = second_count)
+      yield replace(bench, n_iterations = n_iterations)
+
+
+def parse_ratio(text: str) -> tuple[int, int]:
+  (first, _, second) = text.partition(":")
+  return (int(first), int(second))
+
+
+def main():
+  parser = argparse.ArgumentParser(description = "Generate the mixed SME/SVE instruction benchmarks")
+  parser.add_argument("output", help = "output directory for the generated C sources")
+  parser.add_argument("--shards", type = int, default = 8, help = "number of kernel source files")
+  parser.add_argument("--cache", default = None, help = "kernel cache directory (disabled if omitted)")
+  parser.add_argument("--plan", default = None, help = "sweep plan, only its run schedule is used (see plan_sweep.py)")
+  parser.add_argument("--calibration", default = None, help = "per-benchmark iteration counts (see calibrate.py)")
+  parser.add_argument("--filter", default = None, help = "only generate the benchmarks matching this expression over the Benchmark fields, e.g. 'second_opcode == \"ld1w\"'")
+  parser.add_argument("--ratios", type = parse_ratio, nargs = "+", default = RATIOS, help = "instructions of the first and second stream per loop iteration, e.g. 4:1 4:2")
+  parser.add_argument("--buffer-size", type = int, default = BUFFER_SIZE, help = "size of the buffer the loads cycle through (bytes)")
+  parser.add_argument("--backend", choices = ["sme", "portable"], default = "sme", help = "kernel backend (portable: plain C stand-ins that run on any machine, see portable.py)")
+  parser.add_argument("--compact", action = "store_true", help = "emit the kernels as their loop bodies with shared scaffolding macros (same machine code, smaller sources)")
+  args = parser.parse_args()
+  compact = args.compact and args.backend == "sme"
+
+  # load instruction definitions
+  with open('benchmarks.yaml', 'r') as file:
+    operations = {op.label: op for op in (Operation.from_yaml(y) for y in yaml.safe_load(file))}
+
+  # generate the C code (kernels are written out as they are generated)
+  cache = codegen.KernelCache(args.cache, Benchmark, [__file__, SME.__file__, dataflow.__file__, gen_op_benchmarks.__file__, gen_mem_benchmarks.__file__])
+  selection = codegen.BenchmarkFilter(args.filter, Benchmark)
+  plan = codegen.SweepPlan(args.plan, "mixed_benchmarks")
+  calibration = codegen.Calibration(args.calibration, "mixed_benchmarks", "n_iterations")
+  preamble = PREAMBLE + (COMPACT if compact else "") + (portable.PREAMBLE if args.backend == "portable" else "")
+  writer = codegen.KernelWriter(args.output, "mixed_benchmarks", args.shards, preamble, "mixed_benchmark_t", SETUP, plan.schedule)
+  with writer:
+    for bench in filter(selection, generate_benchmarks(MIXES, operations, cache, calibration, args.ratios, args.buffer_size, compact)):
+      writer.emit(make_portable_function(bench) if args.backend == "portable" else bench)
+
+  print(f"{writer.count} benchmarks ({cache.hits} cached), {len(writer.updated)} files updated", file = sys.stderr)
+
+
+if __name__ == "__main__":
+  main()
@@ -1,29 +1,72 @@
 #!/usr/bin/env python3
+import sys, argparse, math
 from types import SimpleNamespace
 from textwrap import indent, dedent
 from typing import Literal, assert_never
 import yaml
-from dataclasses import dataclass, fields as get_dataclass_fields
-import SME
+from dataclasses import dataclass, replace, fields as get_dataclass_fields
+import SME, codegen, dataflow, portable
 
 # SVE/SME operation encoding (data is in benchmarks.yaml)
 OperationEncoding = Literal["za-tile", "za-vector", "za-double-vector", "za-quad-vector", "z-register"]
 
+# Operand types and roles of operations with an explicit operand list (see Operation.Operand)
+OperandType = Literal[
+  "z-register", "z-lane", "za-tile", "za-tiles", "za-tile-slice", "za-vector", "za-double-vector", "za-quad-vector",
+  "za-row", "zt0", "zt0-slice", "predicate", "predicate-as-counter", "gpr", "immediate", "memory"
+]
+OperandRole = Literal["destination", "accumulator", "source"]
+
+# Benchmark kind: independent instructions (throughput) or dependent chains (latency)
+BenchmarkMode = Literal["throughput", "latency"]
+
+# Default number of instructions per chain at ILP 1 (divided by the ILP and the chain length,
+# the calibration overrides it)
+N_ITERATIONS = 8000000
+
+# Default latency benchmarks: instructions per dependent chain and number of interleaved chains
+CHAIN_LENGTHS = [8]
+CHAIN_INTERLEAVE = [1, 2]
+
 @dataclass(kw_only=True)
 class Operation:
-  """ An SVE/SME operation with two register inputs and an output
+  """ An SVE/SME operation with two register inputs and an output (opcode out, in, in) or with
+      an explicit operand list
 
-      See operations.yaml for more info
+      See benchmarks.yaml for more info
   """
   @dataclass
   class Output:
-    type: OperationEncoding
+    type: OperationEncoding | OperandType
     data: SME.SMEType
 
   @dataclass
   class Input:
     data: SME.SMEType
 
+  @dataclass(kw_only=True)
+  class Operand:
+    role: OperandRole
+    type: OperandType
+    data: SME.SMEType | None = None
+    # registers per Z register group or vectors per ZA vector group
+    vgsize: int = 1
+    # predicate qualifier (m or z)
+    qualifier: str | None = None
+    # immediate value or vector index (z-lane)
+    value: int | None = None
+
+    @classmethod
+    def from_yaml(cls, yaml):
+      return cls(
+        role = yaml.get("role"),
+        type = yaml.get("type"),
+        data = SME.Types.with_label(yaml["data"]) if "data" in yaml else None,
+        vgsize = yaml.get("vgsize", 1),
+        qualifier = yaml.get("qualifier"),
+        value = yaml.get("value")
+      )
+
   # fields
   label: str
   category: str
@@ -34,9 +77,14 @@ class Operation:
   output: Output
   input: Input
   ops: int
+  # explicit operands (None for the opcode out, in, in form)
+  operands: list[Operand] | None = None
 
   @classmethod
   def from_yaml(cls, yaml):
+    if "operands" in yaml:
+      return cls.from_operands_yaml(yaml)
+
     return Operation(
       label = yaml.get("label"),
       category = yaml.get("category"),
@@ -54,6 +102,28 @@ class Operation:
       ops = yaml.get("ops")
     )
 
+  @classmethod
+  def from_operands_yaml(cls, yaml):
+    """ Operation with an explicit operand list, the output is the first destination (or accumulator)
+        operand and the input the first source operand with data
+    """
+    operands = [cls.Operand.from_yaml(y) for y in yaml.get("operands")]
+    output = next(operand for operand in operands if operand.role != "source")
+    inputs = [operand for operand in operands if operand.role == "source" and operand.data is not None]
+
+    return Operation(
+      label = yaml.get("label"),
+      category = yaml.get("category"),
+      opcode = yaml.get("opcode"),
+      feature = yaml.get("feature"),
+      predicated = any(operand.type.startswith("predicate") for operand in operands),
+      vgsize = max(operand.vgsize for operand in operands),
+      output = cls.Output(type = output.type, data = output.data),
+      input = cls.Input(data = inputs[0].data if inputs else output.data),
+      ops = yaml.get("ops"),
+      operands = operands
+    )
+
 # output encoders for instructions
 class OutputEncoder:
   # encoded operations
@@ -64,11 +134,14 @@ class OutputEncoder:
   n_elements: int
   #  max possible ILP per unrolled loop (number of instructions without data dependencies)
   max_independent_instructions: int
+  # number of output elements written under the governing predicates (see SME.emit_predicate)
+  n_active_elements: int
 
-  def encode(self, index: int): pass
+  # operands of the output of the index-th independent instruction
+  def encode(self, index: int) -> tuple[SME.Operand, ...]: pass
   def emit_prologue(self, asm: SME.AsmBlock): pass
 
-  def __new__(cls, op: Operation):
+  def __new__(cls, op: Operation, density: float = 1.0):
     match op.output.type:
       case "za-tile": cls = ZATileOutputEncoder
       case "za-vector" | "za-double-vector" | "za-quad-vector": cls = ZAVectorOutputEncoder
@@ -78,24 +151,38 @@ class OutputEncoder:
     return object.__new__(cls)
 
 class ZATileOutputEncoder(OutputEncoder):
-  """ Instruction encoder for tile output (e.g. ZA0.S) """
-  def __init__(self, op: Operation):
+  """ Instruction encoder for tile output (e.g. ZA0.S)
+
+      The predicates govern the input elements: for widening outer products every row (column)
+      of the tile covers depth consecutive lanes of the row (column) predicate, its (row, k)
+      pairs. Partial predicates activate the same number of whole rows and columns (like the
+      edge of a GEMM with packed K) and update the top left corner of the tile.
+  """
+  def __init__(self, op: Operation, density: float = 1.0):
     assert op.output.type == "za-tile"
+    assert op.predicated or density == 1.0, f"{op.label} is not predicated"
     self.op = op
     self.n_vectors = 512//op.output.data.size
     self.max_independent_instructions = op.output.data.max_za_tiles
     self.n_elements = self.n_vectors*self.n_vectors
-    self.clobber = ""
+    self.depth = (512//op.input.data.size)//self.n_vectors
+    rows = SME.active_lanes(self.n_vectors, density)
+    self.active = rows*self.depth if rows is not None else None
+    # products of the active (row, k) x (col, k) pairs, depth per output element
+    lanes = self.active or self.n_vectors*self.depth
+    products = sum(len(range(k, lanes, self.depth))**2 for k in range(self.depth))
+    self.n_active_elements = products//self.depth
+    self.clobber = ", \"x24\", \"x25\"" if self.active is not None else ""
 
   def encode(self, index: int):
     assert index >= 0 and index < self.max_independent_instructions
-    predicate = ", p0/m, p1/m" if self.op.predicated else ""
-    return f"za{index}.{self.op.output.data.suffix}{predicate}"
+    tile = SME.ZATile(index, self.op.output.data.suffix)
+    return (tile, SME.P(0, qualifier = "m"), SME.P(1, qualifier = "m")) if self.op.predicated else (tile,)
 
   def emit_prologue(self, asm: SME.AsmBlock):
     if not self.op.predicated: return
-    asm.emit("ptrue", f"p0.{self.op.output.data.suffix}")
-    asm.emit("ptrue", f"p1.{self.op.output.data.suffix}")
+    SME.emit_predicate(asm, SME.P(0, self.op.input.data.suffix), self.active)
+    SME.emit_predicate(asm, SME.P(1, self.op.input.data.suffix), self.active)
 
 
 class ZAVectorOutputEncoder(OutputEncoder):
@@ -110,61 +197,65 @@ class ZAVectorOutputEncoder(OutputEncoder):
       slices, one at index w8+3 and one at index w8+3 + NRows/vgsize (all indice are  modulo NRows
       to avoid out-of bounds acccess)
   """
-  def __init__(self, op: Operation):
+  def __init__(self, op: Operation, density: float = 1.0):
     encodings = ["za-vector", "za-double-vector", "za-quad-vector"]
     assert op.output.type in encodings
-    assert not op.predicated, "za-vector ouput cannot be predicated"
+    assert not op.predicated and density == 1.0, "za-vector ouput cannot be predicated"
     self.op = op
     # number of VL-sized vectors of output
     self.n_vectors = int(op.vgsize*2**encodings.index(op.output.type))
     # we only support up to 32 unique indices on VL=512 due to base register limitations
     self.max_independent_instructions = min(64//self.n_vectors, 32)
     self.n_elements = (512//op.output.data.size)*self.n_vectors
+    self.n_active_elements = self.n_elements
     self.clobber = ", \"x8\", \"x9\", \"x10\", \"x11\""
 
   def encode(self, index: int):
     assert index >= 0 and index < self.max_independent_instructions
-    # offset is in range 0..7, select an appropriate base register w8..w11
-    if self.op.output.type == "za-vector":
-      base   = f"w{index // 8 + 8}"
-      offset = str(index % 8)
-    elif self.op.output.type == "za-double-vector":
-      base   = f"w{index // 4 + 8}"
-      offset = (index % 4)*2
-      offset = f"{offset}:{offset+1}"
-    elif self.op.output.type == "za-quad-vector":
-      base   = f"w{index // 2 + 8}"
-      offset = (index % 2)*4
-      offset = f"{offset}:{offset+3}"
-
-    vgsize = f", VGx{self.op.vgsize}" if self.op.vgsize > 1 else ""
-
-    return f"za.{self.op.output.data.suffix}[{base}, {offset}{vgsize}]"
+    return (encode_za_vector(self.op.output.type, self.op.vgsize, self.op.output.data, index),)
 
   def emit_prologue(self, asm: SME.AsmBlock):
-    # init the base registers
-    for i in range(4): asm.emit("mov", f"x{i + 8}", i*8)
+    emit_za_vector_bases(asm)
+
+
+def encode_za_vector(encoding: OperationEncoding, vgsize: int, data: SME.SMEType, index: int) -> SME.ZASlice:
+  """ The index-th ZA vector group of an encoding (see ZAVectorOutputEncoder) """
+  # offset is in range 0..7, select an appropriate base register w8..w11
+  count = 2**["za-vector", "za-double-vector", "za-quad-vector"].index(encoding)
+  per_base = 8//count
+  base = SME.GPR(index // per_base + 8, 32)
+  offset = (index % per_base)*count
+
+  return SME.ZASlice(base, offset, count, vgsize, data.suffix)
+
+
+def emit_za_vector_bases(asm: SME.AsmBlock):
+  # init the base registers
+  for i in range(4): asm.emit("mov", SME.GPR(i + 8), SME.Imm(i*8))
 
 
 class RegisterOutputEncoder(OutputEncoder):
   """ Instruction encoder for Z register output, e.g Z13.S """
-  def __init__(self, op: Operation):
+  def __init__(self, op: Operation, density: float = 1.0):
     assert op.output.type == "z-register"
     assert op.vgsize == 1, "Z register output does not support multivectors"
+    assert op.predicated or density == 1.0, f"{op.label} is not predicated"
     self.op = op
     self.n_vectors = 1
     self.max_independent_instructions = 32
     self.n_elements = 512//op.output.data.size
-    self.clobber = ""
+    self.active = SME.active_lanes(self.n_elements, density)
+    self.n_active_elements = self.active or self.n_elements
+    self.clobber = ", \"x24\"" if self.active is not None else ""
 
   def encode(self, index: int):
     assert index >= 0 and index < self.max_independent_instructions
-    predicate = ", p0/m" if self.op.predicated else ""
-    return f"z{index}.{self.op.output.data.suffix}{predicate}"
+    register = SME.Z(index, self.op.output.data.suffix)
+    return (register, SME.P(0, qualifier = "m")) if self.op.predicated else (register,)
 
   def emit_prologue(self, asm: SME.AsmBlock):
     if not self.op.predicated: return
-    asm.emit("ptrue", f"p0.{self.op.output.data.suffix}")
+    SME.emit_predicate(asm, SME.P(0, self.op.output.data.suffix), self.active)
 
 # Instruction input encoding
 class InputEncoder:
@@ -174,7 +265,7 @@ class InputEncoder:
     self.n_vectors = op.vgsize
     self.n_elements = (512//op.input.data.size)*op.vgsize
 
-  def encode(self, index: int):
+  def encode(self, index: int) -> SME.Z | SME.ZGroup:
     suffix = self.op.input.data.suffix
     vgsize = self.op.vgsize
 
@@ -183,9 +274,277 @@ class InputEncoder:
     index = (index % 32//vgsize)
 
     if vgsize == 1:
-      return f"z{index}.{suffix}"
+      return SME.Z(index, suffix)
     else:
-     return f"{{z{index*vgsize}.{suffix}-z{index*vgsize + vgsize - 1}.{suffix}}}"
+      return SME.ZGroup(index*vgsize, vgsize, suffix)
+
+
+# Explicit operand encoding (operations with an operand list)
+#
+# Every operand is encoded for the index-th independent instruction. The Z registers are divided
+# into slots of stride registers (the largest register group of the operation): the destinations
+# (or accumulators) of the instructions use distinct slots and all Z sources read the last slot,
+# so that no instruction reads a register written by itself or another instruction (only
+# accumulators form a chain through the loop). ZA destinations select a distinct tile, tile slice
+# or vector group per instruction, sources use the same selection (reads do not conflict).
+
+# general-purpose registers for gpr operands (x0 is the loop counter, x1 the buffer, x8..x12 ZA
+# base registers, x18 is reserved on Apple platforms)
+GPR_OPERANDS = [2, 3, 4, 5, 6, 7, 13, 14, 15, 16, 17, 19, 20, 21, 22, 23]
+
+# bytes of the kernel buffer of memory operands (one vector per independent instruction)
+BUFFER_SIZE = 16*SME.SVL_BYTES
+
+class OperandEncoder:
+  # encoded operand (the data type defaults to the output data of the operation)
+  operand: Operation.Operand
+  # number of VL-sized vectors and elements (data lanes) of the operand
+  n_vectors: int
+  n_elements: int
+  # max possible ILP per unrolled loop
+  max_independent_instructions: int
+  clobber: str = ""
+  # the operand addresses the kernel buffer
+  memory: bool = False
+  # fraction of the lanes of the instruction enabled by the operand (predicates)
+  active_fraction: float = 1.0
+
+  def encode(self, index: int) -> SME.Operand: pass
+  def emit_prologue(self, asm: SME.AsmBlock): pass
+
+  # clobbered registers of the first count independent instructions
+  def clobbers(self, count: int) -> str:
+    return self.clobber
+
+  def __new__(cls, operand: Operation.Operand, stride: int, number: int, density: float = 1.0):
+    match operand.type:
+      case "z-register" | "z-lane": cls = ZOperandEncoder
+      case "za-tile" | "za-tiles": cls = ZATileOperandEncoder
+      case "za-tile-slice": cls = ZATileSliceOperandEncoder
+      case "za-vector" | "za-double-vector" | "za-quad-vector": cls = ZAVectorOperandEncoder
+      case "za-row" | "memory": cls = ZARowOperandEncoder
+      case "zt0" | "zt0-slice": cls = ZT0OperandEncoder
+      case "predicate" | "predicate-as-counter": cls = PredicateOperandEncoder
+      case "gpr" | "immediate": cls = ScalarOperandEncoder
+      case _: assert_never(operand.type)
+
+    return object.__new__(cls)
+
+
+class ZOperandEncoder(OperandEncoder):
+  """ Z register or group at the slot of the instruction (the last slot for sources), e.g. z4.s,
+      {z4.s-z5.s} or z28[0] (z-lane)
+  """
+  def __init__(self, operand: Operation.Operand, stride: int, number: int, density: float = 1.0):
+    assert operand.vgsize <= stride
+    self.operand = operand
+    self.stride = stride
+    self.n_vectors = operand.vgsize
+    self.n_elements = (512//operand.data.size)*operand.vgsize
+    self.slots = 32//stride
+    self.max_independent_instructions = self.slots
+
+  def reserve_source_slot(self):
+    """ Leave the last slot to the sources of the instruction """
+    if self.operand.role != "source": self.max_independent_instructions = self.slots - 1
+
+  def encode(self, index: int):
+    register = (self.slots - 1 if self.operand.role == "source" else index)*self.stride
+    if self.operand.type == "z-lane": return SME.Z(register, lane = self.operand.value or 0)
+    if self.operand.vgsize == 1: return SME.Z(register, self.operand.data.suffix)
+    return SME.ZGroup(register, self.operand.vgsize, self.operand.data.suffix)
+
+
+class ZATileOperandEncoder(OperandEncoder):
+  """ ZA tile, e.g. za2.d, or a list of one tile, e.g. {za2.d} (za-tiles) """
+  def __init__(self, operand: Operation.Operand, stride: int, number: int, density: float = 1.0):
+    self.operand = operand
+    self.n_vectors = 512//operand.data.size
+    self.n_elements = self.n_vectors*self.n_vectors
+    self.max_independent_instructions = operand.data.max_za_tiles
+
+  def encode(self, index: int):
+    tile = SME.ZATile(index, self.operand.data.suffix)
+    return SME.ZAList((tile,)) if self.operand.type == "za-tiles" else tile
+
+
+class ZATileSliceOperandEncoder(OperandEncoder):
+  """ Horizontal ZA tile slice, e.g. za1h.s[w12, 2]
+
+      The instructions cycle through the tiles and then through the slice offsets (the
+      immediate offset has 16/tiles values), 16 distinct slices for every element size.
+  """
+  def __init__(self, operand: Operation.Operand, stride: int, number: int, density: float = 1.0):
+    self.operand = operand
+    self.tiles = operand.data.max_za_tiles
+    self.n_vectors = 1
+    self.n_elements = 512//operand.data.size
+    self.max_independent_instructions = 16
+    self.clobber = ", \"x12\""
+
+  def encode(self, index: int):
+    return SME.ZASlice(SME.GPR(12, 32), index // self.tiles, tile = index % self.tiles, direction = "h", suffix = self.operand.data.suffix)
+
+  def emit_prologue(self, asm: SME.AsmBlock):
+    asm.emit("mov", SME.GPR(12), SME.Imm(0))
+
+
+class ZAVectorOperandEncoder(OperandEncoder):
+  """ ZA array vector group, e.g. za.d[w8, 1, VGx2] (see ZAVectorOutputEncoder) """
+  def __init__(self, operand: Operation.Operand, stride: int, number: int, density: float = 1.0):
+    self.operand = operand
+    self.n_vectors = operand.vgsize*2**["za-vector", "za-double-vector", "za-quad-vector"].index(operand.type)
+    self.n_elements = (512//operand.data.size)*self.n_vectors
+    self.max_independent_instructions = min(64//self.n_vectors, 32)
+    self.clobber = ", \"x8\", \"x9\", \"x10\", \"x11\""
+
+  def encode(self, index: int):
+    return encode_za_vector(self.operand.type, self.operand.vgsize, self.operand.data, index)
+
+  def emit_prologue(self, asm: SME.AsmBlock):
+    emit_za_vector_bases(asm)
+
+
+class ZARowOperandEncoder(OperandEncoder):
+  """ Untyped ZA array vector and its buffer address with the same offset (ldr/str za), e.g. za[w12, 3] and [x1, 3, MUL VL] """
+  def __init__(self, operand: Operation.Operand, stride: int, number: int, density: float = 1.0):
+    self.operand = operand
+    self.n_vectors = 1
+    self.n_elements = 512//operand.data.size
+    self.max_independent_instructions = BUFFER_SIZE//SME.SVL_BYTES
+    self.memory = operand.type == "memory"
+    self.clobber = ", \"x1\"" if self.memory else ", \"x12\""
+
+  def encode(self, index: int):
+    if self.memory: return SME.Address(SME.GPR(1), index)
+    return SME.ZASlice(SME.GPR(12, 32), index)
+
+  def emit_prologue(self, asm: SME.AsmBlock):
+    if self.memory:
+      asm.emit("mov", SME.GPR(1), SME.Arg("buffer"))
+    else:
+      asm.emit("mov", SME.GPR(12), SME.Imm(0))
+
+
+class ZT0OperandEncoder(OperandEncoder):
+  """ The lookup table register, e.g. zt0, or one of its 64-bit elements, e.g. zt0[8] (zt0-slice)
+
+      Sources are shared by all instructions, independent destinations need distinct elements
+      (8 slices, one written table).
+  """
+  def __init__(self, operand: Operation.Operand, stride: int, number: int, density: float = 1.0):
+    self.operand = operand
+    self.n_vectors = 1 if operand.type == "zt0" else 0
+    self.n_elements = 512//operand.data.size if operand.type == "zt0" else 1
+    self.max_independent_instructions = 32 if operand.role == "source" else 1 if operand.type == "zt0" else 8
+
+  def encode(self, index: int):
+    return SME.ZT0() if self.operand.type == "zt0" else SME.ZT0(8*(index % 8))
+
+
+class PredicateOperandEncoder(OperandEncoder):
+  """ Governing predicate, e.g. p0/m or pn8/z (the number-th predicate of the instruction), all-true
+      or with the first lanes active (predicate-as-counters count the lanes of vgsize vectors)
+  """
+  def __init__(self, operand: Operation.Operand, stride: int, number: int, density: float = 1.0):
+    self.operand = operand
+    self.number = number
+    self.n_vectors = 0
+    self.n_elements = 0
+    self.max_independent_instructions = 32
+    lanes = (512//operand.data.size)*operand.vgsize
+    self.active = SME.active_lanes(lanes, density)
+    self.active_fraction = (self.active or lanes)/lanes
+    if self.active is not None: self.clobber = f", \"{SME.predicate_count(self.register())}\""
+
+  def register(self, **fields) -> SME.P | SME.PN:
+    if self.operand.type == "predicate": return SME.P(self.number, **fields)
+    return SME.PN(8 + self.number, **fields)
+
+  def encode(self, index: int):
+    return self.register(qualifier = self.operand.qualifier)
+
+  def emit_prologue(self, asm: SME.AsmBlock):
+    SME.emit_predicate(asm, self.register(suffix = self.operand.data.suffix), self.active, self.operand.vgsize)
+
+
+class ScalarOperandEncoder(OperandEncoder):
+  """ General-purpose register (a distinct one per instruction, see GPR_OPERANDS) or immediate """
+  def __init__(self, operand: Operation.Operand, stride: int, number: int, density: float = 1.0):
+    self.operand = operand
+    self.n_vectors = 0
+    self.n_elements = 1 if operand.type == "gpr" else 0
+    self.max_independent_instructions = len(GPR_OPERANDS) if operand.type == "gpr" else 32
+
+  def encode(self, index: int):
+    if self.operand.type == "immediate": return SME.Imm(self.operand.value)
+    return SME.GPR(GPR_OPERANDS[index], 64 if self.operand.data.size == 64 else 32)
+
+  def clobbers(self, count: int):
+    # only the registers written by the instructions of the kernel
+    if self.operand.type != "gpr" or self.operand.role == "source": return ""
+    return "".join(f", \"x{register}\"" for register in GPR_OPERANDS[:count])
+
+
+class InstructionEncoder:
+  """ Operands of the independent instructions of an operation
+
+      Operations without an operand list are encoded as opcode out, in, in with the output and
+      input encoders. Otherwise every operand has its encoder, the output is the first
+      destination (or accumulator) and the inputs are the sources with data. The governing
+      predicates have the given density (fraction of active lanes).
+  """
+  def __init__(self, op: Operation, density: float = 1.0):
+    self.op = op
+    if op.operands is None:
+      self.output = OutputEncoder(op, density)
+      self.inputs = [InputEncoder(op)]*2
+      self.operand_encoders = None
+      self.n_active_elements = self.output.n_active_elements
+      self.max_independent_instructions = self.output.max_independent_instructions
+      self.memory = False
+      self.input_data = [f"{encoder.n_elements}x {op.input.data.label}" for encoder in self.inputs]
+      return
+
+    stride = max([operand.vgsize for operand in op.operands if operand.type.startswith("z-")], default = 1)
+    self.operand_encoders = []
+    for operand in op.operands:
+      number = sum(encoder.operand.type.startswith("predicate") for encoder in self.operand_encoders)
+      operand = operand if operand.data is not None else replace(operand, data = op.output.data)
+      self.operand_encoders.append(OperandEncoder(operand, stride, number, density))
+    z_encoders = [encoder for encoder in self.operand_encoders if isinstance(encoder, ZOperandEncoder)]
+    if any(encoder.operand.role == "source" for encoder in z_encoders):
+      for encoder in z_encoders: encoder.reserve_source_slot()
+
+    self.output = next(encoder for encoder in self.operand_encoders if encoder.operand.role != "source")
+    # the predicates select the active output elements
+    self.n_active_elements = round(self.output.n_elements*math.prod(encoder.active_fraction for encoder in self.operand_encoders))
+    self.inputs = [encoder for encoder in self.operand_encoders if encoder.operand.role == "source" and encoder.n_elements > 0]
+    self.max_independent_instructions = min(encoder.max_independent_instructions for encoder in self.operand_encoders)
+    self.memory = any(encoder.memory for encoder in self.operand_encoders)
+    self.input_data = [f"{encoder.n_elements}x {encoder.operand.data.label}" for encoder in self.inputs]
+
+  def encode(self, index: int) -> tuple[SME.Operand, ...]:
+    assert index >= 0 and index < self.max_independent_instructions
+    if self.operand_encoders is None:
+      return (*self.output.encode(index), self.inputs[0].encode(index), self.inputs[1].encode(index))
+
+    return tuple(encoder.encode(index) for encoder in self.operand_encoders)
+
+  def clobbers(self, count: int) -> str:
+    """ Extra clobbers of a kernel with count independent instructions """
+    if self.operand_encoders is None: return self.output.clobber
+    return "".join(dict.fromkeys(encoder.clobbers(count) for encoder in self.operand_encoders))
+
+  def emit_prologue(self, asm: SME.AsmBlock):
+    if self.operand_encoders is None:
+      self.output.emit_prologue(asm)
+      return
+
+    # operands may share predicates and base registers
+    prologue = SME.AsmBlock()
+    for encoder in self.operand_encoders: encoder.emit_prologue(prologue)
+    asm.extend(dict.fromkeys(prologue.instructions))
 
 
 # Microbenchmarks
@@ -205,7 +564,15 @@ class Benchmark:
   input_elements: int
   input_vectors: int
   ops_per_instruction: int
+  # number of data-independent instructions (throughput) or interleaved chains (latency)
   ilp: int
+  mode: BenchmarkMode
+  # number of dependent instructions per chain and loop iteration (1 for throughput benchmarks)
+  chain_length: int
+  # fraction of active lanes of the governing predicates (1.0 for all-true predicates)
+  predicate_density: float
+  # number of benchmark loop iterations
+  n_iterations: int
   fn: tuple[str, str]
 
   def to_c_struct(self):
@@ -222,18 +589,75 @@ class Benchmark:
     return f"{{{", ".join(fields)}}}"
 
 
-def make_benchmark_function_name(op: Operation, ilp: int):
-  # vector group size
+def make_benchmark_function_name(op: Operation, ilp: int, chain_length: int = 1, density: float = 1.0):
+  # vector group size (operations with an operand list are named after their output encoding)
   za = "_za" if op.output.type.startswith("za") else ""
+  if op.operands is not None: za = f"_{op.output.type.replace("-", "_")}"
   vgsize = f"_vgx{op.vgsize}" if op.vgsize > 1 else ""
+  chain = f"_chain{chain_length}" if chain_length > 1 else ""
+  predicate = f"_p{round(density*100)}" if density < 1.0 else ""
+
+  return f"{op.opcode}{za}_{op.output.data.label}_{op.input.data.label}{vgsize}{chain}{predicate}_ilp{ilp}"
+
 
-  return f"{op.opcode}{za}_{op.output.data.label}_{op.input.data.label}{vgsize}_ilp{ilp}"
+def max_chain_interleave(op: Operation) -> int:
+  """ Maximal number of independent dependent chains (z-register chains use two registers each)
 
+      Latency chains are only formed for opcode out, in, in operations (none for operand lists).
+  """
+  if op.operands is not None: return 0
+  max_ilp = min(OutputEncoder(op).max_independent_instructions, 16)
+  return max_ilp//2 if op.output.type == "z-register" else max_ilp
+
+
+def encode_chain_instruction(op: Operation, output_encoder: OutputEncoder, input_encoder: InputEncoder, chain: int, step: int):
+  """ Operands of the step-th instruction of a dependent chain
 
-def make_benchmark_function(op: Operation, ilp: int):
-  """ Build benchmarking code for the operation using ilp data-parallel instructions per chunk """
-  output_encoder = OutputEncoder(op)
-  input_encoder = InputEncoder(op)
+      Accumulating outputs (ZA) form the chain through the accumulator. Z register chains
+      alternate between two registers, so that the result of each instruction is the input
+      of the next one.
+  """
+  if op.output.type != "z-register":
+    return (*output_encoder.encode(chain), input_encoder.encode(chain), input_encoder.encode(chain))
+
+  (src, dst) = (2*chain + step % 2, 2*chain + (step + 1) % 2)
+  return (*output_encoder.encode(dst), input_encoder.encode(src), input_encoder.encode(src))
+
+
+def make_benchmark_function(
+  op: Operation,
+  ilp: int,
+  mode: BenchmarkMode = "throughput",
+  chain_length: int = 1,
+  density: float = 1.0,
+  compact: bool = False
+):
+  """ Build benchmarking code for the operation
+
+      Throughput benchmarks use ilp data-parallel instructions per loop iteration, latency
+      benchmarks ilp interleaved chains of chain_length dependent instructions. Predicated
+      throughput benchmarks can run with partial predicates (density is the fraction of active
+      lanes), the operation count only includes the active output elements. Memory operands
+      address a buffer of the kernel (BUFFER_SIZE bytes on the stack). The instructions are
+      verified (see dataflow.py) before they are rendered. Compact kernels only contain the
+      prologue and the loop body, the scaffolding is OP_KERNEL or OP_KERNEL_BUFFER (see COMPACT).
+  """
+  assert mode == "latency" or chain_length == 1
+  assert mode == "throughput" or op.operands is None, f"{op.label}: no latency chains for operand lists"
+  assert mode == "throughput" or density == 1.0, f"{op.label}: latency chains use all-true predicates"
+  # z register chains must end in the register they start from
+  assert op.output.type != "z-register" or chain_length % 2 == 0 or mode == "throughput", f"{op.label}: the chain length must be even"
+  encoder = InstructionEncoder(op, density)
+  label = SME.predicate_label(op.label, density)
+
+  def emit_body(asm: SME.AsmBlock):
+    if mode == "throughput":
+      for i in range(ilp):
+        asm.emit(op.opcode, *encoder.encode(i))
+    else:
+      for step in range(chain_length):
+        for chain in range(ilp):
+          asm.emit(op.opcode, *encode_chain_instruction(op, encoder.output, encoder.inputs[0], chain, step))
 
   # generate the microbenchmark assembly
   asm = SME.AsmBlock()
@@ -241,12 +665,11 @@ def make_benchmark_function(op: Operation, ilp: int):
   # prologue
   asm.emit("smstart")
   asm.emit("mov", "x0", "%[n]")
-  output_encoder.emit_prologue(asm)
+  encoder.emit_prologue(asm)
 
   # the microbencmark loop
   with asm.labeled_block(1):
-    for i in range(ilp):
-      asm.emit(op.opcode, output_encoder.encode(i), input_encoder.encode(i), input_encoder.encode(i))
+    emit_body(asm)
 
     asm.emit("")
     asm.emit("subs", "x0", "x0", "#1")
@@ -256,92 +679,259 @@ def make_benchmark_function(op: Operation, ilp: int):
   asm.emit("smstop")
 
   # function declaration
-  fn_name = make_benchmark_function_name(op, ilp)
-  iters = "N_ITERATIONS" if ilp == 1 else f"N_ITERATIONS/{ilp}"
-  ops = op.ops*output_encoder.n_elements
+  fn_name = make_benchmark_function_name(op, ilp, chain_length, density)
+  dataflow.verify_kernel(fn_name, asm.code, ilp, chain_length)
+  ops = op.ops*encoder.n_active_elements
+  n_instructions = ilp*chain_length
+  structure = f"ILP = {ilp}" if mode == "throughput" else f"{ilp} interleaved dependent chains of {chain_length} instructions"
+
 
+  input_data = ", ".join(encoder.input_data)
+  output_data = f"{encoder.output.n_elements}x {op.output.data.label}"
+  if encoder.n_active_elements < encoder.output.n_elements: output_data = f"{encoder.n_active_elements} of {output_data}"
 
-  input_data = f"{input_encoder.n_elements}x {op.input.data.label}"
-  output_data = f"{output_encoder.n_elements}x {op.output.data.label}"
+  # the buffer of the memory operands
+  (buffer, asm_inputs, clobber) = ("", "[n] \"r\" (n_iterations)", encoder.clobbers(ilp))
+  if encoder.memory:
+    buffer = f"\n      uint8_t buffer[{BUFFER_SIZE}] __attribute__((aligned({SME.SVL_BYTES})));"
+    asm_inputs += ", [buffer] \"r\" (buffer)"
+    clobber = ", \"memory\"" + clobber
 
   fn_body =  dedent(f"""
-    static double {fn_name}(const void*) {{
-      // {op.label}, {op.category}
+    double {fn_name}(const void* args) {{
+      // {label}, {op.category}
       //
-      // Each instruction: ({input_data}, {input_data}) → {output_data} ({ops} OPs)
-      // Total of {ops*ilp} OPs per loop iteration, ILP = {ilp}
-      size_t n_iterations = {iters};
+      // Each instruction: ({input_data}) → {output_data} ({ops} OPs)
+      // Total of {ops*n_instructions} OPs per loop iteration, {structure}
+      size_t n_iterations = *(const size_t*)args;{buffer}
 
       __asm__ __volatile__ (
         {asm.join()}
         : // no outputs
-        : [n] \"r\" (n_iterations)
-        : "x0"{output_encoder.clobber}
+        : {asm_inputs}
+        : "x0"{clobber}
       );
 
-      // number of OPS executed (ops_per_instruction*ILP*iterations)
-      return {ops}.0*{ilp}.0*(double)n_iterations;
+      // number of OPS executed (ops_per_instruction*instructions*iterations)
+      return {ops}.0*{n_instructions}.0*(double)n_iterations;
     }}
   """)
 
+  if compact:
+    (prologue, body) = (SME.AsmBlock(), SME.AsmBlock())
+    encoder.emit_prologue(prologue)
+    emit_body(body)
+    kernel = "OP_KERNEL_BUFFER" if encoder.memory else "OP_KERNEL"
+    fn_body = dedent(f"""
+      // {label}, {structure}
+      {kernel}({fn_name}, {ops}.0, {n_instructions}.0, {prologue.compact(8)},
+        {body.compact(8)}{encoder.clobbers(ilp)})
+    """)
+
   # benchmark definition
   return Benchmark(
     category = op.category,
-    label = op.label,
+    label = label,
     feature = op.feature,
     encoding = op.output.type,
     opcode = op.opcode,
     output_data = op.output.data.label,
-    output_elements = output_encoder.n_elements,
-    output_vectors = output_encoder.n_vectors,
+    output_elements = encoder.output.n_elements,
+    output_vectors = encoder.output.n_vectors,
     input_data = op.input.data.label,
-    input_elements = input_encoder.n_elements*2,
-    input_vectors = input_encoder.n_vectors*2,
+    input_elements = sum(input.n_elements for input in encoder.inputs),
+    input_vectors = sum(input.n_vectors for input in encoder.inputs),
     ops_per_instruction = ops,
     ilp = ilp,
+    mode = mode,
+    chain_length = chain_length,
+    predicate_density = density,
+    n_iterations = N_ITERATIONS//n_instructions,
     fn = (fn_name, fn_body)
   )
 
 
-# load instruction definitions
-with open('benchmarks.yaml', 'r') as file:
-    operations = [Operation.from_yaml(y) for y in yaml.safe_load(file)]
-    operations.sort(key = lambda op: op.category)
+def make_portable_function(bench: Benchmark) -> Benchmark:
+  """ Replace the kernel of the benchmark with its portable C stand-in (see portable.py)
 
-# build benchmarks
-benchmarks = []
-for op in operations:
-  # maximal number of data-independent instructions to emit (limit to 8)
-  max_ilp = min(OutputEncoder(op).max_independent_instructions, 16)
-  for ilp in  range(1, max_ilp + 1):
-    benchmarks.append(make_benchmark_function(op, ilp))
+      Every instruction becomes output_elements multiply-accumulates into the accumulators of
+      its output (shared by the instructions of a latency chain), the stand-in returns the
+      operation count of the SME kernel.
+  """
+  fn_name = bench.fn[0]
+  n_instructions = bench.ilp*bench.chain_length
+  # products per output element (a multiply-accumulate is two OPs)
+  k = max(bench.ops_per_instruction//(2*bench.output_elements), 1)
+  macs = [f"PORTABLE_MAC(acc[{i}], a, b, {bench.output_elements}, {k});" for _ in range(bench.chain_length) for i in range(bench.ilp)]
+  structure = f"ILP = {bench.ilp}" if bench.mode == "throughput" else f"{bench.ilp} interleaved dependent chains of {bench.chain_length} instructions"
+
+  fn_body = dedent(f"""
+    double {fn_name}(const void* args) {{
+      // {bench.label}, {bench.category} (portable stand-in)
+      //
+      // Each instruction: {bench.output_elements} outputs of {k} multiply-accumulates, {structure}
+      size_t n_iterations = *(const size_t*)args;
+
+      {portable.c_type(bench.output_data)} acc[{bench.ilp}][{bench.output_elements}];
+      {portable.c_type(bench.input_data)} a[{k}], b[{k}];
+      memset(acc, 0, sizeof(acc));
+      memset(a, 0, sizeof(a));
+      memset(b, 0, sizeof(b));
+      PORTABLE_CLOBBER(a);
+      PORTABLE_CLOBBER(b);
+
+      for (size_t i = 0; i < n_iterations; i++) {{
+        {"\n        ".join(macs)}
+        PORTABLE_CLOBBER(acc);
+      }}
+
+      // number of OPS executed (ops_per_instruction*instructions*iterations)
+      return {bench.ops_per_instruction}.0*{n_instructions}.0*(double)n_iterations;
+    }}
+  """)
 
-# generate the C code
-print(f"""// generated by tools/gen_op_benchmarks.py, do not edit!
+  return replace(bench, fn = (fn_name, fn_body))
+
+
+# C code shared by all generated files
+PREAMBLE = """// generated by tools/gen_op_benchmarks.py, do not edit!
 #include <assert.h>
-#include "bench.h"
+#include "../bench.h"
+"""
+
+# Compact kernels (--compact): the prologue, loop control and epilogue shared by all kernels.
+# OP_KERNEL expands to the same function as the expanded kernel (make_benchmark_function), the
+# kernel only passes its prologue, loop body, operation count and extra clobbers.
+COMPACT = f"""
+// OP_KERNEL(name, ops, n_instructions, prologue, body, clobbers...): run body n_iterations times
+#define OP_KERNEL(name, ops, n_instructions, prologue, body, ...) \\
+  double name(const void* args) {{ \\
+    size_t n_iterations = *(const size_t*)args; \\
+    __asm__ __volatile__ ( \\
+      "smstart\\n" \\
+      "mov x0, %[n]\\n" \\
+      prologue \\
+      "1:\\n" \\
+      body \\
+      "subs x0, x0, #1\\n" \\
+      "b.ne 1b\\n" \\
+      "smstop\\n" \\
+      : \\
+      : [n] "r" (n_iterations) \\
+      : "x0" __VA_OPT__(,) __VA_ARGS__ \\
+    ); \\
+    return ops*n_instructions*(double)n_iterations; \\
+  }}
+
+// OP_KERNEL_BUFFER(...): OP_KERNEL with a buffer for the memory operands (%[buffer])
+#define OP_KERNEL_BUFFER(name, ops, n_instructions, prologue, body, ...) \\
+  double name(const void* args) {{ \\
+    size_t n_iterations = *(const size_t*)args; \\
+    uint8_t buffer[{BUFFER_SIZE}] __attribute__((aligned({SME.SVL_BYTES}))); \\
+    __asm__ __volatile__ ( \\
+      "smstart\\n" \\
+      "mov x0, %[n]\\n" \\
+      prologue \\
+      "1:\\n" \\
+      body \\
+      "subs x0, x0, #1\\n" \\
+      "b.ne 1b\\n" \\
+      "smstop\\n" \\
+      : \\
+      : [n] "r" (n_iterations), [buffer] "r" (buffer) \\
+      : "x0", "memory" __VA_OPT__(,) __VA_ARGS__ \\
+    ); \\
+    return ops*n_instructions*(double)n_iterations; \\
+  }}
+"""
+
+# benchmark setup (emitted in the table file)
+SETUP = """
+// benchmark setup
+static void* setup(const void* params) {
+  // the number of iterations (size_t) is passed as the benchmark parameter
+  assert(params != nullptr);
+  return (void*)params;
+}
+
+static void teardown(void* data) {
+  assert(data != nullptr);
+}
+"""
+
+
+def generate_benchmarks(
+  operations: list[Operation],
+  cache: codegen.KernelCache,
+  plan: codegen.SweepPlan,
+  calibration: codegen.Calibration,
+  chain_lengths: list[int] = CHAIN_LENGTHS,
+  chain_interleave: list[int] = CHAIN_INTERLEAVE,
+  densities: list[float] = SME.PREDICATE_DENSITIES,
+  compact: bool = False
+):
+  """ Generate the benchmarks for each operation and ILP (reusing unchanged kernels from the cache)
+
+      Each operation is benchmarked for throughput over its ILP range (limited by the sweep
+      plan) and for latency with every combination of chain length and interleave factor.
+      Predicated operations are also benchmarked for throughput with every partial predicate
+      density (as separate benchmarks, the label includes the density). Every kernel is
+      verified when it is built, so the kernel cache is also keyed by dataflow.py.
+  """
+  for op in operations:
+    # maximal number of data-independent instructions to emit (limit to 16)
+    max_ilp = min(InstructionEncoder(op).max_independent_instructions, 16)
+    for density in [1.0, *(density for density in densities if density < 1.0 and op.predicated)]:
+      key = dict(label = SME.predicate_label(op.label, density), encoding = op.output.type, vgsize = op.vgsize)
+      configs = [("throughput", 1, ilp) for ilp in plan.ilps(range(1, max_ilp + 1), **key)]
+      configs += [
+        ("latency", chain_length, ilp)
+        for chain_length in chain_lengths
+        for ilp in chain_interleave if ilp <= max_chain_interleave(op) and density == 1.0
+      ]
+
+      for (mode, chain_length, ilp) in configs:
+        bench = cache.get((op, ilp, mode, chain_length, density), lambda: make_benchmark_function(op, ilp, mode, chain_length, density))
+        if compact: bench = cache.get((op, ilp, mode, chain_length, density, "compact"), lambda: make_benchmark_function(op, ilp, mode, chain_length, density, compact = True))
+        # the iteration count is a table field, so calibration does not change the kernels
+        n_iterations = calibration.get(N_ITERATIONS//(ilp*chain_length), **key, mode = mode, chain_length = chain_length, ilp = ilp)
+        yield replace(bench, n_iterations = n_iterations)
+
+
+def main():
+  parser = argparse.ArgumentParser(description = "Generate the SME/SVE instruction benchmarks")
+  parser.add_argument("output", help = "output directory for the generated C sources")
+  parser.add_argument("--shards", type = int, default = 8, help = "number of kernel source files")
+  parser.add_argument("--cache", default = None, help = "kernel cache directory (disabled if omitted)")
+  parser.add_argument("--plan", default = None, help = "sweep plan selecting the ILPs to generate and the run schedule (see plan_sweep.py)")
+  parser.add_argument("--calibration", default = None, help = "per-benchmark iteration counts (see calibrate.py)")
+  parser.add_argument("--filter", default = None, help = "only generate the benchmarks matching this expression over the Benchmark fields, e.g. 'opcode == \"fmopa\" and 1 <= ilp <= 4'")
+  parser.add_argument("--chain-lengths", type = int, nargs = "*", default = CHAIN_LENGTHS, help = "instructions per dependent chain of the latency benchmarks (even, none to disable)")
+  parser.add_argument("--chain-interleave", type = int, nargs = "+", default = CHAIN_INTERLEAVE, help = "numbers of interleaved chains of the latency benchmarks")
+  parser.add_argument("--predicate-densities", type = float, nargs = "*", default = SME.PREDICATE_DENSITIES, help = "fractions of active lanes of the predicated throughput benchmarks (all-true predicates are always benchmarked)")
+  parser.add_argument("--backend", choices = ["sme", "portable"], default = "sme", help = "kernel backend (portable: plain C stand-ins that run on any machine, see portable.py)")
+  parser.add_argument("--compact", action = "store_true", help = "emit the kernels as their loop bodies with shared scaffolding macros (same machine code, smaller sources)")
+  args = parser.parse_args()
+  compact = args.compact and args.backend == "sme"
+
+  # load instruction definitions
+  with open('benchmarks.yaml', 'r') as file:
+    operations = [Operation.from_yaml(y) for y in yaml.safe_load(file)]
+    operations.sort(key = lambda op: op.category)
 
-// Number of iterations
-static const size_t N_ITERATIONS = 8000000;
+  # generate the C code (kernels are written out as they are generated)
+  cache = codegen.KernelCache(args.cache, Benchmark, [__file__, SME.__file__, dataflow.__file__])
+  plan = codegen.SweepPlan(args.plan, "op_benchmarks")
+  selection = codegen.BenchmarkFilter(args.filter, Benchmark)
+  calibration = codegen.Calibration(args.calibration, "op_benchmarks", "n_iterations")
+  preamble = PREAMBLE + (COMPACT if compact else "") + (portable.PREAMBLE if args.backend == "portable" else "")
+  writer = codegen.KernelWriter(args.output, "op_benchmarks", args.shards, preamble, "op_benchmark_t", SETUP, plan.schedule)
+  with writer:
+    for bench in filter(selection, generate_benchmarks(operations, cache, plan, calibration, args.chain_lengths, args.chain_interleave, args.predicate_densities, compact)):
+      writer.emit(make_portable_function(bench) if args.backend == "portable" else bench)
 
-// benchmark functions
-{"\n".join(bench.fn[1] for bench in benchmarks)}
+  print(f"{writer.count} benchmarks ({cache.hits} cached), {len(writer.updated)} files updated", file = sys.stderr)
 
-// benchmark setup
-static void* setup(const void* params) {{
-  assert(params == nullptr);
-  return nullptr;
-}}
-
-static void teardown(void* data) {{
-  assert(data == nullptr);
-}}
-
-// benchmark table
-static const op_benchmark_t benchmarks[] = {{
-  {",\n  ".join(bench.to_c_struct() for bench in benchmarks)}
-}};
-
-CONST_PTR(op_benchmark_t) op_benchmarks = benchmarks;
-const size_t op_benchmarks_count = sizeof(benchmarks)/sizeof(benchmarks[0]);
-""")
+
+if __name__ == "__main__":
+  main()
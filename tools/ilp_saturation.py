@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+import sys
+assert sys.version_info >= (3, 10), "Requires Python 3.10 or later"
+
+import json, argparse
+from dataclasses import dataclass, asdict
+import numpy as np
+import results, stats
+
+# ILP saturation analysis
+#
+# Throughput of n independent instructions is modelled as a latency-bound line that saturates
+# at the peak issue rate of the unit:
+#
+#   gops(n) = min(slope*n, peak)
+#
+# slope is the throughput of a dependent chain (one instruction in flight) and peak the
+# throughput limit, so the knee peak/slope is the number of instructions that need to be in
+# flight to saturate the unit, i.e. the latency/throughput ratio (Little's law).
+
+# benchmark identity (everything except ILP)
+GROUP_KEYS = ["label", "opcode", "encoding", "output_data", "input_data", "input_vectors", "ops_per_instruction", "threads_h", "threads_l"]
+
+@dataclass(kw_only=True)
+class SaturationFit:
+  # fitted model parameters (GOP/s)
+  slope: float
+  peak: float
+  # number of leading points in the latency-bound (linear) segment
+  n_linear: int
+  # residual sum of squares
+  sse: float
+
+  @property
+  def knee(self) -> float:
+    return self.peak/self.slope if self.slope > 0 else float("inf")
+
+  def predict(self, ilp: np.ndarray) -> np.ndarray:
+    return np.minimum(self.slope*np.asarray(ilp), self.peak)
+
+
+def fit_saturation(ilp: np.ndarray, gops: np.ndarray) -> SaturationFit:
+  """ Least-squares fit of gops = min(slope*ilp, peak)
+
+      Every split of the ILP-sorted points into a linear and a plateau segment is evaluated
+      (the linear segment is a line through the origin, the plateau a constant) and the model
+      with the smallest residual is selected. The first point always belongs to the linear segment.
+  """
+  order = np.argsort(ilp)
+  x = np.asarray(ilp, dtype = np.float64)[order]
+  y = np.asarray(gops, dtype = np.float64)[order]
+  n = len(x)
+  assert n > 0
+
+  # prefix sums for the linear segment (points 0..m-1), suffix sums for the plateau (m..n-1)
+  sxy = np.cumsum(x*y)
+  sxx = np.cumsum(x*x)
+  sy_rev = np.cumsum(y[::-1])[::-1]
+
+  best = None
+  for m in range(1, n + 1):
+    slope = sxy[m - 1]/sxx[m - 1]
+    peak = sy_rev[m]/(n - m) if m < n else slope*x[-1]
+    # the segment estimates are evaluated with the full model, so that splits where the
+    # plateau and the line are inconsistent are penalized
+    sse = float(np.sum((np.minimum(slope*x, peak) - y)**2))
+
+    if best is None or sse < best.sse:
+      best = SaturationFit(slope = slope, peak = peak, n_linear = m, sse = sse)
+
+  return best
+
+
+@dataclass(kw_only=True)
+class PeakEntry:
+  label: str
+  opcode: str
+  encoding: str
+  output_data: str
+  input_data: str
+  vgsize: int
+  ops_per_instruction: int
+  threads_h: int
+  threads_l: int
+  # measured and fitted peak throughput (GOP/s)
+  measured_peak: float
+  peak: float
+  # smallest measured ILP reaching the threshold fraction of the peak
+  min_ilp: int | None
+  # fitted knee (latency/throughput ratio, instructions in flight needed to saturate)
+  knee: float
+  # implied dependent-chain latency and reciprocal throughput per instruction (ns, all threads)
+  latency_ns: float
+  reciprocal_throughput_ns: float
+  # latency measured by the dependent-chain benchmarks (ns, all threads), None if not measured
+  measured_latency_ns: float | None
+  # false if throughput still scales at the largest measured ILP
+  saturated: bool
+  max_ilp: int
+  # relative RMS error of the fit
+  fit_error: float
+
+
+def chain_latencies(data: results.Results) -> dict[tuple, float]:
+  """ Per-instruction latency (ns) of every benchmark group from its dependent-chain benchmarks
+      (the fastest chain configuration)
+  """
+  gops = stats.median(data.sample_matrix())
+  latency = data["ops_per_instruction"]*data["ilp"]/gops
+  columns = [data[key].tolist() for key in GROUP_KEYS]
+
+  out = {}
+  for (i, key) in enumerate(zip(*columns)):
+    if np.isfinite(latency[i]): out[key] = min(out.get(key, np.inf), float(latency[i]))
+
+  return out
+
+
+def peak_table(data: results.Results, threshold: float = 0.95) -> list[PeakEntry]:
+  """ Fit the saturation model for every benchmark group and derive the peak table """
+  # the saturation model applies to the throughput benchmarks (older reports have no mode)
+  latencies = {}
+  if "mode" in data.columns:
+    latencies = chain_latencies(data.where(mode = "latency"))
+    data = data.where(mode = "throughput")
+
+  # robust per-row throughput
+  gops = stats.median(data.sample_matrix())
+  ilp = data["ilp"]
+  (order, starts) = data.group_index(GROUP_KEYS)
+  ends = np.append(starts[1:], len(order))
+  columns = {key: data[key] for key in GROUP_KEYS}
+
+  entries = []
+  for (start, end) in zip(starts, ends):
+    rows = order[start:end]
+    rows = rows[~np.isnan(gops[rows])]
+    if len(rows) == 0: continue
+
+    fit = fit_saturation(ilp[rows], gops[rows])
+    first = rows[0]
+    ops = int(columns["ops_per_instruction"][first])
+
+    # smallest measured ILP that reaches the threshold
+    reached = ilp[rows][gops[rows] >= threshold*fit.peak]
+    residual = gops[rows] - fit.predict(ilp[rows])
+
+    entries.append(PeakEntry(
+      label = columns["label"][first],
+      opcode = columns["opcode"][first],
+      encoding = columns["encoding"][first],
+      output_data = columns["output_data"][first],
+      input_data = columns["input_data"][first],
+      # two input operands per instruction
+      vgsize = int(columns["input_vectors"][first])//2,
+      ops_per_instruction = ops,
+      threads_h = int(columns["threads_h"][first]),
+      threads_l = int(columns["threads_l"][first]),
+      measured_peak = float(np.max(gops[rows])),
+      peak = float(fit.peak),
+      min_ilp = int(np.min(reached)) if len(reached) > 0 else None,
+      knee = float(fit.knee),
+      latency_ns = float(ops/fit.slope) if fit.slope > 0 else float("inf"),
+      reciprocal_throughput_ns = float(ops/fit.peak) if fit.peak > 0 else float("inf"),
+      measured_latency_ns = latencies.get(tuple(columns[key][first] for key in GROUP_KEYS)),
+      saturated = fit.n_linear < len(rows),
+      max_ilp = int(np.max(ilp[rows])),
+      fit_error = float(np.sqrt(np.mean(residual**2))/fit.peak) if fit.peak > 0 else float("nan")
+    ))
+
+  return entries
+
+
+def main():
+  parser = argparse.ArgumentParser(description = "Detect ILP saturation and build the per-instruction peak table")
+  parser.add_argument("report", nargs = "?", default = "results/op_benchmarks.json.bz2", help = "instruction benchmark report")
+  parser.add_argument("--threshold", type = float, default = 0.95, help = "fraction of the peak used for the minimal ILP")
+  parser.add_argument("--threads", default = None, metavar = "H,L", help = "only report this thread configuration (e.g. 1,0)")
+  parser.add_argument("--json", default = None, help = "write the peak table to this file")
+  args = parser.parse_args()
+
+  data = results.load(args.report)
+  if args.threads is not None:
+    (threads_h, threads_l) = (int(t) for t in args.threads.split(","))
+    data = data.where(threads_h = threads_h, threads_l = threads_l)
+
+  entries = peak_table(data, args.threshold)
+
+  if args.json is not None:
+    with open(args.json, "w") as file: json.dump([asdict(entry) for entry in entries], file, indent = 2)
+
+  columns = ["label", "encoding", "threads_h", "threads_l", "peak", "min_ilp", "knee", "latency_ns", "measured_latency_ns", "reciprocal_throughput_ns", "saturated"]
+  results.print_table({name: np.array([getattr(entry, name) for entry in entries], dtype = object) for name in columns})
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+import sys
+assert sys.version_info >= (3, 10), "Requires Python 3.10 or later"
+
+import json, math, argparse
+import numpy as np
+import results, stats
+from ilp_saturation import fit_saturation
+
+# Adaptive sweep planner
+#
+# Uses a previous run to select the benchmark points that carry information: the ILPs around
+# the saturation knee of every benchmark (plus the points the saturation model does not
+# explain) and the buffer sizes around the bandwidth transitions (cache capacities) most series
+# agree on, a subset of the measured sizes unless --refine adds sizes between them. The plan is
+# consumed by the generators (--plan), benchmarks without prior data keep their full sweep.
+#
+# The plan can also carry a randomized run schedule (--shuffle): the harness visits every
+# benchmark once per round in shuffled order with cooldown pauses, so that thermal and
+# frequency drifts over a long run do not bias benchmarks by their position in the table
+# (see codegen.RunSchedule and drift.py).
+
+# Allocation granularity of the memory benchmarks (see gen_mem_benchmarks.py)
+SIZE_ALIGNMENT = 64*4
+
+def series(data: results.Results, keys: list[str]):
+  """ Iterate over groups of rows with equal keys, yielding the row indices of each group """
+  (order, starts) = data.group_index(keys)
+  for (start, end) in zip(starts, np.append(starts[1:], len(order))):
+    yield order[start:end]
+
+
+def plan_ilps(ilp: np.ndarray, throughput: np.ndarray, margin: int = 1, tolerance: float = 0.05) -> set[int]:
+  """ Informative ILPs of one series: the extremes, the knee neighbourhood and poorly modelled points """
+  valid = ~np.isnan(throughput)
+  (ilp, throughput) = (ilp[valid], throughput[valid])
+  if len(ilp) == 0: return set()
+
+  fit = fit_saturation(ilp, throughput)
+  selected = {int(np.min(ilp)), int(np.max(ilp))}
+
+  # the knee and its neighbourhood
+  if math.isfinite(fit.knee):
+    selected |= set(range(math.floor(fit.knee) - margin, math.ceil(fit.knee) + margin + 1))
+
+  # the first point reaching the plateau
+  reached = ilp[throughput >= (1 - tolerance)*fit.peak]
+  if len(reached) > 0: selected.add(int(np.min(reached)))
+
+  # points that deviate from the model (e.g. register pressure effects)
+  residual = np.abs(throughput - fit.predict(ilp))/fit.peak
+  selected |= {int(i) for i in ilp[residual > tolerance]}
+
+  return selected & {int(i) for i in ilp}
+
+
+def plan_benchmark_ilps(data: results.Results, keys: list[str], margin: int = 1, tolerance: float = 0.05) -> list[dict]:
+  """ Plan entries (key columns + ILP list) for every benchmark, union over all other configurations """
+  throughput = stats.median(data.sample_matrix())
+  ilp = data["ilp"]
+  columns = {key: data[key] for key in keys}
+  # all remaining identity columns (threads, sizes, ...) form the individual series
+  other = [name for name in stats.identity_columns(data) if name not in keys and name not in ["ilp", "run"]]
+
+  plan = {}
+  for rows in series(data, keys + other):
+    entry = tuple(columns[key][rows[0]] for key in keys)
+    plan.setdefault(entry, set()).update(plan_ilps(ilp[rows], throughput[rows], margin, tolerance))
+
+  return [{**dict(zip(keys, key)), "ilp": sorted(ilps)} for (key, ilps) in plan.items()]
+
+
+def round_size(size: float) -> int:
+  """ Closest valid buffer size (the generated setup requires a multiple of SIZE_ALIGNMENT) """
+  return max(SIZE_ALIGNMENT, int(round(size/SIZE_ALIGNMENT))*SIZE_ALIGNMENT)
+
+
+def plan_sizes(data: results.Results, tolerance: float = 0.1, refine: bool = False) -> list[int]:
+  """ Informative buffer sizes: the extremes, both sides of the bandwidth transitions a majority
+      of the series agree on and the middle of every plateau between them
+
+      A transition is a gap between neighbouring sizes of the measured grid, a series votes for
+      it if its bandwidth changes by more than tolerance across the gap (the series covering
+      the gap decide). The plan is a subset of the measured sizes, with refine the geometric
+      midpoint of every transition is added to locate it more precisely.
+  """
+  throughput = stats.median(data.sample_matrix())
+  size = data["size"]
+  grid = np.unique(size)
+  keys = [name for name in stats.identity_columns(data) if name not in ["size", "run"]]
+
+  # votes for the gaps between neighbouring grid sizes and the number of series covering them
+  votes = np.zeros(max(len(grid) - 1, 0), dtype = int)
+  covered = np.zeros(max(len(grid) - 1, 0), dtype = int)
+  for rows in series(data, keys):
+    rows = rows[np.argsort(size[rows])]
+    rows = rows[~np.isnan(throughput[rows])]
+    if len(rows) < 2: continue
+
+    (x, y) = (np.searchsorted(grid, size[rows]), throughput[rows])
+    covered[x[0]:x[-1]] += 1
+
+    # transitions between neighbouring sizes of the series (a transition between sizes that are
+    # not neighbours on the grid votes for every gap between them)
+    with np.errstate(divide = "ignore", invalid = "ignore"):
+      transition = np.abs(np.log(y[1:]/y[:-1])) > math.log(1 + tolerance)
+    for i in np.flatnonzero(transition): votes[x[i]:x[i + 1]] += 1
+
+  if len(grid) == 0: return []
+  gaps = np.flatnonzero(2*votes > covered)
+  selected = {int(grid[0]), int(grid[-1])}
+  for gap in gaps:
+    selected |= {int(grid[gap]), int(grid[gap + 1])}
+    if refine: selected.add(round_size(math.sqrt(grid[gap]*grid[gap + 1])))
+
+  # one representative size per plateau
+  boundaries = [0, *(gap + 1 for gap in gaps), len(grid)]
+  for (start, end) in zip(boundaries[:-1], boundaries[1:]):
+    if end > start: selected.add(int(grid[(start + end - 1)//2]))
+
+  return sorted(selected)
+
+
+def main():
+  parser = argparse.ArgumentParser(description = "Plan a reduced benchmark sweep from a previous run")
+  parser.add_argument("--ops", default = None, help = "previous instruction benchmark report")
+  parser.add_argument("--mem", default = None, help = "previous memory benchmark report")
+  parser.add_argument("--margin", type = int, default = 1, help = "ILPs to keep on each side of the knee")
+  parser.add_argument("--ilp-tolerance", type = float, default = 0.05, help = "relative model error marking an ILP as informative")
+  parser.add_argument("--size-tolerance", type = float, default = 0.1, help = "relative bandwidth change marking a transition")
+  parser.add_argument("--refine", action = "store_true", help = "add the midpoint of every bandwidth transition (sizes between the measured ones)")
+  parser.add_argument("--shuffle", type = int, default = None, metavar = "SEED", help = "add a randomized run schedule with this seed")
+  parser.add_argument("--rounds", type = int, default = 4, help = "rounds of the run schedule (the repetitions are split over the rounds)")
+  parser.add_argument("--cooldown-every", type = int, default = 50, help = "benchmarks between cooldown pauses (0 to disable)")
+  parser.add_argument("--cooldown-ms", type = int, default = 2000, help = "length of the cooldown pauses (milliseconds)")
+  parser.add_argument("-o", "--output", default = "plan.json", help = "output plan file")
+  args = parser.parse_args()
+
+  plan = {}
+
+  if args.ops is not None:
+    data = results.load(args.ops)
+    # latency benchmarks are not swept over ILP
+    if "mode" in data.columns: data = data.where(mode = "throughput")
+    entries = plan_benchmark_ilps(data, ["label", "encoding", "input_vectors"], args.margin, args.ilp_tolerance)
+    # the generator identifies operations by their vector group size (two inputs per instruction)
+    for entry in entries: entry["vgsize"] = int(entry.pop("input_vectors"))//2
+    plan["op_benchmarks"] = entries
+    n_full = len(data.group_index(["label", "encoding", "input_vectors", "ilp"])[1])
+    print(f"ops: {sum(len(entry["ilp"]) for entry in entries)} of {n_full} benchmarks", file = sys.stderr)
+
+  if args.mem is not None:
+    data = results.load(args.mem)
+    if "ilp" in data.columns and "op_type" in data.columns:
+      entries = plan_benchmark_ilps(data, ["label", "encoding", "op_type", "n_vectors"], args.margin, args.ilp_tolerance)
+      for entry in entries: entry["n_vectors"] = int(entry["n_vectors"])
+      plan["mem_benchmarks"] = entries
+      print(f"mem: {sum(len(entry["ilp"]) for entry in entries)} benchmarks", file = sys.stderr)
+
+    plan["mem_sizes"] = plan_sizes(data, args.size_tolerance, args.refine)
+    print(f"mem: {len(plan["mem_sizes"])} of {len(np.unique(data["size"]))} buffer sizes", file = sys.stderr)
+
+  if args.shuffle is not None:
+    plan["schedule"] = {"seed": args.shuffle, "rounds": args.rounds, "cooldown_every": args.cooldown_every, "cooldown_ms": args.cooldown_ms}
+
+  with open(args.output, "w") as file:
+    json.dump(plan, file, indent = 2, default = lambda value: value.item())
+
+
+if __name__ == "__main__":
+  main()
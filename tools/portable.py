@@ -0,0 +1,66 @@
+import sys
+assert sys.version_info >= (3, 10), "Requires Python 3.10 or later"
+
+import SME
+
+# Portable kernel backend
+#
+# The generated SME kernels only run on SME hardware. With --backend portable the generators
+# replace every kernel with a plain C stand-in that has the same signature, table row and
+# operation accounting (the return value), so the tables, the harness and the whole result
+# pipeline (calibration, sweep plans, analysis tools) can be exercised on any machine. The
+# stand-ins perform comparable work in loops the compiler can vectorize (NEON, SSE/AVX), their
+# throughput says nothing about SME.
+#
+# The kernels are still generated and verified as SME code first, the stand-in is derived from
+# the fields of the benchmark, so the tables of both backends are identical.
+
+# C code shared by the generated files of the portable backend
+PREAMBLE = """
+// portable backend (plain C stand-ins of the SME kernels, see tools/portable.py)
+#include <stdint.h>
+#include <string.h>
+
+// hide a value from the optimizer (forces it to be computed and memory to be written)
+#define PORTABLE_CLOBBER(x) __asm__ __volatile__("" : : "r"(x) : "memory")
+
+// n_out multiply-accumulates of k products each: acc[e] += a[kk]*b[kk]
+#define PORTABLE_MAC(acc, a, b, n_out, k) \\
+  for (size_t e = 0; e < (n_out); e++) \\
+    for (size_t kk = 0; kk < (k); kk++) (acc)[e] += (a)[kk]*(b)[kk]
+
+// rows x cols outer product accumulated in type T: acc[r*cols + c] += a[r]*b[c]
+#define PORTABLE_OUTER(acc, a, b, rows, cols, T) \\
+  for (size_t r = 0; r < (rows); r++) \\
+    for (size_t c = 0; c < (cols); c++) (acc)[r*(cols) + c] += (T)(a)[r]*(T)(b)[c]
+
+// n accumulators stored as elements of type S without a C equivalent (integers of their size, wrapping)
+#define PORTABLE_STORE(dst, acc, n, S) \\
+  for (size_t e = 0; e < (n); e++) ((S*)(dst))[e] = (S)(int64_t)(acc)[e]
+
+// XOR reduction of n 64-bit words
+#define PORTABLE_LOAD(sum, src, n) \\
+  for (size_t w = 0; w < (n); w++) (sum) ^= ((const uint64_t*)(src))[w]
+"""
+
+
+def c_type(label: str) -> str:
+  """ C type of the values of an SME data type (the accumulator type of the stand-ins)
+
+      Floating-point types compute in float (double for 64-bit), integer types in unsigned
+      arithmetic (wrapping instead of overflowing).
+  """
+  data = SME.Types.with_label(label)
+  if data.kind in ["float", "bfloat"]: return "double" if data.size == 64 else "float"
+  return "uint64_t" if data.size == 64 else "uint32_t"
+
+
+def storage_type(label: str) -> str:
+  """ C type of the stored elements of an SME data type (same size, converted on use)
+
+      Types without a portable C equivalent (8- and 16-bit floating point) are stored as
+      unsigned integers of their size.
+  """
+  data = SME.Types.with_label(label)
+  if data.kind == "float" and data.size >= 32: return c_type(label)
+  return f"uint{data.size}_t"
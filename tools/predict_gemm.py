@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+import sys
+assert sys.version_info >= (3, 10), "Requires Python 3.10 or later"
+
+import json, math, argparse
+from dataclasses import dataclass, asdict
+import numpy as np
+import results, stats
+
+# Analytical GEMM time prediction
+#
+# Roofline model of C = A*B (M x N, reduction K) for the packed outer-product kernels of
+# gen_gemm_benchmarks.py, built from measured peaks only:
+#
+#   compute = 2*M*N*K / peak outer product throughput (instruction benchmarks)
+#   memory  = sum over the operand streams of bytes/bandwidth(working set)
+#
+# With an m_step x n_step C block, the A panel (K x m_step) is reused for a whole row of C blocks
+# and the packed B (K x N) is streamed once per A panel, so the kernel loads M*N*K/n_step A
+# elements from a working set of one panel and M*N*K/m_step B elements from a working set of
+# the whole B. The bandwidth of each stream is the measured load bandwidth at its working set
+# size (interpolated over the buffer sizes, which places it in the matching cache level) for
+# the same thread configuration. The predicted time is the larger of both terms.
+
+@dataclass(kw_only=True)
+class Prediction:
+  threads_h: int
+  threads_l: int
+  # cores used by the threads (high-priority threads run on the P-cores first)
+  p_threads: int
+  e_threads: int
+  # predicted times (seconds)
+  compute_time: float
+  memory_time: float
+  time: float
+  # effective throughput (GOP/s, 2*M*N*K)
+  gops: float
+  bound: str
+  # bytes and bandwidth (GB/s) of the operand streams
+  streams: dict[str, dict]
+
+
+def throughput_rows(data: results.Results) -> results.Results:
+  # the dependent-chain benchmarks and partial predicates do not measure the peak (older reports have neither)
+  if "mode" in data.columns: data = data.where(mode = "throughput")
+  if "predicate_density" in data.columns: data = data.where(predicate_density = 1.0)
+  return data
+
+
+def compute_peaks(data: results.Results, label: str) -> dict[tuple[int, int], float]:
+  """ Peak GOP/s (best median over ILPs) of an operation for every thread configuration """
+  data = throughput_rows(data).where(label = label)
+  assert len(data) > 0, f"no measurements of {label}"
+  table = data.group_by(["threads_h", "threads_l"], np.nan_to_num(stats.median(data.sample_matrix())), np.maximum)
+
+  return {(int(h), int(l)): float(peak) for (h, l, peak) in zip(table["threads_h"], table["threads_l"], table["value"])}
+
+
+def select_operation(data: results.Results, dtype: str, accumulator: str | None = None) -> str:
+  """ The outer product (ZA tile output) with the given input type and the highest single-thread peak """
+  data = throughput_rows(data).where(encoding = "za-tile", input_data = dtype)
+  if accumulator is not None: data = data.where(output_data = accumulator)
+  assert len(data) > 0, f"no outer product with {dtype} input" + (f" and {accumulator} output" if accumulator else "")
+
+  table = data.group_by(["label"], np.nan_to_num(stats.median(data.sample_matrix())), np.maximum)
+  return str(table["label"][np.argmax(table["value"])])
+
+
+def operation_types(data: results.Results, label: str) -> tuple[int, int]:
+  """ Input and output element sizes (bytes) of an operation """
+  data = data.where(label = label)
+  sizes = {"8": 1, "16": 2, "32": 4, "64": 8}
+  size = lambda name: sizes[name.lstrip("bfiu")]
+
+  return (size(data["input_data"][0]), size(data["output_data"][0]))
+
+
+def load_bandwidth(data: results.Results) -> dict[tuple[int, int], tuple[np.ndarray, np.ndarray]]:
+  """ Load bandwidth curve (buffer sizes, best median GB/s) for every thread configuration
+
+      Older reports (type, threads) ran high-priority threads only.
+  """
+  if "op_type" in data.columns:
+    data = throughput_rows(data).where(op_type = "load")
+    keys = ["threads_h", "threads_l", "size"]
+    threads = lambda row: (int(row[0]), int(row[1]))
+  else:
+    data = data.where(type = "load")
+    keys = ["threads", "size"]
+    threads = lambda row: (int(row[0]), 0)
+
+  table = data.group_by(keys, np.nan_to_num(stats.median(data.sample_matrix())), np.maximum)
+  curves = {}
+  for row in zip(*(table[key] for key in keys), table["value"]):
+    curves.setdefault(threads(row), []).append((int(row[-2]), float(row[-1])))
+
+  return {key: (np.array([size for (size, _) in curve]), np.array([gbps for (_, gbps) in curve])) for (key, curve) in curves.items()}
+
+
+def bandwidth_at(curve: tuple[np.ndarray, np.ndarray], size: float) -> float:
+  """ Bandwidth at a working set size (log-linear interpolation, clamped to the measured sizes) """
+  (sizes, gbps) = curve
+  order = np.argsort(sizes)
+  return float(np.interp(math.log2(max(size, 1)), np.log2(sizes[order]), gbps[order]))
+
+
+def default_tiles(output_size: int) -> tuple[int, int]:
+  """ Squarest power-of-two tile grid using all ZA tiles of the output type (one per output byte) """
+  n_tiles = output_size
+  rows = 2**(int(math.log2(n_tiles))//2)
+  return (rows, n_tiles//rows)
+
+
+def predict(
+  shape: tuple[int, int, int],
+  peak: float,
+  curve: tuple[np.ndarray, np.ndarray],
+  sizes: tuple[int, int],
+  tiles: tuple[int, int],
+  threads: tuple[int, int],
+  p_cores: int
+) -> Prediction:
+  """ Roofline prediction of one GEMM shape for one thread configuration """
+  (m, n, k) = shape
+  (input_size, output_size) = sizes
+  # C block of the kernel (one vector of output elements per tile side), the shape is padded to it
+  vector = 64//output_size
+  (m_step, n_step) = (tiles[0]*vector, tiles[1]*vector)
+  (m, n) = (math.ceil(m/m_step)*m_step, math.ceil(n/n_step)*n_step)
+
+  streams = {
+    # (bytes, working set per thread)
+    "A": (m*n*k*input_size/n_step, k*m_step*input_size),
+    "B": (m*n*k*input_size/m_step, k*n*input_size),
+    # C is written once, streamed through the whole hierarchy (the largest measured size)
+    "C": (m*n*output_size, None),
+  }
+  bandwidths = {name: bandwidth_at(curve, ws if ws is not None else np.max(curve[0])) for (name, (_, ws)) in streams.items()}
+  times = {name: size/(bandwidths[name]*1e9) for (name, (size, _)) in streams.items()}
+
+  ops = 2.0*m*n*k
+  compute_time = ops/(peak*1e9)
+  memory_time = sum(times.values())
+  time = max(compute_time, memory_time)
+  slowest = max(times, key = times.get)
+
+  (threads_h, threads_l) = threads
+  return Prediction(
+    threads_h = threads_h,
+    threads_l = threads_l,
+    p_threads = min(threads_h, p_cores),
+    e_threads = threads_l + max(0, threads_h - p_cores),
+    compute_time = compute_time,
+    memory_time = memory_time,
+    time = time,
+    gops = ops/time/1e9,
+    bound = "compute" if compute_time >= memory_time else f"memory ({slowest})",
+    streams = {name: {"bytes": size, "working_set": ws, "gbps": bandwidths[name]} for (name, (size, ws)) in streams.items()}
+  )
+
+
+def parse_shape(text: str) -> tuple[int, int, int]:
+  (m, n, k) = text.split("x")
+  return (int(m), int(n), int(k))
+
+
+def main():
+  parser = argparse.ArgumentParser(description = "Predict GEMM run times from the measured peaks and bandwidths")
+  parser.add_argument("shapes", type = parse_shape, nargs = "+", help = "problem shapes MxNxK, e.g. 1024x1024x1024")
+  parser.add_argument("--ops", default = "results/op_benchmarks.json.bz2", help = "instruction benchmark report")
+  parser.add_argument("--mem", default = "results/sme-memcpy.json", help = "memory benchmark report")
+  parser.add_argument("--cpu-info", default = "results/cpu_info.json", help = "CPU info report (core counts)")
+  parser.add_argument("--dtype", default = "f32", help = "input data type (e.g. f32, f16, i8)")
+  parser.add_argument("--accumulator", default = None, help = "output data type (e.g. f32 for FP16 into FP32), the fastest outer product if omitted")
+  parser.add_argument("--label", default = None, help = "outer product to use (overrides --dtype)")
+  parser.add_argument("--tiles", default = None, metavar = "RxC", help = "ZA tile grid of the kernel (all tiles of the output type if omitted)")
+  parser.add_argument("--threads", default = None, metavar = "H,L", help = "only predict this thread configuration (e.g. 3,0)")
+  parser.add_argument("--json", default = None, help = "write the predictions to this file")
+  args = parser.parse_args()
+
+  ops = results.load(args.ops)
+  curves = load_bandwidth(results.load(args.mem))
+  with open(args.cpu_info) as file: p_cores = json.load(file)["cpu_p_cores"]
+
+  label = args.label or select_operation(ops, args.dtype, args.accumulator)
+  peaks = compute_peaks(ops, label)
+  sizes = operation_types(ops, label)
+  tiles = tuple(int(t) for t in args.tiles.split("x")) if args.tiles is not None else default_tiles(sizes[1])
+
+  # thread configurations measured by both reports
+  configs = sorted(set(peaks) & set(curves))
+  if args.threads is not None:
+    configs = [config for config in configs if config == tuple(int(t) for t in args.threads.split(","))]
+  assert configs, "the reports have no common thread configuration"
+  print(f"{label}, {tiles[0]}x{tiles[1]} tiles", file = sys.stderr)
+
+  output = []
+  for shape in args.shapes:
+    predictions = sorted((predict(shape, peaks[config], curves[config], sizes, tiles, config, p_cores) for config in configs), key = lambda p: p.time)
+    best = predictions[0]
+
+    print(f"\n{shape[0]}x{shape[1]}x{shape[2]}: {best.time*1000:.3f} ms with {best.p_threads}P+{best.e_threads}E threads, {best.bound} bound\n")
+    columns = ["threads_h", "threads_l", "p_threads", "e_threads", "compute_time", "memory_time", "time", "gops", "bound"]
+    results.print_table({name: np.array([getattr(p, name) for p in predictions], dtype = object) for name in columns})
+
+    output.append({"m": shape[0], "n": shape[1], "k": shape[2], "label": label, "tiles": list(tiles), "predictions": [asdict(p) for p in predictions]})
+
+  if args.json is not None:
+    with open(args.json, "w") as file: json.dump(output, file, indent = 2)
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+import sys
+assert sys.version_info >= (3, 10), "Requires Python 3.10 or later"
+
+import os, bz2, json, shutil, argparse, itertools
+from typing import Callable, Literal
+import numpy as np
+
+# Columnar benchmark results store
+#
+# The JSON reports written by the benchmark app (results/*.json, optionally bzip2-compressed)
+# are converted once into a directory of NumPy arrays that are memory-mapped on demand:
+#
+#   meta.json           schema (column kinds, categories), sources and row count
+#   <column>.npy        one array per scalar column (string columns are stored as int32 codes)
+#   samples.npy         all raw throughput samples (gops/gbps/...) concatenated
+#   offsets.npy         row i owns samples[offsets[i]:offsets[i + 1]]
+#
+# Several reports (e.g. different devices or runs) can be combined in one store, the `run`
+# column identifies the source of each row.
+
+ColumnKind = Literal["int", "float", "bool", "category"]
+
+STORE_VERSION = 1
+
+def read_report(path: str) -> list[dict]:
+  """ Read a JSON benchmark report (bzip2-compressed if the name ends with .bz2) """
+  opener = bz2.open if path.endswith(".bz2") else open
+  with opener(path, "rt") as file:
+    return json.load(file)
+
+
+def report_name(path: str) -> str:
+  """ Report name without the directory and the .json/.bz2 extensions """
+  name = os.path.basename(path)
+  for ext in [".bz2", ".json"]: name = name.removesuffix(ext)
+  return name
+
+
+def default_store_path(path: str) -> str:
+  return os.path.join(os.path.dirname(path), ".columns", report_name(path))
+
+
+def source_signature(path: str) -> list:
+  stat = os.stat(path)
+  return [os.path.abspath(path), stat.st_size, stat.st_mtime_ns]
+
+
+def column_kind(values: list) -> ColumnKind:
+  kinds = {type(value) for value in values if value is not None}
+  # columns without any value (e.g. unavailable hardware counters) are missing measurements
+  if not kinds: return "float"
+  if kinds <= {bool}: return "bool"
+  if kinds <= {int}: return "int"
+  if kinds <= {int, float}: return "float"
+  return "category"
+
+
+def convert(paths: list[str], store: str, runs: list[str] | None = None):
+  """ Convert one or more JSON reports into a columnar store at the given path
+
+      Rows of all reports are concatenated, runs provides the `run` label for each report
+      (the report name by default). All reports must use the same samples field.
+  """
+  runs = runs or [report_name(path) for path in paths]
+  assert len(runs) == len(paths)
+
+  rows = []
+  run_codes = []
+  for (i, path) in enumerate(paths):
+    report = read_report(path)
+    rows += report
+    run_codes += [i]*len(report)
+
+  # the samples field is the only list-valued field
+  sample_fields = {key for row in rows for (key, value) in row.items() if isinstance(value, list)}
+  assert len(sample_fields) <= 1, f"reports have multiple sample fields: {sample_fields}"
+  samples_field = sample_fields.pop() if sample_fields else None
+
+  # scalar columns in order of appearance
+  names = list(dict.fromkeys(key for row in rows for key in row if key != samples_field))
+
+  # write to a temporary directory first, so that an interrupted conversion is never loaded
+  tmp = f"{store}.tmp"
+  shutil.rmtree(tmp, ignore_errors = True)
+  os.makedirs(tmp)
+
+  columns = {"run": {"kind": "category", "categories": runs}}
+  np.save(os.path.join(tmp, "run.npy"), np.array(run_codes, dtype = np.int32))
+
+  for name in names:
+    values = [row.get(name) for row in rows]
+    kind = column_kind(values)
+    columns[name] = {"kind": kind}
+
+    match kind:
+      case "bool":
+        data = np.array([bool(value) for value in values], dtype = bool)
+      case "int":
+        data = np.array([-1 if value is None else value for value in values], dtype = np.int64)
+      case "float":
+        data = np.array([np.nan if value is None else value for value in values], dtype = np.float64)
+      case "category":
+        values = ["" if value is None else str(value) for value in values]
+        categories = sorted(set(values))
+        lookup = {category: code for (code, category) in enumerate(categories)}
+        data = np.array([lookup[value] for value in values], dtype = np.int32)
+        columns[name]["categories"] = categories
+
+    np.save(os.path.join(tmp, f"{name}.npy"), data)
+
+  # samples as a ragged array
+  samples = [row.get(samples_field) or [] for row in rows] if samples_field else [[] for _ in rows]
+  offsets = np.zeros(len(rows) + 1, dtype = np.int64)
+  np.cumsum([len(s) for s in samples], out = offsets[1:])
+  np.save(os.path.join(tmp, "samples.npy"), np.fromiter(itertools.chain.from_iterable(samples), dtype = np.float64, count = offsets[-1]))
+  np.save(os.path.join(tmp, "offsets.npy"), offsets)
+
+  with open(os.path.join(tmp, "meta.json"), "w") as file:
+    json.dump({
+      "version": STORE_VERSION,
+      "n_rows": len(rows),
+      "samples": samples_field,
+      "sources": [source_signature(path) for path in paths],
+      "columns": columns
+    }, file, indent = 2)
+
+  shutil.rmtree(store, ignore_errors = True)
+  os.rename(tmp, store)
+
+
+def load(*paths: str, store: str | None = None, runs: list[str] | None = None) -> "Results":
+  """ Open the results for one or more JSON reports, converting them if the store is missing or stale """
+  assert len(paths) > 0
+  store = store or default_store_path(paths[0])
+
+  try:
+    with open(os.path.join(store, "meta.json"), "r") as file:
+      meta = json.load(file)
+    stale = meta["version"] != STORE_VERSION or meta["sources"] != [source_signature(path) for path in paths]
+    stale = stale or (runs is not None and meta["columns"]["run"]["categories"] != runs)
+  except FileNotFoundError:
+    stale = True
+
+  if stale: convert(list(paths), store, runs)
+
+  return Results(store)
+
+
+class Results:
+  """ A (lazily loaded) selection of rows from a columnar results store
+
+      Columns are memory-mapped on first access. Filtering returns a new Results object
+      sharing the underlying arrays, string columns are compared using their codes.
+  """
+  def __init__(self, store: str, index: np.ndarray | None = None, _arrays: dict | None = None, _meta: dict | None = None):
+    self.store = store
+    if _meta is None:
+      with open(os.path.join(store, "meta.json"), "r") as file: _meta = json.load(file)
+    self.meta = _meta
+    self.index = index
+    self._arrays = {} if _arrays is None else _arrays
+
+  def __len__(self):
+    return self.meta["n_rows"] if self.index is None else len(self.index)
+
+  def __repr__(self):
+    return f"Results({self.store!r}, {len(self)} rows, samples = {self.samples_field!r})"
+
+  @property
+  def columns(self) -> list[str]:
+    return list(self.meta["columns"].keys())
+
+  @property
+  def samples_field(self) -> str | None:
+    return self.meta["samples"]
+
+  def kind(self, name: str) -> ColumnKind:
+    return self.meta["columns"][name]["kind"]
+
+  def categories(self, name: str) -> list[str]:
+    return self.meta["columns"][name]["categories"]
+
+  def _array(self, name: str) -> np.ndarray:
+    # memory-map the full array on first access
+    if name not in self._arrays:
+      self._arrays[name] = np.load(os.path.join(self.store, f"{name}.npy"), mmap_mode = "r")
+    return self._arrays[name]
+
+  def _select(self, data: np.ndarray) -> np.ndarray:
+    return np.asarray(data) if self.index is None else data[self.index]
+
+  def codes(self, name: str) -> np.ndarray:
+    """ Raw column values (category codes for string columns) of the selected rows """
+    return self._select(self._array(name))
+
+  def __getitem__(self, name: str) -> np.ndarray:
+    """ Column values of the selected rows (string columns are decoded) """
+    data = self.codes(name)
+    if self.kind(name) == "category":
+      return np.array(self.categories(name), dtype = object)[data]
+    return data
+
+  def _subset(self, index: np.ndarray) -> "Results":
+    return Results(self.store, index, self._arrays, self.meta)
+
+  def take(self, rows: np.ndarray) -> "Results":
+    """ Select rows by position or boolean mask (relative to this selection) """
+    rows = np.asarray(rows)
+    if rows.dtype == bool: rows = np.flatnonzero(rows)
+    base = np.arange(self.meta["n_rows"]) if self.index is None else self.index
+    return self._subset(base[rows])
+
+  def mask(self, name: str, condition) -> np.ndarray:
+    """ Boolean mask for a column condition: a value, a list/set/range of values or a predicate """
+    if callable(condition): return np.asarray(condition(self[name]), dtype = bool)
+
+    values = list(condition) if isinstance(condition, (list, tuple, set, range)) else [condition]
+    if self.kind(name) == "category":
+      lookup = {category: code for (code, category) in enumerate(self.categories(name))}
+      values = [lookup[value] for value in values if value in lookup]
+
+    return np.isin(self.codes(name), values)
+
+  def where(self, **conditions) -> "Results":
+    """ Filter rows, e.g. where(label = "FMOPA (FP32)", ilp = range(1, 5), threads_l = 0) """
+    selected = np.ones(len(self), dtype = bool)
+    for (name, condition) in conditions.items():
+      selected &= self.mask(name, condition)
+
+    return self.take(selected)
+
+  def samples(self) -> tuple[np.ndarray, np.ndarray]:
+    """ Samples of the selected rows as a ragged array (values, offsets) """
+    samples = self._array("samples")
+    offsets = self._array("offsets")
+    if self.index is None: return (np.asarray(samples), np.asarray(offsets))
+
+    starts = offsets[self.index]
+    counts = offsets[self.index + 1] - starts
+    out_offsets = np.zeros(len(self.index) + 1, dtype = np.int64)
+    np.cumsum(counts, out = out_offsets[1:])
+    positions = np.repeat(starts - out_offsets[:-1], counts) + np.arange(out_offsets[-1])
+
+    return (samples[positions], out_offsets)
+
+  def sample_counts(self) -> np.ndarray:
+    return np.diff(self.samples()[1])
+
+  def sample_matrix(self) -> np.ndarray:
+    """ Samples of the selected rows as a NaN-padded (rows x max samples) matrix """
+    (values, offsets) = self.samples()
+    counts = np.diff(offsets)
+    matrix = np.full((len(counts), counts.max(initial = 0)), np.nan)
+    rows = np.repeat(np.arange(len(counts)), counts)
+    matrix[rows, np.arange(len(values)) - offsets[rows]] = values
+
+    return matrix
+
+  def reduce_samples(self, reduce: np.ufunc = np.maximum) -> np.ndarray:
+    """ Reduce the samples of each selected row with a ufunc (NaN for rows without samples) """
+    (values, offsets) = self.samples()
+    counts = np.diff(offsets)
+    out = np.full(len(counts), np.nan)
+    nonempty = counts > 0
+    if values.size > 0:
+      out[nonempty] = reduce.reduceat(values, offsets[:-1][nonempty])
+
+    return out
+
+  def group_by(self, keys: list[str], values: np.ndarray, reduce: np.ufunc = np.maximum) -> dict[str, np.ndarray]:
+    """ Reduce per-row values over groups of rows with equal keys
+
+        Returns a dictionary of columns: the group keys and the reduced `value`.
+    """
+    values = np.asarray(values)
+    assert len(values) == len(self)
+    (order, starts) = self.group_index(keys)
+
+    table = {key: self[key][order[starts]] for key in keys}
+    table["value"] = reduce.reduceat(values[order], starts) if len(order) > 0 else values[:0]
+
+    return table
+
+  def group_index(self, keys: list[str]) -> tuple[np.ndarray, np.ndarray]:
+    """ Row order that sorts the selection by keys and the start offset of each group """
+    codes = [self.codes(key) for key in keys]
+    if len(self) == 0: return (np.zeros(0, dtype = np.int64), np.zeros(0, dtype = np.int64))
+
+    order = np.lexsort(codes[::-1])
+    changes = np.zeros(len(order), dtype = bool)
+    changes[0] = True
+    for column in codes:
+      sorted_column = column[order]
+      changes[1:] |= sorted_column[1:] != sorted_column[:-1]
+
+    return (order, np.flatnonzero(changes))
+
+  def peak(self, keys: list[str]) -> dict[str, np.ndarray]:
+    """ Maximal sample per group, e.g. peak(["label", "ilp", "threads_h", "threads_l"]) """
+    return self.group_by(keys, self.reduce_samples(np.maximum), np.maximum)
+
+  def to_dict(self, columns: list[str] | None = None) -> dict[str, np.ndarray]:
+    return {name: self[name] for name in (columns or self.columns)}
+
+
+def print_table(table: dict[str, np.ndarray], file = sys.stdout):
+  """ Print a dictionary of columns as an aligned text table """
+  names = list(table.keys())
+  cells = [[f"{value:.4g}" if isinstance(value, (float, np.floating)) else str(value) for value in table[name]] for name in names]
+  widths = [max([len(name), *(len(cell) for cell in column)]) for (name, column) in zip(names, cells)]
+
+  print(" | ".join(name.ljust(width) for (name, width) in zip(names, widths)), file = file)
+  print("-+-".join("-"*width for width in widths), file = file)
+  for row in zip(*cells):
+    print(" | ".join(cell.ljust(width) for (cell, width) in zip(row, widths)), file = file)
+
+
+def main():
+  parser = argparse.ArgumentParser(description = "Convert benchmark reports into a columnar store")
+  parser.add_argument("reports", nargs = "+", help = "JSON benchmark reports (optionally .bz2)")
+  parser.add_argument("--store", default = None, help = "store directory (default: results/.columns/<report>)")
+  parser.add_argument("--runs", nargs = "+", default = None, help = "run label for each report")
+  parser.add_argument("--peak", nargs = "+", default = None, metavar = "KEY", help = "print the peak sample grouped by these columns")
+  args = parser.parse_args()
+
+  results = load(*args.reports, store = args.store, runs = args.runs)
+  print(results, file = sys.stderr)
+
+  if args.peak is not None: print_table(results.peak(args.peak))
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+import sys
+assert sys.version_info >= (3, 10), "Requires Python 3.10 or later"
+
+import json, math, argparse
+from dataclasses import dataclass, asdict
+import numpy as np
+import results, stats
+from ilp_saturation import GROUP_KEYS, fit_saturation
+from predict_gemm import throughput_rows
+from plan_sweep import series
+
+# Multi-core scaling and shared-unit contention
+#
+# The thread configurations of a report contain two sweeps: high-priority threads only
+# (threads_h = n, threads_l = 0), which run on the P-cores first, and low-priority threads only
+# (threads_h = 0, threads_l = n), which run on the E-cores. The aggregate throughput of every
+# benchmark (best ILP or alignment per thread count) is fitted with three models over n:
+#
+#   ideal       gops(n) = single*n
+#   Amdahl      gops(n) = single/((1 - p) + p/n)       (p: parallel fraction)
+#   saturation  gops(n) = min(single*n, peak)           (a unit shared by the cores of a cluster)
+#
+# and the model with the smallest Akaike information criterion is selected. The saturation knee
+# peak/single is the number of threads that saturate the shared resource. Independent of the
+# models, the scaling limit is the smallest measured thread count reaching the threshold fraction
+# of the best throughput: adding threads beyond it does not pay off.
+
+# benchmark identity of the instruction reports (everything except ILP and threads)
+OP_KEYS = [key for key in GROUP_KEYS if key not in ["threads_h", "threads_l"]]
+# memory reports (alignment and ILP are reduced to the best one), older format (sme-memcpy)
+MEM_KEYS = ["op_type", "encoding", "n_vectors", "size"]
+LEGACY_MEM_KEYS = ["type", "unroll", "storage", "size"]
+
+# (sweep name, thread count column, column that is zero in the sweep)
+SWEEPS = [("P", "threads_h", "threads_l"), ("E", "threads_l", "threads_h")]
+
+@dataclass(kw_only=True)
+class ScalingFit:
+  model: str
+  # single-thread throughput of the model
+  single: float
+  # Amdahl parallel fraction, saturation peak (None for the other models)
+  parallel_fraction: float | None = None
+  peak: float | None = None
+  sse: float
+  aic: float
+
+  def predict(self, n: np.ndarray) -> np.ndarray:
+    n = np.asarray(n, dtype = np.float64)
+    if self.model == "amdahl": return self.single/((1 - self.parallel_fraction) + self.parallel_fraction/n)
+    if self.model == "saturation": return np.minimum(self.single*n, self.peak)
+    return self.single*n
+
+  @property
+  def knee(self) -> float:
+    """ Thread count where the model stops scaling linearly """
+    if self.model == "saturation": return self.peak/self.single if self.single > 0 else float("inf")
+    # Amdahl: the speedup reaches half of its limit 1/(1 - p)
+    if self.model == "amdahl": return self.parallel_fraction/(1 - self.parallel_fraction) if self.parallel_fraction < 1 else float("inf")
+    return float("inf")
+
+
+def information_criterion(sse: float, n_points: int, n_parameters: int, scale: float) -> float:
+  # the residual is floored (relative to the throughput) so that exact fits remain comparable
+  floor = n_points*(1e-4*scale)**2
+  return n_points*math.log(max(sse, floor)/n_points) + 2*n_parameters
+
+
+def fit_ideal(n: np.ndarray, gops: np.ndarray) -> ScalingFit:
+  single = float(np.sum(n*gops)/np.sum(n*n))
+  sse = float(np.sum((single*n - gops)**2))
+  return ScalingFit(model = "ideal", single = single, sse = sse, aic = information_criterion(sse, len(n), 1, np.max(gops)))
+
+
+def fit_amdahl(n: np.ndarray, gops: np.ndarray, resolution: int = 1000) -> ScalingFit:
+  """ Least-squares fit of gops = single/((1 - p) + p/n), p on a grid in [0, 1] (single in closed form) """
+  best = None
+  for p in np.linspace(0, 1, resolution + 1):
+    speedup = 1/((1 - p) + p/n)
+    single = np.sum(gops*speedup)/np.sum(speedup*speedup)
+    sse = float(np.sum((single*speedup - gops)**2))
+    if best is None or sse < best[0]: best = (sse, float(p), float(single))
+
+  (sse, p, single) = best
+  return ScalingFit(model = "amdahl", single = single, parallel_fraction = p, sse = sse, aic = information_criterion(sse, len(n), 2, np.max(gops)))
+
+
+def fit_contention(n: np.ndarray, gops: np.ndarray) -> ScalingFit:
+  fit = fit_saturation(n, gops)
+  return ScalingFit(model = "saturation", single = float(fit.slope), peak = float(fit.peak), sse = fit.sse, aic = information_criterion(fit.sse, len(n), 2, np.max(gops)))
+
+
+def fit_scaling(n: np.ndarray, gops: np.ndarray) -> tuple[ScalingFit, list[ScalingFit]]:
+  """ The selected model and all fitted models of one scaling curve """
+  n = np.asarray(n, dtype = np.float64)
+  gops = np.asarray(gops, dtype = np.float64)
+  fits = [fit_ideal(n, gops), fit_amdahl(n, gops), fit_contention(n, gops)]
+  # ties keep the simpler model (listed first)
+  return (min(fits, key = lambda fit: fit.aic), fits)
+
+
+@dataclass(kw_only=True)
+class ScalingEntry:
+  key: dict
+  sweep: str
+  threads: list[int]
+  gops: list[float]
+  model: str
+  single: float
+  parallel_fraction: float | None
+  peak: float | None
+  knee: float
+  # smallest measured thread count reaching the threshold fraction of the best throughput
+  limit: int
+  max_threads: int
+  # speedup and parallel efficiency at the largest measured thread count
+  speedup: float
+  efficiency: float
+  # relative RMS error of the selected model
+  fit_error: float
+
+
+def report_format(data: results.Results) -> tuple[list[str], list[tuple[str, str, str | None]]]:
+  """ Benchmark identity and sweeps of a report """
+  if "threads_h" not in data.columns:
+    # older memory reports ran high-priority threads only
+    return (LEGACY_MEM_KEYS, [("P", "threads", None)])
+  if "ops_per_instruction" not in data.columns: return (MEM_KEYS, SWEEPS)
+  # the category is a property of the operation, kept for the class summary
+  return (OP_KEYS + (["category"] if "category" in data.columns else []), SWEEPS)
+
+
+def scaling_table(data: results.Results, threshold: float = 0.95) -> list[ScalingEntry]:
+  """ Fit the scaling models for every benchmark and sweep """
+  data = throughput_rows(data)
+  (keys, sweeps) = report_format(data)
+  throughput = np.nan_to_num(stats.median(data.sample_matrix()))
+
+  entries = []
+  for (sweep, column, other) in sweeps:
+    rows = np.ones(len(data), dtype = bool) if other is None else (data[other] == 0) & (data[column] > 0)
+    if not np.any(rows): continue
+    sweep_data = data.take(rows)
+    (count, sweep_gops) = (sweep_data[column], throughput[rows])
+    columns = {key: sweep_data[key] for key in keys}
+
+    for group in series(sweep_data, keys):
+      # best ILP/alignment per thread count
+      threads = np.unique(count[group])
+      gops = np.array([np.max(sweep_gops[group][count[group] == n]) for n in threads])
+      if len(threads) < 2 or np.max(gops) <= 0: continue
+
+      (fit, _) = fit_scaling(threads, gops)
+      best = np.max(gops)
+      residual = gops - fit.predict(threads)
+      # the measured single-thread point if present, else the model
+      single = gops[0] if threads[0] == 1 else fit.single
+
+      entries.append(ScalingEntry(
+        key = {key: columns[key][group[0]].item() if hasattr(columns[key][group[0]], "item") else columns[key][group[0]] for key in keys},
+        sweep = sweep,
+        threads = [int(n) for n in threads],
+        gops = gops.tolist(),
+        model = fit.model,
+        single = fit.single,
+        parallel_fraction = fit.parallel_fraction,
+        peak = fit.peak,
+        knee = fit.knee,
+        limit = int(threads[np.argmax(gops >= threshold*best)]),
+        max_threads = int(threads[-1]),
+        speedup = float(gops[-1]/single) if single > 0 else float("nan"),
+        efficiency = float(gops[-1]/(single*threads[-1])) if single > 0 else float("nan"),
+        fit_error = float(np.sqrt(np.mean(residual**2))/best)
+      ))
+
+  return entries
+
+
+def class_summary(entries: list[ScalingEntry], class_keys: list[str]) -> list[dict]:
+  """ Scaling limit per class of benchmarks (e.g. instruction category) and sweep """
+  groups = {}
+  for entry in entries:
+    key = (entry.sweep, *(entry.key.get(name) for name in class_keys))
+    groups.setdefault(key, []).append(entry)
+
+  summary = []
+  for (key, group) in sorted(groups.items()):
+    limits = np.array([entry.limit for entry in group])
+    summary.append({
+      "sweep": key[0],
+      **dict(zip(class_keys, key[1:])),
+      "benchmarks": len(group),
+      "limit": int(np.median(limits)),
+      "min_limit": int(np.min(limits)),
+      "max_threads": max(entry.max_threads for entry in group),
+      "efficiency": float(np.median([entry.efficiency for entry in group])),
+      "saturated": sum(entry.model == "saturation" for entry in group),
+      "amdahl": sum(entry.model == "amdahl" for entry in group),
+      "ideal": sum(entry.model == "ideal" for entry in group)
+    })
+
+  return summary
+
+
+def main():
+  parser = argparse.ArgumentParser(description = "Fit multi-core scaling models and find where benchmarks stop scaling")
+  parser.add_argument("report", nargs = "?", default = "results/op_benchmarks.json.bz2", help = "instruction or memory benchmark report")
+  parser.add_argument("--threshold", type = float, default = 0.95, help = "fraction of the best throughput that defines the scaling limit")
+  parser.add_argument("--classes", default = None, help = "comma-separated columns the summary is grouped by (category or op_type/type and size by default)")
+  parser.add_argument("--benchmarks", action = "store_true", help = "also print the fit of every benchmark")
+  parser.add_argument("--json", default = None, help = "write the fits and the summary to this file")
+  args = parser.parse_args()
+
+  data = results.load(args.report)
+  entries = scaling_table(data, args.threshold)
+  assert entries, f"{args.report} has no thread sweep"
+
+  if args.classes is not None: class_keys = args.classes.split(",")
+  elif "category" in data.columns: class_keys = ["category"]
+  else: class_keys = ["op_type" if "op_type" in data.columns else "type", "size"]
+  summary = class_summary(entries, class_keys)
+
+  if args.benchmarks:
+    keys = list(entries[0].key)
+    columns = {name: np.array([entry.key[name] for entry in entries], dtype = object) for name in keys}
+    for name in ["sweep", "model", "single", "peak", "knee", "limit", "max_threads", "speedup", "efficiency", "fit_error"]:
+      columns[name] = np.array([getattr(entry, name) for entry in entries], dtype = object)
+    results.print_table(columns)
+    print()
+
+  results.print_table({name: np.array([entry[name] for entry in summary], dtype = object) for name in summary[0]})
+
+  if args.json is not None:
+    with open(args.json, "w") as file:
+      json.dump({"summary": summary, "benchmarks": [asdict(entry) for entry in entries]}, file, indent = 2, default = lambda value: value.item())
+
+
+if __name__ == "__main__":
+  main()
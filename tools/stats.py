@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+import sys
+assert sys.version_info >= (3, 10), "Requires Python 3.10 or later"
+
+import json, math, argparse
+import numpy as np
+import results
+
+# Robust statistics over benchmark samples
+#
+# All functions operate on a NaN-padded (rows x samples) matrix as returned by
+# Results.sample_matrix(), computing the statistic for every row in one vectorized pass.
+
+# scale factor that makes the MAD a consistent estimator of the standard deviation
+MAD_SCALE = 1.4826
+
+def sample_counts(matrix: np.ndarray) -> np.ndarray:
+  return np.sum(~np.isnan(matrix), axis = 1)
+
+
+def sorted_rows(matrix: np.ndarray) -> np.ndarray:
+  """ Sort each row, padding (NaN) values are moved to the end """
+  return np.sort(matrix, axis = 1)
+
+
+def order_statistic(sorted_matrix: np.ndarray, counts: np.ndarray, q: float) -> np.ndarray:
+  """ Per-row quantile (linear interpolation) of row-sorted data with the given number of valid values """
+  position = q*np.maximum(counts - 1, 0)
+  lo = np.floor(position).astype(np.int64)
+  hi = np.minimum(lo + 1, np.maximum(counts - 1, 0))
+  weight = position - lo
+
+  take = lambda i: np.take_along_axis(sorted_matrix, i[..., None], axis = -1)[..., 0]
+  out = take(lo)*(1 - weight) + take(hi)*weight
+
+  return np.where(counts > 0, out, np.nan)
+
+
+def median(matrix: np.ndarray) -> np.ndarray:
+  return order_statistic(sorted_rows(matrix), sample_counts(matrix), 0.5)
+
+
+def mad(matrix: np.ndarray, center: np.ndarray | None = None) -> np.ndarray:
+  """ Median absolute deviation, scaled to estimate the standard deviation """
+  center = median(matrix) if center is None else center
+  return MAD_SCALE*median(np.abs(matrix - center[:, None]))
+
+
+def trimmed_mean(matrix: np.ndarray, proportion: float = 0.1) -> np.ndarray:
+  """ Mean after discarding the given proportion of the lowest and the highest samples of each row """
+  assert 0 <= proportion < 0.5
+  counts = sample_counts(matrix)
+  trim = np.floor(counts*proportion).astype(np.int64)
+
+  # keep the sorted positions trim <= i < count - trim
+  positions = np.arange(matrix.shape[1])[None, :]
+  keep = (positions >= trim[:, None]) & (positions < (counts - trim)[:, None])
+  total = np.sum(np.where(keep, sorted_rows(matrix), 0.0), axis = 1)
+
+  with np.errstate(invalid = "ignore", divide = "ignore"):
+    return total/np.sum(keep, axis = 1)
+
+
+def bootstrap_ci(
+  matrix: np.ndarray,
+  confidence: float = 0.95,
+  n_resamples: int = 1000,
+  seed: int = 0,
+  chunk_size: int = 1 << 24
+) -> tuple[np.ndarray, np.ndarray]:
+  """ Percentile bootstrap confidence interval of the median of each row
+
+      Rows are processed in chunks of at most chunk_size resampled values to bound memory use.
+  """
+  rng = np.random.default_rng(seed)
+  counts = sample_counts(matrix)
+  n_rows, width = matrix.shape
+  lo = np.full(n_rows, np.nan)
+  hi = np.full(n_rows, np.nan)
+  if width == 0: return (lo, hi)
+
+  # padding is sorted to the end of each row, so resampling indices 0..count-1 only sees valid values
+  data = sorted_rows(matrix)
+  alpha = (1 - confidence)/2
+  rows_per_chunk = max(1, chunk_size//(n_resamples*width))
+
+  for start in range(0, n_rows, rows_per_chunk):
+    rows = slice(start, start + rows_per_chunk)
+    n = counts[rows]
+
+    # resample indices (rows x resamples x width), positions >= count are padding
+    indices = np.floor(rng.random((len(n), n_resamples, width))*n[:, None, None]).astype(np.int64)
+    resampled = np.take_along_axis(data[rows][:, None, :], indices, axis = 2)
+    resampled[np.broadcast_to(np.arange(width)[None, None, :] >= n[:, None, None], resampled.shape)] = np.nan
+
+    medians = order_statistic(np.sort(resampled, axis = 2), np.broadcast_to(n[:, None], (len(n), n_resamples)), 0.5)
+    medians.sort(axis = 1)
+    lo[rows] = order_statistic(medians, np.full(len(n), n_resamples), alpha)
+    hi[rows] = order_statistic(medians, np.full(len(n), n_resamples), 1 - alpha)
+
+  lo[counts == 0] = np.nan
+  hi[counts == 0] = np.nan
+  return (lo, hi)
+
+
+def mann_whitney(x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+  """ Two-sided Mann-Whitney U test for each pair of rows of two NaN-padded sample matrices
+
+      Uses the normal approximation with tie and continuity correction. Returns the U statistic
+      of x and the p-value, rows where either sample is empty have p = NaN.
+  """
+  assert len(x) == len(y)
+  n1 = sample_counts(x).astype(np.float64)
+  n2 = sample_counts(y).astype(np.float64)
+  n = n1 + n2
+
+  # U = number of (x, y) pairs with x > y, ties count as one half (NaN comparisons are false)
+  gt = np.sum(x[:, :, None] > y[:, None, :], axis = (1, 2))
+  eq = np.sum(x[:, :, None] == y[:, None, :], axis = (1, 2))
+  u = gt + 0.5*eq
+
+  # tie correction: sum of (t^3 - t) over groups of tied values = sum of (t^2 - 1) over values
+  combined = np.concatenate([x, y], axis = 1)
+  ties = np.sum(combined[:, :, None] == combined[:, None, :], axis = 2)
+  tie_term = np.sum(np.where(np.isnan(combined), 0, ties**2 - 1), axis = 1)
+
+  with np.errstate(invalid = "ignore", divide = "ignore"):
+    mean = n1*n2/2
+    sigma = np.sqrt(n1*n2/12*((n + 1) - tie_term/(n*(n - 1))))
+    z = np.maximum(np.abs(u - mean) - 0.5, 0)/sigma
+    p = np.array([math.erfc(value/math.sqrt(2)) for value in z])
+
+  # identical samples (sigma = 0) are not significantly different
+  p[sigma == 0] = 1.0
+  p[(n1 == 0) | (n2 == 0)] = np.nan
+
+  return (u, p)
+
+
+def benjamini_hochberg(p: np.ndarray) -> np.ndarray:
+  """ Benjamini-Hochberg adjusted p-values (false discovery rate), NaN values are ignored """
+  q = np.full(len(p), np.nan)
+  valid = np.flatnonzero(~np.isnan(p))
+  order = valid[np.argsort(p[valid])]
+  m = len(order)
+  if m == 0: return q
+
+  adjusted = p[order]*m/np.arange(1, m + 1)
+  # enforce monotonicity from the largest p-value down
+  q[order] = np.minimum(np.minimum.accumulate(adjusted[::-1])[::-1], 1.0)
+
+  return q
+
+
+def describe(
+  matrix: np.ndarray,
+  trim: float = 0.1,
+  confidence: float = 0.95,
+  n_resamples: int = 1000,
+  seed: int = 0
+) -> dict[str, np.ndarray]:
+  """ Robust summary statistics for each row of a NaN-padded sample matrix """
+  counts = sample_counts(matrix)
+  center = median(matrix)
+  (ci_lo, ci_hi) = bootstrap_ci(matrix, confidence, n_resamples, seed)
+
+  with np.errstate(invalid = "ignore", divide = "ignore"):
+    return {
+      "n": counts,
+      "median": center,
+      "mad": mad(matrix, center),
+      "trimmed_mean": trimmed_mean(matrix, trim),
+      "max": order_statistic(sorted_rows(matrix), counts, 1.0),
+      "ci_lo": ci_lo,
+      "ci_hi": ci_hi,
+      # relative dispersion
+      "rmad": mad(matrix, center)/center,
+      "rci": (ci_hi - ci_lo)/center,
+    }
+
+
+def flag_unstable(
+  summary: dict[str, np.ndarray],
+  max_rmad: float = 0.05,
+  max_rci: float = 0.05,
+  min_samples: int = 5
+) -> np.ndarray:
+  """ Rows with too few samples, a large relative MAD or a wide confidence interval of the median """
+  return (
+    (summary["n"] < min_samples) |
+    ~(summary["rmad"] <= max_rmad) |
+    ~(summary["rci"] <= max_rci)
+  )
+
+
+# columns used to identify rows in printed tables (reports without labels print all identity columns)
+DISPLAY_COLUMNS = ["label", "ilp", "size", "alignment", "threads_h", "threads_l"]
+
+def identity_columns(data: results.Results) -> list[str]:
+  """ Columns identifying a benchmark row (everything except measurements) """
+  return [name for name in data.columns if data.kind(name) != "float"]
+
+
+def summarize(data: results.Results, **options) -> dict[str, np.ndarray]:
+  """ Identity columns and robust statistics for every row of the results """
+  summary = describe(data.sample_matrix(), **options)
+  table = {name: data[name] for name in identity_columns(data)}
+  table.update(summary)
+
+  return table
+
+
+def main():
+  parser = argparse.ArgumentParser(description = "Robust statistics for benchmark samples")
+  parser.add_argument("reports", nargs = "+", help = "JSON benchmark reports (optionally .bz2)")
+  parser.add_argument("--trim", type = float, default = 0.1, help = "trimmed mean proportion (each side)")
+  parser.add_argument("--confidence", type = float, default = 0.95, help = "bootstrap confidence level")
+  parser.add_argument("--resamples", type = int, default = 1000, help = "number of bootstrap resamples")
+  parser.add_argument("--max-rmad", type = float, default = 0.05, help = "instability threshold for MAD/median")
+  parser.add_argument("--max-rci", type = float, default = 0.05, help = "instability threshold for CI width/median")
+  parser.add_argument("--min-samples", type = int, default = 5, help = "rows with fewer samples are unstable")
+  parser.add_argument("--all", action = "store_true", help = "print all rows, not only the unstable ones")
+  parser.add_argument("--json", default = None, help = "write the statistics for all rows to this file")
+  args = parser.parse_args()
+
+  # reports are analysed one at a time, they can have different columns and sample fields (e.g. gops and gbps)
+  rows = []
+  for path in args.reports:
+    data = results.load(path)
+    table = summarize(data, trim = args.trim, confidence = args.confidence, n_resamples = args.resamples)
+    table["unstable"] = flag_unstable(table, args.max_rmad, args.max_rci, args.min_samples)
+    rows += [dict(zip(table.keys(), row)) for row in zip(*(column.tolist() for column in table.values()))]
+
+    shown = np.ones(len(data), dtype = bool) if args.all else table["unstable"]
+    keys = [name for name in DISPLAY_COLUMNS if name in table] if "label" in table else identity_columns(data)
+    columns = [*keys, "n", "median", "mad", "trimmed_mean", "ci_lo", "ci_hi", "unstable"]
+    if len(args.reports) > 1: print(f"{results.report_name(path)}:")
+    results.print_table({name: table[name][shown] for name in columns})
+    print(f"{results.report_name(path)}: {np.sum(table["unstable"])} of {len(data)} rows are unstable", file = sys.stderr)
+
+  if args.json is not None:
+    with open(args.json, "w") as file: json.dump(rows, file, indent = 2)
+
+if __name__ == "__main__":
+  main()